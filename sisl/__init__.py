@@ -46,6 +46,7 @@ Advanced classes
    SparseCSR
    SparseAtom
    SparseOrbital
+   SparseGeometryView
    Selector
 
 """
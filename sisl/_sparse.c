@@ -6,7 +6,7 @@
         "depends": [],
         "name": "sisl._sparse",
         "sources": [
-            "/home/nicpa/codes/sisl/sisl/_sparse.pyx"
+            "/root/package/sisl/_sparse.pyx"
         ]
     },
     "module_name": "sisl._sparse"
@@ -623,11 +623,11 @@ static CYTHON_INLINE float __PYX_NAN() {
 /* Early includes */
 #include <math.h>
 #include <string.h>
+#include <stdlib.h>
 #include <stdio.h>
 #include "numpy/arrayobject.h"
 #include "numpy/ufuncobject.h"
 #include "pythread.h"
-#include <stdlib.h>
 #include "pystate.h"
 #ifdef _OPENMP
 #include <omp.h>
@@ -959,11 +959,6 @@ typedef volatile __pyx_atomic_int_type __pyx_atomic_int;
             __pyx_sub_acquisition_count_locked(__pyx_get_slice_count_pointer(memview), memview->lock)
 #endif
 
-/* ForceInitThreads.proto */
-#ifndef __PYX_FORCE_INIT_THREADS
-  #define __PYX_FORCE_INIT_THREADS 0
-#endif
-
 /* NoFastGil.proto */
 #define __Pyx_PyGILState_Ensure PyGILState_Ensure
 #define __Pyx_PyGILState_Release PyGILState_Release
@@ -971,8 +966,13 @@ typedef volatile __pyx_atomic_int_type __pyx_atomic_int;
 #define __Pyx_FastGIL_Forget()
 #define __Pyx_FastGilFuncInit()
 
+/* ForceInitThreads.proto */
+#ifndef __PYX_FORCE_INIT_THREADS
+  #define __PYX_FORCE_INIT_THREADS 0
+#endif
+
 
-/* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":776
+/* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":776
  * # in Cython to enable them only on the right systems.
  * 
  * ctypedef npy_int8       int8_t             # <<<<<<<<<<<<<<
@@ -981,7 +981,7 @@ typedef volatile __pyx_atomic_int_type __pyx_atomic_int;
  */
 typedef npy_int8 __pyx_t_5numpy_int8_t;
 
-/* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":777
+/* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":777
  * 
  * ctypedef npy_int8       int8_t
  * ctypedef npy_int16      int16_t             # <<<<<<<<<<<<<<
@@ -990,7 +990,7 @@ typedef npy_int8 __pyx_t_5numpy_int8_t;
  */
 typedef npy_int16 __pyx_t_5numpy_int16_t;
 
-/* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":778
+/* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":778
  * ctypedef npy_int8       int8_t
  * ctypedef npy_int16      int16_t
  * ctypedef npy_int32      int32_t             # <<<<<<<<<<<<<<
@@ -999,7 +999,7 @@ typedef npy_int16 __pyx_t_5numpy_int16_t;
  */
 typedef npy_int32 __pyx_t_5numpy_int32_t;
 
-/* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":779
+/* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":779
  * ctypedef npy_int16      int16_t
  * ctypedef npy_int32      int32_t
  * ctypedef npy_int64      int64_t             # <<<<<<<<<<<<<<
@@ -1008,7 +1008,7 @@ typedef npy_int32 __pyx_t_5numpy_int32_t;
  */
 typedef npy_int64 __pyx_t_5numpy_int64_t;
 
-/* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":783
+/* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":783
  * #ctypedef npy_int128     int128_t
  * 
  * ctypedef npy_uint8      uint8_t             # <<<<<<<<<<<<<<
@@ -1017,7 +1017,7 @@ typedef npy_int64 __pyx_t_5numpy_int64_t;
  */
 typedef npy_uint8 __pyx_t_5numpy_uint8_t;
 
-/* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":784
+/* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":784
  * 
  * ctypedef npy_uint8      uint8_t
  * ctypedef npy_uint16     uint16_t             # <<<<<<<<<<<<<<
@@ -1026,7 +1026,7 @@ typedef npy_uint8 __pyx_t_5numpy_uint8_t;
  */
 typedef npy_uint16 __pyx_t_5numpy_uint16_t;
 
-/* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":785
+/* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":785
  * ctypedef npy_uint8      uint8_t
  * ctypedef npy_uint16     uint16_t
  * ctypedef npy_uint32     uint32_t             # <<<<<<<<<<<<<<
@@ -1035,7 +1035,7 @@ typedef npy_uint16 __pyx_t_5numpy_uint16_t;
  */
 typedef npy_uint32 __pyx_t_5numpy_uint32_t;
 
-/* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":786
+/* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":786
  * ctypedef npy_uint16     uint16_t
  * ctypedef npy_uint32     uint32_t
  * ctypedef npy_uint64     uint64_t             # <<<<<<<<<<<<<<
@@ -1044,7 +1044,7 @@ typedef npy_uint32 __pyx_t_5numpy_uint32_t;
  */
 typedef npy_uint64 __pyx_t_5numpy_uint64_t;
 
-/* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":790
+/* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":790
  * #ctypedef npy_uint128    uint128_t
  * 
  * ctypedef npy_float32    float32_t             # <<<<<<<<<<<<<<
@@ -1053,7 +1053,7 @@ typedef npy_uint64 __pyx_t_5numpy_uint64_t;
  */
 typedef npy_float32 __pyx_t_5numpy_float32_t;
 
-/* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":791
+/* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":791
  * 
  * ctypedef npy_float32    float32_t
  * ctypedef npy_float64    float64_t             # <<<<<<<<<<<<<<
@@ -1062,7 +1062,7 @@ typedef npy_float32 __pyx_t_5numpy_float32_t;
  */
 typedef npy_float64 __pyx_t_5numpy_float64_t;
 
-/* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":800
+/* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":800
  * # The int types are mapped a bit surprising --
  * # numpy.int corresponds to 'l' and numpy.long to 'q'
  * ctypedef npy_long       int_t             # <<<<<<<<<<<<<<
@@ -1071,7 +1071,7 @@ typedef npy_float64 __pyx_t_5numpy_float64_t;
  */
 typedef npy_long __pyx_t_5numpy_int_t;
 
-/* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":801
+/* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":801
  * # numpy.int corresponds to 'l' and numpy.long to 'q'
  * ctypedef npy_long       int_t
  * ctypedef npy_longlong   long_t             # <<<<<<<<<<<<<<
@@ -1080,7 +1080,7 @@ typedef npy_long __pyx_t_5numpy_int_t;
  */
 typedef npy_longlong __pyx_t_5numpy_long_t;
 
-/* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":802
+/* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":802
  * ctypedef npy_long       int_t
  * ctypedef npy_longlong   long_t
  * ctypedef npy_longlong   longlong_t             # <<<<<<<<<<<<<<
@@ -1089,7 +1089,7 @@ typedef npy_longlong __pyx_t_5numpy_long_t;
  */
 typedef npy_longlong __pyx_t_5numpy_longlong_t;
 
-/* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":804
+/* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":804
  * ctypedef npy_longlong   longlong_t
  * 
  * ctypedef npy_ulong      uint_t             # <<<<<<<<<<<<<<
@@ -1098,7 +1098,7 @@ typedef npy_longlong __pyx_t_5numpy_longlong_t;
  */
 typedef npy_ulong __pyx_t_5numpy_uint_t;
 
-/* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":805
+/* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":805
  * 
  * ctypedef npy_ulong      uint_t
  * ctypedef npy_ulonglong  ulong_t             # <<<<<<<<<<<<<<
@@ -1107,7 +1107,7 @@ typedef npy_ulong __pyx_t_5numpy_uint_t;
  */
 typedef npy_ulonglong __pyx_t_5numpy_ulong_t;
 
-/* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":806
+/* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":806
  * ctypedef npy_ulong      uint_t
  * ctypedef npy_ulonglong  ulong_t
  * ctypedef npy_ulonglong  ulonglong_t             # <<<<<<<<<<<<<<
@@ -1116,7 +1116,7 @@ typedef npy_ulonglong __pyx_t_5numpy_ulong_t;
  */
 typedef npy_ulonglong __pyx_t_5numpy_ulonglong_t;
 
-/* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":808
+/* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":808
  * ctypedef npy_ulonglong  ulonglong_t
  * 
  * ctypedef npy_intp       intp_t             # <<<<<<<<<<<<<<
@@ -1125,7 +1125,7 @@ typedef npy_ulonglong __pyx_t_5numpy_ulonglong_t;
  */
 typedef npy_intp __pyx_t_5numpy_intp_t;
 
-/* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":809
+/* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":809
  * 
  * ctypedef npy_intp       intp_t
  * ctypedef npy_uintp      uintp_t             # <<<<<<<<<<<<<<
@@ -1134,7 +1134,7 @@ typedef npy_intp __pyx_t_5numpy_intp_t;
  */
 typedef npy_uintp __pyx_t_5numpy_uintp_t;
 
-/* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":811
+/* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":811
  * ctypedef npy_uintp      uintp_t
  * 
  * ctypedef npy_double     float_t             # <<<<<<<<<<<<<<
@@ -1143,7 +1143,7 @@ typedef npy_uintp __pyx_t_5numpy_uintp_t;
  */
 typedef npy_double __pyx_t_5numpy_float_t;
 
-/* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":812
+/* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":812
  * 
  * ctypedef npy_double     float_t
  * ctypedef npy_double     double_t             # <<<<<<<<<<<<<<
@@ -1152,7 +1152,7 @@ typedef npy_double __pyx_t_5numpy_float_t;
  */
 typedef npy_double __pyx_t_5numpy_double_t;
 
-/* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":813
+/* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":813
  * ctypedef npy_double     float_t
  * ctypedef npy_double     double_t
  * ctypedef npy_longdouble longdouble_t             # <<<<<<<<<<<<<<
@@ -1191,7 +1191,7 @@ struct __pyx_MemviewEnum_obj;
 struct __pyx_memoryview_obj;
 struct __pyx_memoryviewslice_obj;
 
-/* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":815
+/* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":815
  * ctypedef npy_longdouble longdouble_t
  * 
  * ctypedef npy_cfloat      cfloat_t             # <<<<<<<<<<<<<<
@@ -1200,7 +1200,7 @@ struct __pyx_memoryviewslice_obj;
  */
 typedef npy_cfloat __pyx_t_5numpy_cfloat_t;
 
-/* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":816
+/* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":816
  * 
  * ctypedef npy_cfloat      cfloat_t
  * ctypedef npy_cdouble     cdouble_t             # <<<<<<<<<<<<<<
@@ -1209,7 +1209,7 @@ typedef npy_cfloat __pyx_t_5numpy_cfloat_t;
  */
 typedef npy_cdouble __pyx_t_5numpy_cdouble_t;
 
-/* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":817
+/* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":817
  * ctypedef npy_cfloat      cfloat_t
  * ctypedef npy_cdouble     cdouble_t
  * ctypedef npy_clongdouble clongdouble_t             # <<<<<<<<<<<<<<
@@ -1218,7 +1218,7 @@ typedef npy_cdouble __pyx_t_5numpy_cdouble_t;
  */
 typedef npy_clongdouble __pyx_t_5numpy_clongdouble_t;
 
-/* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":819
+/* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":819
  * ctypedef npy_clongdouble clongdouble_t
  * 
  * ctypedef npy_cdouble     complex_t             # <<<<<<<<<<<<<<
@@ -1226,6 +1226,19 @@ typedef npy_clongdouble __pyx_t_5numpy_clongdouble_t;
  * cdef inline object PyArray_MultiIterNew1(a):
  */
 typedef npy_cdouble __pyx_t_5numpy_complex_t;
+struct __pyx_t_4sisl_7_sparse__col_idx;
+
+/* "sisl/_sparse.pyx":494
+ * 
+ * 
+ * cdef struct _col_idx:             # <<<<<<<<<<<<<<
+ *     int col
+ *     int idx
+ */
+struct __pyx_t_4sisl_7_sparse__col_idx {
+  int col;
+  int idx;
+};
 
 /* "View.MemoryView":105
  * 
@@ -1638,6 +1651,12 @@ static CYTHON_INLINE PyObject* __Pyx_PyObject_CallNoArg(PyObject *func);
 #define __Pyx_PyObject_CallNoArg(func) __Pyx_PyObject_Call(func, __pyx_empty_tuple, NULL)
 #endif
 
+/* PyDictContains.proto */
+static CYTHON_INLINE int __Pyx_PyDict_ContainsTF(PyObject* item, PyObject* dict, int eq) {
+    int result = PyDict_Contains(dict, item);
+    return unlikely(result < 0) ? result : (result == (eq == Py_EQ));
+}
+
 /* DictGetItem.proto */
 #if PY_MAJOR_VERSION >= 3 && !CYTHON_COMPILING_IN_PYPY
 static PyObject *__Pyx_PyDict_GetItem(PyObject *d, PyObject* key);
@@ -1649,15 +1668,87 @@ static PyObject *__Pyx_PyDict_GetItem(PyObject *d, PyObject* key);
 #define __Pyx_PyObject_Dict_GetItem(obj, name)  PyObject_GetItem(obj, name)
 #endif
 
-/* RaiseTooManyValuesToUnpack.proto */
-static CYTHON_INLINE void __Pyx_RaiseTooManyValuesError(Py_ssize_t expected);
+/* UnicodeAsUCS4.proto */
+static CYTHON_INLINE Py_UCS4 __Pyx_PyUnicode_AsPy_UCS4(PyObject*);
+
+/* object_ord.proto */
+#if PY_MAJOR_VERSION >= 3
+#define __Pyx_PyObject_Ord(c)\
+    (likely(PyUnicode_Check(c)) ? (long)__Pyx_PyUnicode_AsPy_UCS4(c) : __Pyx__PyObject_Ord(c))
+#else
+#define __Pyx_PyObject_Ord(c) __Pyx__PyObject_Ord(c)
+#endif
+static long __Pyx__PyObject_Ord(PyObject* c);
+
+/* SetItemInt.proto */
+#define __Pyx_SetItemInt(o, i, v, type, is_signed, to_py_func, is_list, wraparound, boundscheck)\
+    (__Pyx_fits_Py_ssize_t(i, type, is_signed) ?\
+    __Pyx_SetItemInt_Fast(o, (Py_ssize_t)i, v, is_list, wraparound, boundscheck) :\
+    (is_list ? (PyErr_SetString(PyExc_IndexError, "list assignment index out of range"), -1) :\
+               __Pyx_SetItemInt_Generic(o, to_py_func(i), v)))
+static int __Pyx_SetItemInt_Generic(PyObject *o, PyObject *j, PyObject *v);
+static CYTHON_INLINE int __Pyx_SetItemInt_Fast(PyObject *o, Py_ssize_t i, PyObject *v,
+                                               int is_list, int wraparound, int boundscheck);
+
+/* IterFinish.proto */
+static CYTHON_INLINE int __Pyx_IterFinish(void);
+
+/* PyObjectGetMethod.proto */
+static int __Pyx_PyObject_GetMethod(PyObject *obj, PyObject *name, PyObject **method);
+
+/* PyObjectCallMethod0.proto */
+static PyObject* __Pyx_PyObject_CallMethod0(PyObject* obj, PyObject* method_name);
 
 /* RaiseNeedMoreValuesToUnpack.proto */
 static CYTHON_INLINE void __Pyx_RaiseNeedMoreValuesError(Py_ssize_t index);
 
+/* RaiseTooManyValuesToUnpack.proto */
+static CYTHON_INLINE void __Pyx_RaiseTooManyValuesError(Py_ssize_t expected);
+
+/* UnpackItemEndCheck.proto */
+static int __Pyx_IternextUnpackEndCheck(PyObject *retval, Py_ssize_t expected);
+
 /* RaiseNoneIterError.proto */
 static CYTHON_INLINE void __Pyx_RaiseNoneNotIterableError(void);
 
+/* UnpackTupleError.proto */
+static void __Pyx_UnpackTupleError(PyObject *, Py_ssize_t index);
+
+/* UnpackTuple2.proto */
+#define __Pyx_unpack_tuple2(tuple, value1, value2, is_tuple, has_known_size, decref_tuple)\
+    (likely(is_tuple || PyTuple_Check(tuple)) ?\
+        (likely(has_known_size || PyTuple_GET_SIZE(tuple) == 2) ?\
+            __Pyx_unpack_tuple2_exact(tuple, value1, value2, decref_tuple) :\
+            (__Pyx_UnpackTupleError(tuple, 2), -1)) :\
+        __Pyx_unpack_tuple2_generic(tuple, value1, value2, has_known_size, decref_tuple))
+static CYTHON_INLINE int __Pyx_unpack_tuple2_exact(
+    PyObject* tuple, PyObject** value1, PyObject** value2, int decref_tuple);
+static int __Pyx_unpack_tuple2_generic(
+    PyObject* tuple, PyObject** value1, PyObject** value2, int has_known_size, int decref_tuple);
+
+/* dict_iter.proto */
+static CYTHON_INLINE PyObject* __Pyx_dict_iterator(PyObject* dict, int is_dict, PyObject* method_name,
+                                                   Py_ssize_t* p_orig_length, int* p_is_dict);
+static CYTHON_INLINE int __Pyx_dict_iter_next(PyObject* dict_or_iter, Py_ssize_t orig_length, Py_ssize_t* ppos,
+                                              PyObject** pkey, PyObject** pvalue, PyObject** pitem, int is_dict);
+
+/* ListAppend.proto */
+#if CYTHON_USE_PYLIST_INTERNALS && CYTHON_ASSUME_SAFE_MACROS
+static CYTHON_INLINE int __Pyx_PyList_Append(PyObject* list, PyObject* x) {
+    PyListObject* L = (PyListObject*) list;
+    Py_ssize_t len = Py_SIZE(list);
+    if (likely(L->allocated > len) & likely(len > (L->allocated >> 1))) {
+        Py_INCREF(x);
+        PyList_SET_ITEM(list, len, x);
+        Py_SIZE(list) = len+1;
+        return 0;
+    }
+    return PyList_Append(list, x);
+}
+#else
+#define __Pyx_PyList_Append(L,x) PyList_Append(L,x)
+#endif
+
 /* GetTopmostException.proto */
 #if CYTHON_USE_EXC_INFO_STACK
 static _PyErr_StackItem * __Pyx_PyErr_GetTopmostException(PyThreadState *tstate);
@@ -1804,23 +1895,6 @@ static CYTHON_INLINE int __Pyx_PyList_Extend(PyObject* L, PyObject* v) {
 #endif
 }
 
-/* ListAppend.proto */
-#if CYTHON_USE_PYLIST_INTERNALS && CYTHON_ASSUME_SAFE_MACROS
-static CYTHON_INLINE int __Pyx_PyList_Append(PyObject* list, PyObject* x) {
-    PyListObject* L = (PyListObject*) list;
-    Py_ssize_t len = Py_SIZE(list);
-    if (likely(L->allocated > len) & likely(len > (L->allocated >> 1))) {
-        Py_INCREF(x);
-        PyList_SET_ITEM(list, len, x);
-        Py_SIZE(list) = len+1;
-        return 0;
-    }
-    return PyList_Append(list, x);
-}
-#else
-#define __Pyx_PyList_Append(L,x) PyList_Append(L,x)
-#endif
-
 /* None.proto */
 static CYTHON_INLINE void __Pyx_RaiseUnboundLocalError(const char *varname);
 
@@ -1869,6 +1943,82 @@ enum __Pyx_ImportType_CheckSize {
 static PyTypeObject *__Pyx_ImportType(PyObject* module, const char *module_name, const char *class_name, size_t size, enum __Pyx_ImportType_CheckSize check_size);
 #endif
 
+/* FetchCommonType.proto */
+static PyTypeObject* __Pyx_FetchCommonType(PyTypeObject* type);
+
+/* CythonFunction.proto */
+#define __Pyx_CyFunction_USED 1
+#define __Pyx_CYFUNCTION_STATICMETHOD  0x01
+#define __Pyx_CYFUNCTION_CLASSMETHOD   0x02
+#define __Pyx_CYFUNCTION_CCLASS        0x04
+#define __Pyx_CyFunction_GetClosure(f)\
+    (((__pyx_CyFunctionObject *) (f))->func_closure)
+#define __Pyx_CyFunction_GetClassObj(f)\
+    (((__pyx_CyFunctionObject *) (f))->func_classobj)
+#define __Pyx_CyFunction_Defaults(type, f)\
+    ((type *)(((__pyx_CyFunctionObject *) (f))->defaults))
+#define __Pyx_CyFunction_SetDefaultsGetter(f, g)\
+    ((__pyx_CyFunctionObject *) (f))->defaults_getter = (g)
+typedef struct {
+    PyCFunctionObject func;
+#if PY_VERSION_HEX < 0x030500A0
+    PyObject *func_weakreflist;
+#endif
+    PyObject *func_dict;
+    PyObject *func_name;
+    PyObject *func_qualname;
+    PyObject *func_doc;
+    PyObject *func_globals;
+    PyObject *func_code;
+    PyObject *func_closure;
+    PyObject *func_classobj;
+    void *defaults;
+    int defaults_pyobjects;
+    int flags;
+    PyObject *defaults_tuple;
+    PyObject *defaults_kwdict;
+    PyObject *(*defaults_getter)(PyObject *);
+    PyObject *func_annotations;
+} __pyx_CyFunctionObject;
+static PyTypeObject *__pyx_CyFunctionType = 0;
+#define __Pyx_CyFunction_Check(obj)  (__Pyx_TypeCheck(obj, __pyx_CyFunctionType))
+#define __Pyx_CyFunction_NewEx(ml, flags, qualname, self, module, globals, code)\
+    __Pyx_CyFunction_New(__pyx_CyFunctionType, ml, flags, qualname, self, module, globals, code)
+static PyObject *__Pyx_CyFunction_New(PyTypeObject *, PyMethodDef *ml,
+                                      int flags, PyObject* qualname,
+                                      PyObject *self,
+                                      PyObject *module, PyObject *globals,
+                                      PyObject* code);
+static CYTHON_INLINE void *__Pyx_CyFunction_InitDefaults(PyObject *m,
+                                                         size_t size,
+                                                         int pyobjects);
+static CYTHON_INLINE void __Pyx_CyFunction_SetDefaultsTuple(PyObject *m,
+                                                            PyObject *tuple);
+static CYTHON_INLINE void __Pyx_CyFunction_SetDefaultsKwDict(PyObject *m,
+                                                             PyObject *dict);
+static CYTHON_INLINE void __Pyx_CyFunction_SetAnnotationsDict(PyObject *m,
+                                                              PyObject *dict);
+static int __pyx_CyFunction_init(void);
+
+/* FusedFunction.proto */
+typedef struct {
+    __pyx_CyFunctionObject func;
+    PyObject *__signatures__;
+    PyObject *type;
+    PyObject *self;
+} __pyx_FusedFunctionObject;
+#define __pyx_FusedFunction_NewEx(ml, flags, qualname, self, module, globals, code)\
+        __pyx_FusedFunction_New(__pyx_FusedFunctionType, ml, flags, qualname, self, module, globals, code)
+static PyObject *__pyx_FusedFunction_New(PyTypeObject *type,
+                                         PyMethodDef *ml, int flags,
+                                         PyObject *qualname, PyObject *self,
+                                         PyObject *module, PyObject *globals,
+                                         PyObject *code);
+static int __pyx_FusedFunction_clear(__pyx_FusedFunctionObject *self);
+static PyTypeObject *__pyx_FusedFunctionType = NULL;
+static int __pyx_FusedFunction_init(void);
+#define __Pyx_FusedFunction_USED
+
 /* CLineInTraceback.proto */
 #ifdef CYTHON_CLINE_IN_TRACEBACK
 #define __Pyx_CLineForTraceback(tstate, c_line)  (((CYTHON_CLINE_IN_TRACEBACK)) ? c_line : 0)
@@ -1929,6 +2079,26 @@ static int __pyx_slices_overlap(__Pyx_memviewslice *slice1,
 /* Capsule.proto */
 static CYTHON_INLINE PyObject *__pyx_capsule_create(void *p, const char *sig);
 
+/* TypeInfoCompare.proto */
+static int __pyx_typeinfo_cmp(__Pyx_TypeInfo *a, __Pyx_TypeInfo *b);
+
+/* MemviewSliceValidateAndInit.proto */
+static int __Pyx_ValidateAndInit_memviewslice(
+                int *axes_specs,
+                int c_or_f_flag,
+                int buf_flags,
+                int ndim,
+                __Pyx_TypeInfo *dtype,
+                __Pyx_BufFmt_StackElem stack[],
+                __Pyx_memviewslice *memviewslice,
+                PyObject *original_obj);
+
+/* ObjectToMemviewSlice.proto */
+static CYTHON_INLINE __Pyx_memviewslice __Pyx_PyObject_to_MemoryviewSlice_d_dc_float(PyObject *, int writable_flag);
+
+/* ObjectToMemviewSlice.proto */
+static CYTHON_INLINE __Pyx_memviewslice __Pyx_PyObject_to_MemoryviewSlice_d_dc_double(PyObject *, int writable_flag);
+
 /* CIntToPy.proto */
 static CYTHON_INLINE PyObject* __Pyx_PyInt_From_long(long value);
 
@@ -2050,29 +2220,25 @@ __pyx_memoryview_copy_new_contig(const __Pyx_memviewslice *from_mvs,
 /* CIntFromPy.proto */
 static CYTHON_INLINE int __Pyx_PyInt_As_int(PyObject *);
 
+/* BytesContains.proto */
+static CYTHON_INLINE int __Pyx_BytesContains(PyObject* bytes, char character);
+
+/* ImportNumPyArray.proto */
+static PyObject *__pyx_numpy_ndarray = NULL;
+static PyObject* __Pyx_ImportNumPyArrayTypeIfAvailable(void);
+
 /* CIntFromPy.proto */
 static CYTHON_INLINE long __Pyx_PyInt_As_long(PyObject *);
 
 /* CIntFromPy.proto */
 static CYTHON_INLINE char __Pyx_PyInt_As_char(PyObject *);
 
-/* TypeInfoCompare.proto */
-static int __pyx_typeinfo_cmp(__Pyx_TypeInfo *a, __Pyx_TypeInfo *b);
-
-/* MemviewSliceValidateAndInit.proto */
-static int __Pyx_ValidateAndInit_memviewslice(
-                int *axes_specs,
-                int c_or_f_flag,
-                int buf_flags,
-                int ndim,
-                __Pyx_TypeInfo *dtype,
-                __Pyx_BufFmt_StackElem stack[],
-                __Pyx_memviewslice *memviewslice,
-                PyObject *original_obj);
-
 /* ObjectToMemviewSlice.proto */
 static CYTHON_INLINE __Pyx_memviewslice __Pyx_PyObject_to_MemoryviewSlice_dc_int(PyObject *, int writable_flag);
 
+/* ObjectToMemviewSlice.proto */
+static CYTHON_INLINE __Pyx_memviewslice __Pyx_PyObject_to_MemoryviewSlice_d_dc_unsigned_char(PyObject *, int writable_flag);
+
 /* CheckBinaryVersion.proto */
 static int __Pyx_check_binary_version(void);
 
@@ -2099,10 +2265,12 @@ static PyObject *__pyx_memoryviewslice_assign_item_from_object(struct __pyx_memo
 
 /* Module declarations from 'libc.math' */
 
-/* Module declarations from 'cpython.buffer' */
-
 /* Module declarations from 'libc.string' */
 
+/* Module declarations from 'libc.stdlib' */
+
+/* Module declarations from 'cpython.buffer' */
+
 /* Module declarations from 'libc.stdio' */
 
 /* Module declarations from '__builtin__' */
@@ -2144,6 +2312,9 @@ static PyObject *indirect_contiguous = 0;
 static int __pyx_memoryview_thread_locks_used;
 static PyThread_type_lock __pyx_memoryview_thread_locks[8];
 static CYTHON_INLINE int __pyx_f_4sisl_7_sparse__sum(__Pyx_memviewslice); /*proto*/
+static void __pyx_f_4sisl_7_sparse__sparse_merge(__Pyx_memviewslice, __Pyx_memviewslice, __Pyx_memviewslice, __Pyx_memviewslice, __Pyx_memviewslice, __Pyx_memviewslice, __Pyx_memviewslice, __Pyx_memviewslice, __Pyx_memviewslice, __Pyx_memviewslice); /*proto*/
+static int __pyx_f_4sisl_7_sparse__col_idx_cmp(void const *, void const *); /*proto*/
+static int __pyx_f_4sisl_7_sparse__int_cmp(void const *, void const *); /*proto*/
 static struct __pyx_array_obj *__pyx_array_new(PyObject *, Py_ssize_t, char *, char *, char *); /*proto*/
 static void *__pyx_align_pointer(void *, size_t); /*proto*/
 static PyObject *__pyx_memoryview_new(PyObject *, int, int, __Pyx_TypeInfo *); /*proto*/
@@ -2178,7 +2349,11 @@ static void __pyx_memoryview_slice_assign_scalar(__Pyx_memviewslice *, int, size
 static void __pyx_memoryview__slice_assign_scalar(char *, Py_ssize_t *, Py_ssize_t *, int, size_t, void *); /*proto*/
 static PyObject *__pyx_unpickle_Enum__set_state(struct __pyx_MemviewEnum_obj *, PyObject *); /*proto*/
 static __Pyx_TypeInfo __Pyx_TypeInfo_nn___pyx_t_5numpy_int32_t = { "int32_t", NULL, sizeof(__pyx_t_5numpy_int32_t), { 0 }, 0, IS_UNSIGNED(__pyx_t_5numpy_int32_t) ? 'U' : 'I', IS_UNSIGNED(__pyx_t_5numpy_int32_t), 0 };
+static __Pyx_TypeInfo __Pyx_TypeInfo_nn___pyx_t_5numpy_uint8_t = { "uint8_t", NULL, sizeof(__pyx_t_5numpy_uint8_t), { 0 }, 0, IS_UNSIGNED(__pyx_t_5numpy_uint8_t) ? 'U' : 'I', IS_UNSIGNED(__pyx_t_5numpy_uint8_t), 0 };
+static __Pyx_TypeInfo __Pyx_TypeInfo_float = { "float", NULL, sizeof(float), { 0 }, 0, 'R', 0, 0 };
+static __Pyx_TypeInfo __Pyx_TypeInfo_double = { "double", NULL, sizeof(double), { 0 }, 0, 'R', 0, 0 };
 static __Pyx_TypeInfo __Pyx_TypeInfo_int = { "int", NULL, sizeof(int), { 0 }, 0, IS_UNSIGNED(int) ? 'U' : 'I', IS_UNSIGNED(int), 0 };
+static __Pyx_TypeInfo __Pyx_TypeInfo_unsigned_char = { "unsigned char", NULL, sizeof(unsigned char), { 0 }, 0, IS_UNSIGNED(unsigned char) ? 'U' : 'I', IS_UNSIGNED(unsigned char), 0 };
 #define __Pyx_MODULE_NAME "sisl._sparse"
 extern int __pyx_module_is_main_sisl___sparse;
 int __pyx_module_is_main_sisl___sparse = 0;
@@ -2186,70 +2361,171 @@ int __pyx_module_is_main_sisl___sparse = 0;
 /* Implementation of 'sisl._sparse' */
 static PyObject *__pyx_builtin_range;
 static PyObject *__pyx_builtin_ValueError;
+static PyObject *__pyx_builtin_MemoryError;
+static PyObject *__pyx_builtin_TypeError;
 static PyObject *__pyx_builtin_RuntimeError;
 static PyObject *__pyx_builtin_ImportError;
-static PyObject *__pyx_builtin_MemoryError;
 static PyObject *__pyx_builtin_enumerate;
-static PyObject *__pyx_builtin_TypeError;
 static PyObject *__pyx_builtin_Ellipsis;
 static PyObject *__pyx_builtin_id;
 static PyObject *__pyx_builtin_IndexError;
+static const char __pyx_k_D[] = "D";
 static const char __pyx_k_O[] = "O";
 static const char __pyx_k_c[] = "c";
+static const char __pyx_k_i[] = "i";
+static const char __pyx_k_j[] = "j";
+static const char __pyx_k_k[] = "k";
+static const char __pyx_k_n[] = "n";
+static const char __pyx_k_p[] = "p";
+static const char __pyx_k_q[] = "q";
 static const char __pyx_k_r[] = "r";
+static const char __pyx_k_s[] = "s";
+static const char __pyx_k_t[] = "t";
+static const char __pyx_k_v[] = "v";
+static const char __pyx_k__5[] = "()";
+static const char __pyx_k__6[] = "|";
+static const char __pyx_k_ad[] = "ad";
+static const char __pyx_k_e1[] = "e1";
+static const char __pyx_k_e2[] = "e2";
+static const char __pyx_k_i1[] = "i1";
+static const char __pyx_k_i2[] = "i2";
+static const char __pyx_k_ia[] = "ia";
 static const char __pyx_k_id[] = "id";
+static const char __pyx_k_io[] = "io";
+static const char __pyx_k_na[] = "na";
+static const char __pyx_k_nc[] = "nc";
+static const char __pyx_k_nd[] = "nd";
+static const char __pyx_k_no[] = "no";
 static const char __pyx_k_np[] = "np";
 static const char __pyx_k_nr[] = "nr";
 static const char __pyx_k_nz[] = "nz";
 static const char __pyx_k_rr[] = "rr";
+static const char __pyx_k_sz[] = "sz";
+static const char __pyx_k_A_D[] = "A_D";
 static const char __pyx_k_COL[] = "COL";
+static const char __pyx_k_D_v[] = "D_v";
+static const char __pyx_k_IDX[] = "IDX";
+static const char __pyx_k_ISC[] = "ISC";
+static const char __pyx_k_O2A[] = "O2A";
+static const char __pyx_k_OFF[] = "OFF";
+static const char __pyx_k_POS[] = "POS";
 static const char __pyx_k_PTR[] = "PTR";
+static const char __pyx_k_PVT[] = "PVT";
 static const char __pyx_k_col[] = "col";
+static const char __pyx_k_err[] = "err";
+static const char __pyx_k_idx[] = "idx";
 static const char __pyx_k_ind[] = "ind";
+static const char __pyx_k_isc[] = "isc";
+static const char __pyx_k_n_s[] = "n_s";
 static const char __pyx_k_new[] = "__new__";
+static const char __pyx_k_nnz[] = "nnz";
+static const char __pyx_k_o2a[] = "o2a";
 static const char __pyx_k_obj[] = "obj";
+static const char __pyx_k_off[] = "off";
+static const char __pyx_k_pos[] = "pos";
 static const char __pyx_k_ptr[] = "ptr";
+static const char __pyx_k_pvt[] = "pvt";
 static const char __pyx_k_tmp[] = "tmp";
+static const char __pyx_k_COL1[] = "COL1";
+static const char __pyx_k_COL2[] = "COL2";
+static const char __pyx_k_IDX1[] = "IDX1";
+static const char __pyx_k_IDX2[] = "IDX2";
 static const char __pyx_k_NCOL[] = "NCOL";
+static const char __pyx_k_PTR1[] = "PTR1";
+static const char __pyx_k_PTR2[] = "PTR2";
+static const char __pyx_k_ROWS[] = "ROWS";
+static const char __pyx_k_acol[] = "acol";
+static const char __pyx_k_aptr[] = "aptr";
+static const char __pyx_k_args[] = "args";
 static const char __pyx_k_base[] = "base";
+static const char __pyx_k_col1[] = "col1";
+static const char __pyx_k_col2[] = "col2";
 static const char __pyx_k_copy[] = "copy";
+static const char __pyx_k_data[] = "data";
 static const char __pyx_k_dict[] = "__dict__";
+static const char __pyx_k_fill[] = "fill";
+static const char __pyx_k_full[] = "full";
+static const char __pyx_k_idx1[] = "idx1";
+static const char __pyx_k_idx2[] = "idx2";
+static const char __pyx_k_kind[] = "kind";
+static const char __pyx_k_last[] = "last";
 static const char __pyx_k_main[] = "__main__";
 static const char __pyx_k_mode[] = "mode";
 static const char __pyx_k_name[] = "name";
 static const char __pyx_k_ncol[] = "ncol";
 static const char __pyx_k_ndim[] = "ndim";
+static const char __pyx_k_only[] = "only";
 static const char __pyx_k_pack[] = "pack";
+static const char __pyx_k_ptr1[] = "ptr1";
+static const char __pyx_k_ptr2[] = "ptr2";
+static const char __pyx_k_rows[] = "rows";
+static const char __pyx_k_scol[] = "scol";
+static const char __pyx_k_sidx[] = "sidx";
 static const char __pyx_k_size[] = "size";
 static const char __pyx_k_sort[] = "sort";
+static const char __pyx_k_sptr[] = "sptr";
 static const char __pyx_k_step[] = "step";
 static const char __pyx_k_stop[] = "stop";
+static const char __pyx_k_tcol[] = "tcol";
 static const char __pyx_k_test[] = "__test__";
+static const char __pyx_k_tptr[] = "tptr";
 static const char __pyx_k_ASCII[] = "ASCII";
+static const char __pyx_k_A_COL[] = "A_COL";
+static const char __pyx_k_A_PTR[] = "A_PTR";
+static const char __pyx_k_COL_v[] = "COL_v";
+static const char __pyx_k_NCOL1[] = "NCOL1";
+static const char __pyx_k_NCOL2[] = "NCOL2";
+static const char __pyx_k_STAMP[] = "STAMP";
+static const char __pyx_k_S_COL[] = "S_COL";
+static const char __pyx_k_S_IDX[] = "S_IDX";
+static const char __pyx_k_S_PTR[] = "S_PTR";
+static const char __pyx_k_T_COL[] = "T_COL";
+static const char __pyx_k_T_PTR[] = "T_PTR";
 static const char __pyx_k_class[] = "__class__";
 static const char __pyx_k_dtype[] = "dtype";
 static const char __pyx_k_empty[] = "empty";
 static const char __pyx_k_error[] = "error";
 static const char __pyx_k_flags[] = "flags";
+static const char __pyx_k_float[] = "float";
 static const char __pyx_k_int32[] = "int32";
+static const char __pyx_k_max_c[] = "max_c";
+static const char __pyx_k_max_k[] = "max_k";
+static const char __pyx_k_ncol1[] = "ncol1";
+static const char __pyx_k_ncol2[] = "ncol2";
 static const char __pyx_k_numpy[] = "numpy";
+static const char __pyx_k_pairs[] = "pairs";
 static const char __pyx_k_range[] = "range";
 static const char __pyx_k_shape[] = "shape";
+static const char __pyx_k_sncol[] = "sncol";
+static const char __pyx_k_split[] = "split";
+static const char __pyx_k_stamp[] = "stamp";
 static const char __pyx_k_start[] = "start";
+static const char __pyx_k_strip[] = "strip";
+static const char __pyx_k_tncol[] = "tncol";
+static const char __pyx_k_zeros[] = "zeros";
+static const char __pyx_k_FIRSTO[] = "FIRSTO";
+static const char __pyx_k_S_NCOL[] = "S_NCOL";
+static const char __pyx_k_T_NCOL[] = "T_NCOL";
+static const char __pyx_k_double[] = "double";
 static const char __pyx_k_encode[] = "encode";
+static const char __pyx_k_firsto[] = "firsto";
 static const char __pyx_k_format[] = "format";
 static const char __pyx_k_import[] = "__import__";
+static const char __pyx_k_kwargs[] = "kwargs";
 static const char __pyx_k_name_2[] = "__name__";
 static const char __pyx_k_pickle[] = "pickle";
 static const char __pyx_k_reduce[] = "__reduce__";
 static const char __pyx_k_struct[] = "struct";
 static const char __pyx_k_unpack[] = "unpack";
 static const char __pyx_k_update[] = "update";
+static const char __pyx_k_float32[] = "float32";
+static const char __pyx_k_float64[] = "float64";
 static const char __pyx_k_fortran[] = "fortran";
 static const char __pyx_k_memview[] = "memview";
 static const char __pyx_k_Ellipsis[] = "Ellipsis";
 static const char __pyx_k_FOLD_col[] = "FOLD_col";
 static const char __pyx_k_FOLD_ptr[] = "FOLD_ptr";
+static const char __pyx_k_defaults[] = "defaults";
 static const char __pyx_k_fold_col[] = "fold_col";
 static const char __pyx_k_fold_ptr[] = "fold_ptr";
 static const char __pyx_k_getstate[] = "__getstate__";
@@ -2266,12 +2542,15 @@ static const char __pyx_k_IndexError[] = "IndexError";
 static const char __pyx_k_ValueError[] = "ValueError";
 static const char __pyx_k_pyx_result[] = "__pyx_result";
 static const char __pyx_k_pyx_vtable[] = "__pyx_vtable__";
+static const char __pyx_k_signatures[] = "signatures";
+static const char __pyx_k_sparse_sub[] = "sparse_sub";
 static const char __pyx_k_ImportError[] = "ImportError";
 static const char __pyx_k_MemoryError[] = "MemoryError";
 static const char __pyx_k_PickleError[] = "PickleError";
 static const char __pyx_k_RuntimeError[] = "RuntimeError";
 static const char __pyx_k_pyx_checksum[] = "__pyx_checksum";
 static const char __pyx_k_sisl__sparse[] = "sisl._sparse";
+static const char __pyx_k_sparse_merge[] = "sparse_merge";
 static const char __pyx_k_stringsource[] = "stringsource";
 static const char __pyx_k_pyx_getbuffer[] = "__pyx_getbuffer";
 static const char __pyx_k_reduce_cython[] = "__reduce_cython__";
@@ -2281,10 +2560,13 @@ static const char __pyx_k_dtype_is_object[] = "dtype_is_object";
 static const char __pyx_k_fold_csr_matrix[] = "fold_csr_matrix";
 static const char __pyx_k_pyx_PickleError[] = "__pyx_PickleError";
 static const char __pyx_k_setstate_cython[] = "__setstate_cython__";
+static const char __pyx_k_sparse_finalize[] = "sparse_finalize";
 static const char __pyx_k_sisl__sparse_pyx[] = "sisl/_sparse.pyx";
+static const char __pyx_k_sparse_transpose[] = "sparse_transpose";
 static const char __pyx_k_pyx_unpickle_Enum[] = "__pyx_unpickle_Enum";
 static const char __pyx_k_cline_in_traceback[] = "cline_in_traceback";
 static const char __pyx_k_fold_csr_matrix_nc[] = "fold_csr_matrix_nc";
+static const char __pyx_k_sparse_orb_to_atom[] = "sparse_orb_to_atom";
 static const char __pyx_k_strided_and_direct[] = "<strided and direct>";
 static const char __pyx_k_fold_csr_diagonal_nc[] = "fold_csr_diagonal_nc";
 static const char __pyx_k_something_went_wrong[] = "something went wrong";
@@ -2296,6 +2578,7 @@ static const char __pyx_k_contiguous_and_indirect[] = "<contiguous and indirect>
 static const char __pyx_k_something_went_wrong_NC[] = "something went wrong NC";
 static const char __pyx_k_Cannot_index_with_type_s[] = "Cannot index with type '%s'";
 static const char __pyx_k_Invalid_shape_in_axis_d_d[] = "Invalid shape in axis %d: %d.";
+static const char __pyx_k_No_matching_signature_found[] = "No matching signature found";
 static const char __pyx_k_itemsize_0_for_cython_array[] = "itemsize <= 0 for cython.array";
 static const char __pyx_k_ndarray_is_not_C_contiguous[] = "ndarray is not C contiguous";
 static const char __pyx_k_unable_to_allocate_array_data[] = "unable to allocate array data.";
@@ -2308,7 +2591,9 @@ static const char __pyx_k_Can_only_create_a_buffer_that_is[] = "Can only create
 static const char __pyx_k_Cannot_assign_to_read_only_memor[] = "Cannot assign to read-only memoryview";
 static const char __pyx_k_Cannot_create_writable_memory_vi[] = "Cannot create writable memory view from read-only memoryview";
 static const char __pyx_k_Empty_shape_tuple_for_cython_arr[] = "Empty shape tuple for cython.array";
+static const char __pyx_k_Expected_at_least_d_argument_s_g[] = "Expected at least %d argument%s, got %d";
 static const char __pyx_k_Format_string_allocated_too_shor[] = "Format string allocated too short, see comment in numpy.pxd";
+static const char __pyx_k_Function_call_with_ambiguous_arg[] = "Function call with ambiguous argument types";
 static const char __pyx_k_Incompatible_checksums_s_vs_0xb0[] = "Incompatible checksums (%s vs 0xb068931 = (name))";
 static const char __pyx_k_Indirect_dimensions_not_supporte[] = "Indirect dimensions not supported";
 static const char __pyx_k_Invalid_mode_expected_c_or_fortr[] = "Invalid mode, expected 'c' or 'fortran', got %s";
@@ -2322,19 +2607,34 @@ static const char __pyx_k_numpy_core_umath_failed_to_impor[] = "numpy.core.umath
 static const char __pyx_k_unable_to_allocate_shape_and_str[] = "unable to allocate shape and strides.";
 static const char __pyx_k_Format_string_allocated_too_shor_2[] = "Format string allocated too short.";
 static PyObject *__pyx_n_s_ASCII;
+static PyObject *__pyx_n_s_A_COL;
+static PyObject *__pyx_n_s_A_D;
+static PyObject *__pyx_n_s_A_PTR;
 static PyObject *__pyx_kp_s_Buffer_view_does_not_expose_stri;
 static PyObject *__pyx_n_s_COL;
+static PyObject *__pyx_n_s_COL1;
+static PyObject *__pyx_n_s_COL2;
+static PyObject *__pyx_n_s_COL_v;
 static PyObject *__pyx_kp_s_Can_only_create_a_buffer_that_is;
 static PyObject *__pyx_kp_s_Cannot_assign_to_read_only_memor;
 static PyObject *__pyx_kp_s_Cannot_create_writable_memory_vi;
 static PyObject *__pyx_kp_s_Cannot_index_with_type_s;
+static PyObject *__pyx_n_s_D;
+static PyObject *__pyx_n_s_D_v;
 static PyObject *__pyx_n_s_Ellipsis;
 static PyObject *__pyx_kp_s_Empty_shape_tuple_for_cython_arr;
+static PyObject *__pyx_kp_s_Expected_at_least_d_argument_s_g;
+static PyObject *__pyx_n_s_FIRSTO;
 static PyObject *__pyx_n_s_FOLD_col;
 static PyObject *__pyx_n_s_FOLD_ncol;
 static PyObject *__pyx_n_s_FOLD_ptr;
 static PyObject *__pyx_kp_u_Format_string_allocated_too_shor;
 static PyObject *__pyx_kp_u_Format_string_allocated_too_shor_2;
+static PyObject *__pyx_kp_s_Function_call_with_ambiguous_arg;
+static PyObject *__pyx_n_s_IDX;
+static PyObject *__pyx_n_s_IDX1;
+static PyObject *__pyx_n_s_IDX2;
+static PyObject *__pyx_n_s_ISC;
 static PyObject *__pyx_n_s_ImportError;
 static PyObject *__pyx_kp_s_Incompatible_checksums_s_vs_0xb0;
 static PyObject *__pyx_n_s_IndexError;
@@ -2345,34 +2645,71 @@ static PyObject *__pyx_n_s_MemoryError;
 static PyObject *__pyx_kp_s_MemoryView_of_r_at_0x_x;
 static PyObject *__pyx_kp_s_MemoryView_of_r_object;
 static PyObject *__pyx_n_s_NCOL;
+static PyObject *__pyx_n_s_NCOL1;
+static PyObject *__pyx_n_s_NCOL2;
+static PyObject *__pyx_kp_s_No_matching_signature_found;
 static PyObject *__pyx_kp_u_Non_native_byte_order_not_suppor;
 static PyObject *__pyx_n_b_O;
+static PyObject *__pyx_n_s_O2A;
+static PyObject *__pyx_n_s_OFF;
 static PyObject *__pyx_kp_s_Out_of_bounds_on_buffer_access_a;
+static PyObject *__pyx_n_s_POS;
 static PyObject *__pyx_n_s_PTR;
+static PyObject *__pyx_n_s_PTR1;
+static PyObject *__pyx_n_s_PTR2;
+static PyObject *__pyx_n_s_PVT;
 static PyObject *__pyx_n_s_PickleError;
+static PyObject *__pyx_n_s_ROWS;
 static PyObject *__pyx_n_s_RuntimeError;
+static PyObject *__pyx_n_s_STAMP;
+static PyObject *__pyx_n_s_S_COL;
+static PyObject *__pyx_n_s_S_IDX;
+static PyObject *__pyx_n_s_S_NCOL;
+static PyObject *__pyx_n_s_S_PTR;
+static PyObject *__pyx_n_s_T_COL;
+static PyObject *__pyx_n_s_T_NCOL;
+static PyObject *__pyx_n_s_T_PTR;
 static PyObject *__pyx_n_s_TypeError;
 static PyObject *__pyx_kp_s_Unable_to_convert_item_to_object;
 static PyObject *__pyx_n_s_ValueError;
 static PyObject *__pyx_n_s_View_MemoryView;
+static PyObject *__pyx_kp_s__5;
+static PyObject *__pyx_kp_s__6;
+static PyObject *__pyx_n_s_acol;
+static PyObject *__pyx_n_s_ad;
 static PyObject *__pyx_n_s_allocate_buffer;
+static PyObject *__pyx_n_s_aptr;
+static PyObject *__pyx_n_s_args;
 static PyObject *__pyx_n_s_base;
 static PyObject *__pyx_n_s_c;
 static PyObject *__pyx_n_u_c;
 static PyObject *__pyx_n_s_class;
 static PyObject *__pyx_n_s_cline_in_traceback;
 static PyObject *__pyx_n_s_col;
+static PyObject *__pyx_n_s_col1;
+static PyObject *__pyx_n_s_col2;
 static PyObject *__pyx_kp_s_contiguous_and_direct;
 static PyObject *__pyx_kp_s_contiguous_and_indirect;
 static PyObject *__pyx_n_s_copy;
+static PyObject *__pyx_n_s_data;
+static PyObject *__pyx_n_s_defaults;
 static PyObject *__pyx_n_s_dict;
+static PyObject *__pyx_n_s_double;
 static PyObject *__pyx_n_s_dtype;
 static PyObject *__pyx_n_s_dtype_is_object;
+static PyObject *__pyx_n_s_e1;
+static PyObject *__pyx_n_s_e2;
 static PyObject *__pyx_n_s_empty;
 static PyObject *__pyx_n_s_encode;
 static PyObject *__pyx_n_s_enumerate;
+static PyObject *__pyx_n_s_err;
 static PyObject *__pyx_n_s_error;
+static PyObject *__pyx_n_s_fill;
+static PyObject *__pyx_n_s_firsto;
 static PyObject *__pyx_n_s_flags;
+static PyObject *__pyx_n_s_float;
+static PyObject *__pyx_n_s_float32;
+static PyObject *__pyx_n_s_float64;
 static PyObject *__pyx_n_s_fold_col;
 static PyObject *__pyx_n_s_fold_csr_diagonal_nc;
 static PyObject *__pyx_n_s_fold_csr_matrix;
@@ -2382,24 +2719,50 @@ static PyObject *__pyx_n_s_fold_ptr;
 static PyObject *__pyx_n_s_format;
 static PyObject *__pyx_n_s_fortran;
 static PyObject *__pyx_n_u_fortran;
+static PyObject *__pyx_n_s_full;
 static PyObject *__pyx_n_s_getstate;
 static PyObject *__pyx_kp_s_got_differing_extents_in_dimensi;
+static PyObject *__pyx_n_s_i;
+static PyObject *__pyx_n_s_i1;
+static PyObject *__pyx_n_s_i2;
+static PyObject *__pyx_n_s_ia;
 static PyObject *__pyx_n_s_id;
+static PyObject *__pyx_n_s_idx;
+static PyObject *__pyx_n_s_idx1;
+static PyObject *__pyx_n_s_idx2;
 static PyObject *__pyx_n_s_import;
 static PyObject *__pyx_n_s_ind;
 static PyObject *__pyx_n_s_int32;
+static PyObject *__pyx_n_s_io;
+static PyObject *__pyx_n_s_isc;
 static PyObject *__pyx_n_s_itemsize;
 static PyObject *__pyx_kp_s_itemsize_0_for_cython_array;
+static PyObject *__pyx_n_s_j;
+static PyObject *__pyx_n_s_k;
+static PyObject *__pyx_n_s_kind;
+static PyObject *__pyx_n_s_kwargs;
+static PyObject *__pyx_n_s_last;
 static PyObject *__pyx_n_s_main;
+static PyObject *__pyx_n_s_max_c;
+static PyObject *__pyx_n_s_max_k;
 static PyObject *__pyx_n_s_memview;
 static PyObject *__pyx_n_s_mode;
+static PyObject *__pyx_n_s_n;
+static PyObject *__pyx_n_s_n_s;
+static PyObject *__pyx_n_s_na;
 static PyObject *__pyx_n_s_name;
 static PyObject *__pyx_n_s_name_2;
+static PyObject *__pyx_n_s_nc;
 static PyObject *__pyx_n_s_ncol;
+static PyObject *__pyx_n_s_ncol1;
+static PyObject *__pyx_n_s_ncol2;
+static PyObject *__pyx_n_s_nd;
 static PyObject *__pyx_kp_u_ndarray_is_not_C_contiguous;
 static PyObject *__pyx_kp_u_ndarray_is_not_Fortran_contiguou;
 static PyObject *__pyx_n_s_ndim;
 static PyObject *__pyx_n_s_new;
+static PyObject *__pyx_n_s_nnz;
+static PyObject *__pyx_n_s_no;
 static PyObject *__pyx_kp_s_no_default___reduce___due_to_non;
 static PyObject *__pyx_n_s_np;
 static PyObject *__pyx_n_s_nr;
@@ -2407,10 +2770,19 @@ static PyObject *__pyx_n_s_numpy;
 static PyObject *__pyx_kp_s_numpy_core_multiarray_failed_to;
 static PyObject *__pyx_kp_s_numpy_core_umath_failed_to_impor;
 static PyObject *__pyx_n_s_nz;
+static PyObject *__pyx_n_s_o2a;
 static PyObject *__pyx_n_s_obj;
+static PyObject *__pyx_n_s_off;
+static PyObject *__pyx_n_s_only;
+static PyObject *__pyx_n_s_p;
 static PyObject *__pyx_n_s_pack;
+static PyObject *__pyx_n_s_pairs;
 static PyObject *__pyx_n_s_pickle;
+static PyObject *__pyx_n_s_pos;
 static PyObject *__pyx_n_s_ptr;
+static PyObject *__pyx_n_s_ptr1;
+static PyObject *__pyx_n_s_ptr2;
+static PyObject *__pyx_n_s_pvt;
 static PyObject *__pyx_n_s_pyx_PickleError;
 static PyObject *__pyx_n_s_pyx_checksum;
 static PyObject *__pyx_n_s_pyx_getbuffer;
@@ -2419,22 +2791,37 @@ static PyObject *__pyx_n_s_pyx_state;
 static PyObject *__pyx_n_s_pyx_type;
 static PyObject *__pyx_n_s_pyx_unpickle_Enum;
 static PyObject *__pyx_n_s_pyx_vtable;
+static PyObject *__pyx_n_s_q;
 static PyObject *__pyx_n_s_r;
 static PyObject *__pyx_n_s_range;
 static PyObject *__pyx_n_s_reduce;
 static PyObject *__pyx_n_s_reduce_cython;
 static PyObject *__pyx_n_s_reduce_ex;
+static PyObject *__pyx_n_s_rows;
 static PyObject *__pyx_n_s_rr;
+static PyObject *__pyx_n_s_s;
+static PyObject *__pyx_n_s_scol;
 static PyObject *__pyx_n_s_setstate;
 static PyObject *__pyx_n_s_setstate_cython;
 static PyObject *__pyx_n_s_shape;
+static PyObject *__pyx_n_s_sidx;
+static PyObject *__pyx_n_s_signatures;
 static PyObject *__pyx_n_s_sisl__sparse;
 static PyObject *__pyx_kp_s_sisl__sparse_pyx;
 static PyObject *__pyx_n_s_size;
+static PyObject *__pyx_n_s_sncol;
 static PyObject *__pyx_kp_s_something_went_wrong;
 static PyObject *__pyx_kp_s_something_went_wrong_NC;
 static PyObject *__pyx_kp_s_something_went_wrong_overlap_NC;
 static PyObject *__pyx_n_s_sort;
+static PyObject *__pyx_n_s_sparse_finalize;
+static PyObject *__pyx_n_s_sparse_merge;
+static PyObject *__pyx_n_s_sparse_orb_to_atom;
+static PyObject *__pyx_n_s_sparse_sub;
+static PyObject *__pyx_n_s_sparse_transpose;
+static PyObject *__pyx_n_s_split;
+static PyObject *__pyx_n_s_sptr;
+static PyObject *__pyx_n_s_stamp;
 static PyObject *__pyx_n_s_start;
 static PyObject *__pyx_n_s_step;
 static PyObject *__pyx_n_s_stop;
@@ -2442,17 +2829,32 @@ static PyObject *__pyx_kp_s_strided_and_direct;
 static PyObject *__pyx_kp_s_strided_and_direct_or_indirect;
 static PyObject *__pyx_kp_s_strided_and_indirect;
 static PyObject *__pyx_kp_s_stringsource;
+static PyObject *__pyx_n_s_strip;
 static PyObject *__pyx_n_s_struct;
+static PyObject *__pyx_n_s_sz;
+static PyObject *__pyx_n_s_t;
+static PyObject *__pyx_n_s_tcol;
 static PyObject *__pyx_n_s_test;
 static PyObject *__pyx_n_s_tmp;
+static PyObject *__pyx_n_s_tncol;
+static PyObject *__pyx_n_s_tptr;
 static PyObject *__pyx_kp_s_unable_to_allocate_array_data;
 static PyObject *__pyx_kp_s_unable_to_allocate_shape_and_str;
 static PyObject *__pyx_kp_u_unknown_dtype_code_in_numpy_pxd;
 static PyObject *__pyx_n_s_unpack;
 static PyObject *__pyx_n_s_update;
+static PyObject *__pyx_n_s_v;
+static PyObject *__pyx_n_s_zeros;
 static PyObject *__pyx_pf_4sisl_7_sparse_fold_csr_matrix(CYTHON_UNUSED PyObject *__pyx_self, PyArrayObject *__pyx_v_PTR, PyArrayObject *__pyx_v_NCOL, PyArrayObject *__pyx_v_COL); /* proto */
 static PyObject *__pyx_pf_4sisl_7_sparse_2fold_csr_matrix_nc(CYTHON_UNUSED PyObject *__pyx_self, PyArrayObject *__pyx_v_PTR, PyArrayObject *__pyx_v_NCOL, PyArrayObject *__pyx_v_COL); /* proto */
 static PyObject *__pyx_pf_4sisl_7_sparse_4fold_csr_diagonal_nc(CYTHON_UNUSED PyObject *__pyx_self, PyArrayObject *__pyx_v_PTR, PyArrayObject *__pyx_v_NCOL, PyArrayObject *__pyx_v_COL); /* proto */
+static PyObject *__pyx_pf_4sisl_7_sparse_6sparse_merge(CYTHON_UNUSED PyObject *__pyx_self, PyArrayObject *__pyx_v_PTR1, PyArrayObject *__pyx_v_NCOL1, PyArrayObject *__pyx_v_COL1, PyArrayObject *__pyx_v_PTR2, PyArrayObject *__pyx_v_NCOL2, PyArrayObject *__pyx_v_COL2); /* proto */
+static PyObject *__pyx_pf_4sisl_7_sparse_8sparse_transpose(CYTHON_UNUSED PyObject *__pyx_self, PyArrayObject *__pyx_v_PTR, PyArrayObject *__pyx_v_NCOL, PyArrayObject *__pyx_v_COL, PyArrayObject *__pyx_v_ISC, int __pyx_v_size); /* proto */
+static PyObject *__pyx_pf_4sisl_7_sparse_10sparse_sub(CYTHON_UNUSED PyObject *__pyx_self, PyArrayObject *__pyx_v_PTR, PyArrayObject *__pyx_v_NCOL, PyArrayObject *__pyx_v_COL, PyArrayObject *__pyx_v_ROWS, PyArrayObject *__pyx_v_PVT); /* proto */
+static PyObject *__pyx_pf_4sisl_7_sparse_12sparse_finalize(CYTHON_UNUSED PyObject *__pyx_self, PyArrayObject *__pyx_v_PTR, PyArrayObject *__pyx_v_NCOL, PyArrayObject *__pyx_v_COL, PyArrayObject *__pyx_v_D, int __pyx_v_sort); /* proto */
+static PyObject *__pyx_pf_4sisl_7_sparse_14sparse_orb_to_atom(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_signatures, PyObject *__pyx_v_args, PyObject *__pyx_v_kwargs, CYTHON_UNUSED PyObject *__pyx_v_defaults); /* proto */
+static PyObject *__pyx_pf_4sisl_7_sparse_16sparse_orb_to_atom(CYTHON_UNUSED PyObject *__pyx_self, PyArrayObject *__pyx_v_PTR, PyArrayObject *__pyx_v_COL, __Pyx_memviewslice __pyx_v_D, PyArrayObject *__pyx_v_FIRSTO, PyArrayObject *__pyx_v_O2A, int __pyx_v_n_s, int __pyx_v_only); /* proto */
+static PyObject *__pyx_pf_4sisl_7_sparse_18sparse_orb_to_atom(CYTHON_UNUSED PyObject *__pyx_self, PyArrayObject *__pyx_v_PTR, PyArrayObject *__pyx_v_COL, __Pyx_memviewslice __pyx_v_D, PyArrayObject *__pyx_v_FIRSTO, PyArrayObject *__pyx_v_O2A, int __pyx_v_n_s, int __pyx_v_only); /* proto */
 static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, Py_buffer *__pyx_v_info, int __pyx_v_flags); /* proto */
 static void __pyx_pf_5numpy_7ndarray_2__releasebuffer__(PyArrayObject *__pyx_v_self, Py_buffer *__pyx_v_info); /* proto */
 static int __pyx_array___pyx_pf_15View_dot_MemoryView_5array___cinit__(struct __pyx_array_obj *__pyx_v_self, PyObject *__pyx_v_shape, Py_ssize_t __pyx_v_itemsize, PyObject *__pyx_v_format, PyObject *__pyx_v_mode, int __pyx_v_allocate_buffer); /* proto */
@@ -2503,18 +2905,17 @@ static PyObject *__pyx_tp_new_memoryview(PyTypeObject *t, PyObject *a, PyObject
 static PyObject *__pyx_tp_new__memoryviewslice(PyTypeObject *t, PyObject *a, PyObject *k); /*proto*/
 static PyObject *__pyx_int_0;
 static PyObject *__pyx_int_1;
+static PyObject *__pyx_int_7;
 static PyObject *__pyx_int_184977713;
 static PyObject *__pyx_int_neg_1;
 static PyObject *__pyx_tuple_;
 static PyObject *__pyx_tuple__2;
 static PyObject *__pyx_tuple__3;
 static PyObject *__pyx_tuple__4;
-static PyObject *__pyx_tuple__5;
-static PyObject *__pyx_tuple__6;
 static PyObject *__pyx_tuple__7;
 static PyObject *__pyx_tuple__8;
 static PyObject *__pyx_tuple__9;
-static PyObject *__pyx_slice__25;
+static PyObject *__pyx_slice__30;
 static PyObject *__pyx_tuple__10;
 static PyObject *__pyx_tuple__11;
 static PyObject *__pyx_tuple__12;
@@ -2530,25 +2931,40 @@ static PyObject *__pyx_tuple__21;
 static PyObject *__pyx_tuple__22;
 static PyObject *__pyx_tuple__23;
 static PyObject *__pyx_tuple__24;
+static PyObject *__pyx_tuple__25;
 static PyObject *__pyx_tuple__26;
 static PyObject *__pyx_tuple__27;
 static PyObject *__pyx_tuple__28;
 static PyObject *__pyx_tuple__29;
 static PyObject *__pyx_tuple__31;
+static PyObject *__pyx_tuple__32;
 static PyObject *__pyx_tuple__33;
-static PyObject *__pyx_tuple__35;
+static PyObject *__pyx_tuple__34;
 static PyObject *__pyx_tuple__36;
-static PyObject *__pyx_tuple__37;
 static PyObject *__pyx_tuple__38;
-static PyObject *__pyx_tuple__39;
 static PyObject *__pyx_tuple__40;
-static PyObject *__pyx_codeobj__30;
-static PyObject *__pyx_codeobj__32;
-static PyObject *__pyx_codeobj__34;
+static PyObject *__pyx_tuple__42;
+static PyObject *__pyx_tuple__44;
+static PyObject *__pyx_tuple__46;
+static PyObject *__pyx_tuple__48;
+static PyObject *__pyx_tuple__50;
+static PyObject *__pyx_tuple__51;
+static PyObject *__pyx_tuple__52;
+static PyObject *__pyx_tuple__53;
+static PyObject *__pyx_tuple__54;
+static PyObject *__pyx_tuple__55;
+static PyObject *__pyx_codeobj__35;
+static PyObject *__pyx_codeobj__37;
+static PyObject *__pyx_codeobj__39;
 static PyObject *__pyx_codeobj__41;
+static PyObject *__pyx_codeobj__43;
+static PyObject *__pyx_codeobj__45;
+static PyObject *__pyx_codeobj__47;
+static PyObject *__pyx_codeobj__49;
+static PyObject *__pyx_codeobj__56;
 /* Late includes */
 
-/* "sisl/_sparse.pyx":16
+/* "sisl/_sparse.pyx":18
  * @cython.wraparound(False)
  * @cython.initializedcheck(False)
  * cdef inline int _sum(const int[::1] array) nogil:             # <<<<<<<<<<<<<<
@@ -2565,7 +2981,7 @@ static CYTHON_INLINE int __pyx_f_4sisl_7_sparse__sum(__Pyx_memviewslice __pyx_v_
   int __pyx_t_3;
   Py_ssize_t __pyx_t_4;
 
-  /* "sisl/_sparse.pyx":19
+  /* "sisl/_sparse.pyx":21
  *     cdef int total, i
  * 
  *     total = 0             # <<<<<<<<<<<<<<
@@ -2574,7 +2990,7 @@ static CYTHON_INLINE int __pyx_f_4sisl_7_sparse__sum(__Pyx_memviewslice __pyx_v_
  */
   __pyx_v_total = 0;
 
-  /* "sisl/_sparse.pyx":20
+  /* "sisl/_sparse.pyx":22
  * 
  *     total = 0
  *     for i in range(array.shape[0]):             # <<<<<<<<<<<<<<
@@ -2586,7 +3002,7 @@ static CYTHON_INLINE int __pyx_f_4sisl_7_sparse__sum(__Pyx_memviewslice __pyx_v_
   for (__pyx_t_3 = 0; __pyx_t_3 < __pyx_t_2; __pyx_t_3+=1) {
     __pyx_v_i = __pyx_t_3;
 
-    /* "sisl/_sparse.pyx":21
+    /* "sisl/_sparse.pyx":23
  *     total = 0
  *     for i in range(array.shape[0]):
  *         total += array[i]             # <<<<<<<<<<<<<<
@@ -2597,7 +3013,7 @@ static CYTHON_INLINE int __pyx_f_4sisl_7_sparse__sum(__Pyx_memviewslice __pyx_v_
     __pyx_v_total = (__pyx_v_total + (*((int const  *) ( /* dim=0 */ ((char *) (((int const  *) __pyx_v_array.data) + __pyx_t_4)) ))));
   }
 
-  /* "sisl/_sparse.pyx":22
+  /* "sisl/_sparse.pyx":24
  *     for i in range(array.shape[0]):
  *         total += array[i]
  *     return total             # <<<<<<<<<<<<<<
@@ -2607,7 +3023,7 @@ static CYTHON_INLINE int __pyx_f_4sisl_7_sparse__sum(__Pyx_memviewslice __pyx_v_
   __pyx_r = __pyx_v_total;
   goto __pyx_L0;
 
-  /* "sisl/_sparse.pyx":16
+  /* "sisl/_sparse.pyx":18
  * @cython.wraparound(False)
  * @cython.initializedcheck(False)
  * cdef inline int _sum(const int[::1] array) nogil:             # <<<<<<<<<<<<<<
@@ -2620,7 +3036,7 @@ static CYTHON_INLINE int __pyx_f_4sisl_7_sparse__sum(__Pyx_memviewslice __pyx_v_
   return __pyx_r;
 }
 
-/* "sisl/_sparse.pyx":29
+/* "sisl/_sparse.pyx":31
  * @cython.initializedcheck(False)
  * @cython.cdivision(True)
  * def fold_csr_matrix(np.ndarray[np.int32_t, ndim=1, mode='c'] PTR,             # <<<<<<<<<<<<<<
@@ -2664,17 +3080,17 @@ static PyObject *__pyx_pw_4sisl_7_sparse_1fold_csr_matrix(PyObject *__pyx_self,
         case  1:
         if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_NCOL)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("fold_csr_matrix", 1, 3, 3, 1); __PYX_ERR(0, 29, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("fold_csr_matrix", 1, 3, 3, 1); __PYX_ERR(0, 31, __pyx_L3_error)
         }
         CYTHON_FALLTHROUGH;
         case  2:
         if (likely((values[2] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_COL)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("fold_csr_matrix", 1, 3, 3, 2); __PYX_ERR(0, 29, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("fold_csr_matrix", 1, 3, 3, 2); __PYX_ERR(0, 31, __pyx_L3_error)
         }
       }
       if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "fold_csr_matrix") < 0)) __PYX_ERR(0, 29, __pyx_L3_error)
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "fold_csr_matrix") < 0)) __PYX_ERR(0, 31, __pyx_L3_error)
       }
     } else if (PyTuple_GET_SIZE(__pyx_args) != 3) {
       goto __pyx_L5_argtuple_error;
@@ -2689,15 +3105,15 @@ static PyObject *__pyx_pw_4sisl_7_sparse_1fold_csr_matrix(PyObject *__pyx_self,
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("fold_csr_matrix", 1, 3, 3, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 29, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("fold_csr_matrix", 1, 3, 3, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 31, __pyx_L3_error)
   __pyx_L3_error:;
   __Pyx_AddTraceback("sisl._sparse.fold_csr_matrix", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
   return NULL;
   __pyx_L4_argument_unpacking_done:;
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_PTR), __pyx_ptype_5numpy_ndarray, 1, "PTR", 0))) __PYX_ERR(0, 29, __pyx_L1_error)
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_NCOL), __pyx_ptype_5numpy_ndarray, 1, "NCOL", 0))) __PYX_ERR(0, 30, __pyx_L1_error)
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_COL), __pyx_ptype_5numpy_ndarray, 1, "COL", 0))) __PYX_ERR(0, 31, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_PTR), __pyx_ptype_5numpy_ndarray, 1, "PTR", 0))) __PYX_ERR(0, 31, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_NCOL), __pyx_ptype_5numpy_ndarray, 1, "NCOL", 0))) __PYX_ERR(0, 32, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_COL), __pyx_ptype_5numpy_ndarray, 1, "COL", 0))) __PYX_ERR(0, 33, __pyx_L1_error)
   __pyx_r = __pyx_pf_4sisl_7_sparse_fold_csr_matrix(__pyx_self, __pyx_v_PTR, __pyx_v_NCOL, __pyx_v_COL);
 
   /* function exit code */
@@ -2812,57 +3228,57 @@ static PyObject *__pyx_pf_4sisl_7_sparse_fold_csr_matrix(CYTHON_UNUSED PyObject
   __pyx_pybuffernd_COL.rcbuffer = &__pyx_pybuffer_COL;
   {
     __Pyx_BufFmt_StackElem __pyx_stack[1];
-    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_PTR.rcbuffer->pybuffer, (PyObject*)__pyx_v_PTR, &__Pyx_TypeInfo_nn___pyx_t_5numpy_int32_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 29, __pyx_L1_error)
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_PTR.rcbuffer->pybuffer, (PyObject*)__pyx_v_PTR, &__Pyx_TypeInfo_nn___pyx_t_5numpy_int32_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 31, __pyx_L1_error)
   }
   __pyx_pybuffernd_PTR.diminfo[0].strides = __pyx_pybuffernd_PTR.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_PTR.diminfo[0].shape = __pyx_pybuffernd_PTR.rcbuffer->pybuffer.shape[0];
   {
     __Pyx_BufFmt_StackElem __pyx_stack[1];
-    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_NCOL.rcbuffer->pybuffer, (PyObject*)__pyx_v_NCOL, &__Pyx_TypeInfo_nn___pyx_t_5numpy_int32_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 29, __pyx_L1_error)
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_NCOL.rcbuffer->pybuffer, (PyObject*)__pyx_v_NCOL, &__Pyx_TypeInfo_nn___pyx_t_5numpy_int32_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 31, __pyx_L1_error)
   }
   __pyx_pybuffernd_NCOL.diminfo[0].strides = __pyx_pybuffernd_NCOL.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_NCOL.diminfo[0].shape = __pyx_pybuffernd_NCOL.rcbuffer->pybuffer.shape[0];
   {
     __Pyx_BufFmt_StackElem __pyx_stack[1];
-    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_COL.rcbuffer->pybuffer, (PyObject*)__pyx_v_COL, &__Pyx_TypeInfo_nn___pyx_t_5numpy_int32_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 29, __pyx_L1_error)
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_COL.rcbuffer->pybuffer, (PyObject*)__pyx_v_COL, &__Pyx_TypeInfo_nn___pyx_t_5numpy_int32_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 31, __pyx_L1_error)
   }
   __pyx_pybuffernd_COL.diminfo[0].strides = __pyx_pybuffernd_COL.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_COL.diminfo[0].shape = __pyx_pybuffernd_COL.rcbuffer->pybuffer.shape[0];
 
-  /* "sisl/_sparse.pyx":33
+  /* "sisl/_sparse.pyx":35
  *                     np.ndarray[np.int32_t, ndim=1, mode='c'] COL):
  *     """ Fold all columns into a square matrix """
  *     cdef int[::1] ptr = PTR             # <<<<<<<<<<<<<<
  *     cdef int[::1] ncol = NCOL
  *     cdef int[::1] col = COL
  */
-  __pyx_t_1 = __Pyx_PyObject_to_MemoryviewSlice_dc_int(((PyObject *)__pyx_v_PTR), PyBUF_WRITABLE); if (unlikely(!__pyx_t_1.memview)) __PYX_ERR(0, 33, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyObject_to_MemoryviewSlice_dc_int(((PyObject *)__pyx_v_PTR), PyBUF_WRITABLE); if (unlikely(!__pyx_t_1.memview)) __PYX_ERR(0, 35, __pyx_L1_error)
   __pyx_v_ptr = __pyx_t_1;
   __pyx_t_1.memview = NULL;
   __pyx_t_1.data = NULL;
 
-  /* "sisl/_sparse.pyx":34
+  /* "sisl/_sparse.pyx":36
  *     """ Fold all columns into a square matrix """
  *     cdef int[::1] ptr = PTR
  *     cdef int[::1] ncol = NCOL             # <<<<<<<<<<<<<<
  *     cdef int[::1] col = COL
  *     # Number of rows
  */
-  __pyx_t_1 = __Pyx_PyObject_to_MemoryviewSlice_dc_int(((PyObject *)__pyx_v_NCOL), PyBUF_WRITABLE); if (unlikely(!__pyx_t_1.memview)) __PYX_ERR(0, 34, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyObject_to_MemoryviewSlice_dc_int(((PyObject *)__pyx_v_NCOL), PyBUF_WRITABLE); if (unlikely(!__pyx_t_1.memview)) __PYX_ERR(0, 36, __pyx_L1_error)
   __pyx_v_ncol = __pyx_t_1;
   __pyx_t_1.memview = NULL;
   __pyx_t_1.data = NULL;
 
-  /* "sisl/_sparse.pyx":35
+  /* "sisl/_sparse.pyx":37
  *     cdef int[::1] ptr = PTR
  *     cdef int[::1] ncol = NCOL
  *     cdef int[::1] col = COL             # <<<<<<<<<<<<<<
  *     # Number of rows
  *     cdef int nr = ncol.shape[0]
  */
-  __pyx_t_1 = __Pyx_PyObject_to_MemoryviewSlice_dc_int(((PyObject *)__pyx_v_COL), PyBUF_WRITABLE); if (unlikely(!__pyx_t_1.memview)) __PYX_ERR(0, 35, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyObject_to_MemoryviewSlice_dc_int(((PyObject *)__pyx_v_COL), PyBUF_WRITABLE); if (unlikely(!__pyx_t_1.memview)) __PYX_ERR(0, 37, __pyx_L1_error)
   __pyx_v_col = __pyx_t_1;
   __pyx_t_1.memview = NULL;
   __pyx_t_1.data = NULL;
 
-  /* "sisl/_sparse.pyx":37
+  /* "sisl/_sparse.pyx":39
  *     cdef int[::1] col = COL
  *     # Number of rows
  *     cdef int nr = ncol.shape[0]             # <<<<<<<<<<<<<<
@@ -2871,51 +3287,51 @@ static PyObject *__pyx_pf_4sisl_7_sparse_fold_csr_matrix(CYTHON_UNUSED PyObject
  */
   __pyx_v_nr = (__pyx_v_ncol.shape[0]);
 
-  /* "sisl/_sparse.pyx":38
+  /* "sisl/_sparse.pyx":40
  *     # Number of rows
  *     cdef int nr = ncol.shape[0]
  *     cdef np.ndarray[np.int32_t, ndim=1, mode='c'] FOLD_ptr = np.empty([nr + 1], dtype=np.int32)             # <<<<<<<<<<<<<<
  *     cdef int[::1] fold_ptr = FOLD_ptr
  *     cdef np.ndarray[np.int32_t, ndim=1, mode='c'] FOLD_ncol = np.empty([nr], dtype=np.int32)
  */
-  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_np); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 38, __pyx_L1_error)
+  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_np); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 40, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_empty); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 38, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_empty); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 40, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __pyx_t_2 = __Pyx_PyInt_From_long((__pyx_v_nr + 1)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 38, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyInt_From_long((__pyx_v_nr + 1)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 40, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_4 = PyList_New(1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 38, __pyx_L1_error)
+  __pyx_t_4 = PyList_New(1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 40, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_4);
   __Pyx_GIVEREF(__pyx_t_2);
   PyList_SET_ITEM(__pyx_t_4, 0, __pyx_t_2);
   __pyx_t_2 = 0;
-  __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 38, __pyx_L1_error)
+  __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 40, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __Pyx_GIVEREF(__pyx_t_4);
   PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_t_4);
   __pyx_t_4 = 0;
-  __pyx_t_4 = __Pyx_PyDict_NewPresized(1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 38, __pyx_L1_error)
+  __pyx_t_4 = __Pyx_PyDict_NewPresized(1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 40, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_4);
-  __Pyx_GetModuleGlobalName(__pyx_t_5, __pyx_n_s_np); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 38, __pyx_L1_error)
+  __Pyx_GetModuleGlobalName(__pyx_t_5, __pyx_n_s_np); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 40, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_5);
-  __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_t_5, __pyx_n_s_int32); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 38, __pyx_L1_error)
+  __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_t_5, __pyx_n_s_int32); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 40, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_6);
   __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-  if (PyDict_SetItem(__pyx_t_4, __pyx_n_s_dtype, __pyx_t_6) < 0) __PYX_ERR(0, 38, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_4, __pyx_n_s_dtype, __pyx_t_6) < 0) __PYX_ERR(0, 40, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-  __pyx_t_6 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_t_2, __pyx_t_4); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 38, __pyx_L1_error)
+  __pyx_t_6 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_t_2, __pyx_t_4); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 40, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_6);
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-  if (!(likely(((__pyx_t_6) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_6, __pyx_ptype_5numpy_ndarray))))) __PYX_ERR(0, 38, __pyx_L1_error)
+  if (!(likely(((__pyx_t_6) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_6, __pyx_ptype_5numpy_ndarray))))) __PYX_ERR(0, 40, __pyx_L1_error)
   __pyx_t_7 = ((PyArrayObject *)__pyx_t_6);
   {
     __Pyx_BufFmt_StackElem __pyx_stack[1];
     if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_FOLD_ptr.rcbuffer->pybuffer, (PyObject*)__pyx_t_7, &__Pyx_TypeInfo_nn___pyx_t_5numpy_int32_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) {
       __pyx_v_FOLD_ptr = ((PyArrayObject *)Py_None); __Pyx_INCREF(Py_None); __pyx_pybuffernd_FOLD_ptr.rcbuffer->pybuffer.buf = NULL;
-      __PYX_ERR(0, 38, __pyx_L1_error)
+      __PYX_ERR(0, 40, __pyx_L1_error)
     } else {__pyx_pybuffernd_FOLD_ptr.diminfo[0].strides = __pyx_pybuffernd_FOLD_ptr.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_FOLD_ptr.diminfo[0].shape = __pyx_pybuffernd_FOLD_ptr.rcbuffer->pybuffer.shape[0];
     }
   }
@@ -2923,63 +3339,63 @@ static PyObject *__pyx_pf_4sisl_7_sparse_fold_csr_matrix(CYTHON_UNUSED PyObject
   __pyx_v_FOLD_ptr = ((PyArrayObject *)__pyx_t_6);
   __pyx_t_6 = 0;
 
-  /* "sisl/_sparse.pyx":39
+  /* "sisl/_sparse.pyx":41
  *     cdef int nr = ncol.shape[0]
  *     cdef np.ndarray[np.int32_t, ndim=1, mode='c'] FOLD_ptr = np.empty([nr + 1], dtype=np.int32)
  *     cdef int[::1] fold_ptr = FOLD_ptr             # <<<<<<<<<<<<<<
  *     cdef np.ndarray[np.int32_t, ndim=1, mode='c'] FOLD_ncol = np.empty([nr], dtype=np.int32)
  *     cdef int[::1] fold_ncol = FOLD_ncol
  */
-  __pyx_t_1 = __Pyx_PyObject_to_MemoryviewSlice_dc_int(((PyObject *)__pyx_v_FOLD_ptr), PyBUF_WRITABLE); if (unlikely(!__pyx_t_1.memview)) __PYX_ERR(0, 39, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyObject_to_MemoryviewSlice_dc_int(((PyObject *)__pyx_v_FOLD_ptr), PyBUF_WRITABLE); if (unlikely(!__pyx_t_1.memview)) __PYX_ERR(0, 41, __pyx_L1_error)
   __pyx_v_fold_ptr = __pyx_t_1;
   __pyx_t_1.memview = NULL;
   __pyx_t_1.data = NULL;
 
-  /* "sisl/_sparse.pyx":40
+  /* "sisl/_sparse.pyx":42
  *     cdef np.ndarray[np.int32_t, ndim=1, mode='c'] FOLD_ptr = np.empty([nr + 1], dtype=np.int32)
  *     cdef int[::1] fold_ptr = FOLD_ptr
  *     cdef np.ndarray[np.int32_t, ndim=1, mode='c'] FOLD_ncol = np.empty([nr], dtype=np.int32)             # <<<<<<<<<<<<<<
  *     cdef int[::1] fold_ncol = FOLD_ncol
  *     cdef np.ndarray[np.int32_t, ndim=1, mode='c'] FOLD_col = np.empty([_sum(ncol)], dtype=np.int32)
  */
-  __Pyx_GetModuleGlobalName(__pyx_t_6, __pyx_n_s_np); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 40, __pyx_L1_error)
+  __Pyx_GetModuleGlobalName(__pyx_t_6, __pyx_n_s_np); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 42, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_6);
-  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_t_6, __pyx_n_s_empty); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 40, __pyx_L1_error)
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_t_6, __pyx_n_s_empty); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 42, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_4);
   __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-  __pyx_t_6 = __Pyx_PyInt_From_int(__pyx_v_nr); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 40, __pyx_L1_error)
+  __pyx_t_6 = __Pyx_PyInt_From_int(__pyx_v_nr); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 42, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_6);
-  __pyx_t_2 = PyList_New(1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 40, __pyx_L1_error)
+  __pyx_t_2 = PyList_New(1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 42, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __Pyx_GIVEREF(__pyx_t_6);
   PyList_SET_ITEM(__pyx_t_2, 0, __pyx_t_6);
   __pyx_t_6 = 0;
-  __pyx_t_6 = PyTuple_New(1); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 40, __pyx_L1_error)
+  __pyx_t_6 = PyTuple_New(1); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 42, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_6);
   __Pyx_GIVEREF(__pyx_t_2);
   PyTuple_SET_ITEM(__pyx_t_6, 0, __pyx_t_2);
   __pyx_t_2 = 0;
-  __pyx_t_2 = __Pyx_PyDict_NewPresized(1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 40, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyDict_NewPresized(1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 42, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_n_s_np); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 40, __pyx_L1_error)
+  __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_n_s_np); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 42, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_n_s_int32); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 40, __pyx_L1_error)
+  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_n_s_int32); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 42, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_5);
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  if (PyDict_SetItem(__pyx_t_2, __pyx_n_s_dtype, __pyx_t_5) < 0) __PYX_ERR(0, 40, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_2, __pyx_n_s_dtype, __pyx_t_5) < 0) __PYX_ERR(0, 42, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-  __pyx_t_5 = __Pyx_PyObject_Call(__pyx_t_4, __pyx_t_6, __pyx_t_2); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 40, __pyx_L1_error)
+  __pyx_t_5 = __Pyx_PyObject_Call(__pyx_t_4, __pyx_t_6, __pyx_t_2); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 42, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_5);
   __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
   __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  if (!(likely(((__pyx_t_5) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_5, __pyx_ptype_5numpy_ndarray))))) __PYX_ERR(0, 40, __pyx_L1_error)
+  if (!(likely(((__pyx_t_5) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_5, __pyx_ptype_5numpy_ndarray))))) __PYX_ERR(0, 42, __pyx_L1_error)
   __pyx_t_8 = ((PyArrayObject *)__pyx_t_5);
   {
     __Pyx_BufFmt_StackElem __pyx_stack[1];
     if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_FOLD_ncol.rcbuffer->pybuffer, (PyObject*)__pyx_t_8, &__Pyx_TypeInfo_nn___pyx_t_5numpy_int32_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) {
       __pyx_v_FOLD_ncol = ((PyArrayObject *)Py_None); __Pyx_INCREF(Py_None); __pyx_pybuffernd_FOLD_ncol.rcbuffer->pybuffer.buf = NULL;
-      __PYX_ERR(0, 40, __pyx_L1_error)
+      __PYX_ERR(0, 42, __pyx_L1_error)
     } else {__pyx_pybuffernd_FOLD_ncol.diminfo[0].strides = __pyx_pybuffernd_FOLD_ncol.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_FOLD_ncol.diminfo[0].shape = __pyx_pybuffernd_FOLD_ncol.rcbuffer->pybuffer.shape[0];
     }
   }
@@ -2987,63 +3403,63 @@ static PyObject *__pyx_pf_4sisl_7_sparse_fold_csr_matrix(CYTHON_UNUSED PyObject
   __pyx_v_FOLD_ncol = ((PyArrayObject *)__pyx_t_5);
   __pyx_t_5 = 0;
 
-  /* "sisl/_sparse.pyx":41
+  /* "sisl/_sparse.pyx":43
  *     cdef int[::1] fold_ptr = FOLD_ptr
  *     cdef np.ndarray[np.int32_t, ndim=1, mode='c'] FOLD_ncol = np.empty([nr], dtype=np.int32)
  *     cdef int[::1] fold_ncol = FOLD_ncol             # <<<<<<<<<<<<<<
  *     cdef np.ndarray[np.int32_t, ndim=1, mode='c'] FOLD_col = np.empty([_sum(ncol)], dtype=np.int32)
  *     cdef int[::1] fold_col = FOLD_col
  */
-  __pyx_t_1 = __Pyx_PyObject_to_MemoryviewSlice_dc_int(((PyObject *)__pyx_v_FOLD_ncol), PyBUF_WRITABLE); if (unlikely(!__pyx_t_1.memview)) __PYX_ERR(0, 41, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyObject_to_MemoryviewSlice_dc_int(((PyObject *)__pyx_v_FOLD_ncol), PyBUF_WRITABLE); if (unlikely(!__pyx_t_1.memview)) __PYX_ERR(0, 43, __pyx_L1_error)
   __pyx_v_fold_ncol = __pyx_t_1;
   __pyx_t_1.memview = NULL;
   __pyx_t_1.data = NULL;
 
-  /* "sisl/_sparse.pyx":42
+  /* "sisl/_sparse.pyx":44
  *     cdef np.ndarray[np.int32_t, ndim=1, mode='c'] FOLD_ncol = np.empty([nr], dtype=np.int32)
  *     cdef int[::1] fold_ncol = FOLD_ncol
  *     cdef np.ndarray[np.int32_t, ndim=1, mode='c'] FOLD_col = np.empty([_sum(ncol)], dtype=np.int32)             # <<<<<<<<<<<<<<
  *     cdef int[::1] fold_col = FOLD_col
  *     # local variables
  */
-  __Pyx_GetModuleGlobalName(__pyx_t_5, __pyx_n_s_np); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 42, __pyx_L1_error)
+  __Pyx_GetModuleGlobalName(__pyx_t_5, __pyx_n_s_np); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 44, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_5);
-  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_t_5, __pyx_n_s_empty); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 42, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_t_5, __pyx_n_s_empty); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 44, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-  __pyx_t_5 = __Pyx_PyInt_From_int(__pyx_f_4sisl_7_sparse__sum(__pyx_v_ncol)); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 42, __pyx_L1_error)
+  __pyx_t_5 = __Pyx_PyInt_From_int(__pyx_f_4sisl_7_sparse__sum(__pyx_v_ncol)); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 44, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_5);
-  __pyx_t_6 = PyList_New(1); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 42, __pyx_L1_error)
+  __pyx_t_6 = PyList_New(1); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 44, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_6);
   __Pyx_GIVEREF(__pyx_t_5);
   PyList_SET_ITEM(__pyx_t_6, 0, __pyx_t_5);
   __pyx_t_5 = 0;
-  __pyx_t_5 = PyTuple_New(1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 42, __pyx_L1_error)
+  __pyx_t_5 = PyTuple_New(1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 44, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_5);
   __Pyx_GIVEREF(__pyx_t_6);
   PyTuple_SET_ITEM(__pyx_t_5, 0, __pyx_t_6);
   __pyx_t_6 = 0;
-  __pyx_t_6 = __Pyx_PyDict_NewPresized(1); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 42, __pyx_L1_error)
+  __pyx_t_6 = __Pyx_PyDict_NewPresized(1); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 44, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_6);
-  __Pyx_GetModuleGlobalName(__pyx_t_4, __pyx_n_s_np); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 42, __pyx_L1_error)
+  __Pyx_GetModuleGlobalName(__pyx_t_4, __pyx_n_s_np); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 44, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_4);
-  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_4, __pyx_n_s_int32); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 42, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_4, __pyx_n_s_int32); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 44, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
   __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-  if (PyDict_SetItem(__pyx_t_6, __pyx_n_s_dtype, __pyx_t_3) < 0) __PYX_ERR(0, 42, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_6, __pyx_n_s_dtype, __pyx_t_3) < 0) __PYX_ERR(0, 44, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  __pyx_t_3 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_t_5, __pyx_t_6); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 42, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_t_5, __pyx_t_6); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 44, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
   __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-  if (!(likely(((__pyx_t_3) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_3, __pyx_ptype_5numpy_ndarray))))) __PYX_ERR(0, 42, __pyx_L1_error)
+  if (!(likely(((__pyx_t_3) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_3, __pyx_ptype_5numpy_ndarray))))) __PYX_ERR(0, 44, __pyx_L1_error)
   __pyx_t_9 = ((PyArrayObject *)__pyx_t_3);
   {
     __Pyx_BufFmt_StackElem __pyx_stack[1];
     if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_FOLD_col.rcbuffer->pybuffer, (PyObject*)__pyx_t_9, &__Pyx_TypeInfo_nn___pyx_t_5numpy_int32_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) {
       __pyx_v_FOLD_col = ((PyArrayObject *)Py_None); __Pyx_INCREF(Py_None); __pyx_pybuffernd_FOLD_col.rcbuffer->pybuffer.buf = NULL;
-      __PYX_ERR(0, 42, __pyx_L1_error)
+      __PYX_ERR(0, 44, __pyx_L1_error)
     } else {__pyx_pybuffernd_FOLD_col.diminfo[0].strides = __pyx_pybuffernd_FOLD_col.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_FOLD_col.diminfo[0].shape = __pyx_pybuffernd_FOLD_col.rcbuffer->pybuffer.shape[0];
     }
   }
@@ -3051,19 +3467,19 @@ static PyObject *__pyx_pf_4sisl_7_sparse_fold_csr_matrix(CYTHON_UNUSED PyObject
   __pyx_v_FOLD_col = ((PyArrayObject *)__pyx_t_3);
   __pyx_t_3 = 0;
 
-  /* "sisl/_sparse.pyx":43
+  /* "sisl/_sparse.pyx":45
  *     cdef int[::1] fold_ncol = FOLD_ncol
  *     cdef np.ndarray[np.int32_t, ndim=1, mode='c'] FOLD_col = np.empty([_sum(ncol)], dtype=np.int32)
  *     cdef int[::1] fold_col = FOLD_col             # <<<<<<<<<<<<<<
  *     # local variables
  *     cdef int r, ind, nz, c
  */
-  __pyx_t_1 = __Pyx_PyObject_to_MemoryviewSlice_dc_int(((PyObject *)__pyx_v_FOLD_col), PyBUF_WRITABLE); if (unlikely(!__pyx_t_1.memview)) __PYX_ERR(0, 43, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyObject_to_MemoryviewSlice_dc_int(((PyObject *)__pyx_v_FOLD_col), PyBUF_WRITABLE); if (unlikely(!__pyx_t_1.memview)) __PYX_ERR(0, 45, __pyx_L1_error)
   __pyx_v_fold_col = __pyx_t_1;
   __pyx_t_1.memview = NULL;
   __pyx_t_1.data = NULL;
 
-  /* "sisl/_sparse.pyx":47
+  /* "sisl/_sparse.pyx":49
  *     cdef int r, ind, nz, c
  * 
  *     nz = 0             # <<<<<<<<<<<<<<
@@ -3072,7 +3488,7 @@ static PyObject *__pyx_pf_4sisl_7_sparse_fold_csr_matrix(CYTHON_UNUSED PyObject
  */
   __pyx_v_nz = 0;
 
-  /* "sisl/_sparse.pyx":48
+  /* "sisl/_sparse.pyx":50
  * 
  *     nz = 0
  *     fold_ptr[0] = 0             # <<<<<<<<<<<<<<
@@ -3082,7 +3498,7 @@ static PyObject *__pyx_pf_4sisl_7_sparse_fold_csr_matrix(CYTHON_UNUSED PyObject
   __pyx_t_10 = 0;
   *((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_fold_ptr.data) + __pyx_t_10)) )) = 0;
 
-  /* "sisl/_sparse.pyx":50
+  /* "sisl/_sparse.pyx":52
  *     fold_ptr[0] = 0
  *     # Loop on all rows
  *     for r in range(nr):             # <<<<<<<<<<<<<<
@@ -3094,7 +3510,7 @@ static PyObject *__pyx_pf_4sisl_7_sparse_fold_csr_matrix(CYTHON_UNUSED PyObject
   for (__pyx_t_13 = 0; __pyx_t_13 < __pyx_t_12; __pyx_t_13+=1) {
     __pyx_v_r = __pyx_t_13;
 
-    /* "sisl/_sparse.pyx":53
+    /* "sisl/_sparse.pyx":55
  * 
  *         # Initialize the pointer arrays
  *         if ncol[r] > 0:             # <<<<<<<<<<<<<<
@@ -3105,7 +3521,7 @@ static PyObject *__pyx_pf_4sisl_7_sparse_fold_csr_matrix(CYTHON_UNUSED PyObject
     __pyx_t_15 = (((*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_ncol.data) + __pyx_t_14)) ))) > 0) != 0);
     if (__pyx_t_15) {
 
-      /* "sisl/_sparse.pyx":54
+      /* "sisl/_sparse.pyx":56
  *         # Initialize the pointer arrays
  *         if ncol[r] > 0:
  *             fold_ncol[r] = 1             # <<<<<<<<<<<<<<
@@ -3115,7 +3531,7 @@ static PyObject *__pyx_pf_4sisl_7_sparse_fold_csr_matrix(CYTHON_UNUSED PyObject
       __pyx_t_16 = __pyx_v_r;
       *((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_fold_ncol.data) + __pyx_t_16)) )) = 1;
 
-      /* "sisl/_sparse.pyx":55
+      /* "sisl/_sparse.pyx":57
  *         if ncol[r] > 0:
  *             fold_ncol[r] = 1
  *             fold_col[fold_ptr[r]] = col[ptr[r]] % nr             # <<<<<<<<<<<<<<
@@ -3128,7 +3544,7 @@ static PyObject *__pyx_pf_4sisl_7_sparse_fold_csr_matrix(CYTHON_UNUSED PyObject
       __pyx_t_20 = (*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_fold_ptr.data) + __pyx_t_19)) )));
       *((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_fold_col.data) + __pyx_t_20)) )) = ((*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_col.data) + __pyx_t_18)) ))) % __pyx_v_nr);
 
-      /* "sisl/_sparse.pyx":53
+      /* "sisl/_sparse.pyx":55
  * 
  *         # Initialize the pointer arrays
  *         if ncol[r] > 0:             # <<<<<<<<<<<<<<
@@ -3138,7 +3554,7 @@ static PyObject *__pyx_pf_4sisl_7_sparse_fold_csr_matrix(CYTHON_UNUSED PyObject
       goto __pyx_L5;
     }
 
-    /* "sisl/_sparse.pyx":57
+    /* "sisl/_sparse.pyx":59
  *             fold_col[fold_ptr[r]] = col[ptr[r]] % nr
  *         else:
  *             fold_ncol[r] = 0             # <<<<<<<<<<<<<<
@@ -3151,7 +3567,7 @@ static PyObject *__pyx_pf_4sisl_7_sparse_fold_csr_matrix(CYTHON_UNUSED PyObject
     }
     __pyx_L5:;
 
-    /* "sisl/_sparse.pyx":59
+    /* "sisl/_sparse.pyx":61
  *             fold_ncol[r] = 0
  * 
  *         for ind in range(ptr[r] + 1, ptr[r] + ncol[r]):             # <<<<<<<<<<<<<<
@@ -3166,7 +3582,7 @@ static PyObject *__pyx_pf_4sisl_7_sparse_fold_csr_matrix(CYTHON_UNUSED PyObject
     for (__pyx_t_27 = ((*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_ptr.data) + __pyx_t_25)) ))) + 1); __pyx_t_27 < __pyx_t_26; __pyx_t_27+=1) {
       __pyx_v_ind = __pyx_t_27;
 
-      /* "sisl/_sparse.pyx":60
+      /* "sisl/_sparse.pyx":62
  * 
  *         for ind in range(ptr[r] + 1, ptr[r] + ncol[r]):
  *             c = col[ind] % nr             # <<<<<<<<<<<<<<
@@ -3176,7 +3592,7 @@ static PyObject *__pyx_pf_4sisl_7_sparse_fold_csr_matrix(CYTHON_UNUSED PyObject
       __pyx_t_28 = __pyx_v_ind;
       __pyx_v_c = ((*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_col.data) + __pyx_t_28)) ))) % __pyx_v_nr);
 
-      /* "sisl/_sparse.pyx":61
+      /* "sisl/_sparse.pyx":63
  *         for ind in range(ptr[r] + 1, ptr[r] + ncol[r]):
  *             c = col[ind] % nr
  *             if not in_1d(fold_col[fold_ptr[r]:fold_ptr[r] + fold_ncol[r]], c):             # <<<<<<<<<<<<<<
@@ -3204,7 +3620,7 @@ static PyObject *__pyx_pf_4sisl_7_sparse_fold_csr_matrix(CYTHON_UNUSED PyObject
     0,
     1) < 0))
 {
-    __PYX_ERR(0, 61, __pyx_L1_error)
+    __PYX_ERR(0, 63, __pyx_L1_error)
 }
 
 __pyx_t_15 = ((!(__pyx_f_4sisl_8_indices_in_1d(__pyx_t_1, __pyx_v_c) != 0)) != 0);
@@ -3213,7 +3629,7 @@ __pyx_t_15 = ((!(__pyx_f_4sisl_8_indices_in_1d(__pyx_t_1, __pyx_v_c) != 0)) != 0
       __pyx_t_1.data = NULL;
       if (__pyx_t_15) {
 
-        /* "sisl/_sparse.pyx":62
+        /* "sisl/_sparse.pyx":64
  *             c = col[ind] % nr
  *             if not in_1d(fold_col[fold_ptr[r]:fold_ptr[r] + fold_ncol[r]], c):
  *                 fold_col[fold_ptr[r] + fold_ncol[r]] = c             # <<<<<<<<<<<<<<
@@ -3225,7 +3641,7 @@ __pyx_t_15 = ((!(__pyx_f_4sisl_8_indices_in_1d(__pyx_t_1, __pyx_v_c) != 0)) != 0
         __pyx_t_35 = ((*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_fold_ptr.data) + __pyx_t_33)) ))) + (*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_fold_ncol.data) + __pyx_t_34)) ))));
         *((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_fold_col.data) + __pyx_t_35)) )) = __pyx_v_c;
 
-        /* "sisl/_sparse.pyx":63
+        /* "sisl/_sparse.pyx":65
  *             if not in_1d(fold_col[fold_ptr[r]:fold_ptr[r] + fold_ncol[r]], c):
  *                 fold_col[fold_ptr[r] + fold_ncol[r]] = c
  *                 fold_ncol[r] += 1             # <<<<<<<<<<<<<<
@@ -3235,7 +3651,7 @@ __pyx_t_15 = ((!(__pyx_f_4sisl_8_indices_in_1d(__pyx_t_1, __pyx_v_c) != 0)) != 0
         __pyx_t_36 = __pyx_v_r;
         *((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_fold_ncol.data) + __pyx_t_36)) )) += 1;
 
-        /* "sisl/_sparse.pyx":61
+        /* "sisl/_sparse.pyx":63
  *         for ind in range(ptr[r] + 1, ptr[r] + ncol[r]):
  *             c = col[ind] % nr
  *             if not in_1d(fold_col[fold_ptr[r]:fold_ptr[r] + fold_ncol[r]], c):             # <<<<<<<<<<<<<<
@@ -3245,16 +3661,16 @@ __pyx_t_15 = ((!(__pyx_f_4sisl_8_indices_in_1d(__pyx_t_1, __pyx_v_c) != 0)) != 0
       }
     }
 
-    /* "sisl/_sparse.pyx":66
+    /* "sisl/_sparse.pyx":68
  * 
  *         # Sort indices (we should implement our own sorting algorithm)
  *         tmp = np.sort(fold_col[fold_ptr[r]:fold_ptr[r] + fold_ncol[r]])             # <<<<<<<<<<<<<<
  *         for ind in range(fold_ncol[r]):
  *             fold_col[fold_ptr[r] + ind] = tmp[ind]
  */
-    __Pyx_GetModuleGlobalName(__pyx_t_6, __pyx_n_s_np); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 66, __pyx_L1_error)
+    __Pyx_GetModuleGlobalName(__pyx_t_6, __pyx_n_s_np); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 68, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_6);
-    __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_6, __pyx_n_s_sort); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 66, __pyx_L1_error)
+    __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_6, __pyx_n_s_sort); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 68, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_5);
     __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
     __pyx_t_37 = __pyx_v_r;
@@ -3278,10 +3694,10 @@ __pyx_t_15 = ((!(__pyx_f_4sisl_8_indices_in_1d(__pyx_t_1, __pyx_v_c) != 0)) != 0
     0,
     1) < 0))
 {
-    __PYX_ERR(0, 66, __pyx_L1_error)
+    __PYX_ERR(0, 68, __pyx_L1_error)
 }
 
-__pyx_t_6 = __pyx_memoryview_fromslice(__pyx_t_1, 1, (PyObject *(*)(char *)) __pyx_memview_get_int, (int (*)(char *, PyObject *)) __pyx_memview_set_int, 0);; if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 66, __pyx_L1_error)
+__pyx_t_6 = __pyx_memoryview_fromslice(__pyx_t_1, 1, (PyObject *(*)(char *)) __pyx_memview_get_int, (int (*)(char *, PyObject *)) __pyx_memview_set_int, 0);; if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 68, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_6);
     __PYX_XDEC_MEMVIEW(&__pyx_t_1, 1);
     __pyx_t_1.memview = NULL;
@@ -3299,13 +3715,13 @@ __pyx_t_6 = __pyx_memoryview_fromslice(__pyx_t_1, 1, (PyObject *(*)(char *)) __p
     __pyx_t_3 = (__pyx_t_2) ? __Pyx_PyObject_Call2Args(__pyx_t_5, __pyx_t_2, __pyx_t_6) : __Pyx_PyObject_CallOneArg(__pyx_t_5, __pyx_t_6);
     __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
     __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-    if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 66, __pyx_L1_error)
+    if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 68, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_3);
     __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
     __Pyx_XDECREF_SET(__pyx_v_tmp, __pyx_t_3);
     __pyx_t_3 = 0;
 
-    /* "sisl/_sparse.pyx":67
+    /* "sisl/_sparse.pyx":69
  *         # Sort indices (we should implement our own sorting algorithm)
  *         tmp = np.sort(fold_col[fold_ptr[r]:fold_ptr[r] + fold_ncol[r]])
  *         for ind in range(fold_ncol[r]):             # <<<<<<<<<<<<<<
@@ -3318,23 +3734,23 @@ __pyx_t_6 = __pyx_memoryview_fromslice(__pyx_t_1, 1, (PyObject *(*)(char *)) __p
     for (__pyx_t_27 = 0; __pyx_t_27 < __pyx_t_26; __pyx_t_27+=1) {
       __pyx_v_ind = __pyx_t_27;
 
-      /* "sisl/_sparse.pyx":68
+      /* "sisl/_sparse.pyx":70
  *         tmp = np.sort(fold_col[fold_ptr[r]:fold_ptr[r] + fold_ncol[r]])
  *         for ind in range(fold_ncol[r]):
  *             fold_col[fold_ptr[r] + ind] = tmp[ind]             # <<<<<<<<<<<<<<
  * 
  *         fold_ptr[r + 1] = fold_ptr[r] + fold_ncol[r]
  */
-      __pyx_t_3 = __Pyx_GetItemInt(__pyx_v_tmp, __pyx_v_ind, int, 1, __Pyx_PyInt_From_int, 0, 0, 0); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 68, __pyx_L1_error)
+      __pyx_t_3 = __Pyx_GetItemInt(__pyx_v_tmp, __pyx_v_ind, int, 1, __Pyx_PyInt_From_int, 0, 0, 0); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 70, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_3);
-      __pyx_t_32 = __Pyx_PyInt_As_int(__pyx_t_3); if (unlikely((__pyx_t_32 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 68, __pyx_L1_error)
+      __pyx_t_32 = __Pyx_PyInt_As_int(__pyx_t_3); if (unlikely((__pyx_t_32 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 70, __pyx_L1_error)
       __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
       __pyx_t_41 = __pyx_v_r;
       __pyx_t_42 = ((*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_fold_ptr.data) + __pyx_t_41)) ))) + __pyx_v_ind);
       *((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_fold_col.data) + __pyx_t_42)) )) = __pyx_t_32;
     }
 
-    /* "sisl/_sparse.pyx":70
+    /* "sisl/_sparse.pyx":72
  *             fold_col[fold_ptr[r] + ind] = tmp[ind]
  * 
  *         fold_ptr[r + 1] = fold_ptr[r] + fold_ncol[r]             # <<<<<<<<<<<<<<
@@ -3346,7 +3762,7 @@ __pyx_t_6 = __pyx_memoryview_fromslice(__pyx_t_1, 1, (PyObject *(*)(char *)) __p
     __pyx_t_45 = (__pyx_v_r + 1);
     *((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_fold_ptr.data) + __pyx_t_45)) )) = ((*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_fold_ptr.data) + __pyx_t_43)) ))) + (*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_fold_ncol.data) + __pyx_t_44)) ))));
 
-    /* "sisl/_sparse.pyx":71
+    /* "sisl/_sparse.pyx":73
  * 
  *         fold_ptr[r + 1] = fold_ptr[r] + fold_ncol[r]
  *         nz += fold_ncol[r]             # <<<<<<<<<<<<<<
@@ -3357,7 +3773,7 @@ __pyx_t_6 = __pyx_memoryview_fromslice(__pyx_t_1, 1, (PyObject *(*)(char *)) __p
     __pyx_v_nz = (__pyx_v_nz + (*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_fold_ncol.data) + __pyx_t_46)) ))));
   }
 
-  /* "sisl/_sparse.pyx":73
+  /* "sisl/_sparse.pyx":75
  *         nz += fold_ncol[r]
  * 
  *     if nz > fold_col.shape[0]:             # <<<<<<<<<<<<<<
@@ -3367,20 +3783,20 @@ __pyx_t_6 = __pyx_memoryview_fromslice(__pyx_t_1, 1, (PyObject *(*)(char *)) __p
   __pyx_t_15 = ((__pyx_v_nz > (__pyx_v_fold_col.shape[0])) != 0);
   if (unlikely(__pyx_t_15)) {
 
-    /* "sisl/_sparse.pyx":74
+    /* "sisl/_sparse.pyx":76
  * 
  *     if nz > fold_col.shape[0]:
  *         raise ValueError('something went wrong')             # <<<<<<<<<<<<<<
  * 
  *     # Return objects
  */
-    __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple_, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 74, __pyx_L1_error)
+    __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple_, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 76, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_3);
     __Pyx_Raise(__pyx_t_3, 0, 0, 0);
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    __PYX_ERR(0, 74, __pyx_L1_error)
+    __PYX_ERR(0, 76, __pyx_L1_error)
 
-    /* "sisl/_sparse.pyx":73
+    /* "sisl/_sparse.pyx":75
  *         nz += fold_ncol[r]
  * 
  *     if nz > fold_col.shape[0]:             # <<<<<<<<<<<<<<
@@ -3389,7 +3805,7 @@ __pyx_t_6 = __pyx_memoryview_fromslice(__pyx_t_1, 1, (PyObject *(*)(char *)) __p
  */
   }
 
-  /* "sisl/_sparse.pyx":77
+  /* "sisl/_sparse.pyx":79
  * 
  *     # Return objects
  *     return FOLD_ptr, FOLD_ncol, FOLD_col[:nz].copy()             # <<<<<<<<<<<<<<
@@ -3397,15 +3813,15 @@ __pyx_t_6 = __pyx_memoryview_fromslice(__pyx_t_1, 1, (PyObject *(*)(char *)) __p
  * 
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_5 = __Pyx_PyInt_From_int(__pyx_v_nz); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 77, __pyx_L1_error)
+  __pyx_t_5 = __Pyx_PyInt_From_int(__pyx_v_nz); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 79, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_5);
-  __pyx_t_6 = PySlice_New(Py_None, __pyx_t_5, Py_None); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 77, __pyx_L1_error)
+  __pyx_t_6 = PySlice_New(Py_None, __pyx_t_5, Py_None); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 79, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_6);
   __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-  __pyx_t_5 = __Pyx_PyObject_GetItem(((PyObject *)__pyx_v_FOLD_col), __pyx_t_6); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 77, __pyx_L1_error)
+  __pyx_t_5 = __Pyx_PyObject_GetItem(((PyObject *)__pyx_v_FOLD_col), __pyx_t_6); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 79, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_5);
   __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-  __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_t_5, __pyx_n_s_copy); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 77, __pyx_L1_error)
+  __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_t_5, __pyx_n_s_copy); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 79, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_6);
   __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
   __pyx_t_5 = NULL;
@@ -3420,10 +3836,10 @@ __pyx_t_6 = __pyx_memoryview_fromslice(__pyx_t_1, 1, (PyObject *(*)(char *)) __p
   }
   __pyx_t_3 = (__pyx_t_5) ? __Pyx_PyObject_CallOneArg(__pyx_t_6, __pyx_t_5) : __Pyx_PyObject_CallNoArg(__pyx_t_6);
   __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
-  if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 77, __pyx_L1_error)
+  if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 79, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
   __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-  __pyx_t_6 = PyTuple_New(3); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 77, __pyx_L1_error)
+  __pyx_t_6 = PyTuple_New(3); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 79, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_6);
   __Pyx_INCREF(((PyObject *)__pyx_v_FOLD_ptr));
   __Pyx_GIVEREF(((PyObject *)__pyx_v_FOLD_ptr));
@@ -3438,7 +3854,7 @@ __pyx_t_6 = __pyx_memoryview_fromslice(__pyx_t_1, 1, (PyObject *(*)(char *)) __p
   __pyx_t_6 = 0;
   goto __pyx_L0;
 
-  /* "sisl/_sparse.pyx":29
+  /* "sisl/_sparse.pyx":31
  * @cython.initializedcheck(False)
  * @cython.cdivision(True)
  * def fold_csr_matrix(np.ndarray[np.int32_t, ndim=1, mode='c'] PTR,             # <<<<<<<<<<<<<<
@@ -3491,7 +3907,7 @@ __pyx_t_6 = __pyx_memoryview_fromslice(__pyx_t_1, 1, (PyObject *(*)(char *)) __p
   return __pyx_r;
 }
 
-/* "sisl/_sparse.pyx":84
+/* "sisl/_sparse.pyx":86
  * @cython.initializedcheck(False)
  * @cython.cdivision(True)
  * def fold_csr_matrix_nc(np.ndarray[np.int32_t, ndim=1, mode='c'] PTR,             # <<<<<<<<<<<<<<
@@ -3535,17 +3951,17 @@ static PyObject *__pyx_pw_4sisl_7_sparse_3fold_csr_matrix_nc(PyObject *__pyx_sel
         case  1:
         if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_NCOL)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("fold_csr_matrix_nc", 1, 3, 3, 1); __PYX_ERR(0, 84, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("fold_csr_matrix_nc", 1, 3, 3, 1); __PYX_ERR(0, 86, __pyx_L3_error)
         }
         CYTHON_FALLTHROUGH;
         case  2:
         if (likely((values[2] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_COL)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("fold_csr_matrix_nc", 1, 3, 3, 2); __PYX_ERR(0, 84, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("fold_csr_matrix_nc", 1, 3, 3, 2); __PYX_ERR(0, 86, __pyx_L3_error)
         }
       }
       if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "fold_csr_matrix_nc") < 0)) __PYX_ERR(0, 84, __pyx_L3_error)
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "fold_csr_matrix_nc") < 0)) __PYX_ERR(0, 86, __pyx_L3_error)
       }
     } else if (PyTuple_GET_SIZE(__pyx_args) != 3) {
       goto __pyx_L5_argtuple_error;
@@ -3560,15 +3976,15 @@ static PyObject *__pyx_pw_4sisl_7_sparse_3fold_csr_matrix_nc(PyObject *__pyx_sel
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("fold_csr_matrix_nc", 1, 3, 3, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 84, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("fold_csr_matrix_nc", 1, 3, 3, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 86, __pyx_L3_error)
   __pyx_L3_error:;
   __Pyx_AddTraceback("sisl._sparse.fold_csr_matrix_nc", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
   return NULL;
   __pyx_L4_argument_unpacking_done:;
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_PTR), __pyx_ptype_5numpy_ndarray, 1, "PTR", 0))) __PYX_ERR(0, 84, __pyx_L1_error)
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_NCOL), __pyx_ptype_5numpy_ndarray, 1, "NCOL", 0))) __PYX_ERR(0, 85, __pyx_L1_error)
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_COL), __pyx_ptype_5numpy_ndarray, 1, "COL", 0))) __PYX_ERR(0, 86, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_PTR), __pyx_ptype_5numpy_ndarray, 1, "PTR", 0))) __PYX_ERR(0, 86, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_NCOL), __pyx_ptype_5numpy_ndarray, 1, "NCOL", 0))) __PYX_ERR(0, 87, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_COL), __pyx_ptype_5numpy_ndarray, 1, "COL", 0))) __PYX_ERR(0, 88, __pyx_L1_error)
   __pyx_r = __pyx_pf_4sisl_7_sparse_2fold_csr_matrix_nc(__pyx_self, __pyx_v_PTR, __pyx_v_NCOL, __pyx_v_COL);
 
   /* function exit code */
@@ -3696,57 +4112,57 @@ static PyObject *__pyx_pf_4sisl_7_sparse_2fold_csr_matrix_nc(CYTHON_UNUSED PyObj
   __pyx_pybuffernd_COL.rcbuffer = &__pyx_pybuffer_COL;
   {
     __Pyx_BufFmt_StackElem __pyx_stack[1];
-    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_PTR.rcbuffer->pybuffer, (PyObject*)__pyx_v_PTR, &__Pyx_TypeInfo_nn___pyx_t_5numpy_int32_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 84, __pyx_L1_error)
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_PTR.rcbuffer->pybuffer, (PyObject*)__pyx_v_PTR, &__Pyx_TypeInfo_nn___pyx_t_5numpy_int32_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 86, __pyx_L1_error)
   }
   __pyx_pybuffernd_PTR.diminfo[0].strides = __pyx_pybuffernd_PTR.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_PTR.diminfo[0].shape = __pyx_pybuffernd_PTR.rcbuffer->pybuffer.shape[0];
   {
     __Pyx_BufFmt_StackElem __pyx_stack[1];
-    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_NCOL.rcbuffer->pybuffer, (PyObject*)__pyx_v_NCOL, &__Pyx_TypeInfo_nn___pyx_t_5numpy_int32_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 84, __pyx_L1_error)
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_NCOL.rcbuffer->pybuffer, (PyObject*)__pyx_v_NCOL, &__Pyx_TypeInfo_nn___pyx_t_5numpy_int32_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 86, __pyx_L1_error)
   }
   __pyx_pybuffernd_NCOL.diminfo[0].strides = __pyx_pybuffernd_NCOL.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_NCOL.diminfo[0].shape = __pyx_pybuffernd_NCOL.rcbuffer->pybuffer.shape[0];
   {
     __Pyx_BufFmt_StackElem __pyx_stack[1];
-    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_COL.rcbuffer->pybuffer, (PyObject*)__pyx_v_COL, &__Pyx_TypeInfo_nn___pyx_t_5numpy_int32_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 84, __pyx_L1_error)
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_COL.rcbuffer->pybuffer, (PyObject*)__pyx_v_COL, &__Pyx_TypeInfo_nn___pyx_t_5numpy_int32_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 86, __pyx_L1_error)
   }
   __pyx_pybuffernd_COL.diminfo[0].strides = __pyx_pybuffernd_COL.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_COL.diminfo[0].shape = __pyx_pybuffernd_COL.rcbuffer->pybuffer.shape[0];
 
-  /* "sisl/_sparse.pyx":88
+  /* "sisl/_sparse.pyx":90
  *                        np.ndarray[np.int32_t, ndim=1, mode='c'] COL):
  *     """ Fold all columns into a square matrix """
  *     cdef int[::1] ptr = PTR             # <<<<<<<<<<<<<<
  *     cdef int[::1] ncol = NCOL
  *     cdef int[::1] col = COL
  */
-  __pyx_t_1 = __Pyx_PyObject_to_MemoryviewSlice_dc_int(((PyObject *)__pyx_v_PTR), PyBUF_WRITABLE); if (unlikely(!__pyx_t_1.memview)) __PYX_ERR(0, 88, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyObject_to_MemoryviewSlice_dc_int(((PyObject *)__pyx_v_PTR), PyBUF_WRITABLE); if (unlikely(!__pyx_t_1.memview)) __PYX_ERR(0, 90, __pyx_L1_error)
   __pyx_v_ptr = __pyx_t_1;
   __pyx_t_1.memview = NULL;
   __pyx_t_1.data = NULL;
 
-  /* "sisl/_sparse.pyx":89
+  /* "sisl/_sparse.pyx":91
  *     """ Fold all columns into a square matrix """
  *     cdef int[::1] ptr = PTR
  *     cdef int[::1] ncol = NCOL             # <<<<<<<<<<<<<<
  *     cdef int[::1] col = COL
  *     # Number of rows
  */
-  __pyx_t_1 = __Pyx_PyObject_to_MemoryviewSlice_dc_int(((PyObject *)__pyx_v_NCOL), PyBUF_WRITABLE); if (unlikely(!__pyx_t_1.memview)) __PYX_ERR(0, 89, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyObject_to_MemoryviewSlice_dc_int(((PyObject *)__pyx_v_NCOL), PyBUF_WRITABLE); if (unlikely(!__pyx_t_1.memview)) __PYX_ERR(0, 91, __pyx_L1_error)
   __pyx_v_ncol = __pyx_t_1;
   __pyx_t_1.memview = NULL;
   __pyx_t_1.data = NULL;
 
-  /* "sisl/_sparse.pyx":90
+  /* "sisl/_sparse.pyx":92
  *     cdef int[::1] ptr = PTR
  *     cdef int[::1] ncol = NCOL
  *     cdef int[::1] col = COL             # <<<<<<<<<<<<<<
  *     # Number of rows
  *     cdef int nr = ncol.shape[0]
  */
-  __pyx_t_1 = __Pyx_PyObject_to_MemoryviewSlice_dc_int(((PyObject *)__pyx_v_COL), PyBUF_WRITABLE); if (unlikely(!__pyx_t_1.memview)) __PYX_ERR(0, 90, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyObject_to_MemoryviewSlice_dc_int(((PyObject *)__pyx_v_COL), PyBUF_WRITABLE); if (unlikely(!__pyx_t_1.memview)) __PYX_ERR(0, 92, __pyx_L1_error)
   __pyx_v_col = __pyx_t_1;
   __pyx_t_1.memview = NULL;
   __pyx_t_1.data = NULL;
 
-  /* "sisl/_sparse.pyx":92
+  /* "sisl/_sparse.pyx":94
  *     cdef int[::1] col = COL
  *     # Number of rows
  *     cdef int nr = ncol.shape[0]             # <<<<<<<<<<<<<<
@@ -3755,51 +4171,51 @@ static PyObject *__pyx_pf_4sisl_7_sparse_2fold_csr_matrix_nc(CYTHON_UNUSED PyObj
  */
   __pyx_v_nr = (__pyx_v_ncol.shape[0]);
 
-  /* "sisl/_sparse.pyx":94
+  /* "sisl/_sparse.pyx":96
  *     cdef int nr = ncol.shape[0]
  * 
  *     cdef np.ndarray[np.int32_t, ndim=1, mode='c'] FOLD_ptr = np.empty([nr * 2 + 1], dtype=np.int32)             # <<<<<<<<<<<<<<
  *     cdef int[::1] fold_ptr = FOLD_ptr
  *     cdef np.ndarray[np.int32_t, ndim=1, mode='c'] FOLD_ncol = np.empty([nr * 2], dtype=np.int32)
  */
-  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_np); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 94, __pyx_L1_error)
+  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_np); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 96, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_empty); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 94, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_empty); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 96, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __pyx_t_2 = __Pyx_PyInt_From_long(((__pyx_v_nr * 2) + 1)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 94, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyInt_From_long(((__pyx_v_nr * 2) + 1)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 96, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_4 = PyList_New(1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 94, __pyx_L1_error)
+  __pyx_t_4 = PyList_New(1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 96, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_4);
   __Pyx_GIVEREF(__pyx_t_2);
   PyList_SET_ITEM(__pyx_t_4, 0, __pyx_t_2);
   __pyx_t_2 = 0;
-  __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 94, __pyx_L1_error)
+  __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 96, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __Pyx_GIVEREF(__pyx_t_4);
   PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_t_4);
   __pyx_t_4 = 0;
-  __pyx_t_4 = __Pyx_PyDict_NewPresized(1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 94, __pyx_L1_error)
+  __pyx_t_4 = __Pyx_PyDict_NewPresized(1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 96, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_4);
-  __Pyx_GetModuleGlobalName(__pyx_t_5, __pyx_n_s_np); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 94, __pyx_L1_error)
+  __Pyx_GetModuleGlobalName(__pyx_t_5, __pyx_n_s_np); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 96, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_5);
-  __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_t_5, __pyx_n_s_int32); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 94, __pyx_L1_error)
+  __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_t_5, __pyx_n_s_int32); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 96, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_6);
   __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-  if (PyDict_SetItem(__pyx_t_4, __pyx_n_s_dtype, __pyx_t_6) < 0) __PYX_ERR(0, 94, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_4, __pyx_n_s_dtype, __pyx_t_6) < 0) __PYX_ERR(0, 96, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-  __pyx_t_6 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_t_2, __pyx_t_4); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 94, __pyx_L1_error)
+  __pyx_t_6 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_t_2, __pyx_t_4); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 96, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_6);
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-  if (!(likely(((__pyx_t_6) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_6, __pyx_ptype_5numpy_ndarray))))) __PYX_ERR(0, 94, __pyx_L1_error)
+  if (!(likely(((__pyx_t_6) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_6, __pyx_ptype_5numpy_ndarray))))) __PYX_ERR(0, 96, __pyx_L1_error)
   __pyx_t_7 = ((PyArrayObject *)__pyx_t_6);
   {
     __Pyx_BufFmt_StackElem __pyx_stack[1];
     if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_FOLD_ptr.rcbuffer->pybuffer, (PyObject*)__pyx_t_7, &__Pyx_TypeInfo_nn___pyx_t_5numpy_int32_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) {
       __pyx_v_FOLD_ptr = ((PyArrayObject *)Py_None); __Pyx_INCREF(Py_None); __pyx_pybuffernd_FOLD_ptr.rcbuffer->pybuffer.buf = NULL;
-      __PYX_ERR(0, 94, __pyx_L1_error)
+      __PYX_ERR(0, 96, __pyx_L1_error)
     } else {__pyx_pybuffernd_FOLD_ptr.diminfo[0].strides = __pyx_pybuffernd_FOLD_ptr.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_FOLD_ptr.diminfo[0].shape = __pyx_pybuffernd_FOLD_ptr.rcbuffer->pybuffer.shape[0];
     }
   }
@@ -3807,63 +4223,63 @@ static PyObject *__pyx_pf_4sisl_7_sparse_2fold_csr_matrix_nc(CYTHON_UNUSED PyObj
   __pyx_v_FOLD_ptr = ((PyArrayObject *)__pyx_t_6);
   __pyx_t_6 = 0;
 
-  /* "sisl/_sparse.pyx":95
+  /* "sisl/_sparse.pyx":97
  * 
  *     cdef np.ndarray[np.int32_t, ndim=1, mode='c'] FOLD_ptr = np.empty([nr * 2 + 1], dtype=np.int32)
  *     cdef int[::1] fold_ptr = FOLD_ptr             # <<<<<<<<<<<<<<
  *     cdef np.ndarray[np.int32_t, ndim=1, mode='c'] FOLD_ncol = np.empty([nr * 2], dtype=np.int32)
  *     cdef int[::1] fold_ncol = FOLD_ncol
  */
-  __pyx_t_1 = __Pyx_PyObject_to_MemoryviewSlice_dc_int(((PyObject *)__pyx_v_FOLD_ptr), PyBUF_WRITABLE); if (unlikely(!__pyx_t_1.memview)) __PYX_ERR(0, 95, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyObject_to_MemoryviewSlice_dc_int(((PyObject *)__pyx_v_FOLD_ptr), PyBUF_WRITABLE); if (unlikely(!__pyx_t_1.memview)) __PYX_ERR(0, 97, __pyx_L1_error)
   __pyx_v_fold_ptr = __pyx_t_1;
   __pyx_t_1.memview = NULL;
   __pyx_t_1.data = NULL;
 
-  /* "sisl/_sparse.pyx":96
+  /* "sisl/_sparse.pyx":98
  *     cdef np.ndarray[np.int32_t, ndim=1, mode='c'] FOLD_ptr = np.empty([nr * 2 + 1], dtype=np.int32)
  *     cdef int[::1] fold_ptr = FOLD_ptr
  *     cdef np.ndarray[np.int32_t, ndim=1, mode='c'] FOLD_ncol = np.empty([nr * 2], dtype=np.int32)             # <<<<<<<<<<<<<<
  *     cdef int[::1] fold_ncol = FOLD_ncol
  *     # We have to multiply by 4, 2 times the number of rows, and each row couples to 2 more elements
  */
-  __Pyx_GetModuleGlobalName(__pyx_t_6, __pyx_n_s_np); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 96, __pyx_L1_error)
+  __Pyx_GetModuleGlobalName(__pyx_t_6, __pyx_n_s_np); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 98, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_6);
-  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_t_6, __pyx_n_s_empty); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 96, __pyx_L1_error)
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_t_6, __pyx_n_s_empty); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 98, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_4);
   __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-  __pyx_t_6 = __Pyx_PyInt_From_long((__pyx_v_nr * 2)); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 96, __pyx_L1_error)
+  __pyx_t_6 = __Pyx_PyInt_From_long((__pyx_v_nr * 2)); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 98, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_6);
-  __pyx_t_2 = PyList_New(1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 96, __pyx_L1_error)
+  __pyx_t_2 = PyList_New(1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 98, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __Pyx_GIVEREF(__pyx_t_6);
   PyList_SET_ITEM(__pyx_t_2, 0, __pyx_t_6);
   __pyx_t_6 = 0;
-  __pyx_t_6 = PyTuple_New(1); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 96, __pyx_L1_error)
+  __pyx_t_6 = PyTuple_New(1); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 98, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_6);
   __Pyx_GIVEREF(__pyx_t_2);
   PyTuple_SET_ITEM(__pyx_t_6, 0, __pyx_t_2);
   __pyx_t_2 = 0;
-  __pyx_t_2 = __Pyx_PyDict_NewPresized(1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 96, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyDict_NewPresized(1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 98, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_n_s_np); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 96, __pyx_L1_error)
+  __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_n_s_np); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 98, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_n_s_int32); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 96, __pyx_L1_error)
+  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_n_s_int32); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 98, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_5);
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  if (PyDict_SetItem(__pyx_t_2, __pyx_n_s_dtype, __pyx_t_5) < 0) __PYX_ERR(0, 96, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_2, __pyx_n_s_dtype, __pyx_t_5) < 0) __PYX_ERR(0, 98, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-  __pyx_t_5 = __Pyx_PyObject_Call(__pyx_t_4, __pyx_t_6, __pyx_t_2); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 96, __pyx_L1_error)
+  __pyx_t_5 = __Pyx_PyObject_Call(__pyx_t_4, __pyx_t_6, __pyx_t_2); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 98, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_5);
   __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
   __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  if (!(likely(((__pyx_t_5) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_5, __pyx_ptype_5numpy_ndarray))))) __PYX_ERR(0, 96, __pyx_L1_error)
+  if (!(likely(((__pyx_t_5) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_5, __pyx_ptype_5numpy_ndarray))))) __PYX_ERR(0, 98, __pyx_L1_error)
   __pyx_t_8 = ((PyArrayObject *)__pyx_t_5);
   {
     __Pyx_BufFmt_StackElem __pyx_stack[1];
     if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_FOLD_ncol.rcbuffer->pybuffer, (PyObject*)__pyx_t_8, &__Pyx_TypeInfo_nn___pyx_t_5numpy_int32_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) {
       __pyx_v_FOLD_ncol = ((PyArrayObject *)Py_None); __Pyx_INCREF(Py_None); __pyx_pybuffernd_FOLD_ncol.rcbuffer->pybuffer.buf = NULL;
-      __PYX_ERR(0, 96, __pyx_L1_error)
+      __PYX_ERR(0, 98, __pyx_L1_error)
     } else {__pyx_pybuffernd_FOLD_ncol.diminfo[0].strides = __pyx_pybuffernd_FOLD_ncol.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_FOLD_ncol.diminfo[0].shape = __pyx_pybuffernd_FOLD_ncol.rcbuffer->pybuffer.shape[0];
     }
   }
@@ -3871,63 +4287,63 @@ static PyObject *__pyx_pf_4sisl_7_sparse_2fold_csr_matrix_nc(CYTHON_UNUSED PyObj
   __pyx_v_FOLD_ncol = ((PyArrayObject *)__pyx_t_5);
   __pyx_t_5 = 0;
 
-  /* "sisl/_sparse.pyx":97
+  /* "sisl/_sparse.pyx":99
  *     cdef int[::1] fold_ptr = FOLD_ptr
  *     cdef np.ndarray[np.int32_t, ndim=1, mode='c'] FOLD_ncol = np.empty([nr * 2], dtype=np.int32)
  *     cdef int[::1] fold_ncol = FOLD_ncol             # <<<<<<<<<<<<<<
  *     # We have to multiply by 4, 2 times the number of rows, and each row couples to 2 more elements
  *     cdef np.ndarray[np.int32_t, ndim=1, mode='c'] FOLD_col = np.empty([_sum(ncol) * 4], dtype=np.int32)
  */
-  __pyx_t_1 = __Pyx_PyObject_to_MemoryviewSlice_dc_int(((PyObject *)__pyx_v_FOLD_ncol), PyBUF_WRITABLE); if (unlikely(!__pyx_t_1.memview)) __PYX_ERR(0, 97, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyObject_to_MemoryviewSlice_dc_int(((PyObject *)__pyx_v_FOLD_ncol), PyBUF_WRITABLE); if (unlikely(!__pyx_t_1.memview)) __PYX_ERR(0, 99, __pyx_L1_error)
   __pyx_v_fold_ncol = __pyx_t_1;
   __pyx_t_1.memview = NULL;
   __pyx_t_1.data = NULL;
 
-  /* "sisl/_sparse.pyx":99
+  /* "sisl/_sparse.pyx":101
  *     cdef int[::1] fold_ncol = FOLD_ncol
  *     # We have to multiply by 4, 2 times the number of rows, and each row couples to 2 more elements
  *     cdef np.ndarray[np.int32_t, ndim=1, mode='c'] FOLD_col = np.empty([_sum(ncol) * 4], dtype=np.int32)             # <<<<<<<<<<<<<<
  *     cdef int[::1] fold_col = FOLD_col
  *     # local variables
  */
-  __Pyx_GetModuleGlobalName(__pyx_t_5, __pyx_n_s_np); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 99, __pyx_L1_error)
+  __Pyx_GetModuleGlobalName(__pyx_t_5, __pyx_n_s_np); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 101, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_5);
-  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_t_5, __pyx_n_s_empty); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 99, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_t_5, __pyx_n_s_empty); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 101, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-  __pyx_t_5 = __Pyx_PyInt_From_long((__pyx_f_4sisl_7_sparse__sum(__pyx_v_ncol) * 4)); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 99, __pyx_L1_error)
+  __pyx_t_5 = __Pyx_PyInt_From_long((__pyx_f_4sisl_7_sparse__sum(__pyx_v_ncol) * 4)); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 101, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_5);
-  __pyx_t_6 = PyList_New(1); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 99, __pyx_L1_error)
+  __pyx_t_6 = PyList_New(1); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 101, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_6);
   __Pyx_GIVEREF(__pyx_t_5);
   PyList_SET_ITEM(__pyx_t_6, 0, __pyx_t_5);
   __pyx_t_5 = 0;
-  __pyx_t_5 = PyTuple_New(1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 99, __pyx_L1_error)
+  __pyx_t_5 = PyTuple_New(1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 101, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_5);
   __Pyx_GIVEREF(__pyx_t_6);
   PyTuple_SET_ITEM(__pyx_t_5, 0, __pyx_t_6);
   __pyx_t_6 = 0;
-  __pyx_t_6 = __Pyx_PyDict_NewPresized(1); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 99, __pyx_L1_error)
+  __pyx_t_6 = __Pyx_PyDict_NewPresized(1); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 101, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_6);
-  __Pyx_GetModuleGlobalName(__pyx_t_4, __pyx_n_s_np); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 99, __pyx_L1_error)
+  __Pyx_GetModuleGlobalName(__pyx_t_4, __pyx_n_s_np); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 101, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_4);
-  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_4, __pyx_n_s_int32); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 99, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_4, __pyx_n_s_int32); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 101, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
   __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-  if (PyDict_SetItem(__pyx_t_6, __pyx_n_s_dtype, __pyx_t_3) < 0) __PYX_ERR(0, 99, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_6, __pyx_n_s_dtype, __pyx_t_3) < 0) __PYX_ERR(0, 101, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  __pyx_t_3 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_t_5, __pyx_t_6); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 99, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_t_5, __pyx_t_6); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 101, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
   __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-  if (!(likely(((__pyx_t_3) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_3, __pyx_ptype_5numpy_ndarray))))) __PYX_ERR(0, 99, __pyx_L1_error)
+  if (!(likely(((__pyx_t_3) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_3, __pyx_ptype_5numpy_ndarray))))) __PYX_ERR(0, 101, __pyx_L1_error)
   __pyx_t_9 = ((PyArrayObject *)__pyx_t_3);
   {
     __Pyx_BufFmt_StackElem __pyx_stack[1];
     if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_FOLD_col.rcbuffer->pybuffer, (PyObject*)__pyx_t_9, &__Pyx_TypeInfo_nn___pyx_t_5numpy_int32_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) {
       __pyx_v_FOLD_col = ((PyArrayObject *)Py_None); __Pyx_INCREF(Py_None); __pyx_pybuffernd_FOLD_col.rcbuffer->pybuffer.buf = NULL;
-      __PYX_ERR(0, 99, __pyx_L1_error)
+      __PYX_ERR(0, 101, __pyx_L1_error)
     } else {__pyx_pybuffernd_FOLD_col.diminfo[0].strides = __pyx_pybuffernd_FOLD_col.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_FOLD_col.diminfo[0].shape = __pyx_pybuffernd_FOLD_col.rcbuffer->pybuffer.shape[0];
     }
   }
@@ -3935,19 +4351,19 @@ static PyObject *__pyx_pf_4sisl_7_sparse_2fold_csr_matrix_nc(CYTHON_UNUSED PyObj
   __pyx_v_FOLD_col = ((PyArrayObject *)__pyx_t_3);
   __pyx_t_3 = 0;
 
-  /* "sisl/_sparse.pyx":100
+  /* "sisl/_sparse.pyx":102
  *     # We have to multiply by 4, 2 times the number of rows, and each row couples to 2 more elements
  *     cdef np.ndarray[np.int32_t, ndim=1, mode='c'] FOLD_col = np.empty([_sum(ncol) * 4], dtype=np.int32)
  *     cdef int[::1] fold_col = FOLD_col             # <<<<<<<<<<<<<<
  *     # local variables
  *     cdef int r, rr, ind, nz, c
  */
-  __pyx_t_1 = __Pyx_PyObject_to_MemoryviewSlice_dc_int(((PyObject *)__pyx_v_FOLD_col), PyBUF_WRITABLE); if (unlikely(!__pyx_t_1.memview)) __PYX_ERR(0, 100, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyObject_to_MemoryviewSlice_dc_int(((PyObject *)__pyx_v_FOLD_col), PyBUF_WRITABLE); if (unlikely(!__pyx_t_1.memview)) __PYX_ERR(0, 102, __pyx_L1_error)
   __pyx_v_fold_col = __pyx_t_1;
   __pyx_t_1.memview = NULL;
   __pyx_t_1.data = NULL;
 
-  /* "sisl/_sparse.pyx":104
+  /* "sisl/_sparse.pyx":106
  *     cdef int r, rr, ind, nz, c
  * 
  *     nz = 0             # <<<<<<<<<<<<<<
@@ -3956,7 +4372,7 @@ static PyObject *__pyx_pf_4sisl_7_sparse_2fold_csr_matrix_nc(CYTHON_UNUSED PyObj
  */
   __pyx_v_nz = 0;
 
-  /* "sisl/_sparse.pyx":105
+  /* "sisl/_sparse.pyx":107
  * 
  *     nz = 0
  *     fold_ptr[0] = 0             # <<<<<<<<<<<<<<
@@ -3966,7 +4382,7 @@ static PyObject *__pyx_pf_4sisl_7_sparse_2fold_csr_matrix_nc(CYTHON_UNUSED PyObj
   __pyx_t_10 = 0;
   *((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_fold_ptr.data) + __pyx_t_10)) )) = 0;
 
-  /* "sisl/_sparse.pyx":107
+  /* "sisl/_sparse.pyx":109
  *     fold_ptr[0] = 0
  *     # Loop on all rows
  *     for r in range(nr):             # <<<<<<<<<<<<<<
@@ -3978,7 +4394,7 @@ static PyObject *__pyx_pf_4sisl_7_sparse_2fold_csr_matrix_nc(CYTHON_UNUSED PyObj
   for (__pyx_t_13 = 0; __pyx_t_13 < __pyx_t_12; __pyx_t_13+=1) {
     __pyx_v_r = __pyx_t_13;
 
-    /* "sisl/_sparse.pyx":108
+    /* "sisl/_sparse.pyx":110
  *     # Loop on all rows
  *     for r in range(nr):
  *         rr = r * 2             # <<<<<<<<<<<<<<
@@ -3987,7 +4403,7 @@ static PyObject *__pyx_pf_4sisl_7_sparse_2fold_csr_matrix_nc(CYTHON_UNUSED PyObj
  */
     __pyx_v_rr = (__pyx_v_r * 2);
 
-    /* "sisl/_sparse.pyx":111
+    /* "sisl/_sparse.pyx":113
  * 
  *         # Initialize the pointer arrays
  *         if ncol[r] > 0:             # <<<<<<<<<<<<<<
@@ -3998,7 +4414,7 @@ static PyObject *__pyx_pf_4sisl_7_sparse_2fold_csr_matrix_nc(CYTHON_UNUSED PyObj
     __pyx_t_15 = (((*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_ncol.data) + __pyx_t_14)) ))) > 0) != 0);
     if (__pyx_t_15) {
 
-      /* "sisl/_sparse.pyx":112
+      /* "sisl/_sparse.pyx":114
  *         # Initialize the pointer arrays
  *         if ncol[r] > 0:
  *             c = (col[ptr[r]] % nr) * 2             # <<<<<<<<<<<<<<
@@ -4009,7 +4425,7 @@ static PyObject *__pyx_pf_4sisl_7_sparse_2fold_csr_matrix_nc(CYTHON_UNUSED PyObj
       __pyx_t_17 = (*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_ptr.data) + __pyx_t_16)) )));
       __pyx_v_c = (((*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_col.data) + __pyx_t_17)) ))) % __pyx_v_nr) * 2);
 
-      /* "sisl/_sparse.pyx":113
+      /* "sisl/_sparse.pyx":115
  *         if ncol[r] > 0:
  *             c = (col[ptr[r]] % nr) * 2
  *             fold_ncol[rr] = 2             # <<<<<<<<<<<<<<
@@ -4019,7 +4435,7 @@ static PyObject *__pyx_pf_4sisl_7_sparse_2fold_csr_matrix_nc(CYTHON_UNUSED PyObj
       __pyx_t_18 = __pyx_v_rr;
       *((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_fold_ncol.data) + __pyx_t_18)) )) = 2;
 
-      /* "sisl/_sparse.pyx":114
+      /* "sisl/_sparse.pyx":116
  *             c = (col[ptr[r]] % nr) * 2
  *             fold_ncol[rr] = 2
  *             fold_col[fold_ptr[rr]] = c             # <<<<<<<<<<<<<<
@@ -4030,7 +4446,7 @@ static PyObject *__pyx_pf_4sisl_7_sparse_2fold_csr_matrix_nc(CYTHON_UNUSED PyObj
       __pyx_t_20 = (*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_fold_ptr.data) + __pyx_t_19)) )));
       *((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_fold_col.data) + __pyx_t_20)) )) = __pyx_v_c;
 
-      /* "sisl/_sparse.pyx":115
+      /* "sisl/_sparse.pyx":117
  *             fold_ncol[rr] = 2
  *             fold_col[fold_ptr[rr]] = c
  *             fold_col[fold_ptr[rr] + 1] = c + 1             # <<<<<<<<<<<<<<
@@ -4041,7 +4457,7 @@ static PyObject *__pyx_pf_4sisl_7_sparse_2fold_csr_matrix_nc(CYTHON_UNUSED PyObj
       __pyx_t_22 = ((*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_fold_ptr.data) + __pyx_t_21)) ))) + 1);
       *((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_fold_col.data) + __pyx_t_22)) )) = (__pyx_v_c + 1);
 
-      /* "sisl/_sparse.pyx":111
+      /* "sisl/_sparse.pyx":113
  * 
  *         # Initialize the pointer arrays
  *         if ncol[r] > 0:             # <<<<<<<<<<<<<<
@@ -4051,7 +4467,7 @@ static PyObject *__pyx_pf_4sisl_7_sparse_2fold_csr_matrix_nc(CYTHON_UNUSED PyObj
       goto __pyx_L5;
     }
 
-    /* "sisl/_sparse.pyx":117
+    /* "sisl/_sparse.pyx":119
  *             fold_col[fold_ptr[rr] + 1] = c + 1
  *         else:
  *             fold_ncol[rr] = 0             # <<<<<<<<<<<<<<
@@ -4064,7 +4480,7 @@ static PyObject *__pyx_pf_4sisl_7_sparse_2fold_csr_matrix_nc(CYTHON_UNUSED PyObj
     }
     __pyx_L5:;
 
-    /* "sisl/_sparse.pyx":119
+    /* "sisl/_sparse.pyx":121
  *             fold_ncol[rr] = 0
  * 
  *         for ind in range(ptr[r] + 1, ptr[r] + ncol[r]):             # <<<<<<<<<<<<<<
@@ -4079,7 +4495,7 @@ static PyObject *__pyx_pf_4sisl_7_sparse_2fold_csr_matrix_nc(CYTHON_UNUSED PyObj
     for (__pyx_t_29 = ((*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_ptr.data) + __pyx_t_27)) ))) + 1); __pyx_t_29 < __pyx_t_28; __pyx_t_29+=1) {
       __pyx_v_ind = __pyx_t_29;
 
-      /* "sisl/_sparse.pyx":120
+      /* "sisl/_sparse.pyx":122
  * 
  *         for ind in range(ptr[r] + 1, ptr[r] + ncol[r]):
  *             c = (col[ind] % nr) * 2             # <<<<<<<<<<<<<<
@@ -4089,7 +4505,7 @@ static PyObject *__pyx_pf_4sisl_7_sparse_2fold_csr_matrix_nc(CYTHON_UNUSED PyObj
       __pyx_t_30 = __pyx_v_ind;
       __pyx_v_c = (((*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_col.data) + __pyx_t_30)) ))) % __pyx_v_nr) * 2);
 
-      /* "sisl/_sparse.pyx":121
+      /* "sisl/_sparse.pyx":123
  *         for ind in range(ptr[r] + 1, ptr[r] + ncol[r]):
  *             c = (col[ind] % nr) * 2
  *             if not in_1d(fold_col[fold_ptr[rr]:fold_ptr[rr] + fold_ncol[rr]], c):             # <<<<<<<<<<<<<<
@@ -4117,7 +4533,7 @@ static PyObject *__pyx_pf_4sisl_7_sparse_2fold_csr_matrix_nc(CYTHON_UNUSED PyObj
     0,
     1) < 0))
 {
-    __PYX_ERR(0, 121, __pyx_L1_error)
+    __PYX_ERR(0, 123, __pyx_L1_error)
 }
 
 __pyx_t_15 = ((!(__pyx_f_4sisl_8_indices_in_1d(__pyx_t_1, __pyx_v_c) != 0)) != 0);
@@ -4126,7 +4542,7 @@ __pyx_t_15 = ((!(__pyx_f_4sisl_8_indices_in_1d(__pyx_t_1, __pyx_v_c) != 0)) != 0
       __pyx_t_1.data = NULL;
       if (__pyx_t_15) {
 
-        /* "sisl/_sparse.pyx":122
+        /* "sisl/_sparse.pyx":124
  *             c = (col[ind] % nr) * 2
  *             if not in_1d(fold_col[fold_ptr[rr]:fold_ptr[rr] + fold_ncol[rr]], c):
  *                 fold_col[fold_ptr[rr] + fold_ncol[rr]] = c             # <<<<<<<<<<<<<<
@@ -4138,7 +4554,7 @@ __pyx_t_15 = ((!(__pyx_f_4sisl_8_indices_in_1d(__pyx_t_1, __pyx_v_c) != 0)) != 0
         __pyx_t_37 = ((*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_fold_ptr.data) + __pyx_t_35)) ))) + (*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_fold_ncol.data) + __pyx_t_36)) ))));
         *((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_fold_col.data) + __pyx_t_37)) )) = __pyx_v_c;
 
-        /* "sisl/_sparse.pyx":123
+        /* "sisl/_sparse.pyx":125
  *             if not in_1d(fold_col[fold_ptr[rr]:fold_ptr[rr] + fold_ncol[rr]], c):
  *                 fold_col[fold_ptr[rr] + fold_ncol[rr]] = c
  *                 fold_col[fold_ptr[rr] + fold_ncol[rr] + 1] = c + 1             # <<<<<<<<<<<<<<
@@ -4150,7 +4566,7 @@ __pyx_t_15 = ((!(__pyx_f_4sisl_8_indices_in_1d(__pyx_t_1, __pyx_v_c) != 0)) != 0
         __pyx_t_40 = (((*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_fold_ptr.data) + __pyx_t_38)) ))) + (*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_fold_ncol.data) + __pyx_t_39)) )))) + 1);
         *((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_fold_col.data) + __pyx_t_40)) )) = (__pyx_v_c + 1);
 
-        /* "sisl/_sparse.pyx":124
+        /* "sisl/_sparse.pyx":126
  *                 fold_col[fold_ptr[rr] + fold_ncol[rr]] = c
  *                 fold_col[fold_ptr[rr] + fold_ncol[rr] + 1] = c + 1
  *                 fold_ncol[rr] += 2             # <<<<<<<<<<<<<<
@@ -4160,7 +4576,7 @@ __pyx_t_15 = ((!(__pyx_f_4sisl_8_indices_in_1d(__pyx_t_1, __pyx_v_c) != 0)) != 0
         __pyx_t_41 = __pyx_v_rr;
         *((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_fold_ncol.data) + __pyx_t_41)) )) += 2;
 
-        /* "sisl/_sparse.pyx":121
+        /* "sisl/_sparse.pyx":123
  *         for ind in range(ptr[r] + 1, ptr[r] + ncol[r]):
  *             c = (col[ind] % nr) * 2
  *             if not in_1d(fold_col[fold_ptr[rr]:fold_ptr[rr] + fold_ncol[rr]], c):             # <<<<<<<<<<<<<<
@@ -4170,7 +4586,7 @@ __pyx_t_15 = ((!(__pyx_f_4sisl_8_indices_in_1d(__pyx_t_1, __pyx_v_c) != 0)) != 0
       }
     }
 
-    /* "sisl/_sparse.pyx":127
+    /* "sisl/_sparse.pyx":129
  * 
  *         # Duplicate pointers and counters for next row (off-diagonal)
  *         fold_ptr[rr + 1] = fold_ptr[rr] + fold_ncol[rr]             # <<<<<<<<<<<<<<
@@ -4182,7 +4598,7 @@ __pyx_t_15 = ((!(__pyx_f_4sisl_8_indices_in_1d(__pyx_t_1, __pyx_v_c) != 0)) != 0
     __pyx_t_44 = (__pyx_v_rr + 1);
     *((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_fold_ptr.data) + __pyx_t_44)) )) = ((*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_fold_ptr.data) + __pyx_t_42)) ))) + (*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_fold_ncol.data) + __pyx_t_43)) ))));
 
-    /* "sisl/_sparse.pyx":128
+    /* "sisl/_sparse.pyx":130
  *         # Duplicate pointers and counters for next row (off-diagonal)
  *         fold_ptr[rr + 1] = fold_ptr[rr] + fold_ncol[rr]
  *         fold_ncol[rr + 1] = fold_ncol[rr]             # <<<<<<<<<<<<<<
@@ -4193,16 +4609,16 @@ __pyx_t_15 = ((!(__pyx_f_4sisl_8_indices_in_1d(__pyx_t_1, __pyx_v_c) != 0)) != 0
     __pyx_t_46 = (__pyx_v_rr + 1);
     *((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_fold_ncol.data) + __pyx_t_46)) )) = (*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_fold_ncol.data) + __pyx_t_45)) )));
 
-    /* "sisl/_sparse.pyx":131
+    /* "sisl/_sparse.pyx":133
  * 
  *         # Sort indices (we should implement our own sorting algorithm)
  *         tmp = np.sort(fold_col[fold_ptr[rr]:fold_ptr[rr] + fold_ncol[rr]])             # <<<<<<<<<<<<<<
  *         for ind in range(fold_ncol[rr]):
  *             c = tmp[ind]
  */
-    __Pyx_GetModuleGlobalName(__pyx_t_6, __pyx_n_s_np); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 131, __pyx_L1_error)
+    __Pyx_GetModuleGlobalName(__pyx_t_6, __pyx_n_s_np); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 133, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_6);
-    __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_6, __pyx_n_s_sort); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 131, __pyx_L1_error)
+    __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_6, __pyx_n_s_sort); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 133, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_5);
     __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
     __pyx_t_47 = __pyx_v_rr;
@@ -4226,10 +4642,10 @@ __pyx_t_15 = ((!(__pyx_f_4sisl_8_indices_in_1d(__pyx_t_1, __pyx_v_c) != 0)) != 0
     0,
     1) < 0))
 {
-    __PYX_ERR(0, 131, __pyx_L1_error)
+    __PYX_ERR(0, 133, __pyx_L1_error)
 }
 
-__pyx_t_6 = __pyx_memoryview_fromslice(__pyx_t_1, 1, (PyObject *(*)(char *)) __pyx_memview_get_int, (int (*)(char *, PyObject *)) __pyx_memview_set_int, 0);; if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 131, __pyx_L1_error)
+__pyx_t_6 = __pyx_memoryview_fromslice(__pyx_t_1, 1, (PyObject *(*)(char *)) __pyx_memview_get_int, (int (*)(char *, PyObject *)) __pyx_memview_set_int, 0);; if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 133, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_6);
     __PYX_XDEC_MEMVIEW(&__pyx_t_1, 1);
     __pyx_t_1.memview = NULL;
@@ -4247,13 +4663,13 @@ __pyx_t_6 = __pyx_memoryview_fromslice(__pyx_t_1, 1, (PyObject *(*)(char *)) __p
     __pyx_t_3 = (__pyx_t_2) ? __Pyx_PyObject_Call2Args(__pyx_t_5, __pyx_t_2, __pyx_t_6) : __Pyx_PyObject_CallOneArg(__pyx_t_5, __pyx_t_6);
     __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
     __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-    if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 131, __pyx_L1_error)
+    if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 133, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_3);
     __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
     __Pyx_XDECREF_SET(__pyx_v_tmp, __pyx_t_3);
     __pyx_t_3 = 0;
 
-    /* "sisl/_sparse.pyx":132
+    /* "sisl/_sparse.pyx":134
  *         # Sort indices (we should implement our own sorting algorithm)
  *         tmp = np.sort(fold_col[fold_ptr[rr]:fold_ptr[rr] + fold_ncol[rr]])
  *         for ind in range(fold_ncol[rr]):             # <<<<<<<<<<<<<<
@@ -4266,20 +4682,20 @@ __pyx_t_6 = __pyx_memoryview_fromslice(__pyx_t_1, 1, (PyObject *(*)(char *)) __p
     for (__pyx_t_29 = 0; __pyx_t_29 < __pyx_t_28; __pyx_t_29+=1) {
       __pyx_v_ind = __pyx_t_29;
 
-      /* "sisl/_sparse.pyx":133
+      /* "sisl/_sparse.pyx":135
  *         tmp = np.sort(fold_col[fold_ptr[rr]:fold_ptr[rr] + fold_ncol[rr]])
  *         for ind in range(fold_ncol[rr]):
  *             c = tmp[ind]             # <<<<<<<<<<<<<<
  *             fold_col[fold_ptr[rr] + ind] = c
  *             # Copy to next row as well
  */
-      __pyx_t_3 = __Pyx_GetItemInt(__pyx_v_tmp, __pyx_v_ind, int, 1, __Pyx_PyInt_From_int, 0, 0, 0); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 133, __pyx_L1_error)
+      __pyx_t_3 = __Pyx_GetItemInt(__pyx_v_tmp, __pyx_v_ind, int, 1, __Pyx_PyInt_From_int, 0, 0, 0); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 135, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_3);
-      __pyx_t_34 = __Pyx_PyInt_As_int(__pyx_t_3); if (unlikely((__pyx_t_34 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 133, __pyx_L1_error)
+      __pyx_t_34 = __Pyx_PyInt_As_int(__pyx_t_3); if (unlikely((__pyx_t_34 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 135, __pyx_L1_error)
       __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
       __pyx_v_c = __pyx_t_34;
 
-      /* "sisl/_sparse.pyx":134
+      /* "sisl/_sparse.pyx":136
  *         for ind in range(fold_ncol[rr]):
  *             c = tmp[ind]
  *             fold_col[fold_ptr[rr] + ind] = c             # <<<<<<<<<<<<<<
@@ -4290,7 +4706,7 @@ __pyx_t_6 = __pyx_memoryview_fromslice(__pyx_t_1, 1, (PyObject *(*)(char *)) __p
       __pyx_t_52 = ((*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_fold_ptr.data) + __pyx_t_51)) ))) + __pyx_v_ind);
       *((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_fold_col.data) + __pyx_t_52)) )) = __pyx_v_c;
 
-      /* "sisl/_sparse.pyx":136
+      /* "sisl/_sparse.pyx":138
  *             fold_col[fold_ptr[rr] + ind] = c
  *             # Copy to next row as well
  *             fold_col[fold_ptr[rr+1] + ind] = c             # <<<<<<<<<<<<<<
@@ -4302,7 +4718,7 @@ __pyx_t_6 = __pyx_memoryview_fromslice(__pyx_t_1, 1, (PyObject *(*)(char *)) __p
       *((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_fold_col.data) + __pyx_t_54)) )) = __pyx_v_c;
     }
 
-    /* "sisl/_sparse.pyx":139
+    /* "sisl/_sparse.pyx":141
  * 
  *         # Increment the next row
  *         fold_ptr[rr + 2] = fold_ptr[rr + 1] + fold_ncol[rr + 1]             # <<<<<<<<<<<<<<
@@ -4314,7 +4730,7 @@ __pyx_t_6 = __pyx_memoryview_fromslice(__pyx_t_1, 1, (PyObject *(*)(char *)) __p
     __pyx_t_57 = (__pyx_v_rr + 2);
     *((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_fold_ptr.data) + __pyx_t_57)) )) = ((*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_fold_ptr.data) + __pyx_t_55)) ))) + (*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_fold_ncol.data) + __pyx_t_56)) ))));
 
-    /* "sisl/_sparse.pyx":140
+    /* "sisl/_sparse.pyx":142
  *         # Increment the next row
  *         fold_ptr[rr + 2] = fold_ptr[rr + 1] + fold_ncol[rr + 1]
  *         nz += fold_ncol[rr] * 2             # <<<<<<<<<<<<<<
@@ -4325,7 +4741,7 @@ __pyx_t_6 = __pyx_memoryview_fromslice(__pyx_t_1, 1, (PyObject *(*)(char *)) __p
     __pyx_v_nz = (__pyx_v_nz + ((*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_fold_ncol.data) + __pyx_t_58)) ))) * 2));
   }
 
-  /* "sisl/_sparse.pyx":142
+  /* "sisl/_sparse.pyx":144
  *         nz += fold_ncol[rr] * 2
  * 
  *     if nz > fold_col.shape[0]:             # <<<<<<<<<<<<<<
@@ -4335,20 +4751,20 @@ __pyx_t_6 = __pyx_memoryview_fromslice(__pyx_t_1, 1, (PyObject *(*)(char *)) __p
   __pyx_t_15 = ((__pyx_v_nz > (__pyx_v_fold_col.shape[0])) != 0);
   if (unlikely(__pyx_t_15)) {
 
-    /* "sisl/_sparse.pyx":143
+    /* "sisl/_sparse.pyx":145
  * 
  *     if nz > fold_col.shape[0]:
  *         raise ValueError('something went wrong NC')             # <<<<<<<<<<<<<<
  * 
  *     # Return objects
  */
-    __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__2, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 143, __pyx_L1_error)
+    __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__2, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 145, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_3);
     __Pyx_Raise(__pyx_t_3, 0, 0, 0);
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    __PYX_ERR(0, 143, __pyx_L1_error)
+    __PYX_ERR(0, 145, __pyx_L1_error)
 
-    /* "sisl/_sparse.pyx":142
+    /* "sisl/_sparse.pyx":144
  *         nz += fold_ncol[rr] * 2
  * 
  *     if nz > fold_col.shape[0]:             # <<<<<<<<<<<<<<
@@ -4357,7 +4773,7 @@ __pyx_t_6 = __pyx_memoryview_fromslice(__pyx_t_1, 1, (PyObject *(*)(char *)) __p
  */
   }
 
-  /* "sisl/_sparse.pyx":146
+  /* "sisl/_sparse.pyx":148
  * 
  *     # Return objects
  *     return FOLD_ptr, FOLD_ncol, FOLD_col[:nz].copy()             # <<<<<<<<<<<<<<
@@ -4365,15 +4781,15 @@ __pyx_t_6 = __pyx_memoryview_fromslice(__pyx_t_1, 1, (PyObject *(*)(char *)) __p
  * 
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_5 = __Pyx_PyInt_From_int(__pyx_v_nz); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 146, __pyx_L1_error)
+  __pyx_t_5 = __Pyx_PyInt_From_int(__pyx_v_nz); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 148, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_5);
-  __pyx_t_6 = PySlice_New(Py_None, __pyx_t_5, Py_None); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 146, __pyx_L1_error)
+  __pyx_t_6 = PySlice_New(Py_None, __pyx_t_5, Py_None); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 148, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_6);
   __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-  __pyx_t_5 = __Pyx_PyObject_GetItem(((PyObject *)__pyx_v_FOLD_col), __pyx_t_6); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 146, __pyx_L1_error)
+  __pyx_t_5 = __Pyx_PyObject_GetItem(((PyObject *)__pyx_v_FOLD_col), __pyx_t_6); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 148, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_5);
   __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-  __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_t_5, __pyx_n_s_copy); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 146, __pyx_L1_error)
+  __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_t_5, __pyx_n_s_copy); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 148, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_6);
   __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
   __pyx_t_5 = NULL;
@@ -4388,10 +4804,10 @@ __pyx_t_6 = __pyx_memoryview_fromslice(__pyx_t_1, 1, (PyObject *(*)(char *)) __p
   }
   __pyx_t_3 = (__pyx_t_5) ? __Pyx_PyObject_CallOneArg(__pyx_t_6, __pyx_t_5) : __Pyx_PyObject_CallNoArg(__pyx_t_6);
   __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
-  if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 146, __pyx_L1_error)
+  if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 148, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
   __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-  __pyx_t_6 = PyTuple_New(3); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 146, __pyx_L1_error)
+  __pyx_t_6 = PyTuple_New(3); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 148, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_6);
   __Pyx_INCREF(((PyObject *)__pyx_v_FOLD_ptr));
   __Pyx_GIVEREF(((PyObject *)__pyx_v_FOLD_ptr));
@@ -4406,7 +4822,7 @@ __pyx_t_6 = __pyx_memoryview_fromslice(__pyx_t_1, 1, (PyObject *(*)(char *)) __p
   __pyx_t_6 = 0;
   goto __pyx_L0;
 
-  /* "sisl/_sparse.pyx":84
+  /* "sisl/_sparse.pyx":86
  * @cython.initializedcheck(False)
  * @cython.cdivision(True)
  * def fold_csr_matrix_nc(np.ndarray[np.int32_t, ndim=1, mode='c'] PTR,             # <<<<<<<<<<<<<<
@@ -4459,7 +4875,7 @@ __pyx_t_6 = __pyx_memoryview_fromslice(__pyx_t_1, 1, (PyObject *(*)(char *)) __p
   return __pyx_r;
 }
 
-/* "sisl/_sparse.pyx":153
+/* "sisl/_sparse.pyx":155
  * @cython.initializedcheck(False)
  * @cython.cdivision(True)
  * def fold_csr_diagonal_nc(np.ndarray[np.int32_t, ndim=1, mode='c'] PTR,             # <<<<<<<<<<<<<<
@@ -4503,17 +4919,17 @@ static PyObject *__pyx_pw_4sisl_7_sparse_5fold_csr_diagonal_nc(PyObject *__pyx_s
         case  1:
         if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_NCOL)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("fold_csr_diagonal_nc", 1, 3, 3, 1); __PYX_ERR(0, 153, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("fold_csr_diagonal_nc", 1, 3, 3, 1); __PYX_ERR(0, 155, __pyx_L3_error)
         }
         CYTHON_FALLTHROUGH;
         case  2:
         if (likely((values[2] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_COL)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("fold_csr_diagonal_nc", 1, 3, 3, 2); __PYX_ERR(0, 153, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("fold_csr_diagonal_nc", 1, 3, 3, 2); __PYX_ERR(0, 155, __pyx_L3_error)
         }
       }
       if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "fold_csr_diagonal_nc") < 0)) __PYX_ERR(0, 153, __pyx_L3_error)
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "fold_csr_diagonal_nc") < 0)) __PYX_ERR(0, 155, __pyx_L3_error)
       }
     } else if (PyTuple_GET_SIZE(__pyx_args) != 3) {
       goto __pyx_L5_argtuple_error;
@@ -4528,15 +4944,15 @@ static PyObject *__pyx_pw_4sisl_7_sparse_5fold_csr_diagonal_nc(PyObject *__pyx_s
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("fold_csr_diagonal_nc", 1, 3, 3, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 153, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("fold_csr_diagonal_nc", 1, 3, 3, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 155, __pyx_L3_error)
   __pyx_L3_error:;
   __Pyx_AddTraceback("sisl._sparse.fold_csr_diagonal_nc", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
   return NULL;
   __pyx_L4_argument_unpacking_done:;
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_PTR), __pyx_ptype_5numpy_ndarray, 1, "PTR", 0))) __PYX_ERR(0, 153, __pyx_L1_error)
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_NCOL), __pyx_ptype_5numpy_ndarray, 1, "NCOL", 0))) __PYX_ERR(0, 154, __pyx_L1_error)
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_COL), __pyx_ptype_5numpy_ndarray, 1, "COL", 0))) __PYX_ERR(0, 155, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_PTR), __pyx_ptype_5numpy_ndarray, 1, "PTR", 0))) __PYX_ERR(0, 155, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_NCOL), __pyx_ptype_5numpy_ndarray, 1, "NCOL", 0))) __PYX_ERR(0, 156, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_COL), __pyx_ptype_5numpy_ndarray, 1, "COL", 0))) __PYX_ERR(0, 157, __pyx_L1_error)
   __pyx_r = __pyx_pf_4sisl_7_sparse_4fold_csr_diagonal_nc(__pyx_self, __pyx_v_PTR, __pyx_v_NCOL, __pyx_v_COL);
 
   /* function exit code */
@@ -4659,57 +5075,57 @@ static PyObject *__pyx_pf_4sisl_7_sparse_4fold_csr_diagonal_nc(CYTHON_UNUSED PyO
   __pyx_pybuffernd_COL.rcbuffer = &__pyx_pybuffer_COL;
   {
     __Pyx_BufFmt_StackElem __pyx_stack[1];
-    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_PTR.rcbuffer->pybuffer, (PyObject*)__pyx_v_PTR, &__Pyx_TypeInfo_nn___pyx_t_5numpy_int32_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 153, __pyx_L1_error)
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_PTR.rcbuffer->pybuffer, (PyObject*)__pyx_v_PTR, &__Pyx_TypeInfo_nn___pyx_t_5numpy_int32_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 155, __pyx_L1_error)
   }
   __pyx_pybuffernd_PTR.diminfo[0].strides = __pyx_pybuffernd_PTR.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_PTR.diminfo[0].shape = __pyx_pybuffernd_PTR.rcbuffer->pybuffer.shape[0];
   {
     __Pyx_BufFmt_StackElem __pyx_stack[1];
-    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_NCOL.rcbuffer->pybuffer, (PyObject*)__pyx_v_NCOL, &__Pyx_TypeInfo_nn___pyx_t_5numpy_int32_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 153, __pyx_L1_error)
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_NCOL.rcbuffer->pybuffer, (PyObject*)__pyx_v_NCOL, &__Pyx_TypeInfo_nn___pyx_t_5numpy_int32_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 155, __pyx_L1_error)
   }
   __pyx_pybuffernd_NCOL.diminfo[0].strides = __pyx_pybuffernd_NCOL.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_NCOL.diminfo[0].shape = __pyx_pybuffernd_NCOL.rcbuffer->pybuffer.shape[0];
   {
     __Pyx_BufFmt_StackElem __pyx_stack[1];
-    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_COL.rcbuffer->pybuffer, (PyObject*)__pyx_v_COL, &__Pyx_TypeInfo_nn___pyx_t_5numpy_int32_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 153, __pyx_L1_error)
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_COL.rcbuffer->pybuffer, (PyObject*)__pyx_v_COL, &__Pyx_TypeInfo_nn___pyx_t_5numpy_int32_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 155, __pyx_L1_error)
   }
   __pyx_pybuffernd_COL.diminfo[0].strides = __pyx_pybuffernd_COL.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_COL.diminfo[0].shape = __pyx_pybuffernd_COL.rcbuffer->pybuffer.shape[0];
 
-  /* "sisl/_sparse.pyx":157
+  /* "sisl/_sparse.pyx":159
  *                          np.ndarray[np.int32_t, ndim=1, mode='c'] COL):
  *     """ Fold all columns into a square matrix """
  *     cdef int[::1] ptr = PTR             # <<<<<<<<<<<<<<
  *     cdef int[::1] ncol = NCOL
  *     cdef int[::1] col = COL
  */
-  __pyx_t_1 = __Pyx_PyObject_to_MemoryviewSlice_dc_int(((PyObject *)__pyx_v_PTR), PyBUF_WRITABLE); if (unlikely(!__pyx_t_1.memview)) __PYX_ERR(0, 157, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyObject_to_MemoryviewSlice_dc_int(((PyObject *)__pyx_v_PTR), PyBUF_WRITABLE); if (unlikely(!__pyx_t_1.memview)) __PYX_ERR(0, 159, __pyx_L1_error)
   __pyx_v_ptr = __pyx_t_1;
   __pyx_t_1.memview = NULL;
   __pyx_t_1.data = NULL;
 
-  /* "sisl/_sparse.pyx":158
+  /* "sisl/_sparse.pyx":160
  *     """ Fold all columns into a square matrix """
  *     cdef int[::1] ptr = PTR
  *     cdef int[::1] ncol = NCOL             # <<<<<<<<<<<<<<
  *     cdef int[::1] col = COL
  *     # Number of rows
  */
-  __pyx_t_1 = __Pyx_PyObject_to_MemoryviewSlice_dc_int(((PyObject *)__pyx_v_NCOL), PyBUF_WRITABLE); if (unlikely(!__pyx_t_1.memview)) __PYX_ERR(0, 158, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyObject_to_MemoryviewSlice_dc_int(((PyObject *)__pyx_v_NCOL), PyBUF_WRITABLE); if (unlikely(!__pyx_t_1.memview)) __PYX_ERR(0, 160, __pyx_L1_error)
   __pyx_v_ncol = __pyx_t_1;
   __pyx_t_1.memview = NULL;
   __pyx_t_1.data = NULL;
 
-  /* "sisl/_sparse.pyx":159
+  /* "sisl/_sparse.pyx":161
  *     cdef int[::1] ptr = PTR
  *     cdef int[::1] ncol = NCOL
  *     cdef int[::1] col = COL             # <<<<<<<<<<<<<<
  *     # Number of rows
  *     cdef int nr = ncol.shape[0]
  */
-  __pyx_t_1 = __Pyx_PyObject_to_MemoryviewSlice_dc_int(((PyObject *)__pyx_v_COL), PyBUF_WRITABLE); if (unlikely(!__pyx_t_1.memview)) __PYX_ERR(0, 159, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyObject_to_MemoryviewSlice_dc_int(((PyObject *)__pyx_v_COL), PyBUF_WRITABLE); if (unlikely(!__pyx_t_1.memview)) __PYX_ERR(0, 161, __pyx_L1_error)
   __pyx_v_col = __pyx_t_1;
   __pyx_t_1.memview = NULL;
   __pyx_t_1.data = NULL;
 
-  /* "sisl/_sparse.pyx":161
+  /* "sisl/_sparse.pyx":163
  *     cdef int[::1] col = COL
  *     # Number of rows
  *     cdef int nr = ncol.shape[0]             # <<<<<<<<<<<<<<
@@ -4718,51 +5134,51 @@ static PyObject *__pyx_pf_4sisl_7_sparse_4fold_csr_diagonal_nc(CYTHON_UNUSED PyO
  */
   __pyx_v_nr = (__pyx_v_ncol.shape[0]);
 
-  /* "sisl/_sparse.pyx":163
+  /* "sisl/_sparse.pyx":165
  *     cdef int nr = ncol.shape[0]
  * 
  *     cdef np.ndarray[np.int32_t, ndim=1, mode='c'] FOLD_ptr = np.empty([nr * 2 + 1], dtype=np.int32)             # <<<<<<<<<<<<<<
  *     cdef int[::1] fold_ptr = FOLD_ptr
  *     cdef np.ndarray[np.int32_t, ndim=1, mode='c'] FOLD_ncol = np.empty([nr * 2], dtype=np.int32)
  */
-  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_np); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 163, __pyx_L1_error)
+  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_np); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 165, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_empty); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 163, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_empty); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 165, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __pyx_t_2 = __Pyx_PyInt_From_long(((__pyx_v_nr * 2) + 1)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 163, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyInt_From_long(((__pyx_v_nr * 2) + 1)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 165, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_4 = PyList_New(1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 163, __pyx_L1_error)
+  __pyx_t_4 = PyList_New(1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 165, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_4);
   __Pyx_GIVEREF(__pyx_t_2);
   PyList_SET_ITEM(__pyx_t_4, 0, __pyx_t_2);
   __pyx_t_2 = 0;
-  __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 163, __pyx_L1_error)
+  __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 165, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __Pyx_GIVEREF(__pyx_t_4);
   PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_t_4);
   __pyx_t_4 = 0;
-  __pyx_t_4 = __Pyx_PyDict_NewPresized(1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 163, __pyx_L1_error)
+  __pyx_t_4 = __Pyx_PyDict_NewPresized(1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 165, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_4);
-  __Pyx_GetModuleGlobalName(__pyx_t_5, __pyx_n_s_np); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 163, __pyx_L1_error)
+  __Pyx_GetModuleGlobalName(__pyx_t_5, __pyx_n_s_np); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 165, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_5);
-  __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_t_5, __pyx_n_s_int32); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 163, __pyx_L1_error)
+  __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_t_5, __pyx_n_s_int32); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 165, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_6);
   __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-  if (PyDict_SetItem(__pyx_t_4, __pyx_n_s_dtype, __pyx_t_6) < 0) __PYX_ERR(0, 163, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_4, __pyx_n_s_dtype, __pyx_t_6) < 0) __PYX_ERR(0, 165, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-  __pyx_t_6 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_t_2, __pyx_t_4); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 163, __pyx_L1_error)
+  __pyx_t_6 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_t_2, __pyx_t_4); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 165, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_6);
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-  if (!(likely(((__pyx_t_6) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_6, __pyx_ptype_5numpy_ndarray))))) __PYX_ERR(0, 163, __pyx_L1_error)
+  if (!(likely(((__pyx_t_6) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_6, __pyx_ptype_5numpy_ndarray))))) __PYX_ERR(0, 165, __pyx_L1_error)
   __pyx_t_7 = ((PyArrayObject *)__pyx_t_6);
   {
     __Pyx_BufFmt_StackElem __pyx_stack[1];
     if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_FOLD_ptr.rcbuffer->pybuffer, (PyObject*)__pyx_t_7, &__Pyx_TypeInfo_nn___pyx_t_5numpy_int32_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) {
       __pyx_v_FOLD_ptr = ((PyArrayObject *)Py_None); __Pyx_INCREF(Py_None); __pyx_pybuffernd_FOLD_ptr.rcbuffer->pybuffer.buf = NULL;
-      __PYX_ERR(0, 163, __pyx_L1_error)
+      __PYX_ERR(0, 165, __pyx_L1_error)
     } else {__pyx_pybuffernd_FOLD_ptr.diminfo[0].strides = __pyx_pybuffernd_FOLD_ptr.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_FOLD_ptr.diminfo[0].shape = __pyx_pybuffernd_FOLD_ptr.rcbuffer->pybuffer.shape[0];
     }
   }
@@ -4770,63 +5186,63 @@ static PyObject *__pyx_pf_4sisl_7_sparse_4fold_csr_diagonal_nc(CYTHON_UNUSED PyO
   __pyx_v_FOLD_ptr = ((PyArrayObject *)__pyx_t_6);
   __pyx_t_6 = 0;
 
-  /* "sisl/_sparse.pyx":164
+  /* "sisl/_sparse.pyx":166
  * 
  *     cdef np.ndarray[np.int32_t, ndim=1, mode='c'] FOLD_ptr = np.empty([nr * 2 + 1], dtype=np.int32)
  *     cdef int[::1] fold_ptr = FOLD_ptr             # <<<<<<<<<<<<<<
  *     cdef np.ndarray[np.int32_t, ndim=1, mode='c'] FOLD_ncol = np.empty([nr * 2], dtype=np.int32)
  *     cdef int[::1] fold_ncol = FOLD_ncol
  */
-  __pyx_t_1 = __Pyx_PyObject_to_MemoryviewSlice_dc_int(((PyObject *)__pyx_v_FOLD_ptr), PyBUF_WRITABLE); if (unlikely(!__pyx_t_1.memview)) __PYX_ERR(0, 164, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyObject_to_MemoryviewSlice_dc_int(((PyObject *)__pyx_v_FOLD_ptr), PyBUF_WRITABLE); if (unlikely(!__pyx_t_1.memview)) __PYX_ERR(0, 166, __pyx_L1_error)
   __pyx_v_fold_ptr = __pyx_t_1;
   __pyx_t_1.memview = NULL;
   __pyx_t_1.data = NULL;
 
-  /* "sisl/_sparse.pyx":165
+  /* "sisl/_sparse.pyx":167
  *     cdef np.ndarray[np.int32_t, ndim=1, mode='c'] FOLD_ptr = np.empty([nr * 2 + 1], dtype=np.int32)
  *     cdef int[::1] fold_ptr = FOLD_ptr
  *     cdef np.ndarray[np.int32_t, ndim=1, mode='c'] FOLD_ncol = np.empty([nr * 2], dtype=np.int32)             # <<<<<<<<<<<<<<
  *     cdef int[::1] fold_ncol = FOLD_ncol
  *     # We have to multiply by 2, 2 times the number of rows
  */
-  __Pyx_GetModuleGlobalName(__pyx_t_6, __pyx_n_s_np); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 165, __pyx_L1_error)
+  __Pyx_GetModuleGlobalName(__pyx_t_6, __pyx_n_s_np); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 167, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_6);
-  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_t_6, __pyx_n_s_empty); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 165, __pyx_L1_error)
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_t_6, __pyx_n_s_empty); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 167, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_4);
   __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-  __pyx_t_6 = __Pyx_PyInt_From_long((__pyx_v_nr * 2)); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 165, __pyx_L1_error)
+  __pyx_t_6 = __Pyx_PyInt_From_long((__pyx_v_nr * 2)); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 167, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_6);
-  __pyx_t_2 = PyList_New(1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 165, __pyx_L1_error)
+  __pyx_t_2 = PyList_New(1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 167, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __Pyx_GIVEREF(__pyx_t_6);
   PyList_SET_ITEM(__pyx_t_2, 0, __pyx_t_6);
   __pyx_t_6 = 0;
-  __pyx_t_6 = PyTuple_New(1); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 165, __pyx_L1_error)
+  __pyx_t_6 = PyTuple_New(1); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 167, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_6);
   __Pyx_GIVEREF(__pyx_t_2);
   PyTuple_SET_ITEM(__pyx_t_6, 0, __pyx_t_2);
   __pyx_t_2 = 0;
-  __pyx_t_2 = __Pyx_PyDict_NewPresized(1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 165, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyDict_NewPresized(1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 167, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_n_s_np); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 165, __pyx_L1_error)
+  __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_n_s_np); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 167, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_n_s_int32); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 165, __pyx_L1_error)
+  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_n_s_int32); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 167, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_5);
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  if (PyDict_SetItem(__pyx_t_2, __pyx_n_s_dtype, __pyx_t_5) < 0) __PYX_ERR(0, 165, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_2, __pyx_n_s_dtype, __pyx_t_5) < 0) __PYX_ERR(0, 167, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-  __pyx_t_5 = __Pyx_PyObject_Call(__pyx_t_4, __pyx_t_6, __pyx_t_2); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 165, __pyx_L1_error)
+  __pyx_t_5 = __Pyx_PyObject_Call(__pyx_t_4, __pyx_t_6, __pyx_t_2); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 167, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_5);
   __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
   __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  if (!(likely(((__pyx_t_5) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_5, __pyx_ptype_5numpy_ndarray))))) __PYX_ERR(0, 165, __pyx_L1_error)
+  if (!(likely(((__pyx_t_5) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_5, __pyx_ptype_5numpy_ndarray))))) __PYX_ERR(0, 167, __pyx_L1_error)
   __pyx_t_8 = ((PyArrayObject *)__pyx_t_5);
   {
     __Pyx_BufFmt_StackElem __pyx_stack[1];
     if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_FOLD_ncol.rcbuffer->pybuffer, (PyObject*)__pyx_t_8, &__Pyx_TypeInfo_nn___pyx_t_5numpy_int32_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) {
       __pyx_v_FOLD_ncol = ((PyArrayObject *)Py_None); __Pyx_INCREF(Py_None); __pyx_pybuffernd_FOLD_ncol.rcbuffer->pybuffer.buf = NULL;
-      __PYX_ERR(0, 165, __pyx_L1_error)
+      __PYX_ERR(0, 167, __pyx_L1_error)
     } else {__pyx_pybuffernd_FOLD_ncol.diminfo[0].strides = __pyx_pybuffernd_FOLD_ncol.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_FOLD_ncol.diminfo[0].shape = __pyx_pybuffernd_FOLD_ncol.rcbuffer->pybuffer.shape[0];
     }
   }
@@ -4834,63 +5250,63 @@ static PyObject *__pyx_pf_4sisl_7_sparse_4fold_csr_diagonal_nc(CYTHON_UNUSED PyO
   __pyx_v_FOLD_ncol = ((PyArrayObject *)__pyx_t_5);
   __pyx_t_5 = 0;
 
-  /* "sisl/_sparse.pyx":166
+  /* "sisl/_sparse.pyx":168
  *     cdef int[::1] fold_ptr = FOLD_ptr
  *     cdef np.ndarray[np.int32_t, ndim=1, mode='c'] FOLD_ncol = np.empty([nr * 2], dtype=np.int32)
  *     cdef int[::1] fold_ncol = FOLD_ncol             # <<<<<<<<<<<<<<
  *     # We have to multiply by 2, 2 times the number of rows
  *     cdef np.ndarray[np.int32_t, ndim=1, mode='c'] FOLD_col = np.empty([_sum(ncol) * 2], dtype=np.int32)
  */
-  __pyx_t_1 = __Pyx_PyObject_to_MemoryviewSlice_dc_int(((PyObject *)__pyx_v_FOLD_ncol), PyBUF_WRITABLE); if (unlikely(!__pyx_t_1.memview)) __PYX_ERR(0, 166, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyObject_to_MemoryviewSlice_dc_int(((PyObject *)__pyx_v_FOLD_ncol), PyBUF_WRITABLE); if (unlikely(!__pyx_t_1.memview)) __PYX_ERR(0, 168, __pyx_L1_error)
   __pyx_v_fold_ncol = __pyx_t_1;
   __pyx_t_1.memview = NULL;
   __pyx_t_1.data = NULL;
 
-  /* "sisl/_sparse.pyx":168
+  /* "sisl/_sparse.pyx":170
  *     cdef int[::1] fold_ncol = FOLD_ncol
  *     # We have to multiply by 2, 2 times the number of rows
  *     cdef np.ndarray[np.int32_t, ndim=1, mode='c'] FOLD_col = np.empty([_sum(ncol) * 2], dtype=np.int32)             # <<<<<<<<<<<<<<
  *     cdef int[::1] fold_col = FOLD_col
  *     # local variables
  */
-  __Pyx_GetModuleGlobalName(__pyx_t_5, __pyx_n_s_np); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 168, __pyx_L1_error)
+  __Pyx_GetModuleGlobalName(__pyx_t_5, __pyx_n_s_np); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 170, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_5);
-  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_t_5, __pyx_n_s_empty); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 168, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_t_5, __pyx_n_s_empty); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 170, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-  __pyx_t_5 = __Pyx_PyInt_From_long((__pyx_f_4sisl_7_sparse__sum(__pyx_v_ncol) * 2)); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 168, __pyx_L1_error)
+  __pyx_t_5 = __Pyx_PyInt_From_long((__pyx_f_4sisl_7_sparse__sum(__pyx_v_ncol) * 2)); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 170, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_5);
-  __pyx_t_6 = PyList_New(1); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 168, __pyx_L1_error)
+  __pyx_t_6 = PyList_New(1); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 170, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_6);
   __Pyx_GIVEREF(__pyx_t_5);
   PyList_SET_ITEM(__pyx_t_6, 0, __pyx_t_5);
   __pyx_t_5 = 0;
-  __pyx_t_5 = PyTuple_New(1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 168, __pyx_L1_error)
+  __pyx_t_5 = PyTuple_New(1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 170, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_5);
   __Pyx_GIVEREF(__pyx_t_6);
   PyTuple_SET_ITEM(__pyx_t_5, 0, __pyx_t_6);
   __pyx_t_6 = 0;
-  __pyx_t_6 = __Pyx_PyDict_NewPresized(1); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 168, __pyx_L1_error)
+  __pyx_t_6 = __Pyx_PyDict_NewPresized(1); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 170, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_6);
-  __Pyx_GetModuleGlobalName(__pyx_t_4, __pyx_n_s_np); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 168, __pyx_L1_error)
+  __Pyx_GetModuleGlobalName(__pyx_t_4, __pyx_n_s_np); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 170, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_4);
-  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_4, __pyx_n_s_int32); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 168, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_4, __pyx_n_s_int32); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 170, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
   __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-  if (PyDict_SetItem(__pyx_t_6, __pyx_n_s_dtype, __pyx_t_3) < 0) __PYX_ERR(0, 168, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_6, __pyx_n_s_dtype, __pyx_t_3) < 0) __PYX_ERR(0, 170, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  __pyx_t_3 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_t_5, __pyx_t_6); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 168, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_t_5, __pyx_t_6); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 170, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
   __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-  if (!(likely(((__pyx_t_3) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_3, __pyx_ptype_5numpy_ndarray))))) __PYX_ERR(0, 168, __pyx_L1_error)
+  if (!(likely(((__pyx_t_3) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_3, __pyx_ptype_5numpy_ndarray))))) __PYX_ERR(0, 170, __pyx_L1_error)
   __pyx_t_9 = ((PyArrayObject *)__pyx_t_3);
   {
     __Pyx_BufFmt_StackElem __pyx_stack[1];
     if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_FOLD_col.rcbuffer->pybuffer, (PyObject*)__pyx_t_9, &__Pyx_TypeInfo_nn___pyx_t_5numpy_int32_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) {
       __pyx_v_FOLD_col = ((PyArrayObject *)Py_None); __Pyx_INCREF(Py_None); __pyx_pybuffernd_FOLD_col.rcbuffer->pybuffer.buf = NULL;
-      __PYX_ERR(0, 168, __pyx_L1_error)
+      __PYX_ERR(0, 170, __pyx_L1_error)
     } else {__pyx_pybuffernd_FOLD_col.diminfo[0].strides = __pyx_pybuffernd_FOLD_col.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_FOLD_col.diminfo[0].shape = __pyx_pybuffernd_FOLD_col.rcbuffer->pybuffer.shape[0];
     }
   }
@@ -4898,19 +5314,19 @@ static PyObject *__pyx_pf_4sisl_7_sparse_4fold_csr_diagonal_nc(CYTHON_UNUSED PyO
   __pyx_v_FOLD_col = ((PyArrayObject *)__pyx_t_3);
   __pyx_t_3 = 0;
 
-  /* "sisl/_sparse.pyx":169
+  /* "sisl/_sparse.pyx":171
  *     # We have to multiply by 2, 2 times the number of rows
  *     cdef np.ndarray[np.int32_t, ndim=1, mode='c'] FOLD_col = np.empty([_sum(ncol) * 2], dtype=np.int32)
  *     cdef int[::1] fold_col = FOLD_col             # <<<<<<<<<<<<<<
  *     # local variables
  *     cdef int r, rr, ind, nz, c
  */
-  __pyx_t_1 = __Pyx_PyObject_to_MemoryviewSlice_dc_int(((PyObject *)__pyx_v_FOLD_col), PyBUF_WRITABLE); if (unlikely(!__pyx_t_1.memview)) __PYX_ERR(0, 169, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyObject_to_MemoryviewSlice_dc_int(((PyObject *)__pyx_v_FOLD_col), PyBUF_WRITABLE); if (unlikely(!__pyx_t_1.memview)) __PYX_ERR(0, 171, __pyx_L1_error)
   __pyx_v_fold_col = __pyx_t_1;
   __pyx_t_1.memview = NULL;
   __pyx_t_1.data = NULL;
 
-  /* "sisl/_sparse.pyx":173
+  /* "sisl/_sparse.pyx":175
  *     cdef int r, rr, ind, nz, c
  * 
  *     nz = 0             # <<<<<<<<<<<<<<
@@ -4919,7 +5335,7 @@ static PyObject *__pyx_pf_4sisl_7_sparse_4fold_csr_diagonal_nc(CYTHON_UNUSED PyO
  */
   __pyx_v_nz = 0;
 
-  /* "sisl/_sparse.pyx":174
+  /* "sisl/_sparse.pyx":176
  * 
  *     nz = 0
  *     fold_ptr[0] = 0             # <<<<<<<<<<<<<<
@@ -4929,7 +5345,7 @@ static PyObject *__pyx_pf_4sisl_7_sparse_4fold_csr_diagonal_nc(CYTHON_UNUSED PyO
   __pyx_t_10 = 0;
   *((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_fold_ptr.data) + __pyx_t_10)) )) = 0;
 
-  /* "sisl/_sparse.pyx":176
+  /* "sisl/_sparse.pyx":178
  *     fold_ptr[0] = 0
  *     # Loop on all rows
  *     for r in range(nr):             # <<<<<<<<<<<<<<
@@ -4941,7 +5357,7 @@ static PyObject *__pyx_pf_4sisl_7_sparse_4fold_csr_diagonal_nc(CYTHON_UNUSED PyO
   for (__pyx_t_13 = 0; __pyx_t_13 < __pyx_t_12; __pyx_t_13+=1) {
     __pyx_v_r = __pyx_t_13;
 
-    /* "sisl/_sparse.pyx":177
+    /* "sisl/_sparse.pyx":179
  *     # Loop on all rows
  *     for r in range(nr):
  *         rr = r * 2             # <<<<<<<<<<<<<<
@@ -4950,7 +5366,7 @@ static PyObject *__pyx_pf_4sisl_7_sparse_4fold_csr_diagonal_nc(CYTHON_UNUSED PyO
  */
     __pyx_v_rr = (__pyx_v_r * 2);
 
-    /* "sisl/_sparse.pyx":180
+    /* "sisl/_sparse.pyx":182
  * 
  *         # Initialize the pointer arrays
  *         if ncol[r] > 0:             # <<<<<<<<<<<<<<
@@ -4961,7 +5377,7 @@ static PyObject *__pyx_pf_4sisl_7_sparse_4fold_csr_diagonal_nc(CYTHON_UNUSED PyO
     __pyx_t_15 = (((*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_ncol.data) + __pyx_t_14)) ))) > 0) != 0);
     if (__pyx_t_15) {
 
-      /* "sisl/_sparse.pyx":181
+      /* "sisl/_sparse.pyx":183
  *         # Initialize the pointer arrays
  *         if ncol[r] > 0:
  *             c = (col[ptr[r]] % nr) * 2             # <<<<<<<<<<<<<<
@@ -4972,7 +5388,7 @@ static PyObject *__pyx_pf_4sisl_7_sparse_4fold_csr_diagonal_nc(CYTHON_UNUSED PyO
       __pyx_t_17 = (*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_ptr.data) + __pyx_t_16)) )));
       __pyx_v_c = (((*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_col.data) + __pyx_t_17)) ))) % __pyx_v_nr) * 2);
 
-      /* "sisl/_sparse.pyx":182
+      /* "sisl/_sparse.pyx":184
  *         if ncol[r] > 0:
  *             c = (col[ptr[r]] % nr) * 2
  *             fold_ncol[rr] = 1             # <<<<<<<<<<<<<<
@@ -4982,7 +5398,7 @@ static PyObject *__pyx_pf_4sisl_7_sparse_4fold_csr_diagonal_nc(CYTHON_UNUSED PyO
       __pyx_t_18 = __pyx_v_rr;
       *((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_fold_ncol.data) + __pyx_t_18)) )) = 1;
 
-      /* "sisl/_sparse.pyx":183
+      /* "sisl/_sparse.pyx":185
  *             c = (col[ptr[r]] % nr) * 2
  *             fold_ncol[rr] = 1
  *             fold_col[fold_ptr[rr]] = c             # <<<<<<<<<<<<<<
@@ -4993,7 +5409,7 @@ static PyObject *__pyx_pf_4sisl_7_sparse_4fold_csr_diagonal_nc(CYTHON_UNUSED PyO
       __pyx_t_20 = (*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_fold_ptr.data) + __pyx_t_19)) )));
       *((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_fold_col.data) + __pyx_t_20)) )) = __pyx_v_c;
 
-      /* "sisl/_sparse.pyx":180
+      /* "sisl/_sparse.pyx":182
  * 
  *         # Initialize the pointer arrays
  *         if ncol[r] > 0:             # <<<<<<<<<<<<<<
@@ -5003,7 +5419,7 @@ static PyObject *__pyx_pf_4sisl_7_sparse_4fold_csr_diagonal_nc(CYTHON_UNUSED PyO
       goto __pyx_L5;
     }
 
-    /* "sisl/_sparse.pyx":185
+    /* "sisl/_sparse.pyx":187
  *             fold_col[fold_ptr[rr]] = c
  *         else:
  *             fold_ncol[rr] = 0             # <<<<<<<<<<<<<<
@@ -5016,7 +5432,7 @@ static PyObject *__pyx_pf_4sisl_7_sparse_4fold_csr_diagonal_nc(CYTHON_UNUSED PyO
     }
     __pyx_L5:;
 
-    /* "sisl/_sparse.pyx":187
+    /* "sisl/_sparse.pyx":189
  *             fold_ncol[rr] = 0
  * 
  *         for ind in range(ptr[r] + 1, ptr[r] + ncol[r]):             # <<<<<<<<<<<<<<
@@ -5031,7 +5447,7 @@ static PyObject *__pyx_pf_4sisl_7_sparse_4fold_csr_diagonal_nc(CYTHON_UNUSED PyO
     for (__pyx_t_27 = ((*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_ptr.data) + __pyx_t_25)) ))) + 1); __pyx_t_27 < __pyx_t_26; __pyx_t_27+=1) {
       __pyx_v_ind = __pyx_t_27;
 
-      /* "sisl/_sparse.pyx":188
+      /* "sisl/_sparse.pyx":190
  * 
  *         for ind in range(ptr[r] + 1, ptr[r] + ncol[r]):
  *             c = (col[ind] % nr) * 2             # <<<<<<<<<<<<<<
@@ -5041,7 +5457,7 @@ static PyObject *__pyx_pf_4sisl_7_sparse_4fold_csr_diagonal_nc(CYTHON_UNUSED PyO
       __pyx_t_28 = __pyx_v_ind;
       __pyx_v_c = (((*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_col.data) + __pyx_t_28)) ))) % __pyx_v_nr) * 2);
 
-      /* "sisl/_sparse.pyx":189
+      /* "sisl/_sparse.pyx":191
  *         for ind in range(ptr[r] + 1, ptr[r] + ncol[r]):
  *             c = (col[ind] % nr) * 2
  *             if not in_1d(fold_col[fold_ptr[rr]:fold_ptr[rr] + fold_ncol[rr]], c):             # <<<<<<<<<<<<<<
@@ -5069,7 +5485,7 @@ static PyObject *__pyx_pf_4sisl_7_sparse_4fold_csr_diagonal_nc(CYTHON_UNUSED PyO
     0,
     1) < 0))
 {
-    __PYX_ERR(0, 189, __pyx_L1_error)
+    __PYX_ERR(0, 191, __pyx_L1_error)
 }
 
 __pyx_t_15 = ((!(__pyx_f_4sisl_8_indices_in_1d(__pyx_t_1, __pyx_v_c) != 0)) != 0);
@@ -5078,7 +5494,7 @@ __pyx_t_15 = ((!(__pyx_f_4sisl_8_indices_in_1d(__pyx_t_1, __pyx_v_c) != 0)) != 0
       __pyx_t_1.data = NULL;
       if (__pyx_t_15) {
 
-        /* "sisl/_sparse.pyx":190
+        /* "sisl/_sparse.pyx":192
  *             c = (col[ind] % nr) * 2
  *             if not in_1d(fold_col[fold_ptr[rr]:fold_ptr[rr] + fold_ncol[rr]], c):
  *                 fold_col[fold_ptr[rr] + fold_ncol[rr]] = c             # <<<<<<<<<<<<<<
@@ -5090,7 +5506,7 @@ __pyx_t_15 = ((!(__pyx_f_4sisl_8_indices_in_1d(__pyx_t_1, __pyx_v_c) != 0)) != 0
         __pyx_t_35 = ((*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_fold_ptr.data) + __pyx_t_33)) ))) + (*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_fold_ncol.data) + __pyx_t_34)) ))));
         *((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_fold_col.data) + __pyx_t_35)) )) = __pyx_v_c;
 
-        /* "sisl/_sparse.pyx":191
+        /* "sisl/_sparse.pyx":193
  *             if not in_1d(fold_col[fold_ptr[rr]:fold_ptr[rr] + fold_ncol[rr]], c):
  *                 fold_col[fold_ptr[rr] + fold_ncol[rr]] = c
  *                 fold_ncol[rr] += 1             # <<<<<<<<<<<<<<
@@ -5100,7 +5516,7 @@ __pyx_t_15 = ((!(__pyx_f_4sisl_8_indices_in_1d(__pyx_t_1, __pyx_v_c) != 0)) != 0
         __pyx_t_36 = __pyx_v_rr;
         *((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_fold_ncol.data) + __pyx_t_36)) )) += 1;
 
-        /* "sisl/_sparse.pyx":189
+        /* "sisl/_sparse.pyx":191
  *         for ind in range(ptr[r] + 1, ptr[r] + ncol[r]):
  *             c = (col[ind] % nr) * 2
  *             if not in_1d(fold_col[fold_ptr[rr]:fold_ptr[rr] + fold_ncol[rr]], c):             # <<<<<<<<<<<<<<
@@ -5110,7 +5526,7 @@ __pyx_t_15 = ((!(__pyx_f_4sisl_8_indices_in_1d(__pyx_t_1, __pyx_v_c) != 0)) != 0
       }
     }
 
-    /* "sisl/_sparse.pyx":194
+    /* "sisl/_sparse.pyx":196
  * 
  *         # Duplicate pointers and counters for next row (off-diagonal)
  *         fold_ptr[rr + 1] = fold_ptr[rr] + fold_ncol[rr]             # <<<<<<<<<<<<<<
@@ -5122,7 +5538,7 @@ __pyx_t_15 = ((!(__pyx_f_4sisl_8_indices_in_1d(__pyx_t_1, __pyx_v_c) != 0)) != 0
     __pyx_t_39 = (__pyx_v_rr + 1);
     *((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_fold_ptr.data) + __pyx_t_39)) )) = ((*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_fold_ptr.data) + __pyx_t_37)) ))) + (*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_fold_ncol.data) + __pyx_t_38)) ))));
 
-    /* "sisl/_sparse.pyx":195
+    /* "sisl/_sparse.pyx":197
  *         # Duplicate pointers and counters for next row (off-diagonal)
  *         fold_ptr[rr + 1] = fold_ptr[rr] + fold_ncol[rr]
  *         fold_ncol[rr + 1] = fold_ncol[rr]             # <<<<<<<<<<<<<<
@@ -5133,16 +5549,16 @@ __pyx_t_15 = ((!(__pyx_f_4sisl_8_indices_in_1d(__pyx_t_1, __pyx_v_c) != 0)) != 0
     __pyx_t_41 = (__pyx_v_rr + 1);
     *((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_fold_ncol.data) + __pyx_t_41)) )) = (*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_fold_ncol.data) + __pyx_t_40)) )));
 
-    /* "sisl/_sparse.pyx":198
+    /* "sisl/_sparse.pyx":200
  * 
  *         # Sort indices (we should implement our own sorting algorithm)
  *         tmp = np.sort(fold_col[fold_ptr[rr]:fold_ptr[rr] + fold_ncol[rr]])             # <<<<<<<<<<<<<<
  *         for ind in range(fold_ncol[rr]):
  *             c = tmp[ind]
  */
-    __Pyx_GetModuleGlobalName(__pyx_t_6, __pyx_n_s_np); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 198, __pyx_L1_error)
+    __Pyx_GetModuleGlobalName(__pyx_t_6, __pyx_n_s_np); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 200, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_6);
-    __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_6, __pyx_n_s_sort); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 198, __pyx_L1_error)
+    __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_6, __pyx_n_s_sort); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 200, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_5);
     __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
     __pyx_t_42 = __pyx_v_rr;
@@ -5166,10 +5582,10 @@ __pyx_t_15 = ((!(__pyx_f_4sisl_8_indices_in_1d(__pyx_t_1, __pyx_v_c) != 0)) != 0
     0,
     1) < 0))
 {
-    __PYX_ERR(0, 198, __pyx_L1_error)
+    __PYX_ERR(0, 200, __pyx_L1_error)
 }
 
-__pyx_t_6 = __pyx_memoryview_fromslice(__pyx_t_1, 1, (PyObject *(*)(char *)) __pyx_memview_get_int, (int (*)(char *, PyObject *)) __pyx_memview_set_int, 0);; if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 198, __pyx_L1_error)
+__pyx_t_6 = __pyx_memoryview_fromslice(__pyx_t_1, 1, (PyObject *(*)(char *)) __pyx_memview_get_int, (int (*)(char *, PyObject *)) __pyx_memview_set_int, 0);; if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 200, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_6);
     __PYX_XDEC_MEMVIEW(&__pyx_t_1, 1);
     __pyx_t_1.memview = NULL;
@@ -5187,13 +5603,13 @@ __pyx_t_6 = __pyx_memoryview_fromslice(__pyx_t_1, 1, (PyObject *(*)(char *)) __p
     __pyx_t_3 = (__pyx_t_2) ? __Pyx_PyObject_Call2Args(__pyx_t_5, __pyx_t_2, __pyx_t_6) : __Pyx_PyObject_CallOneArg(__pyx_t_5, __pyx_t_6);
     __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
     __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-    if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 198, __pyx_L1_error)
+    if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 200, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_3);
     __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
     __Pyx_XDECREF_SET(__pyx_v_tmp, __pyx_t_3);
     __pyx_t_3 = 0;
 
-    /* "sisl/_sparse.pyx":199
+    /* "sisl/_sparse.pyx":201
  *         # Sort indices (we should implement our own sorting algorithm)
  *         tmp = np.sort(fold_col[fold_ptr[rr]:fold_ptr[rr] + fold_ncol[rr]])
  *         for ind in range(fold_ncol[rr]):             # <<<<<<<<<<<<<<
@@ -5206,20 +5622,20 @@ __pyx_t_6 = __pyx_memoryview_fromslice(__pyx_t_1, 1, (PyObject *(*)(char *)) __p
     for (__pyx_t_27 = 0; __pyx_t_27 < __pyx_t_26; __pyx_t_27+=1) {
       __pyx_v_ind = __pyx_t_27;
 
-      /* "sisl/_sparse.pyx":200
+      /* "sisl/_sparse.pyx":202
  *         tmp = np.sort(fold_col[fold_ptr[rr]:fold_ptr[rr] + fold_ncol[rr]])
  *         for ind in range(fold_ncol[rr]):
  *             c = tmp[ind]             # <<<<<<<<<<<<<<
  *             fold_col[fold_ptr[rr] + ind] = c
  *             # Copy to next row as well
  */
-      __pyx_t_3 = __Pyx_GetItemInt(__pyx_v_tmp, __pyx_v_ind, int, 1, __Pyx_PyInt_From_int, 0, 0, 0); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 200, __pyx_L1_error)
+      __pyx_t_3 = __Pyx_GetItemInt(__pyx_v_tmp, __pyx_v_ind, int, 1, __Pyx_PyInt_From_int, 0, 0, 0); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 202, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_3);
-      __pyx_t_32 = __Pyx_PyInt_As_int(__pyx_t_3); if (unlikely((__pyx_t_32 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 200, __pyx_L1_error)
+      __pyx_t_32 = __Pyx_PyInt_As_int(__pyx_t_3); if (unlikely((__pyx_t_32 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 202, __pyx_L1_error)
       __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
       __pyx_v_c = __pyx_t_32;
 
-      /* "sisl/_sparse.pyx":201
+      /* "sisl/_sparse.pyx":203
  *         for ind in range(fold_ncol[rr]):
  *             c = tmp[ind]
  *             fold_col[fold_ptr[rr] + ind] = c             # <<<<<<<<<<<<<<
@@ -5230,7 +5646,7 @@ __pyx_t_6 = __pyx_memoryview_fromslice(__pyx_t_1, 1, (PyObject *(*)(char *)) __p
       __pyx_t_47 = ((*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_fold_ptr.data) + __pyx_t_46)) ))) + __pyx_v_ind);
       *((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_fold_col.data) + __pyx_t_47)) )) = __pyx_v_c;
 
-      /* "sisl/_sparse.pyx":203
+      /* "sisl/_sparse.pyx":205
  *             fold_col[fold_ptr[rr] + ind] = c
  *             # Copy to next row as well
  *             fold_col[fold_ptr[rr+1] + ind] = c + 1             # <<<<<<<<<<<<<<
@@ -5242,7 +5658,7 @@ __pyx_t_6 = __pyx_memoryview_fromslice(__pyx_t_1, 1, (PyObject *(*)(char *)) __p
       *((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_fold_col.data) + __pyx_t_49)) )) = (__pyx_v_c + 1);
     }
 
-    /* "sisl/_sparse.pyx":206
+    /* "sisl/_sparse.pyx":208
  * 
  *         # Increment the next row
  *         fold_ptr[rr + 2] = fold_ptr[rr + 1] + fold_ncol[rr + 1]             # <<<<<<<<<<<<<<
@@ -5254,7 +5670,7 @@ __pyx_t_6 = __pyx_memoryview_fromslice(__pyx_t_1, 1, (PyObject *(*)(char *)) __p
     __pyx_t_52 = (__pyx_v_rr + 2);
     *((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_fold_ptr.data) + __pyx_t_52)) )) = ((*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_fold_ptr.data) + __pyx_t_50)) ))) + (*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_fold_ncol.data) + __pyx_t_51)) ))));
 
-    /* "sisl/_sparse.pyx":207
+    /* "sisl/_sparse.pyx":209
  *         # Increment the next row
  *         fold_ptr[rr + 2] = fold_ptr[rr + 1] + fold_ncol[rr + 1]
  *         nz += fold_ncol[rr] * 2             # <<<<<<<<<<<<<<
@@ -5265,7 +5681,7 @@ __pyx_t_6 = __pyx_memoryview_fromslice(__pyx_t_1, 1, (PyObject *(*)(char *)) __p
     __pyx_v_nz = (__pyx_v_nz + ((*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_fold_ncol.data) + __pyx_t_53)) ))) * 2));
   }
 
-  /* "sisl/_sparse.pyx":209
+  /* "sisl/_sparse.pyx":211
  *         nz += fold_ncol[rr] * 2
  * 
  *     if nz > fold_col.shape[0]:             # <<<<<<<<<<<<<<
@@ -5275,20 +5691,20 @@ __pyx_t_6 = __pyx_memoryview_fromslice(__pyx_t_1, 1, (PyObject *(*)(char *)) __p
   __pyx_t_15 = ((__pyx_v_nz > (__pyx_v_fold_col.shape[0])) != 0);
   if (unlikely(__pyx_t_15)) {
 
-    /* "sisl/_sparse.pyx":210
+    /* "sisl/_sparse.pyx":212
  * 
  *     if nz > fold_col.shape[0]:
  *         raise ValueError('something went wrong overlap NC')             # <<<<<<<<<<<<<<
  * 
  *     # Return objects
  */
-    __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__3, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 210, __pyx_L1_error)
+    __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__3, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 212, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_3);
     __Pyx_Raise(__pyx_t_3, 0, 0, 0);
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    __PYX_ERR(0, 210, __pyx_L1_error)
+    __PYX_ERR(0, 212, __pyx_L1_error)
 
-    /* "sisl/_sparse.pyx":209
+    /* "sisl/_sparse.pyx":211
  *         nz += fold_ncol[rr] * 2
  * 
  *     if nz > fold_col.shape[0]:             # <<<<<<<<<<<<<<
@@ -5297,21 +5713,23 @@ __pyx_t_6 = __pyx_memoryview_fromslice(__pyx_t_1, 1, (PyObject *(*)(char *)) __p
  */
   }
 
-  /* "sisl/_sparse.pyx":213
+  /* "sisl/_sparse.pyx":215
  * 
  *     # Return objects
  *     return FOLD_ptr, FOLD_ncol, FOLD_col[:nz].copy()             # <<<<<<<<<<<<<<
+ * 
+ * 
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_5 = __Pyx_PyInt_From_int(__pyx_v_nz); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 213, __pyx_L1_error)
+  __pyx_t_5 = __Pyx_PyInt_From_int(__pyx_v_nz); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 215, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_5);
-  __pyx_t_6 = PySlice_New(Py_None, __pyx_t_5, Py_None); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 213, __pyx_L1_error)
+  __pyx_t_6 = PySlice_New(Py_None, __pyx_t_5, Py_None); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 215, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_6);
   __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-  __pyx_t_5 = __Pyx_PyObject_GetItem(((PyObject *)__pyx_v_FOLD_col), __pyx_t_6); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 213, __pyx_L1_error)
+  __pyx_t_5 = __Pyx_PyObject_GetItem(((PyObject *)__pyx_v_FOLD_col), __pyx_t_6); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 215, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_5);
   __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-  __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_t_5, __pyx_n_s_copy); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 213, __pyx_L1_error)
+  __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_t_5, __pyx_n_s_copy); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 215, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_6);
   __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
   __pyx_t_5 = NULL;
@@ -5326,10 +5744,10 @@ __pyx_t_6 = __pyx_memoryview_fromslice(__pyx_t_1, 1, (PyObject *(*)(char *)) __p
   }
   __pyx_t_3 = (__pyx_t_5) ? __Pyx_PyObject_CallOneArg(__pyx_t_6, __pyx_t_5) : __Pyx_PyObject_CallNoArg(__pyx_t_6);
   __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
-  if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 213, __pyx_L1_error)
+  if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 215, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
   __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-  __pyx_t_6 = PyTuple_New(3); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 213, __pyx_L1_error)
+  __pyx_t_6 = PyTuple_New(3); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 215, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_6);
   __Pyx_INCREF(((PyObject *)__pyx_v_FOLD_ptr));
   __Pyx_GIVEREF(((PyObject *)__pyx_v_FOLD_ptr));
@@ -5344,7 +5762,7 @@ __pyx_t_6 = __pyx_memoryview_fromslice(__pyx_t_1, 1, (PyObject *(*)(char *)) __p
   __pyx_t_6 = 0;
   goto __pyx_L0;
 
-  /* "sisl/_sparse.pyx":153
+  /* "sisl/_sparse.pyx":155
  * @cython.initializedcheck(False)
  * @cython.cdivision(True)
  * def fold_csr_diagonal_nc(np.ndarray[np.int32_t, ndim=1, mode='c'] PTR,             # <<<<<<<<<<<<<<
@@ -5397,1336 +5815,9839 @@ __pyx_t_6 = __pyx_memoryview_fromslice(__pyx_t_1, 1, (PyObject *(*)(char *)) __p
   return __pyx_r;
 }
 
-/* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":258
- *         # experimental exception made for __getbuffer__ and __releasebuffer__
- *         # -- the details of this may change.
- *         def __getbuffer__(ndarray self, Py_buffer* info, int flags):             # <<<<<<<<<<<<<<
- *             # This implementation of getbuffer is geared towards Cython
- *             # requirements, and does not yet fulfill the PEP.
+/* "sisl/_sparse.pyx":221
+ * @cython.wraparound(False)
+ * @cython.initializedcheck(False)
+ * def sparse_merge(np.ndarray[np.int32_t, ndim=1, mode='c'] PTR1,             # <<<<<<<<<<<<<<
+ *                  np.ndarray[np.int32_t, ndim=1, mode='c'] NCOL1,
+ *                  np.ndarray[np.int32_t, ndim=1, mode='c'] COL1,
  */
 
 /* Python wrapper */
-static CYTHON_UNUSED int __pyx_pw_5numpy_7ndarray_1__getbuffer__(PyObject *__pyx_v_self, Py_buffer *__pyx_v_info, int __pyx_v_flags); /*proto*/
-static CYTHON_UNUSED int __pyx_pw_5numpy_7ndarray_1__getbuffer__(PyObject *__pyx_v_self, Py_buffer *__pyx_v_info, int __pyx_v_flags) {
-  int __pyx_r;
-  __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("__getbuffer__ (wrapper)", 0);
-  __pyx_r = __pyx_pf_5numpy_7ndarray___getbuffer__(((PyArrayObject *)__pyx_v_self), ((Py_buffer *)__pyx_v_info), ((int)__pyx_v_flags));
-
-  /* function exit code */
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, Py_buffer *__pyx_v_info, int __pyx_v_flags) {
-  int __pyx_v_i;
-  int __pyx_v_ndim;
-  int __pyx_v_endian_detector;
-  int __pyx_v_little_endian;
-  int __pyx_v_t;
-  char *__pyx_v_f;
-  PyArray_Descr *__pyx_v_descr = 0;
-  int __pyx_v_offset;
-  int __pyx_r;
+static PyObject *__pyx_pw_4sisl_7_sparse_7sparse_merge(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_4sisl_7_sparse_6sparse_merge[] = " Merge two sparsity patterns with sorted column indices per row into their union\n\n    Parameters\n    ----------\n    PTR1, NCOL1, COL1 : numpy.ndarray(np.int32)\n       the first sparsity pattern (columns sorted in each row)\n    PTR2, NCOL2, COL2 : numpy.ndarray(np.int32)\n       the second sparsity pattern (columns sorted in each row)\n\n    Returns\n    -------\n    ptr, ncol, col : the union sparsity pattern (columns sorted in each row)\n    idx1, idx2 : indices of the union elements in `COL1` and `COL2`, respectively (``-1`` if not present)\n    ";
+static PyMethodDef __pyx_mdef_4sisl_7_sparse_7sparse_merge = {"sparse_merge", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_4sisl_7_sparse_7sparse_merge, METH_VARARGS|METH_KEYWORDS, __pyx_doc_4sisl_7_sparse_6sparse_merge};
+static PyObject *__pyx_pw_4sisl_7_sparse_7sparse_merge(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyArrayObject *__pyx_v_PTR1 = 0;
+  PyArrayObject *__pyx_v_NCOL1 = 0;
+  PyArrayObject *__pyx_v_COL1 = 0;
+  PyArrayObject *__pyx_v_PTR2 = 0;
+  PyArrayObject *__pyx_v_NCOL2 = 0;
+  PyArrayObject *__pyx_v_COL2 = 0;
+  PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
-  int __pyx_t_1;
-  int __pyx_t_2;
-  PyObject *__pyx_t_3 = NULL;
-  int __pyx_t_4;
-  int __pyx_t_5;
-  int __pyx_t_6;
-  PyArray_Descr *__pyx_t_7;
-  PyObject *__pyx_t_8 = NULL;
-  char *__pyx_t_9;
-  if (__pyx_v_info == NULL) {
-    PyErr_SetString(PyExc_BufferError, "PyObject_GetBuffer: view==NULL argument is obsolete");
-    return -1;
-  }
-  __Pyx_RefNannySetupContext("__getbuffer__", 0);
-  __pyx_v_info->obj = Py_None; __Pyx_INCREF(Py_None);
-  __Pyx_GIVEREF(__pyx_v_info->obj);
+  __Pyx_RefNannySetupContext("sparse_merge (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_PTR1,&__pyx_n_s_NCOL1,&__pyx_n_s_COL1,&__pyx_n_s_PTR2,&__pyx_n_s_NCOL2,&__pyx_n_s_COL2,0};
+    PyObject* values[6] = {0,0,0,0,0,0};
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case  6: values[5] = PyTuple_GET_ITEM(__pyx_args, 5);
+        CYTHON_FALLTHROUGH;
+        case  5: values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
+        CYTHON_FALLTHROUGH;
+        case  4: values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+        CYTHON_FALLTHROUGH;
+        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        CYTHON_FALLTHROUGH;
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_PTR1)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_NCOL1)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("sparse_merge", 1, 6, 6, 1); __PYX_ERR(0, 221, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  2:
+        if (likely((values[2] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_COL1)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("sparse_merge", 1, 6, 6, 2); __PYX_ERR(0, 221, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  3:
+        if (likely((values[3] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_PTR2)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("sparse_merge", 1, 6, 6, 3); __PYX_ERR(0, 221, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  4:
+        if (likely((values[4] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_NCOL2)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("sparse_merge", 1, 6, 6, 4); __PYX_ERR(0, 221, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  5:
+        if (likely((values[5] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_COL2)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("sparse_merge", 1, 6, 6, 5); __PYX_ERR(0, 221, __pyx_L3_error)
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "sparse_merge") < 0)) __PYX_ERR(0, 221, __pyx_L3_error)
+      }
+    } else if (PyTuple_GET_SIZE(__pyx_args) != 6) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+      values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+      values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+      values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+      values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
+      values[5] = PyTuple_GET_ITEM(__pyx_args, 5);
+    }
+    __pyx_v_PTR1 = ((PyArrayObject *)values[0]);
+    __pyx_v_NCOL1 = ((PyArrayObject *)values[1]);
+    __pyx_v_COL1 = ((PyArrayObject *)values[2]);
+    __pyx_v_PTR2 = ((PyArrayObject *)values[3]);
+    __pyx_v_NCOL2 = ((PyArrayObject *)values[4]);
+    __pyx_v_COL2 = ((PyArrayObject *)values[5]);
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("sparse_merge", 1, 6, 6, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 221, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("sisl._sparse.sparse_merge", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_PTR1), __pyx_ptype_5numpy_ndarray, 1, "PTR1", 0))) __PYX_ERR(0, 221, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_NCOL1), __pyx_ptype_5numpy_ndarray, 1, "NCOL1", 0))) __PYX_ERR(0, 222, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_COL1), __pyx_ptype_5numpy_ndarray, 1, "COL1", 0))) __PYX_ERR(0, 223, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_PTR2), __pyx_ptype_5numpy_ndarray, 1, "PTR2", 0))) __PYX_ERR(0, 224, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_NCOL2), __pyx_ptype_5numpy_ndarray, 1, "NCOL2", 0))) __PYX_ERR(0, 225, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_COL2), __pyx_ptype_5numpy_ndarray, 1, "COL2", 0))) __PYX_ERR(0, 226, __pyx_L1_error)
+  __pyx_r = __pyx_pf_4sisl_7_sparse_6sparse_merge(__pyx_self, __pyx_v_PTR1, __pyx_v_NCOL1, __pyx_v_COL1, __pyx_v_PTR2, __pyx_v_NCOL2, __pyx_v_COL2);
 
-  /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":265
- * 
- *             cdef int i, ndim
- *             cdef int endian_detector = 1             # <<<<<<<<<<<<<<
- *             cdef bint little_endian = ((<char*>&endian_detector)[0] != 0)
- * 
- */
-  __pyx_v_endian_detector = 1;
+  /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
 
-  /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":266
- *             cdef int i, ndim
- *             cdef int endian_detector = 1
- *             cdef bint little_endian = ((<char*>&endian_detector)[0] != 0)             # <<<<<<<<<<<<<<
- * 
- *             ndim = PyArray_NDIM(self)
+static PyObject *__pyx_pf_4sisl_7_sparse_6sparse_merge(CYTHON_UNUSED PyObject *__pyx_self, PyArrayObject *__pyx_v_PTR1, PyArrayObject *__pyx_v_NCOL1, PyArrayObject *__pyx_v_COL1, PyArrayObject *__pyx_v_PTR2, PyArrayObject *__pyx_v_NCOL2, PyArrayObject *__pyx_v_COL2) {
+  __Pyx_memviewslice __pyx_v_ptr1 = { 0, 0, { 0 }, { 0 }, { 0 } };
+  __Pyx_memviewslice __pyx_v_ncol1 = { 0, 0, { 0 }, { 0 }, { 0 } };
+  __Pyx_memviewslice __pyx_v_col1 = { 0, 0, { 0 }, { 0 }, { 0 } };
+  __Pyx_memviewslice __pyx_v_ptr2 = { 0, 0, { 0 }, { 0 }, { 0 } };
+  __Pyx_memviewslice __pyx_v_ncol2 = { 0, 0, { 0 }, { 0 }, { 0 } };
+  __Pyx_memviewslice __pyx_v_col2 = { 0, 0, { 0 }, { 0 }, { 0 } };
+  int __pyx_v_nr;
+  PyArrayObject *__pyx_v_PTR = 0;
+  PyArrayObject *__pyx_v_NCOL = 0;
+  __Pyx_memviewslice __pyx_v_ptr = { 0, 0, { 0 }, { 0 }, { 0 } };
+  __Pyx_memviewslice __pyx_v_ncol = { 0, 0, { 0 }, { 0 }, { 0 } };
+  int __pyx_v_r;
+  int __pyx_v_i1;
+  int __pyx_v_i2;
+  int __pyx_v_e1;
+  int __pyx_v_e2;
+  int __pyx_v_n;
+  PyArrayObject *__pyx_v_COL = 0;
+  PyArrayObject *__pyx_v_IDX1 = 0;
+  PyArrayObject *__pyx_v_IDX2 = 0;
+  __Pyx_memviewslice __pyx_v_col = { 0, 0, { 0 }, { 0 }, { 0 } };
+  __Pyx_memviewslice __pyx_v_idx1 = { 0, 0, { 0 }, { 0 }, { 0 } };
+  __Pyx_memviewslice __pyx_v_idx2 = { 0, 0, { 0 }, { 0 }, { 0 } };
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_COL;
+  __Pyx_Buffer __pyx_pybuffer_COL;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_COL1;
+  __Pyx_Buffer __pyx_pybuffer_COL1;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_COL2;
+  __Pyx_Buffer __pyx_pybuffer_COL2;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_IDX1;
+  __Pyx_Buffer __pyx_pybuffer_IDX1;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_IDX2;
+  __Pyx_Buffer __pyx_pybuffer_IDX2;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_NCOL;
+  __Pyx_Buffer __pyx_pybuffer_NCOL;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_NCOL1;
+  __Pyx_Buffer __pyx_pybuffer_NCOL1;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_NCOL2;
+  __Pyx_Buffer __pyx_pybuffer_NCOL2;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_PTR;
+  __Pyx_Buffer __pyx_pybuffer_PTR;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_PTR1;
+  __Pyx_Buffer __pyx_pybuffer_PTR1;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_PTR2;
+  __Pyx_Buffer __pyx_pybuffer_PTR2;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  __Pyx_memviewslice __pyx_t_1 = { 0, 0, { 0 }, { 0 }, { 0 } };
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  PyObject *__pyx_t_6 = NULL;
+  PyArrayObject *__pyx_t_7 = NULL;
+  PyArrayObject *__pyx_t_8 = NULL;
+  int __pyx_t_9;
+  int __pyx_t_10;
+  int __pyx_t_11;
+  Py_ssize_t __pyx_t_12;
+  Py_ssize_t __pyx_t_13;
+  Py_ssize_t __pyx_t_14;
+  Py_ssize_t __pyx_t_15;
+  Py_ssize_t __pyx_t_16;
+  int __pyx_t_17;
+  int __pyx_t_18;
+  Py_ssize_t __pyx_t_19;
+  Py_ssize_t __pyx_t_20;
+  Py_ssize_t __pyx_t_21;
+  Py_ssize_t __pyx_t_22;
+  Py_ssize_t __pyx_t_23;
+  Py_ssize_t __pyx_t_24;
+  Py_ssize_t __pyx_t_25;
+  PyArrayObject *__pyx_t_26 = NULL;
+  PyArrayObject *__pyx_t_27 = NULL;
+  PyArrayObject *__pyx_t_28 = NULL;
+  __Pyx_RefNannySetupContext("sparse_merge", 0);
+  __pyx_pybuffer_PTR.pybuffer.buf = NULL;
+  __pyx_pybuffer_PTR.refcount = 0;
+  __pyx_pybuffernd_PTR.data = NULL;
+  __pyx_pybuffernd_PTR.rcbuffer = &__pyx_pybuffer_PTR;
+  __pyx_pybuffer_NCOL.pybuffer.buf = NULL;
+  __pyx_pybuffer_NCOL.refcount = 0;
+  __pyx_pybuffernd_NCOL.data = NULL;
+  __pyx_pybuffernd_NCOL.rcbuffer = &__pyx_pybuffer_NCOL;
+  __pyx_pybuffer_COL.pybuffer.buf = NULL;
+  __pyx_pybuffer_COL.refcount = 0;
+  __pyx_pybuffernd_COL.data = NULL;
+  __pyx_pybuffernd_COL.rcbuffer = &__pyx_pybuffer_COL;
+  __pyx_pybuffer_IDX1.pybuffer.buf = NULL;
+  __pyx_pybuffer_IDX1.refcount = 0;
+  __pyx_pybuffernd_IDX1.data = NULL;
+  __pyx_pybuffernd_IDX1.rcbuffer = &__pyx_pybuffer_IDX1;
+  __pyx_pybuffer_IDX2.pybuffer.buf = NULL;
+  __pyx_pybuffer_IDX2.refcount = 0;
+  __pyx_pybuffernd_IDX2.data = NULL;
+  __pyx_pybuffernd_IDX2.rcbuffer = &__pyx_pybuffer_IDX2;
+  __pyx_pybuffer_PTR1.pybuffer.buf = NULL;
+  __pyx_pybuffer_PTR1.refcount = 0;
+  __pyx_pybuffernd_PTR1.data = NULL;
+  __pyx_pybuffernd_PTR1.rcbuffer = &__pyx_pybuffer_PTR1;
+  __pyx_pybuffer_NCOL1.pybuffer.buf = NULL;
+  __pyx_pybuffer_NCOL1.refcount = 0;
+  __pyx_pybuffernd_NCOL1.data = NULL;
+  __pyx_pybuffernd_NCOL1.rcbuffer = &__pyx_pybuffer_NCOL1;
+  __pyx_pybuffer_COL1.pybuffer.buf = NULL;
+  __pyx_pybuffer_COL1.refcount = 0;
+  __pyx_pybuffernd_COL1.data = NULL;
+  __pyx_pybuffernd_COL1.rcbuffer = &__pyx_pybuffer_COL1;
+  __pyx_pybuffer_PTR2.pybuffer.buf = NULL;
+  __pyx_pybuffer_PTR2.refcount = 0;
+  __pyx_pybuffernd_PTR2.data = NULL;
+  __pyx_pybuffernd_PTR2.rcbuffer = &__pyx_pybuffer_PTR2;
+  __pyx_pybuffer_NCOL2.pybuffer.buf = NULL;
+  __pyx_pybuffer_NCOL2.refcount = 0;
+  __pyx_pybuffernd_NCOL2.data = NULL;
+  __pyx_pybuffernd_NCOL2.rcbuffer = &__pyx_pybuffer_NCOL2;
+  __pyx_pybuffer_COL2.pybuffer.buf = NULL;
+  __pyx_pybuffer_COL2.refcount = 0;
+  __pyx_pybuffernd_COL2.data = NULL;
+  __pyx_pybuffernd_COL2.rcbuffer = &__pyx_pybuffer_COL2;
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_PTR1.rcbuffer->pybuffer, (PyObject*)__pyx_v_PTR1, &__Pyx_TypeInfo_nn___pyx_t_5numpy_int32_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 221, __pyx_L1_error)
+  }
+  __pyx_pybuffernd_PTR1.diminfo[0].strides = __pyx_pybuffernd_PTR1.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_PTR1.diminfo[0].shape = __pyx_pybuffernd_PTR1.rcbuffer->pybuffer.shape[0];
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_NCOL1.rcbuffer->pybuffer, (PyObject*)__pyx_v_NCOL1, &__Pyx_TypeInfo_nn___pyx_t_5numpy_int32_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 221, __pyx_L1_error)
+  }
+  __pyx_pybuffernd_NCOL1.diminfo[0].strides = __pyx_pybuffernd_NCOL1.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_NCOL1.diminfo[0].shape = __pyx_pybuffernd_NCOL1.rcbuffer->pybuffer.shape[0];
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_COL1.rcbuffer->pybuffer, (PyObject*)__pyx_v_COL1, &__Pyx_TypeInfo_nn___pyx_t_5numpy_int32_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 221, __pyx_L1_error)
+  }
+  __pyx_pybuffernd_COL1.diminfo[0].strides = __pyx_pybuffernd_COL1.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_COL1.diminfo[0].shape = __pyx_pybuffernd_COL1.rcbuffer->pybuffer.shape[0];
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_PTR2.rcbuffer->pybuffer, (PyObject*)__pyx_v_PTR2, &__Pyx_TypeInfo_nn___pyx_t_5numpy_int32_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 221, __pyx_L1_error)
+  }
+  __pyx_pybuffernd_PTR2.diminfo[0].strides = __pyx_pybuffernd_PTR2.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_PTR2.diminfo[0].shape = __pyx_pybuffernd_PTR2.rcbuffer->pybuffer.shape[0];
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_NCOL2.rcbuffer->pybuffer, (PyObject*)__pyx_v_NCOL2, &__Pyx_TypeInfo_nn___pyx_t_5numpy_int32_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 221, __pyx_L1_error)
+  }
+  __pyx_pybuffernd_NCOL2.diminfo[0].strides = __pyx_pybuffernd_NCOL2.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_NCOL2.diminfo[0].shape = __pyx_pybuffernd_NCOL2.rcbuffer->pybuffer.shape[0];
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_COL2.rcbuffer->pybuffer, (PyObject*)__pyx_v_COL2, &__Pyx_TypeInfo_nn___pyx_t_5numpy_int32_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 221, __pyx_L1_error)
+  }
+  __pyx_pybuffernd_COL2.diminfo[0].strides = __pyx_pybuffernd_COL2.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_COL2.diminfo[0].shape = __pyx_pybuffernd_COL2.rcbuffer->pybuffer.shape[0];
+
+  /* "sisl/_sparse.pyx":241
+ *     idx1, idx2 : indices of the union elements in `COL1` and `COL2`, respectively (``-1`` if not present)
+ *     """
+ *     cdef int[::1] ptr1 = PTR1             # <<<<<<<<<<<<<<
+ *     cdef int[::1] ncol1 = NCOL1
+ *     cdef int[::1] col1 = COL1
  */
-  __pyx_v_little_endian = ((((char *)(&__pyx_v_endian_detector))[0]) != 0);
+  __pyx_t_1 = __Pyx_PyObject_to_MemoryviewSlice_dc_int(((PyObject *)__pyx_v_PTR1), PyBUF_WRITABLE); if (unlikely(!__pyx_t_1.memview)) __PYX_ERR(0, 241, __pyx_L1_error)
+  __pyx_v_ptr1 = __pyx_t_1;
+  __pyx_t_1.memview = NULL;
+  __pyx_t_1.data = NULL;
 
-  /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":268
- *             cdef bint little_endian = ((<char*>&endian_detector)[0] != 0)
- * 
- *             ndim = PyArray_NDIM(self)             # <<<<<<<<<<<<<<
- * 
- *             if ((flags & pybuf.PyBUF_C_CONTIGUOUS == pybuf.PyBUF_C_CONTIGUOUS)
+  /* "sisl/_sparse.pyx":242
+ *     """
+ *     cdef int[::1] ptr1 = PTR1
+ *     cdef int[::1] ncol1 = NCOL1             # <<<<<<<<<<<<<<
+ *     cdef int[::1] col1 = COL1
+ *     cdef int[::1] ptr2 = PTR2
  */
-  __pyx_v_ndim = PyArray_NDIM(__pyx_v_self);
+  __pyx_t_1 = __Pyx_PyObject_to_MemoryviewSlice_dc_int(((PyObject *)__pyx_v_NCOL1), PyBUF_WRITABLE); if (unlikely(!__pyx_t_1.memview)) __PYX_ERR(0, 242, __pyx_L1_error)
+  __pyx_v_ncol1 = __pyx_t_1;
+  __pyx_t_1.memview = NULL;
+  __pyx_t_1.data = NULL;
 
-  /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":270
- *             ndim = PyArray_NDIM(self)
- * 
- *             if ((flags & pybuf.PyBUF_C_CONTIGUOUS == pybuf.PyBUF_C_CONTIGUOUS)             # <<<<<<<<<<<<<<
- *                 and not PyArray_CHKFLAGS(self, NPY_ARRAY_C_CONTIGUOUS)):
- *                 raise ValueError(u"ndarray is not C contiguous")
+  /* "sisl/_sparse.pyx":243
+ *     cdef int[::1] ptr1 = PTR1
+ *     cdef int[::1] ncol1 = NCOL1
+ *     cdef int[::1] col1 = COL1             # <<<<<<<<<<<<<<
+ *     cdef int[::1] ptr2 = PTR2
+ *     cdef int[::1] ncol2 = NCOL2
  */
-  __pyx_t_2 = (((__pyx_v_flags & PyBUF_C_CONTIGUOUS) == PyBUF_C_CONTIGUOUS) != 0);
-  if (__pyx_t_2) {
-  } else {
-    __pyx_t_1 = __pyx_t_2;
-    goto __pyx_L4_bool_binop_done;
-  }
+  __pyx_t_1 = __Pyx_PyObject_to_MemoryviewSlice_dc_int(((PyObject *)__pyx_v_COL1), PyBUF_WRITABLE); if (unlikely(!__pyx_t_1.memview)) __PYX_ERR(0, 243, __pyx_L1_error)
+  __pyx_v_col1 = __pyx_t_1;
+  __pyx_t_1.memview = NULL;
+  __pyx_t_1.data = NULL;
 
-  /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":271
- * 
- *             if ((flags & pybuf.PyBUF_C_CONTIGUOUS == pybuf.PyBUF_C_CONTIGUOUS)
- *                 and not PyArray_CHKFLAGS(self, NPY_ARRAY_C_CONTIGUOUS)):             # <<<<<<<<<<<<<<
- *                 raise ValueError(u"ndarray is not C contiguous")
- * 
+  /* "sisl/_sparse.pyx":244
+ *     cdef int[::1] ncol1 = NCOL1
+ *     cdef int[::1] col1 = COL1
+ *     cdef int[::1] ptr2 = PTR2             # <<<<<<<<<<<<<<
+ *     cdef int[::1] ncol2 = NCOL2
+ *     cdef int[::1] col2 = COL2
  */
-  __pyx_t_2 = ((!(PyArray_CHKFLAGS(__pyx_v_self, NPY_ARRAY_C_CONTIGUOUS) != 0)) != 0);
-  __pyx_t_1 = __pyx_t_2;
-  __pyx_L4_bool_binop_done:;
+  __pyx_t_1 = __Pyx_PyObject_to_MemoryviewSlice_dc_int(((PyObject *)__pyx_v_PTR2), PyBUF_WRITABLE); if (unlikely(!__pyx_t_1.memview)) __PYX_ERR(0, 244, __pyx_L1_error)
+  __pyx_v_ptr2 = __pyx_t_1;
+  __pyx_t_1.memview = NULL;
+  __pyx_t_1.data = NULL;
 
-  /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":270
- *             ndim = PyArray_NDIM(self)
- * 
- *             if ((flags & pybuf.PyBUF_C_CONTIGUOUS == pybuf.PyBUF_C_CONTIGUOUS)             # <<<<<<<<<<<<<<
- *                 and not PyArray_CHKFLAGS(self, NPY_ARRAY_C_CONTIGUOUS)):
- *                 raise ValueError(u"ndarray is not C contiguous")
+  /* "sisl/_sparse.pyx":245
+ *     cdef int[::1] col1 = COL1
+ *     cdef int[::1] ptr2 = PTR2
+ *     cdef int[::1] ncol2 = NCOL2             # <<<<<<<<<<<<<<
+ *     cdef int[::1] col2 = COL2
+ *     cdef int nr = ncol1.shape[0]
  */
-  if (unlikely(__pyx_t_1)) {
+  __pyx_t_1 = __Pyx_PyObject_to_MemoryviewSlice_dc_int(((PyObject *)__pyx_v_NCOL2), PyBUF_WRITABLE); if (unlikely(!__pyx_t_1.memview)) __PYX_ERR(0, 245, __pyx_L1_error)
+  __pyx_v_ncol2 = __pyx_t_1;
+  __pyx_t_1.memview = NULL;
+  __pyx_t_1.data = NULL;
 
-    /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":272
- *             if ((flags & pybuf.PyBUF_C_CONTIGUOUS == pybuf.PyBUF_C_CONTIGUOUS)
- *                 and not PyArray_CHKFLAGS(self, NPY_ARRAY_C_CONTIGUOUS)):
- *                 raise ValueError(u"ndarray is not C contiguous")             # <<<<<<<<<<<<<<
+  /* "sisl/_sparse.pyx":246
+ *     cdef int[::1] ptr2 = PTR2
+ *     cdef int[::1] ncol2 = NCOL2
+ *     cdef int[::1] col2 = COL2             # <<<<<<<<<<<<<<
+ *     cdef int nr = ncol1.shape[0]
  * 
- *             if ((flags & pybuf.PyBUF_F_CONTIGUOUS == pybuf.PyBUF_F_CONTIGUOUS)
  */
-    __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__4, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 272, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_3);
-    __Pyx_Raise(__pyx_t_3, 0, 0, 0);
-    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    __PYX_ERR(1, 272, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyObject_to_MemoryviewSlice_dc_int(((PyObject *)__pyx_v_COL2), PyBUF_WRITABLE); if (unlikely(!__pyx_t_1.memview)) __PYX_ERR(0, 246, __pyx_L1_error)
+  __pyx_v_col2 = __pyx_t_1;
+  __pyx_t_1.memview = NULL;
+  __pyx_t_1.data = NULL;
 
-    /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":270
- *             ndim = PyArray_NDIM(self)
+  /* "sisl/_sparse.pyx":247
+ *     cdef int[::1] ncol2 = NCOL2
+ *     cdef int[::1] col2 = COL2
+ *     cdef int nr = ncol1.shape[0]             # <<<<<<<<<<<<<<
  * 
- *             if ((flags & pybuf.PyBUF_C_CONTIGUOUS == pybuf.PyBUF_C_CONTIGUOUS)             # <<<<<<<<<<<<<<
- *                 and not PyArray_CHKFLAGS(self, NPY_ARRAY_C_CONTIGUOUS)):
- *                 raise ValueError(u"ndarray is not C contiguous")
+ *     cdef np.ndarray[np.int32_t, ndim=1, mode='c'] PTR = np.empty([nr + 1], dtype=np.int32)
  */
-  }
+  __pyx_v_nr = (__pyx_v_ncol1.shape[0]);
 
-  /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":274
- *                 raise ValueError(u"ndarray is not C contiguous")
+  /* "sisl/_sparse.pyx":249
+ *     cdef int nr = ncol1.shape[0]
  * 
- *             if ((flags & pybuf.PyBUF_F_CONTIGUOUS == pybuf.PyBUF_F_CONTIGUOUS)             # <<<<<<<<<<<<<<
- *                 and not PyArray_CHKFLAGS(self, NPY_ARRAY_F_CONTIGUOUS)):
- *                 raise ValueError(u"ndarray is not Fortran contiguous")
+ *     cdef np.ndarray[np.int32_t, ndim=1, mode='c'] PTR = np.empty([nr + 1], dtype=np.int32)             # <<<<<<<<<<<<<<
+ *     cdef np.ndarray[np.int32_t, ndim=1, mode='c'] NCOL = np.empty([nr], dtype=np.int32)
+ *     cdef int[::1] ptr = PTR
  */
-  __pyx_t_2 = (((__pyx_v_flags & PyBUF_F_CONTIGUOUS) == PyBUF_F_CONTIGUOUS) != 0);
-  if (__pyx_t_2) {
-  } else {
-    __pyx_t_1 = __pyx_t_2;
-    goto __pyx_L7_bool_binop_done;
+  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_np); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 249, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_empty); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 249, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_2 = __Pyx_PyInt_From_long((__pyx_v_nr + 1)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 249, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_4 = PyList_New(1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 249, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_GIVEREF(__pyx_t_2);
+  PyList_SET_ITEM(__pyx_t_4, 0, __pyx_t_2);
+  __pyx_t_2 = 0;
+  __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 249, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_GIVEREF(__pyx_t_4);
+  PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_t_4);
+  __pyx_t_4 = 0;
+  __pyx_t_4 = __Pyx_PyDict_NewPresized(1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 249, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_GetModuleGlobalName(__pyx_t_5, __pyx_n_s_np); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 249, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_t_5, __pyx_n_s_int32); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 249, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  if (PyDict_SetItem(__pyx_t_4, __pyx_n_s_dtype, __pyx_t_6) < 0) __PYX_ERR(0, 249, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  __pyx_t_6 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_t_2, __pyx_t_4); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 249, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  if (!(likely(((__pyx_t_6) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_6, __pyx_ptype_5numpy_ndarray))))) __PYX_ERR(0, 249, __pyx_L1_error)
+  __pyx_t_7 = ((PyArrayObject *)__pyx_t_6);
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_PTR.rcbuffer->pybuffer, (PyObject*)__pyx_t_7, &__Pyx_TypeInfo_nn___pyx_t_5numpy_int32_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) {
+      __pyx_v_PTR = ((PyArrayObject *)Py_None); __Pyx_INCREF(Py_None); __pyx_pybuffernd_PTR.rcbuffer->pybuffer.buf = NULL;
+      __PYX_ERR(0, 249, __pyx_L1_error)
+    } else {__pyx_pybuffernd_PTR.diminfo[0].strides = __pyx_pybuffernd_PTR.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_PTR.diminfo[0].shape = __pyx_pybuffernd_PTR.rcbuffer->pybuffer.shape[0];
+    }
   }
+  __pyx_t_7 = 0;
+  __pyx_v_PTR = ((PyArrayObject *)__pyx_t_6);
+  __pyx_t_6 = 0;
 
-  /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":275
- * 
- *             if ((flags & pybuf.PyBUF_F_CONTIGUOUS == pybuf.PyBUF_F_CONTIGUOUS)
- *                 and not PyArray_CHKFLAGS(self, NPY_ARRAY_F_CONTIGUOUS)):             # <<<<<<<<<<<<<<
- *                 raise ValueError(u"ndarray is not Fortran contiguous")
+  /* "sisl/_sparse.pyx":250
  * 
+ *     cdef np.ndarray[np.int32_t, ndim=1, mode='c'] PTR = np.empty([nr + 1], dtype=np.int32)
+ *     cdef np.ndarray[np.int32_t, ndim=1, mode='c'] NCOL = np.empty([nr], dtype=np.int32)             # <<<<<<<<<<<<<<
+ *     cdef int[::1] ptr = PTR
+ *     cdef int[::1] ncol = NCOL
  */
-  __pyx_t_2 = ((!(PyArray_CHKFLAGS(__pyx_v_self, NPY_ARRAY_F_CONTIGUOUS) != 0)) != 0);
-  __pyx_t_1 = __pyx_t_2;
-  __pyx_L7_bool_binop_done:;
-
-  /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":274
- *                 raise ValueError(u"ndarray is not C contiguous")
- * 
- *             if ((flags & pybuf.PyBUF_F_CONTIGUOUS == pybuf.PyBUF_F_CONTIGUOUS)             # <<<<<<<<<<<<<<
- *                 and not PyArray_CHKFLAGS(self, NPY_ARRAY_F_CONTIGUOUS)):
- *                 raise ValueError(u"ndarray is not Fortran contiguous")
- */
-  if (unlikely(__pyx_t_1)) {
+  __Pyx_GetModuleGlobalName(__pyx_t_6, __pyx_n_s_np); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 250, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_t_6, __pyx_n_s_empty); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 250, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  __pyx_t_6 = __Pyx_PyInt_From_int(__pyx_v_nr); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 250, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __pyx_t_2 = PyList_New(1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 250, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_GIVEREF(__pyx_t_6);
+  PyList_SET_ITEM(__pyx_t_2, 0, __pyx_t_6);
+  __pyx_t_6 = 0;
+  __pyx_t_6 = PyTuple_New(1); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 250, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_GIVEREF(__pyx_t_2);
+  PyTuple_SET_ITEM(__pyx_t_6, 0, __pyx_t_2);
+  __pyx_t_2 = 0;
+  __pyx_t_2 = __Pyx_PyDict_NewPresized(1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 250, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_n_s_np); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 250, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_n_s_int32); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 250, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  if (PyDict_SetItem(__pyx_t_2, __pyx_n_s_dtype, __pyx_t_5) < 0) __PYX_ERR(0, 250, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __pyx_t_5 = __Pyx_PyObject_Call(__pyx_t_4, __pyx_t_6, __pyx_t_2); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 250, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  if (!(likely(((__pyx_t_5) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_5, __pyx_ptype_5numpy_ndarray))))) __PYX_ERR(0, 250, __pyx_L1_error)
+  __pyx_t_8 = ((PyArrayObject *)__pyx_t_5);
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_NCOL.rcbuffer->pybuffer, (PyObject*)__pyx_t_8, &__Pyx_TypeInfo_nn___pyx_t_5numpy_int32_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) {
+      __pyx_v_NCOL = ((PyArrayObject *)Py_None); __Pyx_INCREF(Py_None); __pyx_pybuffernd_NCOL.rcbuffer->pybuffer.buf = NULL;
+      __PYX_ERR(0, 250, __pyx_L1_error)
+    } else {__pyx_pybuffernd_NCOL.diminfo[0].strides = __pyx_pybuffernd_NCOL.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_NCOL.diminfo[0].shape = __pyx_pybuffernd_NCOL.rcbuffer->pybuffer.shape[0];
+    }
+  }
+  __pyx_t_8 = 0;
+  __pyx_v_NCOL = ((PyArrayObject *)__pyx_t_5);
+  __pyx_t_5 = 0;
 
-    /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":276
- *             if ((flags & pybuf.PyBUF_F_CONTIGUOUS == pybuf.PyBUF_F_CONTIGUOUS)
- *                 and not PyArray_CHKFLAGS(self, NPY_ARRAY_F_CONTIGUOUS)):
- *                 raise ValueError(u"ndarray is not Fortran contiguous")             # <<<<<<<<<<<<<<
+  /* "sisl/_sparse.pyx":251
+ *     cdef np.ndarray[np.int32_t, ndim=1, mode='c'] PTR = np.empty([nr + 1], dtype=np.int32)
+ *     cdef np.ndarray[np.int32_t, ndim=1, mode='c'] NCOL = np.empty([nr], dtype=np.int32)
+ *     cdef int[::1] ptr = PTR             # <<<<<<<<<<<<<<
+ *     cdef int[::1] ncol = NCOL
  * 
- *             info.buf = PyArray_DATA(self)
  */
-    __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__5, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 276, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_3);
-    __Pyx_Raise(__pyx_t_3, 0, 0, 0);
-    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    __PYX_ERR(1, 276, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyObject_to_MemoryviewSlice_dc_int(((PyObject *)__pyx_v_PTR), PyBUF_WRITABLE); if (unlikely(!__pyx_t_1.memview)) __PYX_ERR(0, 251, __pyx_L1_error)
+  __pyx_v_ptr = __pyx_t_1;
+  __pyx_t_1.memview = NULL;
+  __pyx_t_1.data = NULL;
 
-    /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":274
- *                 raise ValueError(u"ndarray is not C contiguous")
+  /* "sisl/_sparse.pyx":252
+ *     cdef np.ndarray[np.int32_t, ndim=1, mode='c'] NCOL = np.empty([nr], dtype=np.int32)
+ *     cdef int[::1] ptr = PTR
+ *     cdef int[::1] ncol = NCOL             # <<<<<<<<<<<<<<
  * 
- *             if ((flags & pybuf.PyBUF_F_CONTIGUOUS == pybuf.PyBUF_F_CONTIGUOUS)             # <<<<<<<<<<<<<<
- *                 and not PyArray_CHKFLAGS(self, NPY_ARRAY_F_CONTIGUOUS)):
- *                 raise ValueError(u"ndarray is not Fortran contiguous")
+ *     # Count the number of elements in the union
  */
-  }
+  __pyx_t_1 = __Pyx_PyObject_to_MemoryviewSlice_dc_int(((PyObject *)__pyx_v_NCOL), PyBUF_WRITABLE); if (unlikely(!__pyx_t_1.memview)) __PYX_ERR(0, 252, __pyx_L1_error)
+  __pyx_v_ncol = __pyx_t_1;
+  __pyx_t_1.memview = NULL;
+  __pyx_t_1.data = NULL;
 
-  /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":278
- *                 raise ValueError(u"ndarray is not Fortran contiguous")
- * 
- *             info.buf = PyArray_DATA(self)             # <<<<<<<<<<<<<<
- *             info.ndim = ndim
- *             if sizeof(npy_intp) != sizeof(Py_ssize_t):
+  /* "sisl/_sparse.pyx":256
+ *     # Count the number of elements in the union
+ *     cdef int r, i1, i2, e1, e2, n
+ *     n = 0             # <<<<<<<<<<<<<<
+ *     for r in range(nr):
+ *         i1 = ptr1[r]
  */
-  __pyx_v_info->buf = PyArray_DATA(__pyx_v_self);
+  __pyx_v_n = 0;
 
-  /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":279
- * 
- *             info.buf = PyArray_DATA(self)
- *             info.ndim = ndim             # <<<<<<<<<<<<<<
- *             if sizeof(npy_intp) != sizeof(Py_ssize_t):
- *                 # Allocate new buffer for strides and shape info.
+  /* "sisl/_sparse.pyx":257
+ *     cdef int r, i1, i2, e1, e2, n
+ *     n = 0
+ *     for r in range(nr):             # <<<<<<<<<<<<<<
+ *         i1 = ptr1[r]
+ *         e1 = i1 + ncol1[r]
  */
-  __pyx_v_info->ndim = __pyx_v_ndim;
+  __pyx_t_9 = __pyx_v_nr;
+  __pyx_t_10 = __pyx_t_9;
+  for (__pyx_t_11 = 0; __pyx_t_11 < __pyx_t_10; __pyx_t_11+=1) {
+    __pyx_v_r = __pyx_t_11;
 
-  /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":280
- *             info.buf = PyArray_DATA(self)
- *             info.ndim = ndim
- *             if sizeof(npy_intp) != sizeof(Py_ssize_t):             # <<<<<<<<<<<<<<
- *                 # Allocate new buffer for strides and shape info.
- *                 # This is allocated as one block, strides first.
+    /* "sisl/_sparse.pyx":258
+ *     n = 0
+ *     for r in range(nr):
+ *         i1 = ptr1[r]             # <<<<<<<<<<<<<<
+ *         e1 = i1 + ncol1[r]
+ *         i2 = ptr2[r]
  */
-  __pyx_t_1 = (((sizeof(npy_intp)) != (sizeof(Py_ssize_t))) != 0);
-  if (__pyx_t_1) {
+    __pyx_t_12 = __pyx_v_r;
+    __pyx_v_i1 = (*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_ptr1.data) + __pyx_t_12)) )));
 
-    /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":283
- *                 # Allocate new buffer for strides and shape info.
- *                 # This is allocated as one block, strides first.
- *                 info.strides = <Py_ssize_t*>PyObject_Malloc(sizeof(Py_ssize_t) * 2 * <size_t>ndim)             # <<<<<<<<<<<<<<
- *                 info.shape = info.strides + ndim
- *                 for i in range(ndim):
+    /* "sisl/_sparse.pyx":259
+ *     for r in range(nr):
+ *         i1 = ptr1[r]
+ *         e1 = i1 + ncol1[r]             # <<<<<<<<<<<<<<
+ *         i2 = ptr2[r]
+ *         e2 = i2 + ncol2[r]
  */
-    __pyx_v_info->strides = ((Py_ssize_t *)PyObject_Malloc((((sizeof(Py_ssize_t)) * 2) * ((size_t)__pyx_v_ndim))));
+    __pyx_t_13 = __pyx_v_r;
+    __pyx_v_e1 = (__pyx_v_i1 + (*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_ncol1.data) + __pyx_t_13)) ))));
 
-    /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":284
- *                 # This is allocated as one block, strides first.
- *                 info.strides = <Py_ssize_t*>PyObject_Malloc(sizeof(Py_ssize_t) * 2 * <size_t>ndim)
- *                 info.shape = info.strides + ndim             # <<<<<<<<<<<<<<
- *                 for i in range(ndim):
- *                     info.strides[i] = PyArray_STRIDES(self)[i]
+    /* "sisl/_sparse.pyx":260
+ *         i1 = ptr1[r]
+ *         e1 = i1 + ncol1[r]
+ *         i2 = ptr2[r]             # <<<<<<<<<<<<<<
+ *         e2 = i2 + ncol2[r]
+ *         ptr[r] = n
  */
-    __pyx_v_info->shape = (__pyx_v_info->strides + __pyx_v_ndim);
-
-    /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":285
- *                 info.strides = <Py_ssize_t*>PyObject_Malloc(sizeof(Py_ssize_t) * 2 * <size_t>ndim)
- *                 info.shape = info.strides + ndim
- *                 for i in range(ndim):             # <<<<<<<<<<<<<<
- *                     info.strides[i] = PyArray_STRIDES(self)[i]
- *                     info.shape[i] = PyArray_DIMS(self)[i]
+    __pyx_t_14 = __pyx_v_r;
+    __pyx_v_i2 = (*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_ptr2.data) + __pyx_t_14)) )));
+
+    /* "sisl/_sparse.pyx":261
+ *         e1 = i1 + ncol1[r]
+ *         i2 = ptr2[r]
+ *         e2 = i2 + ncol2[r]             # <<<<<<<<<<<<<<
+ *         ptr[r] = n
+ *         while i1 < e1 and i2 < e2:
+ */
+    __pyx_t_15 = __pyx_v_r;
+    __pyx_v_e2 = (__pyx_v_i2 + (*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_ncol2.data) + __pyx_t_15)) ))));
+
+    /* "sisl/_sparse.pyx":262
+ *         i2 = ptr2[r]
+ *         e2 = i2 + ncol2[r]
+ *         ptr[r] = n             # <<<<<<<<<<<<<<
+ *         while i1 < e1 and i2 < e2:
+ *             if col1[i1] < col2[i2]:
+ */
+    __pyx_t_16 = __pyx_v_r;
+    *((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_ptr.data) + __pyx_t_16)) )) = __pyx_v_n;
+
+    /* "sisl/_sparse.pyx":263
+ *         e2 = i2 + ncol2[r]
+ *         ptr[r] = n
+ *         while i1 < e1 and i2 < e2:             # <<<<<<<<<<<<<<
+ *             if col1[i1] < col2[i2]:
+ *                 i1 += 1
  */
-    __pyx_t_4 = __pyx_v_ndim;
-    __pyx_t_5 = __pyx_t_4;
-    for (__pyx_t_6 = 0; __pyx_t_6 < __pyx_t_5; __pyx_t_6+=1) {
-      __pyx_v_i = __pyx_t_6;
+    while (1) {
+      __pyx_t_18 = ((__pyx_v_i1 < __pyx_v_e1) != 0);
+      if (__pyx_t_18) {
+      } else {
+        __pyx_t_17 = __pyx_t_18;
+        goto __pyx_L7_bool_binop_done;
+      }
+      __pyx_t_18 = ((__pyx_v_i2 < __pyx_v_e2) != 0);
+      __pyx_t_17 = __pyx_t_18;
+      __pyx_L7_bool_binop_done:;
+      if (!__pyx_t_17) break;
+
+      /* "sisl/_sparse.pyx":264
+ *         ptr[r] = n
+ *         while i1 < e1 and i2 < e2:
+ *             if col1[i1] < col2[i2]:             # <<<<<<<<<<<<<<
+ *                 i1 += 1
+ *             elif col1[i1] > col2[i2]:
+ */
+      __pyx_t_19 = __pyx_v_i1;
+      __pyx_t_20 = __pyx_v_i2;
+      __pyx_t_17 = (((*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_col1.data) + __pyx_t_19)) ))) < (*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_col2.data) + __pyx_t_20)) )))) != 0);
+      if (__pyx_t_17) {
+
+        /* "sisl/_sparse.pyx":265
+ *         while i1 < e1 and i2 < e2:
+ *             if col1[i1] < col2[i2]:
+ *                 i1 += 1             # <<<<<<<<<<<<<<
+ *             elif col1[i1] > col2[i2]:
+ *                 i2 += 1
+ */
+        __pyx_v_i1 = (__pyx_v_i1 + 1);
+
+        /* "sisl/_sparse.pyx":264
+ *         ptr[r] = n
+ *         while i1 < e1 and i2 < e2:
+ *             if col1[i1] < col2[i2]:             # <<<<<<<<<<<<<<
+ *                 i1 += 1
+ *             elif col1[i1] > col2[i2]:
+ */
+        goto __pyx_L9;
+      }
 
-      /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":286
- *                 info.shape = info.strides + ndim
- *                 for i in range(ndim):
- *                     info.strides[i] = PyArray_STRIDES(self)[i]             # <<<<<<<<<<<<<<
- *                     info.shape[i] = PyArray_DIMS(self)[i]
+      /* "sisl/_sparse.pyx":266
+ *             if col1[i1] < col2[i2]:
+ *                 i1 += 1
+ *             elif col1[i1] > col2[i2]:             # <<<<<<<<<<<<<<
+ *                 i2 += 1
  *             else:
  */
-      (__pyx_v_info->strides[__pyx_v_i]) = (PyArray_STRIDES(__pyx_v_self)[__pyx_v_i]);
+      __pyx_t_21 = __pyx_v_i1;
+      __pyx_t_22 = __pyx_v_i2;
+      __pyx_t_17 = (((*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_col1.data) + __pyx_t_21)) ))) > (*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_col2.data) + __pyx_t_22)) )))) != 0);
+      if (__pyx_t_17) {
 
-      /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":287
- *                 for i in range(ndim):
- *                     info.strides[i] = PyArray_STRIDES(self)[i]
- *                     info.shape[i] = PyArray_DIMS(self)[i]             # <<<<<<<<<<<<<<
+        /* "sisl/_sparse.pyx":267
+ *                 i1 += 1
+ *             elif col1[i1] > col2[i2]:
+ *                 i2 += 1             # <<<<<<<<<<<<<<
  *             else:
- *                 info.strides = <Py_ssize_t*>PyArray_STRIDES(self)
+ *                 i1 += 1
  */
-      (__pyx_v_info->shape[__pyx_v_i]) = (PyArray_DIMS(__pyx_v_self)[__pyx_v_i]);
-    }
+        __pyx_v_i2 = (__pyx_v_i2 + 1);
 
-    /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":280
- *             info.buf = PyArray_DATA(self)
- *             info.ndim = ndim
- *             if sizeof(npy_intp) != sizeof(Py_ssize_t):             # <<<<<<<<<<<<<<
- *                 # Allocate new buffer for strides and shape info.
- *                 # This is allocated as one block, strides first.
+        /* "sisl/_sparse.pyx":266
+ *             if col1[i1] < col2[i2]:
+ *                 i1 += 1
+ *             elif col1[i1] > col2[i2]:             # <<<<<<<<<<<<<<
+ *                 i2 += 1
+ *             else:
  */
-    goto __pyx_L9;
-  }
+        goto __pyx_L9;
+      }
 
-  /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":289
- *                     info.shape[i] = PyArray_DIMS(self)[i]
+      /* "sisl/_sparse.pyx":269
+ *                 i2 += 1
  *             else:
- *                 info.strides = <Py_ssize_t*>PyArray_STRIDES(self)             # <<<<<<<<<<<<<<
- *                 info.shape = <Py_ssize_t*>PyArray_DIMS(self)
- *             info.suboffsets = NULL
+ *                 i1 += 1             # <<<<<<<<<<<<<<
+ *                 i2 += 1
+ *             n += 1
  */
-  /*else*/ {
-    __pyx_v_info->strides = ((Py_ssize_t *)PyArray_STRIDES(__pyx_v_self));
+      /*else*/ {
+        __pyx_v_i1 = (__pyx_v_i1 + 1);
 
-    /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":290
+        /* "sisl/_sparse.pyx":270
  *             else:
- *                 info.strides = <Py_ssize_t*>PyArray_STRIDES(self)
- *                 info.shape = <Py_ssize_t*>PyArray_DIMS(self)             # <<<<<<<<<<<<<<
- *             info.suboffsets = NULL
- *             info.itemsize = PyArray_ITEMSIZE(self)
+ *                 i1 += 1
+ *                 i2 += 1             # <<<<<<<<<<<<<<
+ *             n += 1
+ *         n += e1 - i1 + e2 - i2
  */
-    __pyx_v_info->shape = ((Py_ssize_t *)PyArray_DIMS(__pyx_v_self));
-  }
-  __pyx_L9:;
+        __pyx_v_i2 = (__pyx_v_i2 + 1);
+      }
+      __pyx_L9:;
 
-  /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":291
- *                 info.strides = <Py_ssize_t*>PyArray_STRIDES(self)
- *                 info.shape = <Py_ssize_t*>PyArray_DIMS(self)
- *             info.suboffsets = NULL             # <<<<<<<<<<<<<<
- *             info.itemsize = PyArray_ITEMSIZE(self)
- *             info.readonly = not PyArray_ISWRITEABLE(self)
+      /* "sisl/_sparse.pyx":271
+ *                 i1 += 1
+ *                 i2 += 1
+ *             n += 1             # <<<<<<<<<<<<<<
+ *         n += e1 - i1 + e2 - i2
+ *         ncol[r] = n - ptr[r]
  */
-  __pyx_v_info->suboffsets = NULL;
+      __pyx_v_n = (__pyx_v_n + 1);
+    }
 
-  /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":292
- *                 info.shape = <Py_ssize_t*>PyArray_DIMS(self)
- *             info.suboffsets = NULL
- *             info.itemsize = PyArray_ITEMSIZE(self)             # <<<<<<<<<<<<<<
- *             info.readonly = not PyArray_ISWRITEABLE(self)
- * 
+    /* "sisl/_sparse.pyx":272
+ *                 i2 += 1
+ *             n += 1
+ *         n += e1 - i1 + e2 - i2             # <<<<<<<<<<<<<<
+ *         ncol[r] = n - ptr[r]
+ *     ptr[nr] = n
  */
-  __pyx_v_info->itemsize = PyArray_ITEMSIZE(__pyx_v_self);
+    __pyx_v_n = (__pyx_v_n + (((__pyx_v_e1 - __pyx_v_i1) + __pyx_v_e2) - __pyx_v_i2));
 
-  /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":293
- *             info.suboffsets = NULL
- *             info.itemsize = PyArray_ITEMSIZE(self)
- *             info.readonly = not PyArray_ISWRITEABLE(self)             # <<<<<<<<<<<<<<
+    /* "sisl/_sparse.pyx":273
+ *             n += 1
+ *         n += e1 - i1 + e2 - i2
+ *         ncol[r] = n - ptr[r]             # <<<<<<<<<<<<<<
+ *     ptr[nr] = n
  * 
- *             cdef int t
  */
-  __pyx_v_info->readonly = (!(PyArray_ISWRITEABLE(__pyx_v_self) != 0));
+    __pyx_t_23 = __pyx_v_r;
+    __pyx_t_24 = __pyx_v_r;
+    *((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_ncol.data) + __pyx_t_24)) )) = (__pyx_v_n - (*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_ptr.data) + __pyx_t_23)) ))));
+  }
 
-  /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":296
+  /* "sisl/_sparse.pyx":274
+ *         n += e1 - i1 + e2 - i2
+ *         ncol[r] = n - ptr[r]
+ *     ptr[nr] = n             # <<<<<<<<<<<<<<
  * 
- *             cdef int t
- *             cdef char* f = NULL             # <<<<<<<<<<<<<<
- *             cdef dtype descr = <dtype>PyArray_DESCR(self)
- *             cdef int offset
+ *     cdef np.ndarray[np.int32_t, ndim=1, mode='c'] COL = np.empty([n], dtype=np.int32)
  */
-  __pyx_v_f = NULL;
+  __pyx_t_25 = __pyx_v_nr;
+  *((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_ptr.data) + __pyx_t_25)) )) = __pyx_v_n;
 
-  /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":297
- *             cdef int t
- *             cdef char* f = NULL
- *             cdef dtype descr = <dtype>PyArray_DESCR(self)             # <<<<<<<<<<<<<<
- *             cdef int offset
+  /* "sisl/_sparse.pyx":276
+ *     ptr[nr] = n
  * 
+ *     cdef np.ndarray[np.int32_t, ndim=1, mode='c'] COL = np.empty([n], dtype=np.int32)             # <<<<<<<<<<<<<<
+ *     cdef np.ndarray[np.int32_t, ndim=1, mode='c'] IDX1 = np.empty([n], dtype=np.int32)
+ *     cdef np.ndarray[np.int32_t, ndim=1, mode='c'] IDX2 = np.empty([n], dtype=np.int32)
  */
-  __pyx_t_7 = PyArray_DESCR(__pyx_v_self);
-  __pyx_t_3 = ((PyObject *)__pyx_t_7);
-  __Pyx_INCREF(__pyx_t_3);
-  __pyx_v_descr = ((PyArray_Descr *)__pyx_t_3);
+  __Pyx_GetModuleGlobalName(__pyx_t_5, __pyx_n_s_np); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 276, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_t_5, __pyx_n_s_empty); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 276, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __pyx_t_5 = __Pyx_PyInt_From_int(__pyx_v_n); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 276, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __pyx_t_6 = PyList_New(1); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 276, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_GIVEREF(__pyx_t_5);
+  PyList_SET_ITEM(__pyx_t_6, 0, __pyx_t_5);
+  __pyx_t_5 = 0;
+  __pyx_t_5 = PyTuple_New(1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 276, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_GIVEREF(__pyx_t_6);
+  PyTuple_SET_ITEM(__pyx_t_5, 0, __pyx_t_6);
+  __pyx_t_6 = 0;
+  __pyx_t_6 = __Pyx_PyDict_NewPresized(1); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 276, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_GetModuleGlobalName(__pyx_t_4, __pyx_n_s_np); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 276, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_4, __pyx_n_s_int32); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 276, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  if (PyDict_SetItem(__pyx_t_6, __pyx_n_s_dtype, __pyx_t_3) < 0) __PYX_ERR(0, 276, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_t_3 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_t_5, __pyx_t_6); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 276, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  if (!(likely(((__pyx_t_3) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_3, __pyx_ptype_5numpy_ndarray))))) __PYX_ERR(0, 276, __pyx_L1_error)
+  __pyx_t_26 = ((PyArrayObject *)__pyx_t_3);
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_COL.rcbuffer->pybuffer, (PyObject*)__pyx_t_26, &__Pyx_TypeInfo_nn___pyx_t_5numpy_int32_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) {
+      __pyx_v_COL = ((PyArrayObject *)Py_None); __Pyx_INCREF(Py_None); __pyx_pybuffernd_COL.rcbuffer->pybuffer.buf = NULL;
+      __PYX_ERR(0, 276, __pyx_L1_error)
+    } else {__pyx_pybuffernd_COL.diminfo[0].strides = __pyx_pybuffernd_COL.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_COL.diminfo[0].shape = __pyx_pybuffernd_COL.rcbuffer->pybuffer.shape[0];
+    }
+  }
+  __pyx_t_26 = 0;
+  __pyx_v_COL = ((PyArrayObject *)__pyx_t_3);
   __pyx_t_3 = 0;
 
-  /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":300
- *             cdef int offset
- * 
- *             info.obj = self             # <<<<<<<<<<<<<<
- * 
- *             if not PyDataType_HASFIELDS(descr):
- */
-  __Pyx_INCREF(((PyObject *)__pyx_v_self));
-  __Pyx_GIVEREF(((PyObject *)__pyx_v_self));
-  __Pyx_GOTREF(__pyx_v_info->obj);
-  __Pyx_DECREF(__pyx_v_info->obj);
-  __pyx_v_info->obj = ((PyObject *)__pyx_v_self);
-
-  /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":302
- *             info.obj = self
+  /* "sisl/_sparse.pyx":277
  * 
- *             if not PyDataType_HASFIELDS(descr):             # <<<<<<<<<<<<<<
- *                 t = descr.type_num
- *                 if ((descr.byteorder == c'>' and little_endian) or
+ *     cdef np.ndarray[np.int32_t, ndim=1, mode='c'] COL = np.empty([n], dtype=np.int32)
+ *     cdef np.ndarray[np.int32_t, ndim=1, mode='c'] IDX1 = np.empty([n], dtype=np.int32)             # <<<<<<<<<<<<<<
+ *     cdef np.ndarray[np.int32_t, ndim=1, mode='c'] IDX2 = np.empty([n], dtype=np.int32)
+ *     cdef int[::1] col = COL
  */
-  __pyx_t_1 = ((!(PyDataType_HASFIELDS(__pyx_v_descr) != 0)) != 0);
-  if (__pyx_t_1) {
+  __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_n_s_np); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 277, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_n_s_empty); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 277, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_t_3 = __Pyx_PyInt_From_int(__pyx_v_n); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 277, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_5 = PyList_New(1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 277, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_GIVEREF(__pyx_t_3);
+  PyList_SET_ITEM(__pyx_t_5, 0, __pyx_t_3);
+  __pyx_t_3 = 0;
+  __pyx_t_3 = PyTuple_New(1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 277, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_GIVEREF(__pyx_t_5);
+  PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_t_5);
+  __pyx_t_5 = 0;
+  __pyx_t_5 = __Pyx_PyDict_NewPresized(1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 277, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_np); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 277, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_int32); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 277, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  if (PyDict_SetItem(__pyx_t_5, __pyx_n_s_dtype, __pyx_t_4) < 0) __PYX_ERR(0, 277, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_t_4 = __Pyx_PyObject_Call(__pyx_t_6, __pyx_t_3, __pyx_t_5); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 277, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  if (!(likely(((__pyx_t_4) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_4, __pyx_ptype_5numpy_ndarray))))) __PYX_ERR(0, 277, __pyx_L1_error)
+  __pyx_t_27 = ((PyArrayObject *)__pyx_t_4);
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_IDX1.rcbuffer->pybuffer, (PyObject*)__pyx_t_27, &__Pyx_TypeInfo_nn___pyx_t_5numpy_int32_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) {
+      __pyx_v_IDX1 = ((PyArrayObject *)Py_None); __Pyx_INCREF(Py_None); __pyx_pybuffernd_IDX1.rcbuffer->pybuffer.buf = NULL;
+      __PYX_ERR(0, 277, __pyx_L1_error)
+    } else {__pyx_pybuffernd_IDX1.diminfo[0].strides = __pyx_pybuffernd_IDX1.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_IDX1.diminfo[0].shape = __pyx_pybuffernd_IDX1.rcbuffer->pybuffer.shape[0];
+    }
+  }
+  __pyx_t_27 = 0;
+  __pyx_v_IDX1 = ((PyArrayObject *)__pyx_t_4);
+  __pyx_t_4 = 0;
 
-    /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":303
- * 
- *             if not PyDataType_HASFIELDS(descr):
- *                 t = descr.type_num             # <<<<<<<<<<<<<<
- *                 if ((descr.byteorder == c'>' and little_endian) or
- *                     (descr.byteorder == c'<' and not little_endian)):
+  /* "sisl/_sparse.pyx":278
+ *     cdef np.ndarray[np.int32_t, ndim=1, mode='c'] COL = np.empty([n], dtype=np.int32)
+ *     cdef np.ndarray[np.int32_t, ndim=1, mode='c'] IDX1 = np.empty([n], dtype=np.int32)
+ *     cdef np.ndarray[np.int32_t, ndim=1, mode='c'] IDX2 = np.empty([n], dtype=np.int32)             # <<<<<<<<<<<<<<
+ *     cdef int[::1] col = COL
+ *     cdef int[::1] idx1 = IDX1
  */
-    __pyx_t_4 = __pyx_v_descr->type_num;
-    __pyx_v_t = __pyx_t_4;
-
-    /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":304
- *             if not PyDataType_HASFIELDS(descr):
- *                 t = descr.type_num
- *                 if ((descr.byteorder == c'>' and little_endian) or             # <<<<<<<<<<<<<<
- *                     (descr.byteorder == c'<' and not little_endian)):
- *                     raise ValueError(u"Non-native byte order not supported")
- */
-    __pyx_t_2 = ((__pyx_v_descr->byteorder == '>') != 0);
-    if (!__pyx_t_2) {
-      goto __pyx_L15_next_or;
-    } else {
-    }
-    __pyx_t_2 = (__pyx_v_little_endian != 0);
-    if (!__pyx_t_2) {
-    } else {
-      __pyx_t_1 = __pyx_t_2;
-      goto __pyx_L14_bool_binop_done;
+  __Pyx_GetModuleGlobalName(__pyx_t_4, __pyx_n_s_np); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 278, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_4, __pyx_n_s_empty); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 278, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_t_4 = __Pyx_PyInt_From_int(__pyx_v_n); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 278, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_3 = PyList_New(1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 278, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_GIVEREF(__pyx_t_4);
+  PyList_SET_ITEM(__pyx_t_3, 0, __pyx_t_4);
+  __pyx_t_4 = 0;
+  __pyx_t_4 = PyTuple_New(1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 278, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_GIVEREF(__pyx_t_3);
+  PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_t_3);
+  __pyx_t_3 = 0;
+  __pyx_t_3 = __Pyx_PyDict_NewPresized(1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 278, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_GetModuleGlobalName(__pyx_t_6, __pyx_n_s_np); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 278, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_t_6, __pyx_n_s_int32); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 278, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  if (PyDict_SetItem(__pyx_t_3, __pyx_n_s_dtype, __pyx_t_2) < 0) __PYX_ERR(0, 278, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_2 = __Pyx_PyObject_Call(__pyx_t_5, __pyx_t_4, __pyx_t_3); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 278, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  if (!(likely(((__pyx_t_2) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_2, __pyx_ptype_5numpy_ndarray))))) __PYX_ERR(0, 278, __pyx_L1_error)
+  __pyx_t_28 = ((PyArrayObject *)__pyx_t_2);
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_IDX2.rcbuffer->pybuffer, (PyObject*)__pyx_t_28, &__Pyx_TypeInfo_nn___pyx_t_5numpy_int32_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) {
+      __pyx_v_IDX2 = ((PyArrayObject *)Py_None); __Pyx_INCREF(Py_None); __pyx_pybuffernd_IDX2.rcbuffer->pybuffer.buf = NULL;
+      __PYX_ERR(0, 278, __pyx_L1_error)
+    } else {__pyx_pybuffernd_IDX2.diminfo[0].strides = __pyx_pybuffernd_IDX2.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_IDX2.diminfo[0].shape = __pyx_pybuffernd_IDX2.rcbuffer->pybuffer.shape[0];
     }
-    __pyx_L15_next_or:;
+  }
+  __pyx_t_28 = 0;
+  __pyx_v_IDX2 = ((PyArrayObject *)__pyx_t_2);
+  __pyx_t_2 = 0;
 
-    /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":305
- *                 t = descr.type_num
- *                 if ((descr.byteorder == c'>' and little_endian) or
- *                     (descr.byteorder == c'<' and not little_endian)):             # <<<<<<<<<<<<<<
- *                     raise ValueError(u"Non-native byte order not supported")
- *                 if   t == NPY_BYTE:        f = "b"
+  /* "sisl/_sparse.pyx":279
+ *     cdef np.ndarray[np.int32_t, ndim=1, mode='c'] IDX1 = np.empty([n], dtype=np.int32)
+ *     cdef np.ndarray[np.int32_t, ndim=1, mode='c'] IDX2 = np.empty([n], dtype=np.int32)
+ *     cdef int[::1] col = COL             # <<<<<<<<<<<<<<
+ *     cdef int[::1] idx1 = IDX1
+ *     cdef int[::1] idx2 = IDX2
  */
-    __pyx_t_2 = ((__pyx_v_descr->byteorder == '<') != 0);
-    if (__pyx_t_2) {
-    } else {
-      __pyx_t_1 = __pyx_t_2;
-      goto __pyx_L14_bool_binop_done;
-    }
-    __pyx_t_2 = ((!(__pyx_v_little_endian != 0)) != 0);
-    __pyx_t_1 = __pyx_t_2;
-    __pyx_L14_bool_binop_done:;
+  __pyx_t_1 = __Pyx_PyObject_to_MemoryviewSlice_dc_int(((PyObject *)__pyx_v_COL), PyBUF_WRITABLE); if (unlikely(!__pyx_t_1.memview)) __PYX_ERR(0, 279, __pyx_L1_error)
+  __pyx_v_col = __pyx_t_1;
+  __pyx_t_1.memview = NULL;
+  __pyx_t_1.data = NULL;
 
-    /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":304
- *             if not PyDataType_HASFIELDS(descr):
- *                 t = descr.type_num
- *                 if ((descr.byteorder == c'>' and little_endian) or             # <<<<<<<<<<<<<<
- *                     (descr.byteorder == c'<' and not little_endian)):
- *                     raise ValueError(u"Non-native byte order not supported")
+  /* "sisl/_sparse.pyx":280
+ *     cdef np.ndarray[np.int32_t, ndim=1, mode='c'] IDX2 = np.empty([n], dtype=np.int32)
+ *     cdef int[::1] col = COL
+ *     cdef int[::1] idx1 = IDX1             # <<<<<<<<<<<<<<
+ *     cdef int[::1] idx2 = IDX2
+ * 
  */
-    if (unlikely(__pyx_t_1)) {
+  __pyx_t_1 = __Pyx_PyObject_to_MemoryviewSlice_dc_int(((PyObject *)__pyx_v_IDX1), PyBUF_WRITABLE); if (unlikely(!__pyx_t_1.memview)) __PYX_ERR(0, 280, __pyx_L1_error)
+  __pyx_v_idx1 = __pyx_t_1;
+  __pyx_t_1.memview = NULL;
+  __pyx_t_1.data = NULL;
 
-      /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":306
- *                 if ((descr.byteorder == c'>' and little_endian) or
- *                     (descr.byteorder == c'<' and not little_endian)):
- *                     raise ValueError(u"Non-native byte order not supported")             # <<<<<<<<<<<<<<
- *                 if   t == NPY_BYTE:        f = "b"
- *                 elif t == NPY_UBYTE:       f = "B"
+  /* "sisl/_sparse.pyx":281
+ *     cdef int[::1] col = COL
+ *     cdef int[::1] idx1 = IDX1
+ *     cdef int[::1] idx2 = IDX2             # <<<<<<<<<<<<<<
+ * 
+ *     _sparse_merge(ptr1, ncol1, col1, ptr2, ncol2, col2, ptr, col, idx1, idx2)
  */
-      __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__6, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 306, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_3);
-      __Pyx_Raise(__pyx_t_3, 0, 0, 0);
-      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-      __PYX_ERR(1, 306, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyObject_to_MemoryviewSlice_dc_int(((PyObject *)__pyx_v_IDX2), PyBUF_WRITABLE); if (unlikely(!__pyx_t_1.memview)) __PYX_ERR(0, 281, __pyx_L1_error)
+  __pyx_v_idx2 = __pyx_t_1;
+  __pyx_t_1.memview = NULL;
+  __pyx_t_1.data = NULL;
 
-      /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":304
- *             if not PyDataType_HASFIELDS(descr):
- *                 t = descr.type_num
- *                 if ((descr.byteorder == c'>' and little_endian) or             # <<<<<<<<<<<<<<
- *                     (descr.byteorder == c'<' and not little_endian)):
- *                     raise ValueError(u"Non-native byte order not supported")
+  /* "sisl/_sparse.pyx":283
+ *     cdef int[::1] idx2 = IDX2
+ * 
+ *     _sparse_merge(ptr1, ncol1, col1, ptr2, ncol2, col2, ptr, col, idx1, idx2)             # <<<<<<<<<<<<<<
+ * 
+ *     return PTR, NCOL, COL, IDX1, IDX2
  */
-    }
+  __pyx_f_4sisl_7_sparse__sparse_merge(__pyx_v_ptr1, __pyx_v_ncol1, __pyx_v_col1, __pyx_v_ptr2, __pyx_v_ncol2, __pyx_v_col2, __pyx_v_ptr, __pyx_v_col, __pyx_v_idx1, __pyx_v_idx2);
 
-    /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":307
- *                     (descr.byteorder == c'<' and not little_endian)):
- *                     raise ValueError(u"Non-native byte order not supported")
- *                 if   t == NPY_BYTE:        f = "b"             # <<<<<<<<<<<<<<
- *                 elif t == NPY_UBYTE:       f = "B"
- *                 elif t == NPY_SHORT:       f = "h"
+  /* "sisl/_sparse.pyx":285
+ *     _sparse_merge(ptr1, ncol1, col1, ptr2, ncol2, col2, ptr, col, idx1, idx2)
+ * 
+ *     return PTR, NCOL, COL, IDX1, IDX2             # <<<<<<<<<<<<<<
+ * 
+ * 
  */
-    switch (__pyx_v_t) {
-      case NPY_BYTE:
-      __pyx_v_f = ((char *)"b");
-      break;
-      case NPY_UBYTE:
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_2 = PyTuple_New(5); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 285, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_INCREF(((PyObject *)__pyx_v_PTR));
+  __Pyx_GIVEREF(((PyObject *)__pyx_v_PTR));
+  PyTuple_SET_ITEM(__pyx_t_2, 0, ((PyObject *)__pyx_v_PTR));
+  __Pyx_INCREF(((PyObject *)__pyx_v_NCOL));
+  __Pyx_GIVEREF(((PyObject *)__pyx_v_NCOL));
+  PyTuple_SET_ITEM(__pyx_t_2, 1, ((PyObject *)__pyx_v_NCOL));
+  __Pyx_INCREF(((PyObject *)__pyx_v_COL));
+  __Pyx_GIVEREF(((PyObject *)__pyx_v_COL));
+  PyTuple_SET_ITEM(__pyx_t_2, 2, ((PyObject *)__pyx_v_COL));
+  __Pyx_INCREF(((PyObject *)__pyx_v_IDX1));
+  __Pyx_GIVEREF(((PyObject *)__pyx_v_IDX1));
+  PyTuple_SET_ITEM(__pyx_t_2, 3, ((PyObject *)__pyx_v_IDX1));
+  __Pyx_INCREF(((PyObject *)__pyx_v_IDX2));
+  __Pyx_GIVEREF(((PyObject *)__pyx_v_IDX2));
+  PyTuple_SET_ITEM(__pyx_t_2, 4, ((PyObject *)__pyx_v_IDX2));
+  __pyx_r = __pyx_t_2;
+  __pyx_t_2 = 0;
+  goto __pyx_L0;
 
-      /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":308
- *                     raise ValueError(u"Non-native byte order not supported")
- *                 if   t == NPY_BYTE:        f = "b"
- *                 elif t == NPY_UBYTE:       f = "B"             # <<<<<<<<<<<<<<
- *                 elif t == NPY_SHORT:       f = "h"
- *                 elif t == NPY_USHORT:      f = "H"
+  /* "sisl/_sparse.pyx":221
+ * @cython.wraparound(False)
+ * @cython.initializedcheck(False)
+ * def sparse_merge(np.ndarray[np.int32_t, ndim=1, mode='c'] PTR1,             # <<<<<<<<<<<<<<
+ *                  np.ndarray[np.int32_t, ndim=1, mode='c'] NCOL1,
+ *                  np.ndarray[np.int32_t, ndim=1, mode='c'] COL1,
  */
-      __pyx_v_f = ((char *)"B");
-      break;
-      case NPY_SHORT:
 
-      /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":309
- *                 if   t == NPY_BYTE:        f = "b"
- *                 elif t == NPY_UBYTE:       f = "B"
- *                 elif t == NPY_SHORT:       f = "h"             # <<<<<<<<<<<<<<
- *                 elif t == NPY_USHORT:      f = "H"
- *                 elif t == NPY_INT:         f = "i"
+  /* function exit code */
+  __pyx_L1_error:;
+  __PYX_XDEC_MEMVIEW(&__pyx_t_1, 1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_6);
+  { PyObject *__pyx_type, *__pyx_value, *__pyx_tb;
+    __Pyx_PyThreadState_declare
+    __Pyx_PyThreadState_assign
+    __Pyx_ErrFetch(&__pyx_type, &__pyx_value, &__pyx_tb);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_COL.rcbuffer->pybuffer);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_COL1.rcbuffer->pybuffer);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_COL2.rcbuffer->pybuffer);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_IDX1.rcbuffer->pybuffer);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_IDX2.rcbuffer->pybuffer);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_NCOL.rcbuffer->pybuffer);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_NCOL1.rcbuffer->pybuffer);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_NCOL2.rcbuffer->pybuffer);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_PTR.rcbuffer->pybuffer);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_PTR1.rcbuffer->pybuffer);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_PTR2.rcbuffer->pybuffer);
+  __Pyx_ErrRestore(__pyx_type, __pyx_value, __pyx_tb);}
+  __Pyx_AddTraceback("sisl._sparse.sparse_merge", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  goto __pyx_L2;
+  __pyx_L0:;
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_COL.rcbuffer->pybuffer);
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_COL1.rcbuffer->pybuffer);
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_COL2.rcbuffer->pybuffer);
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_IDX1.rcbuffer->pybuffer);
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_IDX2.rcbuffer->pybuffer);
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_NCOL.rcbuffer->pybuffer);
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_NCOL1.rcbuffer->pybuffer);
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_NCOL2.rcbuffer->pybuffer);
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_PTR.rcbuffer->pybuffer);
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_PTR1.rcbuffer->pybuffer);
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_PTR2.rcbuffer->pybuffer);
+  __pyx_L2:;
+  __PYX_XDEC_MEMVIEW(&__pyx_v_ptr1, 1);
+  __PYX_XDEC_MEMVIEW(&__pyx_v_ncol1, 1);
+  __PYX_XDEC_MEMVIEW(&__pyx_v_col1, 1);
+  __PYX_XDEC_MEMVIEW(&__pyx_v_ptr2, 1);
+  __PYX_XDEC_MEMVIEW(&__pyx_v_ncol2, 1);
+  __PYX_XDEC_MEMVIEW(&__pyx_v_col2, 1);
+  __Pyx_XDECREF((PyObject *)__pyx_v_PTR);
+  __Pyx_XDECREF((PyObject *)__pyx_v_NCOL);
+  __PYX_XDEC_MEMVIEW(&__pyx_v_ptr, 1);
+  __PYX_XDEC_MEMVIEW(&__pyx_v_ncol, 1);
+  __Pyx_XDECREF((PyObject *)__pyx_v_COL);
+  __Pyx_XDECREF((PyObject *)__pyx_v_IDX1);
+  __Pyx_XDECREF((PyObject *)__pyx_v_IDX2);
+  __PYX_XDEC_MEMVIEW(&__pyx_v_col, 1);
+  __PYX_XDEC_MEMVIEW(&__pyx_v_idx1, 1);
+  __PYX_XDEC_MEMVIEW(&__pyx_v_idx2, 1);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "sisl/_sparse.pyx":291
+ * @cython.wraparound(False)
+ * @cython.initializedcheck(False)
+ * cdef void _sparse_merge(const int[::1] ptr1, const int[::1] ncol1, const int[::1] col1,             # <<<<<<<<<<<<<<
+ *                         const int[::1] ptr2, const int[::1] ncol2, const int[::1] col2,
+ *                         const int[::1] ptr, int[::1] col, int[::1] idx1, int[::1] idx2) nogil:
  */
-      __pyx_v_f = ((char *)"h");
-      break;
-      case NPY_USHORT:
 
-      /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":310
- *                 elif t == NPY_UBYTE:       f = "B"
- *                 elif t == NPY_SHORT:       f = "h"
- *                 elif t == NPY_USHORT:      f = "H"             # <<<<<<<<<<<<<<
- *                 elif t == NPY_INT:         f = "i"
- *                 elif t == NPY_UINT:        f = "I"
+static void __pyx_f_4sisl_7_sparse__sparse_merge(__Pyx_memviewslice __pyx_v_ptr1, __Pyx_memviewslice __pyx_v_ncol1, __Pyx_memviewslice __pyx_v_col1, __Pyx_memviewslice __pyx_v_ptr2, __Pyx_memviewslice __pyx_v_ncol2, __Pyx_memviewslice __pyx_v_col2, __Pyx_memviewslice __pyx_v_ptr, __Pyx_memviewslice __pyx_v_col, __Pyx_memviewslice __pyx_v_idx1, __Pyx_memviewslice __pyx_v_idx2) {
+  int __pyx_v_nr;
+  int __pyx_v_r;
+  int __pyx_v_i1;
+  int __pyx_v_i2;
+  int __pyx_v_e1;
+  int __pyx_v_e2;
+  int __pyx_v_n;
+  int __pyx_t_1;
+  int __pyx_t_2;
+  int __pyx_t_3;
+  Py_ssize_t __pyx_t_4;
+  Py_ssize_t __pyx_t_5;
+  Py_ssize_t __pyx_t_6;
+  Py_ssize_t __pyx_t_7;
+  Py_ssize_t __pyx_t_8;
+  int __pyx_t_9;
+  int __pyx_t_10;
+  Py_ssize_t __pyx_t_11;
+  Py_ssize_t __pyx_t_12;
+  Py_ssize_t __pyx_t_13;
+  Py_ssize_t __pyx_t_14;
+  Py_ssize_t __pyx_t_15;
+  Py_ssize_t __pyx_t_16;
+  Py_ssize_t __pyx_t_17;
+  Py_ssize_t __pyx_t_18;
+  Py_ssize_t __pyx_t_19;
+  Py_ssize_t __pyx_t_20;
+  Py_ssize_t __pyx_t_21;
+  Py_ssize_t __pyx_t_22;
+  Py_ssize_t __pyx_t_23;
+  Py_ssize_t __pyx_t_24;
+  Py_ssize_t __pyx_t_25;
+  Py_ssize_t __pyx_t_26;
+  Py_ssize_t __pyx_t_27;
+  Py_ssize_t __pyx_t_28;
+  Py_ssize_t __pyx_t_29;
+  Py_ssize_t __pyx_t_30;
+  Py_ssize_t __pyx_t_31;
+  Py_ssize_t __pyx_t_32;
+  Py_ssize_t __pyx_t_33;
+  Py_ssize_t __pyx_t_34;
+
+  /* "sisl/_sparse.pyx":294
+ *                         const int[::1] ptr2, const int[::1] ncol2, const int[::1] col2,
+ *                         const int[::1] ptr, int[::1] col, int[::1] idx1, int[::1] idx2) nogil:
+ *     cdef int nr = ncol1.shape[0]             # <<<<<<<<<<<<<<
+ *     cdef int r, i1, i2, e1, e2, n
+ * 
  */
-      __pyx_v_f = ((char *)"H");
-      break;
-      case NPY_INT:
+  __pyx_v_nr = (__pyx_v_ncol1.shape[0]);
 
-      /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":311
- *                 elif t == NPY_SHORT:       f = "h"
- *                 elif t == NPY_USHORT:      f = "H"
- *                 elif t == NPY_INT:         f = "i"             # <<<<<<<<<<<<<<
- *                 elif t == NPY_UINT:        f = "I"
- *                 elif t == NPY_LONG:        f = "l"
+  /* "sisl/_sparse.pyx":297
+ *     cdef int r, i1, i2, e1, e2, n
+ * 
+ *     for r in range(nr):             # <<<<<<<<<<<<<<
+ *         i1 = ptr1[r]
+ *         e1 = i1 + ncol1[r]
  */
-      __pyx_v_f = ((char *)"i");
-      break;
-      case NPY_UINT:
+  __pyx_t_1 = __pyx_v_nr;
+  __pyx_t_2 = __pyx_t_1;
+  for (__pyx_t_3 = 0; __pyx_t_3 < __pyx_t_2; __pyx_t_3+=1) {
+    __pyx_v_r = __pyx_t_3;
 
-      /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":312
- *                 elif t == NPY_USHORT:      f = "H"
- *                 elif t == NPY_INT:         f = "i"
- *                 elif t == NPY_UINT:        f = "I"             # <<<<<<<<<<<<<<
- *                 elif t == NPY_LONG:        f = "l"
- *                 elif t == NPY_ULONG:       f = "L"
+    /* "sisl/_sparse.pyx":298
+ * 
+ *     for r in range(nr):
+ *         i1 = ptr1[r]             # <<<<<<<<<<<<<<
+ *         e1 = i1 + ncol1[r]
+ *         i2 = ptr2[r]
  */
-      __pyx_v_f = ((char *)"I");
-      break;
-      case NPY_LONG:
+    __pyx_t_4 = __pyx_v_r;
+    __pyx_v_i1 = (*((int const  *) ( /* dim=0 */ ((char *) (((int const  *) __pyx_v_ptr1.data) + __pyx_t_4)) )));
 
-      /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":313
- *                 elif t == NPY_INT:         f = "i"
- *                 elif t == NPY_UINT:        f = "I"
- *                 elif t == NPY_LONG:        f = "l"             # <<<<<<<<<<<<<<
- *                 elif t == NPY_ULONG:       f = "L"
- *                 elif t == NPY_LONGLONG:    f = "q"
+    /* "sisl/_sparse.pyx":299
+ *     for r in range(nr):
+ *         i1 = ptr1[r]
+ *         e1 = i1 + ncol1[r]             # <<<<<<<<<<<<<<
+ *         i2 = ptr2[r]
+ *         e2 = i2 + ncol2[r]
+ */
+    __pyx_t_5 = __pyx_v_r;
+    __pyx_v_e1 = (__pyx_v_i1 + (*((int const  *) ( /* dim=0 */ ((char *) (((int const  *) __pyx_v_ncol1.data) + __pyx_t_5)) ))));
+
+    /* "sisl/_sparse.pyx":300
+ *         i1 = ptr1[r]
+ *         e1 = i1 + ncol1[r]
+ *         i2 = ptr2[r]             # <<<<<<<<<<<<<<
+ *         e2 = i2 + ncol2[r]
+ *         n = ptr[r]
+ */
+    __pyx_t_6 = __pyx_v_r;
+    __pyx_v_i2 = (*((int const  *) ( /* dim=0 */ ((char *) (((int const  *) __pyx_v_ptr2.data) + __pyx_t_6)) )));
+
+    /* "sisl/_sparse.pyx":301
+ *         e1 = i1 + ncol1[r]
+ *         i2 = ptr2[r]
+ *         e2 = i2 + ncol2[r]             # <<<<<<<<<<<<<<
+ *         n = ptr[r]
+ *         while i1 < e1 and i2 < e2:
+ */
+    __pyx_t_7 = __pyx_v_r;
+    __pyx_v_e2 = (__pyx_v_i2 + (*((int const  *) ( /* dim=0 */ ((char *) (((int const  *) __pyx_v_ncol2.data) + __pyx_t_7)) ))));
+
+    /* "sisl/_sparse.pyx":302
+ *         i2 = ptr2[r]
+ *         e2 = i2 + ncol2[r]
+ *         n = ptr[r]             # <<<<<<<<<<<<<<
+ *         while i1 < e1 and i2 < e2:
+ *             if col1[i1] < col2[i2]:
+ */
+    __pyx_t_8 = __pyx_v_r;
+    __pyx_v_n = (*((int const  *) ( /* dim=0 */ ((char *) (((int const  *) __pyx_v_ptr.data) + __pyx_t_8)) )));
+
+    /* "sisl/_sparse.pyx":303
+ *         e2 = i2 + ncol2[r]
+ *         n = ptr[r]
+ *         while i1 < e1 and i2 < e2:             # <<<<<<<<<<<<<<
+ *             if col1[i1] < col2[i2]:
+ *                 col[n] = col1[i1]
  */
-      __pyx_v_f = ((char *)"l");
-      break;
-      case NPY_ULONG:
+    while (1) {
+      __pyx_t_10 = ((__pyx_v_i1 < __pyx_v_e1) != 0);
+      if (__pyx_t_10) {
+      } else {
+        __pyx_t_9 = __pyx_t_10;
+        goto __pyx_L7_bool_binop_done;
+      }
+      __pyx_t_10 = ((__pyx_v_i2 < __pyx_v_e2) != 0);
+      __pyx_t_9 = __pyx_t_10;
+      __pyx_L7_bool_binop_done:;
+      if (!__pyx_t_9) break;
+
+      /* "sisl/_sparse.pyx":304
+ *         n = ptr[r]
+ *         while i1 < e1 and i2 < e2:
+ *             if col1[i1] < col2[i2]:             # <<<<<<<<<<<<<<
+ *                 col[n] = col1[i1]
+ *                 idx1[n] = i1
+ */
+      __pyx_t_11 = __pyx_v_i1;
+      __pyx_t_12 = __pyx_v_i2;
+      __pyx_t_9 = (((*((int const  *) ( /* dim=0 */ ((char *) (((int const  *) __pyx_v_col1.data) + __pyx_t_11)) ))) < (*((int const  *) ( /* dim=0 */ ((char *) (((int const  *) __pyx_v_col2.data) + __pyx_t_12)) )))) != 0);
+      if (__pyx_t_9) {
 
-      /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":314
- *                 elif t == NPY_UINT:        f = "I"
- *                 elif t == NPY_LONG:        f = "l"
- *                 elif t == NPY_ULONG:       f = "L"             # <<<<<<<<<<<<<<
- *                 elif t == NPY_LONGLONG:    f = "q"
- *                 elif t == NPY_ULONGLONG:   f = "Q"
+        /* "sisl/_sparse.pyx":305
+ *         while i1 < e1 and i2 < e2:
+ *             if col1[i1] < col2[i2]:
+ *                 col[n] = col1[i1]             # <<<<<<<<<<<<<<
+ *                 idx1[n] = i1
+ *                 idx2[n] = -1
+ */
+        __pyx_t_13 = __pyx_v_i1;
+        __pyx_t_14 = __pyx_v_n;
+        *((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_col.data) + __pyx_t_14)) )) = (*((int const  *) ( /* dim=0 */ ((char *) (((int const  *) __pyx_v_col1.data) + __pyx_t_13)) )));
+
+        /* "sisl/_sparse.pyx":306
+ *             if col1[i1] < col2[i2]:
+ *                 col[n] = col1[i1]
+ *                 idx1[n] = i1             # <<<<<<<<<<<<<<
+ *                 idx2[n] = -1
+ *                 i1 += 1
+ */
+        __pyx_t_15 = __pyx_v_n;
+        *((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_idx1.data) + __pyx_t_15)) )) = __pyx_v_i1;
+
+        /* "sisl/_sparse.pyx":307
+ *                 col[n] = col1[i1]
+ *                 idx1[n] = i1
+ *                 idx2[n] = -1             # <<<<<<<<<<<<<<
+ *                 i1 += 1
+ *             elif col1[i1] > col2[i2]:
+ */
+        __pyx_t_16 = __pyx_v_n;
+        *((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_idx2.data) + __pyx_t_16)) )) = -1;
+
+        /* "sisl/_sparse.pyx":308
+ *                 idx1[n] = i1
+ *                 idx2[n] = -1
+ *                 i1 += 1             # <<<<<<<<<<<<<<
+ *             elif col1[i1] > col2[i2]:
+ *                 col[n] = col2[i2]
+ */
+        __pyx_v_i1 = (__pyx_v_i1 + 1);
+
+        /* "sisl/_sparse.pyx":304
+ *         n = ptr[r]
+ *         while i1 < e1 and i2 < e2:
+ *             if col1[i1] < col2[i2]:             # <<<<<<<<<<<<<<
+ *                 col[n] = col1[i1]
+ *                 idx1[n] = i1
+ */
+        goto __pyx_L9;
+      }
+
+      /* "sisl/_sparse.pyx":309
+ *                 idx2[n] = -1
+ *                 i1 += 1
+ *             elif col1[i1] > col2[i2]:             # <<<<<<<<<<<<<<
+ *                 col[n] = col2[i2]
+ *                 idx1[n] = -1
  */
-      __pyx_v_f = ((char *)"L");
-      break;
-      case NPY_LONGLONG:
+      __pyx_t_17 = __pyx_v_i1;
+      __pyx_t_18 = __pyx_v_i2;
+      __pyx_t_9 = (((*((int const  *) ( /* dim=0 */ ((char *) (((int const  *) __pyx_v_col1.data) + __pyx_t_17)) ))) > (*((int const  *) ( /* dim=0 */ ((char *) (((int const  *) __pyx_v_col2.data) + __pyx_t_18)) )))) != 0);
+      if (__pyx_t_9) {
 
-      /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":315
- *                 elif t == NPY_LONG:        f = "l"
- *                 elif t == NPY_ULONG:       f = "L"
- *                 elif t == NPY_LONGLONG:    f = "q"             # <<<<<<<<<<<<<<
- *                 elif t == NPY_ULONGLONG:   f = "Q"
- *                 elif t == NPY_FLOAT:       f = "f"
+        /* "sisl/_sparse.pyx":310
+ *                 i1 += 1
+ *             elif col1[i1] > col2[i2]:
+ *                 col[n] = col2[i2]             # <<<<<<<<<<<<<<
+ *                 idx1[n] = -1
+ *                 idx2[n] = i2
+ */
+        __pyx_t_19 = __pyx_v_i2;
+        __pyx_t_20 = __pyx_v_n;
+        *((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_col.data) + __pyx_t_20)) )) = (*((int const  *) ( /* dim=0 */ ((char *) (((int const  *) __pyx_v_col2.data) + __pyx_t_19)) )));
+
+        /* "sisl/_sparse.pyx":311
+ *             elif col1[i1] > col2[i2]:
+ *                 col[n] = col2[i2]
+ *                 idx1[n] = -1             # <<<<<<<<<<<<<<
+ *                 idx2[n] = i2
+ *                 i2 += 1
+ */
+        __pyx_t_21 = __pyx_v_n;
+        *((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_idx1.data) + __pyx_t_21)) )) = -1;
+
+        /* "sisl/_sparse.pyx":312
+ *                 col[n] = col2[i2]
+ *                 idx1[n] = -1
+ *                 idx2[n] = i2             # <<<<<<<<<<<<<<
+ *                 i2 += 1
+ *             else:
  */
-      __pyx_v_f = ((char *)"q");
-      break;
-      case NPY_ULONGLONG:
+        __pyx_t_22 = __pyx_v_n;
+        *((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_idx2.data) + __pyx_t_22)) )) = __pyx_v_i2;
 
-      /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":316
- *                 elif t == NPY_ULONG:       f = "L"
- *                 elif t == NPY_LONGLONG:    f = "q"
- *                 elif t == NPY_ULONGLONG:   f = "Q"             # <<<<<<<<<<<<<<
- *                 elif t == NPY_FLOAT:       f = "f"
- *                 elif t == NPY_DOUBLE:      f = "d"
+        /* "sisl/_sparse.pyx":313
+ *                 idx1[n] = -1
+ *                 idx2[n] = i2
+ *                 i2 += 1             # <<<<<<<<<<<<<<
+ *             else:
+ *                 col[n] = col1[i1]
  */
-      __pyx_v_f = ((char *)"Q");
-      break;
-      case NPY_FLOAT:
+        __pyx_v_i2 = (__pyx_v_i2 + 1);
 
-      /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":317
- *                 elif t == NPY_LONGLONG:    f = "q"
- *                 elif t == NPY_ULONGLONG:   f = "Q"
- *                 elif t == NPY_FLOAT:       f = "f"             # <<<<<<<<<<<<<<
- *                 elif t == NPY_DOUBLE:      f = "d"
- *                 elif t == NPY_LONGDOUBLE:  f = "g"
+        /* "sisl/_sparse.pyx":309
+ *                 idx2[n] = -1
+ *                 i1 += 1
+ *             elif col1[i1] > col2[i2]:             # <<<<<<<<<<<<<<
+ *                 col[n] = col2[i2]
+ *                 idx1[n] = -1
  */
-      __pyx_v_f = ((char *)"f");
-      break;
-      case NPY_DOUBLE:
+        goto __pyx_L9;
+      }
 
-      /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":318
- *                 elif t == NPY_ULONGLONG:   f = "Q"
- *                 elif t == NPY_FLOAT:       f = "f"
- *                 elif t == NPY_DOUBLE:      f = "d"             # <<<<<<<<<<<<<<
- *                 elif t == NPY_LONGDOUBLE:  f = "g"
- *                 elif t == NPY_CFLOAT:      f = "Zf"
+      /* "sisl/_sparse.pyx":315
+ *                 i2 += 1
+ *             else:
+ *                 col[n] = col1[i1]             # <<<<<<<<<<<<<<
+ *                 idx1[n] = i1
+ *                 idx2[n] = i2
  */
-      __pyx_v_f = ((char *)"d");
-      break;
-      case NPY_LONGDOUBLE:
+      /*else*/ {
+        __pyx_t_23 = __pyx_v_i1;
+        __pyx_t_24 = __pyx_v_n;
+        *((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_col.data) + __pyx_t_24)) )) = (*((int const  *) ( /* dim=0 */ ((char *) (((int const  *) __pyx_v_col1.data) + __pyx_t_23)) )));
 
-      /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":319
- *                 elif t == NPY_FLOAT:       f = "f"
- *                 elif t == NPY_DOUBLE:      f = "d"
- *                 elif t == NPY_LONGDOUBLE:  f = "g"             # <<<<<<<<<<<<<<
- *                 elif t == NPY_CFLOAT:      f = "Zf"
- *                 elif t == NPY_CDOUBLE:     f = "Zd"
- */
-      __pyx_v_f = ((char *)"g");
-      break;
-      case NPY_CFLOAT:
+        /* "sisl/_sparse.pyx":316
+ *             else:
+ *                 col[n] = col1[i1]
+ *                 idx1[n] = i1             # <<<<<<<<<<<<<<
+ *                 idx2[n] = i2
+ *                 i1 += 1
+ */
+        __pyx_t_25 = __pyx_v_n;
+        *((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_idx1.data) + __pyx_t_25)) )) = __pyx_v_i1;
+
+        /* "sisl/_sparse.pyx":317
+ *                 col[n] = col1[i1]
+ *                 idx1[n] = i1
+ *                 idx2[n] = i2             # <<<<<<<<<<<<<<
+ *                 i1 += 1
+ *                 i2 += 1
+ */
+        __pyx_t_26 = __pyx_v_n;
+        *((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_idx2.data) + __pyx_t_26)) )) = __pyx_v_i2;
+
+        /* "sisl/_sparse.pyx":318
+ *                 idx1[n] = i1
+ *                 idx2[n] = i2
+ *                 i1 += 1             # <<<<<<<<<<<<<<
+ *                 i2 += 1
+ *             n += 1
+ */
+        __pyx_v_i1 = (__pyx_v_i1 + 1);
+
+        /* "sisl/_sparse.pyx":319
+ *                 idx2[n] = i2
+ *                 i1 += 1
+ *                 i2 += 1             # <<<<<<<<<<<<<<
+ *             n += 1
+ *         while i1 < e1:
+ */
+        __pyx_v_i2 = (__pyx_v_i2 + 1);
+      }
+      __pyx_L9:;
 
-      /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":320
- *                 elif t == NPY_DOUBLE:      f = "d"
- *                 elif t == NPY_LONGDOUBLE:  f = "g"
- *                 elif t == NPY_CFLOAT:      f = "Zf"             # <<<<<<<<<<<<<<
- *                 elif t == NPY_CDOUBLE:     f = "Zd"
- *                 elif t == NPY_CLONGDOUBLE: f = "Zg"
+      /* "sisl/_sparse.pyx":320
+ *                 i1 += 1
+ *                 i2 += 1
+ *             n += 1             # <<<<<<<<<<<<<<
+ *         while i1 < e1:
+ *             col[n] = col1[i1]
  */
-      __pyx_v_f = ((char *)"Zf");
-      break;
-      case NPY_CDOUBLE:
+      __pyx_v_n = (__pyx_v_n + 1);
+    }
 
-      /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":321
- *                 elif t == NPY_LONGDOUBLE:  f = "g"
- *                 elif t == NPY_CFLOAT:      f = "Zf"
- *                 elif t == NPY_CDOUBLE:     f = "Zd"             # <<<<<<<<<<<<<<
- *                 elif t == NPY_CLONGDOUBLE: f = "Zg"
- *                 elif t == NPY_OBJECT:      f = "O"
+    /* "sisl/_sparse.pyx":321
+ *                 i2 += 1
+ *             n += 1
+ *         while i1 < e1:             # <<<<<<<<<<<<<<
+ *             col[n] = col1[i1]
+ *             idx1[n] = i1
  */
-      __pyx_v_f = ((char *)"Zd");
-      break;
-      case NPY_CLONGDOUBLE:
-
-      /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":322
- *                 elif t == NPY_CFLOAT:      f = "Zf"
- *                 elif t == NPY_CDOUBLE:     f = "Zd"
- *                 elif t == NPY_CLONGDOUBLE: f = "Zg"             # <<<<<<<<<<<<<<
- *                 elif t == NPY_OBJECT:      f = "O"
- *                 else:
+    while (1) {
+      __pyx_t_9 = ((__pyx_v_i1 < __pyx_v_e1) != 0);
+      if (!__pyx_t_9) break;
+
+      /* "sisl/_sparse.pyx":322
+ *             n += 1
+ *         while i1 < e1:
+ *             col[n] = col1[i1]             # <<<<<<<<<<<<<<
+ *             idx1[n] = i1
+ *             idx2[n] = -1
+ */
+      __pyx_t_27 = __pyx_v_i1;
+      __pyx_t_28 = __pyx_v_n;
+      *((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_col.data) + __pyx_t_28)) )) = (*((int const  *) ( /* dim=0 */ ((char *) (((int const  *) __pyx_v_col1.data) + __pyx_t_27)) )));
+
+      /* "sisl/_sparse.pyx":323
+ *         while i1 < e1:
+ *             col[n] = col1[i1]
+ *             idx1[n] = i1             # <<<<<<<<<<<<<<
+ *             idx2[n] = -1
+ *             i1 += 1
+ */
+      __pyx_t_29 = __pyx_v_n;
+      *((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_idx1.data) + __pyx_t_29)) )) = __pyx_v_i1;
+
+      /* "sisl/_sparse.pyx":324
+ *             col[n] = col1[i1]
+ *             idx1[n] = i1
+ *             idx2[n] = -1             # <<<<<<<<<<<<<<
+ *             i1 += 1
+ *             n += 1
+ */
+      __pyx_t_30 = __pyx_v_n;
+      *((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_idx2.data) + __pyx_t_30)) )) = -1;
+
+      /* "sisl/_sparse.pyx":325
+ *             idx1[n] = i1
+ *             idx2[n] = -1
+ *             i1 += 1             # <<<<<<<<<<<<<<
+ *             n += 1
+ *         while i2 < e2:
+ */
+      __pyx_v_i1 = (__pyx_v_i1 + 1);
+
+      /* "sisl/_sparse.pyx":326
+ *             idx2[n] = -1
+ *             i1 += 1
+ *             n += 1             # <<<<<<<<<<<<<<
+ *         while i2 < e2:
+ *             col[n] = col2[i2]
+ */
+      __pyx_v_n = (__pyx_v_n + 1);
+    }
+
+    /* "sisl/_sparse.pyx":327
+ *             i1 += 1
+ *             n += 1
+ *         while i2 < e2:             # <<<<<<<<<<<<<<
+ *             col[n] = col2[i2]
+ *             idx1[n] = -1
  */
-      __pyx_v_f = ((char *)"Zg");
-      break;
-      case NPY_OBJECT:
+    while (1) {
+      __pyx_t_9 = ((__pyx_v_i2 < __pyx_v_e2) != 0);
+      if (!__pyx_t_9) break;
 
-      /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":323
- *                 elif t == NPY_CDOUBLE:     f = "Zd"
- *                 elif t == NPY_CLONGDOUBLE: f = "Zg"
- *                 elif t == NPY_OBJECT:      f = "O"             # <<<<<<<<<<<<<<
- *                 else:
- *                     raise ValueError(u"unknown dtype code in numpy.pxd (%d)" % t)
+      /* "sisl/_sparse.pyx":328
+ *             n += 1
+ *         while i2 < e2:
+ *             col[n] = col2[i2]             # <<<<<<<<<<<<<<
+ *             idx1[n] = -1
+ *             idx2[n] = i2
  */
-      __pyx_v_f = ((char *)"O");
-      break;
-      default:
+      __pyx_t_31 = __pyx_v_i2;
+      __pyx_t_32 = __pyx_v_n;
+      *((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_col.data) + __pyx_t_32)) )) = (*((int const  *) ( /* dim=0 */ ((char *) (((int const  *) __pyx_v_col2.data) + __pyx_t_31)) )));
 
-      /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":325
- *                 elif t == NPY_OBJECT:      f = "O"
- *                 else:
- *                     raise ValueError(u"unknown dtype code in numpy.pxd (%d)" % t)             # <<<<<<<<<<<<<<
- *                 info.format = f
- *                 return
+      /* "sisl/_sparse.pyx":329
+ *         while i2 < e2:
+ *             col[n] = col2[i2]
+ *             idx1[n] = -1             # <<<<<<<<<<<<<<
+ *             idx2[n] = i2
+ *             i2 += 1
  */
-      __pyx_t_3 = __Pyx_PyInt_From_int(__pyx_v_t); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 325, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_3);
-      __pyx_t_8 = PyUnicode_Format(__pyx_kp_u_unknown_dtype_code_in_numpy_pxd, __pyx_t_3); if (unlikely(!__pyx_t_8)) __PYX_ERR(1, 325, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_8);
-      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-      __pyx_t_3 = __Pyx_PyObject_CallOneArg(__pyx_builtin_ValueError, __pyx_t_8); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 325, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_3);
-      __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
-      __Pyx_Raise(__pyx_t_3, 0, 0, 0);
-      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-      __PYX_ERR(1, 325, __pyx_L1_error)
-      break;
-    }
+      __pyx_t_33 = __pyx_v_n;
+      *((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_idx1.data) + __pyx_t_33)) )) = -1;
 
-    /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":326
- *                 else:
- *                     raise ValueError(u"unknown dtype code in numpy.pxd (%d)" % t)
- *                 info.format = f             # <<<<<<<<<<<<<<
- *                 return
- *             else:
+      /* "sisl/_sparse.pyx":330
+ *             col[n] = col2[i2]
+ *             idx1[n] = -1
+ *             idx2[n] = i2             # <<<<<<<<<<<<<<
+ *             i2 += 1
+ *             n += 1
  */
-    __pyx_v_info->format = __pyx_v_f;
+      __pyx_t_34 = __pyx_v_n;
+      *((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_idx2.data) + __pyx_t_34)) )) = __pyx_v_i2;
 
-    /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":327
- *                     raise ValueError(u"unknown dtype code in numpy.pxd (%d)" % t)
- *                 info.format = f
- *                 return             # <<<<<<<<<<<<<<
- *             else:
- *                 info.format = <char*>PyObject_Malloc(_buffer_format_string_len)
+      /* "sisl/_sparse.pyx":331
+ *             idx1[n] = -1
+ *             idx2[n] = i2
+ *             i2 += 1             # <<<<<<<<<<<<<<
+ *             n += 1
+ * 
  */
-    __pyx_r = 0;
-    goto __pyx_L0;
+      __pyx_v_i2 = (__pyx_v_i2 + 1);
 
-    /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":302
- *             info.obj = self
+      /* "sisl/_sparse.pyx":332
+ *             idx2[n] = i2
+ *             i2 += 1
+ *             n += 1             # <<<<<<<<<<<<<<
+ * 
  * 
- *             if not PyDataType_HASFIELDS(descr):             # <<<<<<<<<<<<<<
- *                 t = descr.type_num
- *                 if ((descr.byteorder == c'>' and little_endian) or
  */
+      __pyx_v_n = (__pyx_v_n + 1);
+    }
   }
 
-  /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":329
- *                 return
- *             else:
- *                 info.format = <char*>PyObject_Malloc(_buffer_format_string_len)             # <<<<<<<<<<<<<<
- *                 info.format[0] = c'^' # Native data types, manual alignment
- *                 offset = 0
- */
-  /*else*/ {
-    __pyx_v_info->format = ((char *)PyObject_Malloc(0xFF));
-
-    /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":330
- *             else:
- *                 info.format = <char*>PyObject_Malloc(_buffer_format_string_len)
- *                 info.format[0] = c'^' # Native data types, manual alignment             # <<<<<<<<<<<<<<
- *                 offset = 0
- *                 f = _util_dtypestring(descr, info.format + 1,
+  /* "sisl/_sparse.pyx":291
+ * @cython.wraparound(False)
+ * @cython.initializedcheck(False)
+ * cdef void _sparse_merge(const int[::1] ptr1, const int[::1] ncol1, const int[::1] col1,             # <<<<<<<<<<<<<<
+ *                         const int[::1] ptr2, const int[::1] ncol2, const int[::1] col2,
+ *                         const int[::1] ptr, int[::1] col, int[::1] idx1, int[::1] idx2) nogil:
  */
-    (__pyx_v_info->format[0]) = '^';
 
-    /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":331
- *                 info.format = <char*>PyObject_Malloc(_buffer_format_string_len)
- *                 info.format[0] = c'^' # Native data types, manual alignment
- *                 offset = 0             # <<<<<<<<<<<<<<
- *                 f = _util_dtypestring(descr, info.format + 1,
- *                                       info.format + _buffer_format_string_len,
- */
-    __pyx_v_offset = 0;
+  /* function exit code */
+}
 
-    /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":332
- *                 info.format[0] = c'^' # Native data types, manual alignment
- *                 offset = 0
- *                 f = _util_dtypestring(descr, info.format + 1,             # <<<<<<<<<<<<<<
- *                                       info.format + _buffer_format_string_len,
- *                                       &offset)
+/* "sisl/_sparse.pyx":339
+ * @cython.initializedcheck(False)
+ * @cython.cdivision(True)
+ * def sparse_transpose(np.ndarray[np.int32_t, ndim=1, mode='c'] PTR,             # <<<<<<<<<<<<<<
+ *                      np.ndarray[np.int32_t, ndim=1, mode='c'] NCOL,
+ *                      np.ndarray[np.int32_t, ndim=1, mode='c'] COL,
  */
-    __pyx_t_9 = __pyx_f_5numpy__util_dtypestring(__pyx_v_descr, (__pyx_v_info->format + 1), (__pyx_v_info->format + 0xFF), (&__pyx_v_offset)); if (unlikely(__pyx_t_9 == ((char *)NULL))) __PYX_ERR(1, 332, __pyx_L1_error)
-    __pyx_v_f = __pyx_t_9;
 
-    /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":335
- *                                       info.format + _buffer_format_string_len,
- *                                       &offset)
- *                 f[0] = c'\0' # Terminate format string             # <<<<<<<<<<<<<<
- * 
- *         def __releasebuffer__(ndarray self, Py_buffer* info):
- */
-    (__pyx_v_f[0]) = '\x00';
+/* Python wrapper */
+static PyObject *__pyx_pw_4sisl_7_sparse_9sparse_transpose(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_4sisl_7_sparse_8sparse_transpose[] = " Transpose a sparsity pattern with supercell columns using a counting sort\n\n    Element ``(r, c + s * size)`` is transposed into ``(c, r + ISC[s] * size)``.\n\n    Parameters\n    ----------\n    PTR, NCOL, COL : numpy.ndarray(np.int32)\n       the sparsity pattern\n    ISC : numpy.ndarray(np.int32)\n       the transposed supercell index for each supercell index\n    size : int\n       number of rows (and number of columns in each supercell)\n\n    Returns\n    -------\n    ptr, ncol, col : the transposed sparsity pattern (columns sorted in each row)\n    idx : indices of the transposed elements in `COL`\n    ";
+static PyMethodDef __pyx_mdef_4sisl_7_sparse_9sparse_transpose = {"sparse_transpose", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_4sisl_7_sparse_9sparse_transpose, METH_VARARGS|METH_KEYWORDS, __pyx_doc_4sisl_7_sparse_8sparse_transpose};
+static PyObject *__pyx_pw_4sisl_7_sparse_9sparse_transpose(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyArrayObject *__pyx_v_PTR = 0;
+  PyArrayObject *__pyx_v_NCOL = 0;
+  PyArrayObject *__pyx_v_COL = 0;
+  PyArrayObject *__pyx_v_ISC = 0;
+  int __pyx_v_size;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("sparse_transpose (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_PTR,&__pyx_n_s_NCOL,&__pyx_n_s_COL,&__pyx_n_s_ISC,&__pyx_n_s_size,0};
+    PyObject* values[5] = {0,0,0,0,0};
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case  5: values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
+        CYTHON_FALLTHROUGH;
+        case  4: values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+        CYTHON_FALLTHROUGH;
+        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        CYTHON_FALLTHROUGH;
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_PTR)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_NCOL)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("sparse_transpose", 1, 5, 5, 1); __PYX_ERR(0, 339, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  2:
+        if (likely((values[2] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_COL)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("sparse_transpose", 1, 5, 5, 2); __PYX_ERR(0, 339, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  3:
+        if (likely((values[3] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_ISC)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("sparse_transpose", 1, 5, 5, 3); __PYX_ERR(0, 339, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  4:
+        if (likely((values[4] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_size)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("sparse_transpose", 1, 5, 5, 4); __PYX_ERR(0, 339, __pyx_L3_error)
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "sparse_transpose") < 0)) __PYX_ERR(0, 339, __pyx_L3_error)
+      }
+    } else if (PyTuple_GET_SIZE(__pyx_args) != 5) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+      values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+      values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+      values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+      values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
+    }
+    __pyx_v_PTR = ((PyArrayObject *)values[0]);
+    __pyx_v_NCOL = ((PyArrayObject *)values[1]);
+    __pyx_v_COL = ((PyArrayObject *)values[2]);
+    __pyx_v_ISC = ((PyArrayObject *)values[3]);
+    __pyx_v_size = __Pyx_PyInt_As_int(values[4]); if (unlikely((__pyx_v_size == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 343, __pyx_L3_error)
   }
-
-  /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":258
- *         # experimental exception made for __getbuffer__ and __releasebuffer__
- *         # -- the details of this may change.
- *         def __getbuffer__(ndarray self, Py_buffer* info, int flags):             # <<<<<<<<<<<<<<
- *             # This implementation of getbuffer is geared towards Cython
- *             # requirements, and does not yet fulfill the PEP.
- */
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("sparse_transpose", 1, 5, 5, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 339, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("sisl._sparse.sparse_transpose", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_PTR), __pyx_ptype_5numpy_ndarray, 1, "PTR", 0))) __PYX_ERR(0, 339, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_NCOL), __pyx_ptype_5numpy_ndarray, 1, "NCOL", 0))) __PYX_ERR(0, 340, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_COL), __pyx_ptype_5numpy_ndarray, 1, "COL", 0))) __PYX_ERR(0, 341, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_ISC), __pyx_ptype_5numpy_ndarray, 1, "ISC", 0))) __PYX_ERR(0, 342, __pyx_L1_error)
+  __pyx_r = __pyx_pf_4sisl_7_sparse_8sparse_transpose(__pyx_self, __pyx_v_PTR, __pyx_v_NCOL, __pyx_v_COL, __pyx_v_ISC, __pyx_v_size);
 
   /* function exit code */
-  __pyx_r = 0;
   goto __pyx_L0;
   __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_3);
-  __Pyx_XDECREF(__pyx_t_8);
-  __Pyx_AddTraceback("numpy.ndarray.__getbuffer__", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __pyx_r = -1;
-  if (__pyx_v_info->obj != NULL) {
-    __Pyx_GOTREF(__pyx_v_info->obj);
-    __Pyx_DECREF(__pyx_v_info->obj); __pyx_v_info->obj = 0;
-  }
-  goto __pyx_L2;
+  __pyx_r = NULL;
   __pyx_L0:;
-  if (__pyx_v_info->obj == Py_None) {
-    __Pyx_GOTREF(__pyx_v_info->obj);
-    __Pyx_DECREF(__pyx_v_info->obj); __pyx_v_info->obj = 0;
-  }
-  __pyx_L2:;
-  __Pyx_XDECREF((PyObject *)__pyx_v_descr);
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-/* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":337
- *                 f[0] = c'\0' # Terminate format string
- * 
- *         def __releasebuffer__(ndarray self, Py_buffer* info):             # <<<<<<<<<<<<<<
- *             if PyArray_HASFIELDS(self):
- *                 PyObject_Free(info.format)
- */
-
-/* Python wrapper */
-static CYTHON_UNUSED void __pyx_pw_5numpy_7ndarray_3__releasebuffer__(PyObject *__pyx_v_self, Py_buffer *__pyx_v_info); /*proto*/
-static CYTHON_UNUSED void __pyx_pw_5numpy_7ndarray_3__releasebuffer__(PyObject *__pyx_v_self, Py_buffer *__pyx_v_info) {
-  __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("__releasebuffer__ (wrapper)", 0);
-  __pyx_pf_5numpy_7ndarray_2__releasebuffer__(((PyArrayObject *)__pyx_v_self), ((Py_buffer *)__pyx_v_info));
-
-  /* function exit code */
-  __Pyx_RefNannyFinishContext();
-}
-
-static void __pyx_pf_5numpy_7ndarray_2__releasebuffer__(PyArrayObject *__pyx_v_self, Py_buffer *__pyx_v_info) {
+static PyObject *__pyx_pf_4sisl_7_sparse_8sparse_transpose(CYTHON_UNUSED PyObject *__pyx_self, PyArrayObject *__pyx_v_PTR, PyArrayObject *__pyx_v_NCOL, PyArrayObject *__pyx_v_COL, PyArrayObject *__pyx_v_ISC, int __pyx_v_size) {
+  __Pyx_memviewslice __pyx_v_ptr = { 0, 0, { 0 }, { 0 }, { 0 } };
+  __Pyx_memviewslice __pyx_v_ncol = { 0, 0, { 0 }, { 0 }, { 0 } };
+  __Pyx_memviewslice __pyx_v_col = { 0, 0, { 0 }, { 0 }, { 0 } };
+  __Pyx_memviewslice __pyx_v_isc = { 0, 0, { 0 }, { 0 }, { 0 } };
+  int __pyx_v_nr;
+  int __pyx_v_n_s;
+  PyArrayObject *__pyx_v_T_PTR = 0;
+  PyArrayObject *__pyx_v_T_NCOL = 0;
+  PyArrayObject *__pyx_v_OFF = 0;
+  __Pyx_memviewslice __pyx_v_tptr = { 0, 0, { 0 }, { 0 }, { 0 } };
+  __Pyx_memviewslice __pyx_v_tncol = { 0, 0, { 0 }, { 0 }, { 0 } };
+  __Pyx_memviewslice __pyx_v_off = { 0, 0, { 0 }, { 0 }, { 0 } };
+  int __pyx_v_r;
+  int __pyx_v_i;
+  int __pyx_v_t;
+  int __pyx_v_n;
+  int __pyx_v_nnz;
+  PyArrayObject *__pyx_v_T_COL = 0;
+  PyArrayObject *__pyx_v_IDX = 0;
+  PyArrayObject *__pyx_v_S_COL = 0;
+  PyArrayObject *__pyx_v_S_IDX = 0;
+  __Pyx_memviewslice __pyx_v_tcol = { 0, 0, { 0 }, { 0 }, { 0 } };
+  __Pyx_memviewslice __pyx_v_idx = { 0, 0, { 0 }, { 0 }, { 0 } };
+  __Pyx_memviewslice __pyx_v_scol = { 0, 0, { 0 }, { 0 }, { 0 } };
+  __Pyx_memviewslice __pyx_v_sidx = { 0, 0, { 0 }, { 0 }, { 0 } };
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_COL;
+  __Pyx_Buffer __pyx_pybuffer_COL;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_IDX;
+  __Pyx_Buffer __pyx_pybuffer_IDX;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_ISC;
+  __Pyx_Buffer __pyx_pybuffer_ISC;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_NCOL;
+  __Pyx_Buffer __pyx_pybuffer_NCOL;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_OFF;
+  __Pyx_Buffer __pyx_pybuffer_OFF;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_PTR;
+  __Pyx_Buffer __pyx_pybuffer_PTR;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_S_COL;
+  __Pyx_Buffer __pyx_pybuffer_S_COL;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_S_IDX;
+  __Pyx_Buffer __pyx_pybuffer_S_IDX;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_T_COL;
+  __Pyx_Buffer __pyx_pybuffer_T_COL;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_T_NCOL;
+  __Pyx_Buffer __pyx_pybuffer_T_NCOL;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_T_PTR;
+  __Pyx_Buffer __pyx_pybuffer_T_PTR;
+  PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
-  int __pyx_t_1;
-  __Pyx_RefNannySetupContext("__releasebuffer__", 0);
+  __Pyx_memviewslice __pyx_t_1 = { 0, 0, { 0 }, { 0 }, { 0 } };
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  PyObject *__pyx_t_6 = NULL;
+  PyArrayObject *__pyx_t_7 = NULL;
+  PyArrayObject *__pyx_t_8 = NULL;
+  PyArrayObject *__pyx_t_9 = NULL;
+  int __pyx_t_10;
+  int __pyx_t_11;
+  int __pyx_t_12;
+  Py_ssize_t __pyx_t_13;
+  Py_ssize_t __pyx_t_14;
+  int __pyx_t_15;
+  Py_ssize_t __pyx_t_16;
+  int __pyx_t_17;
+  int __pyx_t_18;
+  Py_ssize_t __pyx_t_19;
+  Py_ssize_t __pyx_t_20;
+  Py_ssize_t __pyx_t_21;
+  Py_ssize_t __pyx_t_22;
+  Py_ssize_t __pyx_t_23;
+  Py_ssize_t __pyx_t_24;
+  Py_ssize_t __pyx_t_25;
+  Py_ssize_t __pyx_t_26;
+  Py_ssize_t __pyx_t_27;
+  Py_ssize_t __pyx_t_28;
+  Py_ssize_t __pyx_t_29;
+  PyArrayObject *__pyx_t_30 = NULL;
+  PyArrayObject *__pyx_t_31 = NULL;
+  PyArrayObject *__pyx_t_32 = NULL;
+  PyArrayObject *__pyx_t_33 = NULL;
+  Py_ssize_t __pyx_t_34;
+  Py_ssize_t __pyx_t_35;
+  Py_ssize_t __pyx_t_36;
+  Py_ssize_t __pyx_t_37;
+  Py_ssize_t __pyx_t_38;
+  Py_ssize_t __pyx_t_39;
+  Py_ssize_t __pyx_t_40;
+  Py_ssize_t __pyx_t_41;
+  Py_ssize_t __pyx_t_42;
+  Py_ssize_t __pyx_t_43;
+  Py_ssize_t __pyx_t_44;
+  Py_ssize_t __pyx_t_45;
+  Py_ssize_t __pyx_t_46;
+  Py_ssize_t __pyx_t_47;
+  Py_ssize_t __pyx_t_48;
+  Py_ssize_t __pyx_t_49;
+  Py_ssize_t __pyx_t_50;
+  Py_ssize_t __pyx_t_51;
+  Py_ssize_t __pyx_t_52;
+  Py_ssize_t __pyx_t_53;
+  __Pyx_RefNannySetupContext("sparse_transpose", 0);
+  __pyx_pybuffer_T_PTR.pybuffer.buf = NULL;
+  __pyx_pybuffer_T_PTR.refcount = 0;
+  __pyx_pybuffernd_T_PTR.data = NULL;
+  __pyx_pybuffernd_T_PTR.rcbuffer = &__pyx_pybuffer_T_PTR;
+  __pyx_pybuffer_T_NCOL.pybuffer.buf = NULL;
+  __pyx_pybuffer_T_NCOL.refcount = 0;
+  __pyx_pybuffernd_T_NCOL.data = NULL;
+  __pyx_pybuffernd_T_NCOL.rcbuffer = &__pyx_pybuffer_T_NCOL;
+  __pyx_pybuffer_OFF.pybuffer.buf = NULL;
+  __pyx_pybuffer_OFF.refcount = 0;
+  __pyx_pybuffernd_OFF.data = NULL;
+  __pyx_pybuffernd_OFF.rcbuffer = &__pyx_pybuffer_OFF;
+  __pyx_pybuffer_T_COL.pybuffer.buf = NULL;
+  __pyx_pybuffer_T_COL.refcount = 0;
+  __pyx_pybuffernd_T_COL.data = NULL;
+  __pyx_pybuffernd_T_COL.rcbuffer = &__pyx_pybuffer_T_COL;
+  __pyx_pybuffer_IDX.pybuffer.buf = NULL;
+  __pyx_pybuffer_IDX.refcount = 0;
+  __pyx_pybuffernd_IDX.data = NULL;
+  __pyx_pybuffernd_IDX.rcbuffer = &__pyx_pybuffer_IDX;
+  __pyx_pybuffer_S_COL.pybuffer.buf = NULL;
+  __pyx_pybuffer_S_COL.refcount = 0;
+  __pyx_pybuffernd_S_COL.data = NULL;
+  __pyx_pybuffernd_S_COL.rcbuffer = &__pyx_pybuffer_S_COL;
+  __pyx_pybuffer_S_IDX.pybuffer.buf = NULL;
+  __pyx_pybuffer_S_IDX.refcount = 0;
+  __pyx_pybuffernd_S_IDX.data = NULL;
+  __pyx_pybuffernd_S_IDX.rcbuffer = &__pyx_pybuffer_S_IDX;
+  __pyx_pybuffer_PTR.pybuffer.buf = NULL;
+  __pyx_pybuffer_PTR.refcount = 0;
+  __pyx_pybuffernd_PTR.data = NULL;
+  __pyx_pybuffernd_PTR.rcbuffer = &__pyx_pybuffer_PTR;
+  __pyx_pybuffer_NCOL.pybuffer.buf = NULL;
+  __pyx_pybuffer_NCOL.refcount = 0;
+  __pyx_pybuffernd_NCOL.data = NULL;
+  __pyx_pybuffernd_NCOL.rcbuffer = &__pyx_pybuffer_NCOL;
+  __pyx_pybuffer_COL.pybuffer.buf = NULL;
+  __pyx_pybuffer_COL.refcount = 0;
+  __pyx_pybuffernd_COL.data = NULL;
+  __pyx_pybuffernd_COL.rcbuffer = &__pyx_pybuffer_COL;
+  __pyx_pybuffer_ISC.pybuffer.buf = NULL;
+  __pyx_pybuffer_ISC.refcount = 0;
+  __pyx_pybuffernd_ISC.data = NULL;
+  __pyx_pybuffernd_ISC.rcbuffer = &__pyx_pybuffer_ISC;
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_PTR.rcbuffer->pybuffer, (PyObject*)__pyx_v_PTR, &__Pyx_TypeInfo_nn___pyx_t_5numpy_int32_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 339, __pyx_L1_error)
+  }
+  __pyx_pybuffernd_PTR.diminfo[0].strides = __pyx_pybuffernd_PTR.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_PTR.diminfo[0].shape = __pyx_pybuffernd_PTR.rcbuffer->pybuffer.shape[0];
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_NCOL.rcbuffer->pybuffer, (PyObject*)__pyx_v_NCOL, &__Pyx_TypeInfo_nn___pyx_t_5numpy_int32_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 339, __pyx_L1_error)
+  }
+  __pyx_pybuffernd_NCOL.diminfo[0].strides = __pyx_pybuffernd_NCOL.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_NCOL.diminfo[0].shape = __pyx_pybuffernd_NCOL.rcbuffer->pybuffer.shape[0];
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_COL.rcbuffer->pybuffer, (PyObject*)__pyx_v_COL, &__Pyx_TypeInfo_nn___pyx_t_5numpy_int32_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 339, __pyx_L1_error)
+  }
+  __pyx_pybuffernd_COL.diminfo[0].strides = __pyx_pybuffernd_COL.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_COL.diminfo[0].shape = __pyx_pybuffernd_COL.rcbuffer->pybuffer.shape[0];
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_ISC.rcbuffer->pybuffer, (PyObject*)__pyx_v_ISC, &__Pyx_TypeInfo_nn___pyx_t_5numpy_int32_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 339, __pyx_L1_error)
+  }
+  __pyx_pybuffernd_ISC.diminfo[0].strides = __pyx_pybuffernd_ISC.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_ISC.diminfo[0].shape = __pyx_pybuffernd_ISC.rcbuffer->pybuffer.shape[0];
 
-  /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":338
- * 
- *         def __releasebuffer__(ndarray self, Py_buffer* info):
- *             if PyArray_HASFIELDS(self):             # <<<<<<<<<<<<<<
- *                 PyObject_Free(info.format)
- *             if sizeof(npy_intp) != sizeof(Py_ssize_t):
+  /* "sisl/_sparse.pyx":362
+ *     idx : indices of the transposed elements in `COL`
+ *     """
+ *     cdef int[::1] ptr = PTR             # <<<<<<<<<<<<<<
+ *     cdef int[::1] ncol = NCOL
+ *     cdef int[::1] col = COL
  */
-  __pyx_t_1 = (PyArray_HASFIELDS(__pyx_v_self) != 0);
-  if (__pyx_t_1) {
+  __pyx_t_1 = __Pyx_PyObject_to_MemoryviewSlice_dc_int(((PyObject *)__pyx_v_PTR), PyBUF_WRITABLE); if (unlikely(!__pyx_t_1.memview)) __PYX_ERR(0, 362, __pyx_L1_error)
+  __pyx_v_ptr = __pyx_t_1;
+  __pyx_t_1.memview = NULL;
+  __pyx_t_1.data = NULL;
 
-    /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":339
- *         def __releasebuffer__(ndarray self, Py_buffer* info):
- *             if PyArray_HASFIELDS(self):
- *                 PyObject_Free(info.format)             # <<<<<<<<<<<<<<
- *             if sizeof(npy_intp) != sizeof(Py_ssize_t):
- *                 PyObject_Free(info.strides)
+  /* "sisl/_sparse.pyx":363
+ *     """
+ *     cdef int[::1] ptr = PTR
+ *     cdef int[::1] ncol = NCOL             # <<<<<<<<<<<<<<
+ *     cdef int[::1] col = COL
+ *     cdef int[::1] isc = ISC
  */
-    PyObject_Free(__pyx_v_info->format);
+  __pyx_t_1 = __Pyx_PyObject_to_MemoryviewSlice_dc_int(((PyObject *)__pyx_v_NCOL), PyBUF_WRITABLE); if (unlikely(!__pyx_t_1.memview)) __PYX_ERR(0, 363, __pyx_L1_error)
+  __pyx_v_ncol = __pyx_t_1;
+  __pyx_t_1.memview = NULL;
+  __pyx_t_1.data = NULL;
 
-    /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":338
- * 
- *         def __releasebuffer__(ndarray self, Py_buffer* info):
- *             if PyArray_HASFIELDS(self):             # <<<<<<<<<<<<<<
- *                 PyObject_Free(info.format)
- *             if sizeof(npy_intp) != sizeof(Py_ssize_t):
+  /* "sisl/_sparse.pyx":364
+ *     cdef int[::1] ptr = PTR
+ *     cdef int[::1] ncol = NCOL
+ *     cdef int[::1] col = COL             # <<<<<<<<<<<<<<
+ *     cdef int[::1] isc = ISC
+ *     cdef int nr = ncol.shape[0]
  */
-  }
+  __pyx_t_1 = __Pyx_PyObject_to_MemoryviewSlice_dc_int(((PyObject *)__pyx_v_COL), PyBUF_WRITABLE); if (unlikely(!__pyx_t_1.memview)) __PYX_ERR(0, 364, __pyx_L1_error)
+  __pyx_v_col = __pyx_t_1;
+  __pyx_t_1.memview = NULL;
+  __pyx_t_1.data = NULL;
 
-  /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":340
- *             if PyArray_HASFIELDS(self):
- *                 PyObject_Free(info.format)
- *             if sizeof(npy_intp) != sizeof(Py_ssize_t):             # <<<<<<<<<<<<<<
- *                 PyObject_Free(info.strides)
- *                 # info.shape was stored after info.strides in the same block
+  /* "sisl/_sparse.pyx":365
+ *     cdef int[::1] ncol = NCOL
+ *     cdef int[::1] col = COL
+ *     cdef int[::1] isc = ISC             # <<<<<<<<<<<<<<
+ *     cdef int nr = ncol.shape[0]
+ *     cdef int n_s = isc.shape[0]
  */
-  __pyx_t_1 = (((sizeof(npy_intp)) != (sizeof(Py_ssize_t))) != 0);
-  if (__pyx_t_1) {
+  __pyx_t_1 = __Pyx_PyObject_to_MemoryviewSlice_dc_int(((PyObject *)__pyx_v_ISC), PyBUF_WRITABLE); if (unlikely(!__pyx_t_1.memview)) __PYX_ERR(0, 365, __pyx_L1_error)
+  __pyx_v_isc = __pyx_t_1;
+  __pyx_t_1.memview = NULL;
+  __pyx_t_1.data = NULL;
 
-    /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":341
- *                 PyObject_Free(info.format)
- *             if sizeof(npy_intp) != sizeof(Py_ssize_t):
- *                 PyObject_Free(info.strides)             # <<<<<<<<<<<<<<
- *                 # info.shape was stored after info.strides in the same block
+  /* "sisl/_sparse.pyx":366
+ *     cdef int[::1] col = COL
+ *     cdef int[::1] isc = ISC
+ *     cdef int nr = ncol.shape[0]             # <<<<<<<<<<<<<<
+ *     cdef int n_s = isc.shape[0]
  * 
  */
-    PyObject_Free(__pyx_v_info->strides);
-
-    /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":340
- *             if PyArray_HASFIELDS(self):
- *                 PyObject_Free(info.format)
- *             if sizeof(npy_intp) != sizeof(Py_ssize_t):             # <<<<<<<<<<<<<<
- *                 PyObject_Free(info.strides)
- *                 # info.shape was stored after info.strides in the same block
- */
-  }
+  __pyx_v_nr = (__pyx_v_ncol.shape[0]);
 
-  /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":337
- *                 f[0] = c'\0' # Terminate format string
+  /* "sisl/_sparse.pyx":367
+ *     cdef int[::1] isc = ISC
+ *     cdef int nr = ncol.shape[0]
+ *     cdef int n_s = isc.shape[0]             # <<<<<<<<<<<<<<
  * 
- *         def __releasebuffer__(ndarray self, Py_buffer* info):             # <<<<<<<<<<<<<<
- *             if PyArray_HASFIELDS(self):
- *                 PyObject_Free(info.format)
+ *     cdef np.ndarray[np.int32_t, ndim=1, mode='c'] T_PTR = np.zeros([size + 1], dtype=np.int32)
  */
+  __pyx_v_n_s = (__pyx_v_isc.shape[0]);
 
-  /* function exit code */
-  __Pyx_RefNannyFinishContext();
-}
-
-/* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":821
- * ctypedef npy_cdouble     complex_t
- * 
- * cdef inline object PyArray_MultiIterNew1(a):             # <<<<<<<<<<<<<<
- *     return PyArray_MultiIterNew(1, <void*>a)
+  /* "sisl/_sparse.pyx":369
+ *     cdef int n_s = isc.shape[0]
  * 
+ *     cdef np.ndarray[np.int32_t, ndim=1, mode='c'] T_PTR = np.zeros([size + 1], dtype=np.int32)             # <<<<<<<<<<<<<<
+ *     cdef np.ndarray[np.int32_t, ndim=1, mode='c'] T_NCOL = np.zeros([size], dtype=np.int32)
+ *     cdef np.ndarray[np.int32_t, ndim=1, mode='c'] OFF = np.zeros([n_s + 1], dtype=np.int32)
  */
+  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_np); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 369, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_zeros); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 369, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_2 = __Pyx_PyInt_From_long((__pyx_v_size + 1)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 369, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_4 = PyList_New(1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 369, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_GIVEREF(__pyx_t_2);
+  PyList_SET_ITEM(__pyx_t_4, 0, __pyx_t_2);
+  __pyx_t_2 = 0;
+  __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 369, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_GIVEREF(__pyx_t_4);
+  PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_t_4);
+  __pyx_t_4 = 0;
+  __pyx_t_4 = __Pyx_PyDict_NewPresized(1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 369, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_GetModuleGlobalName(__pyx_t_5, __pyx_n_s_np); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 369, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_t_5, __pyx_n_s_int32); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 369, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  if (PyDict_SetItem(__pyx_t_4, __pyx_n_s_dtype, __pyx_t_6) < 0) __PYX_ERR(0, 369, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  __pyx_t_6 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_t_2, __pyx_t_4); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 369, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  if (!(likely(((__pyx_t_6) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_6, __pyx_ptype_5numpy_ndarray))))) __PYX_ERR(0, 369, __pyx_L1_error)
+  __pyx_t_7 = ((PyArrayObject *)__pyx_t_6);
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_T_PTR.rcbuffer->pybuffer, (PyObject*)__pyx_t_7, &__Pyx_TypeInfo_nn___pyx_t_5numpy_int32_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) {
+      __pyx_v_T_PTR = ((PyArrayObject *)Py_None); __Pyx_INCREF(Py_None); __pyx_pybuffernd_T_PTR.rcbuffer->pybuffer.buf = NULL;
+      __PYX_ERR(0, 369, __pyx_L1_error)
+    } else {__pyx_pybuffernd_T_PTR.diminfo[0].strides = __pyx_pybuffernd_T_PTR.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_T_PTR.diminfo[0].shape = __pyx_pybuffernd_T_PTR.rcbuffer->pybuffer.shape[0];
+    }
+  }
+  __pyx_t_7 = 0;
+  __pyx_v_T_PTR = ((PyArrayObject *)__pyx_t_6);
+  __pyx_t_6 = 0;
 
-static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew1(PyObject *__pyx_v_a) {
-  PyObject *__pyx_r = NULL;
-  __Pyx_RefNannyDeclarations
-  PyObject *__pyx_t_1 = NULL;
-  __Pyx_RefNannySetupContext("PyArray_MultiIterNew1", 0);
-
-  /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":822
- * 
- * cdef inline object PyArray_MultiIterNew1(a):
- *     return PyArray_MultiIterNew(1, <void*>a)             # <<<<<<<<<<<<<<
+  /* "sisl/_sparse.pyx":370
  * 
- * cdef inline object PyArray_MultiIterNew2(a, b):
+ *     cdef np.ndarray[np.int32_t, ndim=1, mode='c'] T_PTR = np.zeros([size + 1], dtype=np.int32)
+ *     cdef np.ndarray[np.int32_t, ndim=1, mode='c'] T_NCOL = np.zeros([size], dtype=np.int32)             # <<<<<<<<<<<<<<
+ *     cdef np.ndarray[np.int32_t, ndim=1, mode='c'] OFF = np.zeros([n_s + 1], dtype=np.int32)
+ *     cdef int[::1] tptr = T_PTR
  */
-  __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = PyArray_MultiIterNew(1, ((void *)__pyx_v_a)); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 822, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_r = __pyx_t_1;
-  __pyx_t_1 = 0;
-  goto __pyx_L0;
+  __Pyx_GetModuleGlobalName(__pyx_t_6, __pyx_n_s_np); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 370, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_t_6, __pyx_n_s_zeros); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 370, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  __pyx_t_6 = __Pyx_PyInt_From_int(__pyx_v_size); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 370, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __pyx_t_2 = PyList_New(1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 370, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_GIVEREF(__pyx_t_6);
+  PyList_SET_ITEM(__pyx_t_2, 0, __pyx_t_6);
+  __pyx_t_6 = 0;
+  __pyx_t_6 = PyTuple_New(1); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 370, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_GIVEREF(__pyx_t_2);
+  PyTuple_SET_ITEM(__pyx_t_6, 0, __pyx_t_2);
+  __pyx_t_2 = 0;
+  __pyx_t_2 = __Pyx_PyDict_NewPresized(1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 370, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_n_s_np); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 370, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_n_s_int32); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 370, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  if (PyDict_SetItem(__pyx_t_2, __pyx_n_s_dtype, __pyx_t_5) < 0) __PYX_ERR(0, 370, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __pyx_t_5 = __Pyx_PyObject_Call(__pyx_t_4, __pyx_t_6, __pyx_t_2); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 370, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  if (!(likely(((__pyx_t_5) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_5, __pyx_ptype_5numpy_ndarray))))) __PYX_ERR(0, 370, __pyx_L1_error)
+  __pyx_t_8 = ((PyArrayObject *)__pyx_t_5);
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_T_NCOL.rcbuffer->pybuffer, (PyObject*)__pyx_t_8, &__Pyx_TypeInfo_nn___pyx_t_5numpy_int32_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) {
+      __pyx_v_T_NCOL = ((PyArrayObject *)Py_None); __Pyx_INCREF(Py_None); __pyx_pybuffernd_T_NCOL.rcbuffer->pybuffer.buf = NULL;
+      __PYX_ERR(0, 370, __pyx_L1_error)
+    } else {__pyx_pybuffernd_T_NCOL.diminfo[0].strides = __pyx_pybuffernd_T_NCOL.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_T_NCOL.diminfo[0].shape = __pyx_pybuffernd_T_NCOL.rcbuffer->pybuffer.shape[0];
+    }
+  }
+  __pyx_t_8 = 0;
+  __pyx_v_T_NCOL = ((PyArrayObject *)__pyx_t_5);
+  __pyx_t_5 = 0;
 
-  /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":821
- * ctypedef npy_cdouble     complex_t
- * 
- * cdef inline object PyArray_MultiIterNew1(a):             # <<<<<<<<<<<<<<
- *     return PyArray_MultiIterNew(1, <void*>a)
- * 
+  /* "sisl/_sparse.pyx":371
+ *     cdef np.ndarray[np.int32_t, ndim=1, mode='c'] T_PTR = np.zeros([size + 1], dtype=np.int32)
+ *     cdef np.ndarray[np.int32_t, ndim=1, mode='c'] T_NCOL = np.zeros([size], dtype=np.int32)
+ *     cdef np.ndarray[np.int32_t, ndim=1, mode='c'] OFF = np.zeros([n_s + 1], dtype=np.int32)             # <<<<<<<<<<<<<<
+ *     cdef int[::1] tptr = T_PTR
+ *     cdef int[::1] tncol = T_NCOL
  */
+  __Pyx_GetModuleGlobalName(__pyx_t_5, __pyx_n_s_np); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 371, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_t_5, __pyx_n_s_zeros); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 371, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __pyx_t_5 = __Pyx_PyInt_From_long((__pyx_v_n_s + 1)); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 371, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __pyx_t_6 = PyList_New(1); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 371, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_GIVEREF(__pyx_t_5);
+  PyList_SET_ITEM(__pyx_t_6, 0, __pyx_t_5);
+  __pyx_t_5 = 0;
+  __pyx_t_5 = PyTuple_New(1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 371, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_GIVEREF(__pyx_t_6);
+  PyTuple_SET_ITEM(__pyx_t_5, 0, __pyx_t_6);
+  __pyx_t_6 = 0;
+  __pyx_t_6 = __Pyx_PyDict_NewPresized(1); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 371, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_GetModuleGlobalName(__pyx_t_4, __pyx_n_s_np); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 371, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_4, __pyx_n_s_int32); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 371, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  if (PyDict_SetItem(__pyx_t_6, __pyx_n_s_dtype, __pyx_t_3) < 0) __PYX_ERR(0, 371, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_t_3 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_t_5, __pyx_t_6); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 371, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  if (!(likely(((__pyx_t_3) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_3, __pyx_ptype_5numpy_ndarray))))) __PYX_ERR(0, 371, __pyx_L1_error)
+  __pyx_t_9 = ((PyArrayObject *)__pyx_t_3);
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_OFF.rcbuffer->pybuffer, (PyObject*)__pyx_t_9, &__Pyx_TypeInfo_nn___pyx_t_5numpy_int32_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) {
+      __pyx_v_OFF = ((PyArrayObject *)Py_None); __Pyx_INCREF(Py_None); __pyx_pybuffernd_OFF.rcbuffer->pybuffer.buf = NULL;
+      __PYX_ERR(0, 371, __pyx_L1_error)
+    } else {__pyx_pybuffernd_OFF.diminfo[0].strides = __pyx_pybuffernd_OFF.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_OFF.diminfo[0].shape = __pyx_pybuffernd_OFF.rcbuffer->pybuffer.shape[0];
+    }
+  }
+  __pyx_t_9 = 0;
+  __pyx_v_OFF = ((PyArrayObject *)__pyx_t_3);
+  __pyx_t_3 = 0;
 
-  /* function exit code */
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("numpy.PyArray_MultiIterNew1", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __pyx_r = 0;
-  __pyx_L0:;
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":824
- *     return PyArray_MultiIterNew(1, <void*>a)
- * 
- * cdef inline object PyArray_MultiIterNew2(a, b):             # <<<<<<<<<<<<<<
- *     return PyArray_MultiIterNew(2, <void*>a, <void*>b)
- * 
+  /* "sisl/_sparse.pyx":372
+ *     cdef np.ndarray[np.int32_t, ndim=1, mode='c'] T_NCOL = np.zeros([size], dtype=np.int32)
+ *     cdef np.ndarray[np.int32_t, ndim=1, mode='c'] OFF = np.zeros([n_s + 1], dtype=np.int32)
+ *     cdef int[::1] tptr = T_PTR             # <<<<<<<<<<<<<<
+ *     cdef int[::1] tncol = T_NCOL
+ *     cdef int[::1] off = OFF
  */
+  __pyx_t_1 = __Pyx_PyObject_to_MemoryviewSlice_dc_int(((PyObject *)__pyx_v_T_PTR), PyBUF_WRITABLE); if (unlikely(!__pyx_t_1.memview)) __PYX_ERR(0, 372, __pyx_L1_error)
+  __pyx_v_tptr = __pyx_t_1;
+  __pyx_t_1.memview = NULL;
+  __pyx_t_1.data = NULL;
 
-static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew2(PyObject *__pyx_v_a, PyObject *__pyx_v_b) {
-  PyObject *__pyx_r = NULL;
-  __Pyx_RefNannyDeclarations
-  PyObject *__pyx_t_1 = NULL;
-  __Pyx_RefNannySetupContext("PyArray_MultiIterNew2", 0);
-
-  /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":825
- * 
- * cdef inline object PyArray_MultiIterNew2(a, b):
- *     return PyArray_MultiIterNew(2, <void*>a, <void*>b)             # <<<<<<<<<<<<<<
+  /* "sisl/_sparse.pyx":373
+ *     cdef np.ndarray[np.int32_t, ndim=1, mode='c'] OFF = np.zeros([n_s + 1], dtype=np.int32)
+ *     cdef int[::1] tptr = T_PTR
+ *     cdef int[::1] tncol = T_NCOL             # <<<<<<<<<<<<<<
+ *     cdef int[::1] off = OFF
  * 
- * cdef inline object PyArray_MultiIterNew3(a, b, c):
  */
-  __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = PyArray_MultiIterNew(2, ((void *)__pyx_v_a), ((void *)__pyx_v_b)); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 825, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_r = __pyx_t_1;
-  __pyx_t_1 = 0;
-  goto __pyx_L0;
+  __pyx_t_1 = __Pyx_PyObject_to_MemoryviewSlice_dc_int(((PyObject *)__pyx_v_T_NCOL), PyBUF_WRITABLE); if (unlikely(!__pyx_t_1.memview)) __PYX_ERR(0, 373, __pyx_L1_error)
+  __pyx_v_tncol = __pyx_t_1;
+  __pyx_t_1.memview = NULL;
+  __pyx_t_1.data = NULL;
 
-  /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":824
- *     return PyArray_MultiIterNew(1, <void*>a)
- * 
- * cdef inline object PyArray_MultiIterNew2(a, b):             # <<<<<<<<<<<<<<
- *     return PyArray_MultiIterNew(2, <void*>a, <void*>b)
+  /* "sisl/_sparse.pyx":374
+ *     cdef int[::1] tptr = T_PTR
+ *     cdef int[::1] tncol = T_NCOL
+ *     cdef int[::1] off = OFF             # <<<<<<<<<<<<<<
  * 
+ *     cdef int r, i, t, n, nnz
  */
+  __pyx_t_1 = __Pyx_PyObject_to_MemoryviewSlice_dc_int(((PyObject *)__pyx_v_OFF), PyBUF_WRITABLE); if (unlikely(!__pyx_t_1.memview)) __PYX_ERR(0, 374, __pyx_L1_error)
+  __pyx_v_off = __pyx_t_1;
+  __pyx_t_1.memview = NULL;
+  __pyx_t_1.data = NULL;
 
-  /* function exit code */
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("numpy.PyArray_MultiIterNew2", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __pyx_r = 0;
-  __pyx_L0:;
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":827
- *     return PyArray_MultiIterNew(2, <void*>a, <void*>b)
- * 
- * cdef inline object PyArray_MultiIterNew3(a, b, c):             # <<<<<<<<<<<<<<
- *     return PyArray_MultiIterNew(3, <void*>a, <void*>b, <void*> c)
+  /* "sisl/_sparse.pyx":379
  * 
+ *     # Count elements per transposed row and per transposed supercell
+ *     nnz = 0             # <<<<<<<<<<<<<<
+ *     for r in range(nr):
+ *         for i in range(ptr[r], ptr[r] + ncol[r]):
  */
+  __pyx_v_nnz = 0;
 
-static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew3(PyObject *__pyx_v_a, PyObject *__pyx_v_b, PyObject *__pyx_v_c) {
-  PyObject *__pyx_r = NULL;
-  __Pyx_RefNannyDeclarations
-  PyObject *__pyx_t_1 = NULL;
-  __Pyx_RefNannySetupContext("PyArray_MultiIterNew3", 0);
-
-  /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":828
- * 
- * cdef inline object PyArray_MultiIterNew3(a, b, c):
- *     return PyArray_MultiIterNew(3, <void*>a, <void*>b, <void*> c)             # <<<<<<<<<<<<<<
- * 
- * cdef inline object PyArray_MultiIterNew4(a, b, c, d):
+  /* "sisl/_sparse.pyx":380
+ *     # Count elements per transposed row and per transposed supercell
+ *     nnz = 0
+ *     for r in range(nr):             # <<<<<<<<<<<<<<
+ *         for i in range(ptr[r], ptr[r] + ncol[r]):
+ *             tncol[col[i] % size] += 1
  */
-  __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = PyArray_MultiIterNew(3, ((void *)__pyx_v_a), ((void *)__pyx_v_b), ((void *)__pyx_v_c)); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 828, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_r = __pyx_t_1;
-  __pyx_t_1 = 0;
-  goto __pyx_L0;
+  __pyx_t_10 = __pyx_v_nr;
+  __pyx_t_11 = __pyx_t_10;
+  for (__pyx_t_12 = 0; __pyx_t_12 < __pyx_t_11; __pyx_t_12+=1) {
+    __pyx_v_r = __pyx_t_12;
 
-  /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":827
- *     return PyArray_MultiIterNew(2, <void*>a, <void*>b)
- * 
- * cdef inline object PyArray_MultiIterNew3(a, b, c):             # <<<<<<<<<<<<<<
- *     return PyArray_MultiIterNew(3, <void*>a, <void*>b, <void*> c)
- * 
+    /* "sisl/_sparse.pyx":381
+ *     nnz = 0
+ *     for r in range(nr):
+ *         for i in range(ptr[r], ptr[r] + ncol[r]):             # <<<<<<<<<<<<<<
+ *             tncol[col[i] % size] += 1
+ *             off[isc[col[i] / size] + 1] += 1
  */
+    __pyx_t_13 = __pyx_v_r;
+    __pyx_t_14 = __pyx_v_r;
+    __pyx_t_15 = ((*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_ptr.data) + __pyx_t_13)) ))) + (*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_ncol.data) + __pyx_t_14)) ))));
+    __pyx_t_16 = __pyx_v_r;
+    __pyx_t_17 = __pyx_t_15;
+    for (__pyx_t_18 = (*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_ptr.data) + __pyx_t_16)) ))); __pyx_t_18 < __pyx_t_17; __pyx_t_18+=1) {
+      __pyx_v_i = __pyx_t_18;
 
-  /* function exit code */
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("numpy.PyArray_MultiIterNew3", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __pyx_r = 0;
-  __pyx_L0:;
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":830
- *     return PyArray_MultiIterNew(3, <void*>a, <void*>b, <void*> c)
- * 
- * cdef inline object PyArray_MultiIterNew4(a, b, c, d):             # <<<<<<<<<<<<<<
- *     return PyArray_MultiIterNew(4, <void*>a, <void*>b, <void*>c, <void*> d)
- * 
+      /* "sisl/_sparse.pyx":382
+ *     for r in range(nr):
+ *         for i in range(ptr[r], ptr[r] + ncol[r]):
+ *             tncol[col[i] % size] += 1             # <<<<<<<<<<<<<<
+ *             off[isc[col[i] / size] + 1] += 1
+ *         nnz += ncol[r]
  */
+      __pyx_t_19 = __pyx_v_i;
+      __pyx_t_20 = ((*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_col.data) + __pyx_t_19)) ))) % __pyx_v_size);
+      *((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_tncol.data) + __pyx_t_20)) )) += 1;
 
-static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew4(PyObject *__pyx_v_a, PyObject *__pyx_v_b, PyObject *__pyx_v_c, PyObject *__pyx_v_d) {
-  PyObject *__pyx_r = NULL;
-  __Pyx_RefNannyDeclarations
-  PyObject *__pyx_t_1 = NULL;
-  __Pyx_RefNannySetupContext("PyArray_MultiIterNew4", 0);
-
-  /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":831
- * 
- * cdef inline object PyArray_MultiIterNew4(a, b, c, d):
- *     return PyArray_MultiIterNew(4, <void*>a, <void*>b, <void*>c, <void*> d)             # <<<<<<<<<<<<<<
+      /* "sisl/_sparse.pyx":383
+ *         for i in range(ptr[r], ptr[r] + ncol[r]):
+ *             tncol[col[i] % size] += 1
+ *             off[isc[col[i] / size] + 1] += 1             # <<<<<<<<<<<<<<
+ *         nnz += ncol[r]
  * 
- * cdef inline object PyArray_MultiIterNew5(a, b, c, d, e):
  */
-  __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = PyArray_MultiIterNew(4, ((void *)__pyx_v_a), ((void *)__pyx_v_b), ((void *)__pyx_v_c), ((void *)__pyx_v_d)); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 831, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_r = __pyx_t_1;
-  __pyx_t_1 = 0;
-  goto __pyx_L0;
+      __pyx_t_21 = __pyx_v_i;
+      __pyx_t_22 = ((*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_col.data) + __pyx_t_21)) ))) / __pyx_v_size);
+      __pyx_t_23 = ((*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_isc.data) + __pyx_t_22)) ))) + 1);
+      *((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_off.data) + __pyx_t_23)) )) += 1;
+    }
 
-  /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":830
- *     return PyArray_MultiIterNew(3, <void*>a, <void*>b, <void*> c)
- * 
- * cdef inline object PyArray_MultiIterNew4(a, b, c, d):             # <<<<<<<<<<<<<<
- *     return PyArray_MultiIterNew(4, <void*>a, <void*>b, <void*>c, <void*> d)
+    /* "sisl/_sparse.pyx":384
+ *             tncol[col[i] % size] += 1
+ *             off[isc[col[i] / size] + 1] += 1
+ *         nnz += ncol[r]             # <<<<<<<<<<<<<<
  * 
+ *     for r in range(size):
  */
+    __pyx_t_24 = __pyx_v_r;
+    __pyx_v_nnz = (__pyx_v_nnz + (*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_ncol.data) + __pyx_t_24)) ))));
+  }
 
-  /* function exit code */
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("numpy.PyArray_MultiIterNew4", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __pyx_r = 0;
-  __pyx_L0:;
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":833
- *     return PyArray_MultiIterNew(4, <void*>a, <void*>b, <void*>c, <void*> d)
- * 
- * cdef inline object PyArray_MultiIterNew5(a, b, c, d, e):             # <<<<<<<<<<<<<<
- *     return PyArray_MultiIterNew(5, <void*>a, <void*>b, <void*>c, <void*> d, <void*> e)
+  /* "sisl/_sparse.pyx":386
+ *         nnz += ncol[r]
  * 
+ *     for r in range(size):             # <<<<<<<<<<<<<<
+ *         tptr[r + 1] = tptr[r] + tncol[r]
+ *     for t in range(n_s):
  */
+  __pyx_t_10 = __pyx_v_size;
+  __pyx_t_11 = __pyx_t_10;
+  for (__pyx_t_12 = 0; __pyx_t_12 < __pyx_t_11; __pyx_t_12+=1) {
+    __pyx_v_r = __pyx_t_12;
 
-static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew5(PyObject *__pyx_v_a, PyObject *__pyx_v_b, PyObject *__pyx_v_c, PyObject *__pyx_v_d, PyObject *__pyx_v_e) {
-  PyObject *__pyx_r = NULL;
-  __Pyx_RefNannyDeclarations
-  PyObject *__pyx_t_1 = NULL;
-  __Pyx_RefNannySetupContext("PyArray_MultiIterNew5", 0);
-
-  /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":834
- * 
- * cdef inline object PyArray_MultiIterNew5(a, b, c, d, e):
- *     return PyArray_MultiIterNew(5, <void*>a, <void*>b, <void*>c, <void*> d, <void*> e)             # <<<<<<<<<<<<<<
+    /* "sisl/_sparse.pyx":387
  * 
- * cdef inline tuple PyDataType_SHAPE(dtype d):
+ *     for r in range(size):
+ *         tptr[r + 1] = tptr[r] + tncol[r]             # <<<<<<<<<<<<<<
+ *     for t in range(n_s):
+ *         off[t + 1] += off[t]
  */
-  __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = PyArray_MultiIterNew(5, ((void *)__pyx_v_a), ((void *)__pyx_v_b), ((void *)__pyx_v_c), ((void *)__pyx_v_d), ((void *)__pyx_v_e)); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 834, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_r = __pyx_t_1;
-  __pyx_t_1 = 0;
-  goto __pyx_L0;
+    __pyx_t_25 = __pyx_v_r;
+    __pyx_t_26 = __pyx_v_r;
+    __pyx_t_27 = (__pyx_v_r + 1);
+    *((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_tptr.data) + __pyx_t_27)) )) = ((*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_tptr.data) + __pyx_t_25)) ))) + (*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_tncol.data) + __pyx_t_26)) ))));
+  }
 
-  /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":833
- *     return PyArray_MultiIterNew(4, <void*>a, <void*>b, <void*>c, <void*> d)
- * 
- * cdef inline object PyArray_MultiIterNew5(a, b, c, d, e):             # <<<<<<<<<<<<<<
- *     return PyArray_MultiIterNew(5, <void*>a, <void*>b, <void*>c, <void*> d, <void*> e)
+  /* "sisl/_sparse.pyx":388
+ *     for r in range(size):
+ *         tptr[r + 1] = tptr[r] + tncol[r]
+ *     for t in range(n_s):             # <<<<<<<<<<<<<<
+ *         off[t + 1] += off[t]
  * 
  */
+  __pyx_t_10 = __pyx_v_n_s;
+  __pyx_t_11 = __pyx_t_10;
+  for (__pyx_t_12 = 0; __pyx_t_12 < __pyx_t_11; __pyx_t_12+=1) {
+    __pyx_v_t = __pyx_t_12;
 
-  /* function exit code */
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("numpy.PyArray_MultiIterNew5", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __pyx_r = 0;
-  __pyx_L0:;
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":836
- *     return PyArray_MultiIterNew(5, <void*>a, <void*>b, <void*>c, <void*> d, <void*> e)
+    /* "sisl/_sparse.pyx":389
+ *         tptr[r + 1] = tptr[r] + tncol[r]
+ *     for t in range(n_s):
+ *         off[t + 1] += off[t]             # <<<<<<<<<<<<<<
  * 
- * cdef inline tuple PyDataType_SHAPE(dtype d):             # <<<<<<<<<<<<<<
- *     if PyDataType_HASSUBARRAY(d):
- *         return <tuple>d.subarray.shape
+ *     cdef np.ndarray[np.int32_t, ndim=1, mode='c'] T_COL = np.empty([nnz], dtype=np.int32)
  */
+    __pyx_t_28 = __pyx_v_t;
+    __pyx_t_29 = (__pyx_v_t + 1);
+    *((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_off.data) + __pyx_t_29)) )) += (*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_off.data) + __pyx_t_28)) )));
+  }
 
-static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyDataType_SHAPE(PyArray_Descr *__pyx_v_d) {
-  PyObject *__pyx_r = NULL;
-  __Pyx_RefNannyDeclarations
-  int __pyx_t_1;
-  __Pyx_RefNannySetupContext("PyDataType_SHAPE", 0);
-
-  /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":837
+  /* "sisl/_sparse.pyx":391
+ *         off[t + 1] += off[t]
  * 
- * cdef inline tuple PyDataType_SHAPE(dtype d):
- *     if PyDataType_HASSUBARRAY(d):             # <<<<<<<<<<<<<<
- *         return <tuple>d.subarray.shape
- *     else:
- */
-  __pyx_t_1 = (PyDataType_HASSUBARRAY(__pyx_v_d) != 0);
-  if (__pyx_t_1) {
-
-    /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":838
- * cdef inline tuple PyDataType_SHAPE(dtype d):
- *     if PyDataType_HASSUBARRAY(d):
- *         return <tuple>d.subarray.shape             # <<<<<<<<<<<<<<
- *     else:
- *         return ()
+ *     cdef np.ndarray[np.int32_t, ndim=1, mode='c'] T_COL = np.empty([nnz], dtype=np.int32)             # <<<<<<<<<<<<<<
+ *     cdef np.ndarray[np.int32_t, ndim=1, mode='c'] IDX = np.empty([nnz], dtype=np.int32)
+ *     cdef np.ndarray[np.int32_t, ndim=1, mode='c'] S_COL = np.empty([nnz], dtype=np.int32)
  */
-    __Pyx_XDECREF(__pyx_r);
-    __Pyx_INCREF(((PyObject*)__pyx_v_d->subarray->shape));
-    __pyx_r = ((PyObject*)__pyx_v_d->subarray->shape);
-    goto __pyx_L0;
+  __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_n_s_np); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 391, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_n_s_empty); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 391, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_t_3 = __Pyx_PyInt_From_int(__pyx_v_nnz); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 391, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_5 = PyList_New(1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 391, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_GIVEREF(__pyx_t_3);
+  PyList_SET_ITEM(__pyx_t_5, 0, __pyx_t_3);
+  __pyx_t_3 = 0;
+  __pyx_t_3 = PyTuple_New(1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 391, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_GIVEREF(__pyx_t_5);
+  PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_t_5);
+  __pyx_t_5 = 0;
+  __pyx_t_5 = __Pyx_PyDict_NewPresized(1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 391, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_np); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 391, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_int32); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 391, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  if (PyDict_SetItem(__pyx_t_5, __pyx_n_s_dtype, __pyx_t_4) < 0) __PYX_ERR(0, 391, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_t_4 = __Pyx_PyObject_Call(__pyx_t_6, __pyx_t_3, __pyx_t_5); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 391, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  if (!(likely(((__pyx_t_4) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_4, __pyx_ptype_5numpy_ndarray))))) __PYX_ERR(0, 391, __pyx_L1_error)
+  __pyx_t_30 = ((PyArrayObject *)__pyx_t_4);
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_T_COL.rcbuffer->pybuffer, (PyObject*)__pyx_t_30, &__Pyx_TypeInfo_nn___pyx_t_5numpy_int32_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) {
+      __pyx_v_T_COL = ((PyArrayObject *)Py_None); __Pyx_INCREF(Py_None); __pyx_pybuffernd_T_COL.rcbuffer->pybuffer.buf = NULL;
+      __PYX_ERR(0, 391, __pyx_L1_error)
+    } else {__pyx_pybuffernd_T_COL.diminfo[0].strides = __pyx_pybuffernd_T_COL.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_T_COL.diminfo[0].shape = __pyx_pybuffernd_T_COL.rcbuffer->pybuffer.shape[0];
+    }
+  }
+  __pyx_t_30 = 0;
+  __pyx_v_T_COL = ((PyArrayObject *)__pyx_t_4);
+  __pyx_t_4 = 0;
 
-    /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":837
+  /* "sisl/_sparse.pyx":392
  * 
- * cdef inline tuple PyDataType_SHAPE(dtype d):
- *     if PyDataType_HASSUBARRAY(d):             # <<<<<<<<<<<<<<
- *         return <tuple>d.subarray.shape
- *     else:
+ *     cdef np.ndarray[np.int32_t, ndim=1, mode='c'] T_COL = np.empty([nnz], dtype=np.int32)
+ *     cdef np.ndarray[np.int32_t, ndim=1, mode='c'] IDX = np.empty([nnz], dtype=np.int32)             # <<<<<<<<<<<<<<
+ *     cdef np.ndarray[np.int32_t, ndim=1, mode='c'] S_COL = np.empty([nnz], dtype=np.int32)
+ *     cdef np.ndarray[np.int32_t, ndim=1, mode='c'] S_IDX = np.empty([nnz], dtype=np.int32)
  */
+  __Pyx_GetModuleGlobalName(__pyx_t_4, __pyx_n_s_np); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 392, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_4, __pyx_n_s_empty); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 392, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_t_4 = __Pyx_PyInt_From_int(__pyx_v_nnz); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 392, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_3 = PyList_New(1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 392, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_GIVEREF(__pyx_t_4);
+  PyList_SET_ITEM(__pyx_t_3, 0, __pyx_t_4);
+  __pyx_t_4 = 0;
+  __pyx_t_4 = PyTuple_New(1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 392, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_GIVEREF(__pyx_t_3);
+  PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_t_3);
+  __pyx_t_3 = 0;
+  __pyx_t_3 = __Pyx_PyDict_NewPresized(1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 392, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_GetModuleGlobalName(__pyx_t_6, __pyx_n_s_np); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 392, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_t_6, __pyx_n_s_int32); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 392, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  if (PyDict_SetItem(__pyx_t_3, __pyx_n_s_dtype, __pyx_t_2) < 0) __PYX_ERR(0, 392, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_2 = __Pyx_PyObject_Call(__pyx_t_5, __pyx_t_4, __pyx_t_3); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 392, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  if (!(likely(((__pyx_t_2) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_2, __pyx_ptype_5numpy_ndarray))))) __PYX_ERR(0, 392, __pyx_L1_error)
+  __pyx_t_31 = ((PyArrayObject *)__pyx_t_2);
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_IDX.rcbuffer->pybuffer, (PyObject*)__pyx_t_31, &__Pyx_TypeInfo_nn___pyx_t_5numpy_int32_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) {
+      __pyx_v_IDX = ((PyArrayObject *)Py_None); __Pyx_INCREF(Py_None); __pyx_pybuffernd_IDX.rcbuffer->pybuffer.buf = NULL;
+      __PYX_ERR(0, 392, __pyx_L1_error)
+    } else {__pyx_pybuffernd_IDX.diminfo[0].strides = __pyx_pybuffernd_IDX.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_IDX.diminfo[0].shape = __pyx_pybuffernd_IDX.rcbuffer->pybuffer.shape[0];
+    }
   }
+  __pyx_t_31 = 0;
+  __pyx_v_IDX = ((PyArrayObject *)__pyx_t_2);
+  __pyx_t_2 = 0;
 
-  /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":840
- *         return <tuple>d.subarray.shape
- *     else:
- *         return ()             # <<<<<<<<<<<<<<
- * 
- * cdef inline char* _util_dtypestring(dtype descr, char* f, char* end, int* offset) except NULL:
- */
-  /*else*/ {
-    __Pyx_XDECREF(__pyx_r);
-    __Pyx_INCREF(__pyx_empty_tuple);
-    __pyx_r = __pyx_empty_tuple;
-    goto __pyx_L0;
-  }
-
-  /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":836
- *     return PyArray_MultiIterNew(5, <void*>a, <void*>b, <void*>c, <void*> d, <void*> e)
- * 
- * cdef inline tuple PyDataType_SHAPE(dtype d):             # <<<<<<<<<<<<<<
- *     if PyDataType_HASSUBARRAY(d):
- *         return <tuple>d.subarray.shape
+  /* "sisl/_sparse.pyx":393
+ *     cdef np.ndarray[np.int32_t, ndim=1, mode='c'] T_COL = np.empty([nnz], dtype=np.int32)
+ *     cdef np.ndarray[np.int32_t, ndim=1, mode='c'] IDX = np.empty([nnz], dtype=np.int32)
+ *     cdef np.ndarray[np.int32_t, ndim=1, mode='c'] S_COL = np.empty([nnz], dtype=np.int32)             # <<<<<<<<<<<<<<
+ *     cdef np.ndarray[np.int32_t, ndim=1, mode='c'] S_IDX = np.empty([nnz], dtype=np.int32)
+ *     cdef int[::1] tcol = T_COL
  */
+  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_np); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 393, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_empty); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 393, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_2 = __Pyx_PyInt_From_int(__pyx_v_nnz); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 393, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_4 = PyList_New(1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 393, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_GIVEREF(__pyx_t_2);
+  PyList_SET_ITEM(__pyx_t_4, 0, __pyx_t_2);
+  __pyx_t_2 = 0;
+  __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 393, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_GIVEREF(__pyx_t_4);
+  PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_t_4);
+  __pyx_t_4 = 0;
+  __pyx_t_4 = __Pyx_PyDict_NewPresized(1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 393, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_GetModuleGlobalName(__pyx_t_5, __pyx_n_s_np); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 393, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_t_5, __pyx_n_s_int32); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 393, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  if (PyDict_SetItem(__pyx_t_4, __pyx_n_s_dtype, __pyx_t_6) < 0) __PYX_ERR(0, 393, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  __pyx_t_6 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_t_2, __pyx_t_4); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 393, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  if (!(likely(((__pyx_t_6) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_6, __pyx_ptype_5numpy_ndarray))))) __PYX_ERR(0, 393, __pyx_L1_error)
+  __pyx_t_32 = ((PyArrayObject *)__pyx_t_6);
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_S_COL.rcbuffer->pybuffer, (PyObject*)__pyx_t_32, &__Pyx_TypeInfo_nn___pyx_t_5numpy_int32_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) {
+      __pyx_v_S_COL = ((PyArrayObject *)Py_None); __Pyx_INCREF(Py_None); __pyx_pybuffernd_S_COL.rcbuffer->pybuffer.buf = NULL;
+      __PYX_ERR(0, 393, __pyx_L1_error)
+    } else {__pyx_pybuffernd_S_COL.diminfo[0].strides = __pyx_pybuffernd_S_COL.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_S_COL.diminfo[0].shape = __pyx_pybuffernd_S_COL.rcbuffer->pybuffer.shape[0];
+    }
+  }
+  __pyx_t_32 = 0;
+  __pyx_v_S_COL = ((PyArrayObject *)__pyx_t_6);
+  __pyx_t_6 = 0;
 
-  /* function exit code */
-  __pyx_L0:;
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
+  /* "sisl/_sparse.pyx":394
+ *     cdef np.ndarray[np.int32_t, ndim=1, mode='c'] IDX = np.empty([nnz], dtype=np.int32)
+ *     cdef np.ndarray[np.int32_t, ndim=1, mode='c'] S_COL = np.empty([nnz], dtype=np.int32)
+ *     cdef np.ndarray[np.int32_t, ndim=1, mode='c'] S_IDX = np.empty([nnz], dtype=np.int32)             # <<<<<<<<<<<<<<
+ *     cdef int[::1] tcol = T_COL
+ *     cdef int[::1] idx = IDX
+ */
+  __Pyx_GetModuleGlobalName(__pyx_t_6, __pyx_n_s_np); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 394, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_t_6, __pyx_n_s_empty); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 394, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  __pyx_t_6 = __Pyx_PyInt_From_int(__pyx_v_nnz); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 394, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __pyx_t_2 = PyList_New(1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 394, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_GIVEREF(__pyx_t_6);
+  PyList_SET_ITEM(__pyx_t_2, 0, __pyx_t_6);
+  __pyx_t_6 = 0;
+  __pyx_t_6 = PyTuple_New(1); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 394, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_GIVEREF(__pyx_t_2);
+  PyTuple_SET_ITEM(__pyx_t_6, 0, __pyx_t_2);
+  __pyx_t_2 = 0;
+  __pyx_t_2 = __Pyx_PyDict_NewPresized(1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 394, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_n_s_np); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 394, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_n_s_int32); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 394, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  if (PyDict_SetItem(__pyx_t_2, __pyx_n_s_dtype, __pyx_t_5) < 0) __PYX_ERR(0, 394, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __pyx_t_5 = __Pyx_PyObject_Call(__pyx_t_4, __pyx_t_6, __pyx_t_2); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 394, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  if (!(likely(((__pyx_t_5) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_5, __pyx_ptype_5numpy_ndarray))))) __PYX_ERR(0, 394, __pyx_L1_error)
+  __pyx_t_33 = ((PyArrayObject *)__pyx_t_5);
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_S_IDX.rcbuffer->pybuffer, (PyObject*)__pyx_t_33, &__Pyx_TypeInfo_nn___pyx_t_5numpy_int32_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) {
+      __pyx_v_S_IDX = ((PyArrayObject *)Py_None); __Pyx_INCREF(Py_None); __pyx_pybuffernd_S_IDX.rcbuffer->pybuffer.buf = NULL;
+      __PYX_ERR(0, 394, __pyx_L1_error)
+    } else {__pyx_pybuffernd_S_IDX.diminfo[0].strides = __pyx_pybuffernd_S_IDX.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_S_IDX.diminfo[0].shape = __pyx_pybuffernd_S_IDX.rcbuffer->pybuffer.shape[0];
+    }
+  }
+  __pyx_t_33 = 0;
+  __pyx_v_S_IDX = ((PyArrayObject *)__pyx_t_5);
+  __pyx_t_5 = 0;
 
-/* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":842
- *         return ()
- * 
- * cdef inline char* _util_dtypestring(dtype descr, char* f, char* end, int* offset) except NULL:             # <<<<<<<<<<<<<<
- *     # Recursive utility function used in __getbuffer__ to get format
- *     # string. The new location in the format string is returned.
+  /* "sisl/_sparse.pyx":395
+ *     cdef np.ndarray[np.int32_t, ndim=1, mode='c'] S_COL = np.empty([nnz], dtype=np.int32)
+ *     cdef np.ndarray[np.int32_t, ndim=1, mode='c'] S_IDX = np.empty([nnz], dtype=np.int32)
+ *     cdef int[::1] tcol = T_COL             # <<<<<<<<<<<<<<
+ *     cdef int[::1] idx = IDX
+ *     cdef int[::1] scol = S_COL
  */
+  __pyx_t_1 = __Pyx_PyObject_to_MemoryviewSlice_dc_int(((PyObject *)__pyx_v_T_COL), PyBUF_WRITABLE); if (unlikely(!__pyx_t_1.memview)) __PYX_ERR(0, 395, __pyx_L1_error)
+  __pyx_v_tcol = __pyx_t_1;
+  __pyx_t_1.memview = NULL;
+  __pyx_t_1.data = NULL;
 
-static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx_v_descr, char *__pyx_v_f, char *__pyx_v_end, int *__pyx_v_offset) {
-  PyArray_Descr *__pyx_v_child = 0;
-  int __pyx_v_endian_detector;
-  int __pyx_v_little_endian;
-  PyObject *__pyx_v_fields = 0;
-  PyObject *__pyx_v_childname = NULL;
-  PyObject *__pyx_v_new_offset = NULL;
-  PyObject *__pyx_v_t = NULL;
-  char *__pyx_r;
-  __Pyx_RefNannyDeclarations
-  PyObject *__pyx_t_1 = NULL;
-  Py_ssize_t __pyx_t_2;
-  PyObject *__pyx_t_3 = NULL;
-  PyObject *__pyx_t_4 = NULL;
-  int __pyx_t_5;
-  int __pyx_t_6;
-  int __pyx_t_7;
-  long __pyx_t_8;
-  char *__pyx_t_9;
-  __Pyx_RefNannySetupContext("_util_dtypestring", 0);
+  /* "sisl/_sparse.pyx":396
+ *     cdef np.ndarray[np.int32_t, ndim=1, mode='c'] S_IDX = np.empty([nnz], dtype=np.int32)
+ *     cdef int[::1] tcol = T_COL
+ *     cdef int[::1] idx = IDX             # <<<<<<<<<<<<<<
+ *     cdef int[::1] scol = S_COL
+ *     cdef int[::1] sidx = S_IDX
+ */
+  __pyx_t_1 = __Pyx_PyObject_to_MemoryviewSlice_dc_int(((PyObject *)__pyx_v_IDX), PyBUF_WRITABLE); if (unlikely(!__pyx_t_1.memview)) __PYX_ERR(0, 396, __pyx_L1_error)
+  __pyx_v_idx = __pyx_t_1;
+  __pyx_t_1.memview = NULL;
+  __pyx_t_1.data = NULL;
 
-  /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":847
+  /* "sisl/_sparse.pyx":397
+ *     cdef int[::1] tcol = T_COL
+ *     cdef int[::1] idx = IDX
+ *     cdef int[::1] scol = S_COL             # <<<<<<<<<<<<<<
+ *     cdef int[::1] sidx = S_IDX
  * 
- *     cdef dtype child
- *     cdef int endian_detector = 1             # <<<<<<<<<<<<<<
- *     cdef bint little_endian = ((<char*>&endian_detector)[0] != 0)
- *     cdef tuple fields
  */
-  __pyx_v_endian_detector = 1;
+  __pyx_t_1 = __Pyx_PyObject_to_MemoryviewSlice_dc_int(((PyObject *)__pyx_v_S_COL), PyBUF_WRITABLE); if (unlikely(!__pyx_t_1.memview)) __PYX_ERR(0, 397, __pyx_L1_error)
+  __pyx_v_scol = __pyx_t_1;
+  __pyx_t_1.memview = NULL;
+  __pyx_t_1.data = NULL;
 
-  /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":848
- *     cdef dtype child
- *     cdef int endian_detector = 1
- *     cdef bint little_endian = ((<char*>&endian_detector)[0] != 0)             # <<<<<<<<<<<<<<
- *     cdef tuple fields
+  /* "sisl/_sparse.pyx":398
+ *     cdef int[::1] idx = IDX
+ *     cdef int[::1] scol = S_COL
+ *     cdef int[::1] sidx = S_IDX             # <<<<<<<<<<<<<<
  * 
+ *     with nogil:
  */
-  __pyx_v_little_endian = ((((char *)(&__pyx_v_endian_detector))[0]) != 0);
+  __pyx_t_1 = __Pyx_PyObject_to_MemoryviewSlice_dc_int(((PyObject *)__pyx_v_S_IDX), PyBUF_WRITABLE); if (unlikely(!__pyx_t_1.memview)) __PYX_ERR(0, 398, __pyx_L1_error)
+  __pyx_v_sidx = __pyx_t_1;
+  __pyx_t_1.memview = NULL;
+  __pyx_t_1.data = NULL;
 
-  /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":851
- *     cdef tuple fields
+  /* "sisl/_sparse.pyx":400
+ *     cdef int[::1] sidx = S_IDX
  * 
- *     for childname in descr.names:             # <<<<<<<<<<<<<<
- *         fields = descr.fields[childname]
- *         child, new_offset = fields
+ *     with nogil:             # <<<<<<<<<<<<<<
+ *         # Stable sort by the transposed supercell index (rows are traversed in order)
+ *         for r in range(nr):
  */
-  if (unlikely(__pyx_v_descr->names == Py_None)) {
-    PyErr_SetString(PyExc_TypeError, "'NoneType' object is not iterable");
-    __PYX_ERR(1, 851, __pyx_L1_error)
-  }
-  __pyx_t_1 = __pyx_v_descr->names; __Pyx_INCREF(__pyx_t_1); __pyx_t_2 = 0;
-  for (;;) {
-    if (__pyx_t_2 >= PyTuple_GET_SIZE(__pyx_t_1)) break;
-    #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
-    __pyx_t_3 = PyTuple_GET_ITEM(__pyx_t_1, __pyx_t_2); __Pyx_INCREF(__pyx_t_3); __pyx_t_2++; if (unlikely(0 < 0)) __PYX_ERR(1, 851, __pyx_L1_error)
-    #else
-    __pyx_t_3 = PySequence_ITEM(__pyx_t_1, __pyx_t_2); __pyx_t_2++; if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 851, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_3);
-    #endif
-    __Pyx_XDECREF_SET(__pyx_v_childname, __pyx_t_3);
-    __pyx_t_3 = 0;
+  {
+      #ifdef WITH_THREAD
+      PyThreadState *_save;
+      Py_UNBLOCK_THREADS
+      __Pyx_FastGIL_Remember();
+      #endif
+      /*try:*/ {
+
+        /* "sisl/_sparse.pyx":402
+ *     with nogil:
+ *         # Stable sort by the transposed supercell index (rows are traversed in order)
+ *         for r in range(nr):             # <<<<<<<<<<<<<<
+ *             for i in range(ptr[r], ptr[r] + ncol[r]):
+ *                 t = isc[col[i] / size]
+ */
+        __pyx_t_10 = __pyx_v_nr;
+        __pyx_t_11 = __pyx_t_10;
+        for (__pyx_t_12 = 0; __pyx_t_12 < __pyx_t_11; __pyx_t_12+=1) {
+          __pyx_v_r = __pyx_t_12;
+
+          /* "sisl/_sparse.pyx":403
+ *         # Stable sort by the transposed supercell index (rows are traversed in order)
+ *         for r in range(nr):
+ *             for i in range(ptr[r], ptr[r] + ncol[r]):             # <<<<<<<<<<<<<<
+ *                 t = isc[col[i] / size]
+ *                 n = off[t]
+ */
+          __pyx_t_34 = __pyx_v_r;
+          __pyx_t_35 = __pyx_v_r;
+          __pyx_t_15 = ((*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_ptr.data) + __pyx_t_34)) ))) + (*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_ncol.data) + __pyx_t_35)) ))));
+          __pyx_t_36 = __pyx_v_r;
+          __pyx_t_17 = __pyx_t_15;
+          for (__pyx_t_18 = (*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_ptr.data) + __pyx_t_36)) ))); __pyx_t_18 < __pyx_t_17; __pyx_t_18+=1) {
+            __pyx_v_i = __pyx_t_18;
+
+            /* "sisl/_sparse.pyx":404
+ *         for r in range(nr):
+ *             for i in range(ptr[r], ptr[r] + ncol[r]):
+ *                 t = isc[col[i] / size]             # <<<<<<<<<<<<<<
+ *                 n = off[t]
+ *                 off[t] = n + 1
+ */
+            __pyx_t_37 = __pyx_v_i;
+            __pyx_t_38 = ((*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_col.data) + __pyx_t_37)) ))) / __pyx_v_size);
+            __pyx_v_t = (*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_isc.data) + __pyx_t_38)) )));
+
+            /* "sisl/_sparse.pyx":405
+ *             for i in range(ptr[r], ptr[r] + ncol[r]):
+ *                 t = isc[col[i] / size]
+ *                 n = off[t]             # <<<<<<<<<<<<<<
+ *                 off[t] = n + 1
+ *                 scol[n] = r + t * size
+ */
+            __pyx_t_39 = __pyx_v_t;
+            __pyx_v_n = (*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_off.data) + __pyx_t_39)) )));
+
+            /* "sisl/_sparse.pyx":406
+ *                 t = isc[col[i] / size]
+ *                 n = off[t]
+ *                 off[t] = n + 1             # <<<<<<<<<<<<<<
+ *                 scol[n] = r + t * size
+ *                 sidx[n] = i
+ */
+            __pyx_t_40 = __pyx_v_t;
+            *((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_off.data) + __pyx_t_40)) )) = (__pyx_v_n + 1);
+
+            /* "sisl/_sparse.pyx":407
+ *                 n = off[t]
+ *                 off[t] = n + 1
+ *                 scol[n] = r + t * size             # <<<<<<<<<<<<<<
+ *                 sidx[n] = i
+ * 
+ */
+            __pyx_t_41 = __pyx_v_n;
+            *((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_scol.data) + __pyx_t_41)) )) = (__pyx_v_r + (__pyx_v_t * __pyx_v_size));
+
+            /* "sisl/_sparse.pyx":408
+ *                 off[t] = n + 1
+ *                 scol[n] = r + t * size
+ *                 sidx[n] = i             # <<<<<<<<<<<<<<
+ * 
+ *         # Stable sort by the transposed row, this yields sorted columns in each row
+ */
+            __pyx_t_42 = __pyx_v_n;
+            *((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_sidx.data) + __pyx_t_42)) )) = __pyx_v_i;
+          }
+        }
 
-    /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":852
+        /* "sisl/_sparse.pyx":411
  * 
- *     for childname in descr.names:
- *         fields = descr.fields[childname]             # <<<<<<<<<<<<<<
- *         child, new_offset = fields
+ *         # Stable sort by the transposed row, this yields sorted columns in each row
+ *         for r in range(size):             # <<<<<<<<<<<<<<
+ *             tncol[r] = tptr[r]
+ *         for n in range(nnz):
+ */
+        __pyx_t_10 = __pyx_v_size;
+        __pyx_t_11 = __pyx_t_10;
+        for (__pyx_t_12 = 0; __pyx_t_12 < __pyx_t_11; __pyx_t_12+=1) {
+          __pyx_v_r = __pyx_t_12;
+
+          /* "sisl/_sparse.pyx":412
+ *         # Stable sort by the transposed row, this yields sorted columns in each row
+ *         for r in range(size):
+ *             tncol[r] = tptr[r]             # <<<<<<<<<<<<<<
+ *         for n in range(nnz):
+ *             i = sidx[n]
+ */
+          __pyx_t_43 = __pyx_v_r;
+          __pyx_t_44 = __pyx_v_r;
+          *((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_tncol.data) + __pyx_t_44)) )) = (*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_tptr.data) + __pyx_t_43)) )));
+        }
+
+        /* "sisl/_sparse.pyx":413
+ *         for r in range(size):
+ *             tncol[r] = tptr[r]
+ *         for n in range(nnz):             # <<<<<<<<<<<<<<
+ *             i = sidx[n]
+ *             r = col[i] % size
+ */
+        __pyx_t_10 = __pyx_v_nnz;
+        __pyx_t_11 = __pyx_t_10;
+        for (__pyx_t_12 = 0; __pyx_t_12 < __pyx_t_11; __pyx_t_12+=1) {
+          __pyx_v_n = __pyx_t_12;
+
+          /* "sisl/_sparse.pyx":414
+ *             tncol[r] = tptr[r]
+ *         for n in range(nnz):
+ *             i = sidx[n]             # <<<<<<<<<<<<<<
+ *             r = col[i] % size
+ *             t = tncol[r]
+ */
+          __pyx_t_45 = __pyx_v_n;
+          __pyx_v_i = (*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_sidx.data) + __pyx_t_45)) )));
+
+          /* "sisl/_sparse.pyx":415
+ *         for n in range(nnz):
+ *             i = sidx[n]
+ *             r = col[i] % size             # <<<<<<<<<<<<<<
+ *             t = tncol[r]
+ *             tncol[r] = t + 1
+ */
+          __pyx_t_46 = __pyx_v_i;
+          __pyx_v_r = ((*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_col.data) + __pyx_t_46)) ))) % __pyx_v_size);
+
+          /* "sisl/_sparse.pyx":416
+ *             i = sidx[n]
+ *             r = col[i] % size
+ *             t = tncol[r]             # <<<<<<<<<<<<<<
+ *             tncol[r] = t + 1
+ *             tcol[t] = scol[n]
+ */
+          __pyx_t_47 = __pyx_v_r;
+          __pyx_v_t = (*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_tncol.data) + __pyx_t_47)) )));
+
+          /* "sisl/_sparse.pyx":417
+ *             r = col[i] % size
+ *             t = tncol[r]
+ *             tncol[r] = t + 1             # <<<<<<<<<<<<<<
+ *             tcol[t] = scol[n]
+ *             idx[t] = i
+ */
+          __pyx_t_48 = __pyx_v_r;
+          *((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_tncol.data) + __pyx_t_48)) )) = (__pyx_v_t + 1);
+
+          /* "sisl/_sparse.pyx":418
+ *             t = tncol[r]
+ *             tncol[r] = t + 1
+ *             tcol[t] = scol[n]             # <<<<<<<<<<<<<<
+ *             idx[t] = i
+ *         for r in range(size):
+ */
+          __pyx_t_49 = __pyx_v_n;
+          __pyx_t_50 = __pyx_v_t;
+          *((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_tcol.data) + __pyx_t_50)) )) = (*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_scol.data) + __pyx_t_49)) )));
+
+          /* "sisl/_sparse.pyx":419
+ *             tncol[r] = t + 1
+ *             tcol[t] = scol[n]
+ *             idx[t] = i             # <<<<<<<<<<<<<<
+ *         for r in range(size):
+ *             tncol[r] -= tptr[r]
+ */
+          __pyx_t_51 = __pyx_v_t;
+          *((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_idx.data) + __pyx_t_51)) )) = __pyx_v_i;
+        }
+
+        /* "sisl/_sparse.pyx":420
+ *             tcol[t] = scol[n]
+ *             idx[t] = i
+ *         for r in range(size):             # <<<<<<<<<<<<<<
+ *             tncol[r] -= tptr[r]
  * 
  */
-    if (unlikely(__pyx_v_descr->fields == Py_None)) {
-      PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
-      __PYX_ERR(1, 852, __pyx_L1_error)
-    }
-    __pyx_t_3 = __Pyx_PyDict_GetItem(__pyx_v_descr->fields, __pyx_v_childname); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 852, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_3);
-    if (!(likely(PyTuple_CheckExact(__pyx_t_3))||((__pyx_t_3) == Py_None)||(PyErr_Format(PyExc_TypeError, "Expected %.16s, got %.200s", "tuple", Py_TYPE(__pyx_t_3)->tp_name), 0))) __PYX_ERR(1, 852, __pyx_L1_error)
-    __Pyx_XDECREF_SET(__pyx_v_fields, ((PyObject*)__pyx_t_3));
-    __pyx_t_3 = 0;
+        __pyx_t_10 = __pyx_v_size;
+        __pyx_t_11 = __pyx_t_10;
+        for (__pyx_t_12 = 0; __pyx_t_12 < __pyx_t_11; __pyx_t_12+=1) {
+          __pyx_v_r = __pyx_t_12;
 
-    /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":853
- *     for childname in descr.names:
- *         fields = descr.fields[childname]
- *         child, new_offset = fields             # <<<<<<<<<<<<<<
+          /* "sisl/_sparse.pyx":421
+ *             idx[t] = i
+ *         for r in range(size):
+ *             tncol[r] -= tptr[r]             # <<<<<<<<<<<<<<
  * 
- *         if (end - f) - <int>(new_offset - offset[0]) < 15:
+ *     return T_PTR, T_NCOL, T_COL, IDX
  */
-    if (likely(__pyx_v_fields != Py_None)) {
-      PyObject* sequence = __pyx_v_fields;
-      Py_ssize_t size = __Pyx_PySequence_SIZE(sequence);
-      if (unlikely(size != 2)) {
-        if (size > 2) __Pyx_RaiseTooManyValuesError(2);
-        else if (size >= 0) __Pyx_RaiseNeedMoreValuesError(size);
-        __PYX_ERR(1, 853, __pyx_L1_error)
+          __pyx_t_52 = __pyx_v_r;
+          __pyx_t_53 = __pyx_v_r;
+          *((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_tncol.data) + __pyx_t_53)) )) -= (*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_tptr.data) + __pyx_t_52)) )));
+        }
       }
-      #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
-      __pyx_t_3 = PyTuple_GET_ITEM(sequence, 0); 
-      __pyx_t_4 = PyTuple_GET_ITEM(sequence, 1); 
-      __Pyx_INCREF(__pyx_t_3);
-      __Pyx_INCREF(__pyx_t_4);
-      #else
-      __pyx_t_3 = PySequence_ITEM(sequence, 0); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 853, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_3);
-      __pyx_t_4 = PySequence_ITEM(sequence, 1); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 853, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_4);
-      #endif
-    } else {
-      __Pyx_RaiseNoneNotIterableError(); __PYX_ERR(1, 853, __pyx_L1_error)
-    }
-    if (!(likely(((__pyx_t_3) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_3, __pyx_ptype_5numpy_dtype))))) __PYX_ERR(1, 853, __pyx_L1_error)
-    __Pyx_XDECREF_SET(__pyx_v_child, ((PyArray_Descr *)__pyx_t_3));
-    __pyx_t_3 = 0;
-    __Pyx_XDECREF_SET(__pyx_v_new_offset, __pyx_t_4);
-    __pyx_t_4 = 0;
 
-    /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":855
- *         child, new_offset = fields
- * 
- *         if (end - f) - <int>(new_offset - offset[0]) < 15:             # <<<<<<<<<<<<<<
- *             raise RuntimeError(u"Format string allocated too short, see comment in numpy.pxd")
+      /* "sisl/_sparse.pyx":400
+ *     cdef int[::1] sidx = S_IDX
  * 
+ *     with nogil:             # <<<<<<<<<<<<<<
+ *         # Stable sort by the transposed supercell index (rows are traversed in order)
+ *         for r in range(nr):
  */
-    __pyx_t_4 = __Pyx_PyInt_From_int((__pyx_v_offset[0])); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 855, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_4);
-    __pyx_t_3 = PyNumber_Subtract(__pyx_v_new_offset, __pyx_t_4); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 855, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_3);
-    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-    __pyx_t_5 = __Pyx_PyInt_As_int(__pyx_t_3); if (unlikely((__pyx_t_5 == (int)-1) && PyErr_Occurred())) __PYX_ERR(1, 855, __pyx_L1_error)
-    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    __pyx_t_6 = ((((__pyx_v_end - __pyx_v_f) - ((int)__pyx_t_5)) < 15) != 0);
-    if (unlikely(__pyx_t_6)) {
+      /*finally:*/ {
+        /*normal exit:*/{
+          #ifdef WITH_THREAD
+          __Pyx_FastGIL_Forget();
+          Py_BLOCK_THREADS
+          #endif
+          goto __pyx_L13;
+        }
+        __pyx_L13:;
+      }
+  }
 
-      /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":856
+  /* "sisl/_sparse.pyx":423
+ *             tncol[r] -= tptr[r]
+ * 
+ *     return T_PTR, T_NCOL, T_COL, IDX             # <<<<<<<<<<<<<<
  * 
- *         if (end - f) - <int>(new_offset - offset[0]) < 15:
- *             raise RuntimeError(u"Format string allocated too short, see comment in numpy.pxd")             # <<<<<<<<<<<<<<
  * 
- *         if ((child.byteorder == c'>' and little_endian) or
  */
-      __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_RuntimeError, __pyx_tuple__7, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 856, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_3);
-      __Pyx_Raise(__pyx_t_3, 0, 0, 0);
-      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-      __PYX_ERR(1, 856, __pyx_L1_error)
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_5 = PyTuple_New(4); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 423, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_INCREF(((PyObject *)__pyx_v_T_PTR));
+  __Pyx_GIVEREF(((PyObject *)__pyx_v_T_PTR));
+  PyTuple_SET_ITEM(__pyx_t_5, 0, ((PyObject *)__pyx_v_T_PTR));
+  __Pyx_INCREF(((PyObject *)__pyx_v_T_NCOL));
+  __Pyx_GIVEREF(((PyObject *)__pyx_v_T_NCOL));
+  PyTuple_SET_ITEM(__pyx_t_5, 1, ((PyObject *)__pyx_v_T_NCOL));
+  __Pyx_INCREF(((PyObject *)__pyx_v_T_COL));
+  __Pyx_GIVEREF(((PyObject *)__pyx_v_T_COL));
+  PyTuple_SET_ITEM(__pyx_t_5, 2, ((PyObject *)__pyx_v_T_COL));
+  __Pyx_INCREF(((PyObject *)__pyx_v_IDX));
+  __Pyx_GIVEREF(((PyObject *)__pyx_v_IDX));
+  PyTuple_SET_ITEM(__pyx_t_5, 3, ((PyObject *)__pyx_v_IDX));
+  __pyx_r = __pyx_t_5;
+  __pyx_t_5 = 0;
+  goto __pyx_L0;
 
-      /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":855
- *         child, new_offset = fields
- * 
- *         if (end - f) - <int>(new_offset - offset[0]) < 15:             # <<<<<<<<<<<<<<
- *             raise RuntimeError(u"Format string allocated too short, see comment in numpy.pxd")
- * 
+  /* "sisl/_sparse.pyx":339
+ * @cython.initializedcheck(False)
+ * @cython.cdivision(True)
+ * def sparse_transpose(np.ndarray[np.int32_t, ndim=1, mode='c'] PTR,             # <<<<<<<<<<<<<<
+ *                      np.ndarray[np.int32_t, ndim=1, mode='c'] NCOL,
+ *                      np.ndarray[np.int32_t, ndim=1, mode='c'] COL,
  */
-    }
 
-    /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":858
- *             raise RuntimeError(u"Format string allocated too short, see comment in numpy.pxd")
- * 
- *         if ((child.byteorder == c'>' and little_endian) or             # <<<<<<<<<<<<<<
+  /* function exit code */
+  __pyx_L1_error:;
+  __PYX_XDEC_MEMVIEW(&__pyx_t_1, 1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_6);
+  { PyObject *__pyx_type, *__pyx_value, *__pyx_tb;
+    __Pyx_PyThreadState_declare
+    __Pyx_PyThreadState_assign
+    __Pyx_ErrFetch(&__pyx_type, &__pyx_value, &__pyx_tb);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_COL.rcbuffer->pybuffer);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_IDX.rcbuffer->pybuffer);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_ISC.rcbuffer->pybuffer);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_NCOL.rcbuffer->pybuffer);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_OFF.rcbuffer->pybuffer);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_PTR.rcbuffer->pybuffer);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_S_COL.rcbuffer->pybuffer);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_S_IDX.rcbuffer->pybuffer);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_T_COL.rcbuffer->pybuffer);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_T_NCOL.rcbuffer->pybuffer);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_T_PTR.rcbuffer->pybuffer);
+  __Pyx_ErrRestore(__pyx_type, __pyx_value, __pyx_tb);}
+  __Pyx_AddTraceback("sisl._sparse.sparse_transpose", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  goto __pyx_L2;
+  __pyx_L0:;
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_COL.rcbuffer->pybuffer);
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_IDX.rcbuffer->pybuffer);
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_ISC.rcbuffer->pybuffer);
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_NCOL.rcbuffer->pybuffer);
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_OFF.rcbuffer->pybuffer);
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_PTR.rcbuffer->pybuffer);
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_S_COL.rcbuffer->pybuffer);
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_S_IDX.rcbuffer->pybuffer);
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_T_COL.rcbuffer->pybuffer);
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_T_NCOL.rcbuffer->pybuffer);
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_T_PTR.rcbuffer->pybuffer);
+  __pyx_L2:;
+  __PYX_XDEC_MEMVIEW(&__pyx_v_ptr, 1);
+  __PYX_XDEC_MEMVIEW(&__pyx_v_ncol, 1);
+  __PYX_XDEC_MEMVIEW(&__pyx_v_col, 1);
+  __PYX_XDEC_MEMVIEW(&__pyx_v_isc, 1);
+  __Pyx_XDECREF((PyObject *)__pyx_v_T_PTR);
+  __Pyx_XDECREF((PyObject *)__pyx_v_T_NCOL);
+  __Pyx_XDECREF((PyObject *)__pyx_v_OFF);
+  __PYX_XDEC_MEMVIEW(&__pyx_v_tptr, 1);
+  __PYX_XDEC_MEMVIEW(&__pyx_v_tncol, 1);
+  __PYX_XDEC_MEMVIEW(&__pyx_v_off, 1);
+  __Pyx_XDECREF((PyObject *)__pyx_v_T_COL);
+  __Pyx_XDECREF((PyObject *)__pyx_v_IDX);
+  __Pyx_XDECREF((PyObject *)__pyx_v_S_COL);
+  __Pyx_XDECREF((PyObject *)__pyx_v_S_IDX);
+  __PYX_XDEC_MEMVIEW(&__pyx_v_tcol, 1);
+  __PYX_XDEC_MEMVIEW(&__pyx_v_idx, 1);
+  __PYX_XDEC_MEMVIEW(&__pyx_v_scol, 1);
+  __PYX_XDEC_MEMVIEW(&__pyx_v_sidx, 1);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "sisl/_sparse.pyx":429
+ * @cython.wraparound(False)
+ * @cython.initializedcheck(False)
+ * def sparse_sub(np.ndarray[np.int32_t, ndim=1, mode='c'] PTR,             # <<<<<<<<<<<<<<
+ *                np.ndarray[np.int32_t, ndim=1, mode='c'] NCOL,
+ *                np.ndarray[np.int32_t, ndim=1, mode='c'] COL,
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_4sisl_7_sparse_11sparse_sub(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_4sisl_7_sparse_10sparse_sub[] = " Extract the rows `ROWS` of a sparsity pattern while translating the columns through `PVT`\n\n    Parameters\n    ----------\n    PTR, NCOL, COL : numpy.ndarray(np.int32)\n       the sparsity pattern\n    ROWS : numpy.ndarray(np.int32)\n       the rows that are retained (in the order of the new sparsity pattern)\n    PVT : numpy.ndarray(np.int32)\n       the new column index for each old column index (``-1`` for removed columns)\n\n    Returns\n    -------\n    ptr, ncol, col : the new sparsity pattern\n    idx : indices of the retained elements in `COL`\n    ";
+static PyMethodDef __pyx_mdef_4sisl_7_sparse_11sparse_sub = {"sparse_sub", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_4sisl_7_sparse_11sparse_sub, METH_VARARGS|METH_KEYWORDS, __pyx_doc_4sisl_7_sparse_10sparse_sub};
+static PyObject *__pyx_pw_4sisl_7_sparse_11sparse_sub(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyArrayObject *__pyx_v_PTR = 0;
+  PyArrayObject *__pyx_v_NCOL = 0;
+  PyArrayObject *__pyx_v_COL = 0;
+  PyArrayObject *__pyx_v_ROWS = 0;
+  PyArrayObject *__pyx_v_PVT = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("sparse_sub (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_PTR,&__pyx_n_s_NCOL,&__pyx_n_s_COL,&__pyx_n_s_ROWS,&__pyx_n_s_PVT,0};
+    PyObject* values[5] = {0,0,0,0,0};
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case  5: values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
+        CYTHON_FALLTHROUGH;
+        case  4: values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+        CYTHON_FALLTHROUGH;
+        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        CYTHON_FALLTHROUGH;
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_PTR)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_NCOL)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("sparse_sub", 1, 5, 5, 1); __PYX_ERR(0, 429, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  2:
+        if (likely((values[2] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_COL)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("sparse_sub", 1, 5, 5, 2); __PYX_ERR(0, 429, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  3:
+        if (likely((values[3] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_ROWS)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("sparse_sub", 1, 5, 5, 3); __PYX_ERR(0, 429, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  4:
+        if (likely((values[4] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_PVT)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("sparse_sub", 1, 5, 5, 4); __PYX_ERR(0, 429, __pyx_L3_error)
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "sparse_sub") < 0)) __PYX_ERR(0, 429, __pyx_L3_error)
+      }
+    } else if (PyTuple_GET_SIZE(__pyx_args) != 5) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+      values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+      values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+      values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+      values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
+    }
+    __pyx_v_PTR = ((PyArrayObject *)values[0]);
+    __pyx_v_NCOL = ((PyArrayObject *)values[1]);
+    __pyx_v_COL = ((PyArrayObject *)values[2]);
+    __pyx_v_ROWS = ((PyArrayObject *)values[3]);
+    __pyx_v_PVT = ((PyArrayObject *)values[4]);
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("sparse_sub", 1, 5, 5, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 429, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("sisl._sparse.sparse_sub", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_PTR), __pyx_ptype_5numpy_ndarray, 1, "PTR", 0))) __PYX_ERR(0, 429, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_NCOL), __pyx_ptype_5numpy_ndarray, 1, "NCOL", 0))) __PYX_ERR(0, 430, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_COL), __pyx_ptype_5numpy_ndarray, 1, "COL", 0))) __PYX_ERR(0, 431, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_ROWS), __pyx_ptype_5numpy_ndarray, 1, "ROWS", 0))) __PYX_ERR(0, 432, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_PVT), __pyx_ptype_5numpy_ndarray, 1, "PVT", 0))) __PYX_ERR(0, 433, __pyx_L1_error)
+  __pyx_r = __pyx_pf_4sisl_7_sparse_10sparse_sub(__pyx_self, __pyx_v_PTR, __pyx_v_NCOL, __pyx_v_COL, __pyx_v_ROWS, __pyx_v_PVT);
+
+  /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_4sisl_7_sparse_10sparse_sub(CYTHON_UNUSED PyObject *__pyx_self, PyArrayObject *__pyx_v_PTR, PyArrayObject *__pyx_v_NCOL, PyArrayObject *__pyx_v_COL, PyArrayObject *__pyx_v_ROWS, PyArrayObject *__pyx_v_PVT) {
+  __Pyx_memviewslice __pyx_v_ptr = { 0, 0, { 0 }, { 0 }, { 0 } };
+  __Pyx_memviewslice __pyx_v_ncol = { 0, 0, { 0 }, { 0 }, { 0 } };
+  __Pyx_memviewslice __pyx_v_col = { 0, 0, { 0 }, { 0 }, { 0 } };
+  __Pyx_memviewslice __pyx_v_rows = { 0, 0, { 0 }, { 0 }, { 0 } };
+  __Pyx_memviewslice __pyx_v_pvt = { 0, 0, { 0 }, { 0 }, { 0 } };
+  int __pyx_v_nr;
+  PyArrayObject *__pyx_v_S_PTR = 0;
+  PyArrayObject *__pyx_v_S_NCOL = 0;
+  __Pyx_memviewslice __pyx_v_sptr = { 0, 0, { 0 }, { 0 }, { 0 } };
+  __Pyx_memviewslice __pyx_v_sncol = { 0, 0, { 0 }, { 0 }, { 0 } };
+  int __pyx_v_r;
+  int __pyx_v_i;
+  int __pyx_v_n;
+  int __pyx_v_c;
+  PyArrayObject *__pyx_v_S_COL = 0;
+  PyArrayObject *__pyx_v_IDX = 0;
+  __Pyx_memviewslice __pyx_v_scol = { 0, 0, { 0 }, { 0 }, { 0 } };
+  __Pyx_memviewslice __pyx_v_idx = { 0, 0, { 0 }, { 0 }, { 0 } };
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_COL;
+  __Pyx_Buffer __pyx_pybuffer_COL;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_IDX;
+  __Pyx_Buffer __pyx_pybuffer_IDX;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_NCOL;
+  __Pyx_Buffer __pyx_pybuffer_NCOL;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_PTR;
+  __Pyx_Buffer __pyx_pybuffer_PTR;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_PVT;
+  __Pyx_Buffer __pyx_pybuffer_PVT;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_ROWS;
+  __Pyx_Buffer __pyx_pybuffer_ROWS;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_S_COL;
+  __Pyx_Buffer __pyx_pybuffer_S_COL;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_S_NCOL;
+  __Pyx_Buffer __pyx_pybuffer_S_NCOL;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_S_PTR;
+  __Pyx_Buffer __pyx_pybuffer_S_PTR;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  __Pyx_memviewslice __pyx_t_1 = { 0, 0, { 0 }, { 0 }, { 0 } };
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  PyObject *__pyx_t_6 = NULL;
+  PyArrayObject *__pyx_t_7 = NULL;
+  PyArrayObject *__pyx_t_8 = NULL;
+  int __pyx_t_9;
+  int __pyx_t_10;
+  int __pyx_t_11;
+  Py_ssize_t __pyx_t_12;
+  Py_ssize_t __pyx_t_13;
+  Py_ssize_t __pyx_t_14;
+  Py_ssize_t __pyx_t_15;
+  int __pyx_t_16;
+  Py_ssize_t __pyx_t_17;
+  int __pyx_t_18;
+  int __pyx_t_19;
+  Py_ssize_t __pyx_t_20;
+  Py_ssize_t __pyx_t_21;
+  int __pyx_t_22;
+  Py_ssize_t __pyx_t_23;
+  Py_ssize_t __pyx_t_24;
+  Py_ssize_t __pyx_t_25;
+  PyArrayObject *__pyx_t_26 = NULL;
+  PyArrayObject *__pyx_t_27 = NULL;
+  Py_ssize_t __pyx_t_28;
+  Py_ssize_t __pyx_t_29;
+  Py_ssize_t __pyx_t_30;
+  Py_ssize_t __pyx_t_31;
+  Py_ssize_t __pyx_t_32;
+  Py_ssize_t __pyx_t_33;
+  Py_ssize_t __pyx_t_34;
+  Py_ssize_t __pyx_t_35;
+  Py_ssize_t __pyx_t_36;
+  Py_ssize_t __pyx_t_37;
+  __Pyx_RefNannySetupContext("sparse_sub", 0);
+  __pyx_pybuffer_S_PTR.pybuffer.buf = NULL;
+  __pyx_pybuffer_S_PTR.refcount = 0;
+  __pyx_pybuffernd_S_PTR.data = NULL;
+  __pyx_pybuffernd_S_PTR.rcbuffer = &__pyx_pybuffer_S_PTR;
+  __pyx_pybuffer_S_NCOL.pybuffer.buf = NULL;
+  __pyx_pybuffer_S_NCOL.refcount = 0;
+  __pyx_pybuffernd_S_NCOL.data = NULL;
+  __pyx_pybuffernd_S_NCOL.rcbuffer = &__pyx_pybuffer_S_NCOL;
+  __pyx_pybuffer_S_COL.pybuffer.buf = NULL;
+  __pyx_pybuffer_S_COL.refcount = 0;
+  __pyx_pybuffernd_S_COL.data = NULL;
+  __pyx_pybuffernd_S_COL.rcbuffer = &__pyx_pybuffer_S_COL;
+  __pyx_pybuffer_IDX.pybuffer.buf = NULL;
+  __pyx_pybuffer_IDX.refcount = 0;
+  __pyx_pybuffernd_IDX.data = NULL;
+  __pyx_pybuffernd_IDX.rcbuffer = &__pyx_pybuffer_IDX;
+  __pyx_pybuffer_PTR.pybuffer.buf = NULL;
+  __pyx_pybuffer_PTR.refcount = 0;
+  __pyx_pybuffernd_PTR.data = NULL;
+  __pyx_pybuffernd_PTR.rcbuffer = &__pyx_pybuffer_PTR;
+  __pyx_pybuffer_NCOL.pybuffer.buf = NULL;
+  __pyx_pybuffer_NCOL.refcount = 0;
+  __pyx_pybuffernd_NCOL.data = NULL;
+  __pyx_pybuffernd_NCOL.rcbuffer = &__pyx_pybuffer_NCOL;
+  __pyx_pybuffer_COL.pybuffer.buf = NULL;
+  __pyx_pybuffer_COL.refcount = 0;
+  __pyx_pybuffernd_COL.data = NULL;
+  __pyx_pybuffernd_COL.rcbuffer = &__pyx_pybuffer_COL;
+  __pyx_pybuffer_ROWS.pybuffer.buf = NULL;
+  __pyx_pybuffer_ROWS.refcount = 0;
+  __pyx_pybuffernd_ROWS.data = NULL;
+  __pyx_pybuffernd_ROWS.rcbuffer = &__pyx_pybuffer_ROWS;
+  __pyx_pybuffer_PVT.pybuffer.buf = NULL;
+  __pyx_pybuffer_PVT.refcount = 0;
+  __pyx_pybuffernd_PVT.data = NULL;
+  __pyx_pybuffernd_PVT.rcbuffer = &__pyx_pybuffer_PVT;
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_PTR.rcbuffer->pybuffer, (PyObject*)__pyx_v_PTR, &__Pyx_TypeInfo_nn___pyx_t_5numpy_int32_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 429, __pyx_L1_error)
+  }
+  __pyx_pybuffernd_PTR.diminfo[0].strides = __pyx_pybuffernd_PTR.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_PTR.diminfo[0].shape = __pyx_pybuffernd_PTR.rcbuffer->pybuffer.shape[0];
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_NCOL.rcbuffer->pybuffer, (PyObject*)__pyx_v_NCOL, &__Pyx_TypeInfo_nn___pyx_t_5numpy_int32_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 429, __pyx_L1_error)
+  }
+  __pyx_pybuffernd_NCOL.diminfo[0].strides = __pyx_pybuffernd_NCOL.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_NCOL.diminfo[0].shape = __pyx_pybuffernd_NCOL.rcbuffer->pybuffer.shape[0];
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_COL.rcbuffer->pybuffer, (PyObject*)__pyx_v_COL, &__Pyx_TypeInfo_nn___pyx_t_5numpy_int32_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 429, __pyx_L1_error)
+  }
+  __pyx_pybuffernd_COL.diminfo[0].strides = __pyx_pybuffernd_COL.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_COL.diminfo[0].shape = __pyx_pybuffernd_COL.rcbuffer->pybuffer.shape[0];
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_ROWS.rcbuffer->pybuffer, (PyObject*)__pyx_v_ROWS, &__Pyx_TypeInfo_nn___pyx_t_5numpy_int32_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 429, __pyx_L1_error)
+  }
+  __pyx_pybuffernd_ROWS.diminfo[0].strides = __pyx_pybuffernd_ROWS.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_ROWS.diminfo[0].shape = __pyx_pybuffernd_ROWS.rcbuffer->pybuffer.shape[0];
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_PVT.rcbuffer->pybuffer, (PyObject*)__pyx_v_PVT, &__Pyx_TypeInfo_nn___pyx_t_5numpy_int32_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 429, __pyx_L1_error)
+  }
+  __pyx_pybuffernd_PVT.diminfo[0].strides = __pyx_pybuffernd_PVT.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_PVT.diminfo[0].shape = __pyx_pybuffernd_PVT.rcbuffer->pybuffer.shape[0];
+
+  /* "sisl/_sparse.pyx":450
+ *     idx : indices of the retained elements in `COL`
+ *     """
+ *     cdef int[::1] ptr = PTR             # <<<<<<<<<<<<<<
+ *     cdef int[::1] ncol = NCOL
+ *     cdef int[::1] col = COL
+ */
+  __pyx_t_1 = __Pyx_PyObject_to_MemoryviewSlice_dc_int(((PyObject *)__pyx_v_PTR), PyBUF_WRITABLE); if (unlikely(!__pyx_t_1.memview)) __PYX_ERR(0, 450, __pyx_L1_error)
+  __pyx_v_ptr = __pyx_t_1;
+  __pyx_t_1.memview = NULL;
+  __pyx_t_1.data = NULL;
+
+  /* "sisl/_sparse.pyx":451
+ *     """
+ *     cdef int[::1] ptr = PTR
+ *     cdef int[::1] ncol = NCOL             # <<<<<<<<<<<<<<
+ *     cdef int[::1] col = COL
+ *     cdef int[::1] rows = ROWS
+ */
+  __pyx_t_1 = __Pyx_PyObject_to_MemoryviewSlice_dc_int(((PyObject *)__pyx_v_NCOL), PyBUF_WRITABLE); if (unlikely(!__pyx_t_1.memview)) __PYX_ERR(0, 451, __pyx_L1_error)
+  __pyx_v_ncol = __pyx_t_1;
+  __pyx_t_1.memview = NULL;
+  __pyx_t_1.data = NULL;
+
+  /* "sisl/_sparse.pyx":452
+ *     cdef int[::1] ptr = PTR
+ *     cdef int[::1] ncol = NCOL
+ *     cdef int[::1] col = COL             # <<<<<<<<<<<<<<
+ *     cdef int[::1] rows = ROWS
+ *     cdef int[::1] pvt = PVT
+ */
+  __pyx_t_1 = __Pyx_PyObject_to_MemoryviewSlice_dc_int(((PyObject *)__pyx_v_COL), PyBUF_WRITABLE); if (unlikely(!__pyx_t_1.memview)) __PYX_ERR(0, 452, __pyx_L1_error)
+  __pyx_v_col = __pyx_t_1;
+  __pyx_t_1.memview = NULL;
+  __pyx_t_1.data = NULL;
+
+  /* "sisl/_sparse.pyx":453
+ *     cdef int[::1] ncol = NCOL
+ *     cdef int[::1] col = COL
+ *     cdef int[::1] rows = ROWS             # <<<<<<<<<<<<<<
+ *     cdef int[::1] pvt = PVT
+ *     cdef int nr = rows.shape[0]
+ */
+  __pyx_t_1 = __Pyx_PyObject_to_MemoryviewSlice_dc_int(((PyObject *)__pyx_v_ROWS), PyBUF_WRITABLE); if (unlikely(!__pyx_t_1.memview)) __PYX_ERR(0, 453, __pyx_L1_error)
+  __pyx_v_rows = __pyx_t_1;
+  __pyx_t_1.memview = NULL;
+  __pyx_t_1.data = NULL;
+
+  /* "sisl/_sparse.pyx":454
+ *     cdef int[::1] col = COL
+ *     cdef int[::1] rows = ROWS
+ *     cdef int[::1] pvt = PVT             # <<<<<<<<<<<<<<
+ *     cdef int nr = rows.shape[0]
+ * 
+ */
+  __pyx_t_1 = __Pyx_PyObject_to_MemoryviewSlice_dc_int(((PyObject *)__pyx_v_PVT), PyBUF_WRITABLE); if (unlikely(!__pyx_t_1.memview)) __PYX_ERR(0, 454, __pyx_L1_error)
+  __pyx_v_pvt = __pyx_t_1;
+  __pyx_t_1.memview = NULL;
+  __pyx_t_1.data = NULL;
+
+  /* "sisl/_sparse.pyx":455
+ *     cdef int[::1] rows = ROWS
+ *     cdef int[::1] pvt = PVT
+ *     cdef int nr = rows.shape[0]             # <<<<<<<<<<<<<<
+ * 
+ *     cdef np.ndarray[np.int32_t, ndim=1, mode='c'] S_PTR = np.empty([nr + 1], dtype=np.int32)
+ */
+  __pyx_v_nr = (__pyx_v_rows.shape[0]);
+
+  /* "sisl/_sparse.pyx":457
+ *     cdef int nr = rows.shape[0]
+ * 
+ *     cdef np.ndarray[np.int32_t, ndim=1, mode='c'] S_PTR = np.empty([nr + 1], dtype=np.int32)             # <<<<<<<<<<<<<<
+ *     cdef np.ndarray[np.int32_t, ndim=1, mode='c'] S_NCOL = np.empty([nr], dtype=np.int32)
+ *     cdef int[::1] sptr = S_PTR
+ */
+  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_np); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 457, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_empty); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 457, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_2 = __Pyx_PyInt_From_long((__pyx_v_nr + 1)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 457, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_4 = PyList_New(1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 457, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_GIVEREF(__pyx_t_2);
+  PyList_SET_ITEM(__pyx_t_4, 0, __pyx_t_2);
+  __pyx_t_2 = 0;
+  __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 457, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_GIVEREF(__pyx_t_4);
+  PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_t_4);
+  __pyx_t_4 = 0;
+  __pyx_t_4 = __Pyx_PyDict_NewPresized(1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 457, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_GetModuleGlobalName(__pyx_t_5, __pyx_n_s_np); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 457, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_t_5, __pyx_n_s_int32); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 457, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  if (PyDict_SetItem(__pyx_t_4, __pyx_n_s_dtype, __pyx_t_6) < 0) __PYX_ERR(0, 457, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  __pyx_t_6 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_t_2, __pyx_t_4); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 457, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  if (!(likely(((__pyx_t_6) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_6, __pyx_ptype_5numpy_ndarray))))) __PYX_ERR(0, 457, __pyx_L1_error)
+  __pyx_t_7 = ((PyArrayObject *)__pyx_t_6);
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_S_PTR.rcbuffer->pybuffer, (PyObject*)__pyx_t_7, &__Pyx_TypeInfo_nn___pyx_t_5numpy_int32_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) {
+      __pyx_v_S_PTR = ((PyArrayObject *)Py_None); __Pyx_INCREF(Py_None); __pyx_pybuffernd_S_PTR.rcbuffer->pybuffer.buf = NULL;
+      __PYX_ERR(0, 457, __pyx_L1_error)
+    } else {__pyx_pybuffernd_S_PTR.diminfo[0].strides = __pyx_pybuffernd_S_PTR.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_S_PTR.diminfo[0].shape = __pyx_pybuffernd_S_PTR.rcbuffer->pybuffer.shape[0];
+    }
+  }
+  __pyx_t_7 = 0;
+  __pyx_v_S_PTR = ((PyArrayObject *)__pyx_t_6);
+  __pyx_t_6 = 0;
+
+  /* "sisl/_sparse.pyx":458
+ * 
+ *     cdef np.ndarray[np.int32_t, ndim=1, mode='c'] S_PTR = np.empty([nr + 1], dtype=np.int32)
+ *     cdef np.ndarray[np.int32_t, ndim=1, mode='c'] S_NCOL = np.empty([nr], dtype=np.int32)             # <<<<<<<<<<<<<<
+ *     cdef int[::1] sptr = S_PTR
+ *     cdef int[::1] sncol = S_NCOL
+ */
+  __Pyx_GetModuleGlobalName(__pyx_t_6, __pyx_n_s_np); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 458, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_t_6, __pyx_n_s_empty); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 458, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  __pyx_t_6 = __Pyx_PyInt_From_int(__pyx_v_nr); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 458, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __pyx_t_2 = PyList_New(1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 458, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_GIVEREF(__pyx_t_6);
+  PyList_SET_ITEM(__pyx_t_2, 0, __pyx_t_6);
+  __pyx_t_6 = 0;
+  __pyx_t_6 = PyTuple_New(1); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 458, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_GIVEREF(__pyx_t_2);
+  PyTuple_SET_ITEM(__pyx_t_6, 0, __pyx_t_2);
+  __pyx_t_2 = 0;
+  __pyx_t_2 = __Pyx_PyDict_NewPresized(1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 458, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_n_s_np); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 458, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_n_s_int32); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 458, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  if (PyDict_SetItem(__pyx_t_2, __pyx_n_s_dtype, __pyx_t_5) < 0) __PYX_ERR(0, 458, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __pyx_t_5 = __Pyx_PyObject_Call(__pyx_t_4, __pyx_t_6, __pyx_t_2); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 458, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  if (!(likely(((__pyx_t_5) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_5, __pyx_ptype_5numpy_ndarray))))) __PYX_ERR(0, 458, __pyx_L1_error)
+  __pyx_t_8 = ((PyArrayObject *)__pyx_t_5);
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_S_NCOL.rcbuffer->pybuffer, (PyObject*)__pyx_t_8, &__Pyx_TypeInfo_nn___pyx_t_5numpy_int32_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) {
+      __pyx_v_S_NCOL = ((PyArrayObject *)Py_None); __Pyx_INCREF(Py_None); __pyx_pybuffernd_S_NCOL.rcbuffer->pybuffer.buf = NULL;
+      __PYX_ERR(0, 458, __pyx_L1_error)
+    } else {__pyx_pybuffernd_S_NCOL.diminfo[0].strides = __pyx_pybuffernd_S_NCOL.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_S_NCOL.diminfo[0].shape = __pyx_pybuffernd_S_NCOL.rcbuffer->pybuffer.shape[0];
+    }
+  }
+  __pyx_t_8 = 0;
+  __pyx_v_S_NCOL = ((PyArrayObject *)__pyx_t_5);
+  __pyx_t_5 = 0;
+
+  /* "sisl/_sparse.pyx":459
+ *     cdef np.ndarray[np.int32_t, ndim=1, mode='c'] S_PTR = np.empty([nr + 1], dtype=np.int32)
+ *     cdef np.ndarray[np.int32_t, ndim=1, mode='c'] S_NCOL = np.empty([nr], dtype=np.int32)
+ *     cdef int[::1] sptr = S_PTR             # <<<<<<<<<<<<<<
+ *     cdef int[::1] sncol = S_NCOL
+ * 
+ */
+  __pyx_t_1 = __Pyx_PyObject_to_MemoryviewSlice_dc_int(((PyObject *)__pyx_v_S_PTR), PyBUF_WRITABLE); if (unlikely(!__pyx_t_1.memview)) __PYX_ERR(0, 459, __pyx_L1_error)
+  __pyx_v_sptr = __pyx_t_1;
+  __pyx_t_1.memview = NULL;
+  __pyx_t_1.data = NULL;
+
+  /* "sisl/_sparse.pyx":460
+ *     cdef np.ndarray[np.int32_t, ndim=1, mode='c'] S_NCOL = np.empty([nr], dtype=np.int32)
+ *     cdef int[::1] sptr = S_PTR
+ *     cdef int[::1] sncol = S_NCOL             # <<<<<<<<<<<<<<
+ * 
+ *     cdef int r, i, n, c
+ */
+  __pyx_t_1 = __Pyx_PyObject_to_MemoryviewSlice_dc_int(((PyObject *)__pyx_v_S_NCOL), PyBUF_WRITABLE); if (unlikely(!__pyx_t_1.memview)) __PYX_ERR(0, 460, __pyx_L1_error)
+  __pyx_v_sncol = __pyx_t_1;
+  __pyx_t_1.memview = NULL;
+  __pyx_t_1.data = NULL;
+
+  /* "sisl/_sparse.pyx":465
+ * 
+ *     # Count the number of retained elements per row
+ *     n = 0             # <<<<<<<<<<<<<<
+ *     with nogil:
+ *         for r in range(nr):
+ */
+  __pyx_v_n = 0;
+
+  /* "sisl/_sparse.pyx":466
+ *     # Count the number of retained elements per row
+ *     n = 0
+ *     with nogil:             # <<<<<<<<<<<<<<
+ *         for r in range(nr):
+ *             sptr[r] = n
+ */
+  {
+      #ifdef WITH_THREAD
+      PyThreadState *_save;
+      Py_UNBLOCK_THREADS
+      __Pyx_FastGIL_Remember();
+      #endif
+      /*try:*/ {
+
+        /* "sisl/_sparse.pyx":467
+ *     n = 0
+ *     with nogil:
+ *         for r in range(nr):             # <<<<<<<<<<<<<<
+ *             sptr[r] = n
+ *             c = rows[r]
+ */
+        __pyx_t_9 = __pyx_v_nr;
+        __pyx_t_10 = __pyx_t_9;
+        for (__pyx_t_11 = 0; __pyx_t_11 < __pyx_t_10; __pyx_t_11+=1) {
+          __pyx_v_r = __pyx_t_11;
+
+          /* "sisl/_sparse.pyx":468
+ *     with nogil:
+ *         for r in range(nr):
+ *             sptr[r] = n             # <<<<<<<<<<<<<<
+ *             c = rows[r]
+ *             for i in range(ptr[c], ptr[c] + ncol[c]):
+ */
+          __pyx_t_12 = __pyx_v_r;
+          *((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_sptr.data) + __pyx_t_12)) )) = __pyx_v_n;
+
+          /* "sisl/_sparse.pyx":469
+ *         for r in range(nr):
+ *             sptr[r] = n
+ *             c = rows[r]             # <<<<<<<<<<<<<<
+ *             for i in range(ptr[c], ptr[c] + ncol[c]):
+ *                 if pvt[col[i]] >= 0:
+ */
+          __pyx_t_13 = __pyx_v_r;
+          __pyx_v_c = (*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_rows.data) + __pyx_t_13)) )));
+
+          /* "sisl/_sparse.pyx":470
+ *             sptr[r] = n
+ *             c = rows[r]
+ *             for i in range(ptr[c], ptr[c] + ncol[c]):             # <<<<<<<<<<<<<<
+ *                 if pvt[col[i]] >= 0:
+ *                     n += 1
+ */
+          __pyx_t_14 = __pyx_v_c;
+          __pyx_t_15 = __pyx_v_c;
+          __pyx_t_16 = ((*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_ptr.data) + __pyx_t_14)) ))) + (*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_ncol.data) + __pyx_t_15)) ))));
+          __pyx_t_17 = __pyx_v_c;
+          __pyx_t_18 = __pyx_t_16;
+          for (__pyx_t_19 = (*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_ptr.data) + __pyx_t_17)) ))); __pyx_t_19 < __pyx_t_18; __pyx_t_19+=1) {
+            __pyx_v_i = __pyx_t_19;
+
+            /* "sisl/_sparse.pyx":471
+ *             c = rows[r]
+ *             for i in range(ptr[c], ptr[c] + ncol[c]):
+ *                 if pvt[col[i]] >= 0:             # <<<<<<<<<<<<<<
+ *                     n += 1
+ *             sncol[r] = n - sptr[r]
+ */
+            __pyx_t_20 = __pyx_v_i;
+            __pyx_t_21 = (*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_col.data) + __pyx_t_20)) )));
+            __pyx_t_22 = (((*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_pvt.data) + __pyx_t_21)) ))) >= 0) != 0);
+            if (__pyx_t_22) {
+
+              /* "sisl/_sparse.pyx":472
+ *             for i in range(ptr[c], ptr[c] + ncol[c]):
+ *                 if pvt[col[i]] >= 0:
+ *                     n += 1             # <<<<<<<<<<<<<<
+ *             sncol[r] = n - sptr[r]
+ *         sptr[nr] = n
+ */
+              __pyx_v_n = (__pyx_v_n + 1);
+
+              /* "sisl/_sparse.pyx":471
+ *             c = rows[r]
+ *             for i in range(ptr[c], ptr[c] + ncol[c]):
+ *                 if pvt[col[i]] >= 0:             # <<<<<<<<<<<<<<
+ *                     n += 1
+ *             sncol[r] = n - sptr[r]
+ */
+            }
+          }
+
+          /* "sisl/_sparse.pyx":473
+ *                 if pvt[col[i]] >= 0:
+ *                     n += 1
+ *             sncol[r] = n - sptr[r]             # <<<<<<<<<<<<<<
+ *         sptr[nr] = n
+ * 
+ */
+          __pyx_t_23 = __pyx_v_r;
+          __pyx_t_24 = __pyx_v_r;
+          *((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_sncol.data) + __pyx_t_24)) )) = (__pyx_v_n - (*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_sptr.data) + __pyx_t_23)) ))));
+        }
+
+        /* "sisl/_sparse.pyx":474
+ *                     n += 1
+ *             sncol[r] = n - sptr[r]
+ *         sptr[nr] = n             # <<<<<<<<<<<<<<
+ * 
+ *     cdef np.ndarray[np.int32_t, ndim=1, mode='c'] S_COL = np.empty([n], dtype=np.int32)
+ */
+        __pyx_t_25 = __pyx_v_nr;
+        *((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_sptr.data) + __pyx_t_25)) )) = __pyx_v_n;
+      }
+
+      /* "sisl/_sparse.pyx":466
+ *     # Count the number of retained elements per row
+ *     n = 0
+ *     with nogil:             # <<<<<<<<<<<<<<
+ *         for r in range(nr):
+ *             sptr[r] = n
+ */
+      /*finally:*/ {
+        /*normal exit:*/{
+          #ifdef WITH_THREAD
+          __Pyx_FastGIL_Forget();
+          Py_BLOCK_THREADS
+          #endif
+          goto __pyx_L5;
+        }
+        __pyx_L5:;
+      }
+  }
+
+  /* "sisl/_sparse.pyx":476
+ *         sptr[nr] = n
+ * 
+ *     cdef np.ndarray[np.int32_t, ndim=1, mode='c'] S_COL = np.empty([n], dtype=np.int32)             # <<<<<<<<<<<<<<
+ *     cdef np.ndarray[np.int32_t, ndim=1, mode='c'] IDX = np.empty([n], dtype=np.int32)
+ *     cdef int[::1] scol = S_COL
+ */
+  __Pyx_GetModuleGlobalName(__pyx_t_5, __pyx_n_s_np); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 476, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_t_5, __pyx_n_s_empty); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 476, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __pyx_t_5 = __Pyx_PyInt_From_int(__pyx_v_n); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 476, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __pyx_t_6 = PyList_New(1); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 476, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_GIVEREF(__pyx_t_5);
+  PyList_SET_ITEM(__pyx_t_6, 0, __pyx_t_5);
+  __pyx_t_5 = 0;
+  __pyx_t_5 = PyTuple_New(1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 476, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_GIVEREF(__pyx_t_6);
+  PyTuple_SET_ITEM(__pyx_t_5, 0, __pyx_t_6);
+  __pyx_t_6 = 0;
+  __pyx_t_6 = __Pyx_PyDict_NewPresized(1); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 476, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_GetModuleGlobalName(__pyx_t_4, __pyx_n_s_np); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 476, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_4, __pyx_n_s_int32); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 476, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  if (PyDict_SetItem(__pyx_t_6, __pyx_n_s_dtype, __pyx_t_3) < 0) __PYX_ERR(0, 476, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_t_3 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_t_5, __pyx_t_6); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 476, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  if (!(likely(((__pyx_t_3) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_3, __pyx_ptype_5numpy_ndarray))))) __PYX_ERR(0, 476, __pyx_L1_error)
+  __pyx_t_26 = ((PyArrayObject *)__pyx_t_3);
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_S_COL.rcbuffer->pybuffer, (PyObject*)__pyx_t_26, &__Pyx_TypeInfo_nn___pyx_t_5numpy_int32_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) {
+      __pyx_v_S_COL = ((PyArrayObject *)Py_None); __Pyx_INCREF(Py_None); __pyx_pybuffernd_S_COL.rcbuffer->pybuffer.buf = NULL;
+      __PYX_ERR(0, 476, __pyx_L1_error)
+    } else {__pyx_pybuffernd_S_COL.diminfo[0].strides = __pyx_pybuffernd_S_COL.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_S_COL.diminfo[0].shape = __pyx_pybuffernd_S_COL.rcbuffer->pybuffer.shape[0];
+    }
+  }
+  __pyx_t_26 = 0;
+  __pyx_v_S_COL = ((PyArrayObject *)__pyx_t_3);
+  __pyx_t_3 = 0;
+
+  /* "sisl/_sparse.pyx":477
+ * 
+ *     cdef np.ndarray[np.int32_t, ndim=1, mode='c'] S_COL = np.empty([n], dtype=np.int32)
+ *     cdef np.ndarray[np.int32_t, ndim=1, mode='c'] IDX = np.empty([n], dtype=np.int32)             # <<<<<<<<<<<<<<
+ *     cdef int[::1] scol = S_COL
+ *     cdef int[::1] idx = IDX
+ */
+  __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_n_s_np); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 477, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_n_s_empty); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 477, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_t_3 = __Pyx_PyInt_From_int(__pyx_v_n); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 477, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_5 = PyList_New(1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 477, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_GIVEREF(__pyx_t_3);
+  PyList_SET_ITEM(__pyx_t_5, 0, __pyx_t_3);
+  __pyx_t_3 = 0;
+  __pyx_t_3 = PyTuple_New(1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 477, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_GIVEREF(__pyx_t_5);
+  PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_t_5);
+  __pyx_t_5 = 0;
+  __pyx_t_5 = __Pyx_PyDict_NewPresized(1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 477, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_np); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 477, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_int32); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 477, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  if (PyDict_SetItem(__pyx_t_5, __pyx_n_s_dtype, __pyx_t_4) < 0) __PYX_ERR(0, 477, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_t_4 = __Pyx_PyObject_Call(__pyx_t_6, __pyx_t_3, __pyx_t_5); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 477, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  if (!(likely(((__pyx_t_4) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_4, __pyx_ptype_5numpy_ndarray))))) __PYX_ERR(0, 477, __pyx_L1_error)
+  __pyx_t_27 = ((PyArrayObject *)__pyx_t_4);
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_IDX.rcbuffer->pybuffer, (PyObject*)__pyx_t_27, &__Pyx_TypeInfo_nn___pyx_t_5numpy_int32_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) {
+      __pyx_v_IDX = ((PyArrayObject *)Py_None); __Pyx_INCREF(Py_None); __pyx_pybuffernd_IDX.rcbuffer->pybuffer.buf = NULL;
+      __PYX_ERR(0, 477, __pyx_L1_error)
+    } else {__pyx_pybuffernd_IDX.diminfo[0].strides = __pyx_pybuffernd_IDX.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_IDX.diminfo[0].shape = __pyx_pybuffernd_IDX.rcbuffer->pybuffer.shape[0];
+    }
+  }
+  __pyx_t_27 = 0;
+  __pyx_v_IDX = ((PyArrayObject *)__pyx_t_4);
+  __pyx_t_4 = 0;
+
+  /* "sisl/_sparse.pyx":478
+ *     cdef np.ndarray[np.int32_t, ndim=1, mode='c'] S_COL = np.empty([n], dtype=np.int32)
+ *     cdef np.ndarray[np.int32_t, ndim=1, mode='c'] IDX = np.empty([n], dtype=np.int32)
+ *     cdef int[::1] scol = S_COL             # <<<<<<<<<<<<<<
+ *     cdef int[::1] idx = IDX
+ * 
+ */
+  __pyx_t_1 = __Pyx_PyObject_to_MemoryviewSlice_dc_int(((PyObject *)__pyx_v_S_COL), PyBUF_WRITABLE); if (unlikely(!__pyx_t_1.memview)) __PYX_ERR(0, 478, __pyx_L1_error)
+  __pyx_v_scol = __pyx_t_1;
+  __pyx_t_1.memview = NULL;
+  __pyx_t_1.data = NULL;
+
+  /* "sisl/_sparse.pyx":479
+ *     cdef np.ndarray[np.int32_t, ndim=1, mode='c'] IDX = np.empty([n], dtype=np.int32)
+ *     cdef int[::1] scol = S_COL
+ *     cdef int[::1] idx = IDX             # <<<<<<<<<<<<<<
+ * 
+ *     with nogil:
+ */
+  __pyx_t_1 = __Pyx_PyObject_to_MemoryviewSlice_dc_int(((PyObject *)__pyx_v_IDX), PyBUF_WRITABLE); if (unlikely(!__pyx_t_1.memview)) __PYX_ERR(0, 479, __pyx_L1_error)
+  __pyx_v_idx = __pyx_t_1;
+  __pyx_t_1.memview = NULL;
+  __pyx_t_1.data = NULL;
+
+  /* "sisl/_sparse.pyx":481
+ *     cdef int[::1] idx = IDX
+ * 
+ *     with nogil:             # <<<<<<<<<<<<<<
+ *         n = 0
+ *         for r in range(nr):
+ */
+  {
+      #ifdef WITH_THREAD
+      PyThreadState *_save;
+      Py_UNBLOCK_THREADS
+      __Pyx_FastGIL_Remember();
+      #endif
+      /*try:*/ {
+
+        /* "sisl/_sparse.pyx":482
+ * 
+ *     with nogil:
+ *         n = 0             # <<<<<<<<<<<<<<
+ *         for r in range(nr):
+ *             c = rows[r]
+ */
+        __pyx_v_n = 0;
+
+        /* "sisl/_sparse.pyx":483
+ *     with nogil:
+ *         n = 0
+ *         for r in range(nr):             # <<<<<<<<<<<<<<
+ *             c = rows[r]
+ *             for i in range(ptr[c], ptr[c] + ncol[c]):
+ */
+        __pyx_t_9 = __pyx_v_nr;
+        __pyx_t_10 = __pyx_t_9;
+        for (__pyx_t_11 = 0; __pyx_t_11 < __pyx_t_10; __pyx_t_11+=1) {
+          __pyx_v_r = __pyx_t_11;
+
+          /* "sisl/_sparse.pyx":484
+ *         n = 0
+ *         for r in range(nr):
+ *             c = rows[r]             # <<<<<<<<<<<<<<
+ *             for i in range(ptr[c], ptr[c] + ncol[c]):
+ *                 if pvt[col[i]] >= 0:
+ */
+          __pyx_t_28 = __pyx_v_r;
+          __pyx_v_c = (*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_rows.data) + __pyx_t_28)) )));
+
+          /* "sisl/_sparse.pyx":485
+ *         for r in range(nr):
+ *             c = rows[r]
+ *             for i in range(ptr[c], ptr[c] + ncol[c]):             # <<<<<<<<<<<<<<
+ *                 if pvt[col[i]] >= 0:
+ *                     scol[n] = pvt[col[i]]
+ */
+          __pyx_t_29 = __pyx_v_c;
+          __pyx_t_30 = __pyx_v_c;
+          __pyx_t_16 = ((*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_ptr.data) + __pyx_t_29)) ))) + (*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_ncol.data) + __pyx_t_30)) ))));
+          __pyx_t_31 = __pyx_v_c;
+          __pyx_t_18 = __pyx_t_16;
+          for (__pyx_t_19 = (*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_ptr.data) + __pyx_t_31)) ))); __pyx_t_19 < __pyx_t_18; __pyx_t_19+=1) {
+            __pyx_v_i = __pyx_t_19;
+
+            /* "sisl/_sparse.pyx":486
+ *             c = rows[r]
+ *             for i in range(ptr[c], ptr[c] + ncol[c]):
+ *                 if pvt[col[i]] >= 0:             # <<<<<<<<<<<<<<
+ *                     scol[n] = pvt[col[i]]
+ *                     idx[n] = i
+ */
+            __pyx_t_32 = __pyx_v_i;
+            __pyx_t_33 = (*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_col.data) + __pyx_t_32)) )));
+            __pyx_t_22 = (((*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_pvt.data) + __pyx_t_33)) ))) >= 0) != 0);
+            if (__pyx_t_22) {
+
+              /* "sisl/_sparse.pyx":487
+ *             for i in range(ptr[c], ptr[c] + ncol[c]):
+ *                 if pvt[col[i]] >= 0:
+ *                     scol[n] = pvt[col[i]]             # <<<<<<<<<<<<<<
+ *                     idx[n] = i
+ *                     n += 1
+ */
+              __pyx_t_34 = __pyx_v_i;
+              __pyx_t_35 = (*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_col.data) + __pyx_t_34)) )));
+              __pyx_t_36 = __pyx_v_n;
+              *((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_scol.data) + __pyx_t_36)) )) = (*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_pvt.data) + __pyx_t_35)) )));
+
+              /* "sisl/_sparse.pyx":488
+ *                 if pvt[col[i]] >= 0:
+ *                     scol[n] = pvt[col[i]]
+ *                     idx[n] = i             # <<<<<<<<<<<<<<
+ *                     n += 1
+ * 
+ */
+              __pyx_t_37 = __pyx_v_n;
+              *((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_idx.data) + __pyx_t_37)) )) = __pyx_v_i;
+
+              /* "sisl/_sparse.pyx":489
+ *                     scol[n] = pvt[col[i]]
+ *                     idx[n] = i
+ *                     n += 1             # <<<<<<<<<<<<<<
+ * 
+ *     return S_PTR, S_NCOL, S_COL, IDX
+ */
+              __pyx_v_n = (__pyx_v_n + 1);
+
+              /* "sisl/_sparse.pyx":486
+ *             c = rows[r]
+ *             for i in range(ptr[c], ptr[c] + ncol[c]):
+ *                 if pvt[col[i]] >= 0:             # <<<<<<<<<<<<<<
+ *                     scol[n] = pvt[col[i]]
+ *                     idx[n] = i
+ */
+            }
+          }
+        }
+      }
+
+      /* "sisl/_sparse.pyx":481
+ *     cdef int[::1] idx = IDX
+ * 
+ *     with nogil:             # <<<<<<<<<<<<<<
+ *         n = 0
+ *         for r in range(nr):
+ */
+      /*finally:*/ {
+        /*normal exit:*/{
+          #ifdef WITH_THREAD
+          __Pyx_FastGIL_Forget();
+          Py_BLOCK_THREADS
+          #endif
+          goto __pyx_L13;
+        }
+        __pyx_L13:;
+      }
+  }
+
+  /* "sisl/_sparse.pyx":491
+ *                     n += 1
+ * 
+ *     return S_PTR, S_NCOL, S_COL, IDX             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_4 = PyTuple_New(4); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 491, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_INCREF(((PyObject *)__pyx_v_S_PTR));
+  __Pyx_GIVEREF(((PyObject *)__pyx_v_S_PTR));
+  PyTuple_SET_ITEM(__pyx_t_4, 0, ((PyObject *)__pyx_v_S_PTR));
+  __Pyx_INCREF(((PyObject *)__pyx_v_S_NCOL));
+  __Pyx_GIVEREF(((PyObject *)__pyx_v_S_NCOL));
+  PyTuple_SET_ITEM(__pyx_t_4, 1, ((PyObject *)__pyx_v_S_NCOL));
+  __Pyx_INCREF(((PyObject *)__pyx_v_S_COL));
+  __Pyx_GIVEREF(((PyObject *)__pyx_v_S_COL));
+  PyTuple_SET_ITEM(__pyx_t_4, 2, ((PyObject *)__pyx_v_S_COL));
+  __Pyx_INCREF(((PyObject *)__pyx_v_IDX));
+  __Pyx_GIVEREF(((PyObject *)__pyx_v_IDX));
+  PyTuple_SET_ITEM(__pyx_t_4, 3, ((PyObject *)__pyx_v_IDX));
+  __pyx_r = __pyx_t_4;
+  __pyx_t_4 = 0;
+  goto __pyx_L0;
+
+  /* "sisl/_sparse.pyx":429
+ * @cython.wraparound(False)
+ * @cython.initializedcheck(False)
+ * def sparse_sub(np.ndarray[np.int32_t, ndim=1, mode='c'] PTR,             # <<<<<<<<<<<<<<
+ *                np.ndarray[np.int32_t, ndim=1, mode='c'] NCOL,
+ *                np.ndarray[np.int32_t, ndim=1, mode='c'] COL,
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __PYX_XDEC_MEMVIEW(&__pyx_t_1, 1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_6);
+  { PyObject *__pyx_type, *__pyx_value, *__pyx_tb;
+    __Pyx_PyThreadState_declare
+    __Pyx_PyThreadState_assign
+    __Pyx_ErrFetch(&__pyx_type, &__pyx_value, &__pyx_tb);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_COL.rcbuffer->pybuffer);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_IDX.rcbuffer->pybuffer);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_NCOL.rcbuffer->pybuffer);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_PTR.rcbuffer->pybuffer);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_PVT.rcbuffer->pybuffer);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_ROWS.rcbuffer->pybuffer);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_S_COL.rcbuffer->pybuffer);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_S_NCOL.rcbuffer->pybuffer);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_S_PTR.rcbuffer->pybuffer);
+  __Pyx_ErrRestore(__pyx_type, __pyx_value, __pyx_tb);}
+  __Pyx_AddTraceback("sisl._sparse.sparse_sub", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  goto __pyx_L2;
+  __pyx_L0:;
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_COL.rcbuffer->pybuffer);
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_IDX.rcbuffer->pybuffer);
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_NCOL.rcbuffer->pybuffer);
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_PTR.rcbuffer->pybuffer);
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_PVT.rcbuffer->pybuffer);
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_ROWS.rcbuffer->pybuffer);
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_S_COL.rcbuffer->pybuffer);
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_S_NCOL.rcbuffer->pybuffer);
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_S_PTR.rcbuffer->pybuffer);
+  __pyx_L2:;
+  __PYX_XDEC_MEMVIEW(&__pyx_v_ptr, 1);
+  __PYX_XDEC_MEMVIEW(&__pyx_v_ncol, 1);
+  __PYX_XDEC_MEMVIEW(&__pyx_v_col, 1);
+  __PYX_XDEC_MEMVIEW(&__pyx_v_rows, 1);
+  __PYX_XDEC_MEMVIEW(&__pyx_v_pvt, 1);
+  __Pyx_XDECREF((PyObject *)__pyx_v_S_PTR);
+  __Pyx_XDECREF((PyObject *)__pyx_v_S_NCOL);
+  __PYX_XDEC_MEMVIEW(&__pyx_v_sptr, 1);
+  __PYX_XDEC_MEMVIEW(&__pyx_v_sncol, 1);
+  __Pyx_XDECREF((PyObject *)__pyx_v_S_COL);
+  __Pyx_XDECREF((PyObject *)__pyx_v_IDX);
+  __PYX_XDEC_MEMVIEW(&__pyx_v_scol, 1);
+  __PYX_XDEC_MEMVIEW(&__pyx_v_idx, 1);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "sisl/_sparse.pyx":499
+ * 
+ * 
+ * cdef int _col_idx_cmp(const void *a, const void *b) nogil:             # <<<<<<<<<<<<<<
+ *     cdef int ca = (<_col_idx *> a).col
+ *     cdef int cb = (<_col_idx *> b).col
+ */
+
+static int __pyx_f_4sisl_7_sparse__col_idx_cmp(void const *__pyx_v_a, void const *__pyx_v_b) {
+  int __pyx_v_ca;
+  int __pyx_v_cb;
+  int __pyx_r;
+  int __pyx_t_1;
+
+  /* "sisl/_sparse.pyx":500
+ * 
+ * cdef int _col_idx_cmp(const void *a, const void *b) nogil:
+ *     cdef int ca = (<_col_idx *> a).col             # <<<<<<<<<<<<<<
+ *     cdef int cb = (<_col_idx *> b).col
+ *     return (ca > cb) - (ca < cb)
+ */
+  __pyx_t_1 = ((struct __pyx_t_4sisl_7_sparse__col_idx *)__pyx_v_a)->col;
+  __pyx_v_ca = __pyx_t_1;
+
+  /* "sisl/_sparse.pyx":501
+ * cdef int _col_idx_cmp(const void *a, const void *b) nogil:
+ *     cdef int ca = (<_col_idx *> a).col
+ *     cdef int cb = (<_col_idx *> b).col             # <<<<<<<<<<<<<<
+ *     return (ca > cb) - (ca < cb)
+ * 
+ */
+  __pyx_t_1 = ((struct __pyx_t_4sisl_7_sparse__col_idx *)__pyx_v_b)->col;
+  __pyx_v_cb = __pyx_t_1;
+
+  /* "sisl/_sparse.pyx":502
+ *     cdef int ca = (<_col_idx *> a).col
+ *     cdef int cb = (<_col_idx *> b).col
+ *     return (ca > cb) - (ca < cb)             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __pyx_r = ((__pyx_v_ca > __pyx_v_cb) - (__pyx_v_ca < __pyx_v_cb));
+  goto __pyx_L0;
+
+  /* "sisl/_sparse.pyx":499
+ * 
+ * 
+ * cdef int _col_idx_cmp(const void *a, const void *b) nogil:             # <<<<<<<<<<<<<<
+ *     cdef int ca = (<_col_idx *> a).col
+ *     cdef int cb = (<_col_idx *> b).col
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "sisl/_sparse.pyx":508
+ * @cython.wraparound(False)
+ * @cython.initializedcheck(False)
+ * def sparse_finalize(np.ndarray[np.int32_t, ndim=1, mode='c'] PTR,             # <<<<<<<<<<<<<<
+ *                     np.ndarray[np.int32_t, ndim=1, mode='c'] NCOL,
+ *                     np.ndarray[np.int32_t, ndim=1, mode='c'] COL,
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_4sisl_7_sparse_13sparse_finalize(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_4sisl_7_sparse_12sparse_finalize[] = " In-place compaction of a sparse matrix, optionally sorting the columns in each row\n\n    The elements of each row are moved to be consecutive (`PTR` is updated accordingly) and\n    the data rows are moved along with the column indices.\n    Short rows are sorted by insertion, long rows through `qsort` and an in-place permutation.\n\n    Parameters\n    ----------\n    PTR, NCOL, COL : numpy.ndarray(np.int32)\n       the sparsity pattern, `PTR` and `COL` are changed in-place\n    D : numpy.ndarray(np.uint8)\n       the data viewed as bytes (one row per element), changed in-place\n    sort : bool\n       whether the columns are sorted in each row\n\n    Returns\n    -------\n    nnz : number of non-zero elements (the retained part of `COL` and `D`)\n    row : the first row with duplicate column entries, ``-1`` if none\n    ";
+static PyMethodDef __pyx_mdef_4sisl_7_sparse_13sparse_finalize = {"sparse_finalize", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_4sisl_7_sparse_13sparse_finalize, METH_VARARGS|METH_KEYWORDS, __pyx_doc_4sisl_7_sparse_12sparse_finalize};
+static PyObject *__pyx_pw_4sisl_7_sparse_13sparse_finalize(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyArrayObject *__pyx_v_PTR = 0;
+  PyArrayObject *__pyx_v_NCOL = 0;
+  PyArrayObject *__pyx_v_COL = 0;
+  PyArrayObject *__pyx_v_D = 0;
+  int __pyx_v_sort;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("sparse_finalize (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_PTR,&__pyx_n_s_NCOL,&__pyx_n_s_COL,&__pyx_n_s_D,&__pyx_n_s_sort,0};
+    PyObject* values[5] = {0,0,0,0,0};
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case  5: values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
+        CYTHON_FALLTHROUGH;
+        case  4: values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+        CYTHON_FALLTHROUGH;
+        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        CYTHON_FALLTHROUGH;
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_PTR)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_NCOL)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("sparse_finalize", 1, 5, 5, 1); __PYX_ERR(0, 508, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  2:
+        if (likely((values[2] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_COL)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("sparse_finalize", 1, 5, 5, 2); __PYX_ERR(0, 508, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  3:
+        if (likely((values[3] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_D)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("sparse_finalize", 1, 5, 5, 3); __PYX_ERR(0, 508, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  4:
+        if (likely((values[4] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_sort)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("sparse_finalize", 1, 5, 5, 4); __PYX_ERR(0, 508, __pyx_L3_error)
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "sparse_finalize") < 0)) __PYX_ERR(0, 508, __pyx_L3_error)
+      }
+    } else if (PyTuple_GET_SIZE(__pyx_args) != 5) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+      values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+      values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+      values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+      values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
+    }
+    __pyx_v_PTR = ((PyArrayObject *)values[0]);
+    __pyx_v_NCOL = ((PyArrayObject *)values[1]);
+    __pyx_v_COL = ((PyArrayObject *)values[2]);
+    __pyx_v_D = ((PyArrayObject *)values[3]);
+    __pyx_v_sort = __Pyx_PyObject_IsTrue(values[4]); if (unlikely((__pyx_v_sort == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 512, __pyx_L3_error)
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("sparse_finalize", 1, 5, 5, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 508, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("sisl._sparse.sparse_finalize", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_PTR), __pyx_ptype_5numpy_ndarray, 1, "PTR", 0))) __PYX_ERR(0, 508, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_NCOL), __pyx_ptype_5numpy_ndarray, 1, "NCOL", 0))) __PYX_ERR(0, 509, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_COL), __pyx_ptype_5numpy_ndarray, 1, "COL", 0))) __PYX_ERR(0, 510, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_D), __pyx_ptype_5numpy_ndarray, 1, "D", 0))) __PYX_ERR(0, 511, __pyx_L1_error)
+  __pyx_r = __pyx_pf_4sisl_7_sparse_12sparse_finalize(__pyx_self, __pyx_v_PTR, __pyx_v_NCOL, __pyx_v_COL, __pyx_v_D, __pyx_v_sort);
+
+  /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_4sisl_7_sparse_12sparse_finalize(CYTHON_UNUSED PyObject *__pyx_self, PyArrayObject *__pyx_v_PTR, PyArrayObject *__pyx_v_NCOL, PyArrayObject *__pyx_v_COL, PyArrayObject *__pyx_v_D, int __pyx_v_sort) {
+  __Pyx_memviewslice __pyx_v_ptr = { 0, 0, { 0 }, { 0 }, { 0 } };
+  __Pyx_memviewslice __pyx_v_ncol = { 0, 0, { 0 }, { 0 }, { 0 } };
+  __Pyx_memviewslice __pyx_v_COL_v = { 0, 0, { 0 }, { 0 }, { 0 } };
+  __Pyx_memviewslice __pyx_v_D_v = { 0, 0, { 0 }, { 0 }, { 0 } };
+  size_t __pyx_v_sz;
+  int __pyx_v_nr;
+  int __pyx_v_r;
+  int __pyx_v_i;
+  int __pyx_v_j;
+  int __pyx_v_k;
+  int __pyx_v_n;
+  int __pyx_v_p;
+  int __pyx_v_q;
+  int __pyx_v_c;
+  int __pyx_v_max_k;
+  int __pyx_v_max_c;
+  int __pyx_v_err;
+  int *__pyx_v_col;
+  unsigned char *__pyx_v_data;
+  unsigned char *__pyx_v_tmp;
+  struct __pyx_t_4sisl_7_sparse__col_idx *__pyx_v_pairs;
+  int *__pyx_v_last;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_COL;
+  __Pyx_Buffer __pyx_pybuffer_COL;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_D;
+  __Pyx_Buffer __pyx_pybuffer_D;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_NCOL;
+  __Pyx_Buffer __pyx_pybuffer_NCOL;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_PTR;
+  __Pyx_Buffer __pyx_pybuffer_PTR;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  __Pyx_memviewslice __pyx_t_1 = { 0, 0, { 0 }, { 0 }, { 0 } };
+  __Pyx_memviewslice __pyx_t_2 = { 0, 0, { 0 }, { 0 }, { 0 } };
+  int __pyx_t_3;
+  int __pyx_t_4;
+  long __pyx_t_5;
+  long __pyx_t_6;
+  int __pyx_t_7;
+  Py_ssize_t __pyx_t_8;
+  Py_ssize_t __pyx_t_9;
+  Py_ssize_t __pyx_t_10;
+  Py_ssize_t __pyx_t_11;
+  int __pyx_t_12;
+  int __pyx_t_13;
+  Py_ssize_t __pyx_t_14;
+  Py_ssize_t __pyx_t_15;
+  Py_ssize_t __pyx_t_16;
+  int __pyx_t_17;
+  Py_ssize_t __pyx_t_18;
+  int __pyx_t_19;
+  int __pyx_t_20;
+  Py_ssize_t __pyx_t_21;
+  Py_ssize_t __pyx_t_22;
+  Py_ssize_t __pyx_t_23;
+  PyObject *__pyx_t_24 = NULL;
+  PyObject *__pyx_t_25 = NULL;
+  PyObject *__pyx_t_26 = NULL;
+  Py_ssize_t __pyx_t_27;
+  Py_ssize_t __pyx_t_28;
+  int __pyx_t_29;
+  __Pyx_RefNannySetupContext("sparse_finalize", 0);
+  __pyx_pybuffer_PTR.pybuffer.buf = NULL;
+  __pyx_pybuffer_PTR.refcount = 0;
+  __pyx_pybuffernd_PTR.data = NULL;
+  __pyx_pybuffernd_PTR.rcbuffer = &__pyx_pybuffer_PTR;
+  __pyx_pybuffer_NCOL.pybuffer.buf = NULL;
+  __pyx_pybuffer_NCOL.refcount = 0;
+  __pyx_pybuffernd_NCOL.data = NULL;
+  __pyx_pybuffernd_NCOL.rcbuffer = &__pyx_pybuffer_NCOL;
+  __pyx_pybuffer_COL.pybuffer.buf = NULL;
+  __pyx_pybuffer_COL.refcount = 0;
+  __pyx_pybuffernd_COL.data = NULL;
+  __pyx_pybuffernd_COL.rcbuffer = &__pyx_pybuffer_COL;
+  __pyx_pybuffer_D.pybuffer.buf = NULL;
+  __pyx_pybuffer_D.refcount = 0;
+  __pyx_pybuffernd_D.data = NULL;
+  __pyx_pybuffernd_D.rcbuffer = &__pyx_pybuffer_D;
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_PTR.rcbuffer->pybuffer, (PyObject*)__pyx_v_PTR, &__Pyx_TypeInfo_nn___pyx_t_5numpy_int32_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 508, __pyx_L1_error)
+  }
+  __pyx_pybuffernd_PTR.diminfo[0].strides = __pyx_pybuffernd_PTR.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_PTR.diminfo[0].shape = __pyx_pybuffernd_PTR.rcbuffer->pybuffer.shape[0];
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_NCOL.rcbuffer->pybuffer, (PyObject*)__pyx_v_NCOL, &__Pyx_TypeInfo_nn___pyx_t_5numpy_int32_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 508, __pyx_L1_error)
+  }
+  __pyx_pybuffernd_NCOL.diminfo[0].strides = __pyx_pybuffernd_NCOL.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_NCOL.diminfo[0].shape = __pyx_pybuffernd_NCOL.rcbuffer->pybuffer.shape[0];
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_COL.rcbuffer->pybuffer, (PyObject*)__pyx_v_COL, &__Pyx_TypeInfo_nn___pyx_t_5numpy_int32_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 508, __pyx_L1_error)
+  }
+  __pyx_pybuffernd_COL.diminfo[0].strides = __pyx_pybuffernd_COL.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_COL.diminfo[0].shape = __pyx_pybuffernd_COL.rcbuffer->pybuffer.shape[0];
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_D.rcbuffer->pybuffer, (PyObject*)__pyx_v_D, &__Pyx_TypeInfo_nn___pyx_t_5numpy_uint8_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 2, 0, __pyx_stack) == -1)) __PYX_ERR(0, 508, __pyx_L1_error)
+  }
+  __pyx_pybuffernd_D.diminfo[0].strides = __pyx_pybuffernd_D.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_D.diminfo[0].shape = __pyx_pybuffernd_D.rcbuffer->pybuffer.shape[0]; __pyx_pybuffernd_D.diminfo[1].strides = __pyx_pybuffernd_D.rcbuffer->pybuffer.strides[1]; __pyx_pybuffernd_D.diminfo[1].shape = __pyx_pybuffernd_D.rcbuffer->pybuffer.shape[1];
+
+  /* "sisl/_sparse.pyx":533
+ *     row : the first row with duplicate column entries, ``-1`` if none
+ *     """
+ *     cdef int[::1] ptr = PTR             # <<<<<<<<<<<<<<
+ *     cdef int[::1] ncol = NCOL
+ *     cdef int[::1] COL_v = COL
+ */
+  __pyx_t_1 = __Pyx_PyObject_to_MemoryviewSlice_dc_int(((PyObject *)__pyx_v_PTR), PyBUF_WRITABLE); if (unlikely(!__pyx_t_1.memview)) __PYX_ERR(0, 533, __pyx_L1_error)
+  __pyx_v_ptr = __pyx_t_1;
+  __pyx_t_1.memview = NULL;
+  __pyx_t_1.data = NULL;
+
+  /* "sisl/_sparse.pyx":534
+ *     """
+ *     cdef int[::1] ptr = PTR
+ *     cdef int[::1] ncol = NCOL             # <<<<<<<<<<<<<<
+ *     cdef int[::1] COL_v = COL
+ *     cdef unsigned char[:, ::1] D_v = D
+ */
+  __pyx_t_1 = __Pyx_PyObject_to_MemoryviewSlice_dc_int(((PyObject *)__pyx_v_NCOL), PyBUF_WRITABLE); if (unlikely(!__pyx_t_1.memview)) __PYX_ERR(0, 534, __pyx_L1_error)
+  __pyx_v_ncol = __pyx_t_1;
+  __pyx_t_1.memview = NULL;
+  __pyx_t_1.data = NULL;
+
+  /* "sisl/_sparse.pyx":535
+ *     cdef int[::1] ptr = PTR
+ *     cdef int[::1] ncol = NCOL
+ *     cdef int[::1] COL_v = COL             # <<<<<<<<<<<<<<
+ *     cdef unsigned char[:, ::1] D_v = D
+ *     cdef size_t sz = D.shape[1]
+ */
+  __pyx_t_1 = __Pyx_PyObject_to_MemoryviewSlice_dc_int(((PyObject *)__pyx_v_COL), PyBUF_WRITABLE); if (unlikely(!__pyx_t_1.memview)) __PYX_ERR(0, 535, __pyx_L1_error)
+  __pyx_v_COL_v = __pyx_t_1;
+  __pyx_t_1.memview = NULL;
+  __pyx_t_1.data = NULL;
+
+  /* "sisl/_sparse.pyx":536
+ *     cdef int[::1] ncol = NCOL
+ *     cdef int[::1] COL_v = COL
+ *     cdef unsigned char[:, ::1] D_v = D             # <<<<<<<<<<<<<<
+ *     cdef size_t sz = D.shape[1]
+ *     cdef int nr = ncol.shape[0]
+ */
+  __pyx_t_2 = __Pyx_PyObject_to_MemoryviewSlice_d_dc_unsigned_char(((PyObject *)__pyx_v_D), PyBUF_WRITABLE); if (unlikely(!__pyx_t_2.memview)) __PYX_ERR(0, 536, __pyx_L1_error)
+  __pyx_v_D_v = __pyx_t_2;
+  __pyx_t_2.memview = NULL;
+  __pyx_t_2.data = NULL;
+
+  /* "sisl/_sparse.pyx":537
+ *     cdef int[::1] COL_v = COL
+ *     cdef unsigned char[:, ::1] D_v = D
+ *     cdef size_t sz = D.shape[1]             # <<<<<<<<<<<<<<
+ *     cdef int nr = ncol.shape[0]
+ * 
+ */
+  __pyx_v_sz = (__pyx_v_D->dimensions[1]);
+
+  /* "sisl/_sparse.pyx":538
+ *     cdef unsigned char[:, ::1] D_v = D
+ *     cdef size_t sz = D.shape[1]
+ *     cdef int nr = ncol.shape[0]             # <<<<<<<<<<<<<<
+ * 
+ *     cdef int r, i, j, k, n, p, q, c, max_k, max_c, err
+ */
+  __pyx_v_nr = (__pyx_v_ncol.shape[0]);
+
+  /* "sisl/_sparse.pyx":547
+ *     cdef int *last
+ * 
+ *     if COL_v.shape[0] == 0 or D_v.shape[0] == 0:             # <<<<<<<<<<<<<<
+ *         for r in range(nr + 1):
+ *             ptr[r] = 0
+ */
+  __pyx_t_4 = (((__pyx_v_COL_v.shape[0]) == 0) != 0);
+  if (!__pyx_t_4) {
+  } else {
+    __pyx_t_3 = __pyx_t_4;
+    goto __pyx_L4_bool_binop_done;
+  }
+  __pyx_t_4 = (((__pyx_v_D_v.shape[0]) == 0) != 0);
+  __pyx_t_3 = __pyx_t_4;
+  __pyx_L4_bool_binop_done:;
+  if (__pyx_t_3) {
+
+    /* "sisl/_sparse.pyx":548
+ * 
+ *     if COL_v.shape[0] == 0 or D_v.shape[0] == 0:
+ *         for r in range(nr + 1):             # <<<<<<<<<<<<<<
+ *             ptr[r] = 0
+ *         return 0, -1
+ */
+    __pyx_t_5 = (__pyx_v_nr + 1);
+    __pyx_t_6 = __pyx_t_5;
+    for (__pyx_t_7 = 0; __pyx_t_7 < __pyx_t_6; __pyx_t_7+=1) {
+      __pyx_v_r = __pyx_t_7;
+
+      /* "sisl/_sparse.pyx":549
+ *     if COL_v.shape[0] == 0 or D_v.shape[0] == 0:
+ *         for r in range(nr + 1):
+ *             ptr[r] = 0             # <<<<<<<<<<<<<<
+ *         return 0, -1
+ *     col = &COL_v[0]
+ */
+      __pyx_t_8 = __pyx_v_r;
+      *((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_ptr.data) + __pyx_t_8)) )) = 0;
+    }
+
+    /* "sisl/_sparse.pyx":550
+ *         for r in range(nr + 1):
+ *             ptr[r] = 0
+ *         return 0, -1             # <<<<<<<<<<<<<<
+ *     col = &COL_v[0]
+ *     data = &D_v[0, 0]
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __Pyx_INCREF(__pyx_tuple__4);
+    __pyx_r = __pyx_tuple__4;
+    goto __pyx_L0;
+
+    /* "sisl/_sparse.pyx":547
+ *     cdef int *last
+ * 
+ *     if COL_v.shape[0] == 0 or D_v.shape[0] == 0:             # <<<<<<<<<<<<<<
+ *         for r in range(nr + 1):
+ *             ptr[r] = 0
+ */
+  }
+
+  /* "sisl/_sparse.pyx":551
+ *             ptr[r] = 0
+ *         return 0, -1
+ *     col = &COL_v[0]             # <<<<<<<<<<<<<<
+ *     data = &D_v[0, 0]
+ * 
+ */
+  __pyx_t_9 = 0;
+  __pyx_v_col = (&(*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_COL_v.data) + __pyx_t_9)) ))));
+
+  /* "sisl/_sparse.pyx":552
+ *         return 0, -1
+ *     col = &COL_v[0]
+ *     data = &D_v[0, 0]             # <<<<<<<<<<<<<<
+ * 
+ *     # Compact the elements
+ */
+  __pyx_t_10 = 0;
+  __pyx_t_11 = 0;
+  __pyx_v_data = (&(*((unsigned char *) ( /* dim=1 */ ((char *) (((unsigned char *) ( /* dim=0 */ (__pyx_v_D_v.data + __pyx_t_10 * __pyx_v_D_v.strides[0]) )) + __pyx_t_11)) ))));
+
+  /* "sisl/_sparse.pyx":555
+ * 
+ *     # Compact the elements
+ *     n = 0             # <<<<<<<<<<<<<<
+ *     max_k = 0
+ *     max_c = 0
+ */
+  __pyx_v_n = 0;
+
+  /* "sisl/_sparse.pyx":556
+ *     # Compact the elements
+ *     n = 0
+ *     max_k = 0             # <<<<<<<<<<<<<<
+ *     max_c = 0
+ *     with nogil:
+ */
+  __pyx_v_max_k = 0;
+
+  /* "sisl/_sparse.pyx":557
+ *     n = 0
+ *     max_k = 0
+ *     max_c = 0             # <<<<<<<<<<<<<<
+ *     with nogil:
+ *         for r in range(nr):
+ */
+  __pyx_v_max_c = 0;
+
+  /* "sisl/_sparse.pyx":558
+ *     max_k = 0
+ *     max_c = 0
+ *     with nogil:             # <<<<<<<<<<<<<<
+ *         for r in range(nr):
+ *             i = ptr[r]
+ */
+  {
+      #ifdef WITH_THREAD
+      PyThreadState *_save;
+      Py_UNBLOCK_THREADS
+      __Pyx_FastGIL_Remember();
+      #endif
+      /*try:*/ {
+
+        /* "sisl/_sparse.pyx":559
+ *     max_c = 0
+ *     with nogil:
+ *         for r in range(nr):             # <<<<<<<<<<<<<<
+ *             i = ptr[r]
+ *             k = ncol[r]
+ */
+        __pyx_t_7 = __pyx_v_nr;
+        __pyx_t_12 = __pyx_t_7;
+        for (__pyx_t_13 = 0; __pyx_t_13 < __pyx_t_12; __pyx_t_13+=1) {
+          __pyx_v_r = __pyx_t_13;
+
+          /* "sisl/_sparse.pyx":560
+ *     with nogil:
+ *         for r in range(nr):
+ *             i = ptr[r]             # <<<<<<<<<<<<<<
+ *             k = ncol[r]
+ *             if i != n:
+ */
+          __pyx_t_14 = __pyx_v_r;
+          __pyx_v_i = (*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_ptr.data) + __pyx_t_14)) )));
+
+          /* "sisl/_sparse.pyx":561
+ *         for r in range(nr):
+ *             i = ptr[r]
+ *             k = ncol[r]             # <<<<<<<<<<<<<<
+ *             if i != n:
+ *                 memmove(&col[n], &col[i], k * sizeof(int))
+ */
+          __pyx_t_15 = __pyx_v_r;
+          __pyx_v_k = (*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_ncol.data) + __pyx_t_15)) )));
+
+          /* "sisl/_sparse.pyx":562
+ *             i = ptr[r]
+ *             k = ncol[r]
+ *             if i != n:             # <<<<<<<<<<<<<<
+ *                 memmove(&col[n], &col[i], k * sizeof(int))
+ *                 memmove(&data[n * sz], &data[i * sz], k * sz)
+ */
+          __pyx_t_3 = ((__pyx_v_i != __pyx_v_n) != 0);
+          if (__pyx_t_3) {
+
+            /* "sisl/_sparse.pyx":563
+ *             k = ncol[r]
+ *             if i != n:
+ *                 memmove(&col[n], &col[i], k * sizeof(int))             # <<<<<<<<<<<<<<
+ *                 memmove(&data[n * sz], &data[i * sz], k * sz)
+ *             ptr[r] = n
+ */
+            (void)(memmove((&(__pyx_v_col[__pyx_v_n])), (&(__pyx_v_col[__pyx_v_i])), (__pyx_v_k * (sizeof(int)))));
+
+            /* "sisl/_sparse.pyx":564
+ *             if i != n:
+ *                 memmove(&col[n], &col[i], k * sizeof(int))
+ *                 memmove(&data[n * sz], &data[i * sz], k * sz)             # <<<<<<<<<<<<<<
+ *             ptr[r] = n
+ *             n += k
+ */
+            (void)(memmove((&(__pyx_v_data[(__pyx_v_n * __pyx_v_sz)])), (&(__pyx_v_data[(__pyx_v_i * __pyx_v_sz)])), (__pyx_v_k * __pyx_v_sz)));
+
+            /* "sisl/_sparse.pyx":562
+ *             i = ptr[r]
+ *             k = ncol[r]
+ *             if i != n:             # <<<<<<<<<<<<<<
+ *                 memmove(&col[n], &col[i], k * sizeof(int))
+ *                 memmove(&data[n * sz], &data[i * sz], k * sz)
+ */
+          }
+
+          /* "sisl/_sparse.pyx":565
+ *                 memmove(&col[n], &col[i], k * sizeof(int))
+ *                 memmove(&data[n * sz], &data[i * sz], k * sz)
+ *             ptr[r] = n             # <<<<<<<<<<<<<<
+ *             n += k
+ *             if k > max_k:
+ */
+          __pyx_t_16 = __pyx_v_r;
+          *((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_ptr.data) + __pyx_t_16)) )) = __pyx_v_n;
+
+          /* "sisl/_sparse.pyx":566
+ *                 memmove(&data[n * sz], &data[i * sz], k * sz)
+ *             ptr[r] = n
+ *             n += k             # <<<<<<<<<<<<<<
+ *             if k > max_k:
+ *                 max_k = k
+ */
+          __pyx_v_n = (__pyx_v_n + __pyx_v_k);
+
+          /* "sisl/_sparse.pyx":567
+ *             ptr[r] = n
+ *             n += k
+ *             if k > max_k:             # <<<<<<<<<<<<<<
+ *                 max_k = k
+ *             for j in range(ptr[r], n):
+ */
+          __pyx_t_3 = ((__pyx_v_k > __pyx_v_max_k) != 0);
+          if (__pyx_t_3) {
+
+            /* "sisl/_sparse.pyx":568
+ *             n += k
+ *             if k > max_k:
+ *                 max_k = k             # <<<<<<<<<<<<<<
+ *             for j in range(ptr[r], n):
+ *                 if col[j] > max_c:
+ */
+            __pyx_v_max_k = __pyx_v_k;
+
+            /* "sisl/_sparse.pyx":567
+ *             ptr[r] = n
+ *             n += k
+ *             if k > max_k:             # <<<<<<<<<<<<<<
+ *                 max_k = k
+ *             for j in range(ptr[r], n):
+ */
+          }
+
+          /* "sisl/_sparse.pyx":569
+ *             if k > max_k:
+ *                 max_k = k
+ *             for j in range(ptr[r], n):             # <<<<<<<<<<<<<<
+ *                 if col[j] > max_c:
+ *                     max_c = col[j]
+ */
+          __pyx_t_17 = __pyx_v_n;
+          __pyx_t_18 = __pyx_v_r;
+          __pyx_t_19 = __pyx_t_17;
+          for (__pyx_t_20 = (*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_ptr.data) + __pyx_t_18)) ))); __pyx_t_20 < __pyx_t_19; __pyx_t_20+=1) {
+            __pyx_v_j = __pyx_t_20;
+
+            /* "sisl/_sparse.pyx":570
+ *                 max_k = k
+ *             for j in range(ptr[r], n):
+ *                 if col[j] > max_c:             # <<<<<<<<<<<<<<
+ *                     max_c = col[j]
+ *         ptr[nr] = n
+ */
+            __pyx_t_3 = (((__pyx_v_col[__pyx_v_j]) > __pyx_v_max_c) != 0);
+            if (__pyx_t_3) {
+
+              /* "sisl/_sparse.pyx":571
+ *             for j in range(ptr[r], n):
+ *                 if col[j] > max_c:
+ *                     max_c = col[j]             # <<<<<<<<<<<<<<
+ *         ptr[nr] = n
+ * 
+ */
+              __pyx_v_max_c = (__pyx_v_col[__pyx_v_j]);
+
+              /* "sisl/_sparse.pyx":570
+ *                 max_k = k
+ *             for j in range(ptr[r], n):
+ *                 if col[j] > max_c:             # <<<<<<<<<<<<<<
+ *                     max_c = col[j]
+ *         ptr[nr] = n
+ */
+            }
+          }
+        }
+
+        /* "sisl/_sparse.pyx":572
+ *                 if col[j] > max_c:
+ *                     max_c = col[j]
+ *         ptr[nr] = n             # <<<<<<<<<<<<<<
+ * 
+ *     err = -1
+ */
+        __pyx_t_21 = __pyx_v_nr;
+        *((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_ptr.data) + __pyx_t_21)) )) = __pyx_v_n;
+      }
+
+      /* "sisl/_sparse.pyx":558
+ *     max_k = 0
+ *     max_c = 0
+ *     with nogil:             # <<<<<<<<<<<<<<
+ *         for r in range(nr):
+ *             i = ptr[r]
+ */
+      /*finally:*/ {
+        /*normal exit:*/{
+          #ifdef WITH_THREAD
+          __Pyx_FastGIL_Forget();
+          Py_BLOCK_THREADS
+          #endif
+          goto __pyx_L10;
+        }
+        __pyx_L10:;
+      }
+  }
+
+  /* "sisl/_sparse.pyx":574
+ *         ptr[nr] = n
+ * 
+ *     err = -1             # <<<<<<<<<<<<<<
+ *     if not sort:
+ *         # Check for duplicates by marking the last row each column is found in
+ */
+  __pyx_v_err = -1;
+
+  /* "sisl/_sparse.pyx":575
+ * 
+ *     err = -1
+ *     if not sort:             # <<<<<<<<<<<<<<
+ *         # Check for duplicates by marking the last row each column is found in
+ *         last = <int *> malloc((max_c + 1) * sizeof(int))
+ */
+  __pyx_t_3 = ((!(__pyx_v_sort != 0)) != 0);
+  if (__pyx_t_3) {
+
+    /* "sisl/_sparse.pyx":577
+ *     if not sort:
+ *         # Check for duplicates by marking the last row each column is found in
+ *         last = <int *> malloc((max_c + 1) * sizeof(int))             # <<<<<<<<<<<<<<
+ *         if last is NULL:
+ *             raise MemoryError()
+ */
+    __pyx_v_last = ((int *)malloc(((__pyx_v_max_c + 1) * (sizeof(int)))));
+
+    /* "sisl/_sparse.pyx":578
+ *         # Check for duplicates by marking the last row each column is found in
+ *         last = <int *> malloc((max_c + 1) * sizeof(int))
+ *         if last is NULL:             # <<<<<<<<<<<<<<
+ *             raise MemoryError()
+ *         with nogil:
+ */
+    __pyx_t_3 = ((__pyx_v_last == NULL) != 0);
+    if (unlikely(__pyx_t_3)) {
+
+      /* "sisl/_sparse.pyx":579
+ *         last = <int *> malloc((max_c + 1) * sizeof(int))
+ *         if last is NULL:
+ *             raise MemoryError()             # <<<<<<<<<<<<<<
+ *         with nogil:
+ *             for c in range(max_c + 1):
+ */
+      PyErr_NoMemory(); __PYX_ERR(0, 579, __pyx_L1_error)
+
+      /* "sisl/_sparse.pyx":578
+ *         # Check for duplicates by marking the last row each column is found in
+ *         last = <int *> malloc((max_c + 1) * sizeof(int))
+ *         if last is NULL:             # <<<<<<<<<<<<<<
+ *             raise MemoryError()
+ *         with nogil:
+ */
+    }
+
+    /* "sisl/_sparse.pyx":580
+ *         if last is NULL:
+ *             raise MemoryError()
+ *         with nogil:             # <<<<<<<<<<<<<<
+ *             for c in range(max_c + 1):
+ *                 last[c] = -1
+ */
+    {
+        #ifdef WITH_THREAD
+        PyThreadState *_save;
+        Py_UNBLOCK_THREADS
+        __Pyx_FastGIL_Remember();
+        #endif
+        /*try:*/ {
+
+          /* "sisl/_sparse.pyx":581
+ *             raise MemoryError()
+ *         with nogil:
+ *             for c in range(max_c + 1):             # <<<<<<<<<<<<<<
+ *                 last[c] = -1
+ *             for r in range(nr):
+ */
+          __pyx_t_5 = (__pyx_v_max_c + 1);
+          __pyx_t_6 = __pyx_t_5;
+          for (__pyx_t_7 = 0; __pyx_t_7 < __pyx_t_6; __pyx_t_7+=1) {
+            __pyx_v_c = __pyx_t_7;
+
+            /* "sisl/_sparse.pyx":582
+ *         with nogil:
+ *             for c in range(max_c + 1):
+ *                 last[c] = -1             # <<<<<<<<<<<<<<
+ *             for r in range(nr):
+ *                 for j in range(ptr[r], ptr[r + 1]):
+ */
+            (__pyx_v_last[__pyx_v_c]) = -1;
+          }
+
+          /* "sisl/_sparse.pyx":583
+ *             for c in range(max_c + 1):
+ *                 last[c] = -1
+ *             for r in range(nr):             # <<<<<<<<<<<<<<
+ *                 for j in range(ptr[r], ptr[r + 1]):
+ *                     if last[col[j]] == r:
+ */
+          __pyx_t_7 = __pyx_v_nr;
+          __pyx_t_12 = __pyx_t_7;
+          for (__pyx_t_13 = 0; __pyx_t_13 < __pyx_t_12; __pyx_t_13+=1) {
+            __pyx_v_r = __pyx_t_13;
+
+            /* "sisl/_sparse.pyx":584
+ *                 last[c] = -1
+ *             for r in range(nr):
+ *                 for j in range(ptr[r], ptr[r + 1]):             # <<<<<<<<<<<<<<
+ *                     if last[col[j]] == r:
+ *                         err = r
+ */
+            __pyx_t_22 = (__pyx_v_r + 1);
+            __pyx_t_17 = (*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_ptr.data) + __pyx_t_22)) )));
+            __pyx_t_23 = __pyx_v_r;
+            __pyx_t_19 = __pyx_t_17;
+            for (__pyx_t_20 = (*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_ptr.data) + __pyx_t_23)) ))); __pyx_t_20 < __pyx_t_19; __pyx_t_20+=1) {
+              __pyx_v_j = __pyx_t_20;
+
+              /* "sisl/_sparse.pyx":585
+ *             for r in range(nr):
+ *                 for j in range(ptr[r], ptr[r + 1]):
+ *                     if last[col[j]] == r:             # <<<<<<<<<<<<<<
+ *                         err = r
+ *                         break
+ */
+              __pyx_t_3 = (((__pyx_v_last[(__pyx_v_col[__pyx_v_j])]) == __pyx_v_r) != 0);
+              if (__pyx_t_3) {
+
+                /* "sisl/_sparse.pyx":586
+ *                 for j in range(ptr[r], ptr[r + 1]):
+ *                     if last[col[j]] == r:
+ *                         err = r             # <<<<<<<<<<<<<<
+ *                         break
+ *                     last[col[j]] = r
+ */
+                __pyx_v_err = __pyx_v_r;
+
+                /* "sisl/_sparse.pyx":587
+ *                     if last[col[j]] == r:
+ *                         err = r
+ *                         break             # <<<<<<<<<<<<<<
+ *                     last[col[j]] = r
+ *                 if err >= 0:
+ */
+                goto __pyx_L28_break;
+
+                /* "sisl/_sparse.pyx":585
+ *             for r in range(nr):
+ *                 for j in range(ptr[r], ptr[r + 1]):
+ *                     if last[col[j]] == r:             # <<<<<<<<<<<<<<
+ *                         err = r
+ *                         break
+ */
+              }
+
+              /* "sisl/_sparse.pyx":588
+ *                         err = r
+ *                         break
+ *                     last[col[j]] = r             # <<<<<<<<<<<<<<
+ *                 if err >= 0:
+ *                     break
+ */
+              (__pyx_v_last[(__pyx_v_col[__pyx_v_j])]) = __pyx_v_r;
+            }
+            __pyx_L28_break:;
+
+            /* "sisl/_sparse.pyx":589
+ *                         break
+ *                     last[col[j]] = r
+ *                 if err >= 0:             # <<<<<<<<<<<<<<
+ *                     break
+ *         free(last)
+ */
+            __pyx_t_3 = ((__pyx_v_err >= 0) != 0);
+            if (__pyx_t_3) {
+
+              /* "sisl/_sparse.pyx":590
+ *                     last[col[j]] = r
+ *                 if err >= 0:
+ *                     break             # <<<<<<<<<<<<<<
+ *         free(last)
+ *         return n, err
+ */
+              goto __pyx_L26_break;
+
+              /* "sisl/_sparse.pyx":589
+ *                         break
+ *                     last[col[j]] = r
+ *                 if err >= 0:             # <<<<<<<<<<<<<<
+ *                     break
+ *         free(last)
+ */
+            }
+          }
+          __pyx_L26_break:;
+        }
+
+        /* "sisl/_sparse.pyx":580
+ *         if last is NULL:
+ *             raise MemoryError()
+ *         with nogil:             # <<<<<<<<<<<<<<
+ *             for c in range(max_c + 1):
+ *                 last[c] = -1
+ */
+        /*finally:*/ {
+          /*normal exit:*/{
+            #ifdef WITH_THREAD
+            __Pyx_FastGIL_Forget();
+            Py_BLOCK_THREADS
+            #endif
+            goto __pyx_L22;
+          }
+          __pyx_L22:;
+        }
+    }
+
+    /* "sisl/_sparse.pyx":591
+ *                 if err >= 0:
+ *                     break
+ *         free(last)             # <<<<<<<<<<<<<<
+ *         return n, err
+ * 
+ */
+    free(__pyx_v_last);
+
+    /* "sisl/_sparse.pyx":592
+ *                     break
+ *         free(last)
+ *         return n, err             # <<<<<<<<<<<<<<
+ * 
+ *     tmp = <unsigned char *> malloc(sz + 1)
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_t_24 = __Pyx_PyInt_From_int(__pyx_v_n); if (unlikely(!__pyx_t_24)) __PYX_ERR(0, 592, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_24);
+    __pyx_t_25 = __Pyx_PyInt_From_int(__pyx_v_err); if (unlikely(!__pyx_t_25)) __PYX_ERR(0, 592, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_25);
+    __pyx_t_26 = PyTuple_New(2); if (unlikely(!__pyx_t_26)) __PYX_ERR(0, 592, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_26);
+    __Pyx_GIVEREF(__pyx_t_24);
+    PyTuple_SET_ITEM(__pyx_t_26, 0, __pyx_t_24);
+    __Pyx_GIVEREF(__pyx_t_25);
+    PyTuple_SET_ITEM(__pyx_t_26, 1, __pyx_t_25);
+    __pyx_t_24 = 0;
+    __pyx_t_25 = 0;
+    __pyx_r = __pyx_t_26;
+    __pyx_t_26 = 0;
+    goto __pyx_L0;
+
+    /* "sisl/_sparse.pyx":575
+ * 
+ *     err = -1
+ *     if not sort:             # <<<<<<<<<<<<<<
+ *         # Check for duplicates by marking the last row each column is found in
+ *         last = <int *> malloc((max_c + 1) * sizeof(int))
+ */
+  }
+
+  /* "sisl/_sparse.pyx":594
+ *         return n, err
+ * 
+ *     tmp = <unsigned char *> malloc(sz + 1)             # <<<<<<<<<<<<<<
+ *     pairs = <_col_idx *> malloc((max_k + 1) * sizeof(_col_idx))
+ *     if tmp is NULL or pairs is NULL:
+ */
+  __pyx_v_tmp = ((unsigned char *)malloc((__pyx_v_sz + 1)));
+
+  /* "sisl/_sparse.pyx":595
+ * 
+ *     tmp = <unsigned char *> malloc(sz + 1)
+ *     pairs = <_col_idx *> malloc((max_k + 1) * sizeof(_col_idx))             # <<<<<<<<<<<<<<
+ *     if tmp is NULL or pairs is NULL:
+ *         free(tmp)
+ */
+  __pyx_v_pairs = ((struct __pyx_t_4sisl_7_sparse__col_idx *)malloc(((__pyx_v_max_k + 1) * (sizeof(struct __pyx_t_4sisl_7_sparse__col_idx)))));
+
+  /* "sisl/_sparse.pyx":596
+ *     tmp = <unsigned char *> malloc(sz + 1)
+ *     pairs = <_col_idx *> malloc((max_k + 1) * sizeof(_col_idx))
+ *     if tmp is NULL or pairs is NULL:             # <<<<<<<<<<<<<<
+ *         free(tmp)
+ *         free(pairs)
+ */
+  __pyx_t_4 = ((__pyx_v_tmp == NULL) != 0);
+  if (!__pyx_t_4) {
+  } else {
+    __pyx_t_3 = __pyx_t_4;
+    goto __pyx_L32_bool_binop_done;
+  }
+  __pyx_t_4 = ((__pyx_v_pairs == NULL) != 0);
+  __pyx_t_3 = __pyx_t_4;
+  __pyx_L32_bool_binop_done:;
+  if (unlikely(__pyx_t_3)) {
+
+    /* "sisl/_sparse.pyx":597
+ *     pairs = <_col_idx *> malloc((max_k + 1) * sizeof(_col_idx))
+ *     if tmp is NULL or pairs is NULL:
+ *         free(tmp)             # <<<<<<<<<<<<<<
+ *         free(pairs)
+ *         raise MemoryError()
+ */
+    free(__pyx_v_tmp);
+
+    /* "sisl/_sparse.pyx":598
+ *     if tmp is NULL or pairs is NULL:
+ *         free(tmp)
+ *         free(pairs)             # <<<<<<<<<<<<<<
+ *         raise MemoryError()
+ * 
+ */
+    free(__pyx_v_pairs);
+
+    /* "sisl/_sparse.pyx":599
+ *         free(tmp)
+ *         free(pairs)
+ *         raise MemoryError()             # <<<<<<<<<<<<<<
+ * 
+ *     with nogil:
+ */
+    PyErr_NoMemory(); __PYX_ERR(0, 599, __pyx_L1_error)
+
+    /* "sisl/_sparse.pyx":596
+ *     tmp = <unsigned char *> malloc(sz + 1)
+ *     pairs = <_col_idx *> malloc((max_k + 1) * sizeof(_col_idx))
+ *     if tmp is NULL or pairs is NULL:             # <<<<<<<<<<<<<<
+ *         free(tmp)
+ *         free(pairs)
+ */
+  }
+
+  /* "sisl/_sparse.pyx":601
+ *         raise MemoryError()
+ * 
+ *     with nogil:             # <<<<<<<<<<<<<<
+ *         for r in range(nr):
+ *             i = ptr[r]
+ */
+  {
+      #ifdef WITH_THREAD
+      PyThreadState *_save;
+      Py_UNBLOCK_THREADS
+      __Pyx_FastGIL_Remember();
+      #endif
+      /*try:*/ {
+
+        /* "sisl/_sparse.pyx":602
+ * 
+ *     with nogil:
+ *         for r in range(nr):             # <<<<<<<<<<<<<<
+ *             i = ptr[r]
+ *             k = ncol[r]
+ */
+        __pyx_t_7 = __pyx_v_nr;
+        __pyx_t_12 = __pyx_t_7;
+        for (__pyx_t_13 = 0; __pyx_t_13 < __pyx_t_12; __pyx_t_13+=1) {
+          __pyx_v_r = __pyx_t_13;
+
+          /* "sisl/_sparse.pyx":603
+ *     with nogil:
+ *         for r in range(nr):
+ *             i = ptr[r]             # <<<<<<<<<<<<<<
+ *             k = ncol[r]
+ * 
+ */
+          __pyx_t_27 = __pyx_v_r;
+          __pyx_v_i = (*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_ptr.data) + __pyx_t_27)) )));
+
+          /* "sisl/_sparse.pyx":604
+ *         for r in range(nr):
+ *             i = ptr[r]
+ *             k = ncol[r]             # <<<<<<<<<<<<<<
+ * 
+ *             if k <= 32:
+ */
+          __pyx_t_28 = __pyx_v_r;
+          __pyx_v_k = (*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_ncol.data) + __pyx_t_28)) )));
+
+          /* "sisl/_sparse.pyx":606
+ *             k = ncol[r]
+ * 
+ *             if k <= 32:             # <<<<<<<<<<<<<<
+ *                 # Insertion sort, shifting the column indices and data rows
+ *                 for j in range(i + 1, i + k):
+ */
+          __pyx_t_3 = ((__pyx_v_k <= 32) != 0);
+          if (__pyx_t_3) {
+
+            /* "sisl/_sparse.pyx":608
+ *             if k <= 32:
+ *                 # Insertion sort, shifting the column indices and data rows
+ *                 for j in range(i + 1, i + k):             # <<<<<<<<<<<<<<
+ *                     c = col[j]
+ *                     p = j
+ */
+            __pyx_t_17 = (__pyx_v_i + __pyx_v_k);
+            __pyx_t_19 = __pyx_t_17;
+            for (__pyx_t_20 = (__pyx_v_i + 1); __pyx_t_20 < __pyx_t_19; __pyx_t_20+=1) {
+              __pyx_v_j = __pyx_t_20;
+
+              /* "sisl/_sparse.pyx":609
+ *                 # Insertion sort, shifting the column indices and data rows
+ *                 for j in range(i + 1, i + k):
+ *                     c = col[j]             # <<<<<<<<<<<<<<
+ *                     p = j
+ *                     while p > i and col[p - 1] > c:
+ */
+              __pyx_v_c = (__pyx_v_col[__pyx_v_j]);
+
+              /* "sisl/_sparse.pyx":610
+ *                 for j in range(i + 1, i + k):
+ *                     c = col[j]
+ *                     p = j             # <<<<<<<<<<<<<<
+ *                     while p > i and col[p - 1] > c:
+ *                         p -= 1
+ */
+              __pyx_v_p = __pyx_v_j;
+
+              /* "sisl/_sparse.pyx":611
+ *                     c = col[j]
+ *                     p = j
+ *                     while p > i and col[p - 1] > c:             # <<<<<<<<<<<<<<
+ *                         p -= 1
+ *                     if p != j:
+ */
+              while (1) {
+                __pyx_t_4 = ((__pyx_v_p > __pyx_v_i) != 0);
+                if (__pyx_t_4) {
+                } else {
+                  __pyx_t_3 = __pyx_t_4;
+                  goto __pyx_L44_bool_binop_done;
+                }
+                __pyx_t_4 = (((__pyx_v_col[(__pyx_v_p - 1)]) > __pyx_v_c) != 0);
+                __pyx_t_3 = __pyx_t_4;
+                __pyx_L44_bool_binop_done:;
+                if (!__pyx_t_3) break;
+
+                /* "sisl/_sparse.pyx":612
+ *                     p = j
+ *                     while p > i and col[p - 1] > c:
+ *                         p -= 1             # <<<<<<<<<<<<<<
+ *                     if p != j:
+ *                         memcpy(tmp, &data[j * sz], sz)
+ */
+                __pyx_v_p = (__pyx_v_p - 1);
+              }
+
+              /* "sisl/_sparse.pyx":613
+ *                     while p > i and col[p - 1] > c:
+ *                         p -= 1
+ *                     if p != j:             # <<<<<<<<<<<<<<
+ *                         memcpy(tmp, &data[j * sz], sz)
+ *                         memmove(&col[p + 1], &col[p], (j - p) * sizeof(int))
+ */
+              __pyx_t_3 = ((__pyx_v_p != __pyx_v_j) != 0);
+              if (__pyx_t_3) {
+
+                /* "sisl/_sparse.pyx":614
+ *                         p -= 1
+ *                     if p != j:
+ *                         memcpy(tmp, &data[j * sz], sz)             # <<<<<<<<<<<<<<
+ *                         memmove(&col[p + 1], &col[p], (j - p) * sizeof(int))
+ *                         memmove(&data[(p + 1) * sz], &data[p * sz], (j - p) * sz)
+ */
+                (void)(memcpy(__pyx_v_tmp, (&(__pyx_v_data[(__pyx_v_j * __pyx_v_sz)])), __pyx_v_sz));
+
+                /* "sisl/_sparse.pyx":615
+ *                     if p != j:
+ *                         memcpy(tmp, &data[j * sz], sz)
+ *                         memmove(&col[p + 1], &col[p], (j - p) * sizeof(int))             # <<<<<<<<<<<<<<
+ *                         memmove(&data[(p + 1) * sz], &data[p * sz], (j - p) * sz)
+ *                         col[p] = c
+ */
+                (void)(memmove((&(__pyx_v_col[(__pyx_v_p + 1)])), (&(__pyx_v_col[__pyx_v_p])), ((__pyx_v_j - __pyx_v_p) * (sizeof(int)))));
+
+                /* "sisl/_sparse.pyx":616
+ *                         memcpy(tmp, &data[j * sz], sz)
+ *                         memmove(&col[p + 1], &col[p], (j - p) * sizeof(int))
+ *                         memmove(&data[(p + 1) * sz], &data[p * sz], (j - p) * sz)             # <<<<<<<<<<<<<<
+ *                         col[p] = c
+ *                         memcpy(&data[p * sz], tmp, sz)
+ */
+                (void)(memmove((&(__pyx_v_data[((__pyx_v_p + 1) * __pyx_v_sz)])), (&(__pyx_v_data[(__pyx_v_p * __pyx_v_sz)])), ((__pyx_v_j - __pyx_v_p) * __pyx_v_sz)));
+
+                /* "sisl/_sparse.pyx":617
+ *                         memmove(&col[p + 1], &col[p], (j - p) * sizeof(int))
+ *                         memmove(&data[(p + 1) * sz], &data[p * sz], (j - p) * sz)
+ *                         col[p] = c             # <<<<<<<<<<<<<<
+ *                         memcpy(&data[p * sz], tmp, sz)
+ * 
+ */
+                (__pyx_v_col[__pyx_v_p]) = __pyx_v_c;
+
+                /* "sisl/_sparse.pyx":618
+ *                         memmove(&data[(p + 1) * sz], &data[p * sz], (j - p) * sz)
+ *                         col[p] = c
+ *                         memcpy(&data[p * sz], tmp, sz)             # <<<<<<<<<<<<<<
+ * 
+ *             else:
+ */
+                (void)(memcpy((&(__pyx_v_data[(__pyx_v_p * __pyx_v_sz)])), __pyx_v_tmp, __pyx_v_sz));
+
+                /* "sisl/_sparse.pyx":613
+ *                     while p > i and col[p - 1] > c:
+ *                         p -= 1
+ *                     if p != j:             # <<<<<<<<<<<<<<
+ *                         memcpy(tmp, &data[j * sz], sz)
+ *                         memmove(&col[p + 1], &col[p], (j - p) * sizeof(int))
+ */
+              }
+            }
+
+            /* "sisl/_sparse.pyx":606
+ *             k = ncol[r]
+ * 
+ *             if k <= 32:             # <<<<<<<<<<<<<<
+ *                 # Insertion sort, shifting the column indices and data rows
+ *                 for j in range(i + 1, i + k):
+ */
+            goto __pyx_L39;
+          }
+
+          /* "sisl/_sparse.pyx":621
+ * 
+ *             else:
+ *                 for j in range(k):             # <<<<<<<<<<<<<<
+ *                     pairs[j].col = col[i + j]
+ *                     pairs[j].idx = j
+ */
+          /*else*/ {
+            __pyx_t_17 = __pyx_v_k;
+            __pyx_t_19 = __pyx_t_17;
+            for (__pyx_t_20 = 0; __pyx_t_20 < __pyx_t_19; __pyx_t_20+=1) {
+              __pyx_v_j = __pyx_t_20;
+
+              /* "sisl/_sparse.pyx":622
+ *             else:
+ *                 for j in range(k):
+ *                     pairs[j].col = col[i + j]             # <<<<<<<<<<<<<<
+ *                     pairs[j].idx = j
+ *                 qsort(pairs, k, sizeof(_col_idx), _col_idx_cmp)
+ */
+              (__pyx_v_pairs[__pyx_v_j]).col = (__pyx_v_col[(__pyx_v_i + __pyx_v_j)]);
+
+              /* "sisl/_sparse.pyx":623
+ *                 for j in range(k):
+ *                     pairs[j].col = col[i + j]
+ *                     pairs[j].idx = j             # <<<<<<<<<<<<<<
+ *                 qsort(pairs, k, sizeof(_col_idx), _col_idx_cmp)
+ *                 for j in range(k):
+ */
+              (__pyx_v_pairs[__pyx_v_j]).idx = __pyx_v_j;
+            }
+
+            /* "sisl/_sparse.pyx":624
+ *                     pairs[j].col = col[i + j]
+ *                     pairs[j].idx = j
+ *                 qsort(pairs, k, sizeof(_col_idx), _col_idx_cmp)             # <<<<<<<<<<<<<<
+ *                 for j in range(k):
+ *                     col[i + j] = pairs[j].col
+ */
+            qsort(__pyx_v_pairs, __pyx_v_k, (sizeof(struct __pyx_t_4sisl_7_sparse__col_idx)), __pyx_f_4sisl_7_sparse__col_idx_cmp);
+
+            /* "sisl/_sparse.pyx":625
+ *                     pairs[j].idx = j
+ *                 qsort(pairs, k, sizeof(_col_idx), _col_idx_cmp)
+ *                 for j in range(k):             # <<<<<<<<<<<<<<
+ *                     col[i + j] = pairs[j].col
+ * 
+ */
+            __pyx_t_17 = __pyx_v_k;
+            __pyx_t_19 = __pyx_t_17;
+            for (__pyx_t_20 = 0; __pyx_t_20 < __pyx_t_19; __pyx_t_20+=1) {
+              __pyx_v_j = __pyx_t_20;
+
+              /* "sisl/_sparse.pyx":626
+ *                 qsort(pairs, k, sizeof(_col_idx), _col_idx_cmp)
+ *                 for j in range(k):
+ *                     col[i + j] = pairs[j].col             # <<<<<<<<<<<<<<
+ * 
+ *                 # Permute the data rows by following the cycles of the permutation
+ */
+              __pyx_t_29 = (__pyx_v_pairs[__pyx_v_j]).col;
+              (__pyx_v_col[(__pyx_v_i + __pyx_v_j)]) = __pyx_t_29;
+            }
+
+            /* "sisl/_sparse.pyx":630
+ *                 # Permute the data rows by following the cycles of the permutation
+ *                 # (new row p is the old row pairs[p].idx)
+ *                 for j in range(k):             # <<<<<<<<<<<<<<
+ *                     q = pairs[j].idx
+ *                     if q < 0 or q == j:
+ */
+            __pyx_t_17 = __pyx_v_k;
+            __pyx_t_19 = __pyx_t_17;
+            for (__pyx_t_20 = 0; __pyx_t_20 < __pyx_t_19; __pyx_t_20+=1) {
+              __pyx_v_j = __pyx_t_20;
+
+              /* "sisl/_sparse.pyx":631
+ *                 # (new row p is the old row pairs[p].idx)
+ *                 for j in range(k):
+ *                     q = pairs[j].idx             # <<<<<<<<<<<<<<
+ *                     if q < 0 or q == j:
+ *                         continue
+ */
+              __pyx_t_29 = (__pyx_v_pairs[__pyx_v_j]).idx;
+              __pyx_v_q = __pyx_t_29;
+
+              /* "sisl/_sparse.pyx":632
+ *                 for j in range(k):
+ *                     q = pairs[j].idx
+ *                     if q < 0 or q == j:             # <<<<<<<<<<<<<<
+ *                         continue
+ *                     memcpy(tmp, &data[(i + j) * sz], sz)
+ */
+              __pyx_t_4 = ((__pyx_v_q < 0) != 0);
+              if (!__pyx_t_4) {
+              } else {
+                __pyx_t_3 = __pyx_t_4;
+                goto __pyx_L54_bool_binop_done;
+              }
+              __pyx_t_4 = ((__pyx_v_q == __pyx_v_j) != 0);
+              __pyx_t_3 = __pyx_t_4;
+              __pyx_L54_bool_binop_done:;
+              if (__pyx_t_3) {
+
+                /* "sisl/_sparse.pyx":633
+ *                     q = pairs[j].idx
+ *                     if q < 0 or q == j:
+ *                         continue             # <<<<<<<<<<<<<<
+ *                     memcpy(tmp, &data[(i + j) * sz], sz)
+ *                     p = j
+ */
+                goto __pyx_L51_continue;
+
+                /* "sisl/_sparse.pyx":632
+ *                 for j in range(k):
+ *                     q = pairs[j].idx
+ *                     if q < 0 or q == j:             # <<<<<<<<<<<<<<
+ *                         continue
+ *                     memcpy(tmp, &data[(i + j) * sz], sz)
+ */
+              }
+
+              /* "sisl/_sparse.pyx":634
+ *                     if q < 0 or q == j:
+ *                         continue
+ *                     memcpy(tmp, &data[(i + j) * sz], sz)             # <<<<<<<<<<<<<<
+ *                     p = j
+ *                     while q != j:
+ */
+              (void)(memcpy(__pyx_v_tmp, (&(__pyx_v_data[((__pyx_v_i + __pyx_v_j) * __pyx_v_sz)])), __pyx_v_sz));
+
+              /* "sisl/_sparse.pyx":635
+ *                         continue
+ *                     memcpy(tmp, &data[(i + j) * sz], sz)
+ *                     p = j             # <<<<<<<<<<<<<<
+ *                     while q != j:
+ *                         memcpy(&data[(i + p) * sz], &data[(i + q) * sz], sz)
+ */
+              __pyx_v_p = __pyx_v_j;
+
+              /* "sisl/_sparse.pyx":636
+ *                     memcpy(tmp, &data[(i + j) * sz], sz)
+ *                     p = j
+ *                     while q != j:             # <<<<<<<<<<<<<<
+ *                         memcpy(&data[(i + p) * sz], &data[(i + q) * sz], sz)
+ *                         pairs[p].idx = -1
+ */
+              while (1) {
+                __pyx_t_3 = ((__pyx_v_q != __pyx_v_j) != 0);
+                if (!__pyx_t_3) break;
+
+                /* "sisl/_sparse.pyx":637
+ *                     p = j
+ *                     while q != j:
+ *                         memcpy(&data[(i + p) * sz], &data[(i + q) * sz], sz)             # <<<<<<<<<<<<<<
+ *                         pairs[p].idx = -1
+ *                         p = q
+ */
+                (void)(memcpy((&(__pyx_v_data[((__pyx_v_i + __pyx_v_p) * __pyx_v_sz)])), (&(__pyx_v_data[((__pyx_v_i + __pyx_v_q) * __pyx_v_sz)])), __pyx_v_sz));
+
+                /* "sisl/_sparse.pyx":638
+ *                     while q != j:
+ *                         memcpy(&data[(i + p) * sz], &data[(i + q) * sz], sz)
+ *                         pairs[p].idx = -1             # <<<<<<<<<<<<<<
+ *                         p = q
+ *                         q = pairs[p].idx
+ */
+                (__pyx_v_pairs[__pyx_v_p]).idx = -1;
+
+                /* "sisl/_sparse.pyx":639
+ *                         memcpy(&data[(i + p) * sz], &data[(i + q) * sz], sz)
+ *                         pairs[p].idx = -1
+ *                         p = q             # <<<<<<<<<<<<<<
+ *                         q = pairs[p].idx
+ *                     memcpy(&data[(i + p) * sz], tmp, sz)
+ */
+                __pyx_v_p = __pyx_v_q;
+
+                /* "sisl/_sparse.pyx":640
+ *                         pairs[p].idx = -1
+ *                         p = q
+ *                         q = pairs[p].idx             # <<<<<<<<<<<<<<
+ *                     memcpy(&data[(i + p) * sz], tmp, sz)
+ *                     pairs[p].idx = -1
+ */
+                __pyx_t_29 = (__pyx_v_pairs[__pyx_v_p]).idx;
+                __pyx_v_q = __pyx_t_29;
+              }
+
+              /* "sisl/_sparse.pyx":641
+ *                         p = q
+ *                         q = pairs[p].idx
+ *                     memcpy(&data[(i + p) * sz], tmp, sz)             # <<<<<<<<<<<<<<
+ *                     pairs[p].idx = -1
+ * 
+ */
+              (void)(memcpy((&(__pyx_v_data[((__pyx_v_i + __pyx_v_p) * __pyx_v_sz)])), __pyx_v_tmp, __pyx_v_sz));
+
+              /* "sisl/_sparse.pyx":642
+ *                         q = pairs[p].idx
+ *                     memcpy(&data[(i + p) * sz], tmp, sz)
+ *                     pairs[p].idx = -1             # <<<<<<<<<<<<<<
+ * 
+ *             for j in range(i + 1, i + k):
+ */
+              (__pyx_v_pairs[__pyx_v_p]).idx = -1;
+              __pyx_L51_continue:;
+            }
+          }
+          __pyx_L39:;
+
+          /* "sisl/_sparse.pyx":644
+ *                     pairs[p].idx = -1
+ * 
+ *             for j in range(i + 1, i + k):             # <<<<<<<<<<<<<<
+ *                 if col[j] == col[j - 1]:
+ *                     err = r
+ */
+          __pyx_t_17 = (__pyx_v_i + __pyx_v_k);
+          __pyx_t_19 = __pyx_t_17;
+          for (__pyx_t_20 = (__pyx_v_i + 1); __pyx_t_20 < __pyx_t_19; __pyx_t_20+=1) {
+            __pyx_v_j = __pyx_t_20;
+
+            /* "sisl/_sparse.pyx":645
+ * 
+ *             for j in range(i + 1, i + k):
+ *                 if col[j] == col[j - 1]:             # <<<<<<<<<<<<<<
+ *                     err = r
+ *                     break
+ */
+            __pyx_t_3 = (((__pyx_v_col[__pyx_v_j]) == (__pyx_v_col[(__pyx_v_j - 1)])) != 0);
+            if (__pyx_t_3) {
+
+              /* "sisl/_sparse.pyx":646
+ *             for j in range(i + 1, i + k):
+ *                 if col[j] == col[j - 1]:
+ *                     err = r             # <<<<<<<<<<<<<<
+ *                     break
+ *             if err >= 0:
+ */
+              __pyx_v_err = __pyx_v_r;
+
+              /* "sisl/_sparse.pyx":647
+ *                 if col[j] == col[j - 1]:
+ *                     err = r
+ *                     break             # <<<<<<<<<<<<<<
+ *             if err >= 0:
+ *                 break
+ */
+              goto __pyx_L59_break;
+
+              /* "sisl/_sparse.pyx":645
+ * 
+ *             for j in range(i + 1, i + k):
+ *                 if col[j] == col[j - 1]:             # <<<<<<<<<<<<<<
+ *                     err = r
+ *                     break
+ */
+            }
+          }
+          __pyx_L59_break:;
+
+          /* "sisl/_sparse.pyx":648
+ *                     err = r
+ *                     break
+ *             if err >= 0:             # <<<<<<<<<<<<<<
+ *                 break
+ * 
+ */
+          __pyx_t_3 = ((__pyx_v_err >= 0) != 0);
+          if (__pyx_t_3) {
+
+            /* "sisl/_sparse.pyx":649
+ *                     break
+ *             if err >= 0:
+ *                 break             # <<<<<<<<<<<<<<
+ * 
+ *     free(tmp)
+ */
+            goto __pyx_L38_break;
+
+            /* "sisl/_sparse.pyx":648
+ *                     err = r
+ *                     break
+ *             if err >= 0:             # <<<<<<<<<<<<<<
+ *                 break
+ * 
+ */
+          }
+        }
+        __pyx_L38_break:;
+      }
+
+      /* "sisl/_sparse.pyx":601
+ *         raise MemoryError()
+ * 
+ *     with nogil:             # <<<<<<<<<<<<<<
+ *         for r in range(nr):
+ *             i = ptr[r]
+ */
+      /*finally:*/ {
+        /*normal exit:*/{
+          #ifdef WITH_THREAD
+          __Pyx_FastGIL_Forget();
+          Py_BLOCK_THREADS
+          #endif
+          goto __pyx_L36;
+        }
+        __pyx_L36:;
+      }
+  }
+
+  /* "sisl/_sparse.pyx":651
+ *                 break
+ * 
+ *     free(tmp)             # <<<<<<<<<<<<<<
+ *     free(pairs)
+ * 
+ */
+  free(__pyx_v_tmp);
+
+  /* "sisl/_sparse.pyx":652
+ * 
+ *     free(tmp)
+ *     free(pairs)             # <<<<<<<<<<<<<<
+ * 
+ *     return n, err
+ */
+  free(__pyx_v_pairs);
+
+  /* "sisl/_sparse.pyx":654
+ *     free(pairs)
+ * 
+ *     return n, err             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_26 = __Pyx_PyInt_From_int(__pyx_v_n); if (unlikely(!__pyx_t_26)) __PYX_ERR(0, 654, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_26);
+  __pyx_t_25 = __Pyx_PyInt_From_int(__pyx_v_err); if (unlikely(!__pyx_t_25)) __PYX_ERR(0, 654, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_25);
+  __pyx_t_24 = PyTuple_New(2); if (unlikely(!__pyx_t_24)) __PYX_ERR(0, 654, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_24);
+  __Pyx_GIVEREF(__pyx_t_26);
+  PyTuple_SET_ITEM(__pyx_t_24, 0, __pyx_t_26);
+  __Pyx_GIVEREF(__pyx_t_25);
+  PyTuple_SET_ITEM(__pyx_t_24, 1, __pyx_t_25);
+  __pyx_t_26 = 0;
+  __pyx_t_25 = 0;
+  __pyx_r = __pyx_t_24;
+  __pyx_t_24 = 0;
+  goto __pyx_L0;
+
+  /* "sisl/_sparse.pyx":508
+ * @cython.wraparound(False)
+ * @cython.initializedcheck(False)
+ * def sparse_finalize(np.ndarray[np.int32_t, ndim=1, mode='c'] PTR,             # <<<<<<<<<<<<<<
+ *                     np.ndarray[np.int32_t, ndim=1, mode='c'] NCOL,
+ *                     np.ndarray[np.int32_t, ndim=1, mode='c'] COL,
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __PYX_XDEC_MEMVIEW(&__pyx_t_1, 1);
+  __PYX_XDEC_MEMVIEW(&__pyx_t_2, 1);
+  __Pyx_XDECREF(__pyx_t_24);
+  __Pyx_XDECREF(__pyx_t_25);
+  __Pyx_XDECREF(__pyx_t_26);
+  { PyObject *__pyx_type, *__pyx_value, *__pyx_tb;
+    __Pyx_PyThreadState_declare
+    __Pyx_PyThreadState_assign
+    __Pyx_ErrFetch(&__pyx_type, &__pyx_value, &__pyx_tb);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_COL.rcbuffer->pybuffer);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_D.rcbuffer->pybuffer);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_NCOL.rcbuffer->pybuffer);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_PTR.rcbuffer->pybuffer);
+  __Pyx_ErrRestore(__pyx_type, __pyx_value, __pyx_tb);}
+  __Pyx_AddTraceback("sisl._sparse.sparse_finalize", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  goto __pyx_L2;
+  __pyx_L0:;
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_COL.rcbuffer->pybuffer);
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_D.rcbuffer->pybuffer);
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_NCOL.rcbuffer->pybuffer);
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_PTR.rcbuffer->pybuffer);
+  __pyx_L2:;
+  __PYX_XDEC_MEMVIEW(&__pyx_v_ptr, 1);
+  __PYX_XDEC_MEMVIEW(&__pyx_v_ncol, 1);
+  __PYX_XDEC_MEMVIEW(&__pyx_v_COL_v, 1);
+  __PYX_XDEC_MEMVIEW(&__pyx_v_D_v, 1);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "sisl/_sparse.pyx":662
+ * 
+ * 
+ * cdef int _int_cmp(const void *a, const void *b) nogil:             # <<<<<<<<<<<<<<
+ *     cdef int ia = (<int *> a)[0]
+ *     cdef int ib = (<int *> b)[0]
+ */
+
+static int __pyx_f_4sisl_7_sparse__int_cmp(void const *__pyx_v_a, void const *__pyx_v_b) {
+  int __pyx_v_ia;
+  int __pyx_v_ib;
+  int __pyx_r;
+
+  /* "sisl/_sparse.pyx":663
+ * 
+ * cdef int _int_cmp(const void *a, const void *b) nogil:
+ *     cdef int ia = (<int *> a)[0]             # <<<<<<<<<<<<<<
+ *     cdef int ib = (<int *> b)[0]
+ *     return (ia > ib) - (ia < ib)
+ */
+  __pyx_v_ia = (((int *)__pyx_v_a)[0]);
+
+  /* "sisl/_sparse.pyx":664
+ * cdef int _int_cmp(const void *a, const void *b) nogil:
+ *     cdef int ia = (<int *> a)[0]
+ *     cdef int ib = (<int *> b)[0]             # <<<<<<<<<<<<<<
+ *     return (ia > ib) - (ia < ib)
+ * 
+ */
+  __pyx_v_ib = (((int *)__pyx_v_b)[0]);
+
+  /* "sisl/_sparse.pyx":665
+ *     cdef int ia = (<int *> a)[0]
+ *     cdef int ib = (<int *> b)[0]
+ *     return (ia > ib) - (ia < ib)             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __pyx_r = ((__pyx_v_ia > __pyx_v_ib) - (__pyx_v_ia < __pyx_v_ib));
+  goto __pyx_L0;
+
+  /* "sisl/_sparse.pyx":662
+ * 
+ * 
+ * cdef int _int_cmp(const void *a, const void *b) nogil:             # <<<<<<<<<<<<<<
+ *     cdef int ia = (<int *> a)[0]
+ *     cdef int ib = (<int *> b)[0]
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "sisl/_sparse.pyx":672
+ * @cython.initializedcheck(False)
+ * @cython.cdivision(True)
+ * def sparse_orb_to_atom(np.ndarray[np.int32_t, ndim=1, mode='c'] PTR,             # <<<<<<<<<<<<<<
+ *                        np.ndarray[np.int32_t, ndim=1, mode='c'] COL,
+ *                        _orb_real[:, ::1] D,
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_4sisl_7_sparse_15sparse_orb_to_atom(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_4sisl_7_sparse_14sparse_orb_to_atom[] = " Reduce an orbital CSR matrix to an atomic CSR matrix by summing all orbital elements\n\n    Element ``(io, jo + s * no)`` is summed into ``(O2A[io], O2A[jo] + s * na)``.\n    The columns of the returned sparsity pattern are unique and sorted in each row.\n\n    Parameters\n    ----------\n    PTR, COL : numpy.ndarray(np.int32)\n       the CSR sparsity pattern (``indptr`` and ``indices``) of the orbital matrix\n    D : numpy.ndarray(np.float32 or np.float64)\n       the orbital data, ``D[i, :]`` is the data for matrix ``i`` (all with the same sparsity pattern)\n    FIRSTO : numpy.ndarray(np.int32)\n       first orbital of each atom (with the total number of orbitals appended)\n    O2A : numpy.ndarray(np.int32)\n       atomic index of each orbital\n    n_s : int\n       number of supercells in the atomic columns (1 folds all columns to the unit-cell)\n    only : int\n       if ``1`` only positive elements are summed, if ``-1`` only negative elements are summed,\n       else all elements are summed\n\n    Returns\n    -------\n    ptr, col : the CSR sparsity pattern of the atomic matrix\n    data : the atomic data, ``data[i, :]`` corresponds to ``D[i, :]``\n    ";
+static PyMethodDef __pyx_mdef_4sisl_7_sparse_15sparse_orb_to_atom = {"sparse_orb_to_atom", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_4sisl_7_sparse_15sparse_orb_to_atom, METH_VARARGS|METH_KEYWORDS, __pyx_doc_4sisl_7_sparse_14sparse_orb_to_atom};
+static PyObject *__pyx_pw_4sisl_7_sparse_15sparse_orb_to_atom(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyObject *__pyx_v_signatures = 0;
+  PyObject *__pyx_v_args = 0;
+  PyObject *__pyx_v_kwargs = 0;
+  CYTHON_UNUSED PyObject *__pyx_v_defaults = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__pyx_fused_cpdef (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_signatures,&__pyx_n_s_args,&__pyx_n_s_kwargs,&__pyx_n_s_defaults,0};
+    PyObject* values[4] = {0,0,0,0};
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case  4: values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+        CYTHON_FALLTHROUGH;
+        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        CYTHON_FALLTHROUGH;
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_signatures)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_args)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("__pyx_fused_cpdef", 1, 4, 4, 1); __PYX_ERR(0, 672, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  2:
+        if (likely((values[2] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_kwargs)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("__pyx_fused_cpdef", 1, 4, 4, 2); __PYX_ERR(0, 672, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  3:
+        if (likely((values[3] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_defaults)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("__pyx_fused_cpdef", 1, 4, 4, 3); __PYX_ERR(0, 672, __pyx_L3_error)
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "__pyx_fused_cpdef") < 0)) __PYX_ERR(0, 672, __pyx_L3_error)
+      }
+    } else if (PyTuple_GET_SIZE(__pyx_args) != 4) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+      values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+      values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+      values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+    }
+    __pyx_v_signatures = values[0];
+    __pyx_v_args = values[1];
+    __pyx_v_kwargs = values[2];
+    __pyx_v_defaults = values[3];
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("__pyx_fused_cpdef", 1, 4, 4, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 672, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("sisl._sparse.__pyx_fused_cpdef", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_4sisl_7_sparse_14sparse_orb_to_atom(__pyx_self, __pyx_v_signatures, __pyx_v_args, __pyx_v_kwargs, __pyx_v_defaults);
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_4sisl_7_sparse_14sparse_orb_to_atom(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_signatures, PyObject *__pyx_v_args, PyObject *__pyx_v_kwargs, CYTHON_UNUSED PyObject *__pyx_v_defaults) {
+  PyObject *__pyx_v_dest_sig = NULL;
+  Py_ssize_t __pyx_v_i;
+  PyTypeObject *__pyx_v_ndarray = 0;
+  __Pyx_memviewslice __pyx_v_memslice;
+  Py_ssize_t __pyx_v_itemsize;
+  CYTHON_UNUSED int __pyx_v_dtype_signed;
+  char __pyx_v_kind;
+  PyObject *__pyx_v_arg = NULL;
+  PyObject *__pyx_v_dtype = NULL;
+  PyObject *__pyx_v_arg_base = NULL;
+  PyObject *__pyx_v_candidates = NULL;
+  PyObject *__pyx_v_sig = NULL;
+  int __pyx_v_match_found;
+  PyObject *__pyx_v_src_sig = NULL;
+  PyObject *__pyx_v_dst_type = NULL;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_t_2;
+  int __pyx_t_3;
+  int __pyx_t_4;
+  Py_ssize_t __pyx_t_5;
+  PyObject *__pyx_t_6 = NULL;
+  long __pyx_t_7;
+  __Pyx_memviewslice __pyx_t_8;
+  Py_ssize_t __pyx_t_9;
+  int __pyx_t_10;
+  int __pyx_t_11;
+  PyObject *__pyx_t_12 = NULL;
+  PyObject *__pyx_t_13 = NULL;
+  PyObject *__pyx_t_14 = NULL;
+  Py_ssize_t __pyx_t_15;
+  Py_ssize_t __pyx_t_16;
+  Py_ssize_t __pyx_t_17;
+  int __pyx_t_18;
+  __Pyx_RefNannySetupContext("sparse_orb_to_atom", 0);
+  __Pyx_INCREF(__pyx_v_kwargs);
+  __pyx_t_1 = PyList_New(1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 672, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_INCREF(Py_None);
+  __Pyx_GIVEREF(Py_None);
+  PyList_SET_ITEM(__pyx_t_1, 0, Py_None);
+  __pyx_v_dest_sig = ((PyObject*)__pyx_t_1);
+  __pyx_t_1 = 0;
+  __pyx_t_3 = (__pyx_v_kwargs != Py_None);
+  __pyx_t_4 = (__pyx_t_3 != 0);
+  if (__pyx_t_4) {
+  } else {
+    __pyx_t_2 = __pyx_t_4;
+    goto __pyx_L4_bool_binop_done;
+  }
+  __pyx_t_4 = __Pyx_PyObject_IsTrue(__pyx_v_kwargs); if (unlikely(__pyx_t_4 < 0)) __PYX_ERR(0, 672, __pyx_L1_error)
+  __pyx_t_3 = ((!__pyx_t_4) != 0);
+  __pyx_t_2 = __pyx_t_3;
+  __pyx_L4_bool_binop_done:;
+  if (__pyx_t_2) {
+    __Pyx_INCREF(Py_None);
+    __Pyx_DECREF_SET(__pyx_v_kwargs, Py_None);
+  }
+  __pyx_t_1 = ((PyObject *)__Pyx_ImportNumPyArrayTypeIfAvailable()); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 672, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_v_ndarray = ((PyTypeObject*)__pyx_t_1);
+  __pyx_t_1 = 0;
+  __pyx_v_itemsize = -1L;
+  if (unlikely(__pyx_v_args == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "object of type 'NoneType' has no len()");
+    __PYX_ERR(0, 672, __pyx_L1_error)
+  }
+  __pyx_t_5 = PyTuple_GET_SIZE(((PyObject*)__pyx_v_args)); if (unlikely(__pyx_t_5 == ((Py_ssize_t)-1))) __PYX_ERR(0, 672, __pyx_L1_error)
+  __pyx_t_2 = ((2 < __pyx_t_5) != 0);
+  if (__pyx_t_2) {
+    if (unlikely(__pyx_v_args == Py_None)) {
+      PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+      __PYX_ERR(0, 672, __pyx_L1_error)
+    }
+    __pyx_t_1 = PyTuple_GET_ITEM(((PyObject*)__pyx_v_args), 2);
+    __Pyx_INCREF(__pyx_t_1);
+    __pyx_v_arg = __pyx_t_1;
+    __pyx_t_1 = 0;
+    goto __pyx_L6;
+  }
+  __pyx_t_3 = (__pyx_v_kwargs != Py_None);
+  __pyx_t_4 = (__pyx_t_3 != 0);
+  if (__pyx_t_4) {
+  } else {
+    __pyx_t_2 = __pyx_t_4;
+    goto __pyx_L7_bool_binop_done;
+  }
+  if (unlikely(__pyx_v_kwargs == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "'NoneType' object is not iterable");
+    __PYX_ERR(0, 672, __pyx_L1_error)
+  }
+  __pyx_t_4 = (__Pyx_PyDict_ContainsTF(__pyx_n_s_D, ((PyObject*)__pyx_v_kwargs), Py_EQ)); if (unlikely(__pyx_t_4 < 0)) __PYX_ERR(0, 672, __pyx_L1_error)
+  __pyx_t_3 = (__pyx_t_4 != 0);
+  __pyx_t_2 = __pyx_t_3;
+  __pyx_L7_bool_binop_done:;
+  if (__pyx_t_2) {
+    if (unlikely(__pyx_v_kwargs == Py_None)) {
+      PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+      __PYX_ERR(0, 672, __pyx_L1_error)
+    }
+    __pyx_t_1 = __Pyx_PyDict_GetItem(((PyObject*)__pyx_v_kwargs), __pyx_n_s_D); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 672, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_v_arg = __pyx_t_1;
+    __pyx_t_1 = 0;
+    goto __pyx_L6;
+  }
+  /*else*/ {
+    if (unlikely(__pyx_v_args == Py_None)) {
+      PyErr_SetString(PyExc_TypeError, "object of type 'NoneType' has no len()");
+      __PYX_ERR(0, 672, __pyx_L1_error)
+    }
+    __pyx_t_5 = PyTuple_GET_SIZE(((PyObject*)__pyx_v_args)); if (unlikely(__pyx_t_5 == ((Py_ssize_t)-1))) __PYX_ERR(0, 672, __pyx_L1_error)
+    __pyx_t_1 = PyInt_FromSsize_t(__pyx_t_5); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 672, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_6 = PyTuple_New(3); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 672, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_6);
+    __Pyx_INCREF(__pyx_int_7);
+    __Pyx_GIVEREF(__pyx_int_7);
+    PyTuple_SET_ITEM(__pyx_t_6, 0, __pyx_int_7);
+    __Pyx_INCREF(__pyx_n_s_s);
+    __Pyx_GIVEREF(__pyx_n_s_s);
+    PyTuple_SET_ITEM(__pyx_t_6, 1, __pyx_n_s_s);
+    __Pyx_GIVEREF(__pyx_t_1);
+    PyTuple_SET_ITEM(__pyx_t_6, 2, __pyx_t_1);
+    __pyx_t_1 = 0;
+    __pyx_t_1 = __Pyx_PyString_Format(__pyx_kp_s_Expected_at_least_d_argument_s_g, __pyx_t_6); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 672, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+    __pyx_t_6 = __Pyx_PyObject_CallOneArg(__pyx_builtin_TypeError, __pyx_t_1); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 672, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_6);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __Pyx_Raise(__pyx_t_6, 0, 0, 0);
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+    __PYX_ERR(0, 672, __pyx_L1_error)
+  }
+  __pyx_L6:;
+  while (1) {
+    __pyx_t_2 = (__pyx_v_ndarray != ((PyTypeObject*)Py_None));
+    __pyx_t_3 = (__pyx_t_2 != 0);
+    if (__pyx_t_3) {
+      __pyx_t_3 = __Pyx_TypeCheck(__pyx_v_arg, __pyx_v_ndarray); 
+      __pyx_t_2 = (__pyx_t_3 != 0);
+      if (__pyx_t_2) {
+        __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_v_arg, __pyx_n_s_dtype); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 672, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_6);
+        __pyx_v_dtype = __pyx_t_6;
+        __pyx_t_6 = 0;
+        goto __pyx_L12;
+      }
+      __pyx_t_2 = __pyx_memoryview_check(__pyx_v_arg); 
+      __pyx_t_3 = (__pyx_t_2 != 0);
+      if (__pyx_t_3) {
+        __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_v_arg, __pyx_n_s_base); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 672, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_6);
+        __pyx_v_arg_base = __pyx_t_6;
+        __pyx_t_6 = 0;
+        __pyx_t_3 = __Pyx_TypeCheck(__pyx_v_arg_base, __pyx_v_ndarray); 
+        __pyx_t_2 = (__pyx_t_3 != 0);
+        if (__pyx_t_2) {
+          __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_v_arg_base, __pyx_n_s_dtype); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 672, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_6);
+          __pyx_v_dtype = __pyx_t_6;
+          __pyx_t_6 = 0;
+          goto __pyx_L13;
+        }
+        /*else*/ {
+          __Pyx_INCREF(Py_None);
+          __pyx_v_dtype = Py_None;
+        }
+        __pyx_L13:;
+        goto __pyx_L12;
+      }
+      /*else*/ {
+        __Pyx_INCREF(Py_None);
+        __pyx_v_dtype = Py_None;
+      }
+      __pyx_L12:;
+      __pyx_v_itemsize = -1L;
+      __pyx_t_2 = (__pyx_v_dtype != Py_None);
+      __pyx_t_3 = (__pyx_t_2 != 0);
+      if (__pyx_t_3) {
+        __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_v_dtype, __pyx_n_s_itemsize); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 672, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_6);
+        __pyx_t_5 = __Pyx_PyIndex_AsSsize_t(__pyx_t_6); if (unlikely((__pyx_t_5 == (Py_ssize_t)-1) && PyErr_Occurred())) __PYX_ERR(0, 672, __pyx_L1_error)
+        __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+        __pyx_v_itemsize = __pyx_t_5;
+        __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_v_dtype, __pyx_n_s_kind); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 672, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_6);
+        __pyx_t_7 = __Pyx_PyObject_Ord(__pyx_t_6); if (unlikely(__pyx_t_7 == ((long)(long)(Py_UCS4)-1))) __PYX_ERR(0, 672, __pyx_L1_error)
+        __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+        __pyx_v_kind = __pyx_t_7;
+        __pyx_v_dtype_signed = (__pyx_v_kind == 'i');
+        switch (__pyx_v_kind) {
+          case 'i':
+          case 'u':
+          break;
+          case 'f':
+          __pyx_t_2 = (((sizeof(float)) == __pyx_v_itemsize) != 0);
+          if (__pyx_t_2) {
+          } else {
+            __pyx_t_3 = __pyx_t_2;
+            goto __pyx_L16_bool_binop_done;
+          }
+          __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_v_arg, __pyx_n_s_ndim); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 672, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_6);
+          __pyx_t_5 = __Pyx_PyIndex_AsSsize_t(__pyx_t_6); if (unlikely((__pyx_t_5 == (Py_ssize_t)-1) && PyErr_Occurred())) __PYX_ERR(0, 672, __pyx_L1_error)
+          __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+          __pyx_t_2 = ((((Py_ssize_t)__pyx_t_5) == 2) != 0);
+          __pyx_t_3 = __pyx_t_2;
+          __pyx_L16_bool_binop_done:;
+          if (__pyx_t_3) {
+            if (unlikely(__Pyx_SetItemInt(__pyx_v_dest_sig, 0, __pyx_n_s_float, long, 1, __Pyx_PyInt_From_long, 1, 0, 0) < 0)) __PYX_ERR(0, 672, __pyx_L1_error)
+            goto __pyx_L10_break;
+          }
+          __pyx_t_2 = (((sizeof(double)) == __pyx_v_itemsize) != 0);
+          if (__pyx_t_2) {
+          } else {
+            __pyx_t_3 = __pyx_t_2;
+            goto __pyx_L19_bool_binop_done;
+          }
+          __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_v_arg, __pyx_n_s_ndim); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 672, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_6);
+          __pyx_t_5 = __Pyx_PyIndex_AsSsize_t(__pyx_t_6); if (unlikely((__pyx_t_5 == (Py_ssize_t)-1) && PyErr_Occurred())) __PYX_ERR(0, 672, __pyx_L1_error)
+          __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+          __pyx_t_2 = ((((Py_ssize_t)__pyx_t_5) == 2) != 0);
+          __pyx_t_3 = __pyx_t_2;
+          __pyx_L19_bool_binop_done:;
+          if (__pyx_t_3) {
+            if (unlikely(__Pyx_SetItemInt(__pyx_v_dest_sig, 0, __pyx_n_s_double, long, 1, __Pyx_PyInt_From_long, 1, 0, 0) < 0)) __PYX_ERR(0, 672, __pyx_L1_error)
+            goto __pyx_L10_break;
+          }
+          break;
+          case 'c':
+          break;
+          case 'O':
+          break;
+          default: break;
+        }
+      }
+    }
+    __pyx_t_2 = ((__pyx_v_itemsize == -1L) != 0);
+    if (!__pyx_t_2) {
+    } else {
+      __pyx_t_3 = __pyx_t_2;
+      goto __pyx_L22_bool_binop_done;
+    }
+    __pyx_t_2 = ((__pyx_v_itemsize == (sizeof(float))) != 0);
+    __pyx_t_3 = __pyx_t_2;
+    __pyx_L22_bool_binop_done:;
+    if (__pyx_t_3) {
+      __pyx_t_8 = __Pyx_PyObject_to_MemoryviewSlice_d_dc_float(__pyx_v_arg, 0); 
+      __pyx_v_memslice = __pyx_t_8;
+      __pyx_t_3 = (__pyx_v_memslice.memview != 0);
+      if (__pyx_t_3) {
+        __PYX_XDEC_MEMVIEW((&__pyx_v_memslice), 1); 
+        if (unlikely(__Pyx_SetItemInt(__pyx_v_dest_sig, 0, __pyx_n_s_float, long, 1, __Pyx_PyInt_From_long, 1, 0, 0) < 0)) __PYX_ERR(0, 672, __pyx_L1_error)
+        goto __pyx_L10_break;
+      }
+      /*else*/ {
+        PyErr_Clear(); 
+      }
+    }
+    __pyx_t_2 = ((__pyx_v_itemsize == -1L) != 0);
+    if (!__pyx_t_2) {
+    } else {
+      __pyx_t_3 = __pyx_t_2;
+      goto __pyx_L26_bool_binop_done;
+    }
+    __pyx_t_2 = ((__pyx_v_itemsize == (sizeof(double))) != 0);
+    __pyx_t_3 = __pyx_t_2;
+    __pyx_L26_bool_binop_done:;
+    if (__pyx_t_3) {
+      __pyx_t_8 = __Pyx_PyObject_to_MemoryviewSlice_d_dc_double(__pyx_v_arg, 0); 
+      __pyx_v_memslice = __pyx_t_8;
+      __pyx_t_3 = (__pyx_v_memslice.memview != 0);
+      if (__pyx_t_3) {
+        __PYX_XDEC_MEMVIEW((&__pyx_v_memslice), 1); 
+        if (unlikely(__Pyx_SetItemInt(__pyx_v_dest_sig, 0, __pyx_n_s_double, long, 1, __Pyx_PyInt_From_long, 1, 0, 0) < 0)) __PYX_ERR(0, 672, __pyx_L1_error)
+        goto __pyx_L10_break;
+      }
+      /*else*/ {
+        PyErr_Clear(); 
+      }
+    }
+    if (unlikely(__Pyx_SetItemInt(__pyx_v_dest_sig, 0, Py_None, long, 1, __Pyx_PyInt_From_long, 1, 0, 0) < 0)) __PYX_ERR(0, 672, __pyx_L1_error)
+    goto __pyx_L10_break;
+  }
+  __pyx_L10_break:;
+  __pyx_t_6 = PyList_New(0); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 672, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __pyx_v_candidates = ((PyObject*)__pyx_t_6);
+  __pyx_t_6 = 0;
+  __pyx_t_5 = 0;
+  if (unlikely(__pyx_v_signatures == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "'NoneType' object is not iterable");
+    __PYX_ERR(0, 672, __pyx_L1_error)
+  }
+  __pyx_t_1 = __Pyx_dict_iterator(((PyObject*)__pyx_v_signatures), 1, ((PyObject *)NULL), (&__pyx_t_9), (&__pyx_t_10)); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 672, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_6);
+  __pyx_t_6 = __pyx_t_1;
+  __pyx_t_1 = 0;
+  while (1) {
+    __pyx_t_11 = __Pyx_dict_iter_next(__pyx_t_6, __pyx_t_9, &__pyx_t_5, &__pyx_t_1, NULL, NULL, __pyx_t_10);
+    if (unlikely(__pyx_t_11 == 0)) break;
+    if (unlikely(__pyx_t_11 == -1)) __PYX_ERR(0, 672, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_XDECREF_SET(__pyx_v_sig, __pyx_t_1);
+    __pyx_t_1 = 0;
+    __pyx_v_match_found = 0;
+    __pyx_t_13 = __Pyx_PyObject_GetAttrStr(__pyx_v_sig, __pyx_n_s_strip); if (unlikely(!__pyx_t_13)) __PYX_ERR(0, 672, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_13);
+    __pyx_t_14 = NULL;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_13))) {
+      __pyx_t_14 = PyMethod_GET_SELF(__pyx_t_13);
+      if (likely(__pyx_t_14)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_13);
+        __Pyx_INCREF(__pyx_t_14);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_13, function);
+      }
+    }
+    __pyx_t_12 = (__pyx_t_14) ? __Pyx_PyObject_Call2Args(__pyx_t_13, __pyx_t_14, __pyx_kp_s__5) : __Pyx_PyObject_CallOneArg(__pyx_t_13, __pyx_kp_s__5);
+    __Pyx_XDECREF(__pyx_t_14); __pyx_t_14 = 0;
+    if (unlikely(!__pyx_t_12)) __PYX_ERR(0, 672, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_12);
+    __Pyx_DECREF(__pyx_t_13); __pyx_t_13 = 0;
+    __pyx_t_13 = __Pyx_PyObject_GetAttrStr(__pyx_t_12, __pyx_n_s_split); if (unlikely(!__pyx_t_13)) __PYX_ERR(0, 672, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_13);
+    __Pyx_DECREF(__pyx_t_12); __pyx_t_12 = 0;
+    __pyx_t_12 = NULL;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_13))) {
+      __pyx_t_12 = PyMethod_GET_SELF(__pyx_t_13);
+      if (likely(__pyx_t_12)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_13);
+        __Pyx_INCREF(__pyx_t_12);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_13, function);
+      }
+    }
+    __pyx_t_1 = (__pyx_t_12) ? __Pyx_PyObject_Call2Args(__pyx_t_13, __pyx_t_12, __pyx_kp_s__6) : __Pyx_PyObject_CallOneArg(__pyx_t_13, __pyx_kp_s__6);
+    __Pyx_XDECREF(__pyx_t_12); __pyx_t_12 = 0;
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 672, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_13); __pyx_t_13 = 0;
+    __Pyx_XDECREF_SET(__pyx_v_src_sig, __pyx_t_1);
+    __pyx_t_1 = 0;
+    __pyx_t_15 = PyList_GET_SIZE(__pyx_v_dest_sig); if (unlikely(__pyx_t_15 == ((Py_ssize_t)-1))) __PYX_ERR(0, 672, __pyx_L1_error)
+    __pyx_t_16 = __pyx_t_15;
+    for (__pyx_t_17 = 0; __pyx_t_17 < __pyx_t_16; __pyx_t_17+=1) {
+      __pyx_v_i = __pyx_t_17;
+      __pyx_t_1 = PyList_GET_ITEM(__pyx_v_dest_sig, __pyx_v_i);
+      __Pyx_INCREF(__pyx_t_1);
+      __Pyx_XDECREF_SET(__pyx_v_dst_type, __pyx_t_1);
+      __pyx_t_1 = 0;
+      __pyx_t_3 = (__pyx_v_dst_type != Py_None);
+      __pyx_t_2 = (__pyx_t_3 != 0);
+      if (__pyx_t_2) {
+        __pyx_t_1 = __Pyx_GetItemInt(__pyx_v_src_sig, __pyx_v_i, Py_ssize_t, 1, PyInt_FromSsize_t, 0, 0, 0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 672, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_1);
+        __pyx_t_13 = PyObject_RichCompare(__pyx_t_1, __pyx_v_dst_type, Py_EQ); __Pyx_XGOTREF(__pyx_t_13); if (unlikely(!__pyx_t_13)) __PYX_ERR(0, 672, __pyx_L1_error)
+        __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+        __pyx_t_2 = __Pyx_PyObject_IsTrue(__pyx_t_13); if (unlikely(__pyx_t_2 < 0)) __PYX_ERR(0, 672, __pyx_L1_error)
+        __Pyx_DECREF(__pyx_t_13); __pyx_t_13 = 0;
+        if (__pyx_t_2) {
+          __pyx_v_match_found = 1;
+          goto __pyx_L34;
+        }
+        /*else*/ {
+          __pyx_v_match_found = 0;
+          goto __pyx_L32_break;
+        }
+        __pyx_L34:;
+      }
+    }
+    __pyx_L32_break:;
+    __pyx_t_2 = (__pyx_v_match_found != 0);
+    if (__pyx_t_2) {
+      __pyx_t_18 = __Pyx_PyList_Append(__pyx_v_candidates, __pyx_v_sig); if (unlikely(__pyx_t_18 == ((int)-1))) __PYX_ERR(0, 672, __pyx_L1_error)
+    }
+  }
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  __pyx_t_2 = (PyList_GET_SIZE(__pyx_v_candidates) != 0);
+  __pyx_t_3 = ((!__pyx_t_2) != 0);
+  if (__pyx_t_3) {
+    __pyx_t_6 = __Pyx_PyObject_Call(__pyx_builtin_TypeError, __pyx_tuple__7, NULL); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 672, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_6);
+    __Pyx_Raise(__pyx_t_6, 0, 0, 0);
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+    __PYX_ERR(0, 672, __pyx_L1_error)
+  }
+  __pyx_t_9 = PyList_GET_SIZE(__pyx_v_candidates); if (unlikely(__pyx_t_9 == ((Py_ssize_t)-1))) __PYX_ERR(0, 672, __pyx_L1_error)
+  __pyx_t_3 = ((__pyx_t_9 > 1) != 0);
+  if (__pyx_t_3) {
+    __pyx_t_6 = __Pyx_PyObject_Call(__pyx_builtin_TypeError, __pyx_tuple__8, NULL); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 672, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_6);
+    __Pyx_Raise(__pyx_t_6, 0, 0, 0);
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+    __PYX_ERR(0, 672, __pyx_L1_error)
+  }
+  /*else*/ {
+    __Pyx_XDECREF(__pyx_r);
+    if (unlikely(__pyx_v_signatures == Py_None)) {
+      PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+      __PYX_ERR(0, 672, __pyx_L1_error)
+    }
+    __pyx_t_6 = __Pyx_PyDict_GetItem(((PyObject*)__pyx_v_signatures), PyList_GET_ITEM(__pyx_v_candidates, 0)); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 672, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_6);
+    __pyx_r = __pyx_t_6;
+    __pyx_t_6 = 0;
+    goto __pyx_L0;
+  }
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_XDECREF(__pyx_t_12);
+  __Pyx_XDECREF(__pyx_t_13);
+  __Pyx_XDECREF(__pyx_t_14);
+  __Pyx_AddTraceback("sisl._sparse.__pyx_fused_cpdef", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_dest_sig);
+  __Pyx_XDECREF(__pyx_v_ndarray);
+  __Pyx_XDECREF(__pyx_v_arg);
+  __Pyx_XDECREF(__pyx_v_dtype);
+  __Pyx_XDECREF(__pyx_v_arg_base);
+  __Pyx_XDECREF(__pyx_v_candidates);
+  __Pyx_XDECREF(__pyx_v_sig);
+  __Pyx_XDECREF(__pyx_v_src_sig);
+  __Pyx_XDECREF(__pyx_v_dst_type);
+  __Pyx_XDECREF(__pyx_v_kwargs);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* Python wrapper */
+static PyObject *__pyx_fuse_0__pyx_pw_4sisl_7_sparse_17sparse_orb_to_atom(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static PyMethodDef __pyx_fuse_0__pyx_mdef_4sisl_7_sparse_17sparse_orb_to_atom = {"__pyx_fuse_0sparse_orb_to_atom", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_fuse_0__pyx_pw_4sisl_7_sparse_17sparse_orb_to_atom, METH_VARARGS|METH_KEYWORDS, __pyx_doc_4sisl_7_sparse_14sparse_orb_to_atom};
+static PyObject *__pyx_fuse_0__pyx_pw_4sisl_7_sparse_17sparse_orb_to_atom(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyArrayObject *__pyx_v_PTR = 0;
+  PyArrayObject *__pyx_v_COL = 0;
+  __Pyx_memviewslice __pyx_v_D = { 0, 0, { 0 }, { 0 }, { 0 } };
+  PyArrayObject *__pyx_v_FIRSTO = 0;
+  PyArrayObject *__pyx_v_O2A = 0;
+  int __pyx_v_n_s;
+  int __pyx_v_only;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("sparse_orb_to_atom (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_PTR,&__pyx_n_s_COL,&__pyx_n_s_D,&__pyx_n_s_FIRSTO,&__pyx_n_s_O2A,&__pyx_n_s_n_s,&__pyx_n_s_only,0};
+    PyObject* values[7] = {0,0,0,0,0,0,0};
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case  7: values[6] = PyTuple_GET_ITEM(__pyx_args, 6);
+        CYTHON_FALLTHROUGH;
+        case  6: values[5] = PyTuple_GET_ITEM(__pyx_args, 5);
+        CYTHON_FALLTHROUGH;
+        case  5: values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
+        CYTHON_FALLTHROUGH;
+        case  4: values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+        CYTHON_FALLTHROUGH;
+        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        CYTHON_FALLTHROUGH;
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_PTR)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_COL)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("sparse_orb_to_atom", 1, 7, 7, 1); __PYX_ERR(0, 672, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  2:
+        if (likely((values[2] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_D)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("sparse_orb_to_atom", 1, 7, 7, 2); __PYX_ERR(0, 672, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  3:
+        if (likely((values[3] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_FIRSTO)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("sparse_orb_to_atom", 1, 7, 7, 3); __PYX_ERR(0, 672, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  4:
+        if (likely((values[4] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_O2A)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("sparse_orb_to_atom", 1, 7, 7, 4); __PYX_ERR(0, 672, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  5:
+        if (likely((values[5] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_n_s)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("sparse_orb_to_atom", 1, 7, 7, 5); __PYX_ERR(0, 672, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  6:
+        if (likely((values[6] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_only)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("sparse_orb_to_atom", 1, 7, 7, 6); __PYX_ERR(0, 672, __pyx_L3_error)
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "sparse_orb_to_atom") < 0)) __PYX_ERR(0, 672, __pyx_L3_error)
+      }
+    } else if (PyTuple_GET_SIZE(__pyx_args) != 7) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+      values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+      values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+      values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+      values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
+      values[5] = PyTuple_GET_ITEM(__pyx_args, 5);
+      values[6] = PyTuple_GET_ITEM(__pyx_args, 6);
+    }
+    __pyx_v_PTR = ((PyArrayObject *)values[0]);
+    __pyx_v_COL = ((PyArrayObject *)values[1]);
+    __pyx_v_D = __Pyx_PyObject_to_MemoryviewSlice_d_dc_float(values[2], PyBUF_WRITABLE); if (unlikely(!__pyx_v_D.memview)) __PYX_ERR(0, 674, __pyx_L3_error)
+    __pyx_v_FIRSTO = ((PyArrayObject *)values[3]);
+    __pyx_v_O2A = ((PyArrayObject *)values[4]);
+    __pyx_v_n_s = __Pyx_PyInt_As_int(values[5]); if (unlikely((__pyx_v_n_s == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 677, __pyx_L3_error)
+    __pyx_v_only = __Pyx_PyInt_As_int(values[6]); if (unlikely((__pyx_v_only == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 677, __pyx_L3_error)
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("sparse_orb_to_atom", 1, 7, 7, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 672, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("sisl._sparse.sparse_orb_to_atom", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_PTR), __pyx_ptype_5numpy_ndarray, 1, "PTR", 0))) __PYX_ERR(0, 672, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_COL), __pyx_ptype_5numpy_ndarray, 1, "COL", 0))) __PYX_ERR(0, 673, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_FIRSTO), __pyx_ptype_5numpy_ndarray, 1, "FIRSTO", 0))) __PYX_ERR(0, 675, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_O2A), __pyx_ptype_5numpy_ndarray, 1, "O2A", 0))) __PYX_ERR(0, 676, __pyx_L1_error)
+  __pyx_r = __pyx_pf_4sisl_7_sparse_16sparse_orb_to_atom(__pyx_self, __pyx_v_PTR, __pyx_v_COL, __pyx_v_D, __pyx_v_FIRSTO, __pyx_v_O2A, __pyx_v_n_s, __pyx_v_only);
+
+  /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_4sisl_7_sparse_16sparse_orb_to_atom(CYTHON_UNUSED PyObject *__pyx_self, PyArrayObject *__pyx_v_PTR, PyArrayObject *__pyx_v_COL, __Pyx_memviewslice __pyx_v_D, PyArrayObject *__pyx_v_FIRSTO, PyArrayObject *__pyx_v_O2A, int __pyx_v_n_s, int __pyx_v_only) {
+  __Pyx_memviewslice __pyx_v_ptr = { 0, 0, { 0 }, { 0 }, { 0 } };
+  __Pyx_memviewslice __pyx_v_col = { 0, 0, { 0 }, { 0 }, { 0 } };
+  __Pyx_memviewslice __pyx_v_firsto = { 0, 0, { 0 }, { 0 }, { 0 } };
+  __Pyx_memviewslice __pyx_v_o2a = { 0, 0, { 0 }, { 0 }, { 0 } };
+  int __pyx_v_na;
+  int __pyx_v_no;
+  int __pyx_v_nd;
+  int __pyx_v_nc;
+  PyArrayObject *__pyx_v_A_PTR = 0;
+  PyArrayObject *__pyx_v_STAMP = 0;
+  PyArrayObject *__pyx_v_POS = 0;
+  __Pyx_memviewslice __pyx_v_aptr = { 0, 0, { 0 }, { 0 }, { 0 } };
+  __Pyx_memviewslice __pyx_v_stamp = { 0, 0, { 0 }, { 0 }, { 0 } };
+  __Pyx_memviewslice __pyx_v_pos = { 0, 0, { 0 }, { 0 }, { 0 } };
+  int __pyx_v_ia;
+  int __pyx_v_io;
+  int __pyx_v_i;
+  int __pyx_v_j;
+  int __pyx_v_c;
+  int __pyx_v_n;
+  PyArrayObject *__pyx_v_A_COL = 0;
+  __Pyx_memviewslice __pyx_v_acol = { 0, 0, { 0 }, { 0 }, { 0 } };
+  PyObject *__pyx_v_A_D = NULL;
+  __Pyx_memviewslice __pyx_v_ad = { 0, 0, { 0 }, { 0 }, { 0 } };
+  float __pyx_v_v;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_A_COL;
+  __Pyx_Buffer __pyx_pybuffer_A_COL;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_A_PTR;
+  __Pyx_Buffer __pyx_pybuffer_A_PTR;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_COL;
+  __Pyx_Buffer __pyx_pybuffer_COL;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_FIRSTO;
+  __Pyx_Buffer __pyx_pybuffer_FIRSTO;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_O2A;
+  __Pyx_Buffer __pyx_pybuffer_O2A;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_POS;
+  __Pyx_Buffer __pyx_pybuffer_POS;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_PTR;
+  __Pyx_Buffer __pyx_pybuffer_PTR;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_STAMP;
+  __Pyx_Buffer __pyx_pybuffer_STAMP;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  __Pyx_memviewslice __pyx_t_1 = { 0, 0, { 0 }, { 0 }, { 0 } };
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  PyObject *__pyx_t_6 = NULL;
+  PyArrayObject *__pyx_t_7 = NULL;
+  PyArrayObject *__pyx_t_8 = NULL;
+  PyArrayObject *__pyx_t_9 = NULL;
+  int __pyx_t_10;
+  int __pyx_t_11;
+  int __pyx_t_12;
+  Py_ssize_t __pyx_t_13;
+  Py_ssize_t __pyx_t_14;
+  int __pyx_t_15;
+  Py_ssize_t __pyx_t_16;
+  int __pyx_t_17;
+  int __pyx_t_18;
+  Py_ssize_t __pyx_t_19;
+  int __pyx_t_20;
+  Py_ssize_t __pyx_t_21;
+  int __pyx_t_22;
+  int __pyx_t_23;
+  Py_ssize_t __pyx_t_24;
+  Py_ssize_t __pyx_t_25;
+  Py_ssize_t __pyx_t_26;
+  Py_ssize_t __pyx_t_27;
+  int __pyx_t_28;
+  Py_ssize_t __pyx_t_29;
+  Py_ssize_t __pyx_t_30;
+  PyArrayObject *__pyx_t_31 = NULL;
+  __Pyx_memviewslice __pyx_t_32 = { 0, 0, { 0 }, { 0 }, { 0 } };
+  Py_ssize_t __pyx_t_33;
+  Py_ssize_t __pyx_t_34;
+  Py_ssize_t __pyx_t_35;
+  Py_ssize_t __pyx_t_36;
+  Py_ssize_t __pyx_t_37;
+  Py_ssize_t __pyx_t_38;
+  Py_ssize_t __pyx_t_39;
+  Py_ssize_t __pyx_t_40;
+  Py_ssize_t __pyx_t_41;
+  Py_ssize_t __pyx_t_42;
+  Py_ssize_t __pyx_t_43;
+  Py_ssize_t __pyx_t_44;
+  Py_ssize_t __pyx_t_45;
+  Py_ssize_t __pyx_t_46;
+  Py_ssize_t __pyx_t_47;
+  Py_ssize_t __pyx_t_48;
+  Py_ssize_t __pyx_t_49;
+  Py_ssize_t __pyx_t_50;
+  Py_ssize_t __pyx_t_51;
+  Py_ssize_t __pyx_t_52;
+  Py_ssize_t __pyx_t_53;
+  Py_ssize_t __pyx_t_54;
+  Py_ssize_t __pyx_t_55;
+  Py_ssize_t __pyx_t_56;
+  Py_ssize_t __pyx_t_57;
+  Py_ssize_t __pyx_t_58;
+  Py_ssize_t __pyx_t_59;
+  int __pyx_t_60;
+  int __pyx_t_61;
+  int __pyx_t_62;
+  Py_ssize_t __pyx_t_63;
+  Py_ssize_t __pyx_t_64;
+  Py_ssize_t __pyx_t_65;
+  Py_ssize_t __pyx_t_66;
+  Py_ssize_t __pyx_t_67;
+  Py_ssize_t __pyx_t_68;
+  Py_ssize_t __pyx_t_69;
+  Py_ssize_t __pyx_t_70;
+  __Pyx_RefNannySetupContext("__pyx_fuse_0sparse_orb_to_atom", 0);
+  __pyx_pybuffer_A_PTR.pybuffer.buf = NULL;
+  __pyx_pybuffer_A_PTR.refcount = 0;
+  __pyx_pybuffernd_A_PTR.data = NULL;
+  __pyx_pybuffernd_A_PTR.rcbuffer = &__pyx_pybuffer_A_PTR;
+  __pyx_pybuffer_STAMP.pybuffer.buf = NULL;
+  __pyx_pybuffer_STAMP.refcount = 0;
+  __pyx_pybuffernd_STAMP.data = NULL;
+  __pyx_pybuffernd_STAMP.rcbuffer = &__pyx_pybuffer_STAMP;
+  __pyx_pybuffer_POS.pybuffer.buf = NULL;
+  __pyx_pybuffer_POS.refcount = 0;
+  __pyx_pybuffernd_POS.data = NULL;
+  __pyx_pybuffernd_POS.rcbuffer = &__pyx_pybuffer_POS;
+  __pyx_pybuffer_A_COL.pybuffer.buf = NULL;
+  __pyx_pybuffer_A_COL.refcount = 0;
+  __pyx_pybuffernd_A_COL.data = NULL;
+  __pyx_pybuffernd_A_COL.rcbuffer = &__pyx_pybuffer_A_COL;
+  __pyx_pybuffer_PTR.pybuffer.buf = NULL;
+  __pyx_pybuffer_PTR.refcount = 0;
+  __pyx_pybuffernd_PTR.data = NULL;
+  __pyx_pybuffernd_PTR.rcbuffer = &__pyx_pybuffer_PTR;
+  __pyx_pybuffer_COL.pybuffer.buf = NULL;
+  __pyx_pybuffer_COL.refcount = 0;
+  __pyx_pybuffernd_COL.data = NULL;
+  __pyx_pybuffernd_COL.rcbuffer = &__pyx_pybuffer_COL;
+  __pyx_pybuffer_FIRSTO.pybuffer.buf = NULL;
+  __pyx_pybuffer_FIRSTO.refcount = 0;
+  __pyx_pybuffernd_FIRSTO.data = NULL;
+  __pyx_pybuffernd_FIRSTO.rcbuffer = &__pyx_pybuffer_FIRSTO;
+  __pyx_pybuffer_O2A.pybuffer.buf = NULL;
+  __pyx_pybuffer_O2A.refcount = 0;
+  __pyx_pybuffernd_O2A.data = NULL;
+  __pyx_pybuffernd_O2A.rcbuffer = &__pyx_pybuffer_O2A;
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_PTR.rcbuffer->pybuffer, (PyObject*)__pyx_v_PTR, &__Pyx_TypeInfo_nn___pyx_t_5numpy_int32_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 672, __pyx_L1_error)
+  }
+  __pyx_pybuffernd_PTR.diminfo[0].strides = __pyx_pybuffernd_PTR.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_PTR.diminfo[0].shape = __pyx_pybuffernd_PTR.rcbuffer->pybuffer.shape[0];
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_COL.rcbuffer->pybuffer, (PyObject*)__pyx_v_COL, &__Pyx_TypeInfo_nn___pyx_t_5numpy_int32_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 672, __pyx_L1_error)
+  }
+  __pyx_pybuffernd_COL.diminfo[0].strides = __pyx_pybuffernd_COL.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_COL.diminfo[0].shape = __pyx_pybuffernd_COL.rcbuffer->pybuffer.shape[0];
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_FIRSTO.rcbuffer->pybuffer, (PyObject*)__pyx_v_FIRSTO, &__Pyx_TypeInfo_nn___pyx_t_5numpy_int32_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 672, __pyx_L1_error)
+  }
+  __pyx_pybuffernd_FIRSTO.diminfo[0].strides = __pyx_pybuffernd_FIRSTO.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_FIRSTO.diminfo[0].shape = __pyx_pybuffernd_FIRSTO.rcbuffer->pybuffer.shape[0];
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_O2A.rcbuffer->pybuffer, (PyObject*)__pyx_v_O2A, &__Pyx_TypeInfo_nn___pyx_t_5numpy_int32_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 672, __pyx_L1_error)
+  }
+  __pyx_pybuffernd_O2A.diminfo[0].strides = __pyx_pybuffernd_O2A.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_O2A.diminfo[0].shape = __pyx_pybuffernd_O2A.rcbuffer->pybuffer.shape[0];
+
+  /* "sisl/_sparse.pyx":704
+ *     data : the atomic data, ``data[i, :]`` corresponds to ``D[i, :]``
+ *     """
+ *     cdef int[::1] ptr = PTR             # <<<<<<<<<<<<<<
+ *     cdef int[::1] col = COL
+ *     cdef int[::1] firsto = FIRSTO
+ */
+  __pyx_t_1 = __Pyx_PyObject_to_MemoryviewSlice_dc_int(((PyObject *)__pyx_v_PTR), PyBUF_WRITABLE); if (unlikely(!__pyx_t_1.memview)) __PYX_ERR(0, 704, __pyx_L1_error)
+  __pyx_v_ptr = __pyx_t_1;
+  __pyx_t_1.memview = NULL;
+  __pyx_t_1.data = NULL;
+
+  /* "sisl/_sparse.pyx":705
+ *     """
+ *     cdef int[::1] ptr = PTR
+ *     cdef int[::1] col = COL             # <<<<<<<<<<<<<<
+ *     cdef int[::1] firsto = FIRSTO
+ *     cdef int[::1] o2a = O2A
+ */
+  __pyx_t_1 = __Pyx_PyObject_to_MemoryviewSlice_dc_int(((PyObject *)__pyx_v_COL), PyBUF_WRITABLE); if (unlikely(!__pyx_t_1.memview)) __PYX_ERR(0, 705, __pyx_L1_error)
+  __pyx_v_col = __pyx_t_1;
+  __pyx_t_1.memview = NULL;
+  __pyx_t_1.data = NULL;
+
+  /* "sisl/_sparse.pyx":706
+ *     cdef int[::1] ptr = PTR
+ *     cdef int[::1] col = COL
+ *     cdef int[::1] firsto = FIRSTO             # <<<<<<<<<<<<<<
+ *     cdef int[::1] o2a = O2A
+ *     cdef int na = firsto.shape[0] - 1
+ */
+  __pyx_t_1 = __Pyx_PyObject_to_MemoryviewSlice_dc_int(((PyObject *)__pyx_v_FIRSTO), PyBUF_WRITABLE); if (unlikely(!__pyx_t_1.memview)) __PYX_ERR(0, 706, __pyx_L1_error)
+  __pyx_v_firsto = __pyx_t_1;
+  __pyx_t_1.memview = NULL;
+  __pyx_t_1.data = NULL;
+
+  /* "sisl/_sparse.pyx":707
+ *     cdef int[::1] col = COL
+ *     cdef int[::1] firsto = FIRSTO
+ *     cdef int[::1] o2a = O2A             # <<<<<<<<<<<<<<
+ *     cdef int na = firsto.shape[0] - 1
+ *     cdef int no = o2a.shape[0]
+ */
+  __pyx_t_1 = __Pyx_PyObject_to_MemoryviewSlice_dc_int(((PyObject *)__pyx_v_O2A), PyBUF_WRITABLE); if (unlikely(!__pyx_t_1.memview)) __PYX_ERR(0, 707, __pyx_L1_error)
+  __pyx_v_o2a = __pyx_t_1;
+  __pyx_t_1.memview = NULL;
+  __pyx_t_1.data = NULL;
+
+  /* "sisl/_sparse.pyx":708
+ *     cdef int[::1] firsto = FIRSTO
+ *     cdef int[::1] o2a = O2A
+ *     cdef int na = firsto.shape[0] - 1             # <<<<<<<<<<<<<<
+ *     cdef int no = o2a.shape[0]
+ *     cdef int nd = D.shape[0]
+ */
+  __pyx_v_na = ((__pyx_v_firsto.shape[0]) - 1);
+
+  /* "sisl/_sparse.pyx":709
+ *     cdef int[::1] o2a = O2A
+ *     cdef int na = firsto.shape[0] - 1
+ *     cdef int no = o2a.shape[0]             # <<<<<<<<<<<<<<
+ *     cdef int nd = D.shape[0]
+ *     cdef int nc = na * n_s
+ */
+  __pyx_v_no = (__pyx_v_o2a.shape[0]);
+
+  /* "sisl/_sparse.pyx":710
+ *     cdef int na = firsto.shape[0] - 1
+ *     cdef int no = o2a.shape[0]
+ *     cdef int nd = D.shape[0]             # <<<<<<<<<<<<<<
+ *     cdef int nc = na * n_s
+ * 
+ */
+  __pyx_v_nd = (__pyx_v_D.shape[0]);
+
+  /* "sisl/_sparse.pyx":711
+ *     cdef int no = o2a.shape[0]
+ *     cdef int nd = D.shape[0]
+ *     cdef int nc = na * n_s             # <<<<<<<<<<<<<<
+ * 
+ *     cdef np.ndarray[np.int32_t, ndim=1, mode='c'] A_PTR = np.empty([na + 1], dtype=np.int32)
+ */
+  __pyx_v_nc = (__pyx_v_na * __pyx_v_n_s);
+
+  /* "sisl/_sparse.pyx":713
+ *     cdef int nc = na * n_s
+ * 
+ *     cdef np.ndarray[np.int32_t, ndim=1, mode='c'] A_PTR = np.empty([na + 1], dtype=np.int32)             # <<<<<<<<<<<<<<
+ *     cdef np.ndarray[np.int32_t, ndim=1, mode='c'] STAMP = np.full([nc], -1, dtype=np.int32)
+ *     cdef np.ndarray[np.int32_t, ndim=1, mode='c'] POS = np.empty([nc], dtype=np.int32)
+ */
+  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_np); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 713, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_empty); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 713, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_2 = __Pyx_PyInt_From_long((__pyx_v_na + 1)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 713, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_4 = PyList_New(1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 713, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_GIVEREF(__pyx_t_2);
+  PyList_SET_ITEM(__pyx_t_4, 0, __pyx_t_2);
+  __pyx_t_2 = 0;
+  __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 713, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_GIVEREF(__pyx_t_4);
+  PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_t_4);
+  __pyx_t_4 = 0;
+  __pyx_t_4 = __Pyx_PyDict_NewPresized(1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 713, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_GetModuleGlobalName(__pyx_t_5, __pyx_n_s_np); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 713, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_t_5, __pyx_n_s_int32); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 713, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  if (PyDict_SetItem(__pyx_t_4, __pyx_n_s_dtype, __pyx_t_6) < 0) __PYX_ERR(0, 713, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  __pyx_t_6 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_t_2, __pyx_t_4); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 713, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  if (!(likely(((__pyx_t_6) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_6, __pyx_ptype_5numpy_ndarray))))) __PYX_ERR(0, 713, __pyx_L1_error)
+  __pyx_t_7 = ((PyArrayObject *)__pyx_t_6);
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_A_PTR.rcbuffer->pybuffer, (PyObject*)__pyx_t_7, &__Pyx_TypeInfo_nn___pyx_t_5numpy_int32_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) {
+      __pyx_v_A_PTR = ((PyArrayObject *)Py_None); __Pyx_INCREF(Py_None); __pyx_pybuffernd_A_PTR.rcbuffer->pybuffer.buf = NULL;
+      __PYX_ERR(0, 713, __pyx_L1_error)
+    } else {__pyx_pybuffernd_A_PTR.diminfo[0].strides = __pyx_pybuffernd_A_PTR.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_A_PTR.diminfo[0].shape = __pyx_pybuffernd_A_PTR.rcbuffer->pybuffer.shape[0];
+    }
+  }
+  __pyx_t_7 = 0;
+  __pyx_v_A_PTR = ((PyArrayObject *)__pyx_t_6);
+  __pyx_t_6 = 0;
+
+  /* "sisl/_sparse.pyx":714
+ * 
+ *     cdef np.ndarray[np.int32_t, ndim=1, mode='c'] A_PTR = np.empty([na + 1], dtype=np.int32)
+ *     cdef np.ndarray[np.int32_t, ndim=1, mode='c'] STAMP = np.full([nc], -1, dtype=np.int32)             # <<<<<<<<<<<<<<
+ *     cdef np.ndarray[np.int32_t, ndim=1, mode='c'] POS = np.empty([nc], dtype=np.int32)
+ *     cdef int[::1] aptr = A_PTR
+ */
+  __Pyx_GetModuleGlobalName(__pyx_t_6, __pyx_n_s_np); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 714, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_t_6, __pyx_n_s_full); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 714, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  __pyx_t_6 = __Pyx_PyInt_From_int(__pyx_v_nc); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 714, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __pyx_t_2 = PyList_New(1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 714, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_GIVEREF(__pyx_t_6);
+  PyList_SET_ITEM(__pyx_t_2, 0, __pyx_t_6);
+  __pyx_t_6 = 0;
+  __pyx_t_6 = PyTuple_New(2); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 714, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_GIVEREF(__pyx_t_2);
+  PyTuple_SET_ITEM(__pyx_t_6, 0, __pyx_t_2);
+  __Pyx_INCREF(__pyx_int_neg_1);
+  __Pyx_GIVEREF(__pyx_int_neg_1);
+  PyTuple_SET_ITEM(__pyx_t_6, 1, __pyx_int_neg_1);
+  __pyx_t_2 = 0;
+  __pyx_t_2 = __Pyx_PyDict_NewPresized(1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 714, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_n_s_np); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 714, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_n_s_int32); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 714, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  if (PyDict_SetItem(__pyx_t_2, __pyx_n_s_dtype, __pyx_t_5) < 0) __PYX_ERR(0, 714, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __pyx_t_5 = __Pyx_PyObject_Call(__pyx_t_4, __pyx_t_6, __pyx_t_2); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 714, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  if (!(likely(((__pyx_t_5) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_5, __pyx_ptype_5numpy_ndarray))))) __PYX_ERR(0, 714, __pyx_L1_error)
+  __pyx_t_8 = ((PyArrayObject *)__pyx_t_5);
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_STAMP.rcbuffer->pybuffer, (PyObject*)__pyx_t_8, &__Pyx_TypeInfo_nn___pyx_t_5numpy_int32_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) {
+      __pyx_v_STAMP = ((PyArrayObject *)Py_None); __Pyx_INCREF(Py_None); __pyx_pybuffernd_STAMP.rcbuffer->pybuffer.buf = NULL;
+      __PYX_ERR(0, 714, __pyx_L1_error)
+    } else {__pyx_pybuffernd_STAMP.diminfo[0].strides = __pyx_pybuffernd_STAMP.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_STAMP.diminfo[0].shape = __pyx_pybuffernd_STAMP.rcbuffer->pybuffer.shape[0];
+    }
+  }
+  __pyx_t_8 = 0;
+  __pyx_v_STAMP = ((PyArrayObject *)__pyx_t_5);
+  __pyx_t_5 = 0;
+
+  /* "sisl/_sparse.pyx":715
+ *     cdef np.ndarray[np.int32_t, ndim=1, mode='c'] A_PTR = np.empty([na + 1], dtype=np.int32)
+ *     cdef np.ndarray[np.int32_t, ndim=1, mode='c'] STAMP = np.full([nc], -1, dtype=np.int32)
+ *     cdef np.ndarray[np.int32_t, ndim=1, mode='c'] POS = np.empty([nc], dtype=np.int32)             # <<<<<<<<<<<<<<
+ *     cdef int[::1] aptr = A_PTR
+ *     cdef int[::1] stamp = STAMP
+ */
+  __Pyx_GetModuleGlobalName(__pyx_t_5, __pyx_n_s_np); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 715, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_t_5, __pyx_n_s_empty); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 715, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __pyx_t_5 = __Pyx_PyInt_From_int(__pyx_v_nc); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 715, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __pyx_t_6 = PyList_New(1); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 715, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_GIVEREF(__pyx_t_5);
+  PyList_SET_ITEM(__pyx_t_6, 0, __pyx_t_5);
+  __pyx_t_5 = 0;
+  __pyx_t_5 = PyTuple_New(1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 715, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_GIVEREF(__pyx_t_6);
+  PyTuple_SET_ITEM(__pyx_t_5, 0, __pyx_t_6);
+  __pyx_t_6 = 0;
+  __pyx_t_6 = __Pyx_PyDict_NewPresized(1); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 715, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_GetModuleGlobalName(__pyx_t_4, __pyx_n_s_np); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 715, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_4, __pyx_n_s_int32); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 715, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  if (PyDict_SetItem(__pyx_t_6, __pyx_n_s_dtype, __pyx_t_3) < 0) __PYX_ERR(0, 715, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_t_3 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_t_5, __pyx_t_6); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 715, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  if (!(likely(((__pyx_t_3) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_3, __pyx_ptype_5numpy_ndarray))))) __PYX_ERR(0, 715, __pyx_L1_error)
+  __pyx_t_9 = ((PyArrayObject *)__pyx_t_3);
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_POS.rcbuffer->pybuffer, (PyObject*)__pyx_t_9, &__Pyx_TypeInfo_nn___pyx_t_5numpy_int32_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) {
+      __pyx_v_POS = ((PyArrayObject *)Py_None); __Pyx_INCREF(Py_None); __pyx_pybuffernd_POS.rcbuffer->pybuffer.buf = NULL;
+      __PYX_ERR(0, 715, __pyx_L1_error)
+    } else {__pyx_pybuffernd_POS.diminfo[0].strides = __pyx_pybuffernd_POS.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_POS.diminfo[0].shape = __pyx_pybuffernd_POS.rcbuffer->pybuffer.shape[0];
+    }
+  }
+  __pyx_t_9 = 0;
+  __pyx_v_POS = ((PyArrayObject *)__pyx_t_3);
+  __pyx_t_3 = 0;
+
+  /* "sisl/_sparse.pyx":716
+ *     cdef np.ndarray[np.int32_t, ndim=1, mode='c'] STAMP = np.full([nc], -1, dtype=np.int32)
+ *     cdef np.ndarray[np.int32_t, ndim=1, mode='c'] POS = np.empty([nc], dtype=np.int32)
+ *     cdef int[::1] aptr = A_PTR             # <<<<<<<<<<<<<<
+ *     cdef int[::1] stamp = STAMP
+ *     cdef int[::1] pos = POS
+ */
+  __pyx_t_1 = __Pyx_PyObject_to_MemoryviewSlice_dc_int(((PyObject *)__pyx_v_A_PTR), PyBUF_WRITABLE); if (unlikely(!__pyx_t_1.memview)) __PYX_ERR(0, 716, __pyx_L1_error)
+  __pyx_v_aptr = __pyx_t_1;
+  __pyx_t_1.memview = NULL;
+  __pyx_t_1.data = NULL;
+
+  /* "sisl/_sparse.pyx":717
+ *     cdef np.ndarray[np.int32_t, ndim=1, mode='c'] POS = np.empty([nc], dtype=np.int32)
+ *     cdef int[::1] aptr = A_PTR
+ *     cdef int[::1] stamp = STAMP             # <<<<<<<<<<<<<<
+ *     cdef int[::1] pos = POS
+ * 
+ */
+  __pyx_t_1 = __Pyx_PyObject_to_MemoryviewSlice_dc_int(((PyObject *)__pyx_v_STAMP), PyBUF_WRITABLE); if (unlikely(!__pyx_t_1.memview)) __PYX_ERR(0, 717, __pyx_L1_error)
+  __pyx_v_stamp = __pyx_t_1;
+  __pyx_t_1.memview = NULL;
+  __pyx_t_1.data = NULL;
+
+  /* "sisl/_sparse.pyx":718
+ *     cdef int[::1] aptr = A_PTR
+ *     cdef int[::1] stamp = STAMP
+ *     cdef int[::1] pos = POS             # <<<<<<<<<<<<<<
+ * 
+ *     cdef int ia, io, i, j, c, n
+ */
+  __pyx_t_1 = __Pyx_PyObject_to_MemoryviewSlice_dc_int(((PyObject *)__pyx_v_POS), PyBUF_WRITABLE); if (unlikely(!__pyx_t_1.memview)) __PYX_ERR(0, 718, __pyx_L1_error)
+  __pyx_v_pos = __pyx_t_1;
+  __pyx_t_1.memview = NULL;
+  __pyx_t_1.data = NULL;
+
+  /* "sisl/_sparse.pyx":723
+ * 
+ *     # Count the number of unique atomic columns per atom
+ *     n = 0             # <<<<<<<<<<<<<<
+ *     with nogil:
+ *         for ia in range(na):
+ */
+  __pyx_v_n = 0;
+
+  /* "sisl/_sparse.pyx":724
+ *     # Count the number of unique atomic columns per atom
+ *     n = 0
+ *     with nogil:             # <<<<<<<<<<<<<<
+ *         for ia in range(na):
+ *             aptr[ia] = n
+ */
+  {
+      #ifdef WITH_THREAD
+      PyThreadState *_save;
+      Py_UNBLOCK_THREADS
+      __Pyx_FastGIL_Remember();
+      #endif
+      /*try:*/ {
+
+        /* "sisl/_sparse.pyx":725
+ *     n = 0
+ *     with nogil:
+ *         for ia in range(na):             # <<<<<<<<<<<<<<
+ *             aptr[ia] = n
+ *             for io in range(firsto[ia], firsto[ia + 1]):
+ */
+        __pyx_t_10 = __pyx_v_na;
+        __pyx_t_11 = __pyx_t_10;
+        for (__pyx_t_12 = 0; __pyx_t_12 < __pyx_t_11; __pyx_t_12+=1) {
+          __pyx_v_ia = __pyx_t_12;
+
+          /* "sisl/_sparse.pyx":726
+ *     with nogil:
+ *         for ia in range(na):
+ *             aptr[ia] = n             # <<<<<<<<<<<<<<
+ *             for io in range(firsto[ia], firsto[ia + 1]):
+ *                 for i in range(ptr[io], ptr[io + 1]):
+ */
+          __pyx_t_13 = __pyx_v_ia;
+          *((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_aptr.data) + __pyx_t_13)) )) = __pyx_v_n;
+
+          /* "sisl/_sparse.pyx":727
+ *         for ia in range(na):
+ *             aptr[ia] = n
+ *             for io in range(firsto[ia], firsto[ia + 1]):             # <<<<<<<<<<<<<<
+ *                 for i in range(ptr[io], ptr[io + 1]):
+ *                     c = (o2a[col[i] % no] + (col[i] / no) * na) % nc
+ */
+          __pyx_t_14 = (__pyx_v_ia + 1);
+          __pyx_t_15 = (*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_firsto.data) + __pyx_t_14)) )));
+          __pyx_t_16 = __pyx_v_ia;
+          __pyx_t_17 = __pyx_t_15;
+          for (__pyx_t_18 = (*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_firsto.data) + __pyx_t_16)) ))); __pyx_t_18 < __pyx_t_17; __pyx_t_18+=1) {
+            __pyx_v_io = __pyx_t_18;
+
+            /* "sisl/_sparse.pyx":728
+ *             aptr[ia] = n
+ *             for io in range(firsto[ia], firsto[ia + 1]):
+ *                 for i in range(ptr[io], ptr[io + 1]):             # <<<<<<<<<<<<<<
+ *                     c = (o2a[col[i] % no] + (col[i] / no) * na) % nc
+ *                     if stamp[c] != ia:
+ */
+            __pyx_t_19 = (__pyx_v_io + 1);
+            __pyx_t_20 = (*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_ptr.data) + __pyx_t_19)) )));
+            __pyx_t_21 = __pyx_v_io;
+            __pyx_t_22 = __pyx_t_20;
+            for (__pyx_t_23 = (*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_ptr.data) + __pyx_t_21)) ))); __pyx_t_23 < __pyx_t_22; __pyx_t_23+=1) {
+              __pyx_v_i = __pyx_t_23;
+
+              /* "sisl/_sparse.pyx":729
+ *             for io in range(firsto[ia], firsto[ia + 1]):
+ *                 for i in range(ptr[io], ptr[io + 1]):
+ *                     c = (o2a[col[i] % no] + (col[i] / no) * na) % nc             # <<<<<<<<<<<<<<
+ *                     if stamp[c] != ia:
+ *                         stamp[c] = ia
+ */
+              __pyx_t_24 = __pyx_v_i;
+              __pyx_t_25 = ((*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_col.data) + __pyx_t_24)) ))) % __pyx_v_no);
+              __pyx_t_26 = __pyx_v_i;
+              __pyx_v_c = (((*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_o2a.data) + __pyx_t_25)) ))) + (((*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_col.data) + __pyx_t_26)) ))) / __pyx_v_no) * __pyx_v_na)) % __pyx_v_nc);
+
+              /* "sisl/_sparse.pyx":730
+ *                 for i in range(ptr[io], ptr[io + 1]):
+ *                     c = (o2a[col[i] % no] + (col[i] / no) * na) % nc
+ *                     if stamp[c] != ia:             # <<<<<<<<<<<<<<
+ *                         stamp[c] = ia
+ *                         n += 1
+ */
+              __pyx_t_27 = __pyx_v_c;
+              __pyx_t_28 = (((*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_stamp.data) + __pyx_t_27)) ))) != __pyx_v_ia) != 0);
+              if (__pyx_t_28) {
+
+                /* "sisl/_sparse.pyx":731
+ *                     c = (o2a[col[i] % no] + (col[i] / no) * na) % nc
+ *                     if stamp[c] != ia:
+ *                         stamp[c] = ia             # <<<<<<<<<<<<<<
+ *                         n += 1
+ *         aptr[na] = n
+ */
+                __pyx_t_29 = __pyx_v_c;
+                *((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_stamp.data) + __pyx_t_29)) )) = __pyx_v_ia;
+
+                /* "sisl/_sparse.pyx":732
+ *                     if stamp[c] != ia:
+ *                         stamp[c] = ia
+ *                         n += 1             # <<<<<<<<<<<<<<
+ *         aptr[na] = n
+ * 
+ */
+                __pyx_v_n = (__pyx_v_n + 1);
+
+                /* "sisl/_sparse.pyx":730
+ *                 for i in range(ptr[io], ptr[io + 1]):
+ *                     c = (o2a[col[i] % no] + (col[i] / no) * na) % nc
+ *                     if stamp[c] != ia:             # <<<<<<<<<<<<<<
+ *                         stamp[c] = ia
+ *                         n += 1
+ */
+              }
+            }
+          }
+        }
+
+        /* "sisl/_sparse.pyx":733
+ *                         stamp[c] = ia
+ *                         n += 1
+ *         aptr[na] = n             # <<<<<<<<<<<<<<
+ * 
+ *     cdef np.ndarray[np.int32_t, ndim=1, mode='c'] A_COL = np.empty([n], dtype=np.int32)
+ */
+        __pyx_t_30 = __pyx_v_na;
+        *((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_aptr.data) + __pyx_t_30)) )) = __pyx_v_n;
+      }
+
+      /* "sisl/_sparse.pyx":724
+ *     # Count the number of unique atomic columns per atom
+ *     n = 0
+ *     with nogil:             # <<<<<<<<<<<<<<
+ *         for ia in range(na):
+ *             aptr[ia] = n
+ */
+      /*finally:*/ {
+        /*normal exit:*/{
+          #ifdef WITH_THREAD
+          __Pyx_FastGIL_Forget();
+          Py_BLOCK_THREADS
+          #endif
+          goto __pyx_L5;
+        }
+        __pyx_L5:;
+      }
+  }
+
+  /* "sisl/_sparse.pyx":735
+ *         aptr[na] = n
+ * 
+ *     cdef np.ndarray[np.int32_t, ndim=1, mode='c'] A_COL = np.empty([n], dtype=np.int32)             # <<<<<<<<<<<<<<
+ *     cdef int[::1] acol = A_COL
+ *     if _orb_real is float:
+ */
+  __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_n_s_np); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 735, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_n_s_empty); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 735, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_t_3 = __Pyx_PyInt_From_int(__pyx_v_n); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 735, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_5 = PyList_New(1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 735, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_GIVEREF(__pyx_t_3);
+  PyList_SET_ITEM(__pyx_t_5, 0, __pyx_t_3);
+  __pyx_t_3 = 0;
+  __pyx_t_3 = PyTuple_New(1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 735, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_GIVEREF(__pyx_t_5);
+  PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_t_5);
+  __pyx_t_5 = 0;
+  __pyx_t_5 = __Pyx_PyDict_NewPresized(1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 735, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_np); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 735, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_int32); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 735, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  if (PyDict_SetItem(__pyx_t_5, __pyx_n_s_dtype, __pyx_t_4) < 0) __PYX_ERR(0, 735, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_t_4 = __Pyx_PyObject_Call(__pyx_t_6, __pyx_t_3, __pyx_t_5); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 735, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  if (!(likely(((__pyx_t_4) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_4, __pyx_ptype_5numpy_ndarray))))) __PYX_ERR(0, 735, __pyx_L1_error)
+  __pyx_t_31 = ((PyArrayObject *)__pyx_t_4);
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_A_COL.rcbuffer->pybuffer, (PyObject*)__pyx_t_31, &__Pyx_TypeInfo_nn___pyx_t_5numpy_int32_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) {
+      __pyx_v_A_COL = ((PyArrayObject *)Py_None); __Pyx_INCREF(Py_None); __pyx_pybuffernd_A_COL.rcbuffer->pybuffer.buf = NULL;
+      __PYX_ERR(0, 735, __pyx_L1_error)
+    } else {__pyx_pybuffernd_A_COL.diminfo[0].strides = __pyx_pybuffernd_A_COL.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_A_COL.diminfo[0].shape = __pyx_pybuffernd_A_COL.rcbuffer->pybuffer.shape[0];
+    }
+  }
+  __pyx_t_31 = 0;
+  __pyx_v_A_COL = ((PyArrayObject *)__pyx_t_4);
+  __pyx_t_4 = 0;
+
+  /* "sisl/_sparse.pyx":736
+ * 
+ *     cdef np.ndarray[np.int32_t, ndim=1, mode='c'] A_COL = np.empty([n], dtype=np.int32)
+ *     cdef int[::1] acol = A_COL             # <<<<<<<<<<<<<<
+ *     if _orb_real is float:
+ *         A_D = np.zeros([nd, n], dtype=np.float32)
+ */
+  __pyx_t_1 = __Pyx_PyObject_to_MemoryviewSlice_dc_int(((PyObject *)__pyx_v_A_COL), PyBUF_WRITABLE); if (unlikely(!__pyx_t_1.memview)) __PYX_ERR(0, 736, __pyx_L1_error)
+  __pyx_v_acol = __pyx_t_1;
+  __pyx_t_1.memview = NULL;
+  __pyx_t_1.data = NULL;
+
+  /* "sisl/_sparse.pyx":738
+ *     cdef int[::1] acol = A_COL
+ *     if _orb_real is float:
+ *         A_D = np.zeros([nd, n], dtype=np.float32)             # <<<<<<<<<<<<<<
+ *     else:
+ *         A_D = np.zeros([nd, n], dtype=np.float64)
+ */
+  __Pyx_GetModuleGlobalName(__pyx_t_4, __pyx_n_s_np); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 738, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_4, __pyx_n_s_zeros); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 738, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_t_4 = __Pyx_PyInt_From_int(__pyx_v_nd); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 738, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_3 = __Pyx_PyInt_From_int(__pyx_v_n); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 738, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_6 = PyList_New(2); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 738, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_GIVEREF(__pyx_t_4);
+  PyList_SET_ITEM(__pyx_t_6, 0, __pyx_t_4);
+  __Pyx_GIVEREF(__pyx_t_3);
+  PyList_SET_ITEM(__pyx_t_6, 1, __pyx_t_3);
+  __pyx_t_4 = 0;
+  __pyx_t_3 = 0;
+  __pyx_t_3 = PyTuple_New(1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 738, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_GIVEREF(__pyx_t_6);
+  PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_t_6);
+  __pyx_t_6 = 0;
+  __pyx_t_6 = __Pyx_PyDict_NewPresized(1); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 738, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_GetModuleGlobalName(__pyx_t_4, __pyx_n_s_np); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 738, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_t_4, __pyx_n_s_float32); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 738, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  if (PyDict_SetItem(__pyx_t_6, __pyx_n_s_dtype, __pyx_t_2) < 0) __PYX_ERR(0, 738, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_2 = __Pyx_PyObject_Call(__pyx_t_5, __pyx_t_3, __pyx_t_6); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 738, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  __pyx_v_A_D = __pyx_t_2;
+  __pyx_t_2 = 0;
+
+  /* "sisl/_sparse.pyx":741
+ *     else:
+ *         A_D = np.zeros([nd, n], dtype=np.float64)
+ *     cdef _orb_real[:, ::1] ad = A_D             # <<<<<<<<<<<<<<
+ *     cdef _orb_real v
+ * 
+ */
+  __pyx_t_32 = __Pyx_PyObject_to_MemoryviewSlice_d_dc_float(__pyx_v_A_D, PyBUF_WRITABLE); if (unlikely(!__pyx_t_32.memview)) __PYX_ERR(0, 741, __pyx_L1_error)
+  __pyx_v_ad = __pyx_t_32;
+  __pyx_t_32.memview = NULL;
+  __pyx_t_32.data = NULL;
+
+  /* "sisl/_sparse.pyx":744
+ *     cdef _orb_real v
+ * 
+ *     STAMP.fill(-1)             # <<<<<<<<<<<<<<
+ *     with nogil:
+ *         for ia in range(na):
+ */
+  __pyx_t_6 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_STAMP), __pyx_n_s_fill); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 744, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __pyx_t_3 = NULL;
+  if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_6))) {
+    __pyx_t_3 = PyMethod_GET_SELF(__pyx_t_6);
+    if (likely(__pyx_t_3)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_6);
+      __Pyx_INCREF(__pyx_t_3);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_6, function);
+    }
+  }
+  __pyx_t_2 = (__pyx_t_3) ? __Pyx_PyObject_Call2Args(__pyx_t_6, __pyx_t_3, __pyx_int_neg_1) : __Pyx_PyObject_CallOneArg(__pyx_t_6, __pyx_int_neg_1);
+  __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+  if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 744, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "sisl/_sparse.pyx":745
+ * 
+ *     STAMP.fill(-1)
+ *     with nogil:             # <<<<<<<<<<<<<<
+ *         for ia in range(na):
+ *             # Gather the unique columns
+ */
+  {
+      #ifdef WITH_THREAD
+      PyThreadState *_save;
+      Py_UNBLOCK_THREADS
+      __Pyx_FastGIL_Remember();
+      #endif
+      /*try:*/ {
+
+        /* "sisl/_sparse.pyx":746
+ *     STAMP.fill(-1)
+ *     with nogil:
+ *         for ia in range(na):             # <<<<<<<<<<<<<<
+ *             # Gather the unique columns
+ *             n = aptr[ia]
+ */
+        __pyx_t_10 = __pyx_v_na;
+        __pyx_t_11 = __pyx_t_10;
+        for (__pyx_t_12 = 0; __pyx_t_12 < __pyx_t_11; __pyx_t_12+=1) {
+          __pyx_v_ia = __pyx_t_12;
+
+          /* "sisl/_sparse.pyx":748
+ *         for ia in range(na):
+ *             # Gather the unique columns
+ *             n = aptr[ia]             # <<<<<<<<<<<<<<
+ *             for io in range(firsto[ia], firsto[ia + 1]):
+ *                 for i in range(ptr[io], ptr[io + 1]):
+ */
+          __pyx_t_33 = __pyx_v_ia;
+          __pyx_v_n = (*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_aptr.data) + __pyx_t_33)) )));
+
+          /* "sisl/_sparse.pyx":749
+ *             # Gather the unique columns
+ *             n = aptr[ia]
+ *             for io in range(firsto[ia], firsto[ia + 1]):             # <<<<<<<<<<<<<<
+ *                 for i in range(ptr[io], ptr[io + 1]):
+ *                     c = (o2a[col[i] % no] + (col[i] / no) * na) % nc
+ */
+          __pyx_t_34 = (__pyx_v_ia + 1);
+          __pyx_t_15 = (*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_firsto.data) + __pyx_t_34)) )));
+          __pyx_t_35 = __pyx_v_ia;
+          __pyx_t_17 = __pyx_t_15;
+          for (__pyx_t_18 = (*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_firsto.data) + __pyx_t_35)) ))); __pyx_t_18 < __pyx_t_17; __pyx_t_18+=1) {
+            __pyx_v_io = __pyx_t_18;
+
+            /* "sisl/_sparse.pyx":750
+ *             n = aptr[ia]
+ *             for io in range(firsto[ia], firsto[ia + 1]):
+ *                 for i in range(ptr[io], ptr[io + 1]):             # <<<<<<<<<<<<<<
+ *                     c = (o2a[col[i] % no] + (col[i] / no) * na) % nc
+ *                     if stamp[c] != ia:
+ */
+            __pyx_t_36 = (__pyx_v_io + 1);
+            __pyx_t_20 = (*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_ptr.data) + __pyx_t_36)) )));
+            __pyx_t_37 = __pyx_v_io;
+            __pyx_t_22 = __pyx_t_20;
+            for (__pyx_t_23 = (*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_ptr.data) + __pyx_t_37)) ))); __pyx_t_23 < __pyx_t_22; __pyx_t_23+=1) {
+              __pyx_v_i = __pyx_t_23;
+
+              /* "sisl/_sparse.pyx":751
+ *             for io in range(firsto[ia], firsto[ia + 1]):
+ *                 for i in range(ptr[io], ptr[io + 1]):
+ *                     c = (o2a[col[i] % no] + (col[i] / no) * na) % nc             # <<<<<<<<<<<<<<
+ *                     if stamp[c] != ia:
+ *                         stamp[c] = ia
+ */
+              __pyx_t_38 = __pyx_v_i;
+              __pyx_t_39 = ((*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_col.data) + __pyx_t_38)) ))) % __pyx_v_no);
+              __pyx_t_40 = __pyx_v_i;
+              __pyx_v_c = (((*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_o2a.data) + __pyx_t_39)) ))) + (((*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_col.data) + __pyx_t_40)) ))) / __pyx_v_no) * __pyx_v_na)) % __pyx_v_nc);
+
+              /* "sisl/_sparse.pyx":752
+ *                 for i in range(ptr[io], ptr[io + 1]):
+ *                     c = (o2a[col[i] % no] + (col[i] / no) * na) % nc
+ *                     if stamp[c] != ia:             # <<<<<<<<<<<<<<
+ *                         stamp[c] = ia
+ *                         acol[n] = c
+ */
+              __pyx_t_41 = __pyx_v_c;
+              __pyx_t_28 = (((*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_stamp.data) + __pyx_t_41)) ))) != __pyx_v_ia) != 0);
+              if (__pyx_t_28) {
+
+                /* "sisl/_sparse.pyx":753
+ *                     c = (o2a[col[i] % no] + (col[i] / no) * na) % nc
+ *                     if stamp[c] != ia:
+ *                         stamp[c] = ia             # <<<<<<<<<<<<<<
+ *                         acol[n] = c
+ *                         n += 1
+ */
+                __pyx_t_42 = __pyx_v_c;
+                *((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_stamp.data) + __pyx_t_42)) )) = __pyx_v_ia;
+
+                /* "sisl/_sparse.pyx":754
+ *                     if stamp[c] != ia:
+ *                         stamp[c] = ia
+ *                         acol[n] = c             # <<<<<<<<<<<<<<
+ *                         n += 1
+ * 
+ */
+                __pyx_t_43 = __pyx_v_n;
+                *((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_acol.data) + __pyx_t_43)) )) = __pyx_v_c;
+
+                /* "sisl/_sparse.pyx":755
+ *                         stamp[c] = ia
+ *                         acol[n] = c
+ *                         n += 1             # <<<<<<<<<<<<<<
+ * 
+ *             # Sort them and store their positions
+ */
+                __pyx_v_n = (__pyx_v_n + 1);
+
+                /* "sisl/_sparse.pyx":752
+ *                 for i in range(ptr[io], ptr[io + 1]):
+ *                     c = (o2a[col[i] % no] + (col[i] / no) * na) % nc
+ *                     if stamp[c] != ia:             # <<<<<<<<<<<<<<
+ *                         stamp[c] = ia
+ *                         acol[n] = c
+ */
+              }
+            }
+          }
+
+          /* "sisl/_sparse.pyx":758
+ * 
+ *             # Sort them and store their positions
+ *             n = aptr[ia + 1] - aptr[ia]             # <<<<<<<<<<<<<<
+ *             if n > 1:
+ *                 qsort(&acol[aptr[ia]], n, sizeof(int), _int_cmp)
+ */
+          __pyx_t_44 = (__pyx_v_ia + 1);
+          __pyx_t_45 = __pyx_v_ia;
+          __pyx_v_n = ((*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_aptr.data) + __pyx_t_44)) ))) - (*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_aptr.data) + __pyx_t_45)) ))));
+
+          /* "sisl/_sparse.pyx":759
+ *             # Sort them and store their positions
+ *             n = aptr[ia + 1] - aptr[ia]
+ *             if n > 1:             # <<<<<<<<<<<<<<
+ *                 qsort(&acol[aptr[ia]], n, sizeof(int), _int_cmp)
+ *             for j in range(aptr[ia], aptr[ia + 1]):
+ */
+          __pyx_t_28 = ((__pyx_v_n > 1) != 0);
+          if (__pyx_t_28) {
+
+            /* "sisl/_sparse.pyx":760
+ *             n = aptr[ia + 1] - aptr[ia]
+ *             if n > 1:
+ *                 qsort(&acol[aptr[ia]], n, sizeof(int), _int_cmp)             # <<<<<<<<<<<<<<
+ *             for j in range(aptr[ia], aptr[ia + 1]):
+ *                 pos[acol[j]] = j
+ */
+            __pyx_t_46 = __pyx_v_ia;
+            __pyx_t_47 = (*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_aptr.data) + __pyx_t_46)) )));
+            qsort((&(*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_acol.data) + __pyx_t_47)) )))), __pyx_v_n, (sizeof(int)), __pyx_f_4sisl_7_sparse__int_cmp);
+
+            /* "sisl/_sparse.pyx":759
+ *             # Sort them and store their positions
+ *             n = aptr[ia + 1] - aptr[ia]
+ *             if n > 1:             # <<<<<<<<<<<<<<
+ *                 qsort(&acol[aptr[ia]], n, sizeof(int), _int_cmp)
+ *             for j in range(aptr[ia], aptr[ia + 1]):
+ */
+          }
+
+          /* "sisl/_sparse.pyx":761
+ *             if n > 1:
+ *                 qsort(&acol[aptr[ia]], n, sizeof(int), _int_cmp)
+ *             for j in range(aptr[ia], aptr[ia + 1]):             # <<<<<<<<<<<<<<
+ *                 pos[acol[j]] = j
+ * 
+ */
+          __pyx_t_48 = (__pyx_v_ia + 1);
+          __pyx_t_15 = (*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_aptr.data) + __pyx_t_48)) )));
+          __pyx_t_49 = __pyx_v_ia;
+          __pyx_t_17 = __pyx_t_15;
+          for (__pyx_t_18 = (*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_aptr.data) + __pyx_t_49)) ))); __pyx_t_18 < __pyx_t_17; __pyx_t_18+=1) {
+            __pyx_v_j = __pyx_t_18;
+
+            /* "sisl/_sparse.pyx":762
+ *                 qsort(&acol[aptr[ia]], n, sizeof(int), _int_cmp)
+ *             for j in range(aptr[ia], aptr[ia + 1]):
+ *                 pos[acol[j]] = j             # <<<<<<<<<<<<<<
+ * 
+ *             # Sum the data
+ */
+            __pyx_t_50 = __pyx_v_j;
+            __pyx_t_51 = (*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_acol.data) + __pyx_t_50)) )));
+            *((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_pos.data) + __pyx_t_51)) )) = __pyx_v_j;
+          }
+
+          /* "sisl/_sparse.pyx":765
+ * 
+ *             # Sum the data
+ *             for io in range(firsto[ia], firsto[ia + 1]):             # <<<<<<<<<<<<<<
+ *                 for i in range(ptr[io], ptr[io + 1]):
+ *                     j = pos[(o2a[col[i] % no] + (col[i] / no) * na) % nc]
+ */
+          __pyx_t_52 = (__pyx_v_ia + 1);
+          __pyx_t_15 = (*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_firsto.data) + __pyx_t_52)) )));
+          __pyx_t_53 = __pyx_v_ia;
+          __pyx_t_17 = __pyx_t_15;
+          for (__pyx_t_18 = (*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_firsto.data) + __pyx_t_53)) ))); __pyx_t_18 < __pyx_t_17; __pyx_t_18+=1) {
+            __pyx_v_io = __pyx_t_18;
+
+            /* "sisl/_sparse.pyx":766
+ *             # Sum the data
+ *             for io in range(firsto[ia], firsto[ia + 1]):
+ *                 for i in range(ptr[io], ptr[io + 1]):             # <<<<<<<<<<<<<<
+ *                     j = pos[(o2a[col[i] % no] + (col[i] / no) * na) % nc]
+ *                     for c in range(nd):
+ */
+            __pyx_t_54 = (__pyx_v_io + 1);
+            __pyx_t_20 = (*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_ptr.data) + __pyx_t_54)) )));
+            __pyx_t_55 = __pyx_v_io;
+            __pyx_t_22 = __pyx_t_20;
+            for (__pyx_t_23 = (*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_ptr.data) + __pyx_t_55)) ))); __pyx_t_23 < __pyx_t_22; __pyx_t_23+=1) {
+              __pyx_v_i = __pyx_t_23;
+
+              /* "sisl/_sparse.pyx":767
+ *             for io in range(firsto[ia], firsto[ia + 1]):
+ *                 for i in range(ptr[io], ptr[io + 1]):
+ *                     j = pos[(o2a[col[i] % no] + (col[i] / no) * na) % nc]             # <<<<<<<<<<<<<<
+ *                     for c in range(nd):
+ *                         v = D[c, i]
+ */
+              __pyx_t_56 = __pyx_v_i;
+              __pyx_t_57 = ((*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_col.data) + __pyx_t_56)) ))) % __pyx_v_no);
+              __pyx_t_58 = __pyx_v_i;
+              __pyx_t_59 = (((*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_o2a.data) + __pyx_t_57)) ))) + (((*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_col.data) + __pyx_t_58)) ))) / __pyx_v_no) * __pyx_v_na)) % __pyx_v_nc);
+              __pyx_v_j = (*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_pos.data) + __pyx_t_59)) )));
+
+              /* "sisl/_sparse.pyx":768
+ *                 for i in range(ptr[io], ptr[io + 1]):
+ *                     j = pos[(o2a[col[i] % no] + (col[i] / no) * na) % nc]
+ *                     for c in range(nd):             # <<<<<<<<<<<<<<
+ *                         v = D[c, i]
+ *                         if only == 1:
+ */
+              __pyx_t_60 = __pyx_v_nd;
+              __pyx_t_61 = __pyx_t_60;
+              for (__pyx_t_62 = 0; __pyx_t_62 < __pyx_t_61; __pyx_t_62+=1) {
+                __pyx_v_c = __pyx_t_62;
+
+                /* "sisl/_sparse.pyx":769
+ *                     j = pos[(o2a[col[i] % no] + (col[i] / no) * na) % nc]
+ *                     for c in range(nd):
+ *                         v = D[c, i]             # <<<<<<<<<<<<<<
+ *                         if only == 1:
+ *                             if v > 0:
+ */
+                __pyx_t_63 = __pyx_v_c;
+                __pyx_t_64 = __pyx_v_i;
+                __pyx_v_v = (*((float *) ( /* dim=1 */ ((char *) (((float *) ( /* dim=0 */ (__pyx_v_D.data + __pyx_t_63 * __pyx_v_D.strides[0]) )) + __pyx_t_64)) )));
+
+                /* "sisl/_sparse.pyx":770
+ *                     for c in range(nd):
+ *                         v = D[c, i]
+ *                         if only == 1:             # <<<<<<<<<<<<<<
+ *                             if v > 0:
+ *                                 ad[c, j] += v
+ */
+                switch (__pyx_v_only) {
+                  case 1:
+
+                  /* "sisl/_sparse.pyx":771
+ *                         v = D[c, i]
+ *                         if only == 1:
+ *                             if v > 0:             # <<<<<<<<<<<<<<
+ *                                 ad[c, j] += v
+ *                         elif only == -1:
+ */
+                  __pyx_t_28 = ((__pyx_v_v > 0.0) != 0);
+                  if (__pyx_t_28) {
+
+                    /* "sisl/_sparse.pyx":772
+ *                         if only == 1:
+ *                             if v > 0:
+ *                                 ad[c, j] += v             # <<<<<<<<<<<<<<
+ *                         elif only == -1:
+ *                             if v < 0:
+ */
+                    __pyx_t_65 = __pyx_v_c;
+                    __pyx_t_66 = __pyx_v_j;
+                    *((float *) ( /* dim=1 */ ((char *) (((float *) ( /* dim=0 */ (__pyx_v_ad.data + __pyx_t_65 * __pyx_v_ad.strides[0]) )) + __pyx_t_66)) )) += __pyx_v_v;
+
+                    /* "sisl/_sparse.pyx":771
+ *                         v = D[c, i]
+ *                         if only == 1:
+ *                             if v > 0:             # <<<<<<<<<<<<<<
+ *                                 ad[c, j] += v
+ *                         elif only == -1:
+ */
+                  }
+
+                  /* "sisl/_sparse.pyx":770
+ *                     for c in range(nd):
+ *                         v = D[c, i]
+ *                         if only == 1:             # <<<<<<<<<<<<<<
+ *                             if v > 0:
+ *                                 ad[c, j] += v
+ */
+                  break;
+                  case -1L:
+
+                  /* "sisl/_sparse.pyx":774
+ *                                 ad[c, j] += v
+ *                         elif only == -1:
+ *                             if v < 0:             # <<<<<<<<<<<<<<
+ *                                 ad[c, j] += v
+ *                         else:
+ */
+                  __pyx_t_28 = ((__pyx_v_v < 0.0) != 0);
+                  if (__pyx_t_28) {
+
+                    /* "sisl/_sparse.pyx":775
+ *                         elif only == -1:
+ *                             if v < 0:
+ *                                 ad[c, j] += v             # <<<<<<<<<<<<<<
+ *                         else:
+ *                             ad[c, j] += v
+ */
+                    __pyx_t_67 = __pyx_v_c;
+                    __pyx_t_68 = __pyx_v_j;
+                    *((float *) ( /* dim=1 */ ((char *) (((float *) ( /* dim=0 */ (__pyx_v_ad.data + __pyx_t_67 * __pyx_v_ad.strides[0]) )) + __pyx_t_68)) )) += __pyx_v_v;
+
+                    /* "sisl/_sparse.pyx":774
+ *                                 ad[c, j] += v
+ *                         elif only == -1:
+ *                             if v < 0:             # <<<<<<<<<<<<<<
+ *                                 ad[c, j] += v
+ *                         else:
+ */
+                  }
+
+                  /* "sisl/_sparse.pyx":773
+ *                             if v > 0:
+ *                                 ad[c, j] += v
+ *                         elif only == -1:             # <<<<<<<<<<<<<<
+ *                             if v < 0:
+ *                                 ad[c, j] += v
+ */
+                  break;
+                  default:
+
+                  /* "sisl/_sparse.pyx":777
+ *                                 ad[c, j] += v
+ *                         else:
+ *                             ad[c, j] += v             # <<<<<<<<<<<<<<
+ * 
+ *     return A_PTR, A_COL, A_D
+ */
+                  __pyx_t_69 = __pyx_v_c;
+                  __pyx_t_70 = __pyx_v_j;
+                  *((float *) ( /* dim=1 */ ((char *) (((float *) ( /* dim=0 */ (__pyx_v_ad.data + __pyx_t_69 * __pyx_v_ad.strides[0]) )) + __pyx_t_70)) )) += __pyx_v_v;
+                  break;
+                }
+              }
+            }
+          }
+        }
+      }
+
+      /* "sisl/_sparse.pyx":745
+ * 
+ *     STAMP.fill(-1)
+ *     with nogil:             # <<<<<<<<<<<<<<
+ *         for ia in range(na):
+ *             # Gather the unique columns
+ */
+      /*finally:*/ {
+        /*normal exit:*/{
+          #ifdef WITH_THREAD
+          __Pyx_FastGIL_Forget();
+          Py_BLOCK_THREADS
+          #endif
+          goto __pyx_L15;
+        }
+        __pyx_L15:;
+      }
+  }
+
+  /* "sisl/_sparse.pyx":779
+ *                             ad[c, j] += v
+ * 
+ *     return A_PTR, A_COL, A_D             # <<<<<<<<<<<<<<
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_2 = PyTuple_New(3); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 779, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_INCREF(((PyObject *)__pyx_v_A_PTR));
+  __Pyx_GIVEREF(((PyObject *)__pyx_v_A_PTR));
+  PyTuple_SET_ITEM(__pyx_t_2, 0, ((PyObject *)__pyx_v_A_PTR));
+  __Pyx_INCREF(((PyObject *)__pyx_v_A_COL));
+  __Pyx_GIVEREF(((PyObject *)__pyx_v_A_COL));
+  PyTuple_SET_ITEM(__pyx_t_2, 1, ((PyObject *)__pyx_v_A_COL));
+  __Pyx_INCREF(__pyx_v_A_D);
+  __Pyx_GIVEREF(__pyx_v_A_D);
+  PyTuple_SET_ITEM(__pyx_t_2, 2, __pyx_v_A_D);
+  __pyx_r = __pyx_t_2;
+  __pyx_t_2 = 0;
+  goto __pyx_L0;
+
+  /* "sisl/_sparse.pyx":672
+ * @cython.initializedcheck(False)
+ * @cython.cdivision(True)
+ * def sparse_orb_to_atom(np.ndarray[np.int32_t, ndim=1, mode='c'] PTR,             # <<<<<<<<<<<<<<
+ *                        np.ndarray[np.int32_t, ndim=1, mode='c'] COL,
+ *                        _orb_real[:, ::1] D,
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __PYX_XDEC_MEMVIEW(&__pyx_t_1, 1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_6);
+  __PYX_XDEC_MEMVIEW(&__pyx_t_32, 1);
+  { PyObject *__pyx_type, *__pyx_value, *__pyx_tb;
+    __Pyx_PyThreadState_declare
+    __Pyx_PyThreadState_assign
+    __Pyx_ErrFetch(&__pyx_type, &__pyx_value, &__pyx_tb);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_A_COL.rcbuffer->pybuffer);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_A_PTR.rcbuffer->pybuffer);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_COL.rcbuffer->pybuffer);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_FIRSTO.rcbuffer->pybuffer);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_O2A.rcbuffer->pybuffer);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_POS.rcbuffer->pybuffer);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_PTR.rcbuffer->pybuffer);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_STAMP.rcbuffer->pybuffer);
+  __Pyx_ErrRestore(__pyx_type, __pyx_value, __pyx_tb);}
+  __Pyx_AddTraceback("sisl._sparse.sparse_orb_to_atom", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  goto __pyx_L2;
+  __pyx_L0:;
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_A_COL.rcbuffer->pybuffer);
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_A_PTR.rcbuffer->pybuffer);
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_COL.rcbuffer->pybuffer);
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_FIRSTO.rcbuffer->pybuffer);
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_O2A.rcbuffer->pybuffer);
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_POS.rcbuffer->pybuffer);
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_PTR.rcbuffer->pybuffer);
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_STAMP.rcbuffer->pybuffer);
+  __pyx_L2:;
+  __PYX_XDEC_MEMVIEW(&__pyx_v_ptr, 1);
+  __PYX_XDEC_MEMVIEW(&__pyx_v_col, 1);
+  __PYX_XDEC_MEMVIEW(&__pyx_v_firsto, 1);
+  __PYX_XDEC_MEMVIEW(&__pyx_v_o2a, 1);
+  __Pyx_XDECREF((PyObject *)__pyx_v_A_PTR);
+  __Pyx_XDECREF((PyObject *)__pyx_v_STAMP);
+  __Pyx_XDECREF((PyObject *)__pyx_v_POS);
+  __PYX_XDEC_MEMVIEW(&__pyx_v_aptr, 1);
+  __PYX_XDEC_MEMVIEW(&__pyx_v_stamp, 1);
+  __PYX_XDEC_MEMVIEW(&__pyx_v_pos, 1);
+  __Pyx_XDECREF((PyObject *)__pyx_v_A_COL);
+  __PYX_XDEC_MEMVIEW(&__pyx_v_acol, 1);
+  __Pyx_XDECREF(__pyx_v_A_D);
+  __PYX_XDEC_MEMVIEW(&__pyx_v_ad, 1);
+  __PYX_XDEC_MEMVIEW(&__pyx_v_D, 1);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* Python wrapper */
+static PyObject *__pyx_fuse_1__pyx_pw_4sisl_7_sparse_19sparse_orb_to_atom(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static PyMethodDef __pyx_fuse_1__pyx_mdef_4sisl_7_sparse_19sparse_orb_to_atom = {"__pyx_fuse_1sparse_orb_to_atom", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_fuse_1__pyx_pw_4sisl_7_sparse_19sparse_orb_to_atom, METH_VARARGS|METH_KEYWORDS, __pyx_doc_4sisl_7_sparse_14sparse_orb_to_atom};
+static PyObject *__pyx_fuse_1__pyx_pw_4sisl_7_sparse_19sparse_orb_to_atom(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyArrayObject *__pyx_v_PTR = 0;
+  PyArrayObject *__pyx_v_COL = 0;
+  __Pyx_memviewslice __pyx_v_D = { 0, 0, { 0 }, { 0 }, { 0 } };
+  PyArrayObject *__pyx_v_FIRSTO = 0;
+  PyArrayObject *__pyx_v_O2A = 0;
+  int __pyx_v_n_s;
+  int __pyx_v_only;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("sparse_orb_to_atom (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_PTR,&__pyx_n_s_COL,&__pyx_n_s_D,&__pyx_n_s_FIRSTO,&__pyx_n_s_O2A,&__pyx_n_s_n_s,&__pyx_n_s_only,0};
+    PyObject* values[7] = {0,0,0,0,0,0,0};
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case  7: values[6] = PyTuple_GET_ITEM(__pyx_args, 6);
+        CYTHON_FALLTHROUGH;
+        case  6: values[5] = PyTuple_GET_ITEM(__pyx_args, 5);
+        CYTHON_FALLTHROUGH;
+        case  5: values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
+        CYTHON_FALLTHROUGH;
+        case  4: values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+        CYTHON_FALLTHROUGH;
+        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        CYTHON_FALLTHROUGH;
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_PTR)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_COL)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("sparse_orb_to_atom", 1, 7, 7, 1); __PYX_ERR(0, 672, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  2:
+        if (likely((values[2] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_D)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("sparse_orb_to_atom", 1, 7, 7, 2); __PYX_ERR(0, 672, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  3:
+        if (likely((values[3] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_FIRSTO)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("sparse_orb_to_atom", 1, 7, 7, 3); __PYX_ERR(0, 672, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  4:
+        if (likely((values[4] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_O2A)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("sparse_orb_to_atom", 1, 7, 7, 4); __PYX_ERR(0, 672, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  5:
+        if (likely((values[5] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_n_s)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("sparse_orb_to_atom", 1, 7, 7, 5); __PYX_ERR(0, 672, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  6:
+        if (likely((values[6] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_only)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("sparse_orb_to_atom", 1, 7, 7, 6); __PYX_ERR(0, 672, __pyx_L3_error)
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "sparse_orb_to_atom") < 0)) __PYX_ERR(0, 672, __pyx_L3_error)
+      }
+    } else if (PyTuple_GET_SIZE(__pyx_args) != 7) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+      values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+      values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+      values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+      values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
+      values[5] = PyTuple_GET_ITEM(__pyx_args, 5);
+      values[6] = PyTuple_GET_ITEM(__pyx_args, 6);
+    }
+    __pyx_v_PTR = ((PyArrayObject *)values[0]);
+    __pyx_v_COL = ((PyArrayObject *)values[1]);
+    __pyx_v_D = __Pyx_PyObject_to_MemoryviewSlice_d_dc_double(values[2], PyBUF_WRITABLE); if (unlikely(!__pyx_v_D.memview)) __PYX_ERR(0, 674, __pyx_L3_error)
+    __pyx_v_FIRSTO = ((PyArrayObject *)values[3]);
+    __pyx_v_O2A = ((PyArrayObject *)values[4]);
+    __pyx_v_n_s = __Pyx_PyInt_As_int(values[5]); if (unlikely((__pyx_v_n_s == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 677, __pyx_L3_error)
+    __pyx_v_only = __Pyx_PyInt_As_int(values[6]); if (unlikely((__pyx_v_only == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 677, __pyx_L3_error)
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("sparse_orb_to_atom", 1, 7, 7, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 672, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("sisl._sparse.sparse_orb_to_atom", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_PTR), __pyx_ptype_5numpy_ndarray, 1, "PTR", 0))) __PYX_ERR(0, 672, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_COL), __pyx_ptype_5numpy_ndarray, 1, "COL", 0))) __PYX_ERR(0, 673, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_FIRSTO), __pyx_ptype_5numpy_ndarray, 1, "FIRSTO", 0))) __PYX_ERR(0, 675, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_O2A), __pyx_ptype_5numpy_ndarray, 1, "O2A", 0))) __PYX_ERR(0, 676, __pyx_L1_error)
+  __pyx_r = __pyx_pf_4sisl_7_sparse_18sparse_orb_to_atom(__pyx_self, __pyx_v_PTR, __pyx_v_COL, __pyx_v_D, __pyx_v_FIRSTO, __pyx_v_O2A, __pyx_v_n_s, __pyx_v_only);
+
+  /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_4sisl_7_sparse_18sparse_orb_to_atom(CYTHON_UNUSED PyObject *__pyx_self, PyArrayObject *__pyx_v_PTR, PyArrayObject *__pyx_v_COL, __Pyx_memviewslice __pyx_v_D, PyArrayObject *__pyx_v_FIRSTO, PyArrayObject *__pyx_v_O2A, int __pyx_v_n_s, int __pyx_v_only) {
+  __Pyx_memviewslice __pyx_v_ptr = { 0, 0, { 0 }, { 0 }, { 0 } };
+  __Pyx_memviewslice __pyx_v_col = { 0, 0, { 0 }, { 0 }, { 0 } };
+  __Pyx_memviewslice __pyx_v_firsto = { 0, 0, { 0 }, { 0 }, { 0 } };
+  __Pyx_memviewslice __pyx_v_o2a = { 0, 0, { 0 }, { 0 }, { 0 } };
+  int __pyx_v_na;
+  int __pyx_v_no;
+  int __pyx_v_nd;
+  int __pyx_v_nc;
+  PyArrayObject *__pyx_v_A_PTR = 0;
+  PyArrayObject *__pyx_v_STAMP = 0;
+  PyArrayObject *__pyx_v_POS = 0;
+  __Pyx_memviewslice __pyx_v_aptr = { 0, 0, { 0 }, { 0 }, { 0 } };
+  __Pyx_memviewslice __pyx_v_stamp = { 0, 0, { 0 }, { 0 }, { 0 } };
+  __Pyx_memviewslice __pyx_v_pos = { 0, 0, { 0 }, { 0 }, { 0 } };
+  int __pyx_v_ia;
+  int __pyx_v_io;
+  int __pyx_v_i;
+  int __pyx_v_j;
+  int __pyx_v_c;
+  int __pyx_v_n;
+  PyArrayObject *__pyx_v_A_COL = 0;
+  __Pyx_memviewslice __pyx_v_acol = { 0, 0, { 0 }, { 0 }, { 0 } };
+  PyObject *__pyx_v_A_D = NULL;
+  __Pyx_memviewslice __pyx_v_ad = { 0, 0, { 0 }, { 0 }, { 0 } };
+  double __pyx_v_v;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_A_COL;
+  __Pyx_Buffer __pyx_pybuffer_A_COL;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_A_PTR;
+  __Pyx_Buffer __pyx_pybuffer_A_PTR;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_COL;
+  __Pyx_Buffer __pyx_pybuffer_COL;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_FIRSTO;
+  __Pyx_Buffer __pyx_pybuffer_FIRSTO;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_O2A;
+  __Pyx_Buffer __pyx_pybuffer_O2A;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_POS;
+  __Pyx_Buffer __pyx_pybuffer_POS;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_PTR;
+  __Pyx_Buffer __pyx_pybuffer_PTR;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_STAMP;
+  __Pyx_Buffer __pyx_pybuffer_STAMP;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  __Pyx_memviewslice __pyx_t_1 = { 0, 0, { 0 }, { 0 }, { 0 } };
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  PyObject *__pyx_t_6 = NULL;
+  PyArrayObject *__pyx_t_7 = NULL;
+  PyArrayObject *__pyx_t_8 = NULL;
+  PyArrayObject *__pyx_t_9 = NULL;
+  int __pyx_t_10;
+  int __pyx_t_11;
+  int __pyx_t_12;
+  Py_ssize_t __pyx_t_13;
+  Py_ssize_t __pyx_t_14;
+  int __pyx_t_15;
+  Py_ssize_t __pyx_t_16;
+  int __pyx_t_17;
+  int __pyx_t_18;
+  Py_ssize_t __pyx_t_19;
+  int __pyx_t_20;
+  Py_ssize_t __pyx_t_21;
+  int __pyx_t_22;
+  int __pyx_t_23;
+  Py_ssize_t __pyx_t_24;
+  Py_ssize_t __pyx_t_25;
+  Py_ssize_t __pyx_t_26;
+  Py_ssize_t __pyx_t_27;
+  int __pyx_t_28;
+  Py_ssize_t __pyx_t_29;
+  Py_ssize_t __pyx_t_30;
+  PyArrayObject *__pyx_t_31 = NULL;
+  __Pyx_memviewslice __pyx_t_32 = { 0, 0, { 0 }, { 0 }, { 0 } };
+  Py_ssize_t __pyx_t_33;
+  Py_ssize_t __pyx_t_34;
+  Py_ssize_t __pyx_t_35;
+  Py_ssize_t __pyx_t_36;
+  Py_ssize_t __pyx_t_37;
+  Py_ssize_t __pyx_t_38;
+  Py_ssize_t __pyx_t_39;
+  Py_ssize_t __pyx_t_40;
+  Py_ssize_t __pyx_t_41;
+  Py_ssize_t __pyx_t_42;
+  Py_ssize_t __pyx_t_43;
+  Py_ssize_t __pyx_t_44;
+  Py_ssize_t __pyx_t_45;
+  Py_ssize_t __pyx_t_46;
+  Py_ssize_t __pyx_t_47;
+  Py_ssize_t __pyx_t_48;
+  Py_ssize_t __pyx_t_49;
+  Py_ssize_t __pyx_t_50;
+  Py_ssize_t __pyx_t_51;
+  Py_ssize_t __pyx_t_52;
+  Py_ssize_t __pyx_t_53;
+  Py_ssize_t __pyx_t_54;
+  Py_ssize_t __pyx_t_55;
+  Py_ssize_t __pyx_t_56;
+  Py_ssize_t __pyx_t_57;
+  Py_ssize_t __pyx_t_58;
+  Py_ssize_t __pyx_t_59;
+  int __pyx_t_60;
+  int __pyx_t_61;
+  int __pyx_t_62;
+  Py_ssize_t __pyx_t_63;
+  Py_ssize_t __pyx_t_64;
+  Py_ssize_t __pyx_t_65;
+  Py_ssize_t __pyx_t_66;
+  Py_ssize_t __pyx_t_67;
+  Py_ssize_t __pyx_t_68;
+  Py_ssize_t __pyx_t_69;
+  Py_ssize_t __pyx_t_70;
+  __Pyx_RefNannySetupContext("__pyx_fuse_1sparse_orb_to_atom", 0);
+  __pyx_pybuffer_A_PTR.pybuffer.buf = NULL;
+  __pyx_pybuffer_A_PTR.refcount = 0;
+  __pyx_pybuffernd_A_PTR.data = NULL;
+  __pyx_pybuffernd_A_PTR.rcbuffer = &__pyx_pybuffer_A_PTR;
+  __pyx_pybuffer_STAMP.pybuffer.buf = NULL;
+  __pyx_pybuffer_STAMP.refcount = 0;
+  __pyx_pybuffernd_STAMP.data = NULL;
+  __pyx_pybuffernd_STAMP.rcbuffer = &__pyx_pybuffer_STAMP;
+  __pyx_pybuffer_POS.pybuffer.buf = NULL;
+  __pyx_pybuffer_POS.refcount = 0;
+  __pyx_pybuffernd_POS.data = NULL;
+  __pyx_pybuffernd_POS.rcbuffer = &__pyx_pybuffer_POS;
+  __pyx_pybuffer_A_COL.pybuffer.buf = NULL;
+  __pyx_pybuffer_A_COL.refcount = 0;
+  __pyx_pybuffernd_A_COL.data = NULL;
+  __pyx_pybuffernd_A_COL.rcbuffer = &__pyx_pybuffer_A_COL;
+  __pyx_pybuffer_PTR.pybuffer.buf = NULL;
+  __pyx_pybuffer_PTR.refcount = 0;
+  __pyx_pybuffernd_PTR.data = NULL;
+  __pyx_pybuffernd_PTR.rcbuffer = &__pyx_pybuffer_PTR;
+  __pyx_pybuffer_COL.pybuffer.buf = NULL;
+  __pyx_pybuffer_COL.refcount = 0;
+  __pyx_pybuffernd_COL.data = NULL;
+  __pyx_pybuffernd_COL.rcbuffer = &__pyx_pybuffer_COL;
+  __pyx_pybuffer_FIRSTO.pybuffer.buf = NULL;
+  __pyx_pybuffer_FIRSTO.refcount = 0;
+  __pyx_pybuffernd_FIRSTO.data = NULL;
+  __pyx_pybuffernd_FIRSTO.rcbuffer = &__pyx_pybuffer_FIRSTO;
+  __pyx_pybuffer_O2A.pybuffer.buf = NULL;
+  __pyx_pybuffer_O2A.refcount = 0;
+  __pyx_pybuffernd_O2A.data = NULL;
+  __pyx_pybuffernd_O2A.rcbuffer = &__pyx_pybuffer_O2A;
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_PTR.rcbuffer->pybuffer, (PyObject*)__pyx_v_PTR, &__Pyx_TypeInfo_nn___pyx_t_5numpy_int32_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 672, __pyx_L1_error)
+  }
+  __pyx_pybuffernd_PTR.diminfo[0].strides = __pyx_pybuffernd_PTR.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_PTR.diminfo[0].shape = __pyx_pybuffernd_PTR.rcbuffer->pybuffer.shape[0];
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_COL.rcbuffer->pybuffer, (PyObject*)__pyx_v_COL, &__Pyx_TypeInfo_nn___pyx_t_5numpy_int32_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 672, __pyx_L1_error)
+  }
+  __pyx_pybuffernd_COL.diminfo[0].strides = __pyx_pybuffernd_COL.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_COL.diminfo[0].shape = __pyx_pybuffernd_COL.rcbuffer->pybuffer.shape[0];
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_FIRSTO.rcbuffer->pybuffer, (PyObject*)__pyx_v_FIRSTO, &__Pyx_TypeInfo_nn___pyx_t_5numpy_int32_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 672, __pyx_L1_error)
+  }
+  __pyx_pybuffernd_FIRSTO.diminfo[0].strides = __pyx_pybuffernd_FIRSTO.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_FIRSTO.diminfo[0].shape = __pyx_pybuffernd_FIRSTO.rcbuffer->pybuffer.shape[0];
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_O2A.rcbuffer->pybuffer, (PyObject*)__pyx_v_O2A, &__Pyx_TypeInfo_nn___pyx_t_5numpy_int32_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 672, __pyx_L1_error)
+  }
+  __pyx_pybuffernd_O2A.diminfo[0].strides = __pyx_pybuffernd_O2A.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_O2A.diminfo[0].shape = __pyx_pybuffernd_O2A.rcbuffer->pybuffer.shape[0];
+
+  /* "sisl/_sparse.pyx":704
+ *     data : the atomic data, ``data[i, :]`` corresponds to ``D[i, :]``
+ *     """
+ *     cdef int[::1] ptr = PTR             # <<<<<<<<<<<<<<
+ *     cdef int[::1] col = COL
+ *     cdef int[::1] firsto = FIRSTO
+ */
+  __pyx_t_1 = __Pyx_PyObject_to_MemoryviewSlice_dc_int(((PyObject *)__pyx_v_PTR), PyBUF_WRITABLE); if (unlikely(!__pyx_t_1.memview)) __PYX_ERR(0, 704, __pyx_L1_error)
+  __pyx_v_ptr = __pyx_t_1;
+  __pyx_t_1.memview = NULL;
+  __pyx_t_1.data = NULL;
+
+  /* "sisl/_sparse.pyx":705
+ *     """
+ *     cdef int[::1] ptr = PTR
+ *     cdef int[::1] col = COL             # <<<<<<<<<<<<<<
+ *     cdef int[::1] firsto = FIRSTO
+ *     cdef int[::1] o2a = O2A
+ */
+  __pyx_t_1 = __Pyx_PyObject_to_MemoryviewSlice_dc_int(((PyObject *)__pyx_v_COL), PyBUF_WRITABLE); if (unlikely(!__pyx_t_1.memview)) __PYX_ERR(0, 705, __pyx_L1_error)
+  __pyx_v_col = __pyx_t_1;
+  __pyx_t_1.memview = NULL;
+  __pyx_t_1.data = NULL;
+
+  /* "sisl/_sparse.pyx":706
+ *     cdef int[::1] ptr = PTR
+ *     cdef int[::1] col = COL
+ *     cdef int[::1] firsto = FIRSTO             # <<<<<<<<<<<<<<
+ *     cdef int[::1] o2a = O2A
+ *     cdef int na = firsto.shape[0] - 1
+ */
+  __pyx_t_1 = __Pyx_PyObject_to_MemoryviewSlice_dc_int(((PyObject *)__pyx_v_FIRSTO), PyBUF_WRITABLE); if (unlikely(!__pyx_t_1.memview)) __PYX_ERR(0, 706, __pyx_L1_error)
+  __pyx_v_firsto = __pyx_t_1;
+  __pyx_t_1.memview = NULL;
+  __pyx_t_1.data = NULL;
+
+  /* "sisl/_sparse.pyx":707
+ *     cdef int[::1] col = COL
+ *     cdef int[::1] firsto = FIRSTO
+ *     cdef int[::1] o2a = O2A             # <<<<<<<<<<<<<<
+ *     cdef int na = firsto.shape[0] - 1
+ *     cdef int no = o2a.shape[0]
+ */
+  __pyx_t_1 = __Pyx_PyObject_to_MemoryviewSlice_dc_int(((PyObject *)__pyx_v_O2A), PyBUF_WRITABLE); if (unlikely(!__pyx_t_1.memview)) __PYX_ERR(0, 707, __pyx_L1_error)
+  __pyx_v_o2a = __pyx_t_1;
+  __pyx_t_1.memview = NULL;
+  __pyx_t_1.data = NULL;
+
+  /* "sisl/_sparse.pyx":708
+ *     cdef int[::1] firsto = FIRSTO
+ *     cdef int[::1] o2a = O2A
+ *     cdef int na = firsto.shape[0] - 1             # <<<<<<<<<<<<<<
+ *     cdef int no = o2a.shape[0]
+ *     cdef int nd = D.shape[0]
+ */
+  __pyx_v_na = ((__pyx_v_firsto.shape[0]) - 1);
+
+  /* "sisl/_sparse.pyx":709
+ *     cdef int[::1] o2a = O2A
+ *     cdef int na = firsto.shape[0] - 1
+ *     cdef int no = o2a.shape[0]             # <<<<<<<<<<<<<<
+ *     cdef int nd = D.shape[0]
+ *     cdef int nc = na * n_s
+ */
+  __pyx_v_no = (__pyx_v_o2a.shape[0]);
+
+  /* "sisl/_sparse.pyx":710
+ *     cdef int na = firsto.shape[0] - 1
+ *     cdef int no = o2a.shape[0]
+ *     cdef int nd = D.shape[0]             # <<<<<<<<<<<<<<
+ *     cdef int nc = na * n_s
+ * 
+ */
+  __pyx_v_nd = (__pyx_v_D.shape[0]);
+
+  /* "sisl/_sparse.pyx":711
+ *     cdef int no = o2a.shape[0]
+ *     cdef int nd = D.shape[0]
+ *     cdef int nc = na * n_s             # <<<<<<<<<<<<<<
+ * 
+ *     cdef np.ndarray[np.int32_t, ndim=1, mode='c'] A_PTR = np.empty([na + 1], dtype=np.int32)
+ */
+  __pyx_v_nc = (__pyx_v_na * __pyx_v_n_s);
+
+  /* "sisl/_sparse.pyx":713
+ *     cdef int nc = na * n_s
+ * 
+ *     cdef np.ndarray[np.int32_t, ndim=1, mode='c'] A_PTR = np.empty([na + 1], dtype=np.int32)             # <<<<<<<<<<<<<<
+ *     cdef np.ndarray[np.int32_t, ndim=1, mode='c'] STAMP = np.full([nc], -1, dtype=np.int32)
+ *     cdef np.ndarray[np.int32_t, ndim=1, mode='c'] POS = np.empty([nc], dtype=np.int32)
+ */
+  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_np); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 713, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_empty); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 713, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_2 = __Pyx_PyInt_From_long((__pyx_v_na + 1)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 713, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_4 = PyList_New(1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 713, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_GIVEREF(__pyx_t_2);
+  PyList_SET_ITEM(__pyx_t_4, 0, __pyx_t_2);
+  __pyx_t_2 = 0;
+  __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 713, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_GIVEREF(__pyx_t_4);
+  PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_t_4);
+  __pyx_t_4 = 0;
+  __pyx_t_4 = __Pyx_PyDict_NewPresized(1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 713, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_GetModuleGlobalName(__pyx_t_5, __pyx_n_s_np); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 713, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_t_5, __pyx_n_s_int32); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 713, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  if (PyDict_SetItem(__pyx_t_4, __pyx_n_s_dtype, __pyx_t_6) < 0) __PYX_ERR(0, 713, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  __pyx_t_6 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_t_2, __pyx_t_4); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 713, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  if (!(likely(((__pyx_t_6) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_6, __pyx_ptype_5numpy_ndarray))))) __PYX_ERR(0, 713, __pyx_L1_error)
+  __pyx_t_7 = ((PyArrayObject *)__pyx_t_6);
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_A_PTR.rcbuffer->pybuffer, (PyObject*)__pyx_t_7, &__Pyx_TypeInfo_nn___pyx_t_5numpy_int32_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) {
+      __pyx_v_A_PTR = ((PyArrayObject *)Py_None); __Pyx_INCREF(Py_None); __pyx_pybuffernd_A_PTR.rcbuffer->pybuffer.buf = NULL;
+      __PYX_ERR(0, 713, __pyx_L1_error)
+    } else {__pyx_pybuffernd_A_PTR.diminfo[0].strides = __pyx_pybuffernd_A_PTR.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_A_PTR.diminfo[0].shape = __pyx_pybuffernd_A_PTR.rcbuffer->pybuffer.shape[0];
+    }
+  }
+  __pyx_t_7 = 0;
+  __pyx_v_A_PTR = ((PyArrayObject *)__pyx_t_6);
+  __pyx_t_6 = 0;
+
+  /* "sisl/_sparse.pyx":714
+ * 
+ *     cdef np.ndarray[np.int32_t, ndim=1, mode='c'] A_PTR = np.empty([na + 1], dtype=np.int32)
+ *     cdef np.ndarray[np.int32_t, ndim=1, mode='c'] STAMP = np.full([nc], -1, dtype=np.int32)             # <<<<<<<<<<<<<<
+ *     cdef np.ndarray[np.int32_t, ndim=1, mode='c'] POS = np.empty([nc], dtype=np.int32)
+ *     cdef int[::1] aptr = A_PTR
+ */
+  __Pyx_GetModuleGlobalName(__pyx_t_6, __pyx_n_s_np); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 714, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_t_6, __pyx_n_s_full); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 714, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  __pyx_t_6 = __Pyx_PyInt_From_int(__pyx_v_nc); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 714, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __pyx_t_2 = PyList_New(1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 714, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_GIVEREF(__pyx_t_6);
+  PyList_SET_ITEM(__pyx_t_2, 0, __pyx_t_6);
+  __pyx_t_6 = 0;
+  __pyx_t_6 = PyTuple_New(2); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 714, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_GIVEREF(__pyx_t_2);
+  PyTuple_SET_ITEM(__pyx_t_6, 0, __pyx_t_2);
+  __Pyx_INCREF(__pyx_int_neg_1);
+  __Pyx_GIVEREF(__pyx_int_neg_1);
+  PyTuple_SET_ITEM(__pyx_t_6, 1, __pyx_int_neg_1);
+  __pyx_t_2 = 0;
+  __pyx_t_2 = __Pyx_PyDict_NewPresized(1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 714, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_n_s_np); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 714, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_n_s_int32); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 714, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  if (PyDict_SetItem(__pyx_t_2, __pyx_n_s_dtype, __pyx_t_5) < 0) __PYX_ERR(0, 714, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __pyx_t_5 = __Pyx_PyObject_Call(__pyx_t_4, __pyx_t_6, __pyx_t_2); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 714, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  if (!(likely(((__pyx_t_5) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_5, __pyx_ptype_5numpy_ndarray))))) __PYX_ERR(0, 714, __pyx_L1_error)
+  __pyx_t_8 = ((PyArrayObject *)__pyx_t_5);
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_STAMP.rcbuffer->pybuffer, (PyObject*)__pyx_t_8, &__Pyx_TypeInfo_nn___pyx_t_5numpy_int32_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) {
+      __pyx_v_STAMP = ((PyArrayObject *)Py_None); __Pyx_INCREF(Py_None); __pyx_pybuffernd_STAMP.rcbuffer->pybuffer.buf = NULL;
+      __PYX_ERR(0, 714, __pyx_L1_error)
+    } else {__pyx_pybuffernd_STAMP.diminfo[0].strides = __pyx_pybuffernd_STAMP.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_STAMP.diminfo[0].shape = __pyx_pybuffernd_STAMP.rcbuffer->pybuffer.shape[0];
+    }
+  }
+  __pyx_t_8 = 0;
+  __pyx_v_STAMP = ((PyArrayObject *)__pyx_t_5);
+  __pyx_t_5 = 0;
+
+  /* "sisl/_sparse.pyx":715
+ *     cdef np.ndarray[np.int32_t, ndim=1, mode='c'] A_PTR = np.empty([na + 1], dtype=np.int32)
+ *     cdef np.ndarray[np.int32_t, ndim=1, mode='c'] STAMP = np.full([nc], -1, dtype=np.int32)
+ *     cdef np.ndarray[np.int32_t, ndim=1, mode='c'] POS = np.empty([nc], dtype=np.int32)             # <<<<<<<<<<<<<<
+ *     cdef int[::1] aptr = A_PTR
+ *     cdef int[::1] stamp = STAMP
+ */
+  __Pyx_GetModuleGlobalName(__pyx_t_5, __pyx_n_s_np); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 715, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_t_5, __pyx_n_s_empty); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 715, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __pyx_t_5 = __Pyx_PyInt_From_int(__pyx_v_nc); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 715, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __pyx_t_6 = PyList_New(1); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 715, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_GIVEREF(__pyx_t_5);
+  PyList_SET_ITEM(__pyx_t_6, 0, __pyx_t_5);
+  __pyx_t_5 = 0;
+  __pyx_t_5 = PyTuple_New(1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 715, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_GIVEREF(__pyx_t_6);
+  PyTuple_SET_ITEM(__pyx_t_5, 0, __pyx_t_6);
+  __pyx_t_6 = 0;
+  __pyx_t_6 = __Pyx_PyDict_NewPresized(1); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 715, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_GetModuleGlobalName(__pyx_t_4, __pyx_n_s_np); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 715, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_4, __pyx_n_s_int32); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 715, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  if (PyDict_SetItem(__pyx_t_6, __pyx_n_s_dtype, __pyx_t_3) < 0) __PYX_ERR(0, 715, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_t_3 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_t_5, __pyx_t_6); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 715, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  if (!(likely(((__pyx_t_3) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_3, __pyx_ptype_5numpy_ndarray))))) __PYX_ERR(0, 715, __pyx_L1_error)
+  __pyx_t_9 = ((PyArrayObject *)__pyx_t_3);
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_POS.rcbuffer->pybuffer, (PyObject*)__pyx_t_9, &__Pyx_TypeInfo_nn___pyx_t_5numpy_int32_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) {
+      __pyx_v_POS = ((PyArrayObject *)Py_None); __Pyx_INCREF(Py_None); __pyx_pybuffernd_POS.rcbuffer->pybuffer.buf = NULL;
+      __PYX_ERR(0, 715, __pyx_L1_error)
+    } else {__pyx_pybuffernd_POS.diminfo[0].strides = __pyx_pybuffernd_POS.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_POS.diminfo[0].shape = __pyx_pybuffernd_POS.rcbuffer->pybuffer.shape[0];
+    }
+  }
+  __pyx_t_9 = 0;
+  __pyx_v_POS = ((PyArrayObject *)__pyx_t_3);
+  __pyx_t_3 = 0;
+
+  /* "sisl/_sparse.pyx":716
+ *     cdef np.ndarray[np.int32_t, ndim=1, mode='c'] STAMP = np.full([nc], -1, dtype=np.int32)
+ *     cdef np.ndarray[np.int32_t, ndim=1, mode='c'] POS = np.empty([nc], dtype=np.int32)
+ *     cdef int[::1] aptr = A_PTR             # <<<<<<<<<<<<<<
+ *     cdef int[::1] stamp = STAMP
+ *     cdef int[::1] pos = POS
+ */
+  __pyx_t_1 = __Pyx_PyObject_to_MemoryviewSlice_dc_int(((PyObject *)__pyx_v_A_PTR), PyBUF_WRITABLE); if (unlikely(!__pyx_t_1.memview)) __PYX_ERR(0, 716, __pyx_L1_error)
+  __pyx_v_aptr = __pyx_t_1;
+  __pyx_t_1.memview = NULL;
+  __pyx_t_1.data = NULL;
+
+  /* "sisl/_sparse.pyx":717
+ *     cdef np.ndarray[np.int32_t, ndim=1, mode='c'] POS = np.empty([nc], dtype=np.int32)
+ *     cdef int[::1] aptr = A_PTR
+ *     cdef int[::1] stamp = STAMP             # <<<<<<<<<<<<<<
+ *     cdef int[::1] pos = POS
+ * 
+ */
+  __pyx_t_1 = __Pyx_PyObject_to_MemoryviewSlice_dc_int(((PyObject *)__pyx_v_STAMP), PyBUF_WRITABLE); if (unlikely(!__pyx_t_1.memview)) __PYX_ERR(0, 717, __pyx_L1_error)
+  __pyx_v_stamp = __pyx_t_1;
+  __pyx_t_1.memview = NULL;
+  __pyx_t_1.data = NULL;
+
+  /* "sisl/_sparse.pyx":718
+ *     cdef int[::1] aptr = A_PTR
+ *     cdef int[::1] stamp = STAMP
+ *     cdef int[::1] pos = POS             # <<<<<<<<<<<<<<
+ * 
+ *     cdef int ia, io, i, j, c, n
+ */
+  __pyx_t_1 = __Pyx_PyObject_to_MemoryviewSlice_dc_int(((PyObject *)__pyx_v_POS), PyBUF_WRITABLE); if (unlikely(!__pyx_t_1.memview)) __PYX_ERR(0, 718, __pyx_L1_error)
+  __pyx_v_pos = __pyx_t_1;
+  __pyx_t_1.memview = NULL;
+  __pyx_t_1.data = NULL;
+
+  /* "sisl/_sparse.pyx":723
+ * 
+ *     # Count the number of unique atomic columns per atom
+ *     n = 0             # <<<<<<<<<<<<<<
+ *     with nogil:
+ *         for ia in range(na):
+ */
+  __pyx_v_n = 0;
+
+  /* "sisl/_sparse.pyx":724
+ *     # Count the number of unique atomic columns per atom
+ *     n = 0
+ *     with nogil:             # <<<<<<<<<<<<<<
+ *         for ia in range(na):
+ *             aptr[ia] = n
+ */
+  {
+      #ifdef WITH_THREAD
+      PyThreadState *_save;
+      Py_UNBLOCK_THREADS
+      __Pyx_FastGIL_Remember();
+      #endif
+      /*try:*/ {
+
+        /* "sisl/_sparse.pyx":725
+ *     n = 0
+ *     with nogil:
+ *         for ia in range(na):             # <<<<<<<<<<<<<<
+ *             aptr[ia] = n
+ *             for io in range(firsto[ia], firsto[ia + 1]):
+ */
+        __pyx_t_10 = __pyx_v_na;
+        __pyx_t_11 = __pyx_t_10;
+        for (__pyx_t_12 = 0; __pyx_t_12 < __pyx_t_11; __pyx_t_12+=1) {
+          __pyx_v_ia = __pyx_t_12;
+
+          /* "sisl/_sparse.pyx":726
+ *     with nogil:
+ *         for ia in range(na):
+ *             aptr[ia] = n             # <<<<<<<<<<<<<<
+ *             for io in range(firsto[ia], firsto[ia + 1]):
+ *                 for i in range(ptr[io], ptr[io + 1]):
+ */
+          __pyx_t_13 = __pyx_v_ia;
+          *((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_aptr.data) + __pyx_t_13)) )) = __pyx_v_n;
+
+          /* "sisl/_sparse.pyx":727
+ *         for ia in range(na):
+ *             aptr[ia] = n
+ *             for io in range(firsto[ia], firsto[ia + 1]):             # <<<<<<<<<<<<<<
+ *                 for i in range(ptr[io], ptr[io + 1]):
+ *                     c = (o2a[col[i] % no] + (col[i] / no) * na) % nc
+ */
+          __pyx_t_14 = (__pyx_v_ia + 1);
+          __pyx_t_15 = (*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_firsto.data) + __pyx_t_14)) )));
+          __pyx_t_16 = __pyx_v_ia;
+          __pyx_t_17 = __pyx_t_15;
+          for (__pyx_t_18 = (*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_firsto.data) + __pyx_t_16)) ))); __pyx_t_18 < __pyx_t_17; __pyx_t_18+=1) {
+            __pyx_v_io = __pyx_t_18;
+
+            /* "sisl/_sparse.pyx":728
+ *             aptr[ia] = n
+ *             for io in range(firsto[ia], firsto[ia + 1]):
+ *                 for i in range(ptr[io], ptr[io + 1]):             # <<<<<<<<<<<<<<
+ *                     c = (o2a[col[i] % no] + (col[i] / no) * na) % nc
+ *                     if stamp[c] != ia:
+ */
+            __pyx_t_19 = (__pyx_v_io + 1);
+            __pyx_t_20 = (*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_ptr.data) + __pyx_t_19)) )));
+            __pyx_t_21 = __pyx_v_io;
+            __pyx_t_22 = __pyx_t_20;
+            for (__pyx_t_23 = (*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_ptr.data) + __pyx_t_21)) ))); __pyx_t_23 < __pyx_t_22; __pyx_t_23+=1) {
+              __pyx_v_i = __pyx_t_23;
+
+              /* "sisl/_sparse.pyx":729
+ *             for io in range(firsto[ia], firsto[ia + 1]):
+ *                 for i in range(ptr[io], ptr[io + 1]):
+ *                     c = (o2a[col[i] % no] + (col[i] / no) * na) % nc             # <<<<<<<<<<<<<<
+ *                     if stamp[c] != ia:
+ *                         stamp[c] = ia
+ */
+              __pyx_t_24 = __pyx_v_i;
+              __pyx_t_25 = ((*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_col.data) + __pyx_t_24)) ))) % __pyx_v_no);
+              __pyx_t_26 = __pyx_v_i;
+              __pyx_v_c = (((*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_o2a.data) + __pyx_t_25)) ))) + (((*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_col.data) + __pyx_t_26)) ))) / __pyx_v_no) * __pyx_v_na)) % __pyx_v_nc);
+
+              /* "sisl/_sparse.pyx":730
+ *                 for i in range(ptr[io], ptr[io + 1]):
+ *                     c = (o2a[col[i] % no] + (col[i] / no) * na) % nc
+ *                     if stamp[c] != ia:             # <<<<<<<<<<<<<<
+ *                         stamp[c] = ia
+ *                         n += 1
+ */
+              __pyx_t_27 = __pyx_v_c;
+              __pyx_t_28 = (((*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_stamp.data) + __pyx_t_27)) ))) != __pyx_v_ia) != 0);
+              if (__pyx_t_28) {
+
+                /* "sisl/_sparse.pyx":731
+ *                     c = (o2a[col[i] % no] + (col[i] / no) * na) % nc
+ *                     if stamp[c] != ia:
+ *                         stamp[c] = ia             # <<<<<<<<<<<<<<
+ *                         n += 1
+ *         aptr[na] = n
+ */
+                __pyx_t_29 = __pyx_v_c;
+                *((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_stamp.data) + __pyx_t_29)) )) = __pyx_v_ia;
+
+                /* "sisl/_sparse.pyx":732
+ *                     if stamp[c] != ia:
+ *                         stamp[c] = ia
+ *                         n += 1             # <<<<<<<<<<<<<<
+ *         aptr[na] = n
+ * 
+ */
+                __pyx_v_n = (__pyx_v_n + 1);
+
+                /* "sisl/_sparse.pyx":730
+ *                 for i in range(ptr[io], ptr[io + 1]):
+ *                     c = (o2a[col[i] % no] + (col[i] / no) * na) % nc
+ *                     if stamp[c] != ia:             # <<<<<<<<<<<<<<
+ *                         stamp[c] = ia
+ *                         n += 1
+ */
+              }
+            }
+          }
+        }
+
+        /* "sisl/_sparse.pyx":733
+ *                         stamp[c] = ia
+ *                         n += 1
+ *         aptr[na] = n             # <<<<<<<<<<<<<<
+ * 
+ *     cdef np.ndarray[np.int32_t, ndim=1, mode='c'] A_COL = np.empty([n], dtype=np.int32)
+ */
+        __pyx_t_30 = __pyx_v_na;
+        *((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_aptr.data) + __pyx_t_30)) )) = __pyx_v_n;
+      }
+
+      /* "sisl/_sparse.pyx":724
+ *     # Count the number of unique atomic columns per atom
+ *     n = 0
+ *     with nogil:             # <<<<<<<<<<<<<<
+ *         for ia in range(na):
+ *             aptr[ia] = n
+ */
+      /*finally:*/ {
+        /*normal exit:*/{
+          #ifdef WITH_THREAD
+          __Pyx_FastGIL_Forget();
+          Py_BLOCK_THREADS
+          #endif
+          goto __pyx_L5;
+        }
+        __pyx_L5:;
+      }
+  }
+
+  /* "sisl/_sparse.pyx":735
+ *         aptr[na] = n
+ * 
+ *     cdef np.ndarray[np.int32_t, ndim=1, mode='c'] A_COL = np.empty([n], dtype=np.int32)             # <<<<<<<<<<<<<<
+ *     cdef int[::1] acol = A_COL
+ *     if _orb_real is float:
+ */
+  __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_n_s_np); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 735, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_n_s_empty); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 735, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_t_3 = __Pyx_PyInt_From_int(__pyx_v_n); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 735, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_5 = PyList_New(1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 735, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_GIVEREF(__pyx_t_3);
+  PyList_SET_ITEM(__pyx_t_5, 0, __pyx_t_3);
+  __pyx_t_3 = 0;
+  __pyx_t_3 = PyTuple_New(1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 735, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_GIVEREF(__pyx_t_5);
+  PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_t_5);
+  __pyx_t_5 = 0;
+  __pyx_t_5 = __Pyx_PyDict_NewPresized(1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 735, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_np); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 735, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_int32); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 735, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  if (PyDict_SetItem(__pyx_t_5, __pyx_n_s_dtype, __pyx_t_4) < 0) __PYX_ERR(0, 735, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_t_4 = __Pyx_PyObject_Call(__pyx_t_6, __pyx_t_3, __pyx_t_5); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 735, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  if (!(likely(((__pyx_t_4) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_4, __pyx_ptype_5numpy_ndarray))))) __PYX_ERR(0, 735, __pyx_L1_error)
+  __pyx_t_31 = ((PyArrayObject *)__pyx_t_4);
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_A_COL.rcbuffer->pybuffer, (PyObject*)__pyx_t_31, &__Pyx_TypeInfo_nn___pyx_t_5numpy_int32_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) {
+      __pyx_v_A_COL = ((PyArrayObject *)Py_None); __Pyx_INCREF(Py_None); __pyx_pybuffernd_A_COL.rcbuffer->pybuffer.buf = NULL;
+      __PYX_ERR(0, 735, __pyx_L1_error)
+    } else {__pyx_pybuffernd_A_COL.diminfo[0].strides = __pyx_pybuffernd_A_COL.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_A_COL.diminfo[0].shape = __pyx_pybuffernd_A_COL.rcbuffer->pybuffer.shape[0];
+    }
+  }
+  __pyx_t_31 = 0;
+  __pyx_v_A_COL = ((PyArrayObject *)__pyx_t_4);
+  __pyx_t_4 = 0;
+
+  /* "sisl/_sparse.pyx":736
+ * 
+ *     cdef np.ndarray[np.int32_t, ndim=1, mode='c'] A_COL = np.empty([n], dtype=np.int32)
+ *     cdef int[::1] acol = A_COL             # <<<<<<<<<<<<<<
+ *     if _orb_real is float:
+ *         A_D = np.zeros([nd, n], dtype=np.float32)
+ */
+  __pyx_t_1 = __Pyx_PyObject_to_MemoryviewSlice_dc_int(((PyObject *)__pyx_v_A_COL), PyBUF_WRITABLE); if (unlikely(!__pyx_t_1.memview)) __PYX_ERR(0, 736, __pyx_L1_error)
+  __pyx_v_acol = __pyx_t_1;
+  __pyx_t_1.memview = NULL;
+  __pyx_t_1.data = NULL;
+
+  /* "sisl/_sparse.pyx":740
+ *         A_D = np.zeros([nd, n], dtype=np.float32)
+ *     else:
+ *         A_D = np.zeros([nd, n], dtype=np.float64)             # <<<<<<<<<<<<<<
+ *     cdef _orb_real[:, ::1] ad = A_D
+ *     cdef _orb_real v
+ */
+  __Pyx_GetModuleGlobalName(__pyx_t_4, __pyx_n_s_np); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 740, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_4, __pyx_n_s_zeros); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 740, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_t_4 = __Pyx_PyInt_From_int(__pyx_v_nd); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 740, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_3 = __Pyx_PyInt_From_int(__pyx_v_n); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 740, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_6 = PyList_New(2); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 740, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_GIVEREF(__pyx_t_4);
+  PyList_SET_ITEM(__pyx_t_6, 0, __pyx_t_4);
+  __Pyx_GIVEREF(__pyx_t_3);
+  PyList_SET_ITEM(__pyx_t_6, 1, __pyx_t_3);
+  __pyx_t_4 = 0;
+  __pyx_t_3 = 0;
+  __pyx_t_3 = PyTuple_New(1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 740, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_GIVEREF(__pyx_t_6);
+  PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_t_6);
+  __pyx_t_6 = 0;
+  __pyx_t_6 = __Pyx_PyDict_NewPresized(1); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 740, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_GetModuleGlobalName(__pyx_t_4, __pyx_n_s_np); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 740, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_t_4, __pyx_n_s_float64); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 740, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  if (PyDict_SetItem(__pyx_t_6, __pyx_n_s_dtype, __pyx_t_2) < 0) __PYX_ERR(0, 740, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_2 = __Pyx_PyObject_Call(__pyx_t_5, __pyx_t_3, __pyx_t_6); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 740, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  __pyx_v_A_D = __pyx_t_2;
+  __pyx_t_2 = 0;
+
+  /* "sisl/_sparse.pyx":741
+ *     else:
+ *         A_D = np.zeros([nd, n], dtype=np.float64)
+ *     cdef _orb_real[:, ::1] ad = A_D             # <<<<<<<<<<<<<<
+ *     cdef _orb_real v
+ * 
+ */
+  __pyx_t_32 = __Pyx_PyObject_to_MemoryviewSlice_d_dc_double(__pyx_v_A_D, PyBUF_WRITABLE); if (unlikely(!__pyx_t_32.memview)) __PYX_ERR(0, 741, __pyx_L1_error)
+  __pyx_v_ad = __pyx_t_32;
+  __pyx_t_32.memview = NULL;
+  __pyx_t_32.data = NULL;
+
+  /* "sisl/_sparse.pyx":744
+ *     cdef _orb_real v
+ * 
+ *     STAMP.fill(-1)             # <<<<<<<<<<<<<<
+ *     with nogil:
+ *         for ia in range(na):
+ */
+  __pyx_t_6 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_STAMP), __pyx_n_s_fill); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 744, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __pyx_t_3 = NULL;
+  if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_6))) {
+    __pyx_t_3 = PyMethod_GET_SELF(__pyx_t_6);
+    if (likely(__pyx_t_3)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_6);
+      __Pyx_INCREF(__pyx_t_3);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_6, function);
+    }
+  }
+  __pyx_t_2 = (__pyx_t_3) ? __Pyx_PyObject_Call2Args(__pyx_t_6, __pyx_t_3, __pyx_int_neg_1) : __Pyx_PyObject_CallOneArg(__pyx_t_6, __pyx_int_neg_1);
+  __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+  if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 744, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "sisl/_sparse.pyx":745
+ * 
+ *     STAMP.fill(-1)
+ *     with nogil:             # <<<<<<<<<<<<<<
+ *         for ia in range(na):
+ *             # Gather the unique columns
+ */
+  {
+      #ifdef WITH_THREAD
+      PyThreadState *_save;
+      Py_UNBLOCK_THREADS
+      __Pyx_FastGIL_Remember();
+      #endif
+      /*try:*/ {
+
+        /* "sisl/_sparse.pyx":746
+ *     STAMP.fill(-1)
+ *     with nogil:
+ *         for ia in range(na):             # <<<<<<<<<<<<<<
+ *             # Gather the unique columns
+ *             n = aptr[ia]
+ */
+        __pyx_t_10 = __pyx_v_na;
+        __pyx_t_11 = __pyx_t_10;
+        for (__pyx_t_12 = 0; __pyx_t_12 < __pyx_t_11; __pyx_t_12+=1) {
+          __pyx_v_ia = __pyx_t_12;
+
+          /* "sisl/_sparse.pyx":748
+ *         for ia in range(na):
+ *             # Gather the unique columns
+ *             n = aptr[ia]             # <<<<<<<<<<<<<<
+ *             for io in range(firsto[ia], firsto[ia + 1]):
+ *                 for i in range(ptr[io], ptr[io + 1]):
+ */
+          __pyx_t_33 = __pyx_v_ia;
+          __pyx_v_n = (*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_aptr.data) + __pyx_t_33)) )));
+
+          /* "sisl/_sparse.pyx":749
+ *             # Gather the unique columns
+ *             n = aptr[ia]
+ *             for io in range(firsto[ia], firsto[ia + 1]):             # <<<<<<<<<<<<<<
+ *                 for i in range(ptr[io], ptr[io + 1]):
+ *                     c = (o2a[col[i] % no] + (col[i] / no) * na) % nc
+ */
+          __pyx_t_34 = (__pyx_v_ia + 1);
+          __pyx_t_15 = (*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_firsto.data) + __pyx_t_34)) )));
+          __pyx_t_35 = __pyx_v_ia;
+          __pyx_t_17 = __pyx_t_15;
+          for (__pyx_t_18 = (*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_firsto.data) + __pyx_t_35)) ))); __pyx_t_18 < __pyx_t_17; __pyx_t_18+=1) {
+            __pyx_v_io = __pyx_t_18;
+
+            /* "sisl/_sparse.pyx":750
+ *             n = aptr[ia]
+ *             for io in range(firsto[ia], firsto[ia + 1]):
+ *                 for i in range(ptr[io], ptr[io + 1]):             # <<<<<<<<<<<<<<
+ *                     c = (o2a[col[i] % no] + (col[i] / no) * na) % nc
+ *                     if stamp[c] != ia:
+ */
+            __pyx_t_36 = (__pyx_v_io + 1);
+            __pyx_t_20 = (*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_ptr.data) + __pyx_t_36)) )));
+            __pyx_t_37 = __pyx_v_io;
+            __pyx_t_22 = __pyx_t_20;
+            for (__pyx_t_23 = (*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_ptr.data) + __pyx_t_37)) ))); __pyx_t_23 < __pyx_t_22; __pyx_t_23+=1) {
+              __pyx_v_i = __pyx_t_23;
+
+              /* "sisl/_sparse.pyx":751
+ *             for io in range(firsto[ia], firsto[ia + 1]):
+ *                 for i in range(ptr[io], ptr[io + 1]):
+ *                     c = (o2a[col[i] % no] + (col[i] / no) * na) % nc             # <<<<<<<<<<<<<<
+ *                     if stamp[c] != ia:
+ *                         stamp[c] = ia
+ */
+              __pyx_t_38 = __pyx_v_i;
+              __pyx_t_39 = ((*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_col.data) + __pyx_t_38)) ))) % __pyx_v_no);
+              __pyx_t_40 = __pyx_v_i;
+              __pyx_v_c = (((*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_o2a.data) + __pyx_t_39)) ))) + (((*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_col.data) + __pyx_t_40)) ))) / __pyx_v_no) * __pyx_v_na)) % __pyx_v_nc);
+
+              /* "sisl/_sparse.pyx":752
+ *                 for i in range(ptr[io], ptr[io + 1]):
+ *                     c = (o2a[col[i] % no] + (col[i] / no) * na) % nc
+ *                     if stamp[c] != ia:             # <<<<<<<<<<<<<<
+ *                         stamp[c] = ia
+ *                         acol[n] = c
+ */
+              __pyx_t_41 = __pyx_v_c;
+              __pyx_t_28 = (((*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_stamp.data) + __pyx_t_41)) ))) != __pyx_v_ia) != 0);
+              if (__pyx_t_28) {
+
+                /* "sisl/_sparse.pyx":753
+ *                     c = (o2a[col[i] % no] + (col[i] / no) * na) % nc
+ *                     if stamp[c] != ia:
+ *                         stamp[c] = ia             # <<<<<<<<<<<<<<
+ *                         acol[n] = c
+ *                         n += 1
+ */
+                __pyx_t_42 = __pyx_v_c;
+                *((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_stamp.data) + __pyx_t_42)) )) = __pyx_v_ia;
+
+                /* "sisl/_sparse.pyx":754
+ *                     if stamp[c] != ia:
+ *                         stamp[c] = ia
+ *                         acol[n] = c             # <<<<<<<<<<<<<<
+ *                         n += 1
+ * 
+ */
+                __pyx_t_43 = __pyx_v_n;
+                *((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_acol.data) + __pyx_t_43)) )) = __pyx_v_c;
+
+                /* "sisl/_sparse.pyx":755
+ *                         stamp[c] = ia
+ *                         acol[n] = c
+ *                         n += 1             # <<<<<<<<<<<<<<
+ * 
+ *             # Sort them and store their positions
+ */
+                __pyx_v_n = (__pyx_v_n + 1);
+
+                /* "sisl/_sparse.pyx":752
+ *                 for i in range(ptr[io], ptr[io + 1]):
+ *                     c = (o2a[col[i] % no] + (col[i] / no) * na) % nc
+ *                     if stamp[c] != ia:             # <<<<<<<<<<<<<<
+ *                         stamp[c] = ia
+ *                         acol[n] = c
+ */
+              }
+            }
+          }
+
+          /* "sisl/_sparse.pyx":758
+ * 
+ *             # Sort them and store their positions
+ *             n = aptr[ia + 1] - aptr[ia]             # <<<<<<<<<<<<<<
+ *             if n > 1:
+ *                 qsort(&acol[aptr[ia]], n, sizeof(int), _int_cmp)
+ */
+          __pyx_t_44 = (__pyx_v_ia + 1);
+          __pyx_t_45 = __pyx_v_ia;
+          __pyx_v_n = ((*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_aptr.data) + __pyx_t_44)) ))) - (*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_aptr.data) + __pyx_t_45)) ))));
+
+          /* "sisl/_sparse.pyx":759
+ *             # Sort them and store their positions
+ *             n = aptr[ia + 1] - aptr[ia]
+ *             if n > 1:             # <<<<<<<<<<<<<<
+ *                 qsort(&acol[aptr[ia]], n, sizeof(int), _int_cmp)
+ *             for j in range(aptr[ia], aptr[ia + 1]):
+ */
+          __pyx_t_28 = ((__pyx_v_n > 1) != 0);
+          if (__pyx_t_28) {
+
+            /* "sisl/_sparse.pyx":760
+ *             n = aptr[ia + 1] - aptr[ia]
+ *             if n > 1:
+ *                 qsort(&acol[aptr[ia]], n, sizeof(int), _int_cmp)             # <<<<<<<<<<<<<<
+ *             for j in range(aptr[ia], aptr[ia + 1]):
+ *                 pos[acol[j]] = j
+ */
+            __pyx_t_46 = __pyx_v_ia;
+            __pyx_t_47 = (*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_aptr.data) + __pyx_t_46)) )));
+            qsort((&(*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_acol.data) + __pyx_t_47)) )))), __pyx_v_n, (sizeof(int)), __pyx_f_4sisl_7_sparse__int_cmp);
+
+            /* "sisl/_sparse.pyx":759
+ *             # Sort them and store their positions
+ *             n = aptr[ia + 1] - aptr[ia]
+ *             if n > 1:             # <<<<<<<<<<<<<<
+ *                 qsort(&acol[aptr[ia]], n, sizeof(int), _int_cmp)
+ *             for j in range(aptr[ia], aptr[ia + 1]):
+ */
+          }
+
+          /* "sisl/_sparse.pyx":761
+ *             if n > 1:
+ *                 qsort(&acol[aptr[ia]], n, sizeof(int), _int_cmp)
+ *             for j in range(aptr[ia], aptr[ia + 1]):             # <<<<<<<<<<<<<<
+ *                 pos[acol[j]] = j
+ * 
+ */
+          __pyx_t_48 = (__pyx_v_ia + 1);
+          __pyx_t_15 = (*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_aptr.data) + __pyx_t_48)) )));
+          __pyx_t_49 = __pyx_v_ia;
+          __pyx_t_17 = __pyx_t_15;
+          for (__pyx_t_18 = (*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_aptr.data) + __pyx_t_49)) ))); __pyx_t_18 < __pyx_t_17; __pyx_t_18+=1) {
+            __pyx_v_j = __pyx_t_18;
+
+            /* "sisl/_sparse.pyx":762
+ *                 qsort(&acol[aptr[ia]], n, sizeof(int), _int_cmp)
+ *             for j in range(aptr[ia], aptr[ia + 1]):
+ *                 pos[acol[j]] = j             # <<<<<<<<<<<<<<
+ * 
+ *             # Sum the data
+ */
+            __pyx_t_50 = __pyx_v_j;
+            __pyx_t_51 = (*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_acol.data) + __pyx_t_50)) )));
+            *((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_pos.data) + __pyx_t_51)) )) = __pyx_v_j;
+          }
+
+          /* "sisl/_sparse.pyx":765
+ * 
+ *             # Sum the data
+ *             for io in range(firsto[ia], firsto[ia + 1]):             # <<<<<<<<<<<<<<
+ *                 for i in range(ptr[io], ptr[io + 1]):
+ *                     j = pos[(o2a[col[i] % no] + (col[i] / no) * na) % nc]
+ */
+          __pyx_t_52 = (__pyx_v_ia + 1);
+          __pyx_t_15 = (*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_firsto.data) + __pyx_t_52)) )));
+          __pyx_t_53 = __pyx_v_ia;
+          __pyx_t_17 = __pyx_t_15;
+          for (__pyx_t_18 = (*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_firsto.data) + __pyx_t_53)) ))); __pyx_t_18 < __pyx_t_17; __pyx_t_18+=1) {
+            __pyx_v_io = __pyx_t_18;
+
+            /* "sisl/_sparse.pyx":766
+ *             # Sum the data
+ *             for io in range(firsto[ia], firsto[ia + 1]):
+ *                 for i in range(ptr[io], ptr[io + 1]):             # <<<<<<<<<<<<<<
+ *                     j = pos[(o2a[col[i] % no] + (col[i] / no) * na) % nc]
+ *                     for c in range(nd):
+ */
+            __pyx_t_54 = (__pyx_v_io + 1);
+            __pyx_t_20 = (*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_ptr.data) + __pyx_t_54)) )));
+            __pyx_t_55 = __pyx_v_io;
+            __pyx_t_22 = __pyx_t_20;
+            for (__pyx_t_23 = (*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_ptr.data) + __pyx_t_55)) ))); __pyx_t_23 < __pyx_t_22; __pyx_t_23+=1) {
+              __pyx_v_i = __pyx_t_23;
+
+              /* "sisl/_sparse.pyx":767
+ *             for io in range(firsto[ia], firsto[ia + 1]):
+ *                 for i in range(ptr[io], ptr[io + 1]):
+ *                     j = pos[(o2a[col[i] % no] + (col[i] / no) * na) % nc]             # <<<<<<<<<<<<<<
+ *                     for c in range(nd):
+ *                         v = D[c, i]
+ */
+              __pyx_t_56 = __pyx_v_i;
+              __pyx_t_57 = ((*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_col.data) + __pyx_t_56)) ))) % __pyx_v_no);
+              __pyx_t_58 = __pyx_v_i;
+              __pyx_t_59 = (((*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_o2a.data) + __pyx_t_57)) ))) + (((*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_col.data) + __pyx_t_58)) ))) / __pyx_v_no) * __pyx_v_na)) % __pyx_v_nc);
+              __pyx_v_j = (*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_pos.data) + __pyx_t_59)) )));
+
+              /* "sisl/_sparse.pyx":768
+ *                 for i in range(ptr[io], ptr[io + 1]):
+ *                     j = pos[(o2a[col[i] % no] + (col[i] / no) * na) % nc]
+ *                     for c in range(nd):             # <<<<<<<<<<<<<<
+ *                         v = D[c, i]
+ *                         if only == 1:
+ */
+              __pyx_t_60 = __pyx_v_nd;
+              __pyx_t_61 = __pyx_t_60;
+              for (__pyx_t_62 = 0; __pyx_t_62 < __pyx_t_61; __pyx_t_62+=1) {
+                __pyx_v_c = __pyx_t_62;
+
+                /* "sisl/_sparse.pyx":769
+ *                     j = pos[(o2a[col[i] % no] + (col[i] / no) * na) % nc]
+ *                     for c in range(nd):
+ *                         v = D[c, i]             # <<<<<<<<<<<<<<
+ *                         if only == 1:
+ *                             if v > 0:
+ */
+                __pyx_t_63 = __pyx_v_c;
+                __pyx_t_64 = __pyx_v_i;
+                __pyx_v_v = (*((double *) ( /* dim=1 */ ((char *) (((double *) ( /* dim=0 */ (__pyx_v_D.data + __pyx_t_63 * __pyx_v_D.strides[0]) )) + __pyx_t_64)) )));
+
+                /* "sisl/_sparse.pyx":770
+ *                     for c in range(nd):
+ *                         v = D[c, i]
+ *                         if only == 1:             # <<<<<<<<<<<<<<
+ *                             if v > 0:
+ *                                 ad[c, j] += v
+ */
+                switch (__pyx_v_only) {
+                  case 1:
+
+                  /* "sisl/_sparse.pyx":771
+ *                         v = D[c, i]
+ *                         if only == 1:
+ *                             if v > 0:             # <<<<<<<<<<<<<<
+ *                                 ad[c, j] += v
+ *                         elif only == -1:
+ */
+                  __pyx_t_28 = ((__pyx_v_v > 0.0) != 0);
+                  if (__pyx_t_28) {
+
+                    /* "sisl/_sparse.pyx":772
+ *                         if only == 1:
+ *                             if v > 0:
+ *                                 ad[c, j] += v             # <<<<<<<<<<<<<<
+ *                         elif only == -1:
+ *                             if v < 0:
+ */
+                    __pyx_t_65 = __pyx_v_c;
+                    __pyx_t_66 = __pyx_v_j;
+                    *((double *) ( /* dim=1 */ ((char *) (((double *) ( /* dim=0 */ (__pyx_v_ad.data + __pyx_t_65 * __pyx_v_ad.strides[0]) )) + __pyx_t_66)) )) += __pyx_v_v;
+
+                    /* "sisl/_sparse.pyx":771
+ *                         v = D[c, i]
+ *                         if only == 1:
+ *                             if v > 0:             # <<<<<<<<<<<<<<
+ *                                 ad[c, j] += v
+ *                         elif only == -1:
+ */
+                  }
+
+                  /* "sisl/_sparse.pyx":770
+ *                     for c in range(nd):
+ *                         v = D[c, i]
+ *                         if only == 1:             # <<<<<<<<<<<<<<
+ *                             if v > 0:
+ *                                 ad[c, j] += v
+ */
+                  break;
+                  case -1L:
+
+                  /* "sisl/_sparse.pyx":774
+ *                                 ad[c, j] += v
+ *                         elif only == -1:
+ *                             if v < 0:             # <<<<<<<<<<<<<<
+ *                                 ad[c, j] += v
+ *                         else:
+ */
+                  __pyx_t_28 = ((__pyx_v_v < 0.0) != 0);
+                  if (__pyx_t_28) {
+
+                    /* "sisl/_sparse.pyx":775
+ *                         elif only == -1:
+ *                             if v < 0:
+ *                                 ad[c, j] += v             # <<<<<<<<<<<<<<
+ *                         else:
+ *                             ad[c, j] += v
+ */
+                    __pyx_t_67 = __pyx_v_c;
+                    __pyx_t_68 = __pyx_v_j;
+                    *((double *) ( /* dim=1 */ ((char *) (((double *) ( /* dim=0 */ (__pyx_v_ad.data + __pyx_t_67 * __pyx_v_ad.strides[0]) )) + __pyx_t_68)) )) += __pyx_v_v;
+
+                    /* "sisl/_sparse.pyx":774
+ *                                 ad[c, j] += v
+ *                         elif only == -1:
+ *                             if v < 0:             # <<<<<<<<<<<<<<
+ *                                 ad[c, j] += v
+ *                         else:
+ */
+                  }
+
+                  /* "sisl/_sparse.pyx":773
+ *                             if v > 0:
+ *                                 ad[c, j] += v
+ *                         elif only == -1:             # <<<<<<<<<<<<<<
+ *                             if v < 0:
+ *                                 ad[c, j] += v
+ */
+                  break;
+                  default:
+
+                  /* "sisl/_sparse.pyx":777
+ *                                 ad[c, j] += v
+ *                         else:
+ *                             ad[c, j] += v             # <<<<<<<<<<<<<<
+ * 
+ *     return A_PTR, A_COL, A_D
+ */
+                  __pyx_t_69 = __pyx_v_c;
+                  __pyx_t_70 = __pyx_v_j;
+                  *((double *) ( /* dim=1 */ ((char *) (((double *) ( /* dim=0 */ (__pyx_v_ad.data + __pyx_t_69 * __pyx_v_ad.strides[0]) )) + __pyx_t_70)) )) += __pyx_v_v;
+                  break;
+                }
+              }
+            }
+          }
+        }
+      }
+
+      /* "sisl/_sparse.pyx":745
+ * 
+ *     STAMP.fill(-1)
+ *     with nogil:             # <<<<<<<<<<<<<<
+ *         for ia in range(na):
+ *             # Gather the unique columns
+ */
+      /*finally:*/ {
+        /*normal exit:*/{
+          #ifdef WITH_THREAD
+          __Pyx_FastGIL_Forget();
+          Py_BLOCK_THREADS
+          #endif
+          goto __pyx_L15;
+        }
+        __pyx_L15:;
+      }
+  }
+
+  /* "sisl/_sparse.pyx":779
+ *                             ad[c, j] += v
+ * 
+ *     return A_PTR, A_COL, A_D             # <<<<<<<<<<<<<<
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_2 = PyTuple_New(3); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 779, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_INCREF(((PyObject *)__pyx_v_A_PTR));
+  __Pyx_GIVEREF(((PyObject *)__pyx_v_A_PTR));
+  PyTuple_SET_ITEM(__pyx_t_2, 0, ((PyObject *)__pyx_v_A_PTR));
+  __Pyx_INCREF(((PyObject *)__pyx_v_A_COL));
+  __Pyx_GIVEREF(((PyObject *)__pyx_v_A_COL));
+  PyTuple_SET_ITEM(__pyx_t_2, 1, ((PyObject *)__pyx_v_A_COL));
+  __Pyx_INCREF(__pyx_v_A_D);
+  __Pyx_GIVEREF(__pyx_v_A_D);
+  PyTuple_SET_ITEM(__pyx_t_2, 2, __pyx_v_A_D);
+  __pyx_r = __pyx_t_2;
+  __pyx_t_2 = 0;
+  goto __pyx_L0;
+
+  /* "sisl/_sparse.pyx":672
+ * @cython.initializedcheck(False)
+ * @cython.cdivision(True)
+ * def sparse_orb_to_atom(np.ndarray[np.int32_t, ndim=1, mode='c'] PTR,             # <<<<<<<<<<<<<<
+ *                        np.ndarray[np.int32_t, ndim=1, mode='c'] COL,
+ *                        _orb_real[:, ::1] D,
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __PYX_XDEC_MEMVIEW(&__pyx_t_1, 1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_6);
+  __PYX_XDEC_MEMVIEW(&__pyx_t_32, 1);
+  { PyObject *__pyx_type, *__pyx_value, *__pyx_tb;
+    __Pyx_PyThreadState_declare
+    __Pyx_PyThreadState_assign
+    __Pyx_ErrFetch(&__pyx_type, &__pyx_value, &__pyx_tb);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_A_COL.rcbuffer->pybuffer);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_A_PTR.rcbuffer->pybuffer);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_COL.rcbuffer->pybuffer);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_FIRSTO.rcbuffer->pybuffer);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_O2A.rcbuffer->pybuffer);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_POS.rcbuffer->pybuffer);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_PTR.rcbuffer->pybuffer);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_STAMP.rcbuffer->pybuffer);
+  __Pyx_ErrRestore(__pyx_type, __pyx_value, __pyx_tb);}
+  __Pyx_AddTraceback("sisl._sparse.sparse_orb_to_atom", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  goto __pyx_L2;
+  __pyx_L0:;
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_A_COL.rcbuffer->pybuffer);
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_A_PTR.rcbuffer->pybuffer);
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_COL.rcbuffer->pybuffer);
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_FIRSTO.rcbuffer->pybuffer);
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_O2A.rcbuffer->pybuffer);
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_POS.rcbuffer->pybuffer);
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_PTR.rcbuffer->pybuffer);
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_STAMP.rcbuffer->pybuffer);
+  __pyx_L2:;
+  __PYX_XDEC_MEMVIEW(&__pyx_v_ptr, 1);
+  __PYX_XDEC_MEMVIEW(&__pyx_v_col, 1);
+  __PYX_XDEC_MEMVIEW(&__pyx_v_firsto, 1);
+  __PYX_XDEC_MEMVIEW(&__pyx_v_o2a, 1);
+  __Pyx_XDECREF((PyObject *)__pyx_v_A_PTR);
+  __Pyx_XDECREF((PyObject *)__pyx_v_STAMP);
+  __Pyx_XDECREF((PyObject *)__pyx_v_POS);
+  __PYX_XDEC_MEMVIEW(&__pyx_v_aptr, 1);
+  __PYX_XDEC_MEMVIEW(&__pyx_v_stamp, 1);
+  __PYX_XDEC_MEMVIEW(&__pyx_v_pos, 1);
+  __Pyx_XDECREF((PyObject *)__pyx_v_A_COL);
+  __PYX_XDEC_MEMVIEW(&__pyx_v_acol, 1);
+  __Pyx_XDECREF(__pyx_v_A_D);
+  __PYX_XDEC_MEMVIEW(&__pyx_v_ad, 1);
+  __PYX_XDEC_MEMVIEW(&__pyx_v_D, 1);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":258
+ *         # experimental exception made for __getbuffer__ and __releasebuffer__
+ *         # -- the details of this may change.
+ *         def __getbuffer__(ndarray self, Py_buffer* info, int flags):             # <<<<<<<<<<<<<<
+ *             # This implementation of getbuffer is geared towards Cython
+ *             # requirements, and does not yet fulfill the PEP.
+ */
+
+/* Python wrapper */
+static CYTHON_UNUSED int __pyx_pw_5numpy_7ndarray_1__getbuffer__(PyObject *__pyx_v_self, Py_buffer *__pyx_v_info, int __pyx_v_flags); /*proto*/
+static CYTHON_UNUSED int __pyx_pw_5numpy_7ndarray_1__getbuffer__(PyObject *__pyx_v_self, Py_buffer *__pyx_v_info, int __pyx_v_flags) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__getbuffer__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_5numpy_7ndarray___getbuffer__(((PyArrayObject *)__pyx_v_self), ((Py_buffer *)__pyx_v_info), ((int)__pyx_v_flags));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, Py_buffer *__pyx_v_info, int __pyx_v_flags) {
+  int __pyx_v_i;
+  int __pyx_v_ndim;
+  int __pyx_v_endian_detector;
+  int __pyx_v_little_endian;
+  int __pyx_v_t;
+  char *__pyx_v_f;
+  PyArray_Descr *__pyx_v_descr = 0;
+  int __pyx_v_offset;
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  int __pyx_t_2;
+  PyObject *__pyx_t_3 = NULL;
+  int __pyx_t_4;
+  int __pyx_t_5;
+  int __pyx_t_6;
+  PyArray_Descr *__pyx_t_7;
+  PyObject *__pyx_t_8 = NULL;
+  char *__pyx_t_9;
+  if (__pyx_v_info == NULL) {
+    PyErr_SetString(PyExc_BufferError, "PyObject_GetBuffer: view==NULL argument is obsolete");
+    return -1;
+  }
+  __Pyx_RefNannySetupContext("__getbuffer__", 0);
+  __pyx_v_info->obj = Py_None; __Pyx_INCREF(Py_None);
+  __Pyx_GIVEREF(__pyx_v_info->obj);
+
+  /* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":265
+ * 
+ *             cdef int i, ndim
+ *             cdef int endian_detector = 1             # <<<<<<<<<<<<<<
+ *             cdef bint little_endian = ((<char*>&endian_detector)[0] != 0)
+ * 
+ */
+  __pyx_v_endian_detector = 1;
+
+  /* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":266
+ *             cdef int i, ndim
+ *             cdef int endian_detector = 1
+ *             cdef bint little_endian = ((<char*>&endian_detector)[0] != 0)             # <<<<<<<<<<<<<<
+ * 
+ *             ndim = PyArray_NDIM(self)
+ */
+  __pyx_v_little_endian = ((((char *)(&__pyx_v_endian_detector))[0]) != 0);
+
+  /* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":268
+ *             cdef bint little_endian = ((<char*>&endian_detector)[0] != 0)
+ * 
+ *             ndim = PyArray_NDIM(self)             # <<<<<<<<<<<<<<
+ * 
+ *             if ((flags & pybuf.PyBUF_C_CONTIGUOUS == pybuf.PyBUF_C_CONTIGUOUS)
+ */
+  __pyx_v_ndim = PyArray_NDIM(__pyx_v_self);
+
+  /* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":270
+ *             ndim = PyArray_NDIM(self)
+ * 
+ *             if ((flags & pybuf.PyBUF_C_CONTIGUOUS == pybuf.PyBUF_C_CONTIGUOUS)             # <<<<<<<<<<<<<<
+ *                 and not PyArray_CHKFLAGS(self, NPY_ARRAY_C_CONTIGUOUS)):
+ *                 raise ValueError(u"ndarray is not C contiguous")
+ */
+  __pyx_t_2 = (((__pyx_v_flags & PyBUF_C_CONTIGUOUS) == PyBUF_C_CONTIGUOUS) != 0);
+  if (__pyx_t_2) {
+  } else {
+    __pyx_t_1 = __pyx_t_2;
+    goto __pyx_L4_bool_binop_done;
+  }
+
+  /* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":271
+ * 
+ *             if ((flags & pybuf.PyBUF_C_CONTIGUOUS == pybuf.PyBUF_C_CONTIGUOUS)
+ *                 and not PyArray_CHKFLAGS(self, NPY_ARRAY_C_CONTIGUOUS)):             # <<<<<<<<<<<<<<
+ *                 raise ValueError(u"ndarray is not C contiguous")
+ * 
+ */
+  __pyx_t_2 = ((!(PyArray_CHKFLAGS(__pyx_v_self, NPY_ARRAY_C_CONTIGUOUS) != 0)) != 0);
+  __pyx_t_1 = __pyx_t_2;
+  __pyx_L4_bool_binop_done:;
+
+  /* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":270
+ *             ndim = PyArray_NDIM(self)
+ * 
+ *             if ((flags & pybuf.PyBUF_C_CONTIGUOUS == pybuf.PyBUF_C_CONTIGUOUS)             # <<<<<<<<<<<<<<
+ *                 and not PyArray_CHKFLAGS(self, NPY_ARRAY_C_CONTIGUOUS)):
+ *                 raise ValueError(u"ndarray is not C contiguous")
+ */
+  if (unlikely(__pyx_t_1)) {
+
+    /* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":272
+ *             if ((flags & pybuf.PyBUF_C_CONTIGUOUS == pybuf.PyBUF_C_CONTIGUOUS)
+ *                 and not PyArray_CHKFLAGS(self, NPY_ARRAY_C_CONTIGUOUS)):
+ *                 raise ValueError(u"ndarray is not C contiguous")             # <<<<<<<<<<<<<<
+ * 
+ *             if ((flags & pybuf.PyBUF_F_CONTIGUOUS == pybuf.PyBUF_F_CONTIGUOUS)
+ */
+    __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__9, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 272, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_Raise(__pyx_t_3, 0, 0, 0);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __PYX_ERR(1, 272, __pyx_L1_error)
+
+    /* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":270
+ *             ndim = PyArray_NDIM(self)
+ * 
+ *             if ((flags & pybuf.PyBUF_C_CONTIGUOUS == pybuf.PyBUF_C_CONTIGUOUS)             # <<<<<<<<<<<<<<
+ *                 and not PyArray_CHKFLAGS(self, NPY_ARRAY_C_CONTIGUOUS)):
+ *                 raise ValueError(u"ndarray is not C contiguous")
+ */
+  }
+
+  /* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":274
+ *                 raise ValueError(u"ndarray is not C contiguous")
+ * 
+ *             if ((flags & pybuf.PyBUF_F_CONTIGUOUS == pybuf.PyBUF_F_CONTIGUOUS)             # <<<<<<<<<<<<<<
+ *                 and not PyArray_CHKFLAGS(self, NPY_ARRAY_F_CONTIGUOUS)):
+ *                 raise ValueError(u"ndarray is not Fortran contiguous")
+ */
+  __pyx_t_2 = (((__pyx_v_flags & PyBUF_F_CONTIGUOUS) == PyBUF_F_CONTIGUOUS) != 0);
+  if (__pyx_t_2) {
+  } else {
+    __pyx_t_1 = __pyx_t_2;
+    goto __pyx_L7_bool_binop_done;
+  }
+
+  /* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":275
+ * 
+ *             if ((flags & pybuf.PyBUF_F_CONTIGUOUS == pybuf.PyBUF_F_CONTIGUOUS)
+ *                 and not PyArray_CHKFLAGS(self, NPY_ARRAY_F_CONTIGUOUS)):             # <<<<<<<<<<<<<<
+ *                 raise ValueError(u"ndarray is not Fortran contiguous")
+ * 
+ */
+  __pyx_t_2 = ((!(PyArray_CHKFLAGS(__pyx_v_self, NPY_ARRAY_F_CONTIGUOUS) != 0)) != 0);
+  __pyx_t_1 = __pyx_t_2;
+  __pyx_L7_bool_binop_done:;
+
+  /* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":274
+ *                 raise ValueError(u"ndarray is not C contiguous")
+ * 
+ *             if ((flags & pybuf.PyBUF_F_CONTIGUOUS == pybuf.PyBUF_F_CONTIGUOUS)             # <<<<<<<<<<<<<<
+ *                 and not PyArray_CHKFLAGS(self, NPY_ARRAY_F_CONTIGUOUS)):
+ *                 raise ValueError(u"ndarray is not Fortran contiguous")
+ */
+  if (unlikely(__pyx_t_1)) {
+
+    /* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":276
+ *             if ((flags & pybuf.PyBUF_F_CONTIGUOUS == pybuf.PyBUF_F_CONTIGUOUS)
+ *                 and not PyArray_CHKFLAGS(self, NPY_ARRAY_F_CONTIGUOUS)):
+ *                 raise ValueError(u"ndarray is not Fortran contiguous")             # <<<<<<<<<<<<<<
+ * 
+ *             info.buf = PyArray_DATA(self)
+ */
+    __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__10, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 276, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_Raise(__pyx_t_3, 0, 0, 0);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __PYX_ERR(1, 276, __pyx_L1_error)
+
+    /* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":274
+ *                 raise ValueError(u"ndarray is not C contiguous")
+ * 
+ *             if ((flags & pybuf.PyBUF_F_CONTIGUOUS == pybuf.PyBUF_F_CONTIGUOUS)             # <<<<<<<<<<<<<<
+ *                 and not PyArray_CHKFLAGS(self, NPY_ARRAY_F_CONTIGUOUS)):
+ *                 raise ValueError(u"ndarray is not Fortran contiguous")
+ */
+  }
+
+  /* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":278
+ *                 raise ValueError(u"ndarray is not Fortran contiguous")
+ * 
+ *             info.buf = PyArray_DATA(self)             # <<<<<<<<<<<<<<
+ *             info.ndim = ndim
+ *             if sizeof(npy_intp) != sizeof(Py_ssize_t):
+ */
+  __pyx_v_info->buf = PyArray_DATA(__pyx_v_self);
+
+  /* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":279
+ * 
+ *             info.buf = PyArray_DATA(self)
+ *             info.ndim = ndim             # <<<<<<<<<<<<<<
+ *             if sizeof(npy_intp) != sizeof(Py_ssize_t):
+ *                 # Allocate new buffer for strides and shape info.
+ */
+  __pyx_v_info->ndim = __pyx_v_ndim;
+
+  /* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":280
+ *             info.buf = PyArray_DATA(self)
+ *             info.ndim = ndim
+ *             if sizeof(npy_intp) != sizeof(Py_ssize_t):             # <<<<<<<<<<<<<<
+ *                 # Allocate new buffer for strides and shape info.
+ *                 # This is allocated as one block, strides first.
+ */
+  __pyx_t_1 = (((sizeof(npy_intp)) != (sizeof(Py_ssize_t))) != 0);
+  if (__pyx_t_1) {
+
+    /* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":283
+ *                 # Allocate new buffer for strides and shape info.
+ *                 # This is allocated as one block, strides first.
+ *                 info.strides = <Py_ssize_t*>PyObject_Malloc(sizeof(Py_ssize_t) * 2 * <size_t>ndim)             # <<<<<<<<<<<<<<
+ *                 info.shape = info.strides + ndim
+ *                 for i in range(ndim):
+ */
+    __pyx_v_info->strides = ((Py_ssize_t *)PyObject_Malloc((((sizeof(Py_ssize_t)) * 2) * ((size_t)__pyx_v_ndim))));
+
+    /* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":284
+ *                 # This is allocated as one block, strides first.
+ *                 info.strides = <Py_ssize_t*>PyObject_Malloc(sizeof(Py_ssize_t) * 2 * <size_t>ndim)
+ *                 info.shape = info.strides + ndim             # <<<<<<<<<<<<<<
+ *                 for i in range(ndim):
+ *                     info.strides[i] = PyArray_STRIDES(self)[i]
+ */
+    __pyx_v_info->shape = (__pyx_v_info->strides + __pyx_v_ndim);
+
+    /* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":285
+ *                 info.strides = <Py_ssize_t*>PyObject_Malloc(sizeof(Py_ssize_t) * 2 * <size_t>ndim)
+ *                 info.shape = info.strides + ndim
+ *                 for i in range(ndim):             # <<<<<<<<<<<<<<
+ *                     info.strides[i] = PyArray_STRIDES(self)[i]
+ *                     info.shape[i] = PyArray_DIMS(self)[i]
+ */
+    __pyx_t_4 = __pyx_v_ndim;
+    __pyx_t_5 = __pyx_t_4;
+    for (__pyx_t_6 = 0; __pyx_t_6 < __pyx_t_5; __pyx_t_6+=1) {
+      __pyx_v_i = __pyx_t_6;
+
+      /* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":286
+ *                 info.shape = info.strides + ndim
+ *                 for i in range(ndim):
+ *                     info.strides[i] = PyArray_STRIDES(self)[i]             # <<<<<<<<<<<<<<
+ *                     info.shape[i] = PyArray_DIMS(self)[i]
+ *             else:
+ */
+      (__pyx_v_info->strides[__pyx_v_i]) = (PyArray_STRIDES(__pyx_v_self)[__pyx_v_i]);
+
+      /* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":287
+ *                 for i in range(ndim):
+ *                     info.strides[i] = PyArray_STRIDES(self)[i]
+ *                     info.shape[i] = PyArray_DIMS(self)[i]             # <<<<<<<<<<<<<<
+ *             else:
+ *                 info.strides = <Py_ssize_t*>PyArray_STRIDES(self)
+ */
+      (__pyx_v_info->shape[__pyx_v_i]) = (PyArray_DIMS(__pyx_v_self)[__pyx_v_i]);
+    }
+
+    /* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":280
+ *             info.buf = PyArray_DATA(self)
+ *             info.ndim = ndim
+ *             if sizeof(npy_intp) != sizeof(Py_ssize_t):             # <<<<<<<<<<<<<<
+ *                 # Allocate new buffer for strides and shape info.
+ *                 # This is allocated as one block, strides first.
+ */
+    goto __pyx_L9;
+  }
+
+  /* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":289
+ *                     info.shape[i] = PyArray_DIMS(self)[i]
+ *             else:
+ *                 info.strides = <Py_ssize_t*>PyArray_STRIDES(self)             # <<<<<<<<<<<<<<
+ *                 info.shape = <Py_ssize_t*>PyArray_DIMS(self)
+ *             info.suboffsets = NULL
+ */
+  /*else*/ {
+    __pyx_v_info->strides = ((Py_ssize_t *)PyArray_STRIDES(__pyx_v_self));
+
+    /* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":290
+ *             else:
+ *                 info.strides = <Py_ssize_t*>PyArray_STRIDES(self)
+ *                 info.shape = <Py_ssize_t*>PyArray_DIMS(self)             # <<<<<<<<<<<<<<
+ *             info.suboffsets = NULL
+ *             info.itemsize = PyArray_ITEMSIZE(self)
+ */
+    __pyx_v_info->shape = ((Py_ssize_t *)PyArray_DIMS(__pyx_v_self));
+  }
+  __pyx_L9:;
+
+  /* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":291
+ *                 info.strides = <Py_ssize_t*>PyArray_STRIDES(self)
+ *                 info.shape = <Py_ssize_t*>PyArray_DIMS(self)
+ *             info.suboffsets = NULL             # <<<<<<<<<<<<<<
+ *             info.itemsize = PyArray_ITEMSIZE(self)
+ *             info.readonly = not PyArray_ISWRITEABLE(self)
+ */
+  __pyx_v_info->suboffsets = NULL;
+
+  /* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":292
+ *                 info.shape = <Py_ssize_t*>PyArray_DIMS(self)
+ *             info.suboffsets = NULL
+ *             info.itemsize = PyArray_ITEMSIZE(self)             # <<<<<<<<<<<<<<
+ *             info.readonly = not PyArray_ISWRITEABLE(self)
+ * 
+ */
+  __pyx_v_info->itemsize = PyArray_ITEMSIZE(__pyx_v_self);
+
+  /* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":293
+ *             info.suboffsets = NULL
+ *             info.itemsize = PyArray_ITEMSIZE(self)
+ *             info.readonly = not PyArray_ISWRITEABLE(self)             # <<<<<<<<<<<<<<
+ * 
+ *             cdef int t
+ */
+  __pyx_v_info->readonly = (!(PyArray_ISWRITEABLE(__pyx_v_self) != 0));
+
+  /* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":296
+ * 
+ *             cdef int t
+ *             cdef char* f = NULL             # <<<<<<<<<<<<<<
+ *             cdef dtype descr = <dtype>PyArray_DESCR(self)
+ *             cdef int offset
+ */
+  __pyx_v_f = NULL;
+
+  /* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":297
+ *             cdef int t
+ *             cdef char* f = NULL
+ *             cdef dtype descr = <dtype>PyArray_DESCR(self)             # <<<<<<<<<<<<<<
+ *             cdef int offset
+ * 
+ */
+  __pyx_t_7 = PyArray_DESCR(__pyx_v_self);
+  __pyx_t_3 = ((PyObject *)__pyx_t_7);
+  __Pyx_INCREF(__pyx_t_3);
+  __pyx_v_descr = ((PyArray_Descr *)__pyx_t_3);
+  __pyx_t_3 = 0;
+
+  /* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":300
+ *             cdef int offset
+ * 
+ *             info.obj = self             # <<<<<<<<<<<<<<
+ * 
+ *             if not PyDataType_HASFIELDS(descr):
+ */
+  __Pyx_INCREF(((PyObject *)__pyx_v_self));
+  __Pyx_GIVEREF(((PyObject *)__pyx_v_self));
+  __Pyx_GOTREF(__pyx_v_info->obj);
+  __Pyx_DECREF(__pyx_v_info->obj);
+  __pyx_v_info->obj = ((PyObject *)__pyx_v_self);
+
+  /* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":302
+ *             info.obj = self
+ * 
+ *             if not PyDataType_HASFIELDS(descr):             # <<<<<<<<<<<<<<
+ *                 t = descr.type_num
+ *                 if ((descr.byteorder == c'>' and little_endian) or
+ */
+  __pyx_t_1 = ((!(PyDataType_HASFIELDS(__pyx_v_descr) != 0)) != 0);
+  if (__pyx_t_1) {
+
+    /* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":303
+ * 
+ *             if not PyDataType_HASFIELDS(descr):
+ *                 t = descr.type_num             # <<<<<<<<<<<<<<
+ *                 if ((descr.byteorder == c'>' and little_endian) or
+ *                     (descr.byteorder == c'<' and not little_endian)):
+ */
+    __pyx_t_4 = __pyx_v_descr->type_num;
+    __pyx_v_t = __pyx_t_4;
+
+    /* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":304
+ *             if not PyDataType_HASFIELDS(descr):
+ *                 t = descr.type_num
+ *                 if ((descr.byteorder == c'>' and little_endian) or             # <<<<<<<<<<<<<<
+ *                     (descr.byteorder == c'<' and not little_endian)):
+ *                     raise ValueError(u"Non-native byte order not supported")
+ */
+    __pyx_t_2 = ((__pyx_v_descr->byteorder == '>') != 0);
+    if (!__pyx_t_2) {
+      goto __pyx_L15_next_or;
+    } else {
+    }
+    __pyx_t_2 = (__pyx_v_little_endian != 0);
+    if (!__pyx_t_2) {
+    } else {
+      __pyx_t_1 = __pyx_t_2;
+      goto __pyx_L14_bool_binop_done;
+    }
+    __pyx_L15_next_or:;
+
+    /* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":305
+ *                 t = descr.type_num
+ *                 if ((descr.byteorder == c'>' and little_endian) or
+ *                     (descr.byteorder == c'<' and not little_endian)):             # <<<<<<<<<<<<<<
+ *                     raise ValueError(u"Non-native byte order not supported")
+ *                 if   t == NPY_BYTE:        f = "b"
+ */
+    __pyx_t_2 = ((__pyx_v_descr->byteorder == '<') != 0);
+    if (__pyx_t_2) {
+    } else {
+      __pyx_t_1 = __pyx_t_2;
+      goto __pyx_L14_bool_binop_done;
+    }
+    __pyx_t_2 = ((!(__pyx_v_little_endian != 0)) != 0);
+    __pyx_t_1 = __pyx_t_2;
+    __pyx_L14_bool_binop_done:;
+
+    /* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":304
+ *             if not PyDataType_HASFIELDS(descr):
+ *                 t = descr.type_num
+ *                 if ((descr.byteorder == c'>' and little_endian) or             # <<<<<<<<<<<<<<
+ *                     (descr.byteorder == c'<' and not little_endian)):
+ *                     raise ValueError(u"Non-native byte order not supported")
+ */
+    if (unlikely(__pyx_t_1)) {
+
+      /* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":306
+ *                 if ((descr.byteorder == c'>' and little_endian) or
+ *                     (descr.byteorder == c'<' and not little_endian)):
+ *                     raise ValueError(u"Non-native byte order not supported")             # <<<<<<<<<<<<<<
+ *                 if   t == NPY_BYTE:        f = "b"
+ *                 elif t == NPY_UBYTE:       f = "B"
+ */
+      __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__11, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 306, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_3);
+      __Pyx_Raise(__pyx_t_3, 0, 0, 0);
+      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+      __PYX_ERR(1, 306, __pyx_L1_error)
+
+      /* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":304
+ *             if not PyDataType_HASFIELDS(descr):
+ *                 t = descr.type_num
+ *                 if ((descr.byteorder == c'>' and little_endian) or             # <<<<<<<<<<<<<<
+ *                     (descr.byteorder == c'<' and not little_endian)):
+ *                     raise ValueError(u"Non-native byte order not supported")
+ */
+    }
+
+    /* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":307
+ *                     (descr.byteorder == c'<' and not little_endian)):
+ *                     raise ValueError(u"Non-native byte order not supported")
+ *                 if   t == NPY_BYTE:        f = "b"             # <<<<<<<<<<<<<<
+ *                 elif t == NPY_UBYTE:       f = "B"
+ *                 elif t == NPY_SHORT:       f = "h"
+ */
+    switch (__pyx_v_t) {
+      case NPY_BYTE:
+      __pyx_v_f = ((char *)"b");
+      break;
+      case NPY_UBYTE:
+
+      /* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":308
+ *                     raise ValueError(u"Non-native byte order not supported")
+ *                 if   t == NPY_BYTE:        f = "b"
+ *                 elif t == NPY_UBYTE:       f = "B"             # <<<<<<<<<<<<<<
+ *                 elif t == NPY_SHORT:       f = "h"
+ *                 elif t == NPY_USHORT:      f = "H"
+ */
+      __pyx_v_f = ((char *)"B");
+      break;
+      case NPY_SHORT:
+
+      /* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":309
+ *                 if   t == NPY_BYTE:        f = "b"
+ *                 elif t == NPY_UBYTE:       f = "B"
+ *                 elif t == NPY_SHORT:       f = "h"             # <<<<<<<<<<<<<<
+ *                 elif t == NPY_USHORT:      f = "H"
+ *                 elif t == NPY_INT:         f = "i"
+ */
+      __pyx_v_f = ((char *)"h");
+      break;
+      case NPY_USHORT:
+
+      /* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":310
+ *                 elif t == NPY_UBYTE:       f = "B"
+ *                 elif t == NPY_SHORT:       f = "h"
+ *                 elif t == NPY_USHORT:      f = "H"             # <<<<<<<<<<<<<<
+ *                 elif t == NPY_INT:         f = "i"
+ *                 elif t == NPY_UINT:        f = "I"
+ */
+      __pyx_v_f = ((char *)"H");
+      break;
+      case NPY_INT:
+
+      /* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":311
+ *                 elif t == NPY_SHORT:       f = "h"
+ *                 elif t == NPY_USHORT:      f = "H"
+ *                 elif t == NPY_INT:         f = "i"             # <<<<<<<<<<<<<<
+ *                 elif t == NPY_UINT:        f = "I"
+ *                 elif t == NPY_LONG:        f = "l"
+ */
+      __pyx_v_f = ((char *)"i");
+      break;
+      case NPY_UINT:
+
+      /* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":312
+ *                 elif t == NPY_USHORT:      f = "H"
+ *                 elif t == NPY_INT:         f = "i"
+ *                 elif t == NPY_UINT:        f = "I"             # <<<<<<<<<<<<<<
+ *                 elif t == NPY_LONG:        f = "l"
+ *                 elif t == NPY_ULONG:       f = "L"
+ */
+      __pyx_v_f = ((char *)"I");
+      break;
+      case NPY_LONG:
+
+      /* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":313
+ *                 elif t == NPY_INT:         f = "i"
+ *                 elif t == NPY_UINT:        f = "I"
+ *                 elif t == NPY_LONG:        f = "l"             # <<<<<<<<<<<<<<
+ *                 elif t == NPY_ULONG:       f = "L"
+ *                 elif t == NPY_LONGLONG:    f = "q"
+ */
+      __pyx_v_f = ((char *)"l");
+      break;
+      case NPY_ULONG:
+
+      /* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":314
+ *                 elif t == NPY_UINT:        f = "I"
+ *                 elif t == NPY_LONG:        f = "l"
+ *                 elif t == NPY_ULONG:       f = "L"             # <<<<<<<<<<<<<<
+ *                 elif t == NPY_LONGLONG:    f = "q"
+ *                 elif t == NPY_ULONGLONG:   f = "Q"
+ */
+      __pyx_v_f = ((char *)"L");
+      break;
+      case NPY_LONGLONG:
+
+      /* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":315
+ *                 elif t == NPY_LONG:        f = "l"
+ *                 elif t == NPY_ULONG:       f = "L"
+ *                 elif t == NPY_LONGLONG:    f = "q"             # <<<<<<<<<<<<<<
+ *                 elif t == NPY_ULONGLONG:   f = "Q"
+ *                 elif t == NPY_FLOAT:       f = "f"
+ */
+      __pyx_v_f = ((char *)"q");
+      break;
+      case NPY_ULONGLONG:
+
+      /* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":316
+ *                 elif t == NPY_ULONG:       f = "L"
+ *                 elif t == NPY_LONGLONG:    f = "q"
+ *                 elif t == NPY_ULONGLONG:   f = "Q"             # <<<<<<<<<<<<<<
+ *                 elif t == NPY_FLOAT:       f = "f"
+ *                 elif t == NPY_DOUBLE:      f = "d"
+ */
+      __pyx_v_f = ((char *)"Q");
+      break;
+      case NPY_FLOAT:
+
+      /* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":317
+ *                 elif t == NPY_LONGLONG:    f = "q"
+ *                 elif t == NPY_ULONGLONG:   f = "Q"
+ *                 elif t == NPY_FLOAT:       f = "f"             # <<<<<<<<<<<<<<
+ *                 elif t == NPY_DOUBLE:      f = "d"
+ *                 elif t == NPY_LONGDOUBLE:  f = "g"
+ */
+      __pyx_v_f = ((char *)"f");
+      break;
+      case NPY_DOUBLE:
+
+      /* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":318
+ *                 elif t == NPY_ULONGLONG:   f = "Q"
+ *                 elif t == NPY_FLOAT:       f = "f"
+ *                 elif t == NPY_DOUBLE:      f = "d"             # <<<<<<<<<<<<<<
+ *                 elif t == NPY_LONGDOUBLE:  f = "g"
+ *                 elif t == NPY_CFLOAT:      f = "Zf"
+ */
+      __pyx_v_f = ((char *)"d");
+      break;
+      case NPY_LONGDOUBLE:
+
+      /* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":319
+ *                 elif t == NPY_FLOAT:       f = "f"
+ *                 elif t == NPY_DOUBLE:      f = "d"
+ *                 elif t == NPY_LONGDOUBLE:  f = "g"             # <<<<<<<<<<<<<<
+ *                 elif t == NPY_CFLOAT:      f = "Zf"
+ *                 elif t == NPY_CDOUBLE:     f = "Zd"
+ */
+      __pyx_v_f = ((char *)"g");
+      break;
+      case NPY_CFLOAT:
+
+      /* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":320
+ *                 elif t == NPY_DOUBLE:      f = "d"
+ *                 elif t == NPY_LONGDOUBLE:  f = "g"
+ *                 elif t == NPY_CFLOAT:      f = "Zf"             # <<<<<<<<<<<<<<
+ *                 elif t == NPY_CDOUBLE:     f = "Zd"
+ *                 elif t == NPY_CLONGDOUBLE: f = "Zg"
+ */
+      __pyx_v_f = ((char *)"Zf");
+      break;
+      case NPY_CDOUBLE:
+
+      /* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":321
+ *                 elif t == NPY_LONGDOUBLE:  f = "g"
+ *                 elif t == NPY_CFLOAT:      f = "Zf"
+ *                 elif t == NPY_CDOUBLE:     f = "Zd"             # <<<<<<<<<<<<<<
+ *                 elif t == NPY_CLONGDOUBLE: f = "Zg"
+ *                 elif t == NPY_OBJECT:      f = "O"
+ */
+      __pyx_v_f = ((char *)"Zd");
+      break;
+      case NPY_CLONGDOUBLE:
+
+      /* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":322
+ *                 elif t == NPY_CFLOAT:      f = "Zf"
+ *                 elif t == NPY_CDOUBLE:     f = "Zd"
+ *                 elif t == NPY_CLONGDOUBLE: f = "Zg"             # <<<<<<<<<<<<<<
+ *                 elif t == NPY_OBJECT:      f = "O"
+ *                 else:
+ */
+      __pyx_v_f = ((char *)"Zg");
+      break;
+      case NPY_OBJECT:
+
+      /* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":323
+ *                 elif t == NPY_CDOUBLE:     f = "Zd"
+ *                 elif t == NPY_CLONGDOUBLE: f = "Zg"
+ *                 elif t == NPY_OBJECT:      f = "O"             # <<<<<<<<<<<<<<
+ *                 else:
+ *                     raise ValueError(u"unknown dtype code in numpy.pxd (%d)" % t)
+ */
+      __pyx_v_f = ((char *)"O");
+      break;
+      default:
+
+      /* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":325
+ *                 elif t == NPY_OBJECT:      f = "O"
+ *                 else:
+ *                     raise ValueError(u"unknown dtype code in numpy.pxd (%d)" % t)             # <<<<<<<<<<<<<<
+ *                 info.format = f
+ *                 return
+ */
+      __pyx_t_3 = __Pyx_PyInt_From_int(__pyx_v_t); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 325, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_3);
+      __pyx_t_8 = PyUnicode_Format(__pyx_kp_u_unknown_dtype_code_in_numpy_pxd, __pyx_t_3); if (unlikely(!__pyx_t_8)) __PYX_ERR(1, 325, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_8);
+      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+      __pyx_t_3 = __Pyx_PyObject_CallOneArg(__pyx_builtin_ValueError, __pyx_t_8); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 325, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_3);
+      __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+      __Pyx_Raise(__pyx_t_3, 0, 0, 0);
+      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+      __PYX_ERR(1, 325, __pyx_L1_error)
+      break;
+    }
+
+    /* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":326
+ *                 else:
+ *                     raise ValueError(u"unknown dtype code in numpy.pxd (%d)" % t)
+ *                 info.format = f             # <<<<<<<<<<<<<<
+ *                 return
+ *             else:
+ */
+    __pyx_v_info->format = __pyx_v_f;
+
+    /* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":327
+ *                     raise ValueError(u"unknown dtype code in numpy.pxd (%d)" % t)
+ *                 info.format = f
+ *                 return             # <<<<<<<<<<<<<<
+ *             else:
+ *                 info.format = <char*>PyObject_Malloc(_buffer_format_string_len)
+ */
+    __pyx_r = 0;
+    goto __pyx_L0;
+
+    /* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":302
+ *             info.obj = self
+ * 
+ *             if not PyDataType_HASFIELDS(descr):             # <<<<<<<<<<<<<<
+ *                 t = descr.type_num
+ *                 if ((descr.byteorder == c'>' and little_endian) or
+ */
+  }
+
+  /* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":329
+ *                 return
+ *             else:
+ *                 info.format = <char*>PyObject_Malloc(_buffer_format_string_len)             # <<<<<<<<<<<<<<
+ *                 info.format[0] = c'^' # Native data types, manual alignment
+ *                 offset = 0
+ */
+  /*else*/ {
+    __pyx_v_info->format = ((char *)PyObject_Malloc(0xFF));
+
+    /* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":330
+ *             else:
+ *                 info.format = <char*>PyObject_Malloc(_buffer_format_string_len)
+ *                 info.format[0] = c'^' # Native data types, manual alignment             # <<<<<<<<<<<<<<
+ *                 offset = 0
+ *                 f = _util_dtypestring(descr, info.format + 1,
+ */
+    (__pyx_v_info->format[0]) = '^';
+
+    /* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":331
+ *                 info.format = <char*>PyObject_Malloc(_buffer_format_string_len)
+ *                 info.format[0] = c'^' # Native data types, manual alignment
+ *                 offset = 0             # <<<<<<<<<<<<<<
+ *                 f = _util_dtypestring(descr, info.format + 1,
+ *                                       info.format + _buffer_format_string_len,
+ */
+    __pyx_v_offset = 0;
+
+    /* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":332
+ *                 info.format[0] = c'^' # Native data types, manual alignment
+ *                 offset = 0
+ *                 f = _util_dtypestring(descr, info.format + 1,             # <<<<<<<<<<<<<<
+ *                                       info.format + _buffer_format_string_len,
+ *                                       &offset)
+ */
+    __pyx_t_9 = __pyx_f_5numpy__util_dtypestring(__pyx_v_descr, (__pyx_v_info->format + 1), (__pyx_v_info->format + 0xFF), (&__pyx_v_offset)); if (unlikely(__pyx_t_9 == ((char *)NULL))) __PYX_ERR(1, 332, __pyx_L1_error)
+    __pyx_v_f = __pyx_t_9;
+
+    /* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":335
+ *                                       info.format + _buffer_format_string_len,
+ *                                       &offset)
+ *                 f[0] = c'\0' # Terminate format string             # <<<<<<<<<<<<<<
+ * 
+ *         def __releasebuffer__(ndarray self, Py_buffer* info):
+ */
+    (__pyx_v_f[0]) = '\x00';
+  }
+
+  /* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":258
+ *         # experimental exception made for __getbuffer__ and __releasebuffer__
+ *         # -- the details of this may change.
+ *         def __getbuffer__(ndarray self, Py_buffer* info, int flags):             # <<<<<<<<<<<<<<
+ *             # This implementation of getbuffer is geared towards Cython
+ *             # requirements, and does not yet fulfill the PEP.
+ */
+
+  /* function exit code */
+  __pyx_r = 0;
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_8);
+  __Pyx_AddTraceback("numpy.ndarray.__getbuffer__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1;
+  if (__pyx_v_info->obj != NULL) {
+    __Pyx_GOTREF(__pyx_v_info->obj);
+    __Pyx_DECREF(__pyx_v_info->obj); __pyx_v_info->obj = 0;
+  }
+  goto __pyx_L2;
+  __pyx_L0:;
+  if (__pyx_v_info->obj == Py_None) {
+    __Pyx_GOTREF(__pyx_v_info->obj);
+    __Pyx_DECREF(__pyx_v_info->obj); __pyx_v_info->obj = 0;
+  }
+  __pyx_L2:;
+  __Pyx_XDECREF((PyObject *)__pyx_v_descr);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":337
+ *                 f[0] = c'\0' # Terminate format string
+ * 
+ *         def __releasebuffer__(ndarray self, Py_buffer* info):             # <<<<<<<<<<<<<<
+ *             if PyArray_HASFIELDS(self):
+ *                 PyObject_Free(info.format)
+ */
+
+/* Python wrapper */
+static CYTHON_UNUSED void __pyx_pw_5numpy_7ndarray_3__releasebuffer__(PyObject *__pyx_v_self, Py_buffer *__pyx_v_info); /*proto*/
+static CYTHON_UNUSED void __pyx_pw_5numpy_7ndarray_3__releasebuffer__(PyObject *__pyx_v_self, Py_buffer *__pyx_v_info) {
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__releasebuffer__ (wrapper)", 0);
+  __pyx_pf_5numpy_7ndarray_2__releasebuffer__(((PyArrayObject *)__pyx_v_self), ((Py_buffer *)__pyx_v_info));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+}
+
+static void __pyx_pf_5numpy_7ndarray_2__releasebuffer__(PyArrayObject *__pyx_v_self, Py_buffer *__pyx_v_info) {
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  __Pyx_RefNannySetupContext("__releasebuffer__", 0);
+
+  /* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":338
+ * 
+ *         def __releasebuffer__(ndarray self, Py_buffer* info):
+ *             if PyArray_HASFIELDS(self):             # <<<<<<<<<<<<<<
+ *                 PyObject_Free(info.format)
+ *             if sizeof(npy_intp) != sizeof(Py_ssize_t):
+ */
+  __pyx_t_1 = (PyArray_HASFIELDS(__pyx_v_self) != 0);
+  if (__pyx_t_1) {
+
+    /* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":339
+ *         def __releasebuffer__(ndarray self, Py_buffer* info):
+ *             if PyArray_HASFIELDS(self):
+ *                 PyObject_Free(info.format)             # <<<<<<<<<<<<<<
+ *             if sizeof(npy_intp) != sizeof(Py_ssize_t):
+ *                 PyObject_Free(info.strides)
+ */
+    PyObject_Free(__pyx_v_info->format);
+
+    /* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":338
+ * 
+ *         def __releasebuffer__(ndarray self, Py_buffer* info):
+ *             if PyArray_HASFIELDS(self):             # <<<<<<<<<<<<<<
+ *                 PyObject_Free(info.format)
+ *             if sizeof(npy_intp) != sizeof(Py_ssize_t):
+ */
+  }
+
+  /* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":340
+ *             if PyArray_HASFIELDS(self):
+ *                 PyObject_Free(info.format)
+ *             if sizeof(npy_intp) != sizeof(Py_ssize_t):             # <<<<<<<<<<<<<<
+ *                 PyObject_Free(info.strides)
+ *                 # info.shape was stored after info.strides in the same block
+ */
+  __pyx_t_1 = (((sizeof(npy_intp)) != (sizeof(Py_ssize_t))) != 0);
+  if (__pyx_t_1) {
+
+    /* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":341
+ *                 PyObject_Free(info.format)
+ *             if sizeof(npy_intp) != sizeof(Py_ssize_t):
+ *                 PyObject_Free(info.strides)             # <<<<<<<<<<<<<<
+ *                 # info.shape was stored after info.strides in the same block
+ * 
+ */
+    PyObject_Free(__pyx_v_info->strides);
+
+    /* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":340
+ *             if PyArray_HASFIELDS(self):
+ *                 PyObject_Free(info.format)
+ *             if sizeof(npy_intp) != sizeof(Py_ssize_t):             # <<<<<<<<<<<<<<
+ *                 PyObject_Free(info.strides)
+ *                 # info.shape was stored after info.strides in the same block
+ */
+  }
+
+  /* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":337
+ *                 f[0] = c'\0' # Terminate format string
+ * 
+ *         def __releasebuffer__(ndarray self, Py_buffer* info):             # <<<<<<<<<<<<<<
+ *             if PyArray_HASFIELDS(self):
+ *                 PyObject_Free(info.format)
+ */
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+}
+
+/* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":821
+ * ctypedef npy_cdouble     complex_t
+ * 
+ * cdef inline object PyArray_MultiIterNew1(a):             # <<<<<<<<<<<<<<
+ *     return PyArray_MultiIterNew(1, <void*>a)
+ * 
+ */
+
+static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew1(PyObject *__pyx_v_a) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  __Pyx_RefNannySetupContext("PyArray_MultiIterNew1", 0);
+
+  /* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":822
+ * 
+ * cdef inline object PyArray_MultiIterNew1(a):
+ *     return PyArray_MultiIterNew(1, <void*>a)             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline object PyArray_MultiIterNew2(a, b):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = PyArray_MultiIterNew(1, ((void *)__pyx_v_a)); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 822, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":821
+ * ctypedef npy_cdouble     complex_t
+ * 
+ * cdef inline object PyArray_MultiIterNew1(a):             # <<<<<<<<<<<<<<
+ *     return PyArray_MultiIterNew(1, <void*>a)
+ * 
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("numpy.PyArray_MultiIterNew1", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":824
+ *     return PyArray_MultiIterNew(1, <void*>a)
+ * 
+ * cdef inline object PyArray_MultiIterNew2(a, b):             # <<<<<<<<<<<<<<
+ *     return PyArray_MultiIterNew(2, <void*>a, <void*>b)
+ * 
+ */
+
+static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew2(PyObject *__pyx_v_a, PyObject *__pyx_v_b) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  __Pyx_RefNannySetupContext("PyArray_MultiIterNew2", 0);
+
+  /* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":825
+ * 
+ * cdef inline object PyArray_MultiIterNew2(a, b):
+ *     return PyArray_MultiIterNew(2, <void*>a, <void*>b)             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline object PyArray_MultiIterNew3(a, b, c):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = PyArray_MultiIterNew(2, ((void *)__pyx_v_a), ((void *)__pyx_v_b)); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 825, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":824
+ *     return PyArray_MultiIterNew(1, <void*>a)
+ * 
+ * cdef inline object PyArray_MultiIterNew2(a, b):             # <<<<<<<<<<<<<<
+ *     return PyArray_MultiIterNew(2, <void*>a, <void*>b)
+ * 
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("numpy.PyArray_MultiIterNew2", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":827
+ *     return PyArray_MultiIterNew(2, <void*>a, <void*>b)
+ * 
+ * cdef inline object PyArray_MultiIterNew3(a, b, c):             # <<<<<<<<<<<<<<
+ *     return PyArray_MultiIterNew(3, <void*>a, <void*>b, <void*> c)
+ * 
+ */
+
+static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew3(PyObject *__pyx_v_a, PyObject *__pyx_v_b, PyObject *__pyx_v_c) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  __Pyx_RefNannySetupContext("PyArray_MultiIterNew3", 0);
+
+  /* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":828
+ * 
+ * cdef inline object PyArray_MultiIterNew3(a, b, c):
+ *     return PyArray_MultiIterNew(3, <void*>a, <void*>b, <void*> c)             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline object PyArray_MultiIterNew4(a, b, c, d):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = PyArray_MultiIterNew(3, ((void *)__pyx_v_a), ((void *)__pyx_v_b), ((void *)__pyx_v_c)); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 828, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":827
+ *     return PyArray_MultiIterNew(2, <void*>a, <void*>b)
+ * 
+ * cdef inline object PyArray_MultiIterNew3(a, b, c):             # <<<<<<<<<<<<<<
+ *     return PyArray_MultiIterNew(3, <void*>a, <void*>b, <void*> c)
+ * 
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("numpy.PyArray_MultiIterNew3", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":830
+ *     return PyArray_MultiIterNew(3, <void*>a, <void*>b, <void*> c)
+ * 
+ * cdef inline object PyArray_MultiIterNew4(a, b, c, d):             # <<<<<<<<<<<<<<
+ *     return PyArray_MultiIterNew(4, <void*>a, <void*>b, <void*>c, <void*> d)
+ * 
+ */
+
+static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew4(PyObject *__pyx_v_a, PyObject *__pyx_v_b, PyObject *__pyx_v_c, PyObject *__pyx_v_d) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  __Pyx_RefNannySetupContext("PyArray_MultiIterNew4", 0);
+
+  /* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":831
+ * 
+ * cdef inline object PyArray_MultiIterNew4(a, b, c, d):
+ *     return PyArray_MultiIterNew(4, <void*>a, <void*>b, <void*>c, <void*> d)             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline object PyArray_MultiIterNew5(a, b, c, d, e):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = PyArray_MultiIterNew(4, ((void *)__pyx_v_a), ((void *)__pyx_v_b), ((void *)__pyx_v_c), ((void *)__pyx_v_d)); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 831, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":830
+ *     return PyArray_MultiIterNew(3, <void*>a, <void*>b, <void*> c)
+ * 
+ * cdef inline object PyArray_MultiIterNew4(a, b, c, d):             # <<<<<<<<<<<<<<
+ *     return PyArray_MultiIterNew(4, <void*>a, <void*>b, <void*>c, <void*> d)
+ * 
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("numpy.PyArray_MultiIterNew4", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":833
+ *     return PyArray_MultiIterNew(4, <void*>a, <void*>b, <void*>c, <void*> d)
+ * 
+ * cdef inline object PyArray_MultiIterNew5(a, b, c, d, e):             # <<<<<<<<<<<<<<
+ *     return PyArray_MultiIterNew(5, <void*>a, <void*>b, <void*>c, <void*> d, <void*> e)
+ * 
+ */
+
+static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew5(PyObject *__pyx_v_a, PyObject *__pyx_v_b, PyObject *__pyx_v_c, PyObject *__pyx_v_d, PyObject *__pyx_v_e) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  __Pyx_RefNannySetupContext("PyArray_MultiIterNew5", 0);
+
+  /* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":834
+ * 
+ * cdef inline object PyArray_MultiIterNew5(a, b, c, d, e):
+ *     return PyArray_MultiIterNew(5, <void*>a, <void*>b, <void*>c, <void*> d, <void*> e)             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline tuple PyDataType_SHAPE(dtype d):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = PyArray_MultiIterNew(5, ((void *)__pyx_v_a), ((void *)__pyx_v_b), ((void *)__pyx_v_c), ((void *)__pyx_v_d), ((void *)__pyx_v_e)); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 834, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":833
+ *     return PyArray_MultiIterNew(4, <void*>a, <void*>b, <void*>c, <void*> d)
+ * 
+ * cdef inline object PyArray_MultiIterNew5(a, b, c, d, e):             # <<<<<<<<<<<<<<
+ *     return PyArray_MultiIterNew(5, <void*>a, <void*>b, <void*>c, <void*> d, <void*> e)
+ * 
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("numpy.PyArray_MultiIterNew5", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":836
+ *     return PyArray_MultiIterNew(5, <void*>a, <void*>b, <void*>c, <void*> d, <void*> e)
+ * 
+ * cdef inline tuple PyDataType_SHAPE(dtype d):             # <<<<<<<<<<<<<<
+ *     if PyDataType_HASSUBARRAY(d):
+ *         return <tuple>d.subarray.shape
+ */
+
+static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyDataType_SHAPE(PyArray_Descr *__pyx_v_d) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  __Pyx_RefNannySetupContext("PyDataType_SHAPE", 0);
+
+  /* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":837
+ * 
+ * cdef inline tuple PyDataType_SHAPE(dtype d):
+ *     if PyDataType_HASSUBARRAY(d):             # <<<<<<<<<<<<<<
+ *         return <tuple>d.subarray.shape
+ *     else:
+ */
+  __pyx_t_1 = (PyDataType_HASSUBARRAY(__pyx_v_d) != 0);
+  if (__pyx_t_1) {
+
+    /* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":838
+ * cdef inline tuple PyDataType_SHAPE(dtype d):
+ *     if PyDataType_HASSUBARRAY(d):
+ *         return <tuple>d.subarray.shape             # <<<<<<<<<<<<<<
+ *     else:
+ *         return ()
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __Pyx_INCREF(((PyObject*)__pyx_v_d->subarray->shape));
+    __pyx_r = ((PyObject*)__pyx_v_d->subarray->shape);
+    goto __pyx_L0;
+
+    /* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":837
+ * 
+ * cdef inline tuple PyDataType_SHAPE(dtype d):
+ *     if PyDataType_HASSUBARRAY(d):             # <<<<<<<<<<<<<<
+ *         return <tuple>d.subarray.shape
+ *     else:
+ */
+  }
+
+  /* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":840
+ *         return <tuple>d.subarray.shape
+ *     else:
+ *         return ()             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline char* _util_dtypestring(dtype descr, char* f, char* end, int* offset) except NULL:
+ */
+  /*else*/ {
+    __Pyx_XDECREF(__pyx_r);
+    __Pyx_INCREF(__pyx_empty_tuple);
+    __pyx_r = __pyx_empty_tuple;
+    goto __pyx_L0;
+  }
+
+  /* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":836
+ *     return PyArray_MultiIterNew(5, <void*>a, <void*>b, <void*>c, <void*> d, <void*> e)
+ * 
+ * cdef inline tuple PyDataType_SHAPE(dtype d):             # <<<<<<<<<<<<<<
+ *     if PyDataType_HASSUBARRAY(d):
+ *         return <tuple>d.subarray.shape
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":842
+ *         return ()
+ * 
+ * cdef inline char* _util_dtypestring(dtype descr, char* f, char* end, int* offset) except NULL:             # <<<<<<<<<<<<<<
+ *     # Recursive utility function used in __getbuffer__ to get format
+ *     # string. The new location in the format string is returned.
+ */
+
+static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx_v_descr, char *__pyx_v_f, char *__pyx_v_end, int *__pyx_v_offset) {
+  PyArray_Descr *__pyx_v_child = 0;
+  int __pyx_v_endian_detector;
+  int __pyx_v_little_endian;
+  PyObject *__pyx_v_fields = 0;
+  PyObject *__pyx_v_childname = NULL;
+  PyObject *__pyx_v_new_offset = NULL;
+  PyObject *__pyx_v_t = NULL;
+  char *__pyx_r;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  Py_ssize_t __pyx_t_2;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  int __pyx_t_5;
+  int __pyx_t_6;
+  int __pyx_t_7;
+  long __pyx_t_8;
+  char *__pyx_t_9;
+  __Pyx_RefNannySetupContext("_util_dtypestring", 0);
+
+  /* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":847
+ * 
+ *     cdef dtype child
+ *     cdef int endian_detector = 1             # <<<<<<<<<<<<<<
+ *     cdef bint little_endian = ((<char*>&endian_detector)[0] != 0)
+ *     cdef tuple fields
+ */
+  __pyx_v_endian_detector = 1;
+
+  /* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":848
+ *     cdef dtype child
+ *     cdef int endian_detector = 1
+ *     cdef bint little_endian = ((<char*>&endian_detector)[0] != 0)             # <<<<<<<<<<<<<<
+ *     cdef tuple fields
+ * 
+ */
+  __pyx_v_little_endian = ((((char *)(&__pyx_v_endian_detector))[0]) != 0);
+
+  /* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":851
+ *     cdef tuple fields
+ * 
+ *     for childname in descr.names:             # <<<<<<<<<<<<<<
+ *         fields = descr.fields[childname]
+ *         child, new_offset = fields
+ */
+  if (unlikely(__pyx_v_descr->names == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "'NoneType' object is not iterable");
+    __PYX_ERR(1, 851, __pyx_L1_error)
+  }
+  __pyx_t_1 = __pyx_v_descr->names; __Pyx_INCREF(__pyx_t_1); __pyx_t_2 = 0;
+  for (;;) {
+    if (__pyx_t_2 >= PyTuple_GET_SIZE(__pyx_t_1)) break;
+    #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+    __pyx_t_3 = PyTuple_GET_ITEM(__pyx_t_1, __pyx_t_2); __Pyx_INCREF(__pyx_t_3); __pyx_t_2++; if (unlikely(0 < 0)) __PYX_ERR(1, 851, __pyx_L1_error)
+    #else
+    __pyx_t_3 = PySequence_ITEM(__pyx_t_1, __pyx_t_2); __pyx_t_2++; if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 851, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    #endif
+    __Pyx_XDECREF_SET(__pyx_v_childname, __pyx_t_3);
+    __pyx_t_3 = 0;
+
+    /* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":852
+ * 
+ *     for childname in descr.names:
+ *         fields = descr.fields[childname]             # <<<<<<<<<<<<<<
+ *         child, new_offset = fields
+ * 
+ */
+    if (unlikely(__pyx_v_descr->fields == Py_None)) {
+      PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+      __PYX_ERR(1, 852, __pyx_L1_error)
+    }
+    __pyx_t_3 = __Pyx_PyDict_GetItem(__pyx_v_descr->fields, __pyx_v_childname); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 852, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    if (!(likely(PyTuple_CheckExact(__pyx_t_3))||((__pyx_t_3) == Py_None)||(PyErr_Format(PyExc_TypeError, "Expected %.16s, got %.200s", "tuple", Py_TYPE(__pyx_t_3)->tp_name), 0))) __PYX_ERR(1, 852, __pyx_L1_error)
+    __Pyx_XDECREF_SET(__pyx_v_fields, ((PyObject*)__pyx_t_3));
+    __pyx_t_3 = 0;
+
+    /* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":853
+ *     for childname in descr.names:
+ *         fields = descr.fields[childname]
+ *         child, new_offset = fields             # <<<<<<<<<<<<<<
+ * 
+ *         if (end - f) - <int>(new_offset - offset[0]) < 15:
+ */
+    if (likely(__pyx_v_fields != Py_None)) {
+      PyObject* sequence = __pyx_v_fields;
+      Py_ssize_t size = __Pyx_PySequence_SIZE(sequence);
+      if (unlikely(size != 2)) {
+        if (size > 2) __Pyx_RaiseTooManyValuesError(2);
+        else if (size >= 0) __Pyx_RaiseNeedMoreValuesError(size);
+        __PYX_ERR(1, 853, __pyx_L1_error)
+      }
+      #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+      __pyx_t_3 = PyTuple_GET_ITEM(sequence, 0); 
+      __pyx_t_4 = PyTuple_GET_ITEM(sequence, 1); 
+      __Pyx_INCREF(__pyx_t_3);
+      __Pyx_INCREF(__pyx_t_4);
+      #else
+      __pyx_t_3 = PySequence_ITEM(sequence, 0); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 853, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_3);
+      __pyx_t_4 = PySequence_ITEM(sequence, 1); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 853, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_4);
+      #endif
+    } else {
+      __Pyx_RaiseNoneNotIterableError(); __PYX_ERR(1, 853, __pyx_L1_error)
+    }
+    if (!(likely(((__pyx_t_3) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_3, __pyx_ptype_5numpy_dtype))))) __PYX_ERR(1, 853, __pyx_L1_error)
+    __Pyx_XDECREF_SET(__pyx_v_child, ((PyArray_Descr *)__pyx_t_3));
+    __pyx_t_3 = 0;
+    __Pyx_XDECREF_SET(__pyx_v_new_offset, __pyx_t_4);
+    __pyx_t_4 = 0;
+
+    /* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":855
+ *         child, new_offset = fields
+ * 
+ *         if (end - f) - <int>(new_offset - offset[0]) < 15:             # <<<<<<<<<<<<<<
+ *             raise RuntimeError(u"Format string allocated too short, see comment in numpy.pxd")
+ * 
+ */
+    __pyx_t_4 = __Pyx_PyInt_From_int((__pyx_v_offset[0])); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 855, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __pyx_t_3 = PyNumber_Subtract(__pyx_v_new_offset, __pyx_t_4); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 855, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __pyx_t_5 = __Pyx_PyInt_As_int(__pyx_t_3); if (unlikely((__pyx_t_5 == (int)-1) && PyErr_Occurred())) __PYX_ERR(1, 855, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __pyx_t_6 = ((((__pyx_v_end - __pyx_v_f) - ((int)__pyx_t_5)) < 15) != 0);
+    if (unlikely(__pyx_t_6)) {
+
+      /* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":856
+ * 
+ *         if (end - f) - <int>(new_offset - offset[0]) < 15:
+ *             raise RuntimeError(u"Format string allocated too short, see comment in numpy.pxd")             # <<<<<<<<<<<<<<
+ * 
+ *         if ((child.byteorder == c'>' and little_endian) or
+ */
+      __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_RuntimeError, __pyx_tuple__12, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 856, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_3);
+      __Pyx_Raise(__pyx_t_3, 0, 0, 0);
+      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+      __PYX_ERR(1, 856, __pyx_L1_error)
+
+      /* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":855
+ *         child, new_offset = fields
+ * 
+ *         if (end - f) - <int>(new_offset - offset[0]) < 15:             # <<<<<<<<<<<<<<
+ *             raise RuntimeError(u"Format string allocated too short, see comment in numpy.pxd")
+ * 
+ */
+    }
+
+    /* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":858
+ *             raise RuntimeError(u"Format string allocated too short, see comment in numpy.pxd")
+ * 
+ *         if ((child.byteorder == c'>' and little_endian) or             # <<<<<<<<<<<<<<
  *             (child.byteorder == c'<' and not little_endian)):
  *             raise ValueError(u"Non-native byte order not supported")
  */
@@ -6743,7 +15664,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
     }
     __pyx_L8_next_or:;
 
-    /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":859
+    /* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":859
  * 
  *         if ((child.byteorder == c'>' and little_endian) or
  *             (child.byteorder == c'<' and not little_endian)):             # <<<<<<<<<<<<<<
@@ -6760,7 +15681,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
     __pyx_t_6 = __pyx_t_7;
     __pyx_L7_bool_binop_done:;
 
-    /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":858
+    /* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":858
  *             raise RuntimeError(u"Format string allocated too short, see comment in numpy.pxd")
  * 
  *         if ((child.byteorder == c'>' and little_endian) or             # <<<<<<<<<<<<<<
@@ -6769,20 +15690,20 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
  */
     if (unlikely(__pyx_t_6)) {
 
-      /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":860
+      /* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":860
  *         if ((child.byteorder == c'>' and little_endian) or
  *             (child.byteorder == c'<' and not little_endian)):
  *             raise ValueError(u"Non-native byte order not supported")             # <<<<<<<<<<<<<<
  *             # One could encode it in the format string and have Cython
  *             # complain instead, BUT: < and > in format strings also imply
  */
-      __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__6, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 860, __pyx_L1_error)
+      __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__11, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 860, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_3);
       __Pyx_Raise(__pyx_t_3, 0, 0, 0);
       __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
       __PYX_ERR(1, 860, __pyx_L1_error)
 
-      /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":858
+      /* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":858
  *             raise RuntimeError(u"Format string allocated too short, see comment in numpy.pxd")
  * 
  *         if ((child.byteorder == c'>' and little_endian) or             # <<<<<<<<<<<<<<
@@ -6791,7 +15712,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
  */
     }
 
-    /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":870
+    /* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":870
  * 
  *         # Output padding bytes
  *         while offset[0] < new_offset:             # <<<<<<<<<<<<<<
@@ -6807,7 +15728,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
       __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
       if (!__pyx_t_6) break;
 
-      /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":871
+      /* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":871
  *         # Output padding bytes
  *         while offset[0] < new_offset:
  *             f[0] = 120 # "x"; pad byte             # <<<<<<<<<<<<<<
@@ -6816,7 +15737,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
  */
       (__pyx_v_f[0]) = 0x78;
 
-      /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":872
+      /* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":872
  *         while offset[0] < new_offset:
  *             f[0] = 120 # "x"; pad byte
  *             f += 1             # <<<<<<<<<<<<<<
@@ -6825,7 +15746,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
  */
       __pyx_v_f = (__pyx_v_f + 1);
 
-      /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":873
+      /* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":873
  *             f[0] = 120 # "x"; pad byte
  *             f += 1
  *             offset[0] += 1             # <<<<<<<<<<<<<<
@@ -6836,7 +15757,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
       (__pyx_v_offset[__pyx_t_8]) = ((__pyx_v_offset[__pyx_t_8]) + 1);
     }
 
-    /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":875
+    /* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":875
  *             offset[0] += 1
  * 
  *         offset[0] += child.itemsize             # <<<<<<<<<<<<<<
@@ -6846,7 +15767,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
     __pyx_t_8 = 0;
     (__pyx_v_offset[__pyx_t_8]) = ((__pyx_v_offset[__pyx_t_8]) + __pyx_v_child->elsize);
 
-    /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":877
+    /* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":877
  *         offset[0] += child.itemsize
  * 
  *         if not PyDataType_HASFIELDS(child):             # <<<<<<<<<<<<<<
@@ -6856,7 +15777,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
     __pyx_t_6 = ((!(PyDataType_HASFIELDS(__pyx_v_child) != 0)) != 0);
     if (__pyx_t_6) {
 
-      /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":878
+      /* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":878
  * 
  *         if not PyDataType_HASFIELDS(child):
  *             t = child.type_num             # <<<<<<<<<<<<<<
@@ -6868,7 +15789,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
       __Pyx_XDECREF_SET(__pyx_v_t, __pyx_t_4);
       __pyx_t_4 = 0;
 
-      /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":879
+      /* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":879
  *         if not PyDataType_HASFIELDS(child):
  *             t = child.type_num
  *             if end - f < 5:             # <<<<<<<<<<<<<<
@@ -6878,20 +15799,20 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
       __pyx_t_6 = (((__pyx_v_end - __pyx_v_f) < 5) != 0);
       if (unlikely(__pyx_t_6)) {
 
-        /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":880
+        /* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":880
  *             t = child.type_num
  *             if end - f < 5:
  *                 raise RuntimeError(u"Format string allocated too short.")             # <<<<<<<<<<<<<<
  * 
  *             # Until ticket #99 is fixed, use integers to avoid warnings
  */
-        __pyx_t_4 = __Pyx_PyObject_Call(__pyx_builtin_RuntimeError, __pyx_tuple__8, NULL); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 880, __pyx_L1_error)
+        __pyx_t_4 = __Pyx_PyObject_Call(__pyx_builtin_RuntimeError, __pyx_tuple__13, NULL); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 880, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_4);
         __Pyx_Raise(__pyx_t_4, 0, 0, 0);
         __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
         __PYX_ERR(1, 880, __pyx_L1_error)
 
-        /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":879
+        /* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":879
  *         if not PyDataType_HASFIELDS(child):
  *             t = child.type_num
  *             if end - f < 5:             # <<<<<<<<<<<<<<
@@ -6900,7 +15821,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
  */
       }
 
-      /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":883
+      /* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":883
  * 
  *             # Until ticket #99 is fixed, use integers to avoid warnings
  *             if   t == NPY_BYTE:        f[0] =  98 #"b"             # <<<<<<<<<<<<<<
@@ -6918,7 +15839,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
         goto __pyx_L15;
       }
 
-      /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":884
+      /* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":884
  *             # Until ticket #99 is fixed, use integers to avoid warnings
  *             if   t == NPY_BYTE:        f[0] =  98 #"b"
  *             elif t == NPY_UBYTE:       f[0] =  66 #"B"             # <<<<<<<<<<<<<<
@@ -6936,7 +15857,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
         goto __pyx_L15;
       }
 
-      /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":885
+      /* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":885
  *             if   t == NPY_BYTE:        f[0] =  98 #"b"
  *             elif t == NPY_UBYTE:       f[0] =  66 #"B"
  *             elif t == NPY_SHORT:       f[0] = 104 #"h"             # <<<<<<<<<<<<<<
@@ -6954,7 +15875,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
         goto __pyx_L15;
       }
 
-      /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":886
+      /* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":886
  *             elif t == NPY_UBYTE:       f[0] =  66 #"B"
  *             elif t == NPY_SHORT:       f[0] = 104 #"h"
  *             elif t == NPY_USHORT:      f[0] =  72 #"H"             # <<<<<<<<<<<<<<
@@ -6972,7 +15893,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
         goto __pyx_L15;
       }
 
-      /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":887
+      /* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":887
  *             elif t == NPY_SHORT:       f[0] = 104 #"h"
  *             elif t == NPY_USHORT:      f[0] =  72 #"H"
  *             elif t == NPY_INT:         f[0] = 105 #"i"             # <<<<<<<<<<<<<<
@@ -6990,7 +15911,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
         goto __pyx_L15;
       }
 
-      /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":888
+      /* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":888
  *             elif t == NPY_USHORT:      f[0] =  72 #"H"
  *             elif t == NPY_INT:         f[0] = 105 #"i"
  *             elif t == NPY_UINT:        f[0] =  73 #"I"             # <<<<<<<<<<<<<<
@@ -7008,7 +15929,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
         goto __pyx_L15;
       }
 
-      /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":889
+      /* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":889
  *             elif t == NPY_INT:         f[0] = 105 #"i"
  *             elif t == NPY_UINT:        f[0] =  73 #"I"
  *             elif t == NPY_LONG:        f[0] = 108 #"l"             # <<<<<<<<<<<<<<
@@ -7026,7 +15947,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
         goto __pyx_L15;
       }
 
-      /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":890
+      /* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":890
  *             elif t == NPY_UINT:        f[0] =  73 #"I"
  *             elif t == NPY_LONG:        f[0] = 108 #"l"
  *             elif t == NPY_ULONG:       f[0] = 76  #"L"             # <<<<<<<<<<<<<<
@@ -7044,7 +15965,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
         goto __pyx_L15;
       }
 
-      /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":891
+      /* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":891
  *             elif t == NPY_LONG:        f[0] = 108 #"l"
  *             elif t == NPY_ULONG:       f[0] = 76  #"L"
  *             elif t == NPY_LONGLONG:    f[0] = 113 #"q"             # <<<<<<<<<<<<<<
@@ -7062,7 +15983,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
         goto __pyx_L15;
       }
 
-      /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":892
+      /* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":892
  *             elif t == NPY_ULONG:       f[0] = 76  #"L"
  *             elif t == NPY_LONGLONG:    f[0] = 113 #"q"
  *             elif t == NPY_ULONGLONG:   f[0] = 81  #"Q"             # <<<<<<<<<<<<<<
@@ -7080,7 +16001,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
         goto __pyx_L15;
       }
 
-      /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":893
+      /* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":893
  *             elif t == NPY_LONGLONG:    f[0] = 113 #"q"
  *             elif t == NPY_ULONGLONG:   f[0] = 81  #"Q"
  *             elif t == NPY_FLOAT:       f[0] = 102 #"f"             # <<<<<<<<<<<<<<
@@ -7098,7 +16019,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
         goto __pyx_L15;
       }
 
-      /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":894
+      /* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":894
  *             elif t == NPY_ULONGLONG:   f[0] = 81  #"Q"
  *             elif t == NPY_FLOAT:       f[0] = 102 #"f"
  *             elif t == NPY_DOUBLE:      f[0] = 100 #"d"             # <<<<<<<<<<<<<<
@@ -7116,7 +16037,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
         goto __pyx_L15;
       }
 
-      /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":895
+      /* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":895
  *             elif t == NPY_FLOAT:       f[0] = 102 #"f"
  *             elif t == NPY_DOUBLE:      f[0] = 100 #"d"
  *             elif t == NPY_LONGDOUBLE:  f[0] = 103 #"g"             # <<<<<<<<<<<<<<
@@ -7134,7 +16055,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
         goto __pyx_L15;
       }
 
-      /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":896
+      /* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":896
  *             elif t == NPY_DOUBLE:      f[0] = 100 #"d"
  *             elif t == NPY_LONGDOUBLE:  f[0] = 103 #"g"
  *             elif t == NPY_CFLOAT:      f[0] = 90; f[1] = 102; f += 1 # Zf             # <<<<<<<<<<<<<<
@@ -7154,7 +16075,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
         goto __pyx_L15;
       }
 
-      /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":897
+      /* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":897
  *             elif t == NPY_LONGDOUBLE:  f[0] = 103 #"g"
  *             elif t == NPY_CFLOAT:      f[0] = 90; f[1] = 102; f += 1 # Zf
  *             elif t == NPY_CDOUBLE:     f[0] = 90; f[1] = 100; f += 1 # Zd             # <<<<<<<<<<<<<<
@@ -7174,7 +16095,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
         goto __pyx_L15;
       }
 
-      /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":898
+      /* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":898
  *             elif t == NPY_CFLOAT:      f[0] = 90; f[1] = 102; f += 1 # Zf
  *             elif t == NPY_CDOUBLE:     f[0] = 90; f[1] = 100; f += 1 # Zd
  *             elif t == NPY_CLONGDOUBLE: f[0] = 90; f[1] = 103; f += 1 # Zg             # <<<<<<<<<<<<<<
@@ -7194,7 +16115,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
         goto __pyx_L15;
       }
 
-      /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":899
+      /* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":899
  *             elif t == NPY_CDOUBLE:     f[0] = 90; f[1] = 100; f += 1 # Zd
  *             elif t == NPY_CLONGDOUBLE: f[0] = 90; f[1] = 103; f += 1 # Zg
  *             elif t == NPY_OBJECT:      f[0] = 79 #"O"             # <<<<<<<<<<<<<<
@@ -7212,7 +16133,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
         goto __pyx_L15;
       }
 
-      /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":901
+      /* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":901
  *             elif t == NPY_OBJECT:      f[0] = 79 #"O"
  *             else:
  *                 raise ValueError(u"unknown dtype code in numpy.pxd (%d)" % t)             # <<<<<<<<<<<<<<
@@ -7231,7 +16152,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
       }
       __pyx_L15:;
 
-      /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":902
+      /* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":902
  *             else:
  *                 raise ValueError(u"unknown dtype code in numpy.pxd (%d)" % t)
  *             f += 1             # <<<<<<<<<<<<<<
@@ -7240,7 +16161,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
  */
       __pyx_v_f = (__pyx_v_f + 1);
 
-      /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":877
+      /* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":877
  *         offset[0] += child.itemsize
  * 
  *         if not PyDataType_HASFIELDS(child):             # <<<<<<<<<<<<<<
@@ -7250,7 +16171,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
       goto __pyx_L13;
     }
 
-    /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":906
+    /* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":906
  *             # Cython ignores struct boundary information ("T{...}"),
  *             # so don't output it
  *             f = _util_dtypestring(child, f, end, offset)             # <<<<<<<<<<<<<<
@@ -7263,7 +16184,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
     }
     __pyx_L13:;
 
-    /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":851
+    /* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":851
  *     cdef tuple fields
  * 
  *     for childname in descr.names:             # <<<<<<<<<<<<<<
@@ -7273,7 +16194,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
   }
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":907
+  /* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":907
  *             # so don't output it
  *             f = _util_dtypestring(child, f, end, offset)
  *     return f             # <<<<<<<<<<<<<<
@@ -7283,7 +16204,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
   __pyx_r = __pyx_v_f;
   goto __pyx_L0;
 
-  /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":842
+  /* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":842
  *         return ()
  * 
  * cdef inline char* _util_dtypestring(dtype descr, char* f, char* end, int* offset) except NULL:             # <<<<<<<<<<<<<<
@@ -7308,7 +16229,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
   return __pyx_r;
 }
 
-/* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":1022
+/* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":1022
  *     int _import_umath() except -1
  * 
  * cdef inline void set_array_base(ndarray arr, object base):             # <<<<<<<<<<<<<<
@@ -7320,7 +16241,7 @@ static CYTHON_INLINE void __pyx_f_5numpy_set_array_base(PyArrayObject *__pyx_v_a
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("set_array_base", 0);
 
-  /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":1023
+  /* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":1023
  * 
  * cdef inline void set_array_base(ndarray arr, object base):
  *     Py_INCREF(base) # important to do this before stealing the reference below!             # <<<<<<<<<<<<<<
@@ -7329,7 +16250,7 @@ static CYTHON_INLINE void __pyx_f_5numpy_set_array_base(PyArrayObject *__pyx_v_a
  */
   Py_INCREF(__pyx_v_base);
 
-  /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":1024
+  /* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":1024
  * cdef inline void set_array_base(ndarray arr, object base):
  *     Py_INCREF(base) # important to do this before stealing the reference below!
  *     PyArray_SetBaseObject(arr, base)             # <<<<<<<<<<<<<<
@@ -7338,7 +16259,7 @@ static CYTHON_INLINE void __pyx_f_5numpy_set_array_base(PyArrayObject *__pyx_v_a
  */
   (void)(PyArray_SetBaseObject(__pyx_v_arr, __pyx_v_base));
 
-  /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":1022
+  /* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":1022
  *     int _import_umath() except -1
  * 
  * cdef inline void set_array_base(ndarray arr, object base):             # <<<<<<<<<<<<<<
@@ -7350,7 +16271,7 @@ static CYTHON_INLINE void __pyx_f_5numpy_set_array_base(PyArrayObject *__pyx_v_a
   __Pyx_RefNannyFinishContext();
 }
 
-/* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":1026
+/* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":1026
  *     PyArray_SetBaseObject(arr, base)
  * 
  * cdef inline object get_array_base(ndarray arr):             # <<<<<<<<<<<<<<
@@ -7365,7 +16286,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_get_array_base(PyArrayObject *__py
   int __pyx_t_1;
   __Pyx_RefNannySetupContext("get_array_base", 0);
 
-  /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":1027
+  /* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":1027
  * 
  * cdef inline object get_array_base(ndarray arr):
  *     base = PyArray_BASE(arr)             # <<<<<<<<<<<<<<
@@ -7374,7 +16295,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_get_array_base(PyArrayObject *__py
  */
   __pyx_v_base = PyArray_BASE(__pyx_v_arr);
 
-  /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":1028
+  /* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":1028
  * cdef inline object get_array_base(ndarray arr):
  *     base = PyArray_BASE(arr)
  *     if base is NULL:             # <<<<<<<<<<<<<<
@@ -7384,7 +16305,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_get_array_base(PyArrayObject *__py
   __pyx_t_1 = ((__pyx_v_base == NULL) != 0);
   if (__pyx_t_1) {
 
-    /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":1029
+    /* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":1029
  *     base = PyArray_BASE(arr)
  *     if base is NULL:
  *         return None             # <<<<<<<<<<<<<<
@@ -7395,7 +16316,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_get_array_base(PyArrayObject *__py
     __pyx_r = Py_None; __Pyx_INCREF(Py_None);
     goto __pyx_L0;
 
-    /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":1028
+    /* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":1028
  * cdef inline object get_array_base(ndarray arr):
  *     base = PyArray_BASE(arr)
  *     if base is NULL:             # <<<<<<<<<<<<<<
@@ -7404,7 +16325,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_get_array_base(PyArrayObject *__py
  */
   }
 
-  /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":1030
+  /* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":1030
  *     if base is NULL:
  *         return None
  *     return <object>base             # <<<<<<<<<<<<<<
@@ -7416,7 +16337,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_get_array_base(PyArrayObject *__py
   __pyx_r = ((PyObject *)__pyx_v_base);
   goto __pyx_L0;
 
-  /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":1026
+  /* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":1026
  *     PyArray_SetBaseObject(arr, base)
  * 
  * cdef inline object get_array_base(ndarray arr):             # <<<<<<<<<<<<<<
@@ -7431,7 +16352,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_get_array_base(PyArrayObject *__py
   return __pyx_r;
 }
 
-/* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":1034
+/* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":1034
  * # Versions of the import_* functions which are more suitable for
  * # Cython code.
  * cdef inline int import_array() except -1:             # <<<<<<<<<<<<<<
@@ -7452,7 +16373,7 @@ static CYTHON_INLINE int __pyx_f_5numpy_import_array(void) {
   PyObject *__pyx_t_8 = NULL;
   __Pyx_RefNannySetupContext("import_array", 0);
 
-  /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":1035
+  /* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":1035
  * # Cython code.
  * cdef inline int import_array() except -1:
  *     try:             # <<<<<<<<<<<<<<
@@ -7468,7 +16389,7 @@ static CYTHON_INLINE int __pyx_f_5numpy_import_array(void) {
     __Pyx_XGOTREF(__pyx_t_3);
     /*try:*/ {
 
-      /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":1036
+      /* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":1036
  * cdef inline int import_array() except -1:
  *     try:
  *         _import_array()             # <<<<<<<<<<<<<<
@@ -7477,7 +16398,7 @@ static CYTHON_INLINE int __pyx_f_5numpy_import_array(void) {
  */
       __pyx_t_4 = _import_array(); if (unlikely(__pyx_t_4 == ((int)-1))) __PYX_ERR(1, 1036, __pyx_L3_error)
 
-      /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":1035
+      /* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":1035
  * # Cython code.
  * cdef inline int import_array() except -1:
  *     try:             # <<<<<<<<<<<<<<
@@ -7491,7 +16412,7 @@ static CYTHON_INLINE int __pyx_f_5numpy_import_array(void) {
     goto __pyx_L8_try_end;
     __pyx_L3_error:;
 
-    /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":1037
+    /* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":1037
  *     try:
  *         _import_array()
  *     except Exception:             # <<<<<<<<<<<<<<
@@ -7506,14 +16427,14 @@ static CYTHON_INLINE int __pyx_f_5numpy_import_array(void) {
       __Pyx_GOTREF(__pyx_t_6);
       __Pyx_GOTREF(__pyx_t_7);
 
-      /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":1038
+      /* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":1038
  *         _import_array()
  *     except Exception:
  *         raise ImportError("numpy.core.multiarray failed to import")             # <<<<<<<<<<<<<<
  * 
  * cdef inline int import_umath() except -1:
  */
-      __pyx_t_8 = __Pyx_PyObject_Call(__pyx_builtin_ImportError, __pyx_tuple__9, NULL); if (unlikely(!__pyx_t_8)) __PYX_ERR(1, 1038, __pyx_L5_except_error)
+      __pyx_t_8 = __Pyx_PyObject_Call(__pyx_builtin_ImportError, __pyx_tuple__14, NULL); if (unlikely(!__pyx_t_8)) __PYX_ERR(1, 1038, __pyx_L5_except_error)
       __Pyx_GOTREF(__pyx_t_8);
       __Pyx_Raise(__pyx_t_8, 0, 0, 0);
       __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
@@ -7522,7 +16443,7 @@ static CYTHON_INLINE int __pyx_f_5numpy_import_array(void) {
     goto __pyx_L5_except_error;
     __pyx_L5_except_error:;
 
-    /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":1035
+    /* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":1035
  * # Cython code.
  * cdef inline int import_array() except -1:
  *     try:             # <<<<<<<<<<<<<<
@@ -7537,7 +16458,7 @@ static CYTHON_INLINE int __pyx_f_5numpy_import_array(void) {
     __pyx_L8_try_end:;
   }
 
-  /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":1034
+  /* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":1034
  * # Versions of the import_* functions which are more suitable for
  * # Cython code.
  * cdef inline int import_array() except -1:             # <<<<<<<<<<<<<<
@@ -7560,7 +16481,7 @@ static CYTHON_INLINE int __pyx_f_5numpy_import_array(void) {
   return __pyx_r;
 }
 
-/* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":1040
+/* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":1040
  *         raise ImportError("numpy.core.multiarray failed to import")
  * 
  * cdef inline int import_umath() except -1:             # <<<<<<<<<<<<<<
@@ -7581,7 +16502,7 @@ static CYTHON_INLINE int __pyx_f_5numpy_import_umath(void) {
   PyObject *__pyx_t_8 = NULL;
   __Pyx_RefNannySetupContext("import_umath", 0);
 
-  /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":1041
+  /* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":1041
  * 
  * cdef inline int import_umath() except -1:
  *     try:             # <<<<<<<<<<<<<<
@@ -7597,7 +16518,7 @@ static CYTHON_INLINE int __pyx_f_5numpy_import_umath(void) {
     __Pyx_XGOTREF(__pyx_t_3);
     /*try:*/ {
 
-      /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":1042
+      /* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":1042
  * cdef inline int import_umath() except -1:
  *     try:
  *         _import_umath()             # <<<<<<<<<<<<<<
@@ -7606,7 +16527,7 @@ static CYTHON_INLINE int __pyx_f_5numpy_import_umath(void) {
  */
       __pyx_t_4 = _import_umath(); if (unlikely(__pyx_t_4 == ((int)-1))) __PYX_ERR(1, 1042, __pyx_L3_error)
 
-      /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":1041
+      /* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":1041
  * 
  * cdef inline int import_umath() except -1:
  *     try:             # <<<<<<<<<<<<<<
@@ -7620,7 +16541,7 @@ static CYTHON_INLINE int __pyx_f_5numpy_import_umath(void) {
     goto __pyx_L8_try_end;
     __pyx_L3_error:;
 
-    /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":1043
+    /* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":1043
  *     try:
  *         _import_umath()
  *     except Exception:             # <<<<<<<<<<<<<<
@@ -7635,14 +16556,14 @@ static CYTHON_INLINE int __pyx_f_5numpy_import_umath(void) {
       __Pyx_GOTREF(__pyx_t_6);
       __Pyx_GOTREF(__pyx_t_7);
 
-      /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":1044
+      /* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":1044
  *         _import_umath()
  *     except Exception:
  *         raise ImportError("numpy.core.umath failed to import")             # <<<<<<<<<<<<<<
  * 
  * cdef inline int import_ufunc() except -1:
  */
-      __pyx_t_8 = __Pyx_PyObject_Call(__pyx_builtin_ImportError, __pyx_tuple__10, NULL); if (unlikely(!__pyx_t_8)) __PYX_ERR(1, 1044, __pyx_L5_except_error)
+      __pyx_t_8 = __Pyx_PyObject_Call(__pyx_builtin_ImportError, __pyx_tuple__15, NULL); if (unlikely(!__pyx_t_8)) __PYX_ERR(1, 1044, __pyx_L5_except_error)
       __Pyx_GOTREF(__pyx_t_8);
       __Pyx_Raise(__pyx_t_8, 0, 0, 0);
       __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
@@ -7651,7 +16572,7 @@ static CYTHON_INLINE int __pyx_f_5numpy_import_umath(void) {
     goto __pyx_L5_except_error;
     __pyx_L5_except_error:;
 
-    /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":1041
+    /* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":1041
  * 
  * cdef inline int import_umath() except -1:
  *     try:             # <<<<<<<<<<<<<<
@@ -7666,7 +16587,7 @@ static CYTHON_INLINE int __pyx_f_5numpy_import_umath(void) {
     __pyx_L8_try_end:;
   }
 
-  /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":1040
+  /* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":1040
  *         raise ImportError("numpy.core.multiarray failed to import")
  * 
  * cdef inline int import_umath() except -1:             # <<<<<<<<<<<<<<
@@ -7689,7 +16610,7 @@ static CYTHON_INLINE int __pyx_f_5numpy_import_umath(void) {
   return __pyx_r;
 }
 
-/* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":1046
+/* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":1046
  *         raise ImportError("numpy.core.umath failed to import")
  * 
  * cdef inline int import_ufunc() except -1:             # <<<<<<<<<<<<<<
@@ -7710,7 +16631,7 @@ static CYTHON_INLINE int __pyx_f_5numpy_import_ufunc(void) {
   PyObject *__pyx_t_8 = NULL;
   __Pyx_RefNannySetupContext("import_ufunc", 0);
 
-  /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":1047
+  /* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":1047
  * 
  * cdef inline int import_ufunc() except -1:
  *     try:             # <<<<<<<<<<<<<<
@@ -7726,7 +16647,7 @@ static CYTHON_INLINE int __pyx_f_5numpy_import_ufunc(void) {
     __Pyx_XGOTREF(__pyx_t_3);
     /*try:*/ {
 
-      /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":1048
+      /* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":1048
  * cdef inline int import_ufunc() except -1:
  *     try:
  *         _import_umath()             # <<<<<<<<<<<<<<
@@ -7735,7 +16656,7 @@ static CYTHON_INLINE int __pyx_f_5numpy_import_ufunc(void) {
  */
       __pyx_t_4 = _import_umath(); if (unlikely(__pyx_t_4 == ((int)-1))) __PYX_ERR(1, 1048, __pyx_L3_error)
 
-      /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":1047
+      /* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":1047
  * 
  * cdef inline int import_ufunc() except -1:
  *     try:             # <<<<<<<<<<<<<<
@@ -7749,7 +16670,7 @@ static CYTHON_INLINE int __pyx_f_5numpy_import_ufunc(void) {
     goto __pyx_L8_try_end;
     __pyx_L3_error:;
 
-    /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":1049
+    /* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":1049
  *     try:
  *         _import_umath()
  *     except Exception:             # <<<<<<<<<<<<<<
@@ -7763,12 +16684,12 @@ static CYTHON_INLINE int __pyx_f_5numpy_import_ufunc(void) {
       __Pyx_GOTREF(__pyx_t_6);
       __Pyx_GOTREF(__pyx_t_7);
 
-      /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":1050
+      /* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":1050
  *         _import_umath()
  *     except Exception:
  *         raise ImportError("numpy.core.umath failed to import")             # <<<<<<<<<<<<<<
  */
-      __pyx_t_8 = __Pyx_PyObject_Call(__pyx_builtin_ImportError, __pyx_tuple__10, NULL); if (unlikely(!__pyx_t_8)) __PYX_ERR(1, 1050, __pyx_L5_except_error)
+      __pyx_t_8 = __Pyx_PyObject_Call(__pyx_builtin_ImportError, __pyx_tuple__15, NULL); if (unlikely(!__pyx_t_8)) __PYX_ERR(1, 1050, __pyx_L5_except_error)
       __Pyx_GOTREF(__pyx_t_8);
       __Pyx_Raise(__pyx_t_8, 0, 0, 0);
       __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
@@ -7777,7 +16698,7 @@ static CYTHON_INLINE int __pyx_f_5numpy_import_ufunc(void) {
     goto __pyx_L5_except_error;
     __pyx_L5_except_error:;
 
-    /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":1047
+    /* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":1047
  * 
  * cdef inline int import_ufunc() except -1:
  *     try:             # <<<<<<<<<<<<<<
@@ -7792,7 +16713,7 @@ static CYTHON_INLINE int __pyx_f_5numpy_import_ufunc(void) {
     __pyx_L8_try_end:;
   }
 
-  /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":1046
+  /* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":1046
  *         raise ImportError("numpy.core.umath failed to import")
  * 
  * cdef inline int import_ufunc() except -1:             # <<<<<<<<<<<<<<
@@ -8012,7 +16933,7 @@ static int __pyx_array___pyx_pf_15View_dot_MemoryView_5array___cinit__(struct __
  * 
  *         if itemsize <= 0:
  */
-    __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__11, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(2, 133, __pyx_L1_error)
+    __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__16, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(2, 133, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_3);
     __Pyx_Raise(__pyx_t_3, 0, 0, 0);
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
@@ -8044,7 +16965,7 @@ static int __pyx_array___pyx_pf_15View_dot_MemoryView_5array___cinit__(struct __
  * 
  *         if not isinstance(format, bytes):
  */
-    __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__12, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(2, 136, __pyx_L1_error)
+    __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__17, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(2, 136, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_3);
     __Pyx_Raise(__pyx_t_3, 0, 0, 0);
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
@@ -8171,7 +17092,7 @@ static int __pyx_array___pyx_pf_15View_dot_MemoryView_5array___cinit__(struct __
  * 
  * 
  */
-    __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_MemoryError, __pyx_tuple__13, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(2, 148, __pyx_L1_error)
+    __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_MemoryError, __pyx_tuple__18, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(2, 148, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_3);
     __Pyx_Raise(__pyx_t_3, 0, 0, 0);
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
@@ -8445,7 +17366,7 @@ static int __pyx_array___pyx_pf_15View_dot_MemoryView_5array___cinit__(struct __
  * 
  *             if self.dtype_is_object:
  */
-      __pyx_t_10 = __Pyx_PyObject_Call(__pyx_builtin_MemoryError, __pyx_tuple__14, NULL); if (unlikely(!__pyx_t_10)) __PYX_ERR(2, 176, __pyx_L1_error)
+      __pyx_t_10 = __Pyx_PyObject_Call(__pyx_builtin_MemoryError, __pyx_tuple__19, NULL); if (unlikely(!__pyx_t_10)) __PYX_ERR(2, 176, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_10);
       __Pyx_Raise(__pyx_t_10, 0, 0, 0);
       __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
@@ -8686,7 +17607,7 @@ static int __pyx_array___pyx_pf_15View_dot_MemoryView_5array_2__getbuffer__(stru
  *         info.buf = self.data
  *         info.len = self.len
  */
-    __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__15, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(2, 192, __pyx_L1_error)
+    __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__20, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(2, 192, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_3);
     __Pyx_Raise(__pyx_t_3, 0, 0, 0);
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
@@ -9402,7 +18323,7 @@ static PyObject *__pyx_pf___pyx_array___reduce_cython__(CYTHON_UNUSED struct __p
  * def __setstate_cython__(self, __pyx_state):
  *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
  */
-  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_TypeError, __pyx_tuple__16, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(2, 2, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_TypeError, __pyx_tuple__21, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(2, 2, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_Raise(__pyx_t_1, 0, 0, 0);
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
@@ -9455,7 +18376,7 @@ static PyObject *__pyx_pf___pyx_array_2__setstate_cython__(CYTHON_UNUSED struct
  * def __setstate_cython__(self, __pyx_state):
  *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")             # <<<<<<<<<<<<<<
  */
-  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_TypeError, __pyx_tuple__17, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(2, 4, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_TypeError, __pyx_tuple__22, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(2, 4, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_Raise(__pyx_t_1, 0, 0, 0);
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
@@ -11099,7 +20020,7 @@ static int __pyx_memoryview___pyx_pf_15View_dot_MemoryView_10memoryview_6__setit
  * 
  *         have_slices, index = _unellipsify(index, self.view.ndim)
  */
-    __pyx_t_2 = __Pyx_PyObject_Call(__pyx_builtin_TypeError, __pyx_tuple__18, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(2, 414, __pyx_L1_error)
+    __pyx_t_2 = __Pyx_PyObject_Call(__pyx_builtin_TypeError, __pyx_tuple__23, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(2, 414, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_2);
     __Pyx_Raise(__pyx_t_2, 0, 0, 0);
     __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
@@ -12126,7 +21047,7 @@ static PyObject *__pyx_memoryview_convert_item_to_object(struct __pyx_memoryview
  *         else:
  *             if len(self.view.format) == 1:
  */
-      __pyx_t_6 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__19, NULL); if (unlikely(!__pyx_t_6)) __PYX_ERR(2, 491, __pyx_L5_except_error)
+      __pyx_t_6 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__24, NULL); if (unlikely(!__pyx_t_6)) __PYX_ERR(2, 491, __pyx_L5_except_error)
       __Pyx_GOTREF(__pyx_t_6);
       __Pyx_Raise(__pyx_t_6, 0, 0, 0);
       __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
@@ -12482,7 +21403,7 @@ static int __pyx_memoryview___pyx_pf_15View_dot_MemoryView_10memoryview_8__getbu
  * 
  *         if flags & PyBUF_ND:
  */
-    __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__20, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(2, 516, __pyx_L1_error)
+    __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__25, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(2, 516, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_3);
     __Pyx_Raise(__pyx_t_3, 0, 0, 0);
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
@@ -13022,7 +21943,7 @@ static PyObject *__pyx_pf_15View_dot_MemoryView_10memoryview_7strides___get__(st
  * 
  *         return tuple([stride for stride in self.view.strides[:self.view.ndim]])
  */
-    __pyx_t_2 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__21, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(2, 566, __pyx_L1_error)
+    __pyx_t_2 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__26, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(2, 566, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_2);
     __Pyx_Raise(__pyx_t_2, 0, 0, 0);
     __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
@@ -13136,7 +22057,7 @@ static PyObject *__pyx_pf_15View_dot_MemoryView_10memoryview_10suboffsets___get_
     __Pyx_XDECREF(__pyx_r);
     __pyx_t_2 = __Pyx_PyInt_From_int(__pyx_v_self->view.ndim); if (unlikely(!__pyx_t_2)) __PYX_ERR(2, 573, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_2);
-    __pyx_t_3 = PyNumber_Multiply(__pyx_tuple__22, __pyx_t_2); if (unlikely(!__pyx_t_3)) __PYX_ERR(2, 573, __pyx_L1_error)
+    __pyx_t_3 = PyNumber_Multiply(__pyx_tuple__27, __pyx_t_2); if (unlikely(!__pyx_t_3)) __PYX_ERR(2, 573, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_3);
     __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
     __pyx_r = __pyx_t_3;
@@ -14137,7 +23058,7 @@ static PyObject *__pyx_pf___pyx_memoryview___reduce_cython__(CYTHON_UNUSED struc
  * def __setstate_cython__(self, __pyx_state):
  *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
  */
-  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_TypeError, __pyx_tuple__23, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(2, 2, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_TypeError, __pyx_tuple__28, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(2, 2, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_Raise(__pyx_t_1, 0, 0, 0);
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
@@ -14190,7 +23111,7 @@ static PyObject *__pyx_pf___pyx_memoryview_2__setstate_cython__(CYTHON_UNUSED st
  * def __setstate_cython__(self, __pyx_state):
  *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")             # <<<<<<<<<<<<<<
  */
-  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_TypeError, __pyx_tuple__24, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(2, 4, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_TypeError, __pyx_tuple__29, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(2, 4, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_Raise(__pyx_t_1, 0, 0, 0);
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
@@ -14541,9 +23462,9 @@ static PyObject *_unellipsify(PyObject *__pyx_v_index, int __pyx_v_ndim) {
         __Pyx_GOTREF(__pyx_t_7);
         { Py_ssize_t __pyx_temp;
           for (__pyx_temp=0; __pyx_temp < ((__pyx_v_ndim - __pyx_t_8) + 1); __pyx_temp++) {
-            __Pyx_INCREF(__pyx_slice__25);
-            __Pyx_GIVEREF(__pyx_slice__25);
-            PyList_SET_ITEM(__pyx_t_7, __pyx_temp, __pyx_slice__25);
+            __Pyx_INCREF(__pyx_slice__30);
+            __Pyx_GIVEREF(__pyx_slice__30);
+            PyList_SET_ITEM(__pyx_t_7, __pyx_temp, __pyx_slice__30);
           }
         }
         __pyx_t_9 = __Pyx_PyList_Extend(__pyx_v_result, __pyx_t_7); if (unlikely(__pyx_t_9 == ((int)-1))) __PYX_ERR(2, 678, __pyx_L1_error)
@@ -14576,7 +23497,7 @@ static PyObject *_unellipsify(PyObject *__pyx_v_index, int __pyx_v_ndim) {
  *         else:
  */
       /*else*/ {
-        __pyx_t_9 = __Pyx_PyList_Append(__pyx_v_result, __pyx_slice__25); if (unlikely(__pyx_t_9 == ((int)-1))) __PYX_ERR(2, 681, __pyx_L1_error)
+        __pyx_t_9 = __Pyx_PyList_Append(__pyx_v_result, __pyx_slice__30); if (unlikely(__pyx_t_9 == ((int)-1))) __PYX_ERR(2, 681, __pyx_L1_error)
       }
       __pyx_L7:;
 
@@ -14716,9 +23637,9 @@ static PyObject *_unellipsify(PyObject *__pyx_v_index, int __pyx_v_ndim) {
     __Pyx_GOTREF(__pyx_t_3);
     { Py_ssize_t __pyx_temp;
       for (__pyx_temp=0; __pyx_temp < __pyx_v_nslices; __pyx_temp++) {
-        __Pyx_INCREF(__pyx_slice__25);
-        __Pyx_GIVEREF(__pyx_slice__25);
-        PyList_SET_ITEM(__pyx_t_3, __pyx_temp, __pyx_slice__25);
+        __Pyx_INCREF(__pyx_slice__30);
+        __Pyx_GIVEREF(__pyx_slice__30);
+        PyList_SET_ITEM(__pyx_t_3, __pyx_temp, __pyx_slice__30);
       }
     }
     __pyx_t_9 = __Pyx_PyList_Extend(__pyx_v_result, __pyx_t_3); if (unlikely(__pyx_t_9 == ((int)-1))) __PYX_ERR(2, 692, __pyx_L1_error)
@@ -14842,7 +23763,7 @@ static PyObject *assert_direct_dimensions(Py_ssize_t *__pyx_v_suboffsets, int __
  * 
  * 
  */
-      __pyx_t_5 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__26, NULL); if (unlikely(!__pyx_t_5)) __PYX_ERR(2, 699, __pyx_L1_error)
+      __pyx_t_5 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__31, NULL); if (unlikely(!__pyx_t_5)) __PYX_ERR(2, 699, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_5);
       __Pyx_Raise(__pyx_t_5, 0, 0, 0);
       __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
@@ -17005,7 +25926,7 @@ static PyObject *__pyx_pf___pyx_memoryviewslice___reduce_cython__(CYTHON_UNUSED
  * def __setstate_cython__(self, __pyx_state):
  *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
  */
-  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_TypeError, __pyx_tuple__27, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(2, 2, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_TypeError, __pyx_tuple__32, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(2, 2, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_Raise(__pyx_t_1, 0, 0, 0);
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
@@ -17058,7 +25979,7 @@ static PyObject *__pyx_pf___pyx_memoryviewslice_2__setstate_cython__(CYTHON_UNUS
  * def __setstate_cython__(self, __pyx_state):
  *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")             # <<<<<<<<<<<<<<
  */
-  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_TypeError, __pyx_tuple__28, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(2, 4, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_TypeError, __pyx_tuple__33, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(2, 4, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_Raise(__pyx_t_1, 0, 0, 0);
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
@@ -21307,19 +30228,34 @@ static struct PyModuleDef __pyx_moduledef = {
 
 static __Pyx_StringTabEntry __pyx_string_tab[] = {
   {&__pyx_n_s_ASCII, __pyx_k_ASCII, sizeof(__pyx_k_ASCII), 0, 0, 1, 1},
+  {&__pyx_n_s_A_COL, __pyx_k_A_COL, sizeof(__pyx_k_A_COL), 0, 0, 1, 1},
+  {&__pyx_n_s_A_D, __pyx_k_A_D, sizeof(__pyx_k_A_D), 0, 0, 1, 1},
+  {&__pyx_n_s_A_PTR, __pyx_k_A_PTR, sizeof(__pyx_k_A_PTR), 0, 0, 1, 1},
   {&__pyx_kp_s_Buffer_view_does_not_expose_stri, __pyx_k_Buffer_view_does_not_expose_stri, sizeof(__pyx_k_Buffer_view_does_not_expose_stri), 0, 0, 1, 0},
   {&__pyx_n_s_COL, __pyx_k_COL, sizeof(__pyx_k_COL), 0, 0, 1, 1},
+  {&__pyx_n_s_COL1, __pyx_k_COL1, sizeof(__pyx_k_COL1), 0, 0, 1, 1},
+  {&__pyx_n_s_COL2, __pyx_k_COL2, sizeof(__pyx_k_COL2), 0, 0, 1, 1},
+  {&__pyx_n_s_COL_v, __pyx_k_COL_v, sizeof(__pyx_k_COL_v), 0, 0, 1, 1},
   {&__pyx_kp_s_Can_only_create_a_buffer_that_is, __pyx_k_Can_only_create_a_buffer_that_is, sizeof(__pyx_k_Can_only_create_a_buffer_that_is), 0, 0, 1, 0},
   {&__pyx_kp_s_Cannot_assign_to_read_only_memor, __pyx_k_Cannot_assign_to_read_only_memor, sizeof(__pyx_k_Cannot_assign_to_read_only_memor), 0, 0, 1, 0},
   {&__pyx_kp_s_Cannot_create_writable_memory_vi, __pyx_k_Cannot_create_writable_memory_vi, sizeof(__pyx_k_Cannot_create_writable_memory_vi), 0, 0, 1, 0},
   {&__pyx_kp_s_Cannot_index_with_type_s, __pyx_k_Cannot_index_with_type_s, sizeof(__pyx_k_Cannot_index_with_type_s), 0, 0, 1, 0},
+  {&__pyx_n_s_D, __pyx_k_D, sizeof(__pyx_k_D), 0, 0, 1, 1},
+  {&__pyx_n_s_D_v, __pyx_k_D_v, sizeof(__pyx_k_D_v), 0, 0, 1, 1},
   {&__pyx_n_s_Ellipsis, __pyx_k_Ellipsis, sizeof(__pyx_k_Ellipsis), 0, 0, 1, 1},
   {&__pyx_kp_s_Empty_shape_tuple_for_cython_arr, __pyx_k_Empty_shape_tuple_for_cython_arr, sizeof(__pyx_k_Empty_shape_tuple_for_cython_arr), 0, 0, 1, 0},
+  {&__pyx_kp_s_Expected_at_least_d_argument_s_g, __pyx_k_Expected_at_least_d_argument_s_g, sizeof(__pyx_k_Expected_at_least_d_argument_s_g), 0, 0, 1, 0},
+  {&__pyx_n_s_FIRSTO, __pyx_k_FIRSTO, sizeof(__pyx_k_FIRSTO), 0, 0, 1, 1},
   {&__pyx_n_s_FOLD_col, __pyx_k_FOLD_col, sizeof(__pyx_k_FOLD_col), 0, 0, 1, 1},
   {&__pyx_n_s_FOLD_ncol, __pyx_k_FOLD_ncol, sizeof(__pyx_k_FOLD_ncol), 0, 0, 1, 1},
   {&__pyx_n_s_FOLD_ptr, __pyx_k_FOLD_ptr, sizeof(__pyx_k_FOLD_ptr), 0, 0, 1, 1},
   {&__pyx_kp_u_Format_string_allocated_too_shor, __pyx_k_Format_string_allocated_too_shor, sizeof(__pyx_k_Format_string_allocated_too_shor), 0, 1, 0, 0},
   {&__pyx_kp_u_Format_string_allocated_too_shor_2, __pyx_k_Format_string_allocated_too_shor_2, sizeof(__pyx_k_Format_string_allocated_too_shor_2), 0, 1, 0, 0},
+  {&__pyx_kp_s_Function_call_with_ambiguous_arg, __pyx_k_Function_call_with_ambiguous_arg, sizeof(__pyx_k_Function_call_with_ambiguous_arg), 0, 0, 1, 0},
+  {&__pyx_n_s_IDX, __pyx_k_IDX, sizeof(__pyx_k_IDX), 0, 0, 1, 1},
+  {&__pyx_n_s_IDX1, __pyx_k_IDX1, sizeof(__pyx_k_IDX1), 0, 0, 1, 1},
+  {&__pyx_n_s_IDX2, __pyx_k_IDX2, sizeof(__pyx_k_IDX2), 0, 0, 1, 1},
+  {&__pyx_n_s_ISC, __pyx_k_ISC, sizeof(__pyx_k_ISC), 0, 0, 1, 1},
   {&__pyx_n_s_ImportError, __pyx_k_ImportError, sizeof(__pyx_k_ImportError), 0, 0, 1, 1},
   {&__pyx_kp_s_Incompatible_checksums_s_vs_0xb0, __pyx_k_Incompatible_checksums_s_vs_0xb0, sizeof(__pyx_k_Incompatible_checksums_s_vs_0xb0), 0, 0, 1, 0},
   {&__pyx_n_s_IndexError, __pyx_k_IndexError, sizeof(__pyx_k_IndexError), 0, 0, 1, 1},
@@ -21330,34 +30266,71 @@ static __Pyx_StringTabEntry __pyx_string_tab[] = {
   {&__pyx_kp_s_MemoryView_of_r_at_0x_x, __pyx_k_MemoryView_of_r_at_0x_x, sizeof(__pyx_k_MemoryView_of_r_at_0x_x), 0, 0, 1, 0},
   {&__pyx_kp_s_MemoryView_of_r_object, __pyx_k_MemoryView_of_r_object, sizeof(__pyx_k_MemoryView_of_r_object), 0, 0, 1, 0},
   {&__pyx_n_s_NCOL, __pyx_k_NCOL, sizeof(__pyx_k_NCOL), 0, 0, 1, 1},
+  {&__pyx_n_s_NCOL1, __pyx_k_NCOL1, sizeof(__pyx_k_NCOL1), 0, 0, 1, 1},
+  {&__pyx_n_s_NCOL2, __pyx_k_NCOL2, sizeof(__pyx_k_NCOL2), 0, 0, 1, 1},
+  {&__pyx_kp_s_No_matching_signature_found, __pyx_k_No_matching_signature_found, sizeof(__pyx_k_No_matching_signature_found), 0, 0, 1, 0},
   {&__pyx_kp_u_Non_native_byte_order_not_suppor, __pyx_k_Non_native_byte_order_not_suppor, sizeof(__pyx_k_Non_native_byte_order_not_suppor), 0, 1, 0, 0},
   {&__pyx_n_b_O, __pyx_k_O, sizeof(__pyx_k_O), 0, 0, 0, 1},
+  {&__pyx_n_s_O2A, __pyx_k_O2A, sizeof(__pyx_k_O2A), 0, 0, 1, 1},
+  {&__pyx_n_s_OFF, __pyx_k_OFF, sizeof(__pyx_k_OFF), 0, 0, 1, 1},
   {&__pyx_kp_s_Out_of_bounds_on_buffer_access_a, __pyx_k_Out_of_bounds_on_buffer_access_a, sizeof(__pyx_k_Out_of_bounds_on_buffer_access_a), 0, 0, 1, 0},
+  {&__pyx_n_s_POS, __pyx_k_POS, sizeof(__pyx_k_POS), 0, 0, 1, 1},
   {&__pyx_n_s_PTR, __pyx_k_PTR, sizeof(__pyx_k_PTR), 0, 0, 1, 1},
+  {&__pyx_n_s_PTR1, __pyx_k_PTR1, sizeof(__pyx_k_PTR1), 0, 0, 1, 1},
+  {&__pyx_n_s_PTR2, __pyx_k_PTR2, sizeof(__pyx_k_PTR2), 0, 0, 1, 1},
+  {&__pyx_n_s_PVT, __pyx_k_PVT, sizeof(__pyx_k_PVT), 0, 0, 1, 1},
   {&__pyx_n_s_PickleError, __pyx_k_PickleError, sizeof(__pyx_k_PickleError), 0, 0, 1, 1},
+  {&__pyx_n_s_ROWS, __pyx_k_ROWS, sizeof(__pyx_k_ROWS), 0, 0, 1, 1},
   {&__pyx_n_s_RuntimeError, __pyx_k_RuntimeError, sizeof(__pyx_k_RuntimeError), 0, 0, 1, 1},
+  {&__pyx_n_s_STAMP, __pyx_k_STAMP, sizeof(__pyx_k_STAMP), 0, 0, 1, 1},
+  {&__pyx_n_s_S_COL, __pyx_k_S_COL, sizeof(__pyx_k_S_COL), 0, 0, 1, 1},
+  {&__pyx_n_s_S_IDX, __pyx_k_S_IDX, sizeof(__pyx_k_S_IDX), 0, 0, 1, 1},
+  {&__pyx_n_s_S_NCOL, __pyx_k_S_NCOL, sizeof(__pyx_k_S_NCOL), 0, 0, 1, 1},
+  {&__pyx_n_s_S_PTR, __pyx_k_S_PTR, sizeof(__pyx_k_S_PTR), 0, 0, 1, 1},
+  {&__pyx_n_s_T_COL, __pyx_k_T_COL, sizeof(__pyx_k_T_COL), 0, 0, 1, 1},
+  {&__pyx_n_s_T_NCOL, __pyx_k_T_NCOL, sizeof(__pyx_k_T_NCOL), 0, 0, 1, 1},
+  {&__pyx_n_s_T_PTR, __pyx_k_T_PTR, sizeof(__pyx_k_T_PTR), 0, 0, 1, 1},
   {&__pyx_n_s_TypeError, __pyx_k_TypeError, sizeof(__pyx_k_TypeError), 0, 0, 1, 1},
   {&__pyx_kp_s_Unable_to_convert_item_to_object, __pyx_k_Unable_to_convert_item_to_object, sizeof(__pyx_k_Unable_to_convert_item_to_object), 0, 0, 1, 0},
   {&__pyx_n_s_ValueError, __pyx_k_ValueError, sizeof(__pyx_k_ValueError), 0, 0, 1, 1},
   {&__pyx_n_s_View_MemoryView, __pyx_k_View_MemoryView, sizeof(__pyx_k_View_MemoryView), 0, 0, 1, 1},
+  {&__pyx_kp_s__5, __pyx_k__5, sizeof(__pyx_k__5), 0, 0, 1, 0},
+  {&__pyx_kp_s__6, __pyx_k__6, sizeof(__pyx_k__6), 0, 0, 1, 0},
+  {&__pyx_n_s_acol, __pyx_k_acol, sizeof(__pyx_k_acol), 0, 0, 1, 1},
+  {&__pyx_n_s_ad, __pyx_k_ad, sizeof(__pyx_k_ad), 0, 0, 1, 1},
   {&__pyx_n_s_allocate_buffer, __pyx_k_allocate_buffer, sizeof(__pyx_k_allocate_buffer), 0, 0, 1, 1},
+  {&__pyx_n_s_aptr, __pyx_k_aptr, sizeof(__pyx_k_aptr), 0, 0, 1, 1},
+  {&__pyx_n_s_args, __pyx_k_args, sizeof(__pyx_k_args), 0, 0, 1, 1},
   {&__pyx_n_s_base, __pyx_k_base, sizeof(__pyx_k_base), 0, 0, 1, 1},
   {&__pyx_n_s_c, __pyx_k_c, sizeof(__pyx_k_c), 0, 0, 1, 1},
   {&__pyx_n_u_c, __pyx_k_c, sizeof(__pyx_k_c), 0, 1, 0, 1},
   {&__pyx_n_s_class, __pyx_k_class, sizeof(__pyx_k_class), 0, 0, 1, 1},
   {&__pyx_n_s_cline_in_traceback, __pyx_k_cline_in_traceback, sizeof(__pyx_k_cline_in_traceback), 0, 0, 1, 1},
   {&__pyx_n_s_col, __pyx_k_col, sizeof(__pyx_k_col), 0, 0, 1, 1},
+  {&__pyx_n_s_col1, __pyx_k_col1, sizeof(__pyx_k_col1), 0, 0, 1, 1},
+  {&__pyx_n_s_col2, __pyx_k_col2, sizeof(__pyx_k_col2), 0, 0, 1, 1},
   {&__pyx_kp_s_contiguous_and_direct, __pyx_k_contiguous_and_direct, sizeof(__pyx_k_contiguous_and_direct), 0, 0, 1, 0},
   {&__pyx_kp_s_contiguous_and_indirect, __pyx_k_contiguous_and_indirect, sizeof(__pyx_k_contiguous_and_indirect), 0, 0, 1, 0},
   {&__pyx_n_s_copy, __pyx_k_copy, sizeof(__pyx_k_copy), 0, 0, 1, 1},
+  {&__pyx_n_s_data, __pyx_k_data, sizeof(__pyx_k_data), 0, 0, 1, 1},
+  {&__pyx_n_s_defaults, __pyx_k_defaults, sizeof(__pyx_k_defaults), 0, 0, 1, 1},
   {&__pyx_n_s_dict, __pyx_k_dict, sizeof(__pyx_k_dict), 0, 0, 1, 1},
+  {&__pyx_n_s_double, __pyx_k_double, sizeof(__pyx_k_double), 0, 0, 1, 1},
   {&__pyx_n_s_dtype, __pyx_k_dtype, sizeof(__pyx_k_dtype), 0, 0, 1, 1},
   {&__pyx_n_s_dtype_is_object, __pyx_k_dtype_is_object, sizeof(__pyx_k_dtype_is_object), 0, 0, 1, 1},
+  {&__pyx_n_s_e1, __pyx_k_e1, sizeof(__pyx_k_e1), 0, 0, 1, 1},
+  {&__pyx_n_s_e2, __pyx_k_e2, sizeof(__pyx_k_e2), 0, 0, 1, 1},
   {&__pyx_n_s_empty, __pyx_k_empty, sizeof(__pyx_k_empty), 0, 0, 1, 1},
   {&__pyx_n_s_encode, __pyx_k_encode, sizeof(__pyx_k_encode), 0, 0, 1, 1},
   {&__pyx_n_s_enumerate, __pyx_k_enumerate, sizeof(__pyx_k_enumerate), 0, 0, 1, 1},
+  {&__pyx_n_s_err, __pyx_k_err, sizeof(__pyx_k_err), 0, 0, 1, 1},
   {&__pyx_n_s_error, __pyx_k_error, sizeof(__pyx_k_error), 0, 0, 1, 1},
+  {&__pyx_n_s_fill, __pyx_k_fill, sizeof(__pyx_k_fill), 0, 0, 1, 1},
+  {&__pyx_n_s_firsto, __pyx_k_firsto, sizeof(__pyx_k_firsto), 0, 0, 1, 1},
   {&__pyx_n_s_flags, __pyx_k_flags, sizeof(__pyx_k_flags), 0, 0, 1, 1},
+  {&__pyx_n_s_float, __pyx_k_float, sizeof(__pyx_k_float), 0, 0, 1, 1},
+  {&__pyx_n_s_float32, __pyx_k_float32, sizeof(__pyx_k_float32), 0, 0, 1, 1},
+  {&__pyx_n_s_float64, __pyx_k_float64, sizeof(__pyx_k_float64), 0, 0, 1, 1},
   {&__pyx_n_s_fold_col, __pyx_k_fold_col, sizeof(__pyx_k_fold_col), 0, 0, 1, 1},
   {&__pyx_n_s_fold_csr_diagonal_nc, __pyx_k_fold_csr_diagonal_nc, sizeof(__pyx_k_fold_csr_diagonal_nc), 0, 0, 1, 1},
   {&__pyx_n_s_fold_csr_matrix, __pyx_k_fold_csr_matrix, sizeof(__pyx_k_fold_csr_matrix), 0, 0, 1, 1},
@@ -21367,24 +30340,50 @@ static __Pyx_StringTabEntry __pyx_string_tab[] = {
   {&__pyx_n_s_format, __pyx_k_format, sizeof(__pyx_k_format), 0, 0, 1, 1},
   {&__pyx_n_s_fortran, __pyx_k_fortran, sizeof(__pyx_k_fortran), 0, 0, 1, 1},
   {&__pyx_n_u_fortran, __pyx_k_fortran, sizeof(__pyx_k_fortran), 0, 1, 0, 1},
+  {&__pyx_n_s_full, __pyx_k_full, sizeof(__pyx_k_full), 0, 0, 1, 1},
   {&__pyx_n_s_getstate, __pyx_k_getstate, sizeof(__pyx_k_getstate), 0, 0, 1, 1},
   {&__pyx_kp_s_got_differing_extents_in_dimensi, __pyx_k_got_differing_extents_in_dimensi, sizeof(__pyx_k_got_differing_extents_in_dimensi), 0, 0, 1, 0},
+  {&__pyx_n_s_i, __pyx_k_i, sizeof(__pyx_k_i), 0, 0, 1, 1},
+  {&__pyx_n_s_i1, __pyx_k_i1, sizeof(__pyx_k_i1), 0, 0, 1, 1},
+  {&__pyx_n_s_i2, __pyx_k_i2, sizeof(__pyx_k_i2), 0, 0, 1, 1},
+  {&__pyx_n_s_ia, __pyx_k_ia, sizeof(__pyx_k_ia), 0, 0, 1, 1},
   {&__pyx_n_s_id, __pyx_k_id, sizeof(__pyx_k_id), 0, 0, 1, 1},
+  {&__pyx_n_s_idx, __pyx_k_idx, sizeof(__pyx_k_idx), 0, 0, 1, 1},
+  {&__pyx_n_s_idx1, __pyx_k_idx1, sizeof(__pyx_k_idx1), 0, 0, 1, 1},
+  {&__pyx_n_s_idx2, __pyx_k_idx2, sizeof(__pyx_k_idx2), 0, 0, 1, 1},
   {&__pyx_n_s_import, __pyx_k_import, sizeof(__pyx_k_import), 0, 0, 1, 1},
   {&__pyx_n_s_ind, __pyx_k_ind, sizeof(__pyx_k_ind), 0, 0, 1, 1},
   {&__pyx_n_s_int32, __pyx_k_int32, sizeof(__pyx_k_int32), 0, 0, 1, 1},
+  {&__pyx_n_s_io, __pyx_k_io, sizeof(__pyx_k_io), 0, 0, 1, 1},
+  {&__pyx_n_s_isc, __pyx_k_isc, sizeof(__pyx_k_isc), 0, 0, 1, 1},
   {&__pyx_n_s_itemsize, __pyx_k_itemsize, sizeof(__pyx_k_itemsize), 0, 0, 1, 1},
   {&__pyx_kp_s_itemsize_0_for_cython_array, __pyx_k_itemsize_0_for_cython_array, sizeof(__pyx_k_itemsize_0_for_cython_array), 0, 0, 1, 0},
+  {&__pyx_n_s_j, __pyx_k_j, sizeof(__pyx_k_j), 0, 0, 1, 1},
+  {&__pyx_n_s_k, __pyx_k_k, sizeof(__pyx_k_k), 0, 0, 1, 1},
+  {&__pyx_n_s_kind, __pyx_k_kind, sizeof(__pyx_k_kind), 0, 0, 1, 1},
+  {&__pyx_n_s_kwargs, __pyx_k_kwargs, sizeof(__pyx_k_kwargs), 0, 0, 1, 1},
+  {&__pyx_n_s_last, __pyx_k_last, sizeof(__pyx_k_last), 0, 0, 1, 1},
   {&__pyx_n_s_main, __pyx_k_main, sizeof(__pyx_k_main), 0, 0, 1, 1},
+  {&__pyx_n_s_max_c, __pyx_k_max_c, sizeof(__pyx_k_max_c), 0, 0, 1, 1},
+  {&__pyx_n_s_max_k, __pyx_k_max_k, sizeof(__pyx_k_max_k), 0, 0, 1, 1},
   {&__pyx_n_s_memview, __pyx_k_memview, sizeof(__pyx_k_memview), 0, 0, 1, 1},
   {&__pyx_n_s_mode, __pyx_k_mode, sizeof(__pyx_k_mode), 0, 0, 1, 1},
+  {&__pyx_n_s_n, __pyx_k_n, sizeof(__pyx_k_n), 0, 0, 1, 1},
+  {&__pyx_n_s_n_s, __pyx_k_n_s, sizeof(__pyx_k_n_s), 0, 0, 1, 1},
+  {&__pyx_n_s_na, __pyx_k_na, sizeof(__pyx_k_na), 0, 0, 1, 1},
   {&__pyx_n_s_name, __pyx_k_name, sizeof(__pyx_k_name), 0, 0, 1, 1},
   {&__pyx_n_s_name_2, __pyx_k_name_2, sizeof(__pyx_k_name_2), 0, 0, 1, 1},
+  {&__pyx_n_s_nc, __pyx_k_nc, sizeof(__pyx_k_nc), 0, 0, 1, 1},
   {&__pyx_n_s_ncol, __pyx_k_ncol, sizeof(__pyx_k_ncol), 0, 0, 1, 1},
+  {&__pyx_n_s_ncol1, __pyx_k_ncol1, sizeof(__pyx_k_ncol1), 0, 0, 1, 1},
+  {&__pyx_n_s_ncol2, __pyx_k_ncol2, sizeof(__pyx_k_ncol2), 0, 0, 1, 1},
+  {&__pyx_n_s_nd, __pyx_k_nd, sizeof(__pyx_k_nd), 0, 0, 1, 1},
   {&__pyx_kp_u_ndarray_is_not_C_contiguous, __pyx_k_ndarray_is_not_C_contiguous, sizeof(__pyx_k_ndarray_is_not_C_contiguous), 0, 1, 0, 0},
   {&__pyx_kp_u_ndarray_is_not_Fortran_contiguou, __pyx_k_ndarray_is_not_Fortran_contiguou, sizeof(__pyx_k_ndarray_is_not_Fortran_contiguou), 0, 1, 0, 0},
   {&__pyx_n_s_ndim, __pyx_k_ndim, sizeof(__pyx_k_ndim), 0, 0, 1, 1},
   {&__pyx_n_s_new, __pyx_k_new, sizeof(__pyx_k_new), 0, 0, 1, 1},
+  {&__pyx_n_s_nnz, __pyx_k_nnz, sizeof(__pyx_k_nnz), 0, 0, 1, 1},
+  {&__pyx_n_s_no, __pyx_k_no, sizeof(__pyx_k_no), 0, 0, 1, 1},
   {&__pyx_kp_s_no_default___reduce___due_to_non, __pyx_k_no_default___reduce___due_to_non, sizeof(__pyx_k_no_default___reduce___due_to_non), 0, 0, 1, 0},
   {&__pyx_n_s_np, __pyx_k_np, sizeof(__pyx_k_np), 0, 0, 1, 1},
   {&__pyx_n_s_nr, __pyx_k_nr, sizeof(__pyx_k_nr), 0, 0, 1, 1},
@@ -21392,10 +30391,19 @@ static __Pyx_StringTabEntry __pyx_string_tab[] = {
   {&__pyx_kp_s_numpy_core_multiarray_failed_to, __pyx_k_numpy_core_multiarray_failed_to, sizeof(__pyx_k_numpy_core_multiarray_failed_to), 0, 0, 1, 0},
   {&__pyx_kp_s_numpy_core_umath_failed_to_impor, __pyx_k_numpy_core_umath_failed_to_impor, sizeof(__pyx_k_numpy_core_umath_failed_to_impor), 0, 0, 1, 0},
   {&__pyx_n_s_nz, __pyx_k_nz, sizeof(__pyx_k_nz), 0, 0, 1, 1},
+  {&__pyx_n_s_o2a, __pyx_k_o2a, sizeof(__pyx_k_o2a), 0, 0, 1, 1},
   {&__pyx_n_s_obj, __pyx_k_obj, sizeof(__pyx_k_obj), 0, 0, 1, 1},
+  {&__pyx_n_s_off, __pyx_k_off, sizeof(__pyx_k_off), 0, 0, 1, 1},
+  {&__pyx_n_s_only, __pyx_k_only, sizeof(__pyx_k_only), 0, 0, 1, 1},
+  {&__pyx_n_s_p, __pyx_k_p, sizeof(__pyx_k_p), 0, 0, 1, 1},
   {&__pyx_n_s_pack, __pyx_k_pack, sizeof(__pyx_k_pack), 0, 0, 1, 1},
+  {&__pyx_n_s_pairs, __pyx_k_pairs, sizeof(__pyx_k_pairs), 0, 0, 1, 1},
   {&__pyx_n_s_pickle, __pyx_k_pickle, sizeof(__pyx_k_pickle), 0, 0, 1, 1},
+  {&__pyx_n_s_pos, __pyx_k_pos, sizeof(__pyx_k_pos), 0, 0, 1, 1},
   {&__pyx_n_s_ptr, __pyx_k_ptr, sizeof(__pyx_k_ptr), 0, 0, 1, 1},
+  {&__pyx_n_s_ptr1, __pyx_k_ptr1, sizeof(__pyx_k_ptr1), 0, 0, 1, 1},
+  {&__pyx_n_s_ptr2, __pyx_k_ptr2, sizeof(__pyx_k_ptr2), 0, 0, 1, 1},
+  {&__pyx_n_s_pvt, __pyx_k_pvt, sizeof(__pyx_k_pvt), 0, 0, 1, 1},
   {&__pyx_n_s_pyx_PickleError, __pyx_k_pyx_PickleError, sizeof(__pyx_k_pyx_PickleError), 0, 0, 1, 1},
   {&__pyx_n_s_pyx_checksum, __pyx_k_pyx_checksum, sizeof(__pyx_k_pyx_checksum), 0, 0, 1, 1},
   {&__pyx_n_s_pyx_getbuffer, __pyx_k_pyx_getbuffer, sizeof(__pyx_k_pyx_getbuffer), 0, 0, 1, 1},
@@ -21404,22 +30412,37 @@ static __Pyx_StringTabEntry __pyx_string_tab[] = {
   {&__pyx_n_s_pyx_type, __pyx_k_pyx_type, sizeof(__pyx_k_pyx_type), 0, 0, 1, 1},
   {&__pyx_n_s_pyx_unpickle_Enum, __pyx_k_pyx_unpickle_Enum, sizeof(__pyx_k_pyx_unpickle_Enum), 0, 0, 1, 1},
   {&__pyx_n_s_pyx_vtable, __pyx_k_pyx_vtable, sizeof(__pyx_k_pyx_vtable), 0, 0, 1, 1},
+  {&__pyx_n_s_q, __pyx_k_q, sizeof(__pyx_k_q), 0, 0, 1, 1},
   {&__pyx_n_s_r, __pyx_k_r, sizeof(__pyx_k_r), 0, 0, 1, 1},
   {&__pyx_n_s_range, __pyx_k_range, sizeof(__pyx_k_range), 0, 0, 1, 1},
   {&__pyx_n_s_reduce, __pyx_k_reduce, sizeof(__pyx_k_reduce), 0, 0, 1, 1},
   {&__pyx_n_s_reduce_cython, __pyx_k_reduce_cython, sizeof(__pyx_k_reduce_cython), 0, 0, 1, 1},
   {&__pyx_n_s_reduce_ex, __pyx_k_reduce_ex, sizeof(__pyx_k_reduce_ex), 0, 0, 1, 1},
+  {&__pyx_n_s_rows, __pyx_k_rows, sizeof(__pyx_k_rows), 0, 0, 1, 1},
   {&__pyx_n_s_rr, __pyx_k_rr, sizeof(__pyx_k_rr), 0, 0, 1, 1},
+  {&__pyx_n_s_s, __pyx_k_s, sizeof(__pyx_k_s), 0, 0, 1, 1},
+  {&__pyx_n_s_scol, __pyx_k_scol, sizeof(__pyx_k_scol), 0, 0, 1, 1},
   {&__pyx_n_s_setstate, __pyx_k_setstate, sizeof(__pyx_k_setstate), 0, 0, 1, 1},
   {&__pyx_n_s_setstate_cython, __pyx_k_setstate_cython, sizeof(__pyx_k_setstate_cython), 0, 0, 1, 1},
   {&__pyx_n_s_shape, __pyx_k_shape, sizeof(__pyx_k_shape), 0, 0, 1, 1},
+  {&__pyx_n_s_sidx, __pyx_k_sidx, sizeof(__pyx_k_sidx), 0, 0, 1, 1},
+  {&__pyx_n_s_signatures, __pyx_k_signatures, sizeof(__pyx_k_signatures), 0, 0, 1, 1},
   {&__pyx_n_s_sisl__sparse, __pyx_k_sisl__sparse, sizeof(__pyx_k_sisl__sparse), 0, 0, 1, 1},
   {&__pyx_kp_s_sisl__sparse_pyx, __pyx_k_sisl__sparse_pyx, sizeof(__pyx_k_sisl__sparse_pyx), 0, 0, 1, 0},
   {&__pyx_n_s_size, __pyx_k_size, sizeof(__pyx_k_size), 0, 0, 1, 1},
+  {&__pyx_n_s_sncol, __pyx_k_sncol, sizeof(__pyx_k_sncol), 0, 0, 1, 1},
   {&__pyx_kp_s_something_went_wrong, __pyx_k_something_went_wrong, sizeof(__pyx_k_something_went_wrong), 0, 0, 1, 0},
   {&__pyx_kp_s_something_went_wrong_NC, __pyx_k_something_went_wrong_NC, sizeof(__pyx_k_something_went_wrong_NC), 0, 0, 1, 0},
   {&__pyx_kp_s_something_went_wrong_overlap_NC, __pyx_k_something_went_wrong_overlap_NC, sizeof(__pyx_k_something_went_wrong_overlap_NC), 0, 0, 1, 0},
   {&__pyx_n_s_sort, __pyx_k_sort, sizeof(__pyx_k_sort), 0, 0, 1, 1},
+  {&__pyx_n_s_sparse_finalize, __pyx_k_sparse_finalize, sizeof(__pyx_k_sparse_finalize), 0, 0, 1, 1},
+  {&__pyx_n_s_sparse_merge, __pyx_k_sparse_merge, sizeof(__pyx_k_sparse_merge), 0, 0, 1, 1},
+  {&__pyx_n_s_sparse_orb_to_atom, __pyx_k_sparse_orb_to_atom, sizeof(__pyx_k_sparse_orb_to_atom), 0, 0, 1, 1},
+  {&__pyx_n_s_sparse_sub, __pyx_k_sparse_sub, sizeof(__pyx_k_sparse_sub), 0, 0, 1, 1},
+  {&__pyx_n_s_sparse_transpose, __pyx_k_sparse_transpose, sizeof(__pyx_k_sparse_transpose), 0, 0, 1, 1},
+  {&__pyx_n_s_split, __pyx_k_split, sizeof(__pyx_k_split), 0, 0, 1, 1},
+  {&__pyx_n_s_sptr, __pyx_k_sptr, sizeof(__pyx_k_sptr), 0, 0, 1, 1},
+  {&__pyx_n_s_stamp, __pyx_k_stamp, sizeof(__pyx_k_stamp), 0, 0, 1, 1},
   {&__pyx_n_s_start, __pyx_k_start, sizeof(__pyx_k_start), 0, 0, 1, 1},
   {&__pyx_n_s_step, __pyx_k_step, sizeof(__pyx_k_step), 0, 0, 1, 1},
   {&__pyx_n_s_stop, __pyx_k_stop, sizeof(__pyx_k_stop), 0, 0, 1, 1},
@@ -21427,24 +30450,32 @@ static __Pyx_StringTabEntry __pyx_string_tab[] = {
   {&__pyx_kp_s_strided_and_direct_or_indirect, __pyx_k_strided_and_direct_or_indirect, sizeof(__pyx_k_strided_and_direct_or_indirect), 0, 0, 1, 0},
   {&__pyx_kp_s_strided_and_indirect, __pyx_k_strided_and_indirect, sizeof(__pyx_k_strided_and_indirect), 0, 0, 1, 0},
   {&__pyx_kp_s_stringsource, __pyx_k_stringsource, sizeof(__pyx_k_stringsource), 0, 0, 1, 0},
+  {&__pyx_n_s_strip, __pyx_k_strip, sizeof(__pyx_k_strip), 0, 0, 1, 1},
   {&__pyx_n_s_struct, __pyx_k_struct, sizeof(__pyx_k_struct), 0, 0, 1, 1},
+  {&__pyx_n_s_sz, __pyx_k_sz, sizeof(__pyx_k_sz), 0, 0, 1, 1},
+  {&__pyx_n_s_t, __pyx_k_t, sizeof(__pyx_k_t), 0, 0, 1, 1},
+  {&__pyx_n_s_tcol, __pyx_k_tcol, sizeof(__pyx_k_tcol), 0, 0, 1, 1},
   {&__pyx_n_s_test, __pyx_k_test, sizeof(__pyx_k_test), 0, 0, 1, 1},
   {&__pyx_n_s_tmp, __pyx_k_tmp, sizeof(__pyx_k_tmp), 0, 0, 1, 1},
+  {&__pyx_n_s_tncol, __pyx_k_tncol, sizeof(__pyx_k_tncol), 0, 0, 1, 1},
+  {&__pyx_n_s_tptr, __pyx_k_tptr, sizeof(__pyx_k_tptr), 0, 0, 1, 1},
   {&__pyx_kp_s_unable_to_allocate_array_data, __pyx_k_unable_to_allocate_array_data, sizeof(__pyx_k_unable_to_allocate_array_data), 0, 0, 1, 0},
   {&__pyx_kp_s_unable_to_allocate_shape_and_str, __pyx_k_unable_to_allocate_shape_and_str, sizeof(__pyx_k_unable_to_allocate_shape_and_str), 0, 0, 1, 0},
   {&__pyx_kp_u_unknown_dtype_code_in_numpy_pxd, __pyx_k_unknown_dtype_code_in_numpy_pxd, sizeof(__pyx_k_unknown_dtype_code_in_numpy_pxd), 0, 1, 0, 0},
   {&__pyx_n_s_unpack, __pyx_k_unpack, sizeof(__pyx_k_unpack), 0, 0, 1, 1},
   {&__pyx_n_s_update, __pyx_k_update, sizeof(__pyx_k_update), 0, 0, 1, 1},
+  {&__pyx_n_s_v, __pyx_k_v, sizeof(__pyx_k_v), 0, 0, 1, 1},
+  {&__pyx_n_s_zeros, __pyx_k_zeros, sizeof(__pyx_k_zeros), 0, 0, 1, 1},
   {0, 0, 0, 0, 0, 0, 0}
 };
 static CYTHON_SMALL_CODE int __Pyx_InitCachedBuiltins(void) {
-  __pyx_builtin_range = __Pyx_GetBuiltinName(__pyx_n_s_range); if (!__pyx_builtin_range) __PYX_ERR(0, 20, __pyx_L1_error)
-  __pyx_builtin_ValueError = __Pyx_GetBuiltinName(__pyx_n_s_ValueError); if (!__pyx_builtin_ValueError) __PYX_ERR(0, 74, __pyx_L1_error)
+  __pyx_builtin_range = __Pyx_GetBuiltinName(__pyx_n_s_range); if (!__pyx_builtin_range) __PYX_ERR(0, 22, __pyx_L1_error)
+  __pyx_builtin_ValueError = __Pyx_GetBuiltinName(__pyx_n_s_ValueError); if (!__pyx_builtin_ValueError) __PYX_ERR(0, 76, __pyx_L1_error)
+  __pyx_builtin_MemoryError = __Pyx_GetBuiltinName(__pyx_n_s_MemoryError); if (!__pyx_builtin_MemoryError) __PYX_ERR(0, 579, __pyx_L1_error)
+  __pyx_builtin_TypeError = __Pyx_GetBuiltinName(__pyx_n_s_TypeError); if (!__pyx_builtin_TypeError) __PYX_ERR(0, 672, __pyx_L1_error)
   __pyx_builtin_RuntimeError = __Pyx_GetBuiltinName(__pyx_n_s_RuntimeError); if (!__pyx_builtin_RuntimeError) __PYX_ERR(1, 856, __pyx_L1_error)
   __pyx_builtin_ImportError = __Pyx_GetBuiltinName(__pyx_n_s_ImportError); if (!__pyx_builtin_ImportError) __PYX_ERR(1, 1038, __pyx_L1_error)
-  __pyx_builtin_MemoryError = __Pyx_GetBuiltinName(__pyx_n_s_MemoryError); if (!__pyx_builtin_MemoryError) __PYX_ERR(2, 148, __pyx_L1_error)
   __pyx_builtin_enumerate = __Pyx_GetBuiltinName(__pyx_n_s_enumerate); if (!__pyx_builtin_enumerate) __PYX_ERR(2, 151, __pyx_L1_error)
-  __pyx_builtin_TypeError = __Pyx_GetBuiltinName(__pyx_n_s_TypeError); if (!__pyx_builtin_TypeError) __PYX_ERR(2, 2, __pyx_L1_error)
   __pyx_builtin_Ellipsis = __Pyx_GetBuiltinName(__pyx_n_s_Ellipsis); if (!__pyx_builtin_Ellipsis) __PYX_ERR(2, 400, __pyx_L1_error)
   __pyx_builtin_id = __Pyx_GetBuiltinName(__pyx_n_s_id); if (!__pyx_builtin_id) __PYX_ERR(2, 609, __pyx_L1_error)
   __pyx_builtin_IndexError = __Pyx_GetBuiltinName(__pyx_n_s_IndexError); if (!__pyx_builtin_IndexError) __PYX_ERR(2, 828, __pyx_L1_error)
@@ -21457,115 +30488,140 @@ static CYTHON_SMALL_CODE int __Pyx_InitCachedConstants(void) {
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("__Pyx_InitCachedConstants", 0);
 
-  /* "sisl/_sparse.pyx":74
+  /* "sisl/_sparse.pyx":76
  * 
  *     if nz > fold_col.shape[0]:
  *         raise ValueError('something went wrong')             # <<<<<<<<<<<<<<
  * 
  *     # Return objects
  */
-  __pyx_tuple_ = PyTuple_Pack(1, __pyx_kp_s_something_went_wrong); if (unlikely(!__pyx_tuple_)) __PYX_ERR(0, 74, __pyx_L1_error)
+  __pyx_tuple_ = PyTuple_Pack(1, __pyx_kp_s_something_went_wrong); if (unlikely(!__pyx_tuple_)) __PYX_ERR(0, 76, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_tuple_);
   __Pyx_GIVEREF(__pyx_tuple_);
 
-  /* "sisl/_sparse.pyx":143
+  /* "sisl/_sparse.pyx":145
  * 
  *     if nz > fold_col.shape[0]:
  *         raise ValueError('something went wrong NC')             # <<<<<<<<<<<<<<
  * 
  *     # Return objects
  */
-  __pyx_tuple__2 = PyTuple_Pack(1, __pyx_kp_s_something_went_wrong_NC); if (unlikely(!__pyx_tuple__2)) __PYX_ERR(0, 143, __pyx_L1_error)
+  __pyx_tuple__2 = PyTuple_Pack(1, __pyx_kp_s_something_went_wrong_NC); if (unlikely(!__pyx_tuple__2)) __PYX_ERR(0, 145, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_tuple__2);
   __Pyx_GIVEREF(__pyx_tuple__2);
 
-  /* "sisl/_sparse.pyx":210
+  /* "sisl/_sparse.pyx":212
  * 
  *     if nz > fold_col.shape[0]:
  *         raise ValueError('something went wrong overlap NC')             # <<<<<<<<<<<<<<
  * 
  *     # Return objects
  */
-  __pyx_tuple__3 = PyTuple_Pack(1, __pyx_kp_s_something_went_wrong_overlap_NC); if (unlikely(!__pyx_tuple__3)) __PYX_ERR(0, 210, __pyx_L1_error)
+  __pyx_tuple__3 = PyTuple_Pack(1, __pyx_kp_s_something_went_wrong_overlap_NC); if (unlikely(!__pyx_tuple__3)) __PYX_ERR(0, 212, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_tuple__3);
   __Pyx_GIVEREF(__pyx_tuple__3);
 
-  /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":272
+  /* "sisl/_sparse.pyx":550
+ *         for r in range(nr + 1):
+ *             ptr[r] = 0
+ *         return 0, -1             # <<<<<<<<<<<<<<
+ *     col = &COL_v[0]
+ *     data = &D_v[0, 0]
+ */
+  __pyx_tuple__4 = PyTuple_Pack(2, __pyx_int_0, __pyx_int_neg_1); if (unlikely(!__pyx_tuple__4)) __PYX_ERR(0, 550, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__4);
+  __Pyx_GIVEREF(__pyx_tuple__4);
+
+  /* "sisl/_sparse.pyx":672
+ * @cython.initializedcheck(False)
+ * @cython.cdivision(True)
+ * def sparse_orb_to_atom(np.ndarray[np.int32_t, ndim=1, mode='c'] PTR,             # <<<<<<<<<<<<<<
+ *                        np.ndarray[np.int32_t, ndim=1, mode='c'] COL,
+ *                        _orb_real[:, ::1] D,
+ */
+  __pyx_tuple__7 = PyTuple_Pack(1, __pyx_kp_s_No_matching_signature_found); if (unlikely(!__pyx_tuple__7)) __PYX_ERR(0, 672, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__7);
+  __Pyx_GIVEREF(__pyx_tuple__7);
+  __pyx_tuple__8 = PyTuple_Pack(1, __pyx_kp_s_Function_call_with_ambiguous_arg); if (unlikely(!__pyx_tuple__8)) __PYX_ERR(0, 672, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__8);
+  __Pyx_GIVEREF(__pyx_tuple__8);
+
+  /* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":272
  *             if ((flags & pybuf.PyBUF_C_CONTIGUOUS == pybuf.PyBUF_C_CONTIGUOUS)
  *                 and not PyArray_CHKFLAGS(self, NPY_ARRAY_C_CONTIGUOUS)):
  *                 raise ValueError(u"ndarray is not C contiguous")             # <<<<<<<<<<<<<<
  * 
  *             if ((flags & pybuf.PyBUF_F_CONTIGUOUS == pybuf.PyBUF_F_CONTIGUOUS)
  */
-  __pyx_tuple__4 = PyTuple_Pack(1, __pyx_kp_u_ndarray_is_not_C_contiguous); if (unlikely(!__pyx_tuple__4)) __PYX_ERR(1, 272, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__4);
-  __Pyx_GIVEREF(__pyx_tuple__4);
+  __pyx_tuple__9 = PyTuple_Pack(1, __pyx_kp_u_ndarray_is_not_C_contiguous); if (unlikely(!__pyx_tuple__9)) __PYX_ERR(1, 272, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__9);
+  __Pyx_GIVEREF(__pyx_tuple__9);
 
-  /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":276
+  /* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":276
  *             if ((flags & pybuf.PyBUF_F_CONTIGUOUS == pybuf.PyBUF_F_CONTIGUOUS)
  *                 and not PyArray_CHKFLAGS(self, NPY_ARRAY_F_CONTIGUOUS)):
  *                 raise ValueError(u"ndarray is not Fortran contiguous")             # <<<<<<<<<<<<<<
  * 
  *             info.buf = PyArray_DATA(self)
  */
-  __pyx_tuple__5 = PyTuple_Pack(1, __pyx_kp_u_ndarray_is_not_Fortran_contiguou); if (unlikely(!__pyx_tuple__5)) __PYX_ERR(1, 276, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__5);
-  __Pyx_GIVEREF(__pyx_tuple__5);
+  __pyx_tuple__10 = PyTuple_Pack(1, __pyx_kp_u_ndarray_is_not_Fortran_contiguou); if (unlikely(!__pyx_tuple__10)) __PYX_ERR(1, 276, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__10);
+  __Pyx_GIVEREF(__pyx_tuple__10);
 
-  /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":306
+  /* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":306
  *                 if ((descr.byteorder == c'>' and little_endian) or
  *                     (descr.byteorder == c'<' and not little_endian)):
  *                     raise ValueError(u"Non-native byte order not supported")             # <<<<<<<<<<<<<<
  *                 if   t == NPY_BYTE:        f = "b"
  *                 elif t == NPY_UBYTE:       f = "B"
  */
-  __pyx_tuple__6 = PyTuple_Pack(1, __pyx_kp_u_Non_native_byte_order_not_suppor); if (unlikely(!__pyx_tuple__6)) __PYX_ERR(1, 306, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__6);
-  __Pyx_GIVEREF(__pyx_tuple__6);
+  __pyx_tuple__11 = PyTuple_Pack(1, __pyx_kp_u_Non_native_byte_order_not_suppor); if (unlikely(!__pyx_tuple__11)) __PYX_ERR(1, 306, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__11);
+  __Pyx_GIVEREF(__pyx_tuple__11);
 
-  /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":856
+  /* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":856
  * 
  *         if (end - f) - <int>(new_offset - offset[0]) < 15:
  *             raise RuntimeError(u"Format string allocated too short, see comment in numpy.pxd")             # <<<<<<<<<<<<<<
  * 
  *         if ((child.byteorder == c'>' and little_endian) or
  */
-  __pyx_tuple__7 = PyTuple_Pack(1, __pyx_kp_u_Format_string_allocated_too_shor); if (unlikely(!__pyx_tuple__7)) __PYX_ERR(1, 856, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__7);
-  __Pyx_GIVEREF(__pyx_tuple__7);
+  __pyx_tuple__12 = PyTuple_Pack(1, __pyx_kp_u_Format_string_allocated_too_shor); if (unlikely(!__pyx_tuple__12)) __PYX_ERR(1, 856, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__12);
+  __Pyx_GIVEREF(__pyx_tuple__12);
 
-  /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":880
+  /* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":880
  *             t = child.type_num
  *             if end - f < 5:
  *                 raise RuntimeError(u"Format string allocated too short.")             # <<<<<<<<<<<<<<
  * 
  *             # Until ticket #99 is fixed, use integers to avoid warnings
  */
-  __pyx_tuple__8 = PyTuple_Pack(1, __pyx_kp_u_Format_string_allocated_too_shor_2); if (unlikely(!__pyx_tuple__8)) __PYX_ERR(1, 880, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__8);
-  __Pyx_GIVEREF(__pyx_tuple__8);
+  __pyx_tuple__13 = PyTuple_Pack(1, __pyx_kp_u_Format_string_allocated_too_shor_2); if (unlikely(!__pyx_tuple__13)) __PYX_ERR(1, 880, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__13);
+  __Pyx_GIVEREF(__pyx_tuple__13);
 
-  /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":1038
+  /* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":1038
  *         _import_array()
  *     except Exception:
  *         raise ImportError("numpy.core.multiarray failed to import")             # <<<<<<<<<<<<<<
  * 
  * cdef inline int import_umath() except -1:
  */
-  __pyx_tuple__9 = PyTuple_Pack(1, __pyx_kp_s_numpy_core_multiarray_failed_to); if (unlikely(!__pyx_tuple__9)) __PYX_ERR(1, 1038, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__9);
-  __Pyx_GIVEREF(__pyx_tuple__9);
+  __pyx_tuple__14 = PyTuple_Pack(1, __pyx_kp_s_numpy_core_multiarray_failed_to); if (unlikely(!__pyx_tuple__14)) __PYX_ERR(1, 1038, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__14);
+  __Pyx_GIVEREF(__pyx_tuple__14);
 
-  /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":1044
+  /* "../.pyenv/versions/3.7.16/lib/python3.7/site-packages/Cython/Includes/numpy/__init__.pxd":1044
  *         _import_umath()
  *     except Exception:
  *         raise ImportError("numpy.core.umath failed to import")             # <<<<<<<<<<<<<<
  * 
  * cdef inline int import_ufunc() except -1:
  */
-  __pyx_tuple__10 = PyTuple_Pack(1, __pyx_kp_s_numpy_core_umath_failed_to_impor); if (unlikely(!__pyx_tuple__10)) __PYX_ERR(1, 1044, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__10);
-  __Pyx_GIVEREF(__pyx_tuple__10);
+  __pyx_tuple__15 = PyTuple_Pack(1, __pyx_kp_s_numpy_core_umath_failed_to_impor); if (unlikely(!__pyx_tuple__15)) __PYX_ERR(1, 1044, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__15);
+  __Pyx_GIVEREF(__pyx_tuple__15);
 
   /* "View.MemoryView":133
  * 
@@ -21574,9 +30630,9 @@ static CYTHON_SMALL_CODE int __Pyx_InitCachedConstants(void) {
  * 
  *         if itemsize <= 0:
  */
-  __pyx_tuple__11 = PyTuple_Pack(1, __pyx_kp_s_Empty_shape_tuple_for_cython_arr); if (unlikely(!__pyx_tuple__11)) __PYX_ERR(2, 133, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__11);
-  __Pyx_GIVEREF(__pyx_tuple__11);
+  __pyx_tuple__16 = PyTuple_Pack(1, __pyx_kp_s_Empty_shape_tuple_for_cython_arr); if (unlikely(!__pyx_tuple__16)) __PYX_ERR(2, 133, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__16);
+  __Pyx_GIVEREF(__pyx_tuple__16);
 
   /* "View.MemoryView":136
  * 
@@ -21585,9 +30641,9 @@ static CYTHON_SMALL_CODE int __Pyx_InitCachedConstants(void) {
  * 
  *         if not isinstance(format, bytes):
  */
-  __pyx_tuple__12 = PyTuple_Pack(1, __pyx_kp_s_itemsize_0_for_cython_array); if (unlikely(!__pyx_tuple__12)) __PYX_ERR(2, 136, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__12);
-  __Pyx_GIVEREF(__pyx_tuple__12);
+  __pyx_tuple__17 = PyTuple_Pack(1, __pyx_kp_s_itemsize_0_for_cython_array); if (unlikely(!__pyx_tuple__17)) __PYX_ERR(2, 136, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__17);
+  __Pyx_GIVEREF(__pyx_tuple__17);
 
   /* "View.MemoryView":148
  * 
@@ -21596,9 +30652,9 @@ static CYTHON_SMALL_CODE int __Pyx_InitCachedConstants(void) {
  * 
  * 
  */
-  __pyx_tuple__13 = PyTuple_Pack(1, __pyx_kp_s_unable_to_allocate_shape_and_str); if (unlikely(!__pyx_tuple__13)) __PYX_ERR(2, 148, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__13);
-  __Pyx_GIVEREF(__pyx_tuple__13);
+  __pyx_tuple__18 = PyTuple_Pack(1, __pyx_kp_s_unable_to_allocate_shape_and_str); if (unlikely(!__pyx_tuple__18)) __PYX_ERR(2, 148, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__18);
+  __Pyx_GIVEREF(__pyx_tuple__18);
 
   /* "View.MemoryView":176
  *             self.data = <char *>malloc(self.len)
@@ -21607,9 +30663,9 @@ static CYTHON_SMALL_CODE int __Pyx_InitCachedConstants(void) {
  * 
  *             if self.dtype_is_object:
  */
-  __pyx_tuple__14 = PyTuple_Pack(1, __pyx_kp_s_unable_to_allocate_array_data); if (unlikely(!__pyx_tuple__14)) __PYX_ERR(2, 176, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__14);
-  __Pyx_GIVEREF(__pyx_tuple__14);
+  __pyx_tuple__19 = PyTuple_Pack(1, __pyx_kp_s_unable_to_allocate_array_data); if (unlikely(!__pyx_tuple__19)) __PYX_ERR(2, 176, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__19);
+  __Pyx_GIVEREF(__pyx_tuple__19);
 
   /* "View.MemoryView":192
  *             bufmode = PyBUF_F_CONTIGUOUS | PyBUF_ANY_CONTIGUOUS
@@ -21618,9 +30674,9 @@ static CYTHON_SMALL_CODE int __Pyx_InitCachedConstants(void) {
  *         info.buf = self.data
  *         info.len = self.len
  */
-  __pyx_tuple__15 = PyTuple_Pack(1, __pyx_kp_s_Can_only_create_a_buffer_that_is); if (unlikely(!__pyx_tuple__15)) __PYX_ERR(2, 192, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__15);
-  __Pyx_GIVEREF(__pyx_tuple__15);
+  __pyx_tuple__20 = PyTuple_Pack(1, __pyx_kp_s_Can_only_create_a_buffer_that_is); if (unlikely(!__pyx_tuple__20)) __PYX_ERR(2, 192, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__20);
+  __Pyx_GIVEREF(__pyx_tuple__20);
 
   /* "(tree fragment)":2
  * def __reduce_cython__(self):
@@ -21628,18 +30684,18 @@ static CYTHON_SMALL_CODE int __Pyx_InitCachedConstants(void) {
  * def __setstate_cython__(self, __pyx_state):
  *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
  */
-  __pyx_tuple__16 = PyTuple_Pack(1, __pyx_kp_s_no_default___reduce___due_to_non); if (unlikely(!__pyx_tuple__16)) __PYX_ERR(2, 2, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__16);
-  __Pyx_GIVEREF(__pyx_tuple__16);
+  __pyx_tuple__21 = PyTuple_Pack(1, __pyx_kp_s_no_default___reduce___due_to_non); if (unlikely(!__pyx_tuple__21)) __PYX_ERR(2, 2, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__21);
+  __Pyx_GIVEREF(__pyx_tuple__21);
 
   /* "(tree fragment)":4
  *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
  * def __setstate_cython__(self, __pyx_state):
  *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")             # <<<<<<<<<<<<<<
  */
-  __pyx_tuple__17 = PyTuple_Pack(1, __pyx_kp_s_no_default___reduce___due_to_non); if (unlikely(!__pyx_tuple__17)) __PYX_ERR(2, 4, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__17);
-  __Pyx_GIVEREF(__pyx_tuple__17);
+  __pyx_tuple__22 = PyTuple_Pack(1, __pyx_kp_s_no_default___reduce___due_to_non); if (unlikely(!__pyx_tuple__22)) __PYX_ERR(2, 4, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__22);
+  __Pyx_GIVEREF(__pyx_tuple__22);
 
   /* "View.MemoryView":414
  *     def __setitem__(memoryview self, object index, object value):
@@ -21648,9 +30704,9 @@ static CYTHON_SMALL_CODE int __Pyx_InitCachedConstants(void) {
  * 
  *         have_slices, index = _unellipsify(index, self.view.ndim)
  */
-  __pyx_tuple__18 = PyTuple_Pack(1, __pyx_kp_s_Cannot_assign_to_read_only_memor); if (unlikely(!__pyx_tuple__18)) __PYX_ERR(2, 414, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__18);
-  __Pyx_GIVEREF(__pyx_tuple__18);
+  __pyx_tuple__23 = PyTuple_Pack(1, __pyx_kp_s_Cannot_assign_to_read_only_memor); if (unlikely(!__pyx_tuple__23)) __PYX_ERR(2, 414, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__23);
+  __Pyx_GIVEREF(__pyx_tuple__23);
 
   /* "View.MemoryView":491
  *             result = struct.unpack(self.view.format, bytesitem)
@@ -21659,9 +30715,9 @@ static CYTHON_SMALL_CODE int __Pyx_InitCachedConstants(void) {
  *         else:
  *             if len(self.view.format) == 1:
  */
-  __pyx_tuple__19 = PyTuple_Pack(1, __pyx_kp_s_Unable_to_convert_item_to_object); if (unlikely(!__pyx_tuple__19)) __PYX_ERR(2, 491, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__19);
-  __Pyx_GIVEREF(__pyx_tuple__19);
+  __pyx_tuple__24 = PyTuple_Pack(1, __pyx_kp_s_Unable_to_convert_item_to_object); if (unlikely(!__pyx_tuple__24)) __PYX_ERR(2, 491, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__24);
+  __Pyx_GIVEREF(__pyx_tuple__24);
 
   /* "View.MemoryView":516
  *     def __getbuffer__(self, Py_buffer *info, int flags):
@@ -21670,9 +30726,9 @@ static CYTHON_SMALL_CODE int __Pyx_InitCachedConstants(void) {
  * 
  *         if flags & PyBUF_ND:
  */
-  __pyx_tuple__20 = PyTuple_Pack(1, __pyx_kp_s_Cannot_create_writable_memory_vi); if (unlikely(!__pyx_tuple__20)) __PYX_ERR(2, 516, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__20);
-  __Pyx_GIVEREF(__pyx_tuple__20);
+  __pyx_tuple__25 = PyTuple_Pack(1, __pyx_kp_s_Cannot_create_writable_memory_vi); if (unlikely(!__pyx_tuple__25)) __PYX_ERR(2, 516, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__25);
+  __Pyx_GIVEREF(__pyx_tuple__25);
 
   /* "View.MemoryView":566
  *         if self.view.strides == NULL:
@@ -21681,9 +30737,9 @@ static CYTHON_SMALL_CODE int __Pyx_InitCachedConstants(void) {
  * 
  *         return tuple([stride for stride in self.view.strides[:self.view.ndim]])
  */
-  __pyx_tuple__21 = PyTuple_Pack(1, __pyx_kp_s_Buffer_view_does_not_expose_stri); if (unlikely(!__pyx_tuple__21)) __PYX_ERR(2, 566, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__21);
-  __Pyx_GIVEREF(__pyx_tuple__21);
+  __pyx_tuple__26 = PyTuple_Pack(1, __pyx_kp_s_Buffer_view_does_not_expose_stri); if (unlikely(!__pyx_tuple__26)) __PYX_ERR(2, 566, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__26);
+  __Pyx_GIVEREF(__pyx_tuple__26);
 
   /* "View.MemoryView":573
  *     def suboffsets(self):
@@ -21692,12 +30748,12 @@ static CYTHON_SMALL_CODE int __Pyx_InitCachedConstants(void) {
  * 
  *         return tuple([suboffset for suboffset in self.view.suboffsets[:self.view.ndim]])
  */
-  __pyx_tuple__22 = PyTuple_New(1); if (unlikely(!__pyx_tuple__22)) __PYX_ERR(2, 573, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__22);
+  __pyx_tuple__27 = PyTuple_New(1); if (unlikely(!__pyx_tuple__27)) __PYX_ERR(2, 573, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__27);
   __Pyx_INCREF(__pyx_int_neg_1);
   __Pyx_GIVEREF(__pyx_int_neg_1);
-  PyTuple_SET_ITEM(__pyx_tuple__22, 0, __pyx_int_neg_1);
-  __Pyx_GIVEREF(__pyx_tuple__22);
+  PyTuple_SET_ITEM(__pyx_tuple__27, 0, __pyx_int_neg_1);
+  __Pyx_GIVEREF(__pyx_tuple__27);
 
   /* "(tree fragment)":2
  * def __reduce_cython__(self):
@@ -21705,18 +30761,18 @@ static CYTHON_SMALL_CODE int __Pyx_InitCachedConstants(void) {
  * def __setstate_cython__(self, __pyx_state):
  *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
  */
-  __pyx_tuple__23 = PyTuple_Pack(1, __pyx_kp_s_no_default___reduce___due_to_non); if (unlikely(!__pyx_tuple__23)) __PYX_ERR(2, 2, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__23);
-  __Pyx_GIVEREF(__pyx_tuple__23);
+  __pyx_tuple__28 = PyTuple_Pack(1, __pyx_kp_s_no_default___reduce___due_to_non); if (unlikely(!__pyx_tuple__28)) __PYX_ERR(2, 2, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__28);
+  __Pyx_GIVEREF(__pyx_tuple__28);
 
   /* "(tree fragment)":4
  *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
  * def __setstate_cython__(self, __pyx_state):
  *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")             # <<<<<<<<<<<<<<
  */
-  __pyx_tuple__24 = PyTuple_Pack(1, __pyx_kp_s_no_default___reduce___due_to_non); if (unlikely(!__pyx_tuple__24)) __PYX_ERR(2, 4, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__24);
-  __Pyx_GIVEREF(__pyx_tuple__24);
+  __pyx_tuple__29 = PyTuple_Pack(1, __pyx_kp_s_no_default___reduce___due_to_non); if (unlikely(!__pyx_tuple__29)) __PYX_ERR(2, 4, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__29);
+  __Pyx_GIVEREF(__pyx_tuple__29);
 
   /* "View.MemoryView":678
  *         if item is Ellipsis:
@@ -21725,9 +30781,9 @@ static CYTHON_SMALL_CODE int __Pyx_InitCachedConstants(void) {
  *                 seen_ellipsis = True
  *             else:
  */
-  __pyx_slice__25 = PySlice_New(Py_None, Py_None, Py_None); if (unlikely(!__pyx_slice__25)) __PYX_ERR(2, 678, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_slice__25);
-  __Pyx_GIVEREF(__pyx_slice__25);
+  __pyx_slice__30 = PySlice_New(Py_None, Py_None, Py_None); if (unlikely(!__pyx_slice__30)) __PYX_ERR(2, 678, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_slice__30);
+  __Pyx_GIVEREF(__pyx_slice__30);
 
   /* "View.MemoryView":699
  *     for suboffset in suboffsets[:ndim]:
@@ -21736,9 +30792,9 @@ static CYTHON_SMALL_CODE int __Pyx_InitCachedConstants(void) {
  * 
  * 
  */
-  __pyx_tuple__26 = PyTuple_Pack(1, __pyx_kp_s_Indirect_dimensions_not_supporte); if (unlikely(!__pyx_tuple__26)) __PYX_ERR(2, 699, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__26);
-  __Pyx_GIVEREF(__pyx_tuple__26);
+  __pyx_tuple__31 = PyTuple_Pack(1, __pyx_kp_s_Indirect_dimensions_not_supporte); if (unlikely(!__pyx_tuple__31)) __PYX_ERR(2, 699, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__31);
+  __Pyx_GIVEREF(__pyx_tuple__31);
 
   /* "(tree fragment)":2
  * def __reduce_cython__(self):
@@ -21746,54 +30802,114 @@ static CYTHON_SMALL_CODE int __Pyx_InitCachedConstants(void) {
  * def __setstate_cython__(self, __pyx_state):
  *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
  */
-  __pyx_tuple__27 = PyTuple_Pack(1, __pyx_kp_s_no_default___reduce___due_to_non); if (unlikely(!__pyx_tuple__27)) __PYX_ERR(2, 2, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__27);
-  __Pyx_GIVEREF(__pyx_tuple__27);
+  __pyx_tuple__32 = PyTuple_Pack(1, __pyx_kp_s_no_default___reduce___due_to_non); if (unlikely(!__pyx_tuple__32)) __PYX_ERR(2, 2, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__32);
+  __Pyx_GIVEREF(__pyx_tuple__32);
 
   /* "(tree fragment)":4
  *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
  * def __setstate_cython__(self, __pyx_state):
  *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")             # <<<<<<<<<<<<<<
  */
-  __pyx_tuple__28 = PyTuple_Pack(1, __pyx_kp_s_no_default___reduce___due_to_non); if (unlikely(!__pyx_tuple__28)) __PYX_ERR(2, 4, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__28);
-  __Pyx_GIVEREF(__pyx_tuple__28);
+  __pyx_tuple__33 = PyTuple_Pack(1, __pyx_kp_s_no_default___reduce___due_to_non); if (unlikely(!__pyx_tuple__33)) __PYX_ERR(2, 4, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__33);
+  __Pyx_GIVEREF(__pyx_tuple__33);
 
-  /* "sisl/_sparse.pyx":29
+  /* "sisl/_sparse.pyx":31
  * @cython.initializedcheck(False)
  * @cython.cdivision(True)
  * def fold_csr_matrix(np.ndarray[np.int32_t, ndim=1, mode='c'] PTR,             # <<<<<<<<<<<<<<
  *                     np.ndarray[np.int32_t, ndim=1, mode='c'] NCOL,
  *                     np.ndarray[np.int32_t, ndim=1, mode='c'] COL):
  */
-  __pyx_tuple__29 = PyTuple_Pack(18, __pyx_n_s_PTR, __pyx_n_s_NCOL, __pyx_n_s_COL, __pyx_n_s_ptr, __pyx_n_s_ncol, __pyx_n_s_col, __pyx_n_s_nr, __pyx_n_s_FOLD_ptr, __pyx_n_s_fold_ptr, __pyx_n_s_FOLD_ncol, __pyx_n_s_fold_ncol, __pyx_n_s_FOLD_col, __pyx_n_s_fold_col, __pyx_n_s_r, __pyx_n_s_ind, __pyx_n_s_nz, __pyx_n_s_c, __pyx_n_s_tmp); if (unlikely(!__pyx_tuple__29)) __PYX_ERR(0, 29, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__29);
-  __Pyx_GIVEREF(__pyx_tuple__29);
-  __pyx_codeobj__30 = (PyObject*)__Pyx_PyCode_New(3, 0, 18, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__29, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_sisl__sparse_pyx, __pyx_n_s_fold_csr_matrix, 29, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__30)) __PYX_ERR(0, 29, __pyx_L1_error)
+  __pyx_tuple__34 = PyTuple_Pack(18, __pyx_n_s_PTR, __pyx_n_s_NCOL, __pyx_n_s_COL, __pyx_n_s_ptr, __pyx_n_s_ncol, __pyx_n_s_col, __pyx_n_s_nr, __pyx_n_s_FOLD_ptr, __pyx_n_s_fold_ptr, __pyx_n_s_FOLD_ncol, __pyx_n_s_fold_ncol, __pyx_n_s_FOLD_col, __pyx_n_s_fold_col, __pyx_n_s_r, __pyx_n_s_ind, __pyx_n_s_nz, __pyx_n_s_c, __pyx_n_s_tmp); if (unlikely(!__pyx_tuple__34)) __PYX_ERR(0, 31, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__34);
+  __Pyx_GIVEREF(__pyx_tuple__34);
+  __pyx_codeobj__35 = (PyObject*)__Pyx_PyCode_New(3, 0, 18, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__34, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_sisl__sparse_pyx, __pyx_n_s_fold_csr_matrix, 31, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__35)) __PYX_ERR(0, 31, __pyx_L1_error)
 
-  /* "sisl/_sparse.pyx":84
+  /* "sisl/_sparse.pyx":86
  * @cython.initializedcheck(False)
  * @cython.cdivision(True)
  * def fold_csr_matrix_nc(np.ndarray[np.int32_t, ndim=1, mode='c'] PTR,             # <<<<<<<<<<<<<<
  *                        np.ndarray[np.int32_t, ndim=1, mode='c'] NCOL,
  *                        np.ndarray[np.int32_t, ndim=1, mode='c'] COL):
  */
-  __pyx_tuple__31 = PyTuple_Pack(19, __pyx_n_s_PTR, __pyx_n_s_NCOL, __pyx_n_s_COL, __pyx_n_s_ptr, __pyx_n_s_ncol, __pyx_n_s_col, __pyx_n_s_nr, __pyx_n_s_FOLD_ptr, __pyx_n_s_fold_ptr, __pyx_n_s_FOLD_ncol, __pyx_n_s_fold_ncol, __pyx_n_s_FOLD_col, __pyx_n_s_fold_col, __pyx_n_s_r, __pyx_n_s_rr, __pyx_n_s_ind, __pyx_n_s_nz, __pyx_n_s_c, __pyx_n_s_tmp); if (unlikely(!__pyx_tuple__31)) __PYX_ERR(0, 84, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__31);
-  __Pyx_GIVEREF(__pyx_tuple__31);
-  __pyx_codeobj__32 = (PyObject*)__Pyx_PyCode_New(3, 0, 19, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__31, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_sisl__sparse_pyx, __pyx_n_s_fold_csr_matrix_nc, 84, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__32)) __PYX_ERR(0, 84, __pyx_L1_error)
+  __pyx_tuple__36 = PyTuple_Pack(19, __pyx_n_s_PTR, __pyx_n_s_NCOL, __pyx_n_s_COL, __pyx_n_s_ptr, __pyx_n_s_ncol, __pyx_n_s_col, __pyx_n_s_nr, __pyx_n_s_FOLD_ptr, __pyx_n_s_fold_ptr, __pyx_n_s_FOLD_ncol, __pyx_n_s_fold_ncol, __pyx_n_s_FOLD_col, __pyx_n_s_fold_col, __pyx_n_s_r, __pyx_n_s_rr, __pyx_n_s_ind, __pyx_n_s_nz, __pyx_n_s_c, __pyx_n_s_tmp); if (unlikely(!__pyx_tuple__36)) __PYX_ERR(0, 86, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__36);
+  __Pyx_GIVEREF(__pyx_tuple__36);
+  __pyx_codeobj__37 = (PyObject*)__Pyx_PyCode_New(3, 0, 19, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__36, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_sisl__sparse_pyx, __pyx_n_s_fold_csr_matrix_nc, 86, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__37)) __PYX_ERR(0, 86, __pyx_L1_error)
 
-  /* "sisl/_sparse.pyx":153
+  /* "sisl/_sparse.pyx":155
  * @cython.initializedcheck(False)
  * @cython.cdivision(True)
  * def fold_csr_diagonal_nc(np.ndarray[np.int32_t, ndim=1, mode='c'] PTR,             # <<<<<<<<<<<<<<
  *                          np.ndarray[np.int32_t, ndim=1, mode='c'] NCOL,
  *                          np.ndarray[np.int32_t, ndim=1, mode='c'] COL):
  */
-  __pyx_tuple__33 = PyTuple_Pack(19, __pyx_n_s_PTR, __pyx_n_s_NCOL, __pyx_n_s_COL, __pyx_n_s_ptr, __pyx_n_s_ncol, __pyx_n_s_col, __pyx_n_s_nr, __pyx_n_s_FOLD_ptr, __pyx_n_s_fold_ptr, __pyx_n_s_FOLD_ncol, __pyx_n_s_fold_ncol, __pyx_n_s_FOLD_col, __pyx_n_s_fold_col, __pyx_n_s_r, __pyx_n_s_rr, __pyx_n_s_ind, __pyx_n_s_nz, __pyx_n_s_c, __pyx_n_s_tmp); if (unlikely(!__pyx_tuple__33)) __PYX_ERR(0, 153, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__33);
-  __Pyx_GIVEREF(__pyx_tuple__33);
-  __pyx_codeobj__34 = (PyObject*)__Pyx_PyCode_New(3, 0, 19, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__33, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_sisl__sparse_pyx, __pyx_n_s_fold_csr_diagonal_nc, 153, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__34)) __PYX_ERR(0, 153, __pyx_L1_error)
+  __pyx_tuple__38 = PyTuple_Pack(19, __pyx_n_s_PTR, __pyx_n_s_NCOL, __pyx_n_s_COL, __pyx_n_s_ptr, __pyx_n_s_ncol, __pyx_n_s_col, __pyx_n_s_nr, __pyx_n_s_FOLD_ptr, __pyx_n_s_fold_ptr, __pyx_n_s_FOLD_ncol, __pyx_n_s_fold_ncol, __pyx_n_s_FOLD_col, __pyx_n_s_fold_col, __pyx_n_s_r, __pyx_n_s_rr, __pyx_n_s_ind, __pyx_n_s_nz, __pyx_n_s_c, __pyx_n_s_tmp); if (unlikely(!__pyx_tuple__38)) __PYX_ERR(0, 155, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__38);
+  __Pyx_GIVEREF(__pyx_tuple__38);
+  __pyx_codeobj__39 = (PyObject*)__Pyx_PyCode_New(3, 0, 19, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__38, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_sisl__sparse_pyx, __pyx_n_s_fold_csr_diagonal_nc, 155, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__39)) __PYX_ERR(0, 155, __pyx_L1_error)
+
+  /* "sisl/_sparse.pyx":221
+ * @cython.wraparound(False)
+ * @cython.initializedcheck(False)
+ * def sparse_merge(np.ndarray[np.int32_t, ndim=1, mode='c'] PTR1,             # <<<<<<<<<<<<<<
+ *                  np.ndarray[np.int32_t, ndim=1, mode='c'] NCOL1,
+ *                  np.ndarray[np.int32_t, ndim=1, mode='c'] COL1,
+ */
+  __pyx_tuple__40 = PyTuple_Pack(29, __pyx_n_s_PTR1, __pyx_n_s_NCOL1, __pyx_n_s_COL1, __pyx_n_s_PTR2, __pyx_n_s_NCOL2, __pyx_n_s_COL2, __pyx_n_s_ptr1, __pyx_n_s_ncol1, __pyx_n_s_col1, __pyx_n_s_ptr2, __pyx_n_s_ncol2, __pyx_n_s_col2, __pyx_n_s_nr, __pyx_n_s_PTR, __pyx_n_s_NCOL, __pyx_n_s_ptr, __pyx_n_s_ncol, __pyx_n_s_r, __pyx_n_s_i1, __pyx_n_s_i2, __pyx_n_s_e1, __pyx_n_s_e2, __pyx_n_s_n, __pyx_n_s_COL, __pyx_n_s_IDX1, __pyx_n_s_IDX2, __pyx_n_s_col, __pyx_n_s_idx1, __pyx_n_s_idx2); if (unlikely(!__pyx_tuple__40)) __PYX_ERR(0, 221, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__40);
+  __Pyx_GIVEREF(__pyx_tuple__40);
+  __pyx_codeobj__41 = (PyObject*)__Pyx_PyCode_New(6, 0, 29, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__40, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_sisl__sparse_pyx, __pyx_n_s_sparse_merge, 221, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__41)) __PYX_ERR(0, 221, __pyx_L1_error)
+
+  /* "sisl/_sparse.pyx":339
+ * @cython.initializedcheck(False)
+ * @cython.cdivision(True)
+ * def sparse_transpose(np.ndarray[np.int32_t, ndim=1, mode='c'] PTR,             # <<<<<<<<<<<<<<
+ *                      np.ndarray[np.int32_t, ndim=1, mode='c'] NCOL,
+ *                      np.ndarray[np.int32_t, ndim=1, mode='c'] COL,
+ */
+  __pyx_tuple__42 = PyTuple_Pack(30, __pyx_n_s_PTR, __pyx_n_s_NCOL, __pyx_n_s_COL, __pyx_n_s_ISC, __pyx_n_s_size, __pyx_n_s_ptr, __pyx_n_s_ncol, __pyx_n_s_col, __pyx_n_s_isc, __pyx_n_s_nr, __pyx_n_s_n_s, __pyx_n_s_T_PTR, __pyx_n_s_T_NCOL, __pyx_n_s_OFF, __pyx_n_s_tptr, __pyx_n_s_tncol, __pyx_n_s_off, __pyx_n_s_r, __pyx_n_s_i, __pyx_n_s_t, __pyx_n_s_n, __pyx_n_s_nnz, __pyx_n_s_T_COL, __pyx_n_s_IDX, __pyx_n_s_S_COL, __pyx_n_s_S_IDX, __pyx_n_s_tcol, __pyx_n_s_idx, __pyx_n_s_scol, __pyx_n_s_sidx); if (unlikely(!__pyx_tuple__42)) __PYX_ERR(0, 339, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__42);
+  __Pyx_GIVEREF(__pyx_tuple__42);
+  __pyx_codeobj__43 = (PyObject*)__Pyx_PyCode_New(5, 0, 30, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__42, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_sisl__sparse_pyx, __pyx_n_s_sparse_transpose, 339, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__43)) __PYX_ERR(0, 339, __pyx_L1_error)
+
+  /* "sisl/_sparse.pyx":429
+ * @cython.wraparound(False)
+ * @cython.initializedcheck(False)
+ * def sparse_sub(np.ndarray[np.int32_t, ndim=1, mode='c'] PTR,             # <<<<<<<<<<<<<<
+ *                np.ndarray[np.int32_t, ndim=1, mode='c'] NCOL,
+ *                np.ndarray[np.int32_t, ndim=1, mode='c'] COL,
+ */
+  __pyx_tuple__44 = PyTuple_Pack(23, __pyx_n_s_PTR, __pyx_n_s_NCOL, __pyx_n_s_COL, __pyx_n_s_ROWS, __pyx_n_s_PVT, __pyx_n_s_ptr, __pyx_n_s_ncol, __pyx_n_s_col, __pyx_n_s_rows, __pyx_n_s_pvt, __pyx_n_s_nr, __pyx_n_s_S_PTR, __pyx_n_s_S_NCOL, __pyx_n_s_sptr, __pyx_n_s_sncol, __pyx_n_s_r, __pyx_n_s_i, __pyx_n_s_n, __pyx_n_s_c, __pyx_n_s_S_COL, __pyx_n_s_IDX, __pyx_n_s_scol, __pyx_n_s_idx); if (unlikely(!__pyx_tuple__44)) __PYX_ERR(0, 429, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__44);
+  __Pyx_GIVEREF(__pyx_tuple__44);
+  __pyx_codeobj__45 = (PyObject*)__Pyx_PyCode_New(5, 0, 23, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__44, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_sisl__sparse_pyx, __pyx_n_s_sparse_sub, 429, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__45)) __PYX_ERR(0, 429, __pyx_L1_error)
+
+  /* "sisl/_sparse.pyx":508
+ * @cython.wraparound(False)
+ * @cython.initializedcheck(False)
+ * def sparse_finalize(np.ndarray[np.int32_t, ndim=1, mode='c'] PTR,             # <<<<<<<<<<<<<<
+ *                     np.ndarray[np.int32_t, ndim=1, mode='c'] NCOL,
+ *                     np.ndarray[np.int32_t, ndim=1, mode='c'] COL,
+ */
+  __pyx_tuple__46 = PyTuple_Pack(27, __pyx_n_s_PTR, __pyx_n_s_NCOL, __pyx_n_s_COL, __pyx_n_s_D, __pyx_n_s_sort, __pyx_n_s_ptr, __pyx_n_s_ncol, __pyx_n_s_COL_v, __pyx_n_s_D_v, __pyx_n_s_sz, __pyx_n_s_nr, __pyx_n_s_r, __pyx_n_s_i, __pyx_n_s_j, __pyx_n_s_k, __pyx_n_s_n, __pyx_n_s_p, __pyx_n_s_q, __pyx_n_s_c, __pyx_n_s_max_k, __pyx_n_s_max_c, __pyx_n_s_err, __pyx_n_s_col, __pyx_n_s_data, __pyx_n_s_tmp, __pyx_n_s_pairs, __pyx_n_s_last); if (unlikely(!__pyx_tuple__46)) __PYX_ERR(0, 508, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__46);
+  __Pyx_GIVEREF(__pyx_tuple__46);
+  __pyx_codeobj__47 = (PyObject*)__Pyx_PyCode_New(5, 0, 27, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__46, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_sisl__sparse_pyx, __pyx_n_s_sparse_finalize, 508, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__47)) __PYX_ERR(0, 508, __pyx_L1_error)
+
+  /* "sisl/_sparse.pyx":672
+ * @cython.initializedcheck(False)
+ * @cython.cdivision(True)
+ * def sparse_orb_to_atom(np.ndarray[np.int32_t, ndim=1, mode='c'] PTR,             # <<<<<<<<<<<<<<
+ *                        np.ndarray[np.int32_t, ndim=1, mode='c'] COL,
+ *                        _orb_real[:, ::1] D,
+ */
+  __pyx_tuple__48 = PyTuple_Pack(32, __pyx_n_s_PTR, __pyx_n_s_COL, __pyx_n_s_D, __pyx_n_s_FIRSTO, __pyx_n_s_O2A, __pyx_n_s_n_s, __pyx_n_s_only, __pyx_n_s_ptr, __pyx_n_s_col, __pyx_n_s_firsto, __pyx_n_s_o2a, __pyx_n_s_na, __pyx_n_s_no, __pyx_n_s_nd, __pyx_n_s_nc, __pyx_n_s_A_PTR, __pyx_n_s_STAMP, __pyx_n_s_POS, __pyx_n_s_aptr, __pyx_n_s_stamp, __pyx_n_s_pos, __pyx_n_s_ia, __pyx_n_s_io, __pyx_n_s_i, __pyx_n_s_j, __pyx_n_s_c, __pyx_n_s_n, __pyx_n_s_A_COL, __pyx_n_s_acol, __pyx_n_s_A_D, __pyx_n_s_ad, __pyx_n_s_v); if (unlikely(!__pyx_tuple__48)) __PYX_ERR(0, 672, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__48);
+  __Pyx_GIVEREF(__pyx_tuple__48);
+  __pyx_codeobj__49 = (PyObject*)__Pyx_PyCode_New(7, 0, 32, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__48, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_sisl__sparse_pyx, __pyx_n_s_sparse_orb_to_atom, 672, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__49)) __PYX_ERR(0, 672, __pyx_L1_error)
 
   /* "View.MemoryView":286
  *         return self.name
@@ -21802,9 +30918,9 @@ static CYTHON_SMALL_CODE int __Pyx_InitCachedConstants(void) {
  * cdef strided = Enum("<strided and direct>") # default
  * cdef indirect = Enum("<strided and indirect>")
  */
-  __pyx_tuple__35 = PyTuple_Pack(1, __pyx_kp_s_strided_and_direct_or_indirect); if (unlikely(!__pyx_tuple__35)) __PYX_ERR(2, 286, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__35);
-  __Pyx_GIVEREF(__pyx_tuple__35);
+  __pyx_tuple__50 = PyTuple_Pack(1, __pyx_kp_s_strided_and_direct_or_indirect); if (unlikely(!__pyx_tuple__50)) __PYX_ERR(2, 286, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__50);
+  __Pyx_GIVEREF(__pyx_tuple__50);
 
   /* "View.MemoryView":287
  * 
@@ -21813,9 +30929,9 @@ static CYTHON_SMALL_CODE int __Pyx_InitCachedConstants(void) {
  * cdef indirect = Enum("<strided and indirect>")
  * 
  */
-  __pyx_tuple__36 = PyTuple_Pack(1, __pyx_kp_s_strided_and_direct); if (unlikely(!__pyx_tuple__36)) __PYX_ERR(2, 287, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__36);
-  __Pyx_GIVEREF(__pyx_tuple__36);
+  __pyx_tuple__51 = PyTuple_Pack(1, __pyx_kp_s_strided_and_direct); if (unlikely(!__pyx_tuple__51)) __PYX_ERR(2, 287, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__51);
+  __Pyx_GIVEREF(__pyx_tuple__51);
 
   /* "View.MemoryView":288
  * cdef generic = Enum("<strided and direct or indirect>")
@@ -21824,9 +30940,9 @@ static CYTHON_SMALL_CODE int __Pyx_InitCachedConstants(void) {
  * 
  * 
  */
-  __pyx_tuple__37 = PyTuple_Pack(1, __pyx_kp_s_strided_and_indirect); if (unlikely(!__pyx_tuple__37)) __PYX_ERR(2, 288, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__37);
-  __Pyx_GIVEREF(__pyx_tuple__37);
+  __pyx_tuple__52 = PyTuple_Pack(1, __pyx_kp_s_strided_and_indirect); if (unlikely(!__pyx_tuple__52)) __PYX_ERR(2, 288, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__52);
+  __Pyx_GIVEREF(__pyx_tuple__52);
 
   /* "View.MemoryView":291
  * 
@@ -21835,9 +30951,9 @@ static CYTHON_SMALL_CODE int __Pyx_InitCachedConstants(void) {
  * cdef indirect_contiguous = Enum("<contiguous and indirect>")
  * 
  */
-  __pyx_tuple__38 = PyTuple_Pack(1, __pyx_kp_s_contiguous_and_direct); if (unlikely(!__pyx_tuple__38)) __PYX_ERR(2, 291, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__38);
-  __Pyx_GIVEREF(__pyx_tuple__38);
+  __pyx_tuple__53 = PyTuple_Pack(1, __pyx_kp_s_contiguous_and_direct); if (unlikely(!__pyx_tuple__53)) __PYX_ERR(2, 291, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__53);
+  __Pyx_GIVEREF(__pyx_tuple__53);
 
   /* "View.MemoryView":292
  * 
@@ -21846,19 +30962,19 @@ static CYTHON_SMALL_CODE int __Pyx_InitCachedConstants(void) {
  * 
  * 
  */
-  __pyx_tuple__39 = PyTuple_Pack(1, __pyx_kp_s_contiguous_and_indirect); if (unlikely(!__pyx_tuple__39)) __PYX_ERR(2, 292, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__39);
-  __Pyx_GIVEREF(__pyx_tuple__39);
+  __pyx_tuple__54 = PyTuple_Pack(1, __pyx_kp_s_contiguous_and_indirect); if (unlikely(!__pyx_tuple__54)) __PYX_ERR(2, 292, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__54);
+  __Pyx_GIVEREF(__pyx_tuple__54);
 
   /* "(tree fragment)":1
  * def __pyx_unpickle_Enum(__pyx_type, long __pyx_checksum, __pyx_state):             # <<<<<<<<<<<<<<
  *     cdef object __pyx_PickleError
  *     cdef object __pyx_result
  */
-  __pyx_tuple__40 = PyTuple_Pack(5, __pyx_n_s_pyx_type, __pyx_n_s_pyx_checksum, __pyx_n_s_pyx_state, __pyx_n_s_pyx_PickleError, __pyx_n_s_pyx_result); if (unlikely(!__pyx_tuple__40)) __PYX_ERR(2, 1, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__40);
-  __Pyx_GIVEREF(__pyx_tuple__40);
-  __pyx_codeobj__41 = (PyObject*)__Pyx_PyCode_New(3, 0, 5, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__40, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_stringsource, __pyx_n_s_pyx_unpickle_Enum, 1, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__41)) __PYX_ERR(2, 1, __pyx_L1_error)
+  __pyx_tuple__55 = PyTuple_Pack(5, __pyx_n_s_pyx_type, __pyx_n_s_pyx_checksum, __pyx_n_s_pyx_state, __pyx_n_s_pyx_PickleError, __pyx_n_s_pyx_result); if (unlikely(!__pyx_tuple__55)) __PYX_ERR(2, 1, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__55);
+  __Pyx_GIVEREF(__pyx_tuple__55);
+  __pyx_codeobj__56 = (PyObject*)__Pyx_PyCode_New(3, 0, 5, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__55, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_stringsource, __pyx_n_s_pyx_unpickle_Enum, 1, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__56)) __PYX_ERR(2, 1, __pyx_L1_error)
   __Pyx_RefNannyFinishContext();
   return 0;
   __pyx_L1_error:;
@@ -21870,6 +30986,7 @@ static CYTHON_SMALL_CODE int __Pyx_InitGlobals(void) {
   if (__Pyx_InitStrings(__pyx_string_tab) < 0) __PYX_ERR(0, 1, __pyx_L1_error);
   __pyx_int_0 = PyInt_FromLong(0); if (unlikely(!__pyx_int_0)) __PYX_ERR(0, 1, __pyx_L1_error)
   __pyx_int_1 = PyInt_FromLong(1); if (unlikely(!__pyx_int_1)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_7 = PyInt_FromLong(7); if (unlikely(!__pyx_int_7)) __PYX_ERR(0, 1, __pyx_L1_error)
   __pyx_int_184977713 = PyInt_FromLong(184977713L); if (unlikely(!__pyx_int_184977713)) __PYX_ERR(0, 1, __pyx_L1_error)
   __pyx_int_neg_1 = PyInt_FromLong(-1); if (unlikely(!__pyx_int_neg_1)) __PYX_ERR(0, 1, __pyx_L1_error)
   return 0;
@@ -22122,7 +31239,9 @@ static CYTHON_SMALL_CODE int __pyx_pymod_exec__sparse(PyObject *__pyx_pyinit_mod
 #endif
 {
   PyObject *__pyx_t_1 = NULL;
-  static PyThread_type_lock __pyx_t_2[8];
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  static PyThread_type_lock __pyx_t_4[8];
   __Pyx_RefNannyDeclarations
   #if CYTHON_PEP489_MULTI_PHASE_INIT
   if (__pyx_m) {
@@ -22228,63 +31347,138 @@ if (!__Pyx_RefNanny) {
   if (__Pyx_patch_abc() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
   #endif
 
-  /* "sisl/_sparse.pyx":6
- * from libc.math cimport fabs
+  /* "sisl/_sparse.pyx":8
+ * from libc.stdlib cimport malloc, free, qsort
  * 
  * import numpy as np             # <<<<<<<<<<<<<<
  * # This enables Cython enhanced compatibilities
  * cimport numpy as np
  */
-  __pyx_t_1 = __Pyx_Import(__pyx_n_s_numpy, 0, -1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 6, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_Import(__pyx_n_s_numpy, 0, -1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 8, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_np, __pyx_t_1) < 0) __PYX_ERR(0, 6, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_np, __pyx_t_1) < 0) __PYX_ERR(0, 8, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "sisl/_sparse.pyx":29
+  /* "sisl/_sparse.pyx":31
  * @cython.initializedcheck(False)
  * @cython.cdivision(True)
  * def fold_csr_matrix(np.ndarray[np.int32_t, ndim=1, mode='c'] PTR,             # <<<<<<<<<<<<<<
  *                     np.ndarray[np.int32_t, ndim=1, mode='c'] NCOL,
  *                     np.ndarray[np.int32_t, ndim=1, mode='c'] COL):
  */
-  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_4sisl_7_sparse_1fold_csr_matrix, NULL, __pyx_n_s_sisl__sparse); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 29, __pyx_L1_error)
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_4sisl_7_sparse_1fold_csr_matrix, NULL, __pyx_n_s_sisl__sparse); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 31, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_fold_csr_matrix, __pyx_t_1) < 0) __PYX_ERR(0, 29, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_fold_csr_matrix, __pyx_t_1) < 0) __PYX_ERR(0, 31, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "sisl/_sparse.pyx":84
+  /* "sisl/_sparse.pyx":86
  * @cython.initializedcheck(False)
  * @cython.cdivision(True)
  * def fold_csr_matrix_nc(np.ndarray[np.int32_t, ndim=1, mode='c'] PTR,             # <<<<<<<<<<<<<<
  *                        np.ndarray[np.int32_t, ndim=1, mode='c'] NCOL,
  *                        np.ndarray[np.int32_t, ndim=1, mode='c'] COL):
  */
-  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_4sisl_7_sparse_3fold_csr_matrix_nc, NULL, __pyx_n_s_sisl__sparse); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 84, __pyx_L1_error)
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_4sisl_7_sparse_3fold_csr_matrix_nc, NULL, __pyx_n_s_sisl__sparse); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 86, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_fold_csr_matrix_nc, __pyx_t_1) < 0) __PYX_ERR(0, 84, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_fold_csr_matrix_nc, __pyx_t_1) < 0) __PYX_ERR(0, 86, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "sisl/_sparse.pyx":153
+  /* "sisl/_sparse.pyx":155
  * @cython.initializedcheck(False)
  * @cython.cdivision(True)
  * def fold_csr_diagonal_nc(np.ndarray[np.int32_t, ndim=1, mode='c'] PTR,             # <<<<<<<<<<<<<<
  *                          np.ndarray[np.int32_t, ndim=1, mode='c'] NCOL,
  *                          np.ndarray[np.int32_t, ndim=1, mode='c'] COL):
  */
-  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_4sisl_7_sparse_5fold_csr_diagonal_nc, NULL, __pyx_n_s_sisl__sparse); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 153, __pyx_L1_error)
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_4sisl_7_sparse_5fold_csr_diagonal_nc, NULL, __pyx_n_s_sisl__sparse); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 155, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_fold_csr_diagonal_nc, __pyx_t_1) < 0) __PYX_ERR(0, 155, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "sisl/_sparse.pyx":221
+ * @cython.wraparound(False)
+ * @cython.initializedcheck(False)
+ * def sparse_merge(np.ndarray[np.int32_t, ndim=1, mode='c'] PTR1,             # <<<<<<<<<<<<<<
+ *                  np.ndarray[np.int32_t, ndim=1, mode='c'] NCOL1,
+ *                  np.ndarray[np.int32_t, ndim=1, mode='c'] COL1,
+ */
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_4sisl_7_sparse_7sparse_merge, NULL, __pyx_n_s_sisl__sparse); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 221, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_sparse_merge, __pyx_t_1) < 0) __PYX_ERR(0, 221, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "sisl/_sparse.pyx":339
+ * @cython.initializedcheck(False)
+ * @cython.cdivision(True)
+ * def sparse_transpose(np.ndarray[np.int32_t, ndim=1, mode='c'] PTR,             # <<<<<<<<<<<<<<
+ *                      np.ndarray[np.int32_t, ndim=1, mode='c'] NCOL,
+ *                      np.ndarray[np.int32_t, ndim=1, mode='c'] COL,
+ */
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_4sisl_7_sparse_9sparse_transpose, NULL, __pyx_n_s_sisl__sparse); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 339, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_sparse_transpose, __pyx_t_1) < 0) __PYX_ERR(0, 339, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "sisl/_sparse.pyx":429
+ * @cython.wraparound(False)
+ * @cython.initializedcheck(False)
+ * def sparse_sub(np.ndarray[np.int32_t, ndim=1, mode='c'] PTR,             # <<<<<<<<<<<<<<
+ *                np.ndarray[np.int32_t, ndim=1, mode='c'] NCOL,
+ *                np.ndarray[np.int32_t, ndim=1, mode='c'] COL,
+ */
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_4sisl_7_sparse_11sparse_sub, NULL, __pyx_n_s_sisl__sparse); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 429, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_sparse_sub, __pyx_t_1) < 0) __PYX_ERR(0, 429, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "sisl/_sparse.pyx":508
+ * @cython.wraparound(False)
+ * @cython.initializedcheck(False)
+ * def sparse_finalize(np.ndarray[np.int32_t, ndim=1, mode='c'] PTR,             # <<<<<<<<<<<<<<
+ *                     np.ndarray[np.int32_t, ndim=1, mode='c'] NCOL,
+ *                     np.ndarray[np.int32_t, ndim=1, mode='c'] COL,
+ */
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_4sisl_7_sparse_13sparse_finalize, NULL, __pyx_n_s_sisl__sparse); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 508, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_fold_csr_diagonal_nc, __pyx_t_1) < 0) __PYX_ERR(0, 153, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_sparse_finalize, __pyx_t_1) < 0) __PYX_ERR(0, 508, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
+  /* "sisl/_sparse.pyx":672
+ * @cython.initializedcheck(False)
+ * @cython.cdivision(True)
+ * def sparse_orb_to_atom(np.ndarray[np.int32_t, ndim=1, mode='c'] PTR,             # <<<<<<<<<<<<<<
+ *                        np.ndarray[np.int32_t, ndim=1, mode='c'] COL,
+ *                        _orb_real[:, ::1] D,
+ */
+  __pyx_t_1 = __Pyx_PyDict_NewPresized(2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 672, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = __pyx_FusedFunction_NewEx(&__pyx_fuse_0__pyx_mdef_4sisl_7_sparse_17sparse_orb_to_atom, 0, __pyx_n_s_sparse_orb_to_atom, NULL, __pyx_n_s_sisl__sparse, __pyx_d, ((PyObject *)__pyx_codeobj__49)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 672, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_CyFunction_SetDefaultsTuple(__pyx_t_2, __pyx_empty_tuple);
+  if (PyDict_SetItem(__pyx_t_1, __pyx_n_s_float, __pyx_t_2) < 0) __PYX_ERR(0, 672, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_2 = __pyx_FusedFunction_NewEx(&__pyx_fuse_1__pyx_mdef_4sisl_7_sparse_19sparse_orb_to_atom, 0, __pyx_n_s_sparse_orb_to_atom, NULL, __pyx_n_s_sisl__sparse, __pyx_d, ((PyObject *)__pyx_codeobj__49)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 672, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_CyFunction_SetDefaultsTuple(__pyx_t_2, __pyx_empty_tuple);
+  if (PyDict_SetItem(__pyx_t_1, __pyx_n_s_double, __pyx_t_2) < 0) __PYX_ERR(0, 672, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_2 = __pyx_FusedFunction_NewEx(&__pyx_mdef_4sisl_7_sparse_15sparse_orb_to_atom, 0, __pyx_n_s_sparse_orb_to_atom, NULL, __pyx_n_s_sisl__sparse, __pyx_d, ((PyObject *)__pyx_codeobj__49)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 672, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_CyFunction_SetDefaultsTuple(__pyx_t_2, __pyx_empty_tuple);
+  ((__pyx_FusedFunctionObject *) __pyx_t_2)->__signatures__ = __pyx_t_1;
+  __Pyx_GIVEREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_sparse_orb_to_atom, __pyx_t_2) < 0) __PYX_ERR(0, 672, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
   /* "sisl/_sparse.pyx":1
  * #!python             # <<<<<<<<<<<<<<
  * #cython: language_level=2
  * cimport cython
  */
-  __pyx_t_1 = __Pyx_PyDict_NewPresized(0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_test, __pyx_t_1) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_3 = __Pyx_PyDict_NewPresized(0); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_test, __pyx_t_3) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
 
   /* "View.MemoryView":209
  *         info.obj = self
@@ -22293,10 +31487,10 @@ if (!__Pyx_RefNanny) {
  * 
  *     def __dealloc__(array self):
  */
-  __pyx_t_1 = __pyx_capsule_create(((void *)(&__pyx_array_getbuffer)), ((char *)"getbuffer(obj, view, flags)")); if (unlikely(!__pyx_t_1)) __PYX_ERR(2, 209, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem((PyObject *)__pyx_array_type->tp_dict, __pyx_n_s_pyx_getbuffer, __pyx_t_1) < 0) __PYX_ERR(2, 209, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_3 = __pyx_capsule_create(((void *)(&__pyx_array_getbuffer)), ((char *)"getbuffer(obj, view, flags)")); if (unlikely(!__pyx_t_3)) __PYX_ERR(2, 209, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  if (PyDict_SetItem((PyObject *)__pyx_array_type->tp_dict, __pyx_n_s_pyx_getbuffer, __pyx_t_3) < 0) __PYX_ERR(2, 209, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
   PyType_Modified(__pyx_array_type);
 
   /* "View.MemoryView":286
@@ -22306,12 +31500,12 @@ if (!__Pyx_RefNanny) {
  * cdef strided = Enum("<strided and direct>") # default
  * cdef indirect = Enum("<strided and indirect>")
  */
-  __pyx_t_1 = __Pyx_PyObject_Call(((PyObject *)__pyx_MemviewEnum_type), __pyx_tuple__35, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(2, 286, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_3 = __Pyx_PyObject_Call(((PyObject *)__pyx_MemviewEnum_type), __pyx_tuple__50, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(2, 286, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
   __Pyx_XGOTREF(generic);
-  __Pyx_DECREF_SET(generic, __pyx_t_1);
-  __Pyx_GIVEREF(__pyx_t_1);
-  __pyx_t_1 = 0;
+  __Pyx_DECREF_SET(generic, __pyx_t_3);
+  __Pyx_GIVEREF(__pyx_t_3);
+  __pyx_t_3 = 0;
 
   /* "View.MemoryView":287
  * 
@@ -22320,12 +31514,12 @@ if (!__Pyx_RefNanny) {
  * cdef indirect = Enum("<strided and indirect>")
  * 
  */
-  __pyx_t_1 = __Pyx_PyObject_Call(((PyObject *)__pyx_MemviewEnum_type), __pyx_tuple__36, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(2, 287, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_3 = __Pyx_PyObject_Call(((PyObject *)__pyx_MemviewEnum_type), __pyx_tuple__51, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(2, 287, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
   __Pyx_XGOTREF(strided);
-  __Pyx_DECREF_SET(strided, __pyx_t_1);
-  __Pyx_GIVEREF(__pyx_t_1);
-  __pyx_t_1 = 0;
+  __Pyx_DECREF_SET(strided, __pyx_t_3);
+  __Pyx_GIVEREF(__pyx_t_3);
+  __pyx_t_3 = 0;
 
   /* "View.MemoryView":288
  * cdef generic = Enum("<strided and direct or indirect>")
@@ -22334,12 +31528,12 @@ if (!__Pyx_RefNanny) {
  * 
  * 
  */
-  __pyx_t_1 = __Pyx_PyObject_Call(((PyObject *)__pyx_MemviewEnum_type), __pyx_tuple__37, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(2, 288, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_3 = __Pyx_PyObject_Call(((PyObject *)__pyx_MemviewEnum_type), __pyx_tuple__52, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(2, 288, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
   __Pyx_XGOTREF(indirect);
-  __Pyx_DECREF_SET(indirect, __pyx_t_1);
-  __Pyx_GIVEREF(__pyx_t_1);
-  __pyx_t_1 = 0;
+  __Pyx_DECREF_SET(indirect, __pyx_t_3);
+  __Pyx_GIVEREF(__pyx_t_3);
+  __pyx_t_3 = 0;
 
   /* "View.MemoryView":291
  * 
@@ -22348,12 +31542,12 @@ if (!__Pyx_RefNanny) {
  * cdef indirect_contiguous = Enum("<contiguous and indirect>")
  * 
  */
-  __pyx_t_1 = __Pyx_PyObject_Call(((PyObject *)__pyx_MemviewEnum_type), __pyx_tuple__38, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(2, 291, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_3 = __Pyx_PyObject_Call(((PyObject *)__pyx_MemviewEnum_type), __pyx_tuple__53, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(2, 291, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
   __Pyx_XGOTREF(contiguous);
-  __Pyx_DECREF_SET(contiguous, __pyx_t_1);
-  __Pyx_GIVEREF(__pyx_t_1);
-  __pyx_t_1 = 0;
+  __Pyx_DECREF_SET(contiguous, __pyx_t_3);
+  __Pyx_GIVEREF(__pyx_t_3);
+  __pyx_t_3 = 0;
 
   /* "View.MemoryView":292
  * 
@@ -22362,12 +31556,12 @@ if (!__Pyx_RefNanny) {
  * 
  * 
  */
-  __pyx_t_1 = __Pyx_PyObject_Call(((PyObject *)__pyx_MemviewEnum_type), __pyx_tuple__39, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(2, 292, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_3 = __Pyx_PyObject_Call(((PyObject *)__pyx_MemviewEnum_type), __pyx_tuple__54, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(2, 292, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
   __Pyx_XGOTREF(indirect_contiguous);
-  __Pyx_DECREF_SET(indirect_contiguous, __pyx_t_1);
-  __Pyx_GIVEREF(__pyx_t_1);
-  __pyx_t_1 = 0;
+  __Pyx_DECREF_SET(indirect_contiguous, __pyx_t_3);
+  __Pyx_GIVEREF(__pyx_t_3);
+  __pyx_t_3 = 0;
 
   /* "View.MemoryView":316
  * 
@@ -22385,15 +31579,15 @@ if (!__Pyx_RefNanny) {
  *     PyThread_allocate_lock(),
  *     PyThread_allocate_lock(),
  */
-  __pyx_t_2[0] = PyThread_allocate_lock();
-  __pyx_t_2[1] = PyThread_allocate_lock();
-  __pyx_t_2[2] = PyThread_allocate_lock();
-  __pyx_t_2[3] = PyThread_allocate_lock();
-  __pyx_t_2[4] = PyThread_allocate_lock();
-  __pyx_t_2[5] = PyThread_allocate_lock();
-  __pyx_t_2[6] = PyThread_allocate_lock();
-  __pyx_t_2[7] = PyThread_allocate_lock();
-  memcpy(&(__pyx_memoryview_thread_locks[0]), __pyx_t_2, sizeof(__pyx_memoryview_thread_locks[0]) * (8));
+  __pyx_t_4[0] = PyThread_allocate_lock();
+  __pyx_t_4[1] = PyThread_allocate_lock();
+  __pyx_t_4[2] = PyThread_allocate_lock();
+  __pyx_t_4[3] = PyThread_allocate_lock();
+  __pyx_t_4[4] = PyThread_allocate_lock();
+  __pyx_t_4[5] = PyThread_allocate_lock();
+  __pyx_t_4[6] = PyThread_allocate_lock();
+  __pyx_t_4[7] = PyThread_allocate_lock();
+  memcpy(&(__pyx_memoryview_thread_locks[0]), __pyx_t_4, sizeof(__pyx_memoryview_thread_locks[0]) * (8));
 
   /* "View.MemoryView":545
  *         info.obj = self
@@ -22402,10 +31596,10 @@ if (!__Pyx_RefNanny) {
  * 
  * 
  */
-  __pyx_t_1 = __pyx_capsule_create(((void *)(&__pyx_memoryview_getbuffer)), ((char *)"getbuffer(obj, view, flags)")); if (unlikely(!__pyx_t_1)) __PYX_ERR(2, 545, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem((PyObject *)__pyx_memoryview_type->tp_dict, __pyx_n_s_pyx_getbuffer, __pyx_t_1) < 0) __PYX_ERR(2, 545, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_3 = __pyx_capsule_create(((void *)(&__pyx_memoryview_getbuffer)), ((char *)"getbuffer(obj, view, flags)")); if (unlikely(!__pyx_t_3)) __PYX_ERR(2, 545, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  if (PyDict_SetItem((PyObject *)__pyx_memoryview_type->tp_dict, __pyx_n_s_pyx_getbuffer, __pyx_t_3) < 0) __PYX_ERR(2, 545, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
   PyType_Modified(__pyx_memoryview_type);
 
   /* "View.MemoryView":991
@@ -22415,10 +31609,10 @@ if (!__Pyx_RefNanny) {
  * 
  * 
  */
-  __pyx_t_1 = __pyx_capsule_create(((void *)(&__pyx_memoryview_getbuffer)), ((char *)"getbuffer(obj, view, flags)")); if (unlikely(!__pyx_t_1)) __PYX_ERR(2, 991, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem((PyObject *)__pyx_memoryviewslice_type->tp_dict, __pyx_n_s_pyx_getbuffer, __pyx_t_1) < 0) __PYX_ERR(2, 991, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_3 = __pyx_capsule_create(((void *)(&__pyx_memoryview_getbuffer)), ((char *)"getbuffer(obj, view, flags)")); if (unlikely(!__pyx_t_3)) __PYX_ERR(2, 991, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  if (PyDict_SetItem((PyObject *)__pyx_memoryviewslice_type->tp_dict, __pyx_n_s_pyx_getbuffer, __pyx_t_3) < 0) __PYX_ERR(2, 991, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
   PyType_Modified(__pyx_memoryviewslice_type);
 
   /* "(tree fragment)":1
@@ -22426,10 +31620,10 @@ if (!__Pyx_RefNanny) {
  *     cdef object __pyx_PickleError
  *     cdef object __pyx_result
  */
-  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_15View_dot_MemoryView_1__pyx_unpickle_Enum, NULL, __pyx_n_s_View_MemoryView); if (unlikely(!__pyx_t_1)) __PYX_ERR(2, 1, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_pyx_unpickle_Enum, __pyx_t_1) < 0) __PYX_ERR(2, 1, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_3 = PyCFunction_NewEx(&__pyx_mdef_15View_dot_MemoryView_1__pyx_unpickle_Enum, NULL, __pyx_n_s_View_MemoryView); if (unlikely(!__pyx_t_3)) __PYX_ERR(2, 1, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_pyx_unpickle_Enum, __pyx_t_3) < 0) __PYX_ERR(2, 1, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
 
   /* "(tree fragment)":11
  *         __pyx_unpickle_Enum__set_state(<Enum> __pyx_result, __pyx_state)
@@ -22444,6 +31638,8 @@ if (!__Pyx_RefNanny) {
   goto __pyx_L0;
   __pyx_L1_error:;
   __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
   if (__pyx_m) {
     if (__pyx_d) {
       __Pyx_AddTraceback("init sisl._sparse", __pyx_clineno, __pyx_lineno, __pyx_filename);
@@ -24014,10 +33210,260 @@ static PyObject *__Pyx_PyDict_GetItem(PyObject *d, PyObject* key) {
 }
 #endif
 
-/* RaiseTooManyValuesToUnpack */
-  static CYTHON_INLINE void __Pyx_RaiseTooManyValuesError(Py_ssize_t expected) {
-    PyErr_Format(PyExc_ValueError,
-                 "too many values to unpack (expected %" CYTHON_FORMAT_SSIZE_T "d)", expected);
+/* UnicodeAsUCS4 */
+  static CYTHON_INLINE Py_UCS4 __Pyx_PyUnicode_AsPy_UCS4(PyObject* x) {
+   Py_ssize_t length;
+   #if CYTHON_PEP393_ENABLED
+   length = PyUnicode_GET_LENGTH(x);
+   if (likely(length == 1)) {
+       return PyUnicode_READ_CHAR(x, 0);
+   }
+   #else
+   length = PyUnicode_GET_SIZE(x);
+   if (likely(length == 1)) {
+       return PyUnicode_AS_UNICODE(x)[0];
+   }
+   #if Py_UNICODE_SIZE == 2
+   else if (PyUnicode_GET_SIZE(x) == 2) {
+       Py_UCS4 high_val = PyUnicode_AS_UNICODE(x)[0];
+       if (high_val >= 0xD800 && high_val <= 0xDBFF) {
+           Py_UCS4 low_val = PyUnicode_AS_UNICODE(x)[1];
+           if (low_val >= 0xDC00 && low_val <= 0xDFFF) {
+               return 0x10000 + (((high_val & ((1<<10)-1)) << 10) | (low_val & ((1<<10)-1)));
+           }
+       }
+   }
+   #endif
+   #endif
+   PyErr_Format(PyExc_ValueError,
+                "only single character unicode strings can be converted to Py_UCS4, "
+                "got length %" CYTHON_FORMAT_SSIZE_T "d", length);
+   return (Py_UCS4)-1;
+}
+
+/* object_ord */
+  static long __Pyx__PyObject_Ord(PyObject* c) {
+    Py_ssize_t size;
+    if (PyBytes_Check(c)) {
+        size = PyBytes_GET_SIZE(c);
+        if (likely(size == 1)) {
+            return (unsigned char) PyBytes_AS_STRING(c)[0];
+        }
+#if PY_MAJOR_VERSION < 3
+    } else if (PyUnicode_Check(c)) {
+        return (long)__Pyx_PyUnicode_AsPy_UCS4(c);
+#endif
+#if (!CYTHON_COMPILING_IN_PYPY) || (defined(PyByteArray_AS_STRING) && defined(PyByteArray_GET_SIZE))
+    } else if (PyByteArray_Check(c)) {
+        size = PyByteArray_GET_SIZE(c);
+        if (likely(size == 1)) {
+            return (unsigned char) PyByteArray_AS_STRING(c)[0];
+        }
+#endif
+    } else {
+        PyErr_Format(PyExc_TypeError,
+            "ord() expected string of length 1, but %.200s found", c->ob_type->tp_name);
+        return (long)(Py_UCS4)-1;
+    }
+    PyErr_Format(PyExc_TypeError,
+        "ord() expected a character, but string of length %zd found", size);
+    return (long)(Py_UCS4)-1;
+}
+
+/* SetItemInt */
+  static int __Pyx_SetItemInt_Generic(PyObject *o, PyObject *j, PyObject *v) {
+    int r;
+    if (!j) return -1;
+    r = PyObject_SetItem(o, j, v);
+    Py_DECREF(j);
+    return r;
+}
+static CYTHON_INLINE int __Pyx_SetItemInt_Fast(PyObject *o, Py_ssize_t i, PyObject *v, int is_list,
+                                               CYTHON_NCP_UNUSED int wraparound, CYTHON_NCP_UNUSED int boundscheck) {
+#if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS && CYTHON_USE_TYPE_SLOTS
+    if (is_list || PyList_CheckExact(o)) {
+        Py_ssize_t n = (!wraparound) ? i : ((likely(i >= 0)) ? i : i + PyList_GET_SIZE(o));
+        if ((!boundscheck) || likely(__Pyx_is_valid_index(n, PyList_GET_SIZE(o)))) {
+            PyObject* old = PyList_GET_ITEM(o, n);
+            Py_INCREF(v);
+            PyList_SET_ITEM(o, n, v);
+            Py_DECREF(old);
+            return 1;
+        }
+    } else {
+        PySequenceMethods *m = Py_TYPE(o)->tp_as_sequence;
+        if (likely(m && m->sq_ass_item)) {
+            if (wraparound && unlikely(i < 0) && likely(m->sq_length)) {
+                Py_ssize_t l = m->sq_length(o);
+                if (likely(l >= 0)) {
+                    i += l;
+                } else {
+                    if (!PyErr_ExceptionMatches(PyExc_OverflowError))
+                        return -1;
+                    PyErr_Clear();
+                }
+            }
+            return m->sq_ass_item(o, i, v);
+        }
+    }
+#else
+#if CYTHON_COMPILING_IN_PYPY
+    if (is_list || (PySequence_Check(o) && !PyDict_Check(o)))
+#else
+    if (is_list || PySequence_Check(o))
+#endif
+    {
+        return PySequence_SetItem(o, i, v);
+    }
+#endif
+    return __Pyx_SetItemInt_Generic(o, PyInt_FromSsize_t(i), v);
+}
+
+/* IterFinish */
+  static CYTHON_INLINE int __Pyx_IterFinish(void) {
+#if CYTHON_FAST_THREAD_STATE
+    PyThreadState *tstate = __Pyx_PyThreadState_Current;
+    PyObject* exc_type = tstate->curexc_type;
+    if (unlikely(exc_type)) {
+        if (likely(__Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) {
+            PyObject *exc_value, *exc_tb;
+            exc_value = tstate->curexc_value;
+            exc_tb = tstate->curexc_traceback;
+            tstate->curexc_type = 0;
+            tstate->curexc_value = 0;
+            tstate->curexc_traceback = 0;
+            Py_DECREF(exc_type);
+            Py_XDECREF(exc_value);
+            Py_XDECREF(exc_tb);
+            return 0;
+        } else {
+            return -1;
+        }
+    }
+    return 0;
+#else
+    if (unlikely(PyErr_Occurred())) {
+        if (likely(PyErr_ExceptionMatches(PyExc_StopIteration))) {
+            PyErr_Clear();
+            return 0;
+        } else {
+            return -1;
+        }
+    }
+    return 0;
+#endif
+}
+
+/* PyObjectGetMethod */
+  static int __Pyx_PyObject_GetMethod(PyObject *obj, PyObject *name, PyObject **method) {
+    PyObject *attr;
+#if CYTHON_UNPACK_METHODS && CYTHON_COMPILING_IN_CPYTHON && CYTHON_USE_PYTYPE_LOOKUP
+    PyTypeObject *tp = Py_TYPE(obj);
+    PyObject *descr;
+    descrgetfunc f = NULL;
+    PyObject **dictptr, *dict;
+    int meth_found = 0;
+    assert (*method == NULL);
+    if (unlikely(tp->tp_getattro != PyObject_GenericGetAttr)) {
+        attr = __Pyx_PyObject_GetAttrStr(obj, name);
+        goto try_unpack;
+    }
+    if (unlikely(tp->tp_dict == NULL) && unlikely(PyType_Ready(tp) < 0)) {
+        return 0;
+    }
+    descr = _PyType_Lookup(tp, name);
+    if (likely(descr != NULL)) {
+        Py_INCREF(descr);
+#if PY_MAJOR_VERSION >= 3
+        #ifdef __Pyx_CyFunction_USED
+        if (likely(PyFunction_Check(descr) || (Py_TYPE(descr) == &PyMethodDescr_Type) || __Pyx_CyFunction_Check(descr)))
+        #else
+        if (likely(PyFunction_Check(descr) || (Py_TYPE(descr) == &PyMethodDescr_Type)))
+        #endif
+#else
+        #ifdef __Pyx_CyFunction_USED
+        if (likely(PyFunction_Check(descr) || __Pyx_CyFunction_Check(descr)))
+        #else
+        if (likely(PyFunction_Check(descr)))
+        #endif
+#endif
+        {
+            meth_found = 1;
+        } else {
+            f = Py_TYPE(descr)->tp_descr_get;
+            if (f != NULL && PyDescr_IsData(descr)) {
+                attr = f(descr, obj, (PyObject *)Py_TYPE(obj));
+                Py_DECREF(descr);
+                goto try_unpack;
+            }
+        }
+    }
+    dictptr = _PyObject_GetDictPtr(obj);
+    if (dictptr != NULL && (dict = *dictptr) != NULL) {
+        Py_INCREF(dict);
+        attr = __Pyx_PyDict_GetItemStr(dict, name);
+        if (attr != NULL) {
+            Py_INCREF(attr);
+            Py_DECREF(dict);
+            Py_XDECREF(descr);
+            goto try_unpack;
+        }
+        Py_DECREF(dict);
+    }
+    if (meth_found) {
+        *method = descr;
+        return 1;
+    }
+    if (f != NULL) {
+        attr = f(descr, obj, (PyObject *)Py_TYPE(obj));
+        Py_DECREF(descr);
+        goto try_unpack;
+    }
+    if (descr != NULL) {
+        *method = descr;
+        return 0;
+    }
+    PyErr_Format(PyExc_AttributeError,
+#if PY_MAJOR_VERSION >= 3
+                 "'%.50s' object has no attribute '%U'",
+                 tp->tp_name, name);
+#else
+                 "'%.50s' object has no attribute '%.400s'",
+                 tp->tp_name, PyString_AS_STRING(name));
+#endif
+    return 0;
+#else
+    attr = __Pyx_PyObject_GetAttrStr(obj, name);
+    goto try_unpack;
+#endif
+try_unpack:
+#if CYTHON_UNPACK_METHODS
+    if (likely(attr) && PyMethod_Check(attr) && likely(PyMethod_GET_SELF(attr) == obj)) {
+        PyObject *function = PyMethod_GET_FUNCTION(attr);
+        Py_INCREF(function);
+        Py_DECREF(attr);
+        *method = function;
+        return 1;
+    }
+#endif
+    *method = attr;
+    return 0;
+}
+
+/* PyObjectCallMethod0 */
+  static PyObject* __Pyx_PyObject_CallMethod0(PyObject* obj, PyObject* method_name) {
+    PyObject *method = NULL, *result = NULL;
+    int is_method = __Pyx_PyObject_GetMethod(obj, method_name, &method);
+    if (likely(is_method)) {
+        result = __Pyx_PyObject_CallOneArg(method, obj);
+        Py_DECREF(method);
+        return result;
+    }
+    if (unlikely(!method)) goto bad;
+    result = __Pyx_PyObject_CallNoArg(method);
+    Py_DECREF(method);
+bad:
+    return result;
 }
 
 /* RaiseNeedMoreValuesToUnpack */
@@ -24026,10 +33472,204 @@ static PyObject *__Pyx_PyDict_GetItem(PyObject *d, PyObject* key) {
                  "need more than %" CYTHON_FORMAT_SSIZE_T "d value%.1s to unpack",
                  index, (index == 1) ? "" : "s");
 }
-
-/* RaiseNoneIterError */
-  static CYTHON_INLINE void __Pyx_RaiseNoneNotIterableError(void) {
-    PyErr_SetString(PyExc_TypeError, "'NoneType' object is not iterable");
+
+/* RaiseTooManyValuesToUnpack */
+  static CYTHON_INLINE void __Pyx_RaiseTooManyValuesError(Py_ssize_t expected) {
+    PyErr_Format(PyExc_ValueError,
+                 "too many values to unpack (expected %" CYTHON_FORMAT_SSIZE_T "d)", expected);
+}
+
+/* UnpackItemEndCheck */
+  static int __Pyx_IternextUnpackEndCheck(PyObject *retval, Py_ssize_t expected) {
+    if (unlikely(retval)) {
+        Py_DECREF(retval);
+        __Pyx_RaiseTooManyValuesError(expected);
+        return -1;
+    } else {
+        return __Pyx_IterFinish();
+    }
+    return 0;
+}
+
+/* RaiseNoneIterError */
+  static CYTHON_INLINE void __Pyx_RaiseNoneNotIterableError(void) {
+    PyErr_SetString(PyExc_TypeError, "'NoneType' object is not iterable");
+}
+
+/* UnpackTupleError */
+  static void __Pyx_UnpackTupleError(PyObject *t, Py_ssize_t index) {
+    if (t == Py_None) {
+      __Pyx_RaiseNoneNotIterableError();
+    } else if (PyTuple_GET_SIZE(t) < index) {
+      __Pyx_RaiseNeedMoreValuesError(PyTuple_GET_SIZE(t));
+    } else {
+      __Pyx_RaiseTooManyValuesError(index);
+    }
+}
+
+/* UnpackTuple2 */
+  static CYTHON_INLINE int __Pyx_unpack_tuple2_exact(
+        PyObject* tuple, PyObject** pvalue1, PyObject** pvalue2, int decref_tuple) {
+    PyObject *value1 = NULL, *value2 = NULL;
+#if CYTHON_COMPILING_IN_PYPY
+    value1 = PySequence_ITEM(tuple, 0);  if (unlikely(!value1)) goto bad;
+    value2 = PySequence_ITEM(tuple, 1);  if (unlikely(!value2)) goto bad;
+#else
+    value1 = PyTuple_GET_ITEM(tuple, 0);  Py_INCREF(value1);
+    value2 = PyTuple_GET_ITEM(tuple, 1);  Py_INCREF(value2);
+#endif
+    if (decref_tuple) {
+        Py_DECREF(tuple);
+    }
+    *pvalue1 = value1;
+    *pvalue2 = value2;
+    return 0;
+#if CYTHON_COMPILING_IN_PYPY
+bad:
+    Py_XDECREF(value1);
+    Py_XDECREF(value2);
+    if (decref_tuple) { Py_XDECREF(tuple); }
+    return -1;
+#endif
+}
+static int __Pyx_unpack_tuple2_generic(PyObject* tuple, PyObject** pvalue1, PyObject** pvalue2,
+                                       int has_known_size, int decref_tuple) {
+    Py_ssize_t index;
+    PyObject *value1 = NULL, *value2 = NULL, *iter = NULL;
+    iternextfunc iternext;
+    iter = PyObject_GetIter(tuple);
+    if (unlikely(!iter)) goto bad;
+    if (decref_tuple) { Py_DECREF(tuple); tuple = NULL; }
+    iternext = Py_TYPE(iter)->tp_iternext;
+    value1 = iternext(iter); if (unlikely(!value1)) { index = 0; goto unpacking_failed; }
+    value2 = iternext(iter); if (unlikely(!value2)) { index = 1; goto unpacking_failed; }
+    if (!has_known_size && unlikely(__Pyx_IternextUnpackEndCheck(iternext(iter), 2))) goto bad;
+    Py_DECREF(iter);
+    *pvalue1 = value1;
+    *pvalue2 = value2;
+    return 0;
+unpacking_failed:
+    if (!has_known_size && __Pyx_IterFinish() == 0)
+        __Pyx_RaiseNeedMoreValuesError(index);
+bad:
+    Py_XDECREF(iter);
+    Py_XDECREF(value1);
+    Py_XDECREF(value2);
+    if (decref_tuple) { Py_XDECREF(tuple); }
+    return -1;
+}
+
+/* dict_iter */
+  static CYTHON_INLINE PyObject* __Pyx_dict_iterator(PyObject* iterable, int is_dict, PyObject* method_name,
+                                                   Py_ssize_t* p_orig_length, int* p_source_is_dict) {
+    is_dict = is_dict || likely(PyDict_CheckExact(iterable));
+    *p_source_is_dict = is_dict;
+    if (is_dict) {
+#if !CYTHON_COMPILING_IN_PYPY
+        *p_orig_length = PyDict_Size(iterable);
+        Py_INCREF(iterable);
+        return iterable;
+#elif PY_MAJOR_VERSION >= 3
+        static PyObject *py_items = NULL, *py_keys = NULL, *py_values = NULL;
+        PyObject **pp = NULL;
+        if (method_name) {
+            const char *name = PyUnicode_AsUTF8(method_name);
+            if (strcmp(name, "iteritems") == 0) pp = &py_items;
+            else if (strcmp(name, "iterkeys") == 0) pp = &py_keys;
+            else if (strcmp(name, "itervalues") == 0) pp = &py_values;
+            if (pp) {
+                if (!*pp) {
+                    *pp = PyUnicode_FromString(name + 4);
+                    if (!*pp)
+                        return NULL;
+                }
+                method_name = *pp;
+            }
+        }
+#endif
+    }
+    *p_orig_length = 0;
+    if (method_name) {
+        PyObject* iter;
+        iterable = __Pyx_PyObject_CallMethod0(iterable, method_name);
+        if (!iterable)
+            return NULL;
+#if !CYTHON_COMPILING_IN_PYPY
+        if (PyTuple_CheckExact(iterable) || PyList_CheckExact(iterable))
+            return iterable;
+#endif
+        iter = PyObject_GetIter(iterable);
+        Py_DECREF(iterable);
+        return iter;
+    }
+    return PyObject_GetIter(iterable);
+}
+static CYTHON_INLINE int __Pyx_dict_iter_next(
+        PyObject* iter_obj, CYTHON_NCP_UNUSED Py_ssize_t orig_length, CYTHON_NCP_UNUSED Py_ssize_t* ppos,
+        PyObject** pkey, PyObject** pvalue, PyObject** pitem, int source_is_dict) {
+    PyObject* next_item;
+#if !CYTHON_COMPILING_IN_PYPY
+    if (source_is_dict) {
+        PyObject *key, *value;
+        if (unlikely(orig_length != PyDict_Size(iter_obj))) {
+            PyErr_SetString(PyExc_RuntimeError, "dictionary changed size during iteration");
+            return -1;
+        }
+        if (unlikely(!PyDict_Next(iter_obj, ppos, &key, &value))) {
+            return 0;
+        }
+        if (pitem) {
+            PyObject* tuple = PyTuple_New(2);
+            if (unlikely(!tuple)) {
+                return -1;
+            }
+            Py_INCREF(key);
+            Py_INCREF(value);
+            PyTuple_SET_ITEM(tuple, 0, key);
+            PyTuple_SET_ITEM(tuple, 1, value);
+            *pitem = tuple;
+        } else {
+            if (pkey) {
+                Py_INCREF(key);
+                *pkey = key;
+            }
+            if (pvalue) {
+                Py_INCREF(value);
+                *pvalue = value;
+            }
+        }
+        return 1;
+    } else if (PyTuple_CheckExact(iter_obj)) {
+        Py_ssize_t pos = *ppos;
+        if (unlikely(pos >= PyTuple_GET_SIZE(iter_obj))) return 0;
+        *ppos = pos + 1;
+        next_item = PyTuple_GET_ITEM(iter_obj, pos);
+        Py_INCREF(next_item);
+    } else if (PyList_CheckExact(iter_obj)) {
+        Py_ssize_t pos = *ppos;
+        if (unlikely(pos >= PyList_GET_SIZE(iter_obj))) return 0;
+        *ppos = pos + 1;
+        next_item = PyList_GET_ITEM(iter_obj, pos);
+        Py_INCREF(next_item);
+    } else
+#endif
+    {
+        next_item = PyIter_Next(iter_obj);
+        if (unlikely(!next_item)) {
+            return __Pyx_IterFinish();
+        }
+    }
+    if (pitem) {
+        *pitem = next_item;
+    } else if (pkey && pvalue) {
+        if (__Pyx_unpack_tuple2(next_item, pkey, pvalue, source_is_dict, source_is_dict, 1))
+            return -1;
+    } else if (pkey) {
+        *pkey = next_item;
+    } else {
+        *pvalue = next_item;
+    }
+    return 1;
 }
 
 /* GetTopmostException */
@@ -24703,321 +34343,1286 @@ static PyObject* __Pyx_PyInt_AddObjC(PyObject *op1, PyObject *op2, CYTHON_UNUSED
                 default: return PyLong_Type.tp_as_number->nb_add(op1, op2);
             }
         }
-                x = a + b;
-            return PyLong_FromLong(x);
-#ifdef HAVE_LONG_LONG
-        long_long:
-                llx = lla + llb;
-            return PyLong_FromLongLong(llx);
+                x = a + b;
+            return PyLong_FromLong(x);
+#ifdef HAVE_LONG_LONG
+        long_long:
+                llx = lla + llb;
+            return PyLong_FromLongLong(llx);
+#endif
+        
+        
+    }
+    #endif
+    if (PyFloat_CheckExact(op1)) {
+        const long b = intval;
+        double a = PyFloat_AS_DOUBLE(op1);
+            double result;
+            PyFPE_START_PROTECT("add", return NULL)
+            result = ((double)a) + (double)b;
+            PyFPE_END_PROTECT(result)
+            return PyFloat_FromDouble(result);
+    }
+    return (inplace ? PyNumber_InPlaceAdd : PyNumber_Add)(op1, op2);
+}
+#endif
+
+/* None */
+  static CYTHON_INLINE void __Pyx_RaiseUnboundLocalError(const char *varname) {
+    PyErr_Format(PyExc_UnboundLocalError, "local variable '%s' referenced before assignment", varname);
+}
+
+/* None */
+  static CYTHON_INLINE long __Pyx_div_long(long a, long b) {
+    long q = a / b;
+    long r = a - q*b;
+    q -= ((r != 0) & ((r ^ b) < 0));
+    return q;
+}
+
+/* WriteUnraisableException */
+  static void __Pyx_WriteUnraisable(const char *name, CYTHON_UNUSED int clineno,
+                                  CYTHON_UNUSED int lineno, CYTHON_UNUSED const char *filename,
+                                  int full_traceback, CYTHON_UNUSED int nogil) {
+    PyObject *old_exc, *old_val, *old_tb;
+    PyObject *ctx;
+    __Pyx_PyThreadState_declare
+#ifdef WITH_THREAD
+    PyGILState_STATE state;
+    if (nogil)
+        state = PyGILState_Ensure();
+#ifdef _MSC_VER
+    else state = (PyGILState_STATE)-1;
+#endif
+#endif
+    __Pyx_PyThreadState_assign
+    __Pyx_ErrFetch(&old_exc, &old_val, &old_tb);
+    if (full_traceback) {
+        Py_XINCREF(old_exc);
+        Py_XINCREF(old_val);
+        Py_XINCREF(old_tb);
+        __Pyx_ErrRestore(old_exc, old_val, old_tb);
+        PyErr_PrintEx(1);
+    }
+    #if PY_MAJOR_VERSION < 3
+    ctx = PyString_FromString(name);
+    #else
+    ctx = PyUnicode_FromString(name);
+    #endif
+    __Pyx_ErrRestore(old_exc, old_val, old_tb);
+    if (!ctx) {
+        PyErr_WriteUnraisable(Py_None);
+    } else {
+        PyErr_WriteUnraisable(ctx);
+        Py_DECREF(ctx);
+    }
+#ifdef WITH_THREAD
+    if (nogil)
+        PyGILState_Release(state);
+#endif
+}
+
+/* ImportFrom */
+  static PyObject* __Pyx_ImportFrom(PyObject* module, PyObject* name) {
+    PyObject* value = __Pyx_PyObject_GetAttrStr(module, name);
+    if (unlikely(!value) && PyErr_ExceptionMatches(PyExc_AttributeError)) {
+        PyErr_Format(PyExc_ImportError,
+        #if PY_MAJOR_VERSION < 3
+            "cannot import name %.230s", PyString_AS_STRING(name));
+        #else
+            "cannot import name %S", name);
+        #endif
+    }
+    return value;
+}
+
+/* HasAttr */
+  static CYTHON_INLINE int __Pyx_HasAttr(PyObject *o, PyObject *n) {
+    PyObject *r;
+    if (unlikely(!__Pyx_PyBaseString_Check(n))) {
+        PyErr_SetString(PyExc_TypeError,
+                        "hasattr(): attribute name must be string");
+        return -1;
+    }
+    r = __Pyx_GetAttr(o, n);
+    if (unlikely(!r)) {
+        PyErr_Clear();
+        return 0;
+    } else {
+        Py_DECREF(r);
+        return 1;
+    }
+}
+
+/* PyObject_GenericGetAttrNoDict */
+  #if CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP && PY_VERSION_HEX < 0x03070000
+static PyObject *__Pyx_RaiseGenericGetAttributeError(PyTypeObject *tp, PyObject *attr_name) {
+    PyErr_Format(PyExc_AttributeError,
+#if PY_MAJOR_VERSION >= 3
+                 "'%.50s' object has no attribute '%U'",
+                 tp->tp_name, attr_name);
+#else
+                 "'%.50s' object has no attribute '%.400s'",
+                 tp->tp_name, PyString_AS_STRING(attr_name));
+#endif
+    return NULL;
+}
+static CYTHON_INLINE PyObject* __Pyx_PyObject_GenericGetAttrNoDict(PyObject* obj, PyObject* attr_name) {
+    PyObject *descr;
+    PyTypeObject *tp = Py_TYPE(obj);
+    if (unlikely(!PyString_Check(attr_name))) {
+        return PyObject_GenericGetAttr(obj, attr_name);
+    }
+    assert(!tp->tp_dictoffset);
+    descr = _PyType_Lookup(tp, attr_name);
+    if (unlikely(!descr)) {
+        return __Pyx_RaiseGenericGetAttributeError(tp, attr_name);
+    }
+    Py_INCREF(descr);
+    #if PY_MAJOR_VERSION < 3
+    if (likely(PyType_HasFeature(Py_TYPE(descr), Py_TPFLAGS_HAVE_CLASS)))
+    #endif
+    {
+        descrgetfunc f = Py_TYPE(descr)->tp_descr_get;
+        if (unlikely(f)) {
+            PyObject *res = f(descr, obj, (PyObject *)tp);
+            Py_DECREF(descr);
+            return res;
+        }
+    }
+    return descr;
+}
+#endif
+
+/* PyObject_GenericGetAttr */
+  #if CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP && PY_VERSION_HEX < 0x03070000
+static PyObject* __Pyx_PyObject_GenericGetAttr(PyObject* obj, PyObject* attr_name) {
+    if (unlikely(Py_TYPE(obj)->tp_dictoffset)) {
+        return PyObject_GenericGetAttr(obj, attr_name);
+    }
+    return __Pyx_PyObject_GenericGetAttrNoDict(obj, attr_name);
+}
+#endif
+
+/* SetVTable */
+  static int __Pyx_SetVtable(PyObject *dict, void *vtable) {
+#if PY_VERSION_HEX >= 0x02070000
+    PyObject *ob = PyCapsule_New(vtable, 0, 0);
+#else
+    PyObject *ob = PyCObject_FromVoidPtr(vtable, 0);
+#endif
+    if (!ob)
+        goto bad;
+    if (PyDict_SetItem(dict, __pyx_n_s_pyx_vtable, ob) < 0)
+        goto bad;
+    Py_DECREF(ob);
+    return 0;
+bad:
+    Py_XDECREF(ob);
+    return -1;
+}
+
+/* SetupReduce */
+  static int __Pyx_setup_reduce_is_named(PyObject* meth, PyObject* name) {
+  int ret;
+  PyObject *name_attr;
+  name_attr = __Pyx_PyObject_GetAttrStr(meth, __pyx_n_s_name_2);
+  if (likely(name_attr)) {
+      ret = PyObject_RichCompareBool(name_attr, name, Py_EQ);
+  } else {
+      ret = -1;
+  }
+  if (unlikely(ret < 0)) {
+      PyErr_Clear();
+      ret = 0;
+  }
+  Py_XDECREF(name_attr);
+  return ret;
+}
+static int __Pyx_setup_reduce(PyObject* type_obj) {
+    int ret = 0;
+    PyObject *object_reduce = NULL;
+    PyObject *object_reduce_ex = NULL;
+    PyObject *reduce = NULL;
+    PyObject *reduce_ex = NULL;
+    PyObject *reduce_cython = NULL;
+    PyObject *setstate = NULL;
+    PyObject *setstate_cython = NULL;
+#if CYTHON_USE_PYTYPE_LOOKUP
+    if (_PyType_Lookup((PyTypeObject*)type_obj, __pyx_n_s_getstate)) goto GOOD;
+#else
+    if (PyObject_HasAttr(type_obj, __pyx_n_s_getstate)) goto GOOD;
+#endif
+#if CYTHON_USE_PYTYPE_LOOKUP
+    object_reduce_ex = _PyType_Lookup(&PyBaseObject_Type, __pyx_n_s_reduce_ex); if (!object_reduce_ex) goto BAD;
+#else
+    object_reduce_ex = __Pyx_PyObject_GetAttrStr((PyObject*)&PyBaseObject_Type, __pyx_n_s_reduce_ex); if (!object_reduce_ex) goto BAD;
+#endif
+    reduce_ex = __Pyx_PyObject_GetAttrStr(type_obj, __pyx_n_s_reduce_ex); if (unlikely(!reduce_ex)) goto BAD;
+    if (reduce_ex == object_reduce_ex) {
+#if CYTHON_USE_PYTYPE_LOOKUP
+        object_reduce = _PyType_Lookup(&PyBaseObject_Type, __pyx_n_s_reduce); if (!object_reduce) goto BAD;
+#else
+        object_reduce = __Pyx_PyObject_GetAttrStr((PyObject*)&PyBaseObject_Type, __pyx_n_s_reduce); if (!object_reduce) goto BAD;
+#endif
+        reduce = __Pyx_PyObject_GetAttrStr(type_obj, __pyx_n_s_reduce); if (unlikely(!reduce)) goto BAD;
+        if (reduce == object_reduce || __Pyx_setup_reduce_is_named(reduce, __pyx_n_s_reduce_cython)) {
+            reduce_cython = __Pyx_PyObject_GetAttrStr(type_obj, __pyx_n_s_reduce_cython); if (unlikely(!reduce_cython)) goto BAD;
+            ret = PyDict_SetItem(((PyTypeObject*)type_obj)->tp_dict, __pyx_n_s_reduce, reduce_cython); if (unlikely(ret < 0)) goto BAD;
+            ret = PyDict_DelItem(((PyTypeObject*)type_obj)->tp_dict, __pyx_n_s_reduce_cython); if (unlikely(ret < 0)) goto BAD;
+            setstate = __Pyx_PyObject_GetAttrStr(type_obj, __pyx_n_s_setstate);
+            if (!setstate) PyErr_Clear();
+            if (!setstate || __Pyx_setup_reduce_is_named(setstate, __pyx_n_s_setstate_cython)) {
+                setstate_cython = __Pyx_PyObject_GetAttrStr(type_obj, __pyx_n_s_setstate_cython); if (unlikely(!setstate_cython)) goto BAD;
+                ret = PyDict_SetItem(((PyTypeObject*)type_obj)->tp_dict, __pyx_n_s_setstate, setstate_cython); if (unlikely(ret < 0)) goto BAD;
+                ret = PyDict_DelItem(((PyTypeObject*)type_obj)->tp_dict, __pyx_n_s_setstate_cython); if (unlikely(ret < 0)) goto BAD;
+            }
+            PyType_Modified((PyTypeObject*)type_obj);
+        }
+    }
+    goto GOOD;
+BAD:
+    if (!PyErr_Occurred())
+        PyErr_Format(PyExc_RuntimeError, "Unable to initialize pickling for %s", ((PyTypeObject*)type_obj)->tp_name);
+    ret = -1;
+GOOD:
+#if !CYTHON_USE_PYTYPE_LOOKUP
+    Py_XDECREF(object_reduce);
+    Py_XDECREF(object_reduce_ex);
 #endif
-        
-        
+    Py_XDECREF(reduce);
+    Py_XDECREF(reduce_ex);
+    Py_XDECREF(reduce_cython);
+    Py_XDECREF(setstate);
+    Py_XDECREF(setstate_cython);
+    return ret;
+}
+
+/* TypeImport */
+  #ifndef __PYX_HAVE_RT_ImportType
+#define __PYX_HAVE_RT_ImportType
+static PyTypeObject *__Pyx_ImportType(PyObject *module, const char *module_name, const char *class_name,
+    size_t size, enum __Pyx_ImportType_CheckSize check_size)
+{
+    PyObject *result = 0;
+    char warning[200];
+    Py_ssize_t basicsize;
+#ifdef Py_LIMITED_API
+    PyObject *py_basicsize;
+#endif
+    result = PyObject_GetAttrString(module, class_name);
+    if (!result)
+        goto bad;
+    if (!PyType_Check(result)) {
+        PyErr_Format(PyExc_TypeError,
+            "%.200s.%.200s is not a type object",
+            module_name, class_name);
+        goto bad;
     }
-    #endif
-    if (PyFloat_CheckExact(op1)) {
-        const long b = intval;
-        double a = PyFloat_AS_DOUBLE(op1);
-            double result;
-            PyFPE_START_PROTECT("add", return NULL)
-            result = ((double)a) + (double)b;
-            PyFPE_END_PROTECT(result)
-            return PyFloat_FromDouble(result);
+#ifndef Py_LIMITED_API
+    basicsize = ((PyTypeObject *)result)->tp_basicsize;
+#else
+    py_basicsize = PyObject_GetAttrString(result, "__basicsize__");
+    if (!py_basicsize)
+        goto bad;
+    basicsize = PyLong_AsSsize_t(py_basicsize);
+    Py_DECREF(py_basicsize);
+    py_basicsize = 0;
+    if (basicsize == (Py_ssize_t)-1 && PyErr_Occurred())
+        goto bad;
+#endif
+    if ((size_t)basicsize < size) {
+        PyErr_Format(PyExc_ValueError,
+            "%.200s.%.200s size changed, may indicate binary incompatibility. "
+            "Expected %zd from C header, got %zd from PyObject",
+            module_name, class_name, size, basicsize);
+        goto bad;
     }
-    return (inplace ? PyNumber_InPlaceAdd : PyNumber_Add)(op1, op2);
+    if (check_size == __Pyx_ImportType_CheckSize_Error && (size_t)basicsize != size) {
+        PyErr_Format(PyExc_ValueError,
+            "%.200s.%.200s size changed, may indicate binary incompatibility. "
+            "Expected %zd from C header, got %zd from PyObject",
+            module_name, class_name, size, basicsize);
+        goto bad;
+    }
+    else if (check_size == __Pyx_ImportType_CheckSize_Warn && (size_t)basicsize > size) {
+        PyOS_snprintf(warning, sizeof(warning),
+            "%s.%s size changed, may indicate binary incompatibility. "
+            "Expected %zd from C header, got %zd from PyObject",
+            module_name, class_name, size, basicsize);
+        if (PyErr_WarnEx(NULL, warning, 0) < 0) goto bad;
+    }
+    return (PyTypeObject *)result;
+bad:
+    Py_XDECREF(result);
+    return NULL;
 }
 #endif
 
-/* None */
-  static CYTHON_INLINE void __Pyx_RaiseUnboundLocalError(const char *varname) {
-    PyErr_Format(PyExc_UnboundLocalError, "local variable '%s' referenced before assignment", varname);
+/* FetchCommonType */
+  static PyTypeObject* __Pyx_FetchCommonType(PyTypeObject* type) {
+    PyObject* fake_module;
+    PyTypeObject* cached_type = NULL;
+    fake_module = PyImport_AddModule((char*) "_cython_" CYTHON_ABI);
+    if (!fake_module) return NULL;
+    Py_INCREF(fake_module);
+    cached_type = (PyTypeObject*) PyObject_GetAttrString(fake_module, type->tp_name);
+    if (cached_type) {
+        if (!PyType_Check((PyObject*)cached_type)) {
+            PyErr_Format(PyExc_TypeError,
+                "Shared Cython type %.200s is not a type object",
+                type->tp_name);
+            goto bad;
+        }
+        if (cached_type->tp_basicsize != type->tp_basicsize) {
+            PyErr_Format(PyExc_TypeError,
+                "Shared Cython type %.200s has the wrong size, try recompiling",
+                type->tp_name);
+            goto bad;
+        }
+    } else {
+        if (!PyErr_ExceptionMatches(PyExc_AttributeError)) goto bad;
+        PyErr_Clear();
+        if (PyType_Ready(type) < 0) goto bad;
+        if (PyObject_SetAttrString(fake_module, type->tp_name, (PyObject*) type) < 0)
+            goto bad;
+        Py_INCREF(type);
+        cached_type = type;
+    }
+done:
+    Py_DECREF(fake_module);
+    return cached_type;
+bad:
+    Py_XDECREF(cached_type);
+    cached_type = NULL;
+    goto done;
 }
 
-/* None */
-  static CYTHON_INLINE long __Pyx_div_long(long a, long b) {
-    long q = a / b;
-    long r = a - q*b;
-    q -= ((r != 0) & ((r ^ b) < 0));
-    return q;
+/* CythonFunction */
+  #include <structmember.h>
+static PyObject *
+__Pyx_CyFunction_get_doc(__pyx_CyFunctionObject *op, CYTHON_UNUSED void *closure)
+{
+    if (unlikely(op->func_doc == NULL)) {
+        if (op->func.m_ml->ml_doc) {
+#if PY_MAJOR_VERSION >= 3
+            op->func_doc = PyUnicode_FromString(op->func.m_ml->ml_doc);
+#else
+            op->func_doc = PyString_FromString(op->func.m_ml->ml_doc);
+#endif
+            if (unlikely(op->func_doc == NULL))
+                return NULL;
+        } else {
+            Py_INCREF(Py_None);
+            return Py_None;
+        }
+    }
+    Py_INCREF(op->func_doc);
+    return op->func_doc;
 }
-
-/* WriteUnraisableException */
-  static void __Pyx_WriteUnraisable(const char *name, CYTHON_UNUSED int clineno,
-                                  CYTHON_UNUSED int lineno, CYTHON_UNUSED const char *filename,
-                                  int full_traceback, CYTHON_UNUSED int nogil) {
-    PyObject *old_exc, *old_val, *old_tb;
-    PyObject *ctx;
-    __Pyx_PyThreadState_declare
-#ifdef WITH_THREAD
-    PyGILState_STATE state;
-    if (nogil)
-        state = PyGILState_Ensure();
-#ifdef _MSC_VER
-    else state = (PyGILState_STATE)-1;
+static int
+__Pyx_CyFunction_set_doc(__pyx_CyFunctionObject *op, PyObject *value, CYTHON_UNUSED void *context)
+{
+    PyObject *tmp = op->func_doc;
+    if (value == NULL) {
+        value = Py_None;
+    }
+    Py_INCREF(value);
+    op->func_doc = value;
+    Py_XDECREF(tmp);
+    return 0;
+}
+static PyObject *
+__Pyx_CyFunction_get_name(__pyx_CyFunctionObject *op, CYTHON_UNUSED void *context)
+{
+    if (unlikely(op->func_name == NULL)) {
+#if PY_MAJOR_VERSION >= 3
+        op->func_name = PyUnicode_InternFromString(op->func.m_ml->ml_name);
+#else
+        op->func_name = PyString_InternFromString(op->func.m_ml->ml_name);
 #endif
+        if (unlikely(op->func_name == NULL))
+            return NULL;
+    }
+    Py_INCREF(op->func_name);
+    return op->func_name;
+}
+static int
+__Pyx_CyFunction_set_name(__pyx_CyFunctionObject *op, PyObject *value, CYTHON_UNUSED void *context)
+{
+    PyObject *tmp;
+#if PY_MAJOR_VERSION >= 3
+    if (unlikely(value == NULL || !PyUnicode_Check(value)))
+#else
+    if (unlikely(value == NULL || !PyString_Check(value)))
 #endif
-    __Pyx_PyThreadState_assign
-    __Pyx_ErrFetch(&old_exc, &old_val, &old_tb);
-    if (full_traceback) {
-        Py_XINCREF(old_exc);
-        Py_XINCREF(old_val);
-        Py_XINCREF(old_tb);
-        __Pyx_ErrRestore(old_exc, old_val, old_tb);
-        PyErr_PrintEx(1);
+    {
+        PyErr_SetString(PyExc_TypeError,
+                        "__name__ must be set to a string object");
+        return -1;
     }
-    #if PY_MAJOR_VERSION < 3
-    ctx = PyString_FromString(name);
+    tmp = op->func_name;
+    Py_INCREF(value);
+    op->func_name = value;
+    Py_XDECREF(tmp);
+    return 0;
+}
+static PyObject *
+__Pyx_CyFunction_get_qualname(__pyx_CyFunctionObject *op, CYTHON_UNUSED void *context)
+{
+    Py_INCREF(op->func_qualname);
+    return op->func_qualname;
+}
+static int
+__Pyx_CyFunction_set_qualname(__pyx_CyFunctionObject *op, PyObject *value, CYTHON_UNUSED void *context)
+{
+    PyObject *tmp;
+#if PY_MAJOR_VERSION >= 3
+    if (unlikely(value == NULL || !PyUnicode_Check(value)))
+#else
+    if (unlikely(value == NULL || !PyString_Check(value)))
+#endif
+    {
+        PyErr_SetString(PyExc_TypeError,
+                        "__qualname__ must be set to a string object");
+        return -1;
+    }
+    tmp = op->func_qualname;
+    Py_INCREF(value);
+    op->func_qualname = value;
+    Py_XDECREF(tmp);
+    return 0;
+}
+static PyObject *
+__Pyx_CyFunction_get_self(__pyx_CyFunctionObject *m, CYTHON_UNUSED void *closure)
+{
+    PyObject *self;
+    self = m->func_closure;
+    if (self == NULL)
+        self = Py_None;
+    Py_INCREF(self);
+    return self;
+}
+static PyObject *
+__Pyx_CyFunction_get_dict(__pyx_CyFunctionObject *op, CYTHON_UNUSED void *context)
+{
+    if (unlikely(op->func_dict == NULL)) {
+        op->func_dict = PyDict_New();
+        if (unlikely(op->func_dict == NULL))
+            return NULL;
+    }
+    Py_INCREF(op->func_dict);
+    return op->func_dict;
+}
+static int
+__Pyx_CyFunction_set_dict(__pyx_CyFunctionObject *op, PyObject *value, CYTHON_UNUSED void *context)
+{
+    PyObject *tmp;
+    if (unlikely(value == NULL)) {
+        PyErr_SetString(PyExc_TypeError,
+               "function's dictionary may not be deleted");
+        return -1;
+    }
+    if (unlikely(!PyDict_Check(value))) {
+        PyErr_SetString(PyExc_TypeError,
+               "setting function's dictionary to a non-dict");
+        return -1;
+    }
+    tmp = op->func_dict;
+    Py_INCREF(value);
+    op->func_dict = value;
+    Py_XDECREF(tmp);
+    return 0;
+}
+static PyObject *
+__Pyx_CyFunction_get_globals(__pyx_CyFunctionObject *op, CYTHON_UNUSED void *context)
+{
+    Py_INCREF(op->func_globals);
+    return op->func_globals;
+}
+static PyObject *
+__Pyx_CyFunction_get_closure(CYTHON_UNUSED __pyx_CyFunctionObject *op, CYTHON_UNUSED void *context)
+{
+    Py_INCREF(Py_None);
+    return Py_None;
+}
+static PyObject *
+__Pyx_CyFunction_get_code(__pyx_CyFunctionObject *op, CYTHON_UNUSED void *context)
+{
+    PyObject* result = (op->func_code) ? op->func_code : Py_None;
+    Py_INCREF(result);
+    return result;
+}
+static int
+__Pyx_CyFunction_init_defaults(__pyx_CyFunctionObject *op) {
+    int result = 0;
+    PyObject *res = op->defaults_getter((PyObject *) op);
+    if (unlikely(!res))
+        return -1;
+    #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+    op->defaults_tuple = PyTuple_GET_ITEM(res, 0);
+    Py_INCREF(op->defaults_tuple);
+    op->defaults_kwdict = PyTuple_GET_ITEM(res, 1);
+    Py_INCREF(op->defaults_kwdict);
     #else
-    ctx = PyUnicode_FromString(name);
+    op->defaults_tuple = PySequence_ITEM(res, 0);
+    if (unlikely(!op->defaults_tuple)) result = -1;
+    else {
+        op->defaults_kwdict = PySequence_ITEM(res, 1);
+        if (unlikely(!op->defaults_kwdict)) result = -1;
+    }
     #endif
-    __Pyx_ErrRestore(old_exc, old_val, old_tb);
-    if (!ctx) {
-        PyErr_WriteUnraisable(Py_None);
-    } else {
-        PyErr_WriteUnraisable(ctx);
-        Py_DECREF(ctx);
+    Py_DECREF(res);
+    return result;
+}
+static int
+__Pyx_CyFunction_set_defaults(__pyx_CyFunctionObject *op, PyObject* value, CYTHON_UNUSED void *context) {
+    PyObject* tmp;
+    if (!value) {
+        value = Py_None;
+    } else if (value != Py_None && !PyTuple_Check(value)) {
+        PyErr_SetString(PyExc_TypeError,
+                        "__defaults__ must be set to a tuple object");
+        return -1;
     }
-#ifdef WITH_THREAD
-    if (nogil)
-        PyGILState_Release(state);
-#endif
+    Py_INCREF(value);
+    tmp = op->defaults_tuple;
+    op->defaults_tuple = value;
+    Py_XDECREF(tmp);
+    return 0;
+}
+static PyObject *
+__Pyx_CyFunction_get_defaults(__pyx_CyFunctionObject *op, CYTHON_UNUSED void *context) {
+    PyObject* result = op->defaults_tuple;
+    if (unlikely(!result)) {
+        if (op->defaults_getter) {
+            if (__Pyx_CyFunction_init_defaults(op) < 0) return NULL;
+            result = op->defaults_tuple;
+        } else {
+            result = Py_None;
+        }
+    }
+    Py_INCREF(result);
+    return result;
+}
+static int
+__Pyx_CyFunction_set_kwdefaults(__pyx_CyFunctionObject *op, PyObject* value, CYTHON_UNUSED void *context) {
+    PyObject* tmp;
+    if (!value) {
+        value = Py_None;
+    } else if (value != Py_None && !PyDict_Check(value)) {
+        PyErr_SetString(PyExc_TypeError,
+                        "__kwdefaults__ must be set to a dict object");
+        return -1;
+    }
+    Py_INCREF(value);
+    tmp = op->defaults_kwdict;
+    op->defaults_kwdict = value;
+    Py_XDECREF(tmp);
+    return 0;
 }
-
-/* ImportFrom */
-  static PyObject* __Pyx_ImportFrom(PyObject* module, PyObject* name) {
-    PyObject* value = __Pyx_PyObject_GetAttrStr(module, name);
-    if (unlikely(!value) && PyErr_ExceptionMatches(PyExc_AttributeError)) {
-        PyErr_Format(PyExc_ImportError,
-        #if PY_MAJOR_VERSION < 3
-            "cannot import name %.230s", PyString_AS_STRING(name));
-        #else
-            "cannot import name %S", name);
-        #endif
+static PyObject *
+__Pyx_CyFunction_get_kwdefaults(__pyx_CyFunctionObject *op, CYTHON_UNUSED void *context) {
+    PyObject* result = op->defaults_kwdict;
+    if (unlikely(!result)) {
+        if (op->defaults_getter) {
+            if (__Pyx_CyFunction_init_defaults(op) < 0) return NULL;
+            result = op->defaults_kwdict;
+        } else {
+            result = Py_None;
+        }
     }
-    return value;
+    Py_INCREF(result);
+    return result;
 }
-
-/* HasAttr */
-  static CYTHON_INLINE int __Pyx_HasAttr(PyObject *o, PyObject *n) {
-    PyObject *r;
-    if (unlikely(!__Pyx_PyBaseString_Check(n))) {
+static int
+__Pyx_CyFunction_set_annotations(__pyx_CyFunctionObject *op, PyObject* value, CYTHON_UNUSED void *context) {
+    PyObject* tmp;
+    if (!value || value == Py_None) {
+        value = NULL;
+    } else if (!PyDict_Check(value)) {
         PyErr_SetString(PyExc_TypeError,
-                        "hasattr(): attribute name must be string");
+                        "__annotations__ must be set to a dict object");
         return -1;
     }
-    r = __Pyx_GetAttr(o, n);
-    if (unlikely(!r)) {
-        PyErr_Clear();
-        return 0;
-    } else {
-        Py_DECREF(r);
-        return 1;
+    Py_XINCREF(value);
+    tmp = op->func_annotations;
+    op->func_annotations = value;
+    Py_XDECREF(tmp);
+    return 0;
+}
+static PyObject *
+__Pyx_CyFunction_get_annotations(__pyx_CyFunctionObject *op, CYTHON_UNUSED void *context) {
+    PyObject* result = op->func_annotations;
+    if (unlikely(!result)) {
+        result = PyDict_New();
+        if (unlikely(!result)) return NULL;
+        op->func_annotations = result;
     }
+    Py_INCREF(result);
+    return result;
 }
-
-/* PyObject_GenericGetAttrNoDict */
-  #if CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP && PY_VERSION_HEX < 0x03070000
-static PyObject *__Pyx_RaiseGenericGetAttributeError(PyTypeObject *tp, PyObject *attr_name) {
-    PyErr_Format(PyExc_AttributeError,
+static PyGetSetDef __pyx_CyFunction_getsets[] = {
+    {(char *) "func_doc", (getter)__Pyx_CyFunction_get_doc, (setter)__Pyx_CyFunction_set_doc, 0, 0},
+    {(char *) "__doc__",  (getter)__Pyx_CyFunction_get_doc, (setter)__Pyx_CyFunction_set_doc, 0, 0},
+    {(char *) "func_name", (getter)__Pyx_CyFunction_get_name, (setter)__Pyx_CyFunction_set_name, 0, 0},
+    {(char *) "__name__", (getter)__Pyx_CyFunction_get_name, (setter)__Pyx_CyFunction_set_name, 0, 0},
+    {(char *) "__qualname__", (getter)__Pyx_CyFunction_get_qualname, (setter)__Pyx_CyFunction_set_qualname, 0, 0},
+    {(char *) "__self__", (getter)__Pyx_CyFunction_get_self, 0, 0, 0},
+    {(char *) "func_dict", (getter)__Pyx_CyFunction_get_dict, (setter)__Pyx_CyFunction_set_dict, 0, 0},
+    {(char *) "__dict__", (getter)__Pyx_CyFunction_get_dict, (setter)__Pyx_CyFunction_set_dict, 0, 0},
+    {(char *) "func_globals", (getter)__Pyx_CyFunction_get_globals, 0, 0, 0},
+    {(char *) "__globals__", (getter)__Pyx_CyFunction_get_globals, 0, 0, 0},
+    {(char *) "func_closure", (getter)__Pyx_CyFunction_get_closure, 0, 0, 0},
+    {(char *) "__closure__", (getter)__Pyx_CyFunction_get_closure, 0, 0, 0},
+    {(char *) "func_code", (getter)__Pyx_CyFunction_get_code, 0, 0, 0},
+    {(char *) "__code__", (getter)__Pyx_CyFunction_get_code, 0, 0, 0},
+    {(char *) "func_defaults", (getter)__Pyx_CyFunction_get_defaults, (setter)__Pyx_CyFunction_set_defaults, 0, 0},
+    {(char *) "__defaults__", (getter)__Pyx_CyFunction_get_defaults, (setter)__Pyx_CyFunction_set_defaults, 0, 0},
+    {(char *) "__kwdefaults__", (getter)__Pyx_CyFunction_get_kwdefaults, (setter)__Pyx_CyFunction_set_kwdefaults, 0, 0},
+    {(char *) "__annotations__", (getter)__Pyx_CyFunction_get_annotations, (setter)__Pyx_CyFunction_set_annotations, 0, 0},
+    {0, 0, 0, 0, 0}
+};
+static PyMemberDef __pyx_CyFunction_members[] = {
+    {(char *) "__module__", T_OBJECT, offsetof(PyCFunctionObject, m_module), PY_WRITE_RESTRICTED, 0},
+    {0, 0, 0,  0, 0}
+};
+static PyObject *
+__Pyx_CyFunction_reduce(__pyx_CyFunctionObject *m, CYTHON_UNUSED PyObject *args)
+{
 #if PY_MAJOR_VERSION >= 3
-                 "'%.50s' object has no attribute '%U'",
-                 tp->tp_name, attr_name);
+    return PyUnicode_FromString(m->func.m_ml->ml_name);
 #else
-                 "'%.50s' object has no attribute '%.400s'",
-                 tp->tp_name, PyString_AS_STRING(attr_name));
+    return PyString_FromString(m->func.m_ml->ml_name);
 #endif
-    return NULL;
 }
-static CYTHON_INLINE PyObject* __Pyx_PyObject_GenericGetAttrNoDict(PyObject* obj, PyObject* attr_name) {
-    PyObject *descr;
-    PyTypeObject *tp = Py_TYPE(obj);
-    if (unlikely(!PyString_Check(attr_name))) {
-        return PyObject_GenericGetAttr(obj, attr_name);
+static PyMethodDef __pyx_CyFunction_methods[] = {
+    {"__reduce__", (PyCFunction)__Pyx_CyFunction_reduce, METH_VARARGS, 0},
+    {0, 0, 0, 0}
+};
+#if PY_VERSION_HEX < 0x030500A0
+#define __Pyx_CyFunction_weakreflist(cyfunc) ((cyfunc)->func_weakreflist)
+#else
+#define __Pyx_CyFunction_weakreflist(cyfunc) ((cyfunc)->func.m_weakreflist)
+#endif
+static PyObject *__Pyx_CyFunction_New(PyTypeObject *type, PyMethodDef *ml, int flags, PyObject* qualname,
+                                      PyObject *closure, PyObject *module, PyObject* globals, PyObject* code) {
+    __pyx_CyFunctionObject *op = PyObject_GC_New(__pyx_CyFunctionObject, type);
+    if (op == NULL)
+        return NULL;
+    op->flags = flags;
+    __Pyx_CyFunction_weakreflist(op) = NULL;
+    op->func.m_ml = ml;
+    op->func.m_self = (PyObject *) op;
+    Py_XINCREF(closure);
+    op->func_closure = closure;
+    Py_XINCREF(module);
+    op->func.m_module = module;
+    op->func_dict = NULL;
+    op->func_name = NULL;
+    Py_INCREF(qualname);
+    op->func_qualname = qualname;
+    op->func_doc = NULL;
+    op->func_classobj = NULL;
+    op->func_globals = globals;
+    Py_INCREF(op->func_globals);
+    Py_XINCREF(code);
+    op->func_code = code;
+    op->defaults_pyobjects = 0;
+    op->defaults = NULL;
+    op->defaults_tuple = NULL;
+    op->defaults_kwdict = NULL;
+    op->defaults_getter = NULL;
+    op->func_annotations = NULL;
+    PyObject_GC_Track(op);
+    return (PyObject *) op;
+}
+static int
+__Pyx_CyFunction_clear(__pyx_CyFunctionObject *m)
+{
+    Py_CLEAR(m->func_closure);
+    Py_CLEAR(m->func.m_module);
+    Py_CLEAR(m->func_dict);
+    Py_CLEAR(m->func_name);
+    Py_CLEAR(m->func_qualname);
+    Py_CLEAR(m->func_doc);
+    Py_CLEAR(m->func_globals);
+    Py_CLEAR(m->func_code);
+    Py_CLEAR(m->func_classobj);
+    Py_CLEAR(m->defaults_tuple);
+    Py_CLEAR(m->defaults_kwdict);
+    Py_CLEAR(m->func_annotations);
+    if (m->defaults) {
+        PyObject **pydefaults = __Pyx_CyFunction_Defaults(PyObject *, m);
+        int i;
+        for (i = 0; i < m->defaults_pyobjects; i++)
+            Py_XDECREF(pydefaults[i]);
+        PyObject_Free(m->defaults);
+        m->defaults = NULL;
     }
-    assert(!tp->tp_dictoffset);
-    descr = _PyType_Lookup(tp, attr_name);
-    if (unlikely(!descr)) {
-        return __Pyx_RaiseGenericGetAttributeError(tp, attr_name);
+    return 0;
+}
+static void __Pyx__CyFunction_dealloc(__pyx_CyFunctionObject *m)
+{
+    if (__Pyx_CyFunction_weakreflist(m) != NULL)
+        PyObject_ClearWeakRefs((PyObject *) m);
+    __Pyx_CyFunction_clear(m);
+    PyObject_GC_Del(m);
+}
+static void __Pyx_CyFunction_dealloc(__pyx_CyFunctionObject *m)
+{
+    PyObject_GC_UnTrack(m);
+    __Pyx__CyFunction_dealloc(m);
+}
+static int __Pyx_CyFunction_traverse(__pyx_CyFunctionObject *m, visitproc visit, void *arg)
+{
+    Py_VISIT(m->func_closure);
+    Py_VISIT(m->func.m_module);
+    Py_VISIT(m->func_dict);
+    Py_VISIT(m->func_name);
+    Py_VISIT(m->func_qualname);
+    Py_VISIT(m->func_doc);
+    Py_VISIT(m->func_globals);
+    Py_VISIT(m->func_code);
+    Py_VISIT(m->func_classobj);
+    Py_VISIT(m->defaults_tuple);
+    Py_VISIT(m->defaults_kwdict);
+    if (m->defaults) {
+        PyObject **pydefaults = __Pyx_CyFunction_Defaults(PyObject *, m);
+        int i;
+        for (i = 0; i < m->defaults_pyobjects; i++)
+            Py_VISIT(pydefaults[i]);
     }
-    Py_INCREF(descr);
-    #if PY_MAJOR_VERSION < 3
-    if (likely(PyType_HasFeature(Py_TYPE(descr), Py_TPFLAGS_HAVE_CLASS)))
-    #endif
-    {
-        descrgetfunc f = Py_TYPE(descr)->tp_descr_get;
-        if (unlikely(f)) {
-            PyObject *res = f(descr, obj, (PyObject *)tp);
-            Py_DECREF(descr);
-            return res;
+    return 0;
+}
+static PyObject *__Pyx_CyFunction_descr_get(PyObject *func, PyObject *obj, PyObject *type)
+{
+    __pyx_CyFunctionObject *m = (__pyx_CyFunctionObject *) func;
+    if (m->flags & __Pyx_CYFUNCTION_STATICMETHOD) {
+        Py_INCREF(func);
+        return func;
+    }
+    if (m->flags & __Pyx_CYFUNCTION_CLASSMETHOD) {
+        if (type == NULL)
+            type = (PyObject *)(Py_TYPE(obj));
+        return __Pyx_PyMethod_New(func, type, (PyObject *)(Py_TYPE(type)));
+    }
+    if (obj == Py_None)
+        obj = NULL;
+    return __Pyx_PyMethod_New(func, obj, type);
+}
+static PyObject*
+__Pyx_CyFunction_repr(__pyx_CyFunctionObject *op)
+{
+#if PY_MAJOR_VERSION >= 3
+    return PyUnicode_FromFormat("<cyfunction %U at %p>",
+                                op->func_qualname, (void *)op);
+#else
+    return PyString_FromFormat("<cyfunction %s at %p>",
+                               PyString_AsString(op->func_qualname), (void *)op);
+#endif
+}
+static PyObject * __Pyx_CyFunction_CallMethod(PyObject *func, PyObject *self, PyObject *arg, PyObject *kw) {
+    PyCFunctionObject* f = (PyCFunctionObject*)func;
+    PyCFunction meth = f->m_ml->ml_meth;
+    Py_ssize_t size;
+    switch (f->m_ml->ml_flags & (METH_VARARGS | METH_KEYWORDS | METH_NOARGS | METH_O)) {
+    case METH_VARARGS:
+        if (likely(kw == NULL || PyDict_Size(kw) == 0))
+            return (*meth)(self, arg);
+        break;
+    case METH_VARARGS | METH_KEYWORDS:
+        return (*(PyCFunctionWithKeywords)(void*)meth)(self, arg, kw);
+    case METH_NOARGS:
+        if (likely(kw == NULL || PyDict_Size(kw) == 0)) {
+            size = PyTuple_GET_SIZE(arg);
+            if (likely(size == 0))
+                return (*meth)(self, NULL);
+            PyErr_Format(PyExc_TypeError,
+                "%.200s() takes no arguments (%" CYTHON_FORMAT_SSIZE_T "d given)",
+                f->m_ml->ml_name, size);
+            return NULL;
+        }
+        break;
+    case METH_O:
+        if (likely(kw == NULL || PyDict_Size(kw) == 0)) {
+            size = PyTuple_GET_SIZE(arg);
+            if (likely(size == 1)) {
+                PyObject *result, *arg0;
+                #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+                arg0 = PyTuple_GET_ITEM(arg, 0);
+                #else
+                arg0 = PySequence_ITEM(arg, 0); if (unlikely(!arg0)) return NULL;
+                #endif
+                result = (*meth)(self, arg0);
+                #if !(CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS)
+                Py_DECREF(arg0);
+                #endif
+                return result;
+            }
+            PyErr_Format(PyExc_TypeError,
+                "%.200s() takes exactly one argument (%" CYTHON_FORMAT_SSIZE_T "d given)",
+                f->m_ml->ml_name, size);
+            return NULL;
         }
+        break;
+    default:
+        PyErr_SetString(PyExc_SystemError, "Bad call flags in "
+                        "__Pyx_CyFunction_Call. METH_OLDARGS is no "
+                        "longer supported!");
+        return NULL;
     }
-    return descr;
+    PyErr_Format(PyExc_TypeError, "%.200s() takes no keyword arguments",
+                 f->m_ml->ml_name);
+    return NULL;
 }
-#endif
-
-/* PyObject_GenericGetAttr */
-  #if CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP && PY_VERSION_HEX < 0x03070000
-static PyObject* __Pyx_PyObject_GenericGetAttr(PyObject* obj, PyObject* attr_name) {
-    if (unlikely(Py_TYPE(obj)->tp_dictoffset)) {
-        return PyObject_GenericGetAttr(obj, attr_name);
+static CYTHON_INLINE PyObject *__Pyx_CyFunction_Call(PyObject *func, PyObject *arg, PyObject *kw) {
+    return __Pyx_CyFunction_CallMethod(func, ((PyCFunctionObject*)func)->m_self, arg, kw);
+}
+static PyObject *__Pyx_CyFunction_CallAsMethod(PyObject *func, PyObject *args, PyObject *kw) {
+    PyObject *result;
+    __pyx_CyFunctionObject *cyfunc = (__pyx_CyFunctionObject *) func;
+    if ((cyfunc->flags & __Pyx_CYFUNCTION_CCLASS) && !(cyfunc->flags & __Pyx_CYFUNCTION_STATICMETHOD)) {
+        Py_ssize_t argc;
+        PyObject *new_args;
+        PyObject *self;
+        argc = PyTuple_GET_SIZE(args);
+        new_args = PyTuple_GetSlice(args, 1, argc);
+        if (unlikely(!new_args))
+            return NULL;
+        self = PyTuple_GetItem(args, 0);
+        if (unlikely(!self)) {
+            Py_DECREF(new_args);
+            return NULL;
+        }
+        result = __Pyx_CyFunction_CallMethod(func, self, new_args, kw);
+        Py_DECREF(new_args);
+    } else {
+        result = __Pyx_CyFunction_Call(func, args, kw);
     }
-    return __Pyx_PyObject_GenericGetAttrNoDict(obj, attr_name);
+    return result;
 }
+static PyTypeObject __pyx_CyFunctionType_type = {
+    PyVarObject_HEAD_INIT(0, 0)
+    "cython_function_or_method",
+    sizeof(__pyx_CyFunctionObject),
+    0,
+    (destructor) __Pyx_CyFunction_dealloc,
+    0,
+    0,
+    0,
+#if PY_MAJOR_VERSION < 3
+    0,
+#else
+    0,
 #endif
-
-/* SetVTable */
-  static int __Pyx_SetVtable(PyObject *dict, void *vtable) {
-#if PY_VERSION_HEX >= 0x02070000
-    PyObject *ob = PyCapsule_New(vtable, 0, 0);
+    (reprfunc) __Pyx_CyFunction_repr,
+    0,
+    0,
+    0,
+    0,
+    __Pyx_CyFunction_CallAsMethod,
+    0,
+    0,
+    0,
+    0,
+    Py_TPFLAGS_DEFAULT | Py_TPFLAGS_HAVE_GC,
+    0,
+    (traverseproc) __Pyx_CyFunction_traverse,
+    (inquiry) __Pyx_CyFunction_clear,
+    0,
+#if PY_VERSION_HEX < 0x030500A0
+    offsetof(__pyx_CyFunctionObject, func_weakreflist),
 #else
-    PyObject *ob = PyCObject_FromVoidPtr(vtable, 0);
+    offsetof(PyCFunctionObject, m_weakreflist),
 #endif
-    if (!ob)
-        goto bad;
-    if (PyDict_SetItem(dict, __pyx_n_s_pyx_vtable, ob) < 0)
-        goto bad;
-    Py_DECREF(ob);
+    0,
+    0,
+    __pyx_CyFunction_methods,
+    __pyx_CyFunction_members,
+    __pyx_CyFunction_getsets,
+    0,
+    0,
+    __Pyx_CyFunction_descr_get,
+    0,
+    offsetof(__pyx_CyFunctionObject, func_dict),
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+#if PY_VERSION_HEX >= 0x030400a1
+    0,
+#endif
+};
+static int __pyx_CyFunction_init(void) {
+    __pyx_CyFunctionType = __Pyx_FetchCommonType(&__pyx_CyFunctionType_type);
+    if (unlikely(__pyx_CyFunctionType == NULL)) {
+        return -1;
+    }
     return 0;
-bad:
-    Py_XDECREF(ob);
-    return -1;
 }
-
-/* SetupReduce */
-  static int __Pyx_setup_reduce_is_named(PyObject* meth, PyObject* name) {
-  int ret;
-  PyObject *name_attr;
-  name_attr = __Pyx_PyObject_GetAttrStr(meth, __pyx_n_s_name_2);
-  if (likely(name_attr)) {
-      ret = PyObject_RichCompareBool(name_attr, name, Py_EQ);
-  } else {
-      ret = -1;
-  }
-  if (unlikely(ret < 0)) {
-      PyErr_Clear();
-      ret = 0;
-  }
-  Py_XDECREF(name_attr);
-  return ret;
+static CYTHON_INLINE void *__Pyx_CyFunction_InitDefaults(PyObject *func, size_t size, int pyobjects) {
+    __pyx_CyFunctionObject *m = (__pyx_CyFunctionObject *) func;
+    m->defaults = PyObject_Malloc(size);
+    if (unlikely(!m->defaults))
+        return PyErr_NoMemory();
+    memset(m->defaults, 0, size);
+    m->defaults_pyobjects = pyobjects;
+    return m->defaults;
+}
+static CYTHON_INLINE void __Pyx_CyFunction_SetDefaultsTuple(PyObject *func, PyObject *tuple) {
+    __pyx_CyFunctionObject *m = (__pyx_CyFunctionObject *) func;
+    m->defaults_tuple = tuple;
+    Py_INCREF(tuple);
+}
+static CYTHON_INLINE void __Pyx_CyFunction_SetDefaultsKwDict(PyObject *func, PyObject *dict) {
+    __pyx_CyFunctionObject *m = (__pyx_CyFunctionObject *) func;
+    m->defaults_kwdict = dict;
+    Py_INCREF(dict);
+}
+static CYTHON_INLINE void __Pyx_CyFunction_SetAnnotationsDict(PyObject *func, PyObject *dict) {
+    __pyx_CyFunctionObject *m = (__pyx_CyFunctionObject *) func;
+    m->func_annotations = dict;
+    Py_INCREF(dict);
+}
+
+/* FusedFunction */
+  static PyObject *
+__pyx_FusedFunction_New(PyTypeObject *type, PyMethodDef *ml, int flags,
+                        PyObject *qualname, PyObject *self,
+                        PyObject *module, PyObject *globals,
+                        PyObject *code)
+{
+    __pyx_FusedFunctionObject *fusedfunc =
+        (__pyx_FusedFunctionObject *) __Pyx_CyFunction_New(type, ml, flags, qualname,
+                                                           self, module, globals, code);
+    if (!fusedfunc)
+        return NULL;
+    fusedfunc->__signatures__ = NULL;
+    fusedfunc->type = NULL;
+    fusedfunc->self = NULL;
+    return (PyObject *) fusedfunc;
 }
-static int __Pyx_setup_reduce(PyObject* type_obj) {
-    int ret = 0;
-    PyObject *object_reduce = NULL;
-    PyObject *object_reduce_ex = NULL;
-    PyObject *reduce = NULL;
-    PyObject *reduce_ex = NULL;
-    PyObject *reduce_cython = NULL;
-    PyObject *setstate = NULL;
-    PyObject *setstate_cython = NULL;
-#if CYTHON_USE_PYTYPE_LOOKUP
-    if (_PyType_Lookup((PyTypeObject*)type_obj, __pyx_n_s_getstate)) goto GOOD;
-#else
-    if (PyObject_HasAttr(type_obj, __pyx_n_s_getstate)) goto GOOD;
-#endif
-#if CYTHON_USE_PYTYPE_LOOKUP
-    object_reduce_ex = _PyType_Lookup(&PyBaseObject_Type, __pyx_n_s_reduce_ex); if (!object_reduce_ex) goto BAD;
+static void
+__pyx_FusedFunction_dealloc(__pyx_FusedFunctionObject *self)
+{
+    PyObject_GC_UnTrack(self);
+    Py_CLEAR(self->self);
+    Py_CLEAR(self->type);
+    Py_CLEAR(self->__signatures__);
+    __Pyx__CyFunction_dealloc((__pyx_CyFunctionObject *) self);
+}
+static int
+__pyx_FusedFunction_traverse(__pyx_FusedFunctionObject *self,
+                             visitproc visit,
+                             void *arg)
+{
+    Py_VISIT(self->self);
+    Py_VISIT(self->type);
+    Py_VISIT(self->__signatures__);
+    return __Pyx_CyFunction_traverse((__pyx_CyFunctionObject *) self, visit, arg);
+}
+static int
+__pyx_FusedFunction_clear(__pyx_FusedFunctionObject *self)
+{
+    Py_CLEAR(self->self);
+    Py_CLEAR(self->type);
+    Py_CLEAR(self->__signatures__);
+    return __Pyx_CyFunction_clear((__pyx_CyFunctionObject *) self);
+}
+static PyObject *
+__pyx_FusedFunction_descr_get(PyObject *self, PyObject *obj, PyObject *type)
+{
+    __pyx_FusedFunctionObject *func, *meth;
+    func = (__pyx_FusedFunctionObject *) self;
+    if (func->self || func->func.flags & __Pyx_CYFUNCTION_STATICMETHOD) {
+        Py_INCREF(self);
+        return self;
+    }
+    if (obj == Py_None)
+        obj = NULL;
+    meth = (__pyx_FusedFunctionObject *) __pyx_FusedFunction_NewEx(
+                    ((PyCFunctionObject *) func)->m_ml,
+                    ((__pyx_CyFunctionObject *) func)->flags,
+                    ((__pyx_CyFunctionObject *) func)->func_qualname,
+                    ((__pyx_CyFunctionObject *) func)->func_closure,
+                    ((PyCFunctionObject *) func)->m_module,
+                    ((__pyx_CyFunctionObject *) func)->func_globals,
+                    ((__pyx_CyFunctionObject *) func)->func_code);
+    if (!meth)
+        return NULL;
+    Py_XINCREF(func->func.func_classobj);
+    meth->func.func_classobj = func->func.func_classobj;
+    Py_XINCREF(func->__signatures__);
+    meth->__signatures__ = func->__signatures__;
+    Py_XINCREF(type);
+    meth->type = type;
+    Py_XINCREF(func->func.defaults_tuple);
+    meth->func.defaults_tuple = func->func.defaults_tuple;
+    if (func->func.flags & __Pyx_CYFUNCTION_CLASSMETHOD)
+        obj = type;
+    Py_XINCREF(obj);
+    meth->self = obj;
+    return (PyObject *) meth;
+}
+static PyObject *
+_obj_to_str(PyObject *obj)
+{
+    if (PyType_Check(obj))
+        return PyObject_GetAttr(obj, __pyx_n_s_name_2);
+    else
+        return PyObject_Str(obj);
+}
+static PyObject *
+__pyx_FusedFunction_getitem(__pyx_FusedFunctionObject *self, PyObject *idx)
+{
+    PyObject *signature = NULL;
+    PyObject *unbound_result_func;
+    PyObject *result_func = NULL;
+    if (self->__signatures__ == NULL) {
+        PyErr_SetString(PyExc_TypeError, "Function is not fused");
+        return NULL;
+    }
+    if (PyTuple_Check(idx)) {
+        PyObject *list = PyList_New(0);
+        Py_ssize_t n = PyTuple_GET_SIZE(idx);
+        PyObject *string = NULL;
+        PyObject *sep = NULL;
+        int i;
+        if (!list)
+            return NULL;
+        for (i = 0; i < n; i++) {
+#if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+            PyObject *item = PyTuple_GET_ITEM(idx, i);
 #else
-    object_reduce_ex = __Pyx_PyObject_GetAttrStr((PyObject*)&PyBaseObject_Type, __pyx_n_s_reduce_ex); if (!object_reduce_ex) goto BAD;
+            PyObject *item = PySequence_ITEM(idx, i);
 #endif
-    reduce_ex = __Pyx_PyObject_GetAttrStr(type_obj, __pyx_n_s_reduce_ex); if (unlikely(!reduce_ex)) goto BAD;
-    if (reduce_ex == object_reduce_ex) {
-#if CYTHON_USE_PYTYPE_LOOKUP
-        object_reduce = _PyType_Lookup(&PyBaseObject_Type, __pyx_n_s_reduce); if (!object_reduce) goto BAD;
-#else
-        object_reduce = __Pyx_PyObject_GetAttrStr((PyObject*)&PyBaseObject_Type, __pyx_n_s_reduce); if (!object_reduce) goto BAD;
+            string = _obj_to_str(item);
+#if !(CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS)
+            Py_DECREF(item);
 #endif
-        reduce = __Pyx_PyObject_GetAttrStr(type_obj, __pyx_n_s_reduce); if (unlikely(!reduce)) goto BAD;
-        if (reduce == object_reduce || __Pyx_setup_reduce_is_named(reduce, __pyx_n_s_reduce_cython)) {
-            reduce_cython = __Pyx_PyObject_GetAttrStr(type_obj, __pyx_n_s_reduce_cython); if (unlikely(!reduce_cython)) goto BAD;
-            ret = PyDict_SetItem(((PyTypeObject*)type_obj)->tp_dict, __pyx_n_s_reduce, reduce_cython); if (unlikely(ret < 0)) goto BAD;
-            ret = PyDict_DelItem(((PyTypeObject*)type_obj)->tp_dict, __pyx_n_s_reduce_cython); if (unlikely(ret < 0)) goto BAD;
-            setstate = __Pyx_PyObject_GetAttrStr(type_obj, __pyx_n_s_setstate);
-            if (!setstate) PyErr_Clear();
-            if (!setstate || __Pyx_setup_reduce_is_named(setstate, __pyx_n_s_setstate_cython)) {
-                setstate_cython = __Pyx_PyObject_GetAttrStr(type_obj, __pyx_n_s_setstate_cython); if (unlikely(!setstate_cython)) goto BAD;
-                ret = PyDict_SetItem(((PyTypeObject*)type_obj)->tp_dict, __pyx_n_s_setstate, setstate_cython); if (unlikely(ret < 0)) goto BAD;
-                ret = PyDict_DelItem(((PyTypeObject*)type_obj)->tp_dict, __pyx_n_s_setstate_cython); if (unlikely(ret < 0)) goto BAD;
-            }
-            PyType_Modified((PyTypeObject*)type_obj);
+            if (!string || PyList_Append(list, string) < 0)
+                goto __pyx_err;
+            Py_DECREF(string);
+        }
+        sep = PyUnicode_FromString("|");
+        if (sep)
+            signature = PyUnicode_Join(sep, list);
+__pyx_err:
+;
+        Py_DECREF(list);
+        Py_XDECREF(sep);
+    } else {
+        signature = _obj_to_str(idx);
+    }
+    if (!signature)
+        return NULL;
+    unbound_result_func = PyObject_GetItem(self->__signatures__, signature);
+    if (unbound_result_func) {
+        if (self->self || self->type) {
+            __pyx_FusedFunctionObject *unbound = (__pyx_FusedFunctionObject *) unbound_result_func;
+            Py_CLEAR(unbound->func.func_classobj);
+            Py_XINCREF(self->func.func_classobj);
+            unbound->func.func_classobj = self->func.func_classobj;
+            result_func = __pyx_FusedFunction_descr_get(unbound_result_func,
+                                                        self->self, self->type);
+        } else {
+            result_func = unbound_result_func;
+            Py_INCREF(result_func);
         }
     }
-    goto GOOD;
-BAD:
-    if (!PyErr_Occurred())
-        PyErr_Format(PyExc_RuntimeError, "Unable to initialize pickling for %s", ((PyTypeObject*)type_obj)->tp_name);
-    ret = -1;
-GOOD:
-#if !CYTHON_USE_PYTYPE_LOOKUP
-    Py_XDECREF(object_reduce);
-    Py_XDECREF(object_reduce_ex);
-#endif
-    Py_XDECREF(reduce);
-    Py_XDECREF(reduce_ex);
-    Py_XDECREF(reduce_cython);
-    Py_XDECREF(setstate);
-    Py_XDECREF(setstate_cython);
-    return ret;
+    Py_DECREF(signature);
+    Py_XDECREF(unbound_result_func);
+    return result_func;
 }
-
-/* TypeImport */
-  #ifndef __PYX_HAVE_RT_ImportType
-#define __PYX_HAVE_RT_ImportType
-static PyTypeObject *__Pyx_ImportType(PyObject *module, const char *module_name, const char *class_name,
-    size_t size, enum __Pyx_ImportType_CheckSize check_size)
+static PyObject *
+__pyx_FusedFunction_callfunction(PyObject *func, PyObject *args, PyObject *kw)
 {
-    PyObject *result = 0;
-    char warning[200];
-    Py_ssize_t basicsize;
-#ifdef Py_LIMITED_API
-    PyObject *py_basicsize;
-#endif
-    result = PyObject_GetAttrString(module, class_name);
-    if (!result)
-        goto bad;
-    if (!PyType_Check(result)) {
-        PyErr_Format(PyExc_TypeError,
-            "%.200s.%.200s is not a type object",
-            module_name, class_name);
-        goto bad;
+     __pyx_CyFunctionObject *cyfunc = (__pyx_CyFunctionObject *) func;
+    int static_specialized = (cyfunc->flags & __Pyx_CYFUNCTION_STATICMETHOD &&
+                              !((__pyx_FusedFunctionObject *) func)->__signatures__);
+    if (cyfunc->flags & __Pyx_CYFUNCTION_CCLASS && !static_specialized) {
+        return __Pyx_CyFunction_CallAsMethod(func, args, kw);
+    } else {
+        return __Pyx_CyFunction_Call(func, args, kw);
     }
-#ifndef Py_LIMITED_API
-    basicsize = ((PyTypeObject *)result)->tp_basicsize;
+}
+static PyObject *
+__pyx_FusedFunction_call(PyObject *func, PyObject *args, PyObject *kw)
+{
+    __pyx_FusedFunctionObject *binding_func = (__pyx_FusedFunctionObject *) func;
+    Py_ssize_t argc = PyTuple_GET_SIZE(args);
+    PyObject *new_args = NULL;
+    __pyx_FusedFunctionObject *new_func = NULL;
+    PyObject *result = NULL;
+    PyObject *self = NULL;
+    int is_staticmethod = binding_func->func.flags & __Pyx_CYFUNCTION_STATICMETHOD;
+    int is_classmethod = binding_func->func.flags & __Pyx_CYFUNCTION_CLASSMETHOD;
+    if (binding_func->self) {
+        Py_ssize_t i;
+        new_args = PyTuple_New(argc + 1);
+        if (!new_args)
+            return NULL;
+        self = binding_func->self;
+#if !(CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS)
+        Py_INCREF(self);
+#endif
+        Py_INCREF(self);
+        PyTuple_SET_ITEM(new_args, 0, self);
+        for (i = 0; i < argc; i++) {
+#if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+            PyObject *item = PyTuple_GET_ITEM(args, i);
+            Py_INCREF(item);
 #else
-    py_basicsize = PyObject_GetAttrString(result, "__basicsize__");
-    if (!py_basicsize)
-        goto bad;
-    basicsize = PyLong_AsSsize_t(py_basicsize);
-    Py_DECREF(py_basicsize);
-    py_basicsize = 0;
-    if (basicsize == (Py_ssize_t)-1 && PyErr_Occurred())
-        goto bad;
+            PyObject *item = PySequence_ITEM(args, i);  if (unlikely(!item)) goto bad;
+#endif
+            PyTuple_SET_ITEM(new_args, i + 1, item);
+        }
+        args = new_args;
+    } else if (binding_func->type) {
+        if (argc < 1) {
+            PyErr_SetString(PyExc_TypeError, "Need at least one argument, 0 given.");
+            return NULL;
+        }
+#if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+        self = PyTuple_GET_ITEM(args, 0);
+#else
+        self = PySequence_ITEM(args, 0);  if (unlikely(!self)) return NULL;
 #endif
-    if ((size_t)basicsize < size) {
-        PyErr_Format(PyExc_ValueError,
-            "%.200s.%.200s size changed, may indicate binary incompatibility. "
-            "Expected %zd from C header, got %zd from PyObject",
-            module_name, class_name, size, basicsize);
-        goto bad;
     }
-    if (check_size == __Pyx_ImportType_CheckSize_Error && (size_t)basicsize != size) {
-        PyErr_Format(PyExc_ValueError,
-            "%.200s.%.200s size changed, may indicate binary incompatibility. "
-            "Expected %zd from C header, got %zd from PyObject",
-            module_name, class_name, size, basicsize);
-        goto bad;
+    if (self && !is_classmethod && !is_staticmethod) {
+        int is_instance = PyObject_IsInstance(self, binding_func->type);
+        if (unlikely(!is_instance)) {
+            PyErr_Format(PyExc_TypeError,
+                         "First argument should be of type %.200s, got %.200s.",
+                         ((PyTypeObject *) binding_func->type)->tp_name,
+                         self->ob_type->tp_name);
+            goto bad;
+        } else if (unlikely(is_instance == -1)) {
+            goto bad;
+        }
     }
-    else if (check_size == __Pyx_ImportType_CheckSize_Warn && (size_t)basicsize > size) {
-        PyOS_snprintf(warning, sizeof(warning),
-            "%s.%s size changed, may indicate binary incompatibility. "
-            "Expected %zd from C header, got %zd from PyObject",
-            module_name, class_name, size, basicsize);
-        if (PyErr_WarnEx(NULL, warning, 0) < 0) goto bad;
+#if !(CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS)
+    Py_XDECREF(self);
+    self = NULL;
+#endif
+    if (binding_func->__signatures__) {
+        PyObject *tup;
+        if (is_staticmethod && binding_func->func.flags & __Pyx_CYFUNCTION_CCLASS) {
+            tup = PyTuple_Pack(3, args,
+                               kw == NULL ? Py_None : kw,
+                               binding_func->func.defaults_tuple);
+            if (unlikely(!tup)) goto bad;
+            new_func = (__pyx_FusedFunctionObject *) __Pyx_CyFunction_CallMethod(
+                func, binding_func->__signatures__, tup, NULL);
+        } else {
+            tup = PyTuple_Pack(4, binding_func->__signatures__, args,
+                               kw == NULL ? Py_None : kw,
+                               binding_func->func.defaults_tuple);
+            if (unlikely(!tup)) goto bad;
+            new_func = (__pyx_FusedFunctionObject *) __pyx_FusedFunction_callfunction(func, tup, NULL);
+        }
+        Py_DECREF(tup);
+        if (unlikely(!new_func))
+            goto bad;
+        Py_XINCREF(binding_func->func.func_classobj);
+        Py_CLEAR(new_func->func.func_classobj);
+        new_func->func.func_classobj = binding_func->func.func_classobj;
+        func = (PyObject *) new_func;
     }
-    return (PyTypeObject *)result;
+    result = __pyx_FusedFunction_callfunction(func, args, kw);
 bad:
-    Py_XDECREF(result);
-    return NULL;
+#if !(CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS)
+    Py_XDECREF(self);
+#endif
+    Py_XDECREF(new_args);
+    Py_XDECREF((PyObject *) new_func);
+    return result;
 }
+static PyMemberDef __pyx_FusedFunction_members[] = {
+    {(char *) "__signatures__",
+     T_OBJECT,
+     offsetof(__pyx_FusedFunctionObject, __signatures__),
+     READONLY,
+     0},
+    {0, 0, 0, 0, 0},
+};
+static PyMappingMethods __pyx_FusedFunction_mapping_methods = {
+    0,
+    (binaryfunc) __pyx_FusedFunction_getitem,
+    0,
+};
+static PyTypeObject __pyx_FusedFunctionType_type = {
+    PyVarObject_HEAD_INIT(0, 0)
+    "fused_cython_function",
+    sizeof(__pyx_FusedFunctionObject),
+    0,
+    (destructor) __pyx_FusedFunction_dealloc,
+    0,
+    0,
+    0,
+#if PY_MAJOR_VERSION < 3
+    0,
+#else
+    0,
+#endif
+    0,
+    0,
+    0,
+    &__pyx_FusedFunction_mapping_methods,
+    0,
+    (ternaryfunc) __pyx_FusedFunction_call,
+    0,
+    0,
+    0,
+    0,
+    Py_TPFLAGS_DEFAULT | Py_TPFLAGS_HAVE_GC | Py_TPFLAGS_BASETYPE,
+    0,
+    (traverseproc) __pyx_FusedFunction_traverse,
+    (inquiry) __pyx_FusedFunction_clear,
+    0,
+    0,
+    0,
+    0,
+    0,
+    __pyx_FusedFunction_members,
+    __pyx_CyFunction_getsets,
+    &__pyx_CyFunctionType_type,
+    0,
+    __pyx_FusedFunction_descr_get,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+#if PY_VERSION_HEX >= 0x030400a1
+    0,
 #endif
+};
+static int __pyx_FusedFunction_init(void) {
+    __pyx_FusedFunctionType = __Pyx_FetchCommonType(&__pyx_FusedFunctionType_type);
+    if (__pyx_FusedFunctionType == NULL) {
+        return -1;
+    }
+    return 0;
+}
 
 /* CLineInTraceback */
   #ifndef CYTHON_CLINE_IN_TRACEBACK
@@ -25247,78 +35852,347 @@ static void __Pyx_ReleaseBuffer(Py_buffer *view) {
     view->obj = NULL;
     Py_DECREF(obj);
 }
-#endif
-
+#endif
+
+
+  /* MemviewSliceIsContig */
+  static int
+__pyx_memviewslice_is_contig(const __Pyx_memviewslice mvs, char order, int ndim)
+{
+    int i, index, step, start;
+    Py_ssize_t itemsize = mvs.memview->view.itemsize;
+    if (order == 'F') {
+        step = 1;
+        start = 0;
+    } else {
+        step = -1;
+        start = ndim - 1;
+    }
+    for (i = 0; i < ndim; i++) {
+        index = start + step * i;
+        if (mvs.suboffsets[index] >= 0 || mvs.strides[index] != itemsize)
+            return 0;
+        itemsize *= mvs.shape[index];
+    }
+    return 1;
+}
+
+/* OverlappingSlices */
+  static void
+__pyx_get_array_memory_extents(__Pyx_memviewslice *slice,
+                               void **out_start, void **out_end,
+                               int ndim, size_t itemsize)
+{
+    char *start, *end;
+    int i;
+    start = end = slice->data;
+    for (i = 0; i < ndim; i++) {
+        Py_ssize_t stride = slice->strides[i];
+        Py_ssize_t extent = slice->shape[i];
+        if (extent == 0) {
+            *out_start = *out_end = start;
+            return;
+        } else {
+            if (stride > 0)
+                end += stride * (extent - 1);
+            else
+                start += stride * (extent - 1);
+        }
+    }
+    *out_start = start;
+    *out_end = end + itemsize;
+}
+static int
+__pyx_slices_overlap(__Pyx_memviewslice *slice1,
+                     __Pyx_memviewslice *slice2,
+                     int ndim, size_t itemsize)
+{
+    void *start1, *end1, *start2, *end2;
+    __pyx_get_array_memory_extents(slice1, &start1, &end1, ndim, itemsize);
+    __pyx_get_array_memory_extents(slice2, &start2, &end2, ndim, itemsize);
+    return (start1 < end2) && (start2 < end1);
+}
+
+/* Capsule */
+  static CYTHON_INLINE PyObject *
+__pyx_capsule_create(void *p, CYTHON_UNUSED const char *sig)
+{
+    PyObject *cobj;
+#if PY_VERSION_HEX >= 0x02070000
+    cobj = PyCapsule_New(p, sig, NULL);
+#else
+    cobj = PyCObject_FromVoidPtr(p, NULL);
+#endif
+    return cobj;
+}
+
+/* TypeInfoCompare */
+  static int
+__pyx_typeinfo_cmp(__Pyx_TypeInfo *a, __Pyx_TypeInfo *b)
+{
+    int i;
+    if (!a || !b)
+        return 0;
+    if (a == b)
+        return 1;
+    if (a->size != b->size || a->typegroup != b->typegroup ||
+            a->is_unsigned != b->is_unsigned || a->ndim != b->ndim) {
+        if (a->typegroup == 'H' || b->typegroup == 'H') {
+            return a->size == b->size;
+        } else {
+            return 0;
+        }
+    }
+    if (a->ndim) {
+        for (i = 0; i < a->ndim; i++)
+            if (a->arraysize[i] != b->arraysize[i])
+                return 0;
+    }
+    if (a->typegroup == 'S') {
+        if (a->flags != b->flags)
+            return 0;
+        if (a->fields || b->fields) {
+            if (!(a->fields && b->fields))
+                return 0;
+            for (i = 0; a->fields[i].type && b->fields[i].type; i++) {
+                __Pyx_StructField *field_a = a->fields + i;
+                __Pyx_StructField *field_b = b->fields + i;
+                if (field_a->offset != field_b->offset ||
+                    !__pyx_typeinfo_cmp(field_a->type, field_b->type))
+                    return 0;
+            }
+            return !a->fields[i].type && !b->fields[i].type;
+        }
+    }
+    return 1;
+}
 
-  /* MemviewSliceIsContig */
+/* MemviewSliceValidateAndInit */
   static int
-__pyx_memviewslice_is_contig(const __Pyx_memviewslice mvs, char order, int ndim)
+__pyx_check_strides(Py_buffer *buf, int dim, int ndim, int spec)
 {
-    int i, index, step, start;
-    Py_ssize_t itemsize = mvs.memview->view.itemsize;
-    if (order == 'F') {
-        step = 1;
-        start = 0;
+    if (buf->shape[dim] <= 1)
+        return 1;
+    if (buf->strides) {
+        if (spec & __Pyx_MEMVIEW_CONTIG) {
+            if (spec & (__Pyx_MEMVIEW_PTR|__Pyx_MEMVIEW_FULL)) {
+                if (buf->strides[dim] != sizeof(void *)) {
+                    PyErr_Format(PyExc_ValueError,
+                                 "Buffer is not indirectly contiguous "
+                                 "in dimension %d.", dim);
+                    goto fail;
+                }
+            } else if (buf->strides[dim] != buf->itemsize) {
+                PyErr_SetString(PyExc_ValueError,
+                                "Buffer and memoryview are not contiguous "
+                                "in the same dimension.");
+                goto fail;
+            }
+        }
+        if (spec & __Pyx_MEMVIEW_FOLLOW) {
+            Py_ssize_t stride = buf->strides[dim];
+            if (stride < 0)
+                stride = -stride;
+            if (stride < buf->itemsize) {
+                PyErr_SetString(PyExc_ValueError,
+                                "Buffer and memoryview are not contiguous "
+                                "in the same dimension.");
+                goto fail;
+            }
+        }
     } else {
-        step = -1;
-        start = ndim - 1;
+        if (spec & __Pyx_MEMVIEW_CONTIG && dim != ndim - 1) {
+            PyErr_Format(PyExc_ValueError,
+                         "C-contiguous buffer is not contiguous in "
+                         "dimension %d", dim);
+            goto fail;
+        } else if (spec & (__Pyx_MEMVIEW_PTR)) {
+            PyErr_Format(PyExc_ValueError,
+                         "C-contiguous buffer is not indirect in "
+                         "dimension %d", dim);
+            goto fail;
+        } else if (buf->suboffsets) {
+            PyErr_SetString(PyExc_ValueError,
+                            "Buffer exposes suboffsets but no strides");
+            goto fail;
+        }
     }
-    for (i = 0; i < ndim; i++) {
-        index = start + step * i;
-        if (mvs.suboffsets[index] >= 0 || mvs.strides[index] != itemsize)
-            return 0;
-        itemsize *= mvs.shape[index];
+    return 1;
+fail:
+    return 0;
+}
+static int
+__pyx_check_suboffsets(Py_buffer *buf, int dim, CYTHON_UNUSED int ndim, int spec)
+{
+    if (spec & __Pyx_MEMVIEW_DIRECT) {
+        if (buf->suboffsets && buf->suboffsets[dim] >= 0) {
+            PyErr_Format(PyExc_ValueError,
+                         "Buffer not compatible with direct access "
+                         "in dimension %d.", dim);
+            goto fail;
+        }
+    }
+    if (spec & __Pyx_MEMVIEW_PTR) {
+        if (!buf->suboffsets || (buf->suboffsets && buf->suboffsets[dim] < 0)) {
+            PyErr_Format(PyExc_ValueError,
+                         "Buffer is not indirectly accessible "
+                         "in dimension %d.", dim);
+            goto fail;
+        }
     }
     return 1;
+fail:
+    return 0;
 }
-
-/* OverlappingSlices */
-  static void
-__pyx_get_array_memory_extents(__Pyx_memviewslice *slice,
-                               void **out_start, void **out_end,
-                               int ndim, size_t itemsize)
+static int
+__pyx_verify_contig(Py_buffer *buf, int ndim, int c_or_f_flag)
 {
-    char *start, *end;
     int i;
-    start = end = slice->data;
-    for (i = 0; i < ndim; i++) {
-        Py_ssize_t stride = slice->strides[i];
-        Py_ssize_t extent = slice->shape[i];
-        if (extent == 0) {
-            *out_start = *out_end = start;
-            return;
-        } else {
-            if (stride > 0)
-                end += stride * (extent - 1);
-            else
-                start += stride * (extent - 1);
+    if (c_or_f_flag & __Pyx_IS_F_CONTIG) {
+        Py_ssize_t stride = 1;
+        for (i = 0; i < ndim; i++) {
+            if (stride * buf->itemsize != buf->strides[i] &&
+                    buf->shape[i] > 1)
+            {
+                PyErr_SetString(PyExc_ValueError,
+                    "Buffer not fortran contiguous.");
+                goto fail;
+            }
+            stride = stride * buf->shape[i];
+        }
+    } else if (c_or_f_flag & __Pyx_IS_C_CONTIG) {
+        Py_ssize_t stride = 1;
+        for (i = ndim - 1; i >- 1; i--) {
+            if (stride * buf->itemsize != buf->strides[i] &&
+                    buf->shape[i] > 1) {
+                PyErr_SetString(PyExc_ValueError,
+                    "Buffer not C contiguous.");
+                goto fail;
+            }
+            stride = stride * buf->shape[i];
         }
     }
-    *out_start = start;
-    *out_end = end + itemsize;
+    return 1;
+fail:
+    return 0;
 }
-static int
-__pyx_slices_overlap(__Pyx_memviewslice *slice1,
-                     __Pyx_memviewslice *slice2,
-                     int ndim, size_t itemsize)
+static int __Pyx_ValidateAndInit_memviewslice(
+                int *axes_specs,
+                int c_or_f_flag,
+                int buf_flags,
+                int ndim,
+                __Pyx_TypeInfo *dtype,
+                __Pyx_BufFmt_StackElem stack[],
+                __Pyx_memviewslice *memviewslice,
+                PyObject *original_obj)
 {
-    void *start1, *end1, *start2, *end2;
-    __pyx_get_array_memory_extents(slice1, &start1, &end1, ndim, itemsize);
-    __pyx_get_array_memory_extents(slice2, &start2, &end2, ndim, itemsize);
-    return (start1 < end2) && (start2 < end1);
+    struct __pyx_memoryview_obj *memview, *new_memview;
+    __Pyx_RefNannyDeclarations
+    Py_buffer *buf;
+    int i, spec = 0, retval = -1;
+    __Pyx_BufFmt_Context ctx;
+    int from_memoryview = __pyx_memoryview_check(original_obj);
+    __Pyx_RefNannySetupContext("ValidateAndInit_memviewslice", 0);
+    if (from_memoryview && __pyx_typeinfo_cmp(dtype, ((struct __pyx_memoryview_obj *)
+                                                            original_obj)->typeinfo)) {
+        memview = (struct __pyx_memoryview_obj *) original_obj;
+        new_memview = NULL;
+    } else {
+        memview = (struct __pyx_memoryview_obj *) __pyx_memoryview_new(
+                                            original_obj, buf_flags, 0, dtype);
+        new_memview = memview;
+        if (unlikely(!memview))
+            goto fail;
+    }
+    buf = &memview->view;
+    if (buf->ndim != ndim) {
+        PyErr_Format(PyExc_ValueError,
+                "Buffer has wrong number of dimensions (expected %d, got %d)",
+                ndim, buf->ndim);
+        goto fail;
+    }
+    if (new_memview) {
+        __Pyx_BufFmt_Init(&ctx, stack, dtype);
+        if (!__Pyx_BufFmt_CheckString(&ctx, buf->format)) goto fail;
+    }
+    if ((unsigned) buf->itemsize != dtype->size) {
+        PyErr_Format(PyExc_ValueError,
+                     "Item size of buffer (%" CYTHON_FORMAT_SSIZE_T "u byte%s) "
+                     "does not match size of '%s' (%" CYTHON_FORMAT_SSIZE_T "u byte%s)",
+                     buf->itemsize,
+                     (buf->itemsize > 1) ? "s" : "",
+                     dtype->name,
+                     dtype->size,
+                     (dtype->size > 1) ? "s" : "");
+        goto fail;
+    }
+    for (i = 0; i < ndim; i++) {
+        spec = axes_specs[i];
+        if (!__pyx_check_strides(buf, i, ndim, spec))
+            goto fail;
+        if (!__pyx_check_suboffsets(buf, i, ndim, spec))
+            goto fail;
+    }
+    if (buf->strides && !__pyx_verify_contig(buf, ndim, c_or_f_flag))
+        goto fail;
+    if (unlikely(__Pyx_init_memviewslice(memview, ndim, memviewslice,
+                                         new_memview != NULL) == -1)) {
+        goto fail;
+    }
+    retval = 0;
+    goto no_fail;
+fail:
+    Py_XDECREF(new_memview);
+    retval = -1;
+no_fail:
+    __Pyx_RefNannyFinishContext();
+    return retval;
 }
 
-/* Capsule */
-  static CYTHON_INLINE PyObject *
-__pyx_capsule_create(void *p, CYTHON_UNUSED const char *sig)
-{
-    PyObject *cobj;
-#if PY_VERSION_HEX >= 0x02070000
-    cobj = PyCapsule_New(p, sig, NULL);
-#else
-    cobj = PyCObject_FromVoidPtr(p, NULL);
-#endif
-    return cobj;
+/* ObjectToMemviewSlice */
+  static CYTHON_INLINE __Pyx_memviewslice __Pyx_PyObject_to_MemoryviewSlice_d_dc_float(PyObject *obj, int writable_flag) {
+    __Pyx_memviewslice result = { 0, 0, { 0 }, { 0 }, { 0 } };
+    __Pyx_BufFmt_StackElem stack[1];
+    int axes_specs[] = { (__Pyx_MEMVIEW_DIRECT | __Pyx_MEMVIEW_FOLLOW), (__Pyx_MEMVIEW_DIRECT | __Pyx_MEMVIEW_CONTIG) };
+    int retcode;
+    if (obj == Py_None) {
+        result.memview = (struct __pyx_memoryview_obj *) Py_None;
+        return result;
+    }
+    retcode = __Pyx_ValidateAndInit_memviewslice(axes_specs, __Pyx_IS_C_CONTIG,
+                                                 (PyBUF_C_CONTIGUOUS | PyBUF_FORMAT) | writable_flag, 2,
+                                                 &__Pyx_TypeInfo_float, stack,
+                                                 &result, obj);
+    if (unlikely(retcode == -1))
+        goto __pyx_fail;
+    return result;
+__pyx_fail:
+    result.memview = NULL;
+    result.data = NULL;
+    return result;
+}
+
+/* ObjectToMemviewSlice */
+  static CYTHON_INLINE __Pyx_memviewslice __Pyx_PyObject_to_MemoryviewSlice_d_dc_double(PyObject *obj, int writable_flag) {
+    __Pyx_memviewslice result = { 0, 0, { 0 }, { 0 }, { 0 } };
+    __Pyx_BufFmt_StackElem stack[1];
+    int axes_specs[] = { (__Pyx_MEMVIEW_DIRECT | __Pyx_MEMVIEW_FOLLOW), (__Pyx_MEMVIEW_DIRECT | __Pyx_MEMVIEW_CONTIG) };
+    int retcode;
+    if (obj == Py_None) {
+        result.memview = (struct __pyx_memoryview_obj *) Py_None;
+        return result;
+    }
+    retcode = __Pyx_ValidateAndInit_memviewslice(axes_specs, __Pyx_IS_C_CONTIG,
+                                                 (PyBUF_C_CONTIGUOUS | PyBUF_FORMAT) | writable_flag, 2,
+                                                 &__Pyx_TypeInfo_double, stack,
+                                                 &result, obj);
+    if (unlikely(retcode == -1))
+        goto __pyx_fail;
+    return result;
+__pyx_fail:
+    result.memview = NULL;
+    result.data = NULL;
+    return result;
 }
 
 /* CIntFromPyVerify */
@@ -26014,6 +36888,39 @@ raise_neg_overflow:
     return (int) -1;
 }
 
+/* BytesContains */
+  static CYTHON_INLINE int __Pyx_BytesContains(PyObject* bytes, char character) {
+    const Py_ssize_t length = PyBytes_GET_SIZE(bytes);
+    char* char_start = PyBytes_AS_STRING(bytes);
+    return memchr(char_start, (unsigned char)character, (size_t)length) != NULL;
+}
+
+/* ImportNumPyArray */
+  static PyObject* __Pyx__ImportNumPyArray(void) {
+    PyObject *numpy_module, *ndarray_object = NULL;
+    numpy_module = __Pyx_Import(__pyx_n_s_numpy, NULL, 0);
+    if (likely(numpy_module)) {
+        ndarray_object = PyObject_GetAttrString(numpy_module, "ndarray");
+        Py_DECREF(numpy_module);
+    }
+    if (unlikely(!ndarray_object)) {
+        PyErr_Clear();
+    }
+    if (unlikely(!ndarray_object || !PyObject_TypeCheck(ndarray_object, &PyType_Type))) {
+        Py_XDECREF(ndarray_object);
+        Py_INCREF(Py_None);
+        ndarray_object = Py_None;
+    }
+    return ndarray_object;
+}
+static CYTHON_INLINE PyObject* __Pyx_ImportNumPyArrayTypeIfAvailable(void) {
+    if (unlikely(!__pyx_numpy_ndarray)) {
+        __pyx_numpy_ndarray = __Pyx__ImportNumPyArray();
+    }
+    Py_INCREF(__pyx_numpy_ndarray);
+    return __pyx_numpy_ndarray;
+}
+
 /* CIntFromPy */
   static CYTHON_INLINE long __Pyx_PyInt_As_long(PyObject *x) {
     const long neg_one = (long) ((long) 0 - (long) 1), const_zero = (long) 0;
@@ -26392,229 +37299,6 @@ raise_neg_overflow:
     return (char) -1;
 }
 
-/* TypeInfoCompare */
-  static int
-__pyx_typeinfo_cmp(__Pyx_TypeInfo *a, __Pyx_TypeInfo *b)
-{
-    int i;
-    if (!a || !b)
-        return 0;
-    if (a == b)
-        return 1;
-    if (a->size != b->size || a->typegroup != b->typegroup ||
-            a->is_unsigned != b->is_unsigned || a->ndim != b->ndim) {
-        if (a->typegroup == 'H' || b->typegroup == 'H') {
-            return a->size == b->size;
-        } else {
-            return 0;
-        }
-    }
-    if (a->ndim) {
-        for (i = 0; i < a->ndim; i++)
-            if (a->arraysize[i] != b->arraysize[i])
-                return 0;
-    }
-    if (a->typegroup == 'S') {
-        if (a->flags != b->flags)
-            return 0;
-        if (a->fields || b->fields) {
-            if (!(a->fields && b->fields))
-                return 0;
-            for (i = 0; a->fields[i].type && b->fields[i].type; i++) {
-                __Pyx_StructField *field_a = a->fields + i;
-                __Pyx_StructField *field_b = b->fields + i;
-                if (field_a->offset != field_b->offset ||
-                    !__pyx_typeinfo_cmp(field_a->type, field_b->type))
-                    return 0;
-            }
-            return !a->fields[i].type && !b->fields[i].type;
-        }
-    }
-    return 1;
-}
-
-/* MemviewSliceValidateAndInit */
-  static int
-__pyx_check_strides(Py_buffer *buf, int dim, int ndim, int spec)
-{
-    if (buf->shape[dim] <= 1)
-        return 1;
-    if (buf->strides) {
-        if (spec & __Pyx_MEMVIEW_CONTIG) {
-            if (spec & (__Pyx_MEMVIEW_PTR|__Pyx_MEMVIEW_FULL)) {
-                if (buf->strides[dim] != sizeof(void *)) {
-                    PyErr_Format(PyExc_ValueError,
-                                 "Buffer is not indirectly contiguous "
-                                 "in dimension %d.", dim);
-                    goto fail;
-                }
-            } else if (buf->strides[dim] != buf->itemsize) {
-                PyErr_SetString(PyExc_ValueError,
-                                "Buffer and memoryview are not contiguous "
-                                "in the same dimension.");
-                goto fail;
-            }
-        }
-        if (spec & __Pyx_MEMVIEW_FOLLOW) {
-            Py_ssize_t stride = buf->strides[dim];
-            if (stride < 0)
-                stride = -stride;
-            if (stride < buf->itemsize) {
-                PyErr_SetString(PyExc_ValueError,
-                                "Buffer and memoryview are not contiguous "
-                                "in the same dimension.");
-                goto fail;
-            }
-        }
-    } else {
-        if (spec & __Pyx_MEMVIEW_CONTIG && dim != ndim - 1) {
-            PyErr_Format(PyExc_ValueError,
-                         "C-contiguous buffer is not contiguous in "
-                         "dimension %d", dim);
-            goto fail;
-        } else if (spec & (__Pyx_MEMVIEW_PTR)) {
-            PyErr_Format(PyExc_ValueError,
-                         "C-contiguous buffer is not indirect in "
-                         "dimension %d", dim);
-            goto fail;
-        } else if (buf->suboffsets) {
-            PyErr_SetString(PyExc_ValueError,
-                            "Buffer exposes suboffsets but no strides");
-            goto fail;
-        }
-    }
-    return 1;
-fail:
-    return 0;
-}
-static int
-__pyx_check_suboffsets(Py_buffer *buf, int dim, CYTHON_UNUSED int ndim, int spec)
-{
-    if (spec & __Pyx_MEMVIEW_DIRECT) {
-        if (buf->suboffsets && buf->suboffsets[dim] >= 0) {
-            PyErr_Format(PyExc_ValueError,
-                         "Buffer not compatible with direct access "
-                         "in dimension %d.", dim);
-            goto fail;
-        }
-    }
-    if (spec & __Pyx_MEMVIEW_PTR) {
-        if (!buf->suboffsets || (buf->suboffsets && buf->suboffsets[dim] < 0)) {
-            PyErr_Format(PyExc_ValueError,
-                         "Buffer is not indirectly accessible "
-                         "in dimension %d.", dim);
-            goto fail;
-        }
-    }
-    return 1;
-fail:
-    return 0;
-}
-static int
-__pyx_verify_contig(Py_buffer *buf, int ndim, int c_or_f_flag)
-{
-    int i;
-    if (c_or_f_flag & __Pyx_IS_F_CONTIG) {
-        Py_ssize_t stride = 1;
-        for (i = 0; i < ndim; i++) {
-            if (stride * buf->itemsize != buf->strides[i] &&
-                    buf->shape[i] > 1)
-            {
-                PyErr_SetString(PyExc_ValueError,
-                    "Buffer not fortran contiguous.");
-                goto fail;
-            }
-            stride = stride * buf->shape[i];
-        }
-    } else if (c_or_f_flag & __Pyx_IS_C_CONTIG) {
-        Py_ssize_t stride = 1;
-        for (i = ndim - 1; i >- 1; i--) {
-            if (stride * buf->itemsize != buf->strides[i] &&
-                    buf->shape[i] > 1) {
-                PyErr_SetString(PyExc_ValueError,
-                    "Buffer not C contiguous.");
-                goto fail;
-            }
-            stride = stride * buf->shape[i];
-        }
-    }
-    return 1;
-fail:
-    return 0;
-}
-static int __Pyx_ValidateAndInit_memviewslice(
-                int *axes_specs,
-                int c_or_f_flag,
-                int buf_flags,
-                int ndim,
-                __Pyx_TypeInfo *dtype,
-                __Pyx_BufFmt_StackElem stack[],
-                __Pyx_memviewslice *memviewslice,
-                PyObject *original_obj)
-{
-    struct __pyx_memoryview_obj *memview, *new_memview;
-    __Pyx_RefNannyDeclarations
-    Py_buffer *buf;
-    int i, spec = 0, retval = -1;
-    __Pyx_BufFmt_Context ctx;
-    int from_memoryview = __pyx_memoryview_check(original_obj);
-    __Pyx_RefNannySetupContext("ValidateAndInit_memviewslice", 0);
-    if (from_memoryview && __pyx_typeinfo_cmp(dtype, ((struct __pyx_memoryview_obj *)
-                                                            original_obj)->typeinfo)) {
-        memview = (struct __pyx_memoryview_obj *) original_obj;
-        new_memview = NULL;
-    } else {
-        memview = (struct __pyx_memoryview_obj *) __pyx_memoryview_new(
-                                            original_obj, buf_flags, 0, dtype);
-        new_memview = memview;
-        if (unlikely(!memview))
-            goto fail;
-    }
-    buf = &memview->view;
-    if (buf->ndim != ndim) {
-        PyErr_Format(PyExc_ValueError,
-                "Buffer has wrong number of dimensions (expected %d, got %d)",
-                ndim, buf->ndim);
-        goto fail;
-    }
-    if (new_memview) {
-        __Pyx_BufFmt_Init(&ctx, stack, dtype);
-        if (!__Pyx_BufFmt_CheckString(&ctx, buf->format)) goto fail;
-    }
-    if ((unsigned) buf->itemsize != dtype->size) {
-        PyErr_Format(PyExc_ValueError,
-                     "Item size of buffer (%" CYTHON_FORMAT_SSIZE_T "u byte%s) "
-                     "does not match size of '%s' (%" CYTHON_FORMAT_SSIZE_T "u byte%s)",
-                     buf->itemsize,
-                     (buf->itemsize > 1) ? "s" : "",
-                     dtype->name,
-                     dtype->size,
-                     (dtype->size > 1) ? "s" : "");
-        goto fail;
-    }
-    for (i = 0; i < ndim; i++) {
-        spec = axes_specs[i];
-        if (!__pyx_check_strides(buf, i, ndim, spec))
-            goto fail;
-        if (!__pyx_check_suboffsets(buf, i, ndim, spec))
-            goto fail;
-    }
-    if (buf->strides && !__pyx_verify_contig(buf, ndim, c_or_f_flag))
-        goto fail;
-    if (unlikely(__Pyx_init_memviewslice(memview, ndim, memviewslice,
-                                         new_memview != NULL) == -1)) {
-        goto fail;
-    }
-    retval = 0;
-    goto no_fail;
-fail:
-    Py_XDECREF(new_memview);
-    retval = -1;
-no_fail:
-    __Pyx_RefNannyFinishContext();
-    return retval;
-}
-
 /* ObjectToMemviewSlice */
   static CYTHON_INLINE __Pyx_memviewslice __Pyx_PyObject_to_MemoryviewSlice_dc_int(PyObject *obj, int writable_flag) {
     __Pyx_memviewslice result = { 0, 0, { 0 }, { 0 }, { 0 } };
@@ -26638,6 +37322,29 @@ __pyx_fail:
     return result;
 }
 
+/* ObjectToMemviewSlice */
+  static CYTHON_INLINE __Pyx_memviewslice __Pyx_PyObject_to_MemoryviewSlice_d_dc_unsigned_char(PyObject *obj, int writable_flag) {
+    __Pyx_memviewslice result = { 0, 0, { 0 }, { 0 }, { 0 } };
+    __Pyx_BufFmt_StackElem stack[1];
+    int axes_specs[] = { (__Pyx_MEMVIEW_DIRECT | __Pyx_MEMVIEW_FOLLOW), (__Pyx_MEMVIEW_DIRECT | __Pyx_MEMVIEW_CONTIG) };
+    int retcode;
+    if (obj == Py_None) {
+        result.memview = (struct __pyx_memoryview_obj *) Py_None;
+        return result;
+    }
+    retcode = __Pyx_ValidateAndInit_memviewslice(axes_specs, __Pyx_IS_C_CONTIG,
+                                                 (PyBUF_C_CONTIGUOUS | PyBUF_FORMAT) | writable_flag, 2,
+                                                 &__Pyx_TypeInfo_unsigned_char, stack,
+                                                 &result, obj);
+    if (unlikely(retcode == -1))
+        goto __pyx_fail;
+    return result;
+__pyx_fail:
+    result.memview = NULL;
+    result.data = NULL;
+    return result;
+}
+
 /* CheckBinaryVersion */
   static int __Pyx_check_binary_version(void) {
     char ctversion[4], rtversion[4];
@@ -2,6 +2,8 @@
 #cython: language_level=2
 cimport cython
 from libc.math cimport fabs
+from libc.string cimport memcpy, memmove
+from libc.stdlib cimport malloc, free, qsort
 
 import numpy as np
 # This enables Cython enhanced compatibilities
@@ -211,3 +213,567 @@ def fold_csr_diagonal_nc(np.ndarray[np.int32_t, ndim=1, mode='c'] PTR,
 
     # Return objects
     return FOLD_ptr, FOLD_ncol, FOLD_col[:nz].copy()
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+@cython.initializedcheck(False)
+def sparse_merge(np.ndarray[np.int32_t, ndim=1, mode='c'] PTR1,
+                 np.ndarray[np.int32_t, ndim=1, mode='c'] NCOL1,
+                 np.ndarray[np.int32_t, ndim=1, mode='c'] COL1,
+                 np.ndarray[np.int32_t, ndim=1, mode='c'] PTR2,
+                 np.ndarray[np.int32_t, ndim=1, mode='c'] NCOL2,
+                 np.ndarray[np.int32_t, ndim=1, mode='c'] COL2):
+    """ Merge two sparsity patterns with sorted column indices per row into their union
+
+    Parameters
+    ----------
+    PTR1, NCOL1, COL1 : numpy.ndarray(np.int32)
+       the first sparsity pattern (columns sorted in each row)
+    PTR2, NCOL2, COL2 : numpy.ndarray(np.int32)
+       the second sparsity pattern (columns sorted in each row)
+
+    Returns
+    -------
+    ptr, ncol, col : the union sparsity pattern (columns sorted in each row)
+    idx1, idx2 : indices of the union elements in `COL1` and `COL2`, respectively (``-1`` if not present)
+    """
+    cdef int[::1] ptr1 = PTR1
+    cdef int[::1] ncol1 = NCOL1
+    cdef int[::1] col1 = COL1
+    cdef int[::1] ptr2 = PTR2
+    cdef int[::1] ncol2 = NCOL2
+    cdef int[::1] col2 = COL2
+    cdef int nr = ncol1.shape[0]
+
+    cdef np.ndarray[np.int32_t, ndim=1, mode='c'] PTR = np.empty([nr + 1], dtype=np.int32)
+    cdef np.ndarray[np.int32_t, ndim=1, mode='c'] NCOL = np.empty([nr], dtype=np.int32)
+    cdef int[::1] ptr = PTR
+    cdef int[::1] ncol = NCOL
+
+    # Count the number of elements in the union
+    cdef int r, i1, i2, e1, e2, n
+    n = 0
+    for r in range(nr):
+        i1 = ptr1[r]
+        e1 = i1 + ncol1[r]
+        i2 = ptr2[r]
+        e2 = i2 + ncol2[r]
+        ptr[r] = n
+        while i1 < e1 and i2 < e2:
+            if col1[i1] < col2[i2]:
+                i1 += 1
+            elif col1[i1] > col2[i2]:
+                i2 += 1
+            else:
+                i1 += 1
+                i2 += 1
+            n += 1
+        n += e1 - i1 + e2 - i2
+        ncol[r] = n - ptr[r]
+    ptr[nr] = n
+
+    cdef np.ndarray[np.int32_t, ndim=1, mode='c'] COL = np.empty([n], dtype=np.int32)
+    cdef np.ndarray[np.int32_t, ndim=1, mode='c'] IDX1 = np.empty([n], dtype=np.int32)
+    cdef np.ndarray[np.int32_t, ndim=1, mode='c'] IDX2 = np.empty([n], dtype=np.int32)
+    cdef int[::1] col = COL
+    cdef int[::1] idx1 = IDX1
+    cdef int[::1] idx2 = IDX2
+
+    _sparse_merge(ptr1, ncol1, col1, ptr2, ncol2, col2, ptr, col, idx1, idx2)
+
+    return PTR, NCOL, COL, IDX1, IDX2
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+@cython.initializedcheck(False)
+cdef void _sparse_merge(const int[::1] ptr1, const int[::1] ncol1, const int[::1] col1,
+                        const int[::1] ptr2, const int[::1] ncol2, const int[::1] col2,
+                        const int[::1] ptr, int[::1] col, int[::1] idx1, int[::1] idx2) nogil:
+    cdef int nr = ncol1.shape[0]
+    cdef int r, i1, i2, e1, e2, n
+
+    for r in range(nr):
+        i1 = ptr1[r]
+        e1 = i1 + ncol1[r]
+        i2 = ptr2[r]
+        e2 = i2 + ncol2[r]
+        n = ptr[r]
+        while i1 < e1 and i2 < e2:
+            if col1[i1] < col2[i2]:
+                col[n] = col1[i1]
+                idx1[n] = i1
+                idx2[n] = -1
+                i1 += 1
+            elif col1[i1] > col2[i2]:
+                col[n] = col2[i2]
+                idx1[n] = -1
+                idx2[n] = i2
+                i2 += 1
+            else:
+                col[n] = col1[i1]
+                idx1[n] = i1
+                idx2[n] = i2
+                i1 += 1
+                i2 += 1
+            n += 1
+        while i1 < e1:
+            col[n] = col1[i1]
+            idx1[n] = i1
+            idx2[n] = -1
+            i1 += 1
+            n += 1
+        while i2 < e2:
+            col[n] = col2[i2]
+            idx1[n] = -1
+            idx2[n] = i2
+            i2 += 1
+            n += 1
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+@cython.initializedcheck(False)
+@cython.cdivision(True)
+def sparse_transpose(np.ndarray[np.int32_t, ndim=1, mode='c'] PTR,
+                     np.ndarray[np.int32_t, ndim=1, mode='c'] NCOL,
+                     np.ndarray[np.int32_t, ndim=1, mode='c'] COL,
+                     np.ndarray[np.int32_t, ndim=1, mode='c'] ISC,
+                     const int size):
+    """ Transpose a sparsity pattern with supercell columns using a counting sort
+
+    Element ``(r, c + s * size)`` is transposed into ``(c, r + ISC[s] * size)``.
+
+    Parameters
+    ----------
+    PTR, NCOL, COL : numpy.ndarray(np.int32)
+       the sparsity pattern
+    ISC : numpy.ndarray(np.int32)
+       the transposed supercell index for each supercell index
+    size : int
+       number of rows (and number of columns in each supercell)
+
+    Returns
+    -------
+    ptr, ncol, col : the transposed sparsity pattern (columns sorted in each row)
+    idx : indices of the transposed elements in `COL`
+    """
+    cdef int[::1] ptr = PTR
+    cdef int[::1] ncol = NCOL
+    cdef int[::1] col = COL
+    cdef int[::1] isc = ISC
+    cdef int nr = ncol.shape[0]
+    cdef int n_s = isc.shape[0]
+
+    cdef np.ndarray[np.int32_t, ndim=1, mode='c'] T_PTR = np.zeros([size + 1], dtype=np.int32)
+    cdef np.ndarray[np.int32_t, ndim=1, mode='c'] T_NCOL = np.zeros([size], dtype=np.int32)
+    cdef np.ndarray[np.int32_t, ndim=1, mode='c'] OFF = np.zeros([n_s + 1], dtype=np.int32)
+    cdef int[::1] tptr = T_PTR
+    cdef int[::1] tncol = T_NCOL
+    cdef int[::1] off = OFF
+
+    cdef int r, i, t, n, nnz
+
+    # Count elements per transposed row and per transposed supercell
+    nnz = 0
+    for r in range(nr):
+        for i in range(ptr[r], ptr[r] + ncol[r]):
+            tncol[col[i] % size] += 1
+            off[isc[col[i] / size] + 1] += 1
+        nnz += ncol[r]
+
+    for r in range(size):
+        tptr[r + 1] = tptr[r] + tncol[r]
+    for t in range(n_s):
+        off[t + 1] += off[t]
+
+    cdef np.ndarray[np.int32_t, ndim=1, mode='c'] T_COL = np.empty([nnz], dtype=np.int32)
+    cdef np.ndarray[np.int32_t, ndim=1, mode='c'] IDX = np.empty([nnz], dtype=np.int32)
+    cdef np.ndarray[np.int32_t, ndim=1, mode='c'] S_COL = np.empty([nnz], dtype=np.int32)
+    cdef np.ndarray[np.int32_t, ndim=1, mode='c'] S_IDX = np.empty([nnz], dtype=np.int32)
+    cdef int[::1] tcol = T_COL
+    cdef int[::1] idx = IDX
+    cdef int[::1] scol = S_COL
+    cdef int[::1] sidx = S_IDX
+
+    with nogil:
+        # Stable sort by the transposed supercell index (rows are traversed in order)
+        for r in range(nr):
+            for i in range(ptr[r], ptr[r] + ncol[r]):
+                t = isc[col[i] / size]
+                n = off[t]
+                off[t] = n + 1
+                scol[n] = r + t * size
+                sidx[n] = i
+
+        # Stable sort by the transposed row, this yields sorted columns in each row
+        for r in range(size):
+            tncol[r] = tptr[r]
+        for n in range(nnz):
+            i = sidx[n]
+            r = col[i] % size
+            t = tncol[r]
+            tncol[r] = t + 1
+            tcol[t] = scol[n]
+            idx[t] = i
+        for r in range(size):
+            tncol[r] -= tptr[r]
+
+    return T_PTR, T_NCOL, T_COL, IDX
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+@cython.initializedcheck(False)
+def sparse_sub(np.ndarray[np.int32_t, ndim=1, mode='c'] PTR,
+               np.ndarray[np.int32_t, ndim=1, mode='c'] NCOL,
+               np.ndarray[np.int32_t, ndim=1, mode='c'] COL,
+               np.ndarray[np.int32_t, ndim=1, mode='c'] ROWS,
+               np.ndarray[np.int32_t, ndim=1, mode='c'] PVT):
+    """ Extract the rows `ROWS` of a sparsity pattern while translating the columns through `PVT`
+
+    Parameters
+    ----------
+    PTR, NCOL, COL : numpy.ndarray(np.int32)
+       the sparsity pattern
+    ROWS : numpy.ndarray(np.int32)
+       the rows that are retained (in the order of the new sparsity pattern)
+    PVT : numpy.ndarray(np.int32)
+       the new column index for each old column index (``-1`` for removed columns)
+
+    Returns
+    -------
+    ptr, ncol, col : the new sparsity pattern
+    idx : indices of the retained elements in `COL`
+    """
+    cdef int[::1] ptr = PTR
+    cdef int[::1] ncol = NCOL
+    cdef int[::1] col = COL
+    cdef int[::1] rows = ROWS
+    cdef int[::1] pvt = PVT
+    cdef int nr = rows.shape[0]
+
+    cdef np.ndarray[np.int32_t, ndim=1, mode='c'] S_PTR = np.empty([nr + 1], dtype=np.int32)
+    cdef np.ndarray[np.int32_t, ndim=1, mode='c'] S_NCOL = np.empty([nr], dtype=np.int32)
+    cdef int[::1] sptr = S_PTR
+    cdef int[::1] sncol = S_NCOL
+
+    cdef int r, i, n, c
+
+    # Count the number of retained elements per row
+    n = 0
+    with nogil:
+        for r in range(nr):
+            sptr[r] = n
+            c = rows[r]
+            for i in range(ptr[c], ptr[c] + ncol[c]):
+                if pvt[col[i]] >= 0:
+                    n += 1
+            sncol[r] = n - sptr[r]
+        sptr[nr] = n
+
+    cdef np.ndarray[np.int32_t, ndim=1, mode='c'] S_COL = np.empty([n], dtype=np.int32)
+    cdef np.ndarray[np.int32_t, ndim=1, mode='c'] IDX = np.empty([n], dtype=np.int32)
+    cdef int[::1] scol = S_COL
+    cdef int[::1] idx = IDX
+
+    with nogil:
+        n = 0
+        for r in range(nr):
+            c = rows[r]
+            for i in range(ptr[c], ptr[c] + ncol[c]):
+                if pvt[col[i]] >= 0:
+                    scol[n] = pvt[col[i]]
+                    idx[n] = i
+                    n += 1
+
+    return S_PTR, S_NCOL, S_COL, IDX
+
+
+cdef struct _col_idx:
+    int col
+    int idx
+
+
+cdef int _col_idx_cmp(const void *a, const void *b) nogil:
+    cdef int ca = (<_col_idx *> a).col
+    cdef int cb = (<_col_idx *> b).col
+    return (ca > cb) - (ca < cb)
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+@cython.initializedcheck(False)
+def sparse_finalize(np.ndarray[np.int32_t, ndim=1, mode='c'] PTR,
+                    np.ndarray[np.int32_t, ndim=1, mode='c'] NCOL,
+                    np.ndarray[np.int32_t, ndim=1, mode='c'] COL,
+                    np.ndarray[np.uint8_t, ndim=2, mode='c'] D,
+                    const bint sort):
+    """ In-place compaction of a sparse matrix, optionally sorting the columns in each row
+
+    The elements of each row are moved to be consecutive (`PTR` is updated accordingly) and
+    the data rows are moved along with the column indices.
+    Short rows are sorted by insertion, long rows through `qsort` and an in-place permutation.
+
+    Parameters
+    ----------
+    PTR, NCOL, COL : numpy.ndarray(np.int32)
+       the sparsity pattern, `PTR` and `COL` are changed in-place
+    D : numpy.ndarray(np.uint8)
+       the data viewed as bytes (one row per element), changed in-place
+    sort : bool
+       whether the columns are sorted in each row
+
+    Returns
+    -------
+    nnz : number of non-zero elements (the retained part of `COL` and `D`)
+    row : the first row with duplicate column entries, ``-1`` if none
+    """
+    cdef int[::1] ptr = PTR
+    cdef int[::1] ncol = NCOL
+    cdef int[::1] COL_v = COL
+    cdef unsigned char[:, ::1] D_v = D
+    cdef size_t sz = D.shape[1]
+    cdef int nr = ncol.shape[0]
+
+    cdef int r, i, j, k, n, p, q, c, max_k, max_c, err
+    cdef int *col
+    cdef unsigned char *data
+    cdef unsigned char *tmp
+    cdef _col_idx *pairs
+    cdef int *last
+
+    if COL_v.shape[0] == 0 or D_v.shape[0] == 0:
+        for r in range(nr + 1):
+            ptr[r] = 0
+        return 0, -1
+    col = &COL_v[0]
+    data = &D_v[0, 0]
+
+    # Compact the elements
+    n = 0
+    max_k = 0
+    max_c = 0
+    with nogil:
+        for r in range(nr):
+            i = ptr[r]
+            k = ncol[r]
+            if i != n:
+                memmove(&col[n], &col[i], k * sizeof(int))
+                memmove(&data[n * sz], &data[i * sz], k * sz)
+            ptr[r] = n
+            n += k
+            if k > max_k:
+                max_k = k
+            for j in range(ptr[r], n):
+                if col[j] > max_c:
+                    max_c = col[j]
+        ptr[nr] = n
+
+    err = -1
+    if not sort:
+        # Check for duplicates by marking the last row each column is found in
+        last = <int *> malloc((max_c + 1) * sizeof(int))
+        if last is NULL:
+            raise MemoryError()
+        with nogil:
+            for c in range(max_c + 1):
+                last[c] = -1
+            for r in range(nr):
+                for j in range(ptr[r], ptr[r + 1]):
+                    if last[col[j]] == r:
+                        err = r
+                        break
+                    last[col[j]] = r
+                if err >= 0:
+                    break
+        free(last)
+        return n, err
+
+    tmp = <unsigned char *> malloc(sz + 1)
+    pairs = <_col_idx *> malloc((max_k + 1) * sizeof(_col_idx))
+    if tmp is NULL or pairs is NULL:
+        free(tmp)
+        free(pairs)
+        raise MemoryError()
+
+    with nogil:
+        for r in range(nr):
+            i = ptr[r]
+            k = ncol[r]
+
+            if k <= 32:
+                # Insertion sort, shifting the column indices and data rows
+                for j in range(i + 1, i + k):
+                    c = col[j]
+                    p = j
+                    while p > i and col[p - 1] > c:
+                        p -= 1
+                    if p != j:
+                        memcpy(tmp, &data[j * sz], sz)
+                        memmove(&col[p + 1], &col[p], (j - p) * sizeof(int))
+                        memmove(&data[(p + 1) * sz], &data[p * sz], (j - p) * sz)
+                        col[p] = c
+                        memcpy(&data[p * sz], tmp, sz)
+
+            else:
+                for j in range(k):
+                    pairs[j].col = col[i + j]
+                    pairs[j].idx = j
+                qsort(pairs, k, sizeof(_col_idx), _col_idx_cmp)
+                for j in range(k):
+                    col[i + j] = pairs[j].col
+
+                # Permute the data rows by following the cycles of the permutation
+                # (new row p is the old row pairs[p].idx)
+                for j in range(k):
+                    q = pairs[j].idx
+                    if q < 0 or q == j:
+                        continue
+                    memcpy(tmp, &data[(i + j) * sz], sz)
+                    p = j
+                    while q != j:
+                        memcpy(&data[(i + p) * sz], &data[(i + q) * sz], sz)
+                        pairs[p].idx = -1
+                        p = q
+                        q = pairs[p].idx
+                    memcpy(&data[(i + p) * sz], tmp, sz)
+                    pairs[p].idx = -1
+
+            for j in range(i + 1, i + k):
+                if col[j] == col[j - 1]:
+                    err = r
+                    break
+            if err >= 0:
+                break
+
+    free(tmp)
+    free(pairs)
+
+    return n, err
+
+
+ctypedef fused _orb_real:
+    float
+    double
+
+
+cdef int _int_cmp(const void *a, const void *b) nogil:
+    cdef int ia = (<int *> a)[0]
+    cdef int ib = (<int *> b)[0]
+    return (ia > ib) - (ia < ib)
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+@cython.initializedcheck(False)
+@cython.cdivision(True)
+def sparse_orb_to_atom(np.ndarray[np.int32_t, ndim=1, mode='c'] PTR,
+                       np.ndarray[np.int32_t, ndim=1, mode='c'] COL,
+                       _orb_real[:, ::1] D,
+                       np.ndarray[np.int32_t, ndim=1, mode='c'] FIRSTO,
+                       np.ndarray[np.int32_t, ndim=1, mode='c'] O2A,
+                       const int n_s, const int only):
+    """ Reduce an orbital CSR matrix to an atomic CSR matrix by summing all orbital elements
+
+    Element ``(io, jo + s * no)`` is summed into ``(O2A[io], O2A[jo] + s * na)``.
+    The columns of the returned sparsity pattern are unique and sorted in each row.
+
+    Parameters
+    ----------
+    PTR, COL : numpy.ndarray(np.int32)
+       the CSR sparsity pattern (``indptr`` and ``indices``) of the orbital matrix
+    D : numpy.ndarray(np.float32 or np.float64)
+       the orbital data, ``D[i, :]`` is the data for matrix ``i`` (all with the same sparsity pattern)
+    FIRSTO : numpy.ndarray(np.int32)
+       first orbital of each atom (with the total number of orbitals appended)
+    O2A : numpy.ndarray(np.int32)
+       atomic index of each orbital
+    n_s : int
+       number of supercells in the atomic columns (1 folds all columns to the unit-cell)
+    only : int
+       if ``1`` only positive elements are summed, if ``-1`` only negative elements are summed,
+       else all elements are summed
+
+    Returns
+    -------
+    ptr, col : the CSR sparsity pattern of the atomic matrix
+    data : the atomic data, ``data[i, :]`` corresponds to ``D[i, :]``
+    """
+    cdef int[::1] ptr = PTR
+    cdef int[::1] col = COL
+    cdef int[::1] firsto = FIRSTO
+    cdef int[::1] o2a = O2A
+    cdef int na = firsto.shape[0] - 1
+    cdef int no = o2a.shape[0]
+    cdef int nd = D.shape[0]
+    cdef int nc = na * n_s
+
+    cdef np.ndarray[np.int32_t, ndim=1, mode='c'] A_PTR = np.empty([na + 1], dtype=np.int32)
+    cdef np.ndarray[np.int32_t, ndim=1, mode='c'] STAMP = np.full([nc], -1, dtype=np.int32)
+    cdef np.ndarray[np.int32_t, ndim=1, mode='c'] POS = np.empty([nc], dtype=np.int32)
+    cdef int[::1] aptr = A_PTR
+    cdef int[::1] stamp = STAMP
+    cdef int[::1] pos = POS
+
+    cdef int ia, io, i, j, c, n
+
+    # Count the number of unique atomic columns per atom
+    n = 0
+    with nogil:
+        for ia in range(na):
+            aptr[ia] = n
+            for io in range(firsto[ia], firsto[ia + 1]):
+                for i in range(ptr[io], ptr[io + 1]):
+                    c = (o2a[col[i] % no] + (col[i] / no) * na) % nc
+                    if stamp[c] != ia:
+                        stamp[c] = ia
+                        n += 1
+        aptr[na] = n
+
+    cdef np.ndarray[np.int32_t, ndim=1, mode='c'] A_COL = np.empty([n], dtype=np.int32)
+    cdef int[::1] acol = A_COL
+    if _orb_real is float:
+        A_D = np.zeros([nd, n], dtype=np.float32)
+    else:
+        A_D = np.zeros([nd, n], dtype=np.float64)
+    cdef _orb_real[:, ::1] ad = A_D
+    cdef _orb_real v
+
+    STAMP.fill(-1)
+    with nogil:
+        for ia in range(na):
+            # Gather the unique columns
+            n = aptr[ia]
+            for io in range(firsto[ia], firsto[ia + 1]):
+                for i in range(ptr[io], ptr[io + 1]):
+                    c = (o2a[col[i] % no] + (col[i] / no) * na) % nc
+                    if stamp[c] != ia:
+                        stamp[c] = ia
+                        acol[n] = c
+                        n += 1
+
+            # Sort them and store their positions
+            n = aptr[ia + 1] - aptr[ia]
+            if n > 1:
+                qsort(&acol[aptr[ia]], n, sizeof(int), _int_cmp)
+            for j in range(aptr[ia], aptr[ia + 1]):
+                pos[acol[j]] = j
+
+            # Sum the data
+            for io in range(firsto[ia], firsto[ia + 1]):
+                for i in range(ptr[io], ptr[io + 1]):
+                    j = pos[(o2a[col[i] % no] + (col[i] / no) * na) % nc]
+                    for c in range(nd):
+                        v = D[c, i]
+                        if only == 1:
+                            if v > 0:
+                                ad[c, j] += v
+                        elif only == -1:
+                            if v < 0:
+                                ad[c, j] += v
+                        else:
+                            ad[c, j] += v
+
+    return A_PTR, A_COL, A_D
@@ -1,6 +1,12 @@
 from __future__ import print_function, division
 
-__all__ = ['starts_with_list']
+from numbers import Integral
+import numpy as np
+
+import sisl._array as _a
+from sisl import SuperCell
+
+__all__ = ['starts_with_list', 'grid_slices', 'grid_supercell', 'grid_read_planes']
 
 
 def starts_with_list(l, comments):
@@ -8,3 +14,169 @@ def starts_with_list(l, comments):
         if l.startswith(comment):
             return True
     return False
+
+
+def grid_slices(shape, region=None, stride=None):
+    """ Slices of the grid points retained along each lattice vector
+
+    Parameters
+    ----------
+    shape : (3, ) of int
+       number of grid points along each lattice vector
+    region : list of (None, int, (int, int) or slice), optional
+       the retained grid points along each lattice vector. ``None`` retains all
+       points, an integer a single plane, a tuple the half-open range ``[start, stop)`` and
+       a slice is used as is. Default to the full grid.
+    stride : int or (3, ) of int, optional
+       only every `stride` grid point (along each lattice vector) is retained.
+
+    Returns
+    -------
+    tuple of slice : normalized slices (positive steps and no ``None`` values)
+    """
+    if region is None:
+        region = [None] * 3
+    if stride is None:
+        stride = 1
+    if isinstance(stride, Integral):
+        stride = [stride] * 3
+    if len(region) != 3 or len(stride) != 3:
+        raise ValueError('grid_slices requires region and stride to be defined for all 3 lattice vectors')
+
+    slices = []
+    for n, r, s in zip(shape, region, stride):
+        n = int(n)
+        if r is None:
+            r = slice(None)
+        elif isinstance(r, Integral):
+            r = slice(r, r + 1 if r != -1 else None)
+        elif not isinstance(r, slice):
+            r = slice(*r)
+        start, stop, step = r.indices(n)
+        step *= s
+        if step < 1:
+            raise ValueError('grid_slices requires a positive stride')
+        if len(range(start, stop, step)) == 0:
+            raise ValueError('grid_slices retains no grid points for region {} in a grid with {} points'.format(r, n))
+        slices.append(slice(start, stop, step))
+    return tuple(slices)
+
+
+def grid_supercell(sc, shape, slices):
+    """ The supercell spanned by the retained grid points in `slices`
+
+    The origo is shifted to the first retained grid point and the lattice vectors
+    are scaled to the number of retained points and the (strided) voxel size.
+
+    Parameters
+    ----------
+    sc : SuperCell
+       the supercell of the full grid
+    shape : (3, ) of int
+       number of grid points along each lattice vector of the full grid
+    slices : tuple of slice
+       the retained grid points as returned from `grid_slices`
+    """
+    dcell = sc.cell / _a.asarrayd(shape).reshape(3, 1)
+    cell = np.empty([3, 3], np.float64)
+    origo = sc.origo.copy()
+    for i, sl in enumerate(slices):
+        cell[i, :] = dcell[i, :] * sl.step * len(range(sl.start, sl.stop, sl.step))
+        origo += dcell[i, :] * sl.start
+    return SuperCell(cell, nsc=sc.nsc.copy(), origo=origo)
+
+
+def grid_read_planes(readline, nplane, planes, nplanes=None, dtype=np.float64):
+    """ Read selected planes of a grid stored as white-space separated values
+
+    Only lines containing values in the requested planes are converted, all other
+    lines are simply skipped.
+
+    Parameters
+    ----------
+    readline : callable
+       returns the next line of the file
+    nplane : int
+       number of values in each plane
+    planes : array_like of int
+       increasing indices of the planes to be returned (may be empty to skip all planes)
+    nplanes : int, optional
+       total number of stored planes, all lines of these planes are read (consumed).
+       Default to stop reading after the last plane in `planes`.
+    dtype : numpy.dtype, optional
+       data-type of the returned values
+
+    Returns
+    -------
+    numpy.ndarray : values of the planes with shape ``(len(planes), nplane)``
+    """
+    planes = _a.asarrayi(planes).ravel()
+    if nplanes is None:
+        nplanes = planes[-1] + 1
+    # Row in the returned array for each plane (-1 for skipped planes)
+    row = _a.fulli(nplanes, -1)
+    row[planes] = _a.arangei(len(planes))
+    out = np.empty([len(planes), nplane], dtype)
+    need = (row >= 0).tolist()
+
+    def store(i0, vals):
+        vals = np.array(vals).astype(dtype)
+        i1 = i0 + len(vals)
+        for p in range(i0 // nplane, min((i1 - 1) // nplane + 1, nplanes)):
+            if row[p] < 0:
+                continue
+            p0 = p * nplane
+            a, b = max(i0, p0), min(i1, p0 + nplane)
+            out[row[p], a-p0:b-p0] = vals[a-i0:b-i0]
+
+    # Consecutive runs of retained/skipped planes (and the value index ending the run)
+    runs = []
+    for p, keep in enumerate(need):
+        if len(runs) > 0 and runs[-1][0] == keep:
+            runs[-1][1] = (p + 1) * nplane
+        else:
+            runs.append([keep, (p + 1) * nplane])
+
+    def eof():
+        return ValueError('grid_read_planes reached end of file before reading all values')
+
+    # Number of read values and the values not yet stored (starting at value i0)
+    i = 0
+    i0 = 0
+    vals = []
+    for keep, end in runs:
+        if keep:
+            if len(vals) == 0:
+                i0 = i
+            while i < end:
+                # Limit the memory of the intermediate list of strings
+                stop = min(end, i + 2 ** 20)
+                while i < stop:
+                    line = readline()
+                    if len(line) == 0:
+                        raise eof()
+                    line = line.split()
+                    vals.extend(line)
+                    i += len(line)
+                if i < end:
+                    store(i0, vals)
+                    vals = []
+                    i0 = i
+        else:
+            if len(vals) > 0:
+                store(i0, vals)
+                vals = []
+            while i < end:
+                line = readline()
+                if len(line) == 0:
+                    raise eof()
+                line = line.split()
+                i += len(line)
+            if i > end:
+                # The last line also contains values of the following planes
+                vals = line[len(line) - (i - end):]
+                i0 = end
+    if len(vals) > 0:
+        store(i0, vals)
+
+    return out
@@ -4,8 +4,10 @@ import numpy as np
 
 # Import sile objects
 from sisl.io.sile import *
+from sisl.io._help import grid_slices, grid_supercell, grid_read_planes
 
 # Import the geometry object
+import sisl._array as _a
 from sisl import Geometry, Atom, SuperCell, Grid, SislError
 from sisl.unit import unit_convert
 
@@ -206,7 +208,7 @@ class cubeSile(Sile):
         return Geometry(xyz, atom, sc=sc)
 
     @sile_fh_open()
-    def read_grid(self, imag=None):
+    def read_grid(self, imag=None, region=None, stride=None):
         """ Returns `Grid` object from the CUBE file
 
         Parameters
@@ -214,10 +216,16 @@ class cubeSile(Sile):
         imag : str or Sile or Grid
             the imaginary part of the grid. If the geometries does not match
             an error will be raised.
+        region : list of (None, int, (int, int) or slice), optional
+            the retained grid points along each lattice vector, see `~sisl.io._help.grid_slices`.
+            Only the x-planes in the region are parsed and the returned grid has its
+            supercell shifted to the first retained grid point.
+        stride : int or (3, ) of int, optional
+            only read every `stride` grid point (along each lattice vector)
         """
         if not imag is None:
             if not isinstance(imag, Grid):
-                imag = Grid.read(imag)
+                imag = Grid.read(imag, region=region, stride=stride)
         geom = self.read_geometry()
         if geom is None:
             self.fh.seek(0)
@@ -242,18 +250,23 @@ class cubeSile(Sile):
         for i in range(na):
             self.readline()
 
-        if geom is None:
-            grid = Grid(ngrid, dtype=np.float64, sc=sc)
-        else:
-            grid = Grid(ngrid, dtype=np.float64, geometry=geom)
-        grid.grid.shape = (-1,)
+        slices = grid_slices(ngrid, region, stride)
+        sx, sy, sz = slices
+        sc = grid_supercell(sc, ngrid, slices)
 
-        # TODO check performance of this
-        # We are currently doing this to enable reading
+        # The values are stored with z as the fastest index, hence only the needed
+        # x-planes are parsed.
+        # We are reading values independent of lines to enable reading
         #  1-column data and 6-column data.
-        lines = [item for sublist in self.fh.readlines() for item in sublist.split()]
-        grid.grid[:] = np.array(lines).astype(grid.dtype)
-        grid.grid.shape = ngrid
+        vals = grid_read_planes(self.fh.readline, ngrid[1] * ngrid[2], _a.arangei(ngrid[0])[sx])
+        vals = vals.reshape(-1, ngrid[1], ngrid[2])[:, sy, sz]
+
+        if geom is None:
+            grid = Grid(vals.shape, dtype=np.float64, sc=sc)
+        else:
+            geom.set_supercell(sc)
+            grid = Grid(vals.shape, dtype=np.float64, geometry=geom)
+        grid.grid[:, :, :] = vals
 
         if imag is None:
             return grid
@@ -1,6 +1,10 @@
 from __future__ import print_function, division
 
 from numbers import Integral
+from collections import OrderedDict
+from threading import Lock
+import struct
+import io
 import numpy as np
 
 try:
@@ -9,15 +13,18 @@ try:
 except Exception as e:
     found_module = False
 
-from sisl.messages import warn, SislError
+from sisl.messages import warn, info, SislError
+from sisl._help import _zip as zip
 from ..sile import add_sile, SileError
 from .sile import SileBinSiesta
 
 import sisl._array as _a
 from sisl import Geometry, Atom, SuperCell, Grid
 from sisl.unit.siesta import unit_convert
+from sisl.sparse import _Scratch
 from sisl.physics.sparse import SparseOrbitalBZ
 from sisl.physics import Hamiltonian, DensityMatrix, EnergyDensityMatrix
+from .._help import grid_slices, grid_supercell
 from ._help import *
 
 
@@ -32,6 +39,142 @@ __all__ += ['gridSileSiesta']
 __all__ += ['tsgfSileSiesta']
 
 
+# gfortran splits unformatted records larger than this into sub-records
+_MAX_SUBRECORD = 2 ** 31 - 9
+
+
+def _record_nbytes(nbytes):
+    """ Number of bytes a sequential, unformatted Fortran record of `nbytes` occupies on disk """
+    nsub = max(1, (nbytes + _MAX_SUBRECORD - 1) // _MAX_SUBRECORD)
+    return nbytes + 8 * nsub
+
+
+class _FortranRecords(object):
+    """ Reader of the records in an unformatted sequential Fortran file through a memory-map
+
+    Only the accessed records are read from the file. The sparse matrices in the Siesta
+    files are stored with one record per row, and the location of each row is calculated
+    from the number of non-zero elements per row (i.e. without scanning the file).
+
+    Parameters
+    ----------
+    fname : str
+       the file name
+    """
+    # Maximum number of elements read in each block of rows
+    block = _Scratch.block
+
+    def __init__(self, fname):
+        self.file = fname
+        self._mm = np.memmap(fname, np.uint8, mode='r')
+        # Offset of the current record
+        self.offset = 0
+
+    def _marker(self, offset):
+        return int(self._mm[offset:offset + 4].view(np.int32)[0])
+
+    def skip(self, n=1):
+        """ Skip `n` records """
+        for _ in range(n):
+            nbytes = -1
+            while nbytes < 0:
+                nbytes = self._marker(self.offset)
+                self.offset += abs(nbytes) + 8
+
+    def read(self, dtype):
+        """ Return the content of the current record (as a 1D array of `dtype`) and move to the next record """
+        data = []
+        nbytes = -1
+        while nbytes < 0:
+            nbytes = self._marker(self.offset)
+            data.append(self._mm[self.offset + 4:self.offset + 4 + abs(nbytes)])
+            self.offset += abs(nbytes) + 8
+        if len(data) == 1:
+            return np.array(data[0]).view(dtype)
+        return np.concatenate(data).view(dtype)
+
+    def rows(self, ptr, dtype, width=1):
+        """ Return the offset of the rows (one record per row) and move to the record after the rows
+
+        Parameters
+        ----------
+        ptr : numpy.ndarray
+           index pointer of the rows (``ptr[i+1] - ptr[i]`` elements in row ``i``)
+        dtype : numpy.dtype
+           data-type of the elements
+        width : int, optional
+           number of values per element
+        """
+        offset = self.offset
+        nbytes = np.dtype(dtype).itemsize * width
+        no = len(ptr) - 1
+        self.offset += 8 * no + nbytes * int(ptr[-1])
+        # Check the first and last row to ensure a correct interpretation of the file
+        if no > 0 and (self._marker(offset) != nbytes * (ptr[1] - ptr[0]) or
+                       self._marker(self.offset - 4) != nbytes * (ptr[-1] - ptr[-2])):
+            raise SileError(self.__class__.__name__ + ' could not locate the sparse rows in ' + self.file)
+        return offset
+
+    def iter_rows(self, offset, ptr, dtype, width=1):
+        """ Iterate the values of the rows at `offset` (see `rows`) in blocks of rows
+
+        Iterating several sets of rows with the same `ptr` yields the same slices.
+
+        Yields
+        ------
+        slice
+           the indices of the elements in the block
+        numpy.ndarray
+           the values of the elements in the block
+        """
+        dtype = np.dtype(dtype)
+        ptr = _a.asarrayl(ptr)
+        no = len(ptr) - 1
+        nnz = ptr[-1]
+        if nnz == 0:
+            return
+        # All rows as a contiguous array (including the record markers)
+        # Element j (in row i) is located at index i * step + j * width
+        step = 8 // dtype.itemsize
+        data = self._mm[offset + 4:offset + 8 * no + dtype.itemsize * width * nnz - 4].view(dtype)
+        r0 = 0
+        while r0 < no:
+            r1 = np.searchsorted(ptr, ptr[r0] + self.block, 'right') - 1
+            r1 = min(no, max(r0 + 1, r1))
+            i0, i1 = ptr[r0], ptr[r1]
+            if i1 > i0:
+                idx = step * np.repeat(_a.arangel(r0, r1), np.diff(ptr[r0:r1 + 1])) + width * _a.arangel(i0, i1)
+                if width > 1:
+                    idx = idx.reshape(-1, 1) + _a.arangel(width).reshape(1, -1)
+                yield slice(i0, i1), data[idx]
+            r0 = r1
+
+
+def _csr_empty(csr, ncol, dim, dtype, memmap=False):
+    """ Allocate all arrays of `csr` for the sparsity pattern with `ncol` elements per row
+
+    Parameters
+    ----------
+    memmap : bool or str, optional
+       if not false, the arrays are memory-mapped in a scratch directory (see `SparseCSR.tomemmap`),
+       if a str, the scratch directory is created in this directory
+    """
+    if memmap is False or memmap is None:
+        empty = np.empty
+    else:
+        csr._scratch = scratch = _Scratch(None if memmap is True else memmap)
+        empty = scratch.empty
+    nnz = int(ncol.sum(dtype=np.int64))
+    csr.ncol = empty(len(ncol), np.int32)
+    csr.ncol[:] = ncol
+    csr.ptr = empty(len(ncol) + 1, np.int32)
+    csr.ptr[0] = 0
+    _a.cumsumi(ncol, out=csr.ptr[1:])
+    csr.col = empty(nnz, np.int32)
+    csr._D = empty([nnz, dim], dtype)
+    csr._nnz = nnz
+
+
 def _bin_check(obj, method, message):
     if _siesta.io_m.iostat_query() != 0:
         raise SileError('{}.{} {}'.format(str(obj), method, message))
@@ -92,8 +235,52 @@ class onlysSileSiesta(SileBinSiesta):
 
         return geom
 
+    def _read_tshs(self, method):
+        """ Open the TSHS file and locate the sparse matrix records
+
+        Returns
+        -------
+        f : _FortranRecords
+        sizes : (nspin, no_u, Ef)
+        ncol : number of non-zero elements per row
+        offsets : the offsets of the list_col, S and H rows
+        isc : supercell offsets
+        """
+        f = _FortranRecords(self.file)
+        version = f.read(np.int32)
+        if len(version) != 1 or version[0] != 1:
+            raise SileError(str(self) + '.' + method + ' can only read TSHS files in version 1.')
+        na_u, no_u, no_s, nspin, nnz = f.read(np.int32)
+        f.skip(2) # nsc; cell, xa
+        Gamma, TSGamma, onlyS = f.read(np.int32) != 0
+        f.skip() # kscell, kdispl
+        Ef = f.read(np.float64)[0]
+        f.skip(2) # istep, ia1; lasto
+        ncol = f.read(np.int32)
+        ptr = _a.cumsuml(np.insert(ncol, 0, 0))
+        if ptr[-1] != nnz:
+            raise SileError(str(self) + '.' + method + ' could not read the sparsity pattern.')
+
+        offsets = [f.rows(ptr, np.int32), f.rows(ptr, np.float64)]
+        if not onlyS:
+            offsets += [f.rows(ptr, np.float64) for _ in range(nspin)]
+        if Gamma:
+            isc = _a.zerosi([no_s // no_u, 3])
+        else:
+            isc = f.read(np.int32).reshape(-1, 3)
+        return f, (nspin, no_u, Ef), ncol, offsets, isc
+
     def read_overlap(self, **kwargs):
-        """ Returns the overlap matrix from the siesta.TSHS file """
+        """ Returns the overlap matrix from the siesta.TSHS file
+
+        Parameters
+        ----------
+        geometry : Geometry, optional
+           the geometry associated with the overlap matrix
+        memmap : bool or str, optional
+           store the overlap matrix in memory-mapped arrays (see `SparseCSR.tomemmap`),
+           if a str, the scratch directory is created in this directory
+        """
         tshs_g = self.read_geometry()
         geom = kwargs.get('geometry', tshs_g)
         if geom.na != tshs_g.na or geom.no != tshs_g.no:
@@ -105,28 +292,20 @@ class onlysSileSiesta(SileBinSiesta):
         if np.any(geom.nsc != tshs_g.nsc):
             geom.set_nsc(tshs_g.nsc)
 
-        # read the sizes used...
-        sizes = _siesta.read_tshs_sizes(self.file)
-        _bin_check(self, 'read_overlap', 'could not read sizes.')
-        isc = _siesta.read_tshs_cell(self.file, sizes[3])[2].T
-        _bin_check(self, 'read_overlap', 'could not read cell.')
-        no = sizes[2]
-        nnz = sizes[4]
-        ncol, col, dS = _siesta.read_tshs_s(self.file, no, nnz)
-        _bin_check(self, 'read_overlap', 'could not read overlap matrix.')
+        f, _, ncol, offsets, isc = self._read_tshs('read_overlap')
 
-        # Create the Hamiltonian container
+        # Create the overlap container
         S = SparseOrbitalBZ(geom, nnzpr=1)
+        csr = S._csr
+        _csr_empty(csr, ncol, 1, np.float64, kwargs.get('memmap', False))
 
-        # Create the new sparse matrix
-        S._csr.ncol = ncol.astype(np.int32, copy=False)
-        S._csr.ptr = np.insert(np.cumsum(ncol, dtype=np.int32), 0, 0)
-        # Correct fortran indices
-        S._csr.col = col.astype(np.int32, copy=False) - 1
-        S._csr._nnz = len(col)
-
-        S._csr._D = np.empty([nnz, 1], np.float64)
-        S._csr._D[:, 0] = dS[:]
+        # Read the elements directly into the sparse matrix
+        ptr = csr.ptr
+        for (sl, col), (_, dS) in zip(f.iter_rows(offsets[0], ptr, np.int32),
+                                      f.iter_rows(offsets[1], ptr, np.float64)):
+            # Correct fortran indices
+            csr.col[sl] = col - 1
+            csr._D[sl, 0] = dS
 
         # Convert to sisl supercell
         _csr_from_sc_off(S.geometry, isc, S._csr)
@@ -138,7 +317,16 @@ class tshsSileSiesta(onlysSileSiesta):
     """ Geometry, Hamiltonian and overlap matrix file """
 
     def read_hamiltonian(self, **kwargs):
-        """ Returns the electronic structure from the siesta.TSHS file """
+        """ Returns the electronic structure from the siesta.TSHS file
+
+        Parameters
+        ----------
+        geometry : Geometry, optional
+           the geometry associated with the Hamiltonian
+        memmap : bool or str, optional
+           store the Hamiltonian in memory-mapped arrays (see `SparseCSR.tomemmap`),
+           if a str, the scratch directory is created in this directory
+        """
         tshs_g = self.read_geometry()
         geom = kwargs.get('geometry', tshs_g)
         if geom.na != tshs_g.na or geom.no != tshs_g.no:
@@ -150,48 +338,45 @@ class tshsSileSiesta(onlysSileSiesta):
         if np.any(geom.nsc != tshs_g.nsc):
             geom.set_nsc(tshs_g.nsc)
 
-        # read the sizes used...
-        sizes = _siesta.read_tshs_sizes(self.file)
-        _bin_check(self, 'read_hamiltonian', 'could not read sizes.')
-        isc = _siesta.read_tshs_cell(self.file, sizes[3])[2].T
-        _bin_check(self, 'read_hamiltonian', 'could not read cell.')
-        spin = sizes[0]
-        no = sizes[2]
-        nnz = sizes[4]
-        ncol, col, dH, dS = _siesta.read_tshs_hs(self.file, spin, no, nnz)
-        _bin_check(self, 'read_hamiltonian', 'could not read Hamiltonian and overlap matrix.')
+        f, (spin, no, Ef), ncol, offsets, isc = self._read_tshs('read_hamiltonian')
+        if len(offsets) == 2:
+            raise SileError(str(self) + '.read_hamiltonian the file does not contain a Hamiltonian.')
 
         # Check whether it is an orthogonal basis set
-        orthogonal = np.abs(dS).sum() == geom.no
+        ptr = _a.cumsuml(np.insert(ncol, 0, 0))
+        orthogonal = sum(np.abs(dS).sum() for _, dS in f.iter_rows(offsets[1], ptr, np.float64)) == geom.no
 
         # Create the Hamiltonian container
         H = Hamiltonian(geom, spin, nnzpr=1, orthogonal=orthogonal)
-
-        # Create the new sparse matrix
-        H._csr.ncol = ncol.astype(np.int32, copy=False)
-        H._csr.ptr = np.insert(np.cumsum(ncol, dtype=np.int32), 0, 0)
-        # Correct fortran indices
-        H._csr.col = col.astype(np.int32, copy=False) - 1
-        H._csr._nnz = len(col)
-
-        if orthogonal:
-            H._csr._D = np.empty([nnz, spin], np.float64)
-            H._csr._D[:, :] = dH[:, :]
-        else:
-            H._csr._D = np.empty([nnz, spin+1], np.float64)
-            H._csr._D[:, :spin] = dH[:, :]
-            H._csr._D[:, spin] = dS[:]
+        csr = H._csr
+        _csr_empty(csr, ncol, spin + (not orthogonal), np.float64, kwargs.get('memmap', False))
+
+        # Read the elements directly into the sparse matrix
+        iters = [f.iter_rows(offsets[0], ptr, np.int32)]
+        iters += [f.iter_rows(offset, ptr, np.float64) for offset in offsets[1:]]
+        for blocks in zip(*iters):
+            sl, col = blocks[0]
+            dS = blocks[1][1]
+            # Correct fortran indices
+            col -= 1
+            csr.col[sl] = col
+
+            # Find all indices where dS == 1
+            idx = col[np.isclose(dS, 1.).nonzero()[0]]
+            if np.any(idx >= no):
+                raise SileError(str(self) + '.read_hamiltonian could not assert '
+                                'the supercell connections in the primary unit-cell.')
+
+            for i, (_, dH) in enumerate(blocks[2:]):
+                if i < 2:
+                    # Move to Ef = 0
+                    dH = dH - Ef * dS
+                csr._D[sl, i] = dH * Ry2eV
+            if not orthogonal:
+                csr._D[sl, spin] = dS
 
         # Convert to sisl supercell
-        _csr_from_sc_off(H.geometry, isc, H._csr)
-
-        # Find all indices where dS == 1 (remember col is in fortran indices)
-        idx = col[np.isclose(dS, 1.).nonzero()[0]]
-        if np.any(idx > no):
-            print('Number of orbitals: {}'.format(no))
-            print(idx)
-            raise SileError(str(self) + '.read_hamiltonian could not assert '
-                            'the supercell connections in the primary unit-cell.')
+        _csr_from_sc_off(H.geometry, isc, csr)
 
         return H
 
@@ -213,7 +398,7 @@ class tshsSileSiesta(onlysSileSiesta):
 
         # Get H and S
         if H.orthogonal:
-            h = (csr._D * eV2Ry).astype(np.float64, 'C', copy=False)
+            h = csr._D
             s = csr.diags(1., dim=1)
             # Ensure all data is correctly formatted (i.e. have the same sparsity pattern
             s.align(csr)
@@ -223,8 +408,27 @@ class tshsSileSiesta(onlysSileSiesta):
                                 'have not been defined, this is a requirement.')
             s = (s._D[:, 0]).astype(np.float64, 'C', copy=False)
         else:
-            h = (csr._D[:, :H.S_idx] * eV2Ry).astype(np.float64, 'C', copy=False)
-            s = (csr._D[:, H.S_idx]).astype(np.float64, 'C', copy=False)
+            h = csr._D[:, :H.S_idx]
+            s = csr._D[:, H.S_idx]
+        col = csr.col
+
+        scratch = csr._scratch
+        if scratch is None:
+            h = (h * eV2Ry).astype(np.float64, 'C', copy=False)
+            s = s.astype(np.float64, 'C', copy=False)
+            col = col + 1
+        else:
+            # Stream the memory-mapped data into memory-mapped arrays
+            # in the layout required by the fortran routine (to not copy them in memory)
+            hm = scratch.empty(h.shape, np.float64, order='F')
+            sm = scratch.empty(s.shape, np.float64)
+            colm = scratch.empty(col.shape, np.int32)
+            for sl in scratch.slices(csr.nnz):
+                hm[sl, :] = h[sl, :] * eV2Ry
+                sm[sl] = s[sl]
+                colm[sl] = col[sl] + 1
+            h, s, col = hm, sm, colm
+            del hm, sm, colm
         # Ensure shapes (say if only 1 spin)
         h.shape = (-1, len(H.spin))
         s.shape = (-1,)
@@ -238,22 +442,50 @@ class tshsSileSiesta(onlysSileSiesta):
         # however, they are both in C-contiguous arrays and this is indeed weird... :(
         _siesta.write_tshs_hs(self.file, nsc[0], nsc[1], nsc[2],
                               cell.T, xyz.T, H.geometry.firsto,
-                              csr.ncol, csr.col + 1, h, s, isc)
+                              csr.ncol, col, h, s, isc)
         _bin_check(self, 'write_hamiltonian', 'could not write Hamiltonian and overlap matrix.')
 
 
 class dmSileSiesta(SileBinSiesta):
     """ Density matrix file """
 
+    def _read_dm(self):
+        """ Open the DM file and locate the sparse matrix records
+
+        Returns
+        -------
+        f : _FortranRecords
+        spin, no, nsc : sizes
+        ncol : number of non-zero elements per row
+        offsets : the offsets of the list_col and DM rows (the record after the rows is the next)
+        """
+        f = _FortranRecords(self.file)
+        sizes = f.read(np.int32)
+        spin, no = sizes[1], sizes[0]
+        if len(sizes) >= 5:
+            nsc = sizes[2:5]
+        else:
+            nsc = _a.zerosi(3)
+        ncol = f.read(np.int32)
+        ptr = _a.cumsuml(np.insert(ncol, 0, 0))
+        offsets = [f.rows(ptr, np.int32)]
+        offsets += [f.rows(ptr, np.float64) for _ in range(spin)]
+        return f, spin, no, nsc, ncol, offsets
+
     def read_density_matrix(self, **kwargs):
-        """ Returns the density matrix from the siesta.DM file """
+        """ Returns the density matrix from the siesta.DM file
 
-        # Now read the sizes used...
-        spin, no, nsc, nnz = _siesta.read_dm_sizes(self.file)
-        _bin_check(self, 'read_density_matrix', 'could not read density matrix sizes.')
+        Parameters
+        ----------
+        geometry : Geometry, optional
+           the geometry associated with the density matrix
+        memmap : bool or str, optional
+           store the density matrix in memory-mapped arrays (see `SparseCSR.tomemmap`),
+           if a str, the scratch directory is created in this directory
+        """
 
-        ncol, col, dDM = _siesta.read_dm(self.file, spin, no, nsc, nnz)
-        _bin_check(self, 'read_density_matrix', 'could not read density matrix.')
+        # Now read the sizes used...
+        f, spin, no, nsc, ncol, offsets = self._read_dm()
 
         # Try and immediately attach a geometry
         geom = kwargs.get('geometry', kwargs.get('geom', None))
@@ -275,21 +507,26 @@ class dmSileSiesta(SileBinSiesta):
 
         # Create the density matrix container
         DM = DensityMatrix(geom, spin, nnzpr=1, dtype=np.float64, orthogonal=False)
-
-        # Create the new sparse matrix
-        DM._csr.ncol = ncol.astype(np.int32, copy=False)
-        DM._csr.ptr = np.insert(np.cumsum(ncol, dtype=np.int32), 0, 0)
-        # Correct fortran indices
-        DM._csr.col = col.astype(np.int32, copy=False) - 1
-        DM._csr._nnz = len(col)
-
-        DM._csr._D = np.empty([nnz, spin+1], np.float64)
-        DM._csr._D[:, :spin] = dDM[:, :]
+        csr = DM._csr
+        _csr_empty(csr, ncol, spin + 1, np.float64, kwargs.get('memmap', False))
+
+        # Read the elements directly into the sparse matrix
+        ptr = csr.ptr
+        iters = [f.iter_rows(offsets[0], ptr, np.int32)]
+        iters += [f.iter_rows(offset, ptr, np.float64) for offset in offsets[1:]]
+        col_max = 0
+        for blocks in zip(*iters):
+            sl, col = blocks[0]
+            col_max = max(col_max, col.max())
+            # Correct fortran indices
+            csr.col[sl] = col - 1
+            for i, (_, dDM) in enumerate(blocks[1:]):
+                csr._D[sl, i] = dDM
         # DM file does not contain overlap matrix... so neglect it for now.
-        DM._csr._D[:, spin] = 0.
+        csr._D[:, spin] = 0.
 
         # Convert the supercells to sisl supercells
-        if nsc[0] != 0 or geom.no_s >= col.max():
+        if nsc[0] != 0 or geom.no_s >= col_max:
             _csr_from_siesta(geom, DM._csr)
         else:
             warn(str(self) + '.read_density_matrix may result in a wrong sparse pattern!')
@@ -326,13 +563,22 @@ class tsdeSileSiesta(dmSileSiesta):
     """ Non-equilibrium density matrix and energy density matrix file """
 
     def read_energy_density_matrix(self, **kwargs):
-        """ Returns the energy density matrix from the siesta.DM file """
+        """ Returns the energy density matrix from the siesta.DM file
+
+        Parameters
+        ----------
+        geometry : Geometry, optional
+           the geometry associated with the energy density matrix
+        memmap : bool or str, optional
+           store the energy density matrix in memory-mapped arrays (see `SparseCSR.tomemmap`),
+           if a str, the scratch directory is created in this directory
+        """
 
         # Now read the sizes used...
-        spin, no, nsc, nnz = _siesta.read_tsde_sizes(self.file)
-        _bin_check(self, 'read_energy_density_matrix', 'could not read energy density matrix sizes.')
-        ncol, col, dEDM = _siesta.read_tsde_edm(self.file, spin, no, nsc, nnz)
-        _bin_check(self, 'read_energy_density_matrix', 'could not read energy density matrix.')
+        f, spin, no, nsc, ncol, offsets = self._read_dm()
+        ptr = _a.cumsuml(np.insert(ncol, 0, 0))
+        offsets += [f.rows(ptr, np.float64) for _ in range(spin)]
+        Ef = f.read(np.float64)[0]
 
         # Try and immediately attach a geometry
         geom = kwargs.get('geometry', kwargs.get('geom', None))
@@ -354,21 +600,26 @@ class tsdeSileSiesta(dmSileSiesta):
 
         # Create the energy density matrix container
         EDM = EnergyDensityMatrix(geom, spin, nnzpr=1, dtype=np.float64, orthogonal=False)
-
-        # Create the new sparse matrix
-        EDM._csr.ncol = ncol.astype(np.int32, copy=False)
-        EDM._csr.ptr = np.insert(np.cumsum(ncol, dtype=np.int32), 0, 0)
-        # Correct fortran indices
-        EDM._csr.col = col.astype(np.int32, copy=False) - 1
-        EDM._csr._nnz = len(col)
-
-        EDM._csr._D = np.empty([nnz, spin+1], np.float64)
-        EDM._csr._D[:, :spin] = dEDM[:, :]
+        csr = EDM._csr
+        _csr_empty(csr, ncol, spin + 1, np.float64, kwargs.get('memmap', False))
+
+        # Read the elements directly into the sparse matrix
+        iters = [f.iter_rows(offsets[0], ptr, np.int32)]
+        iters += [f.iter_rows(offset, ptr, np.float64) for offset in offsets[1:]]
+        col_max = 0
+        for blocks in zip(*iters):
+            sl, col = blocks[0]
+            col_max = max(col_max, col.max())
+            # Correct fortran indices
+            csr.col[sl] = col - 1
+            for i in range(spin):
+                # Move to Ef = 0
+                csr._D[sl, i] = (blocks[1 + spin + i][1] - Ef * blocks[1 + i][1]) * Ry2eV
         # EDM file does not contain overlap matrix... so neglect it for now.
-        EDM._csr._D[:, spin] = 0.
+        csr._D[:, spin] = 0.
 
         # Convert the supercells to sisl supercells
-        if nsc[0] != 0 or geom.no_s >= col.max():
+        if nsc[0] != 0 or geom.no_s >= col_max:
             _csr_from_siesta(geom, EDM._csr)
         else:
             warn(str(self) + '.read_energy_density_matrix may '
@@ -380,20 +631,51 @@ class tsdeSileSiesta(dmSileSiesta):
 class hsxSileSiesta(SileBinSiesta):
     """ Hamiltonian and overlap matrix file """
 
+    def _read_hsx(self):
+        """ Open the HSX file and locate the sparse matrix records
+
+        Returns
+        -------
+        f : _FortranRecords
+        Gamma, spin, no, no_s : sizes
+        ncol : number of non-zero elements per row
+        offsets : the offsets of the list_col, H, S and xij (if not Gamma) rows
+        """
+        f = _FortranRecords(self.file)
+        no, no_s, spin, nnz = f.read(np.int32)
+        Gamma = f.read(np.int32)[0] != 0
+        if not Gamma:
+            f.skip() # indxuo
+        ncol = f.read(np.int32)
+        ptr = _a.cumsuml(np.insert(ncol, 0, 0))
+        offsets = [f.rows(ptr, np.int32)]
+        offsets += [f.rows(ptr, np.float32) for _ in range(spin + 1)]
+        f.skip() # Qtot, temp
+        if not Gamma:
+            offsets.append(f.rows(ptr, np.float32, 3))
+        return f, Gamma, spin, no, no_s, ncol, offsets
+
     def read_hamiltonian(self, **kwargs):
-        """ Returns the electronic structure from the siesta.TSHS file """
+        """ Returns the electronic structure from the siesta.HSX file
+
+        Parameters
+        ----------
+        geometry : Geometry, optional
+           the geometry associated with the Hamiltonian
+        memmap : bool or str, optional
+           store the Hamiltonian in memory-mapped arrays (see `SparseCSR.tomemmap`),
+           if a str, the scratch directory is created in this directory
+        """
 
         # Now read the sizes used...
-        Gamma, spin, no, no_s, nnz = _siesta.read_hsx_sizes(self.file)
-        _bin_check(self, 'read_hamiltonian', 'could not read Hamiltonian sizes.')
-        ncol, col, dH, dS, dxij = _siesta.read_hsx_hsx(self.file, Gamma, spin, no, no_s, nnz)
-        _bin_check(self, 'read_hamiltonian', 'could not read Hamiltonian.')
+        f, Gamma, spin, no, no_s, ncol, offsets = self._read_hsx()
+        ptr = _a.cumsuml(np.insert(ncol, 0, 0))
 
         # Try and immediately attach a geometry
         geom = kwargs.get('geometry', kwargs.get('geom', None))
         if geom is None:
             # We have *no* clue about the
-            if np.allclose(dxij, 0.):
+            if Gamma or all(np.allclose(xij, 0.) for _, xij in f.iter_rows(offsets[-1], ptr, np.float32, 3)):
                 # We truly, have no clue,
                 # Just generate a boxed system
                 xyz = [[x, 0, 0] for x in range(no)]
@@ -409,17 +691,19 @@ class hsxSileSiesta(SileBinSiesta):
 
         # Create the Hamiltonian container
         H = Hamiltonian(geom, spin, nnzpr=1, dtype=np.float32, orthogonal=False)
-
-        # Create the new sparse matrix
-        H._csr.ncol = ncol.astype(np.int32, copy=False)
-        H._csr.ptr = np.insert(np.cumsum(ncol, dtype=np.int32), 0, 0)
-        # Correct fortran indices
-        H._csr.col = col.astype(np.int32, copy=False) - 1
-        H._csr._nnz = len(col)
-
-        H._csr._D = np.empty([nnz, spin+1], np.float32)
-        H._csr._D[:, :spin] = dH[:, :]
-        H._csr._D[:, spin] = dS[:]
+        csr = H._csr
+        _csr_empty(csr, ncol, spin + 1, np.float32, kwargs.get('memmap', False))
+
+        # Read the elements directly into the sparse matrix
+        iters = [f.iter_rows(offsets[0], ptr, np.int32)]
+        iters += [f.iter_rows(offset, ptr, np.float32) for offset in offsets[1:spin + 2]]
+        for blocks in zip(*iters):
+            sl, col = blocks[0]
+            # Correct fortran indices
+            csr.col[sl] = col - 1
+            for i in range(spin):
+                csr._D[sl, i] = blocks[1 + i][1] * Ry2eV
+            csr._D[sl, spin] = blocks[1 + spin][1]
 
         # Convert the supercells to sisl supercells
         if no_s // no == np.product(geom.nsc):
@@ -428,12 +712,18 @@ class hsxSileSiesta(SileBinSiesta):
         return H
 
     def read_overlap(self, **kwargs):
-        """ Returns the overlap matrix from the siesta.HSX file """
+        """ Returns the overlap matrix from the siesta.HSX file
+
+        Parameters
+        ----------
+        geometry : Geometry
+           the geometry associated with the overlap matrix
+        memmap : bool or str, optional
+           store the overlap matrix in memory-mapped arrays (see `SparseCSR.tomemmap`),
+           if a str, the scratch directory is created in this directory
+        """
         # Now read the sizes used...
-        Gamma, spin, no, no_s, nnz = _siesta.read_hsx_sizes(self.file)
-        _bin_check(self, 'read_overlap', 'could not read overlap matrix sizes.')
-        ncol, col, dS = _siesta.read_hsx_s(self.file, Gamma, spin, no, no_s, nnz)
-        _bin_check(self, 'read_overlap', 'could not read overlap matrix.')
+        f, Gamma, spin, no, no_s, ncol, offsets = self._read_hsx()
 
         geom = kwargs.get('geometry', kwargs.get('geom', None))
         if geom is None:
@@ -443,18 +733,18 @@ class hsxSileSiesta(SileBinSiesta):
                             'passed geometry as the number of atoms or orbitals is '
                             'inconsistent with HSX file.')
 
-        # Create the Hamiltonian container
+        # Create the overlap container
         S = SparseOrbitalBZ(geom, nnzpr=1)
+        csr = S._csr
+        _csr_empty(csr, ncol, 1, np.float32, kwargs.get('memmap', False))
 
-        # Create the new sparse matrix
-        S._csr.ncol = ncol.astype(np.int32, copy=False)
-        S._csr.ptr = np.insert(np.cumsum(ncol, dtype=np.int32), 0, 0)
-        # Correct fortran indices
-        S._csr.col = col.astype(np.int32, copy=False) - 1
-        S._csr._nnz = len(col)
-
-        S._csr._D = np.empty([nnz, 1], np.float32)
-        S._csr._D[:, 0] = dS[:]
+        # Read the elements directly into the sparse matrix
+        ptr = csr.ptr
+        for (sl, col), (_, dS) in zip(f.iter_rows(offsets[0], ptr, np.int32),
+                                      f.iter_rows(offsets[1 + spin], ptr, np.float32)):
+            # Correct fortran indices
+            csr.col[sl] = col - 1
+            csr._D[sl, 0] = dS
 
         # Convert the supercells to sisl supercells
         if no_s // no == np.product(geom.nsc):
@@ -479,9 +769,11 @@ class _gridSileSiesta(SileBinSiesta):
 
         return SuperCell(cell)
 
-    def read_grid(self, index=0, *args, **kwargs):
+    def read_grid(self, index=0, region=None, stride=None, *args, **kwargs):
         """ Read grid contained in the Grid file
 
+        Only the records of the requested region are read from the file (through a memory-map).
+
         Parameters
         ----------
         index : int or array_like, optional
@@ -489,38 +781,47 @@ class _gridSileSiesta(SileBinSiesta):
            is passed it refers to the fraction per indexed component. I.e.
            ``[0.5, 0.5]`` will return sum of half the first two components.
            Default to the first component.
+        region : list of (None, int, (int, int) or slice), optional
+           the retained grid points along each lattice vector, see `~sisl.io._help.grid_slices`.
+           The returned grid has its supercell shifted to the first retained grid point.
+        stride : int or (3, ) of int, optional
+           only read every `stride` grid point (along each lattice vector)
         """
         # Read the sizes
         nspin, mesh = _siesta.read_grid_sizes(self.file)
         _bin_check(self, 'read_grid', 'could not read grid sizes.')
-        # Read the cell and grid
-        cell = _siesta.read_grid_cell(self.file)
-        _bin_check(self, 'read_grid', 'could not read grid cell.')
-        grid = _siesta.read_grid(self.file, nspin, mesh[0], mesh[1], mesh[2])
-        _bin_check(self, 'read_grid', 'could not read grid.')
+        sc = self.read_supercell()
+        slices = grid_slices(mesh, region, stride)
+        sx, sy, sz = slices
+
+        # The grid is stored as one record per (y, z, spin) of all x-values:
+        #   cell(3, 3) ; mesh(3), nspin ; grid(:, iy, iz, is)
+        # Map the records, including the record markers (same size as the values)
+        offset = _record_nbytes(72) + _record_nbytes(16)
+        grid = np.memmap(str(self.file), dtype=np.float32, mode='r', offset=offset,
+                         shape=(nspin, mesh[2], mesh[1], mesh[0] + 2))
+        if grid[0, 0, 0, :1].view(np.int32)[0] != mesh[0] * 4:
+            raise SileError(str(self) + '.read_grid could not read grid, wrong record size.')
+        # Skip the record markers
+        sx = slice(sx.start + 1, sx.stop + 1, sx.step)
 
         if isinstance(index, Integral):
-            grid = grid[:, :, :, index]
+            g = grid[index, sz, sy, sx] * self.grid_unit
         else:
             if len(index) > grid.shape[0]:
                 raise ValueError(self.__class__.__name__ + '.read_grid requires spin to be an integer or '
                                  'an array of length equal to the number of spin components.')
-            # It is F-contiguous, hence the last index
-            g = grid[:, :, :, 0] * index[0]
+            g = grid[0, sz, sy, sx] * (index[0] * self.grid_unit)
             for i, scale in enumerate(index[1:]):
-                g += grid[:, :, :, 1+i] * scale
-            grid = g
-
-        cell = np.array(cell.T, np.float64)
-        cell.shape = (3, 3)
+                g += grid[1+i, sz, sy, sx] * (scale * self.grid_unit)
+        del grid
 
         # Simply create the grid (with no information)
         # We will overwrite the actual grid
-        g = Grid([1, 1, 1], sc=SuperCell(cell))
-        # NOTE: there is no need to swap-axes since the returned array is in F ordering
-        #       and thus the first axis is the fast (x, y, z) is retained
-        g.grid = (grid * self.grid_unit).astype(dtype=np.float32, order='C', copy=False)
-        return g
+        grid = Grid([1, 1, 1], sc=grid_supercell(sc, mesh, slices))
+        # The file is stored with x as the fastest index, hence (z, y, x)
+        grid.grid = np.transpose(g, (2, 1, 0)).astype(dtype=np.float32, order='C')
+        return grid
 
 
 class _gfSileSiesta(SileBinSiesta):
@@ -548,11 +849,44 @@ class _gfSileSiesta(SileBinSiesta):
     ...        if new_k:
     ...            f.write_hamiltonian(H, S)
     ...        f.write_self_energy(SeHSE)
+
+    Alternatively the individual blocks may be accessed directly by specifying the spin, k-point
+    and energy (index). Reading a single block does not require scanning the file and
+    blocks may be written in any order, e.g. from a pool of workers:
+
+    >>> with sisl.io._gfSileSiesta('hello.GF') as f:
+    ...    f.write_header(bz, E)
+    ...    def calc(ik):
+    ...        f.write_hamiltonian(H, S, ispin=0, k=ik)
+    ...        for iE in range(len(E)):
+    ...            f.write_self_energy(SeHSE, ispin=0, k=ik, E=iE)
+    ...    ThreadPool(4).map(calc, range(len(bz)))
+
+    and subsequently
+
+    >>> with sisl.io._gfSileSiesta('hello.GF') as f:
+    ...    H, S = f.read_hamiltonian(ispin=0, k=2)
+    ...    SeHSE = f.read_self_energy(ispin=0, k=2, E=0.1)
+
+    Blocks read this way are retained in a (least recently used) cache of at most
+    ``_cache_nbytes`` bytes such that repeated reads of the same blocks are cheap.
     """
+    _cache_nbytes = 2 ** 28
 
     def _setup(self, *args, **kwargs):
         """ Simple setup that needs to be overwritten """
         self._iu = -1
+        # File handle for random access of the blocks
+        self._rfh = None
+        self._lock = Lock()
+
+    def __exit__(self, type, value, traceback):
+        self.close()
+        return False
+
+    def close(self):
+        """ Close the file (both sequential and random access) """
+        self._close_gf()
 
     def _is_open(self):
         return self._iu != -1
@@ -568,29 +902,181 @@ class _gfSileSiesta(SileBinSiesta):
         self._ie = 0
         self._ik = 0
 
-    def _close_gf(self):
-        if not self._is_open():
+    def _close_gf(self, clean=True):
+        if self._is_open():
+            # Close it
+            _siesta.close_gf(self._iu)
+            self._iu = -1
+        elif self._rfh is None:
+            return
+        if not clean:
             return
-        # Close it
-        _siesta.close_gf(self._iu)
-        self._iu = -1
+
+        if self._rfh is not None:
+            self._rfh.close()
+            self._rfh = None
 
         # Clean variables
-        del self._ie
-        del self._ik
-        try:
-            del self._E
-            del self._k
-        except:
-            pass
-        try:
-            del self._no_u
-        except:
-            pass
-        try:
-            del self._nspin
-        except:
-            pass
+        for attr in ['_ie', '_ik', '_E', '_k', '_no_u', '_nspin', '_header_nbytes', '_cache']:
+            try:
+                delattr(self, attr)
+            except AttributeError:
+                pass
+
+    def _open_random(self, write=False):
+        """ Open the file for random access of the individual blocks """
+        if not hasattr(self, '_E'):
+            if write:
+                raise SileError(str(self) + '.write_* requires write_header to be called first.')
+            self.read_header()
+        # Release the Fortran unit (this also flushes the header when writing)
+        self._close_gf(clean=False)
+        if self._rfh is None or (write and not self._rfh.writable()):
+            if self._rfh is not None:
+                self._rfh.close()
+            self._rfh = io.open(self.file, 'r+b' if write else 'rb')
+            self._header_nbytes = self._read_header_nbytes()
+        if not hasattr(self, '_cache'):
+            self._cache = OrderedDict()
+
+    def _read_header_nbytes(self):
+        """ Number of bytes used by the header records """
+        fh = self._rfh
+        fh.seek(0)
+        # nspin+cell, na_u+no_u, na_used+no_used, xa+lasto, bloch, mu, nkpt, kpt+w, NE, E
+        for _ in range(10):
+            n = struct.unpack('i', fh.read(4))[0]
+            fh.seek(n + 4, 1)
+        return fh.tell()
+
+    def _read_record(self, offset, nbytes):
+        """ Read the content of the record starting at `offset` (possibly split in sub-records) """
+        fh = self._rfh
+        fh.seek(offset)
+        data = bytearray(nbytes)
+        view = memoryview(data)
+        i = 0
+        n = -1
+        while n < 0:
+            n = struct.unpack('i', fh.read(4))[0]
+            fh.readinto(view[i:i + abs(n)])
+            i += abs(n)
+            fh.seek(4, 1)
+        if i != nbytes:
+            raise SileError(str(self) + ' could not read record at byte {}.'.format(offset))
+        return data
+
+    def _write_record(self, offset, data):
+        """ Write `data` as a record starting at `offset`, returns the offset of the next record """
+        fh = self._rfh
+        fh.seek(offset)
+        if isinstance(data, np.ndarray):
+            data = data.view(np.uint8).ravel()
+        data = memoryview(data)
+        n = len(data)
+        i = 0
+        while True:
+            m = min(n - i, _MAX_SUBRECORD)
+            # A negative marker signals continuation (leading) or a continued record (trailing)
+            fh.write(struct.pack('i', m if i + m >= n else -m))
+            fh.write(data[i:i + m])
+            fh.write(struct.pack('i', m if i == 0 else -m))
+            i += m
+            if i >= n:
+                break
+        return fh.tell()
+
+    def _offset(self, ispin, ik, iE=-1):
+        """ Byte offset of the k-point block (``iE < 0``) or the self-energy block (``iE >= 0``)
+
+        For the k-point block (and ``iE > 0``) the offset is that of the (ik, iE, E) record.
+        """
+        rinfo = _record_nbytes(24)
+        rmat = _record_nbytes(16 * self._no_u ** 2)
+        nk = len(self._k)
+        ne = len(self._E)
+        # info, H, S, SE[0] and then info, SE[iE] for the remaining energies
+        kblock = rinfo + 3 * rmat + (ne - 1) * (rinfo + rmat)
+        offset = int(self._header_nbytes) + (ispin * nk + ik) * kblock
+        if iE < 0:
+            return offset
+        elif iE == 0:
+            return offset + rinfo + 2 * rmat
+        return offset + rinfo + 3 * rmat + (iE - 1) * (rinfo + rmat)
+
+    def _index(self, ispin, k, E=0):
+        """ Convert the spin, k-point and energy specification to indices """
+        nspin = 1 if self._nspin > 2 else self._nspin
+        ispin = 0 if ispin is None else ispin
+        ik = self.kindex(0 if k is None else k)
+        iE = self.Eindex(0 if E is None else E)
+        if not 0 <= ispin < nspin:
+            raise ValueError(self.__class__.__name__ + ' spin index {} is out of range [0, {}['.format(ispin, nspin))
+        if not 0 <= ik < len(self._k):
+            raise ValueError(self.__class__.__name__ + ' k-point index {} is out of range [0, {}['.format(ik, len(self._k)))
+        if not 0 <= iE < len(self._E):
+            raise ValueError(self.__class__.__name__ + ' energy index {} is out of range [0, {}['.format(iE, len(self._E)))
+        return ispin, ik, iE
+
+    def _cache_get(self, key):
+        data = self._cache.pop(key, None)
+        if data is not None:
+            # Re-insert to mark it as the most recently used
+            self._cache[key] = data
+        return data
+
+    def _cache_add(self, key, data):
+        nbytes = sum(d.nbytes for d in data)
+        if nbytes > self._cache_nbytes:
+            return
+        self._cache[key] = data
+        nbytes = sum(d.nbytes for v in self._cache.values() for d in v)
+        while nbytes > self._cache_nbytes:
+            _, v = self._cache.popitem(last=False)
+            nbytes -= sum(d.nbytes for d in v)
+
+    def kindex(self, k):
+        """ Return the index of the k-point that is closests to the queried k-point (in reduced coordinates)
+
+        Parameters
+        ----------
+        k : int or array_like of float
+           if ``int``, return it-self, else the queried k-point in reduced coordinates
+        """
+        if isinstance(k, Integral):
+            return k
+        ik = np.sum(np.abs(self._k - _a.asarrayd(k)[None, :]), axis=1).argmin()
+        ret_k = self._k[ik, :]
+        if not np.allclose(ret_k, k, atol=0.0001):
+            warn(self.__class__.__name__ + " requesting k-point " +
+                 "[{0:.3f}, {1:.3f}, {2:.3f}]".format(*k) +
+                 " found " +
+                 "[{0:.3f}, {1:.3f}, {2:.3f}]".format(*ret_k))
+        return ik
+
+    def Eindex(self, E):
+        """ Return the index of the energy that is closests to the queried energy
+
+        Parameters
+        ----------
+        E : int or float or complex
+           if ``int``, return it-self, else the energy [eV]. If real, only the real part
+           of the energies in the file are compared.
+        """
+        if isinstance(E, Integral):
+            return E
+        e = self._E * Ry2eV
+        if not np.iscomplexobj(E):
+            e = e.real
+        iE = np.abs(e - E).argmin()
+        ret_E = e[iE]
+        if abs(ret_E - E) > 5e-3:
+            warn(self.__class__.__name__ + " requesting energy " +
+                 "{0:.5f} eV, found {1:.5f} eV as the closest energy!".format(E, ret_E))
+        elif abs(ret_E - E) > 1e-3:
+            info(self.__class__.__name__ + " requesting energy " +
+                 "{0:.5f} eV, found {1:.5f} eV as the closest energy!".format(E, ret_E))
+        return iE
 
     def read_header(self):
         """ Read the header of the file and open it for reading subsequently
@@ -653,22 +1139,48 @@ class _gfSileSiesta(SileBinSiesta):
 
         return mem
 
-    def read_hamiltonian(self):
+    def read_hamiltonian(self, ispin=None, k=None):
         """ Return current Hamiltonian and overlap matrix from the GF file
 
+        If neither `ispin` nor `k` is specified the next Hamiltonian in the file is read
+        (sequential access), otherwise the requested Hamiltonian is read directly.
+
+        Parameters
+        ----------
+        ispin : int, optional
+           spin index, defaults to 0 when `k` is specified
+        k : int or array_like, optional
+           k-point index or k-point in reduced coordinates, defaults to 0 when `ispin` is specified
+
         Returns
         -------
         complex128 : Hamiltonian matrix
         complex128 : Overlap matrix
         """
-        self._ik += 1
-        self._ie = 1
-
-        H, S = _siesta.read_gf_hs(self._iu, self._no_u)
-        _bin_check(self, 'read_hamiltonian', 'could not read Hamiltonian and overlap matrices.')
-        return H.T * Ry2eV, S.T
-
-    def read_self_energy(self):
+        if ispin is None and k is None:
+            self._ik += 1
+            self._ie = 1
+
+            H, S = _siesta.read_gf_hs(self._iu, self._no_u)
+            _bin_check(self, 'read_hamiltonian', 'could not read Hamiltonian and overlap matrices.')
+            return H.T * Ry2eV, S.T
+
+        with self._lock:
+            self._open_random()
+            ispin, ik, _ = self._index(ispin, k)
+            key = ('HS', ispin, ik)
+            HS = self._cache_get(key)
+            if HS is None:
+                no = self._no_u
+                offset = self._offset(ispin, ik) + _record_nbytes(24)
+                H = np.frombuffer(self._read_record(offset, 16 * no ** 2), np.complex128).reshape(no, no) * Ry2eV
+                offset += _record_nbytes(16 * no ** 2)
+                S = np.frombuffer(self._read_record(offset, 16 * no ** 2), np.complex128).reshape(no, no)
+                HS = (H, S)
+                self._cache_add(key, HS)
+        return HS[0].copy(), HS[1].copy()
+
+    def read_self_energy(self, ispin=None, k=None, E=None):
         r""" Read the currently reached bulk self-energy
 
         The returned self-energy is:
@@ -676,14 +1188,41 @@ class _gfSileSiesta(SileBinSiesta):
         .. math::
             \boldsymbol \Sigma_{\mathrm{bulk}}(E) = \mathbf S E - \mathbf H - \boldsymbol \Sigma(E)
 
+        If none of `ispin`, `k` or `E` are specified the next self-energy in the file is read
+        (sequential access), otherwise the requested self-energy is read directly.
+
+        Parameters
+        ----------
+        ispin : int, optional
+           spin index, defaults to 0
+        k : int or array_like, optional
+           k-point index or k-point in reduced coordinates, defaults to 0
+        E : int or float or complex, optional
+           energy index or energy [eV], defaults to 0
+
         Returns
         -------
         complex128 : Self-energy matrix
         """
-        SE = _siesta.read_gf_se(self._iu, self._no_u, self._ie).T * Ry2eV
-        _bin_check(self, 'read_self_energy', 'could not read self-energy.')
-        self._ie += 1
-        return SE
+        if ispin is None and k is None and E is None:
+            SE = _siesta.read_gf_se(self._iu, self._no_u, self._ie).T * Ry2eV
+            _bin_check(self, 'read_self_energy', 'could not read self-energy.')
+            self._ie += 1
+            return SE
+
+        with self._lock:
+            self._open_random()
+            ispin, ik, iE = self._index(ispin, k, E)
+            key = ('SE', ispin, ik, iE)
+            SE = self._cache_get(key)
+            if SE is None:
+                no = self._no_u
+                offset = self._offset(ispin, ik, iE)
+                if iE > 0:
+                    offset += _record_nbytes(24)
+                SE = (np.frombuffer(self._read_record(offset, 16 * no ** 2), np.complex128).reshape(no, no) * Ry2eV, )
+                self._cache_add(key, SE)
+        return SE[0].copy()
 
     def write_header(self, bz, E, mu=0., obj=None):
         """ Write to the binary file the header of the file
@@ -744,9 +1283,14 @@ class _gfSileSiesta(SileBinSiesta):
                                 bloch, 0, mu, k.T, w, self._E, **sizes)
         _bin_check(self, 'write_header', 'could not write header information.')
 
-    def write_hamiltonian(self, H, S=None):
+    def write_hamiltonian(self, H, S=None, ispin=None, k=None):
         """ Write the current energy, k-point and H and S to the file
 
+        If neither `ispin` nor `k` is specified the Hamiltonian is written as the next
+        entry in the file (sequential access), otherwise it is written directly to
+        the block of the requested k-point. In the latter case the blocks may be written
+        in any order and concurrently (from multiple threads).
+
         Parameters
         ----------
         H : matrix
@@ -754,18 +1298,37 @@ class _gfSileSiesta(SileBinSiesta):
         S : matrix, optional
            a square matrix corresponding to the overlap, for efficiency reasons
            it may be advantageous to specify this argument for orthogonal cells.
+        ispin : int, optional
+           spin index, defaults to 0 when `k` is specified
+        k : int or array_like, optional
+           k-point index or k-point in reduced coordinates, defaults to 0 when `ispin` is specified
         """
-        self._ik += 1
-        self._ie = 1
         no = len(H)
         if S is None:
             S = np.eye(no, dtype=np.complex128)
+        if not (ispin is None and k is None):
+            H = np.ascontiguousarray(H * eV2Ry, dtype=np.complex128)
+            S = np.ascontiguousarray(S, dtype=np.complex128)
+            with self._lock:
+                self._open_random(write=True)
+                ispin, ik, _ = self._index(ispin, k)
+                if no != self._no_u:
+                    raise ValueError(self.__class__.__name__ + '.write_hamiltonian matrix size does not match the header.')
+                self._cache.pop(('HS', ispin, ik), None)
+                offset = self._write_record(self._offset(ispin, ik),
+                                            struct.pack('ii', ik + 1, 1) + np.complex128(self._E[0]).tobytes())
+                offset = self._write_record(offset, H)
+                self._write_record(offset, S)
+            return
+
+        self._ik += 1
+        self._ie = 1
         _siesta.write_gf_hs(self._iu, self._ik, self._ie, self._E[self._ie-1],
                             H.astype(np.complex128, 'C', copy=False).T * eV2Ry,
                             S.astype(np.complex128, 'C', copy=False).T, no_u=no)
         _bin_check(self, 'write_hamiltonian', 'could not write Hamiltonian and overlap matrices.')
 
-    def write_self_energy(self, SE):
+    def write_self_energy(self, SE, ispin=None, k=None, E=None):
         r""" Write the current self energy, k-point and H and S to the file
 
         The self-energy must correspond to the *bulk* self-energy
@@ -773,12 +1336,38 @@ class _gfSileSiesta(SileBinSiesta):
         .. math::
             \boldsymbol \Sigma_{\mathrm{bulk}}(E) = \mathbf S E - \mathbf H - \boldsymbol \Sigma(E)
 
+        If none of `ispin`, `k` or `E` are specified the self-energy is written as the next
+        entry in the file (sequential access), otherwise it is written directly to
+        the requested block. In the latter case the blocks may be written
+        in any order and concurrently (from multiple threads).
+
         Parameters
         ----------
         SE : matrix
            a square matrix corresponding to the self-energy (Green function)
+        ispin : int, optional
+           spin index, defaults to 0
+        k : int or array_like, optional
+           k-point index or k-point in reduced coordinates, defaults to 0
+        E : int or float or complex, optional
+           energy index or energy [eV], defaults to 0
         """
         no = len(SE)
+        if not (ispin is None and k is None and E is None):
+            SE = np.ascontiguousarray(SE * eV2Ry, dtype=np.complex128)
+            with self._lock:
+                self._open_random(write=True)
+                ispin, ik, iE = self._index(ispin, k, E)
+                if no != self._no_u:
+                    raise ValueError(self.__class__.__name__ + '.write_self_energy matrix size does not match the header.')
+                self._cache.pop(('SE', ispin, ik, iE), None)
+                offset = self._offset(ispin, ik, iE)
+                if iE > 0:
+                    offset = self._write_record(offset, struct.pack('ii', ik + 1, iE + 1) +
+                                                np.complex128(self._E[iE]).tobytes())
+                self._write_record(offset, SE)
+            return
+
         _siesta.write_gf_se(self._iu, self._ik, self._ie,
                             self._E[self._ie-1],
                             SE.astype(np.complex128, 'C', copy=False).T * eV2Ry, no_u=no)
@@ -2,6 +2,8 @@ from __future__ import print_function, division
 
 import warnings
 from datetime import datetime
+from collections import OrderedDict
+import os
 import numpy as np
 
 from sisl import constant
@@ -42,6 +44,37 @@ _LOGICAL = _LOGICAL_FALSE + _LOGICAL_TRUE
 
 Bohr2Ang = unit_convert('Bohr', 'Ang')
 
+# Index of the labels in fdf files (see `fdfSileSiesta._label_index`)
+# Each entry is keyed by the (absolute) file name and the base directory
+_LABEL_INDEX = OrderedDict()
+_LABEL_INDEX_SIZE = 256
+
+
+def _tolabel(label):
+    """ Normalized fdf label (case-insensitive and ignoring ``_``, ``-`` and ``.``) """
+    return label.lower().replace('_', '').replace('-', '').replace('.', '')
+
+
+def _stamp(f):
+    """ Modification stamp of file `f` (``None`` if it does not exist)
+
+    The stamp uses the nano-second modification time (when available), the size
+    and the inode, the latter catches files being replaced.
+    """
+    try:
+        st = os.stat(f)
+    except OSError:
+        return None
+    return getattr(st, 'st_mtime_ns', st.st_mtime), st.st_size, st.st_ino
+
+
+def _invalidate_label_index(f):
+    """ Remove all label indices which depend on the file `f` """
+    f = os.path.abspath(f)
+    for key, (stamps, _) in list(_LABEL_INDEX.items()):
+        if any(os.path.abspath(sf) == f for sf, _ in stamps):
+            del _LABEL_INDEX[key]
+
 
 class fdfSileSiesta(SileSiesta):
     """ FDF-input file
@@ -79,6 +112,13 @@ class fdfSileSiesta(SileSiesta):
         # This is because fdf enables inclusion of other files
         self._parent_fh = []
 
+    def __exit__(self, type, value, traceback):
+        ret = super(fdfSileSiesta, self).__exit__(type, value, traceback)
+        if self._mode != 'r':
+            # The content may have changed (any mode but reading)
+            _invalidate_label_index(self.file)
+        return ret
+
     def _pushfile(self, f):
         if isfile(self.dir_file(f)):
             self._parent_fh.append(self.fh)
@@ -135,7 +175,92 @@ class fdfSileSiesta(SileSiesta):
 
         return includes
 
-    @sile_fh_open()
+    def _build_label_index(self):
+        """ Read the file (and included files) once and index the first occurence of all labels
+
+        Returns
+        -------
+        index : dict
+           normalized label to a tuple of the value and the file name containing the label.
+           The value is a `str` for labels, a `list` for blocks and a tuple ``('<', file)``
+           or ``('%block<', file)`` for labels or blocks piped from another file.
+        files : list of str
+           all files that have been read
+        """
+        index = {}
+        files = []
+
+        def read(fname):
+            files.append(fname)
+            with open(fname, 'r') as fh:
+                lines = iter(fh.readlines())
+
+            for line in lines:
+                if starts_with_list(line, self._comment):
+                    continue
+                ls = line.split('#')[0].split()
+                if len(ls) == 0:
+                    continue
+                lsl = list(map(_tolabel, ls))
+
+                # Check if there is a pipe in the line
+                if '<' in lsl:
+                    idx = lsl.index('<')
+                    if lsl[0] == '%block':
+                        # 1. the full block is piped into the label
+                        #    %block Label < file
+                        if len(lsl) > 3:
+                            index.setdefault(lsl[1], (('%block<', self.dir_file(ls[3])), fname))
+                    else:
+                        # 2. labels that should be read from a subsequent file
+                        #    Label1 Label2 < other.fdf
+                        for l in lsl[:idx]:
+                            index.setdefault(l, (('<', self.dir_file(ls[idx+1])), fname))
+
+                elif lsl[0] == '%block':
+                    # Read in the block content
+                    block = []
+                    for l in lines:
+                        if starts_with_list(l, self._comment):
+                            continue
+                        l = l.strip()
+                        if _tolabel(l).startswith('%endblock'):
+                            break
+                        if len(l) > 0:
+                            block.append(l)
+                    if len(lsl) > 1:
+                        index.setdefault(lsl[1], (block, fname))
+
+                elif lsl[0] == '%include':
+                    f = self.dir_file(ls[1])
+                    if isfile(f):
+                        read(f)
+                    else:
+                        warn(str(self) + ' is trying to include file: {} but the file seems not to exist? Will disregard file!'.format(ls[1]))
+
+                else:
+                    index.setdefault(lsl[0], ((' '.join(ls[1:])).strip(), fname))
+
+        read(self.file)
+        return index, files
+
+    def _label_index(self):
+        """ Index of all labels in the file (see `_build_label_index`)
+
+        The index is built once and shared between all `fdfSileSiesta` objects
+        of the same file. It is rebuilt if any of the read files are modified.
+        """
+        key = (os.path.abspath(self.file), self._directory)
+        entry = _LABEL_INDEX.pop(key, None)
+        if entry is None or any(_stamp(f) != stamp for f, stamp in entry[0]):
+            index, files = self._build_label_index()
+            entry = ([(f, _stamp(f)) for f in files], index)
+        # Insert as the most recently used
+        _LABEL_INDEX[key] = entry
+        while len(_LABEL_INDEX) > _LABEL_INDEX_SIZE:
+            _LABEL_INDEX.popitem(last=False)
+        return entry[1]
+
     def _read_label(self, label):
         """ Try and read the first occurence of a key
 
@@ -146,88 +271,30 @@ class fdfSileSiesta(SileSiesta):
         label : str
            label to find in the fdf file
         """
-        self._seek()
-        def tolabel(label):
-            return label.lower().replace('_', '').replace('-', '').replace('.', '')
-        labell = tolabel(label)
-
-        def valid_line(line):
-            ls = line.strip()
-            if len(ls) == 0:
-                return False
-            return not (ls[0] in self._comment)
-
-        def process_line(line):
-            # Split line by spaces
-            ls = line.split()
-            if len(ls) == 0:
-                return None
-
-            # Make a lower equivalent of ls
-            lsl = list(map(tolabel, ls))
-
-            # Check if there is a pipe in the line
-            if '<' in lsl:
-                idx = lsl.index('<')
-                # Now there are two cases
-
-                # 1. It is a block, in which case
-                #    the full block is piped into the label
-                #    %block Label < file
-                if lsl[0] == '%block' and lsl[1] == labell:
-                    # Correct line found
-                    # Read the file content, removing any empty and/or comment lines
-                    lines = open(self.dir_file(ls[3]), 'r').readlines()
-                    return [l.strip() for l in lines if valid_line(l)]
-
-                # 2. There are labels that should be read from a subsequent file
-                #    Label1 Label2 < other.fdf
-                if labell in lsl[:idx]:
-                    # Valid line, read key from other.fdf
-                    return fdfSileSiesta(self.dir_file(ls[idx+1]), base=self._directory)._read_label(label)
-
-                # It is not in this line, either key is
-                # on the RHS of <, or the key could be "block". Say.
-                return None
-
-            # The last case is if the label is the first word on the line
-            # In that case we have found what we are looking for
-            if lsl[0] == labell:
-                return (' '.join(ls[1:])).strip()
-
-            elif lsl[0] == '%block':
-                if lsl[1] == labell:
-                    # Read in the block content
-                    lines = []
+        value = self._label_index().get(_tolabel(label))
+        if value is None:
+            return None
+        value = value[0]
 
-                    # Now read lines
-                    l = self.readline().strip()
-                    while not tolabel(l).startswith('%endblock'):
-                        if len(l) > 0:
-                            lines.append(l)
-                        l = self.readline().strip()
-                    return lines
+        if isinstance(value, list):
+            # Do not return the indexed block
+            return value[:]
 
-            elif lsl[0] == '%include':
+        elif isinstance(value, tuple):
+            if value[0] == '<':
+                return fdfSileSiesta(value[1], base=self._directory)._read_label(label)
 
-                # We have to open a new file
-                self._pushfile(ls[1])
+            def valid_line(line):
+                ls = line.strip()
+                if len(ls) == 0:
+                    return False
+                return not (ls[0] in self._comment)
 
-            return None
+            # Read the file content, removing any empty and/or comment lines
+            with open(value[1], 'r') as fh:
+                return [l.strip() for l in fh.readlines() if valid_line(l)]
 
-        # Perform actual reading of line
-        l = self.readline().split('#')[0]
-        if len(l) == 0:
-            return None
-        l = process_line(l)
-        while l is None:
-            l = self.readline().split('#')[0]
-            if len(l) == 0:
-                if not self._popfile():
-                    return None
-            l = process_line(l)
-
-        return l
+        return value
 
     @classmethod
     def _type(cls, value):
@@ -277,7 +344,6 @@ class fdfSileSiesta(SileSiesta):
 
         return 'n'
 
-    @sile_fh_open()
     def type(self, label):
         """ Return the type of the fdf-keyword
 
@@ -286,10 +352,8 @@ class fdfSileSiesta(SileSiesta):
         label : str
             the label to look-up
         """
-        self._seek()
         return self._type(self._read_label(label))
 
-    @sile_fh_open()
     def get(self, label, default=None, unit=None, with_unit=False):
         """ Retrieve fdf-keyword from the file
 
@@ -395,16 +459,10 @@ class fdfSileSiesta(SileSiesta):
         top_file = self.file
 
         # 1. find the old value, and thus the file in which it is found
-        with self:
-            try:
-                self.get(key)
-                # Get the file of the containing data
-                top_file = self.fh.name
-            except:
-                pass
-
-        # Ensure that all files are closed
-        self._seek()
+        try:
+            top_file = self._label_index()[_tolabel(key)][1]
+        except:
+            pass
 
         # Now we should re-read and edit the file
         lines = open(top_file, 'r').readlines()
@@ -433,6 +491,8 @@ class fdfSileSiesta(SileSiesta):
                 else:
                     fh.write(line)
 
+        _invalidate_label_index(top_file)
+
     @staticmethod
     def print(key, value):
         """ Return a string which is pretty-printing the key+value """
@@ -6,6 +6,7 @@ import numpy as np
 
 from .sile import SileCDFSiesta
 from ..sile import *
+from .._help import grid_slices, grid_supercell
 
 from sisl.messages import info
 from sisl import SuperCell, Grid
@@ -43,7 +44,7 @@ class gridncSileSiesta(SileCDFSiesta):
         v.unit = 'Bohr'
         v[:, :] = sc.cell[:, :] / Bohr2Ang
 
-    def read_grid(self, spin=0, name='gridfunc', *args, **kwargs):
+    def read_grid(self, spin=0, name='gridfunc', region=None, stride=None, *args, **kwargs):
         """ Reads a grid in the current Siesta.grid.nc file
 
         Enables the reading and processing of the grids created by Siesta
@@ -54,6 +55,12 @@ class gridncSileSiesta(SileCDFSiesta):
             specify the retrieved values
         name : str, optional
             the name for the grid-function (do not supply for standard Siesta output)
+        region : list of (None, int, (int, int) or slice), optional
+            the retained grid points along each lattice vector, see `~sisl.io._help.grid_slices`.
+            Only this hyperslab is read from the file and the returned grid has its
+            supercell shifted to the first retained grid point.
+        stride : int or (3, ) of int, optional
+            only read every `stride` grid point (along each lattice vector)
         """
         # Determine the name of this file
         f = osp.basename(self.file)
@@ -85,13 +92,16 @@ class gridncSileSiesta(SileCDFSiesta):
         else:
             show_info = False
 
-        # Swap as we swap back in the end
-        sc = self.read_supercell().swapaxes(0, 2)
-
         # Create the grid
         nx = len(self._dimension('n1'))
         ny = len(self._dimension('n2'))
         nz = len(self._dimension('n3'))
+        slices = grid_slices([nx, ny, nz], region, stride)
+        # Swap as we swap back in the end
+        sc = grid_supercell(self.read_supercell(), [nx, ny, nz], slices).swapaxes(0, 2)
+        # The grid is stored with x as the fastest index
+        sx, sy, sz = slices
+        nx, ny, nz = [len(range(sl.start, sl.stop, sl.step)) for sl in slices]
 
         if name is None:
             v = self._variable('gridfunc')
@@ -102,16 +112,16 @@ class gridncSileSiesta(SileCDFSiesta):
         grid = Grid([nz, ny, nx], bc=Grid.PERIODIC, sc=sc, dtype=v.dtype)
 
         if v.ndim == 3:
-            grid.grid[:, :, :] = v[:, :, :] * unit
+            grid.grid[:, :, :] = v[sz, sy, sx] * unit
         elif isinstance(spin, Integral):
-            grid.grid[:, :, :] = v[spin, :, :, :] * unit
+            grid.grid[:, :, :] = v[spin, sz, sy, sx] * unit
         else:
             if len(spin) > v.shape[0]:
                 raise SileError(self.__class__.__name__ + '.read_grid requires spin to be an integer or '
                                 'an array of length equal to the number of spin components.')
-            grid.grid[:, :, :] = v[0, :, :, :] * spin[0] * unit
+            grid.grid[:, :, :] = v[0, sz, sy, sx] * spin[0] * unit
             for i, scale in enumerate(spin[1:]):
-                grid.grid[:, :, :] += v[1+i, :, :, :] * scale * unit
+                grid.grid[:, :, :] += v[1+i, sz, sy, sx] * scale * unit
         if show_info:
             info(self.__class__.__name__ + '.read_grid cannot determine the units of the grid. '
                  'The units may not be in sisl units.')
@@ -5,6 +5,7 @@ import numpy as np
 
 from .sile import SileCDFSiesta
 from ..sile import *
+from .._help import grid_slices, grid_supercell
 
 from sisl._array import aranged
 from sisl.unit.siesta import unit_convert
@@ -307,7 +308,7 @@ class ncSileSiesta(SileCDFSiesta):
 
         return grids
 
-    def read_grid(self, name, spin=0):
+    def read_grid(self, name, spin=0, region=None, stride=None):
         """ Reads a grid in the current Siesta.nc file
 
         Enables the reading and processing of the grids created by Siesta
@@ -321,6 +322,12 @@ class ncSileSiesta(SileCDFSiesta):
            is passed it refers to the fraction per indexed component. I.e.
            ``[0.5, 0.5]`` will return sum of half the first two components.
            Default to the first component.
+        region : list of (None, int, (int, int) or slice), optional
+           the retained grid points along each lattice vector, see `~sisl.io._help.grid_slices`.
+           Only this hyperslab is read from the file and the returned grid has its
+           supercell shifted to the first retained grid point.
+        stride : int or (3, ) of int, optional
+           only read every `stride` grid point (along each lattice vector)
         """
         geom = self.read_geometry()
 
@@ -331,6 +338,13 @@ class ncSileSiesta(SileCDFSiesta):
         nx = len(g.dimensions['nx'])
         ny = len(g.dimensions['ny'])
         nz = len(g.dimensions['nz'])
+        slices = grid_slices([nx, ny, nz], region, stride)
+        if region is not None or stride is not None:
+            geom = geom.copy()
+            geom.set_supercell(grid_supercell(geom.sc, [nx, ny, nz], slices))
+        # The grid is stored with x as the fastest index
+        sx, sy, sz = slices
+        nx, ny, nz = [len(range(sl.start, sl.stop, sl.step)) for sl in slices]
 
         # Shorthand variable name
         v = g.variables[name]
@@ -350,17 +364,17 @@ class ncSileSiesta(SileCDFSiesta):
                 'Chlocal': 1. / BohrC2AngC,
         }.get(name, 1.)
 
-        if len(v[:].shape) == 3:
-            grid.grid = v[:, :, :] * unit
+        if v.ndim == 3:
+            grid.grid = v[sz, sy, sx] * unit
         elif isinstance(spin, Integral):
-            grid.grid = v[spin, :, :, :] * unit
+            grid.grid = v[spin, sz, sy, sx] * unit
         else:
             if len(spin) > v.shape[0]:
                 raise SileError(self.__class__.__name__ + '.read_grid requires spin to be an integer or '
                                 'an array of length equal to the number of spin components.')
-            grid.grid[:, :, :] = v[0, :, :, :] * (spin[0] * unit)
+            grid.grid[:, :, :] = v[0, sz, sy, sx] * (spin[0] * unit)
             for i, scale in enumerate(spin[1:]):
-                grid.grid[:, :, :] += v[1+i, :, :, :] * (scale * unit)
+                grid.grid[:, :, :] += v[1+i, sz, sy, sx] * (scale * unit)
 
         try:
             if v.unit == 'Ry':
@@ -488,21 +502,30 @@ class ncSileSiesta(SileCDFSiesta):
         # Create basis group
         sp = self._crt_grp(self, 'SPARSE')
 
+        # Memory-mapped sparse matrices are written in blocks
+        if csr._scratch is None:
+            slices = [slice(None)]
+            chunk = len(csr.col)
+        else:
+            slices = list(csr._scratch.slices(len(csr.col)))
+            chunk = min(len(csr.col), csr._scratch.block)
+
         self._crt_dim(sp, 'nnzs', csr.col.shape[0])
         v = self._crt_var(sp, 'n_col', 'i4', ('no_u',))
         v.info = "Number of non-zero elements per row"
         v[:] = csr.ncol[:]
         v = self._crt_var(sp, 'list_col', 'i4', ('nnzs',),
-                          chunksizes=(len(csr.col),), **self._cmp_args)
+                          chunksizes=(chunk,), **self._cmp_args)
         v.info = "Supercell column indices in the sparse format"
-        v[:] = csr.col[:] + 1  # correct for fortran indices
+        for sl in slices:
+            v[sl] = csr.col[sl] + 1  # correct for fortran indices
         v = self._crt_var(sp, 'isc_off', 'i4', ('n_s', 'xyz'))
         v.info = "Index of supercell coordinates"
         v[:, :] = _siesta.siesta_sc_off(*H.geometry.nsc).T
 
         # Save tight-binding parameters
         v = self._crt_var(sp, 'S', 'f8', ('nnzs',),
-                          chunksizes=(len(csr.col),), **self._cmp_args)
+                          chunksizes=(chunk,), **self._cmp_args)
         v.info = "Overlap matrix"
         if H.orthogonal:
             # We need to create the orthogonal pattern
@@ -521,13 +544,15 @@ class ncSileSiesta(SileCDFSiesta):
             v[:] = tmp._D[:, 0]
             del tmp
         else:
-            v[:] = csr._D[:, H.S_idx]
+            for sl in slices:
+                v[sl] = csr._D[sl, H.S_idx]
         v = self._crt_var(sp, 'H', 'f8', ('spin', 'nnzs'),
-                          chunksizes=(1, len(csr.col)), **self._cmp_args)
+                          chunksizes=(1, chunk), **self._cmp_args)
         v.info = "Hamiltonian"
         v.unit = "Ry"
         for i in range(len(H.spin)):
-            v[i, :] = csr._D[:, i] / Ry2eV
+            for sl in slices:
+                v[i, sl] = csr._D[sl, i] / Ry2eV
 
         # Create the settings
         st = self._crt_grp(self, 'SETTINGS')
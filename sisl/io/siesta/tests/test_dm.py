@@ -21,3 +21,19 @@ def test_si_pdos_kgrid_dm(sisl_files):
 
     assert DM1._csr.spsame(DM2._csr)
     assert np.allclose(DM1._csr._D, DM2._csr._D)
+
+
+def test_dm_memmap(sisl_tmp):
+    g = sisl.geom.graphene().tile(2, 0)
+    DM = sisl.DensityMatrix(g, spin=sisl.Spin('P'))
+    DM.construct([(0.1, 1.5), ([0.4, 0.3], [0.2, 0.1])])
+    f = sisl_tmp('memmap.DM', _dir)
+    DM.write(f)
+
+    DM1 = sisl.get_sile(f).read_density_matrix(geometry=g)
+    DM2 = sisl.get_sile(f).read_density_matrix(geometry=g, memmap=True)
+    assert isinstance(DM2._csr._D, np.memmap)
+    assert DM1._csr.spsame(DM2._csr)
+    assert DM._csr.spsame(DM2._csr)
+    for i in range(len(DM.spin)):
+        assert np.allclose(DM2.tocsr(i).toarray(), DM.tocsr(i).toarray())
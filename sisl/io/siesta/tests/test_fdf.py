@@ -1,6 +1,8 @@
 from __future__ import print_function, division
 
 import pytest
+import os
+import shutil
 
 from sisl import geom
 from sisl import Geometry, Atom
@@ -267,6 +269,42 @@ def test_include(sisl_tmp):
     assert fdf.get('Hello') == [l.replace('\n', '').strip() for l in ll]
 
 
+def test_label_index(sisl_tmp):
+    f = sisl_tmp('file.fdf', _dir)
+    with open(f, 'w') as fh:
+        fh.write('Flag1 date\n')
+        fh.write('%include file2.fdf\n')
+    file2 = sisl_tmp('file2.fdf', _dir)
+    with open(file2, 'w') as fh:
+        fh.write('%block Flag2\n 1 2\n%endblock Flag2\n')
+
+    fdf = fdfSileSiesta(f, base=sisl_tmp.getbase())
+    assert fdf.get('Flag1') == 'date'
+    assert fdf.get('Flag2') == ['1 2']
+    # Returned blocks must not alter the index
+    fdf.get('Flag2').append('3')
+    assert fdf.get('Flag2') == ['1 2']
+
+    # Changing an included file re-builds the index
+    with open(file2, 'w') as fh:
+        fh.write('%block Flag2\n 1 2 3\n%endblock Flag2\nFlag1 not-date\nFlag3 date\n')
+    assert fdf.get('Flag2') == ['1 2 3']
+    assert fdf.get('Flag1') == 'date'
+
+    # Labels are set in the file they are defined in
+    fdf.set('Flag3', 'not-date')
+    assert fdfSileSiesta(file2).get('Flag3') == 'not-date'
+    assert fdf.get('Flag3') == 'not-date'
+
+    # Replacing a file with one of the same size and time-stamps
+    file3 = sisl_tmp('file3.fdf', _dir)
+    with open(file3, 'w') as fh:
+        fh.write(open(file2).read().replace('not-date', 'NOT-DATE'))
+    shutil.copystat(file2, file3)
+    os.rename(file3, file2)
+    assert fdf.get('Flag3') == 'NOT-DATE'
+
+
 def test_xv_preference(sisl_tmp):
     g = geom.graphene()
     g.write(sisl_tmp('file.fdf', _dir))
@@ -106,6 +106,56 @@ def test_gf_write_read_spin(sisl_tmp, sisl_system):
         assert np.allclose(SE_file, S * e - Hk)
 
 
+def test_gf_write_random_read(sisl_tmp, sisl_system):
+    from multiprocessing.pool import ThreadPool
+
+    tb = sisl.Hamiltonian(sisl_system.gtb, spin=sisl.Spin('P'))
+    tb.construct([(0.1, 1.5), ([0.1, -0.1], [2.7, 1.6])])
+
+    bz = sisl.MonkhorstPack(tb, [3, 3, 1])
+    E = np.linspace(-2, 2, 4) + 1j * 1e-4
+    S = np.eye(len(tb), dtype=np.complex128)
+
+    f_seq = sisl_tmp('seq.TSGF', _dir)
+    gf = sisl.io.get_sile(f_seq)
+    gf.write_header(bz, E)
+    for i, (ispin, write_hs, k, e) in enumerate(gf):
+        Hk = tb.Hk(k, spin=ispin, format='array')
+        if write_hs:
+            gf.write_hamiltonian(Hk, S)
+        gf.write_self_energy(S * e - Hk)
+
+    # Write all blocks out of order from several threads
+    f_rnd = sisl_tmp('rnd.TSGF', _dir)
+    with sisl.io.get_sile(f_rnd) as gf:
+        gf.write_header(bz, E)
+
+        def write(ispin_ik):
+            ispin, ik = ispin_ik
+            Hk = tb.Hk(bz.k[ik], spin=ispin, format='array')
+            for iE in range(len(E) - 1, -1, -1):
+                gf.write_self_energy(S * E[iE] - Hk, ispin=ispin, k=ik, E=iE)
+            gf.write_hamiltonian(Hk, S, ispin=ispin, k=ik)
+
+        ThreadPool(3).map(write, [(ispin, ik) for ik in range(len(bz)) for ispin in [1, 0]])
+
+    with open(f_seq, 'rb') as fs, open(f_rnd, 'rb') as fr:
+        assert fs.read() == fr.read()
+
+    with sisl.io.get_sile(f_rnd) as gf:
+        for ispin in [1, 0]:
+            for ik in [2, 0]:
+                Hk = tb.Hk(bz.k[ik], spin=ispin, format='array')
+                Hk_file, Sk_file = gf.read_hamiltonian(ispin=ispin, k=bz.k[ik])
+                assert np.allclose(Hk, Hk_file)
+                assert np.allclose(S, Sk_file)
+                for iE in [3, 0, 1]:
+                    SE = gf.read_self_energy(ispin, ik, iE)
+                    assert np.allclose(SE, S * E[iE] - Hk)
+                    # retrieving the energy by value is the same
+                    assert np.allclose(SE, gf.read_self_energy(ispin, ik, E[iE].real))
+
+
 @pytest.mark.xfail(raises=sisl.SileError)
 def test_gf_sile_error():
     sisl.get_sile('non_existing_file.TSGF').read_header()
@@ -25,3 +25,12 @@ def test_si_pdos_kgrid_grid_fractions(sisl_files):
     grid = si.read_grid()
     grid_halve = si.read_grid(index=[0.5])
     assert np.allclose(grid.grid * 0.5, grid_halve.grid)
+
+
+def test_si_pdos_kgrid_grid_region(sisl_files):
+    si = sisl.get_sile(sisl_files(_dir, 'si_pdos_kgrid.VT'))
+    grid = si.read_grid()
+    sub = si.read_grid(region=[None, (1, 4), 2], stride=2)
+    assert np.allclose(grid.grid[::2, 1:4:2, 2:3], sub.grid)
+    assert np.allclose(sub.sc.origo, grid.dcell[1] + grid.dcell[2] * 2)
+    assert np.allclose(sub.dcell[:2], grid.dcell[:2] * 2)
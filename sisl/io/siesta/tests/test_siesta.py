@@ -45,6 +45,33 @@ def test_nc2(sisl_tmp, sisl_system):
     assert sisl_system.g.atom.equal(ntb.atom, R=False)
 
 
+@pytest.mark.parametrize("orthogonal", [True, False])
+def test_nc_memmap(sisl_tmp, sisl_system, orthogonal):
+    from sisl.sparse import _Scratch
+    tb = Hamiltonian(sisl_system.gtb, orthogonal=orthogonal)
+    if orthogonal:
+        tb.construct([sisl_system.R, sisl_system.t])
+    else:
+        tb.construct([sisl_system.R, sisl_system.tS])
+    tbm = tb.tomemmap(sisl_tmp.dir(_dir))
+    assert np.allclose(tbm.Hk([0.1, 0.2, 0]).toarray(), tb.Hk([0.1, 0.2, 0]).toarray())
+    block = _Scratch.block
+    try:
+        # Ensure several blocks are written
+        _Scratch.block = 7
+        for ext, sile in [('nc', ncSileSiesta), ('TSHS', tshsSileSiesta)]:
+            f = sisl_tmp('grm.' + ext, _dir)
+            tbm.write(sile(f, 'w'))
+            ntb = sile(f).read_hamiltonian()
+            ntb.finalize()
+            assert ntb.spsame(tb)
+            for k in [[0] * 3, [0.1, 0.2, 0]]:
+                assert np.allclose(ntb.Hk(k).toarray(), tb.Hk(k).toarray(), atol=1e-5)
+                assert np.allclose(ntb.Sk(k).toarray(), tb.Sk(k).toarray())
+    finally:
+        _Scratch.block = block
+
+
 def test_nc_overlap(sisl_tmp, sisl_system):
     f = sisl_tmp('gr.nc', _dir)
     tb = Hamiltonian(sisl_system.gtb)
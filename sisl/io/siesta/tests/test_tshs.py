@@ -31,3 +31,33 @@ def test_si_pdos_kgrid_tshs_overlap(sisl_files, sisl_tmp):
     HS.finalize()
     S.finalize()
     assert np.allclose(HS._csr._D[:, HS.S_idx], S._csr._D[:, 0])
+
+
+@pytest.mark.parametrize("orthogonal", [True, False])
+def test_tshs_memmap(sisl_tmp, orthogonal):
+    g = sisl.geom.graphene(orthogonal=True).tile(2, 0)
+    H = sisl.Hamiltonian(g, spin=sisl.Spin('P'), orthogonal=orthogonal)
+    if orthogonal:
+        H.construct([(0.1, 1.5), ([0.1, -0.1], [-2.7, -2.6])])
+    else:
+        H.construct([(0.1, 1.5), ([0.1, -0.1, 1.], [-2.7, -2.6, 0.1])])
+    f = sisl_tmp('memmap.TSHS', _dir)
+    H.write(f)
+
+    HS1 = sisl.get_sile(f).read_hamiltonian()
+    HS2 = sisl.get_sile(f).read_hamiltonian(memmap=True)
+    assert HS1.orthogonal == orthogonal
+    assert HS1._csr.scratch is None
+    assert isinstance(HS2._csr._D, np.memmap)
+    assert HS1._csr.spsame(HS2._csr)
+    assert H._csr.spsame(HS2._csr)
+    for i in range(HS1.dim):
+        assert np.allclose(HS2.tocsr(i).toarray(), HS1.tocsr(i).toarray())
+        assert np.allclose(HS2.tocsr(i).toarray(), H.tocsr(i).toarray())
+
+    S = sisl.get_sile(f).read_overlap(memmap=True)
+    assert isinstance(S._csr.col, np.memmap)
+    if orthogonal:
+        assert np.allclose(S.tocsr(0).diagonal(), 1.)
+    else:
+        assert np.allclose(S.tocsr(0).toarray(), HS1.tocsr(HS1.S_idx).toarray())
@@ -3,7 +3,6 @@ from __future__ import print_function, division
 from numbers import Integral
 
 import numpy as np
-from numpy import in1d
 
 # Import sile objects
 from ..sile import SileWarning
@@ -64,6 +63,21 @@ class _ncSileTBtrans(SileCDFTBtrans):
             # Reset the access pattern
             self._access = access
 
+    def _cached(self, name, func):
+        """ Return ``func()`` and store it in the object (only for ``access > 0``)
+
+        The returned quantity is the stored one, hence it must *not* be changed.
+        """
+        if self._access == 0:
+            return func()
+        try:
+            return self._data[name]
+        except KeyError:
+            pass
+        data = func()
+        self._data[name] = data
+        return data
+
     def read_supercell(self):
         """ Returns `SuperCell` object from this file """
         cell = _a.arrayd(np.copy(self.cell))
@@ -125,9 +139,22 @@ class _ncSileTBtrans(SileCDFTBtrans):
     @property
     def geometry(self):
         """ The associated geometry from this file """
+        if '_geom' in self._data:
+            return self._data['_geom'].copy()
         return self.read_geometry()
     geom = geometry
 
+    def _sparsity_pattern(self):
+        """ Row-pointers and column indices (0-based) of the sparse data in the file
+
+        The returned arrays are the stored ones (if ``access > 0``), hence they must *not* be changed.
+        """
+        def func():
+            rptr = np.insert(_a.cumsumi(self._value('n_col')), 0, 0)
+            col = self._value('list_col') - 1
+            return rptr, col
+        return self._cached('_sparsity_pattern', func)
+
     @property
     def cell(self):
         """ Unit cell in file """
@@ -312,7 +339,23 @@ class _devncSileTBtrans(_ncSileTBtrans):
 
     def btd(self):
         """ Block-sizes for the BTD method in the device region """
-        return self._value('btd')
+        return self._cached('_btd', lambda: self._value('btd')).copy()
+
+    def _pivot(self):
+        """ Pivoting orbitals (0-based), the returned array must *not* be changed """
+        return self._cached('_pivot', lambda: self._value('pivot') - 1)
+
+    def _ipivot(self):
+        """ Inverse pivoting table, orbitals not in the device region are ``-1``
+
+        The returned array must *not* be changed.
+        """
+        def func():
+            pvt = self._pivot()
+            ipvt = _a.fulli(self.no, -1)
+            ipvt[pvt] = _a.arangei(len(pvt))
+            return ipvt
+        return self._cached('_ipivot', func)
 
     def pivot(self, in_device=False, sort=False):
         """ Pivoting orbitals for the full system
@@ -326,13 +369,15 @@ class _devncSileTBtrans(_ncSileTBtrans):
         """
         if in_device and sort:
             return _a.arangei(self.no_d)
-        pvt = self._value('pivot') - 1
+        pvt = self._pivot()
         if in_device:
             subn = _a.onesi(self.no)
             subn[pvt] = 0
-            pvt -= _a.cumsumi(subn)[pvt]
+            pvt = pvt - _a.cumsumi(subn)[pvt]
         elif sort:
             pvt = np.sort(pvt)
+        else:
+            pvt = pvt.copy()
         return pvt
 
     def a2p(self, atom):
@@ -363,7 +408,9 @@ class _devncSileTBtrans(_ncSileTBtrans):
         """
         # We need asarray, otherwise taking len of an int will fail
         orbital = np.asarray(orbital).ravel()
-        porb = in1d(self.pivot(), orbital).nonzero()[0]
+        ipvt = self._ipivot()
+        porb = ipvt[orbital[orbital < len(ipvt)]]
+        porb = np.unique(porb[porb >= 0])
         d = len(orbital) - len(porb)
         if d != 0:
             warn('{}.o2p requesting an orbital outside the device region, '
@@ -1,6 +1,8 @@
 from __future__ import print_function, division
 
 from numbers import Integral
+from collections import OrderedDict
+from multiprocessing.pool import ThreadPool
 try:
     from StringIO import StringIO
 except Exception:
@@ -15,7 +17,7 @@ from scipy.sparse import csr_matrix
 from scipy.sparse import isspmatrix_csr
 
 # Import sile objects
-from ..sile import add_sile, sile_raise_write
+from ..sile import add_sile, get_sile, sile_raise_write
 from ._cdf import _devncSileTBtrans
 from sisl.utils import *
 import sisl._array as _a
@@ -24,6 +26,7 @@ from sisl import Geometry, Atoms
 from sisl import units, constant
 from sisl.messages import warn, info, SislError
 from sisl._help import _range as range
+from sisl._sparse import sparse_orb_to_atom
 from sisl.unit.siesta import unit_convert
 from sisl.physics.distribution import get_distribution, fermi_dirac
 from sisl.physics.densitymatrix import DensityMatrix
@@ -31,6 +34,7 @@ from sisl.physics.densitymatrix import DensityMatrix
 
 __all__ = ['tbtncSileTBtrans', 'phtncSileTBtrans']
 __all__ += ['tbtavncSileTBtrans', 'phtavncSileTBtrans']
+__all__ += ['tbt_bias_scan']
 
 Bohr2Ang = unit_convert('Bohr', 'Ang')
 Ry2eV = unit_convert('Ry', 'eV')
@@ -38,6 +42,95 @@ Ry2K = unit_convert('Ry', 'K')
 eV2Ry = unit_convert('eV', 'Ry')
 
 
+def _k_average(v, wkpt, idx=(), nbytes=2 ** 26):
+    """ k-averaged data of the variable `v` (first dimension being the k-points)
+
+    The k-points are read in blocks aligned with the chunking of the NetCDF
+    variable (and of size no larger than `nbytes`). Each block is then reduced
+    with the k-point weights.
+
+    Parameters
+    ----------
+    v : netCDF4.Variable or numpy.ndarray
+       variable to be averaged
+    wkpt : numpy.ndarray
+       weights of the k-points
+    idx : tuple, optional
+       indices (int, slice or sorted array) of the leading dimensions (after the k-point dimension) of `v`
+    nbytes : int, optional
+       maximum number of bytes read per block (at least one chunk will be read)
+    """
+    nk = len(wkpt)
+    # Figure out the size of a single k-point
+    shape = []
+    for i, n in zip(idx, v.shape[1:]):
+        if isinstance(i, slice):
+            shape.append(len(range(*i.indices(n))))
+        elif not isinstance(i, Integral):
+            shape.append(len(i))
+    shape = tuple(shape) + v.shape[1 + len(idx):]
+    nblock = max(1, nbytes // max(1, int(np.prod(shape)) * np.dtype(v.dtype).itemsize))
+    try:
+        chunk = v.chunking()
+    except AttributeError:
+        chunk = 'contiguous'
+    if not (chunk is None or chunk == 'contiguous'):
+        # Align with the chunks
+        nblock = max(chunk[0], nblock // chunk[0] * chunk[0])
+    nblock = min(nblock, nk)
+
+    data = np.zeros(shape, dtype=np.result_type(v.dtype, wkpt.dtype))
+    for ik in range(0, nk, nblock):
+        blk = slice(ik, min(ik + nblock, nk))
+        data += np.tensordot(wkpt[blk], np.asarray(v[(blk,) + idx + (Ellipsis,)]), axes=(0, 0))
+    return data.astype(v.dtype, copy=False)
+
+
+def tbt_bias_scan(siles, method='current', nthreads=1, **kwargs):
+    """ Calculate the same quantity for several TBtrans output files
+
+    This is typically used for IV-curves (or noise) where each file corresponds
+    to a calculation at a given bias.
+
+    Parameters
+    ----------
+    siles : list of str or list of tbtncSileTBtrans
+       the TBtrans output files
+    method : str, optional
+       the method called for each file, e.g. ``'current'``, ``'current_parameter'``,
+       ``'shot_noise'``, ``'noise_power'`` or ``'fano'``
+    nthreads : int, optional
+       number of threads used to process the files concurrently.
+       This requires the HDF5 library to be compiled thread-safe.
+    **kwargs :
+       arguments passed to `method`
+
+    Examples
+    --------
+    >>> files = ['V{:.1f}.TBT.nc'.format(V) for V in np.linspace(0, 1, 11)]
+    >>> I = tbt_bias_scan(files, elec_from=0, elec_to=1)
+    >>> noise = tbt_bias_scan(files, 'noise_power', elec_from=0, elec_to=1)
+
+    Returns
+    -------
+    numpy.ndarray : the calculated quantities with the first dimension corresponding to `siles`
+    """
+    def calc(sile):
+        if not isinstance(sile, tbtncSileTBtrans):
+            sile = get_sile(sile)
+        return getattr(sile, method)(**kwargs)
+
+    if nthreads > 1:
+        pool = ThreadPool(nthreads)
+        try:
+            out = pool.map(calc, siles)
+        finally:
+            pool.close()
+    else:
+        out = list(map(calc, siles))
+    return np.array(out)
+
+
 class tbtncSileTBtrans(_devncSileTBtrans):
     r""" TBtrans output file object
 
@@ -67,6 +160,8 @@ class tbtncSileTBtrans(_devncSileTBtrans):
     """
     _trans_type = 'TBT'
     _k_avg = False
+    # Maximum number of bytes used for caching k-averaged quantities (access > 0)
+    _k_avg_cache_nbytes = 2 ** 28
 
     def write_tbtav(self, *args, **kwargs):
         """ Convert this to a TBT.AV.nc file, i.e. all k dependent quantites are averaged out.
@@ -78,12 +173,45 @@ class tbtncSileTBtrans(_devncSileTBtrans):
         ----------
         file : str
             output filename
+        lvl : int, optional
+            compression level of the output file, if 0 the compression of the variables
+            in this file is retained
+        nbytes : int, optional
+            approximate maximum number of bytes read at a time when averaging the variables
         """
         f = self._file.replace('.nc', '.AV.nc')
         if len(args) > 0:
             f = args[0]
         f = kwargs.get('file', f)
-        tbtavncSileTBtrans(f, mode='w', access=0).write_tbtav(self)
+        tbtavncSileTBtrans(f, mode='w', lvl=kwargs.get('lvl', 0), access=0).write_tbtav(self, nbytes=kwargs.get('nbytes', 2 ** 26))
+
+    def _k_avg_cache(self, name, tree):
+        """ Cached k-averaged quantity (or None if not cached) """
+        if self._access == 0:
+            return None
+        if isinstance(tree, list):
+            tree = tuple(tree)
+        cache = self._data.get('_k_avg')
+        if cache is None:
+            return None
+        data = cache.pop((name, tree), None)
+        if data is not None:
+            # Re-insert to mark it as the most recently used
+            cache[(name, tree)] = data
+        return data
+
+    def _k_avg_cache_add(self, name, tree, data):
+        """ Add a k-averaged quantity to the cache, discarding the least recently used ones """
+        if self._access == 0 or data.nbytes > self._k_avg_cache_nbytes:
+            return
+        if isinstance(tree, list):
+            tree = tuple(tree)
+        cache = self._data.setdefault('_k_avg', OrderedDict())
+        cache[(name, tree)] = data
+        nbytes = sum(d.nbytes for d in cache.values())
+        while nbytes > self._k_avg_cache_nbytes:
+            _, d = cache.popitem(last=False)
+            nbytes -= d.nbytes
 
     def _value_avg(self, name, tree=None, kavg=False):
         """ Local method for obtaining the data from the SileCDF.
@@ -110,17 +238,16 @@ class tbtncSileTBtrans(_devncSileTBtrans):
         if self._k_avg:
             return v[:]
 
-        wkpt = self.wk
-
         # Perform normalization
         orig_shape = v.shape
         if isinstance(kavg, bool):
             if kavg:
-                nk = len(wkpt)
-                data = v[0, ...] * wkpt[0]
-                for i in range(1, nk):
-                    data += v[i, :] * wkpt[i]
-                data.shape = orig_shape[1:]
+                data = self._k_avg_cache(name, tree)
+                if data is None:
+                    data = _k_average(v, self.wk)
+                    self._k_avg_cache_add(name, tree, data)
+                # Return a copy to not change the cached data
+                data = data.copy()
             else:
                 data = v[:]
 
@@ -142,7 +269,14 @@ class tbtncSileTBtrans(_devncSileTBtrans):
             return self._value_avg(name, tree, kavg)
 
         # Ensure that it is an index
-        iE = self.Eindex(E)
+        if np.ndim(E) > 0:
+            # Read the energies in one go, as a slice if possible
+            iE, inv = np.unique([self.Eindex(e) for e in E], return_inverse=True)
+            if iE[-1] - iE[0] + 1 == len(iE):
+                iE = slice(iE[0], iE[-1] + 1)
+        else:
+            iE = self.Eindex(E)
+            inv = None
 
         try:
             v = self._variable(name, tree=tree)
@@ -156,30 +290,37 @@ class tbtncSileTBtrans(_devncSileTBtrans):
                 raise KeyError(self.__class__.__name__ + ' could not retrieve key "{}.{}" due to missing flags in the input file.'.format(group, name))
             raise KeyError(self.__class__.__name__ + ' could not retrieve key "{}" due to missing flags in the input file.'.format(name))
         if self._k_avg:
-            return v[iE, ...]
-
-        wkpt = self.wk
+            data = np.array(v[iE, ...])
+            if inv is None:
+                return data
+            return data[inv, ...]
 
         # Perform normalization
         orig_shape = v.shape
 
         if isinstance(kavg, bool):
             if kavg:
-                nk = len(wkpt)
-                data = np.array(v[0, iE, ...]) * wkpt[0]
-                for i in range(1, nk):
-                    data += v[i, iE, ...] * wkpt[i]
-                data.shape = orig_shape[2:]
+                data = self._k_avg_cache(name, tree)
+                if data is None:
+                    data = _k_average(v, self.wk, (iE,))
+                else:
+                    data = np.array(data[iE, ...])
             else:
                 data = np.array(v[:, iE, ...])
+                if inv is not None:
+                    return data[:, inv, ...]
 
         elif isinstance(kavg, Integral):
             data = np.array(v[kavg, iE, ...])
-            data.shape = orig_shape[2:]
+            if inv is None:
+                data.shape = orig_shape[2:]
 
         else:
             raise ValueError(self.__class__.__name__ + ' requires kavg argument to be either bool or an integer corresponding to the k-point index.')
 
+        if inv is not None:
+            return data[inv, ...]
+
         # Return data
         return data
 
@@ -549,23 +690,18 @@ class tbtncSileTBtrans(_devncSileTBtrans):
             return DOS[..., p] / NORM
 
         # This is the multi-orbital case...
-
-        # We will return per-atom
-        shp = list(DOS.shape[:-1])
-        nDOS = np.empty(shp + [len(atom)], DOS.dtype)
-
-        # Quicker than re-creating the geometry on every instance
         geom = self.geom
+        atom = geom._sanitize_atom(atom)
 
-        # Sum for new return stuff
-        for i, a in enumerate(atom):
-            pvt = self.a2p(a)
-            if len(pvt) == 0:
-                nDOS[..., i] = 0.
-            else:
-                nDOS[..., i] = DOS[..., pvt].sum(-1) / NORM
+        # Pivoting indices of all orbitals on the atoms (in order of the atoms)
+        pvt = self._ipivot()[geom.a2o(atom, True)]
+        nDOS = DOS[..., np.where(pvt < 0, 0, pvt)]
+        # Remove orbitals not in the device region
+        nDOS[..., pvt < 0] = 0.
 
-        return nDOS
+        # Sum the orbitals per atom
+        ptr = np.insert(_a.cumsumi(geom.firsto[atom + 1] - geom.firsto[atom]), 0, 0)
+        return np.add.reduceat(nDOS, ptr[:-1], axis=-1) / NORM
 
     def DOS(self, E=None, kavg=True, atom=None, orbital=None, sum=True, norm='none'):
         r""" Green function density of states (DOS) (1/eV).
@@ -743,20 +879,29 @@ class tbtncSileTBtrans(_devncSileTBtrans):
         ----------
         elec_from: str, int
            the originating electrode
-        mu_from: float
+        mu_from: float or array_like
            the chemical potential of the electrode (in eV)
-        kt_from: float
+        kt_from: float or array_like
            the electronic temperature of the electrode (in eV)
         elec_to: str, int
            the absorbing electrode (different from `elec_from`)
-        mu_to: float
+        mu_to: float or array_like
            the chemical potential of the electrode (in eV)
-        kt_to: float
+        kt_to: float or array_like
            the electronic temperature of the electrode (in eV)
         kavg: bool, int, optional
            whether the returned current is k-averaged, or an explicit (unweighed) k-point
            is returned
 
+        Examples
+        --------
+        If any of the chemical potentials or temperatures are arrays, the currents
+        are calculated for all (broadcasted) combinations while the transmission is
+        only read once:
+
+        >>> V = np.linspace(0, 1, 11)
+        >>> I = tbt.current_parameter(0, V / 2, 0.025, 1, - V / 2, 0.025)
+
         See Also
         --------
         current : which calculates the current with the chemical potentials and temperatures set in the TBtrans calculation
@@ -772,13 +917,22 @@ class tbtncSileTBtrans(_devncSileTBtrans):
         # to both ends.
         dE = E[1] - E[0]
 
+        grid = any(np.ndim(x) > 0 for x in [mu_from, kt_from, mu_to, kt_to])
+        if grid:
+            mu_from, kt_from, mu_to, kt_to = [np.asarray(x, np.float64)[..., None]
+                                              for x in [mu_from, kt_from, mu_to, kt_to]]
+
         # Check that the lower bound is sufficient
-        print_warning = mu_from - kt_from * 3 < E[0] - dE / 2 or \
-                        mu_to - kt_to * 3  < E[0] - dE / 2
-        print_warning = mu_from + kt_from * 3 > E[-1] + dE / 2 or \
-                        mu_to + kt_to * 3  > E[-1] + dE / 2 or \
+        print_warning = np.min(mu_from - kt_from * 3) < E[0] - dE / 2 or \
+                        np.min(mu_to - kt_to * 3) < E[0] - dE / 2
+        print_warning = np.max(mu_from + kt_from * 3) > E[-1] + dE / 2 or \
+                        np.max(mu_to + kt_to * 3) > E[-1] + dE / 2 or \
                         print_warning
-        if print_warning:
+        if print_warning and grid:
+            warn(self.__class__.__name__ + ".current_parameter cannot "
+                 "accurately calculate the current due to the calculated energy range. "
+                 "Increase the calculated energy-range.")
+        elif print_warning:
             # We should pretty-print a table of data
             m = max(len(elec_from), len(elec_to), 15)
             s = ("{:"+str(m)+"s} {:9.3f} : {:9.3f} eV\n").format('Energy range', E[0] - dE / 2, E[-1] + dE / 2)
@@ -792,7 +946,12 @@ class tbtncSileTBtrans(_devncSileTBtrans):
                  "accurately calculate the current due to the calculated energy range. "
                  "Increase the calculated energy-range.\n" + s)
 
-        I = (T * dE * (fermi_dirac(E, kt_from, mu_from) - fermi_dirac(E, kt_to, mu_to))).sum()
+        window = dE * (fermi_dirac(E, kt_from, mu_from) - fermi_dirac(E, kt_to, mu_to))
+        if grid:
+            # Integrate all windows at once
+            I = np.tensordot(window, T, axes=(-1, -1))
+        else:
+            I = (T * window).sum()
         return I * units('eV', 'J') / constant.h('eV s')
 
     def _check_Teig(self, func_name, TE, eps=0.001):
@@ -802,6 +961,20 @@ class tbtncSileTBtrans(_devncSileTBtrans):
                  'calculation. For some energy values all transmission eigenvalues are above {}!'.format(self.__class__.__name__,
                                                                                                          func_name, eps))
 
+    def _Teig_kavg(self, func_name, func, elec_from, elec_to, kavg):
+        """ Internal method for k-averaging a function of the transmission eigenvalues
+
+        All k-points are read in one go and ``func(T)`` (returning the k-points
+        in the first dimension) is weighted with the k-point weights.
+        """
+        if kavg is True and not self._k_avg:
+            T = self.transmission_eig(elec_from, elec_to, kavg=False)
+            self._check_Teig(func_name, T)
+            return np.tensordot(self.wkpt, func(T), axes=(0, 0))
+        T = self.transmission_eig(elec_from, elec_to, kavg=kavg)
+        self._check_Teig(func_name, T)
+        return func(T)
+
     def shot_noise(self, elec_from=0, elec_to=1, classical=False, kavg=True):
         r""" Shot-noise term `from` to `to` using the k-weights
 
@@ -850,30 +1023,10 @@ class tbtncSileTBtrans(_devncSileTBtrans):
             return _noise_const * self.transmission(elec_from, elec_to, kavg=kavg)
 
         # Non-classical
-        if isinstance(kavg, bool):
-            if not kavg:
-                # The user wants it k-resolved
-                T = self.transmission_eig(elec_from, elec_to, kavg=False)
-                self._check_Teig('shot_noise', T)
-                return _noise_const * (T * (1 - T)).sum(-1)
-
-            # We need to manually weigh the k-points
-            wkpt = self.wkpt
-
-            T = self.transmission_eig(elec_from, elec_to, kavg=0)
-            self._check_Teig('shot_noise', T)
-            sn = (T * (1 - T)).sum(-1) * wkpt[0]
-            for ik in range(1, self.nkpt):
-                T = self.transmission_eig(elec_from, elec_to, kavg=ik)
-                self._check_Teig('shot_noise', T)
-                sn += (T * (1 - T)).sum(-1) * wkpt[ik]
-
-        else:
-            T = self.transmission_eig(elec_from, elec_to, kavg=kavg)
-            self._check_Teig('shot_noise', T)
-            sn = (T * (1 - T)).sum(-1)
+        def func(T):
+            return (T * (1 - T)).sum(-1)
 
-        return _noise_const * sn
+        return _noise_const * self._Teig_kavg('shot_noise', func, elec_from, elec_to, kavg)
 
     def noise_power(self, elec_from=0, elec_to=1, kavg=True):
         r""" Noise power `from` to `to` using the k-weights and energy spacings in the file (temperature dependent)
@@ -926,33 +1079,12 @@ class tbtncSileTBtrans(_devncSileTBtrans):
         # Note that h in eV units will cancel the units in the dE integration
         _noise_const = 2 * units('eV', 'J') ** 2 / constant.h('eV s')
 
-        # Determine the k-average
-        if isinstance(kavg, bool):
-            if not kavg:
-                # The user wants it k-resolved
-                T = self.transmission_eig(elec_from, elec_to, kavg=False)
-                self._check_Teig('noise_power', T)
-                return _noise_const * ((T.sum(-1) * eq_fac).sum(-1) + ((T * (1 - T)).sum(-1) * neq_fac).sum(-1))
-
-            # We need to manually weigh the k-points
-            wkpt = self.wkpt
-
-            T = self.transmission_eig(elec_from, elec_to, kavg=0)
-            self._check_Teig('noise_power', T)
+        def func(T):
             # Separate the calculation into two terms (see Ya.M. Blanter, M. Buttiker, Physics Reports 336 2000)
-            np = ((T.sum(-1) * eq_fac).sum(-1) + ((T * (1 - T)).sum(-1) * neq_fac).sum(-1)) * wkpt[0]
-            for ik in range(1, self.nkpt):
-                T = self.transmission_eig(elec_from, elec_to, kavg=ik)
-                self._check_Teig('noise_power', T)
-                np += ((T.sum(-1) * eq_fac).sum(-1) + ((T * (1 - T)).sum(-1) * neq_fac).sum(-1)) * wkpt[ik]
-
-        else:
-            T = self.transmission_eig(elec_from, elec_to, kavg=kavg)
-            self._check_Teig('noise_power', T)
-            np = (T.sum(-1) * eq_fac).sum(-1) + ((T * (1 - T)).sum(-1) * neq_fac).sum(-1)
+            return (T.sum(-1) * eq_fac).sum(-1) + ((T * (1 - T)).sum(-1) * neq_fac).sum(-1)
 
         # Do final conversion
-        return _noise_const * np
+        return _noise_const * self._Teig_kavg('noise_power', func, elec_from, elec_to, kavg)
 
     def fano(self, elec_from=0, elec_to=1, kavg=True, zero_T=1e-6):
         r""" The Fano-factor for the calculation (requires calculated transmission eigenvalues)
@@ -992,44 +1124,22 @@ class tbtncSileTBtrans(_devncSileTBtrans):
             fano[T <= zero_T] = 0.
             return fano
 
-        if isinstance(kavg, bool):
-            if not kavg:
-                # The user wants it k-resolved
-                T = self.transmission_eig(elec_from, elec_to, kavg=False)
-                self._check_Teig('fano', T)
-                return _fano(T)
-
-            # We need to manually weigh the k-points
-            wkpt = self.wkpt
-
-            T = self.transmission_eig(elec_from, elec_to, kavg=0)
-            self._check_Teig('fano', T)
-            fano = _fano(T) * wkpt[0]
-            for ik in range(1, self.nkpt):
-                T = self.transmission_eig(elec_from, elec_to, kavg=ik)
-                self._check_Teig('fano', T)
-                fano += _fano(T) * wkpt[ik]
-
-        else:
-            T = self.transmission_eig(elec_from, elec_to, kavg=kavg)
-            self._check_Teig('fano', T)
-            fano = _fano(T)
-
-        return fano
+        return self._Teig_kavg('fano', _fano, elec_from, elec_to, kavg)
 
     def _sparse_data(self, data, elec, E, kavg=True, isc=None):
-        """ Internal routine for retrieving sparse data (orbital current, COOP) """
+        """ Internal routine for retrieving sparse data (orbital current, COOP)
+
+        If `E` is array-like the sparsity pattern is only read once and a list of
+        sparse matrices (one per energy) with the same sparsity pattern is returned.
+        """
         # Get the geometry for obtaining the sparsity pattern.
         if elec is not None:
             elec = self._elec(elec)
 
         geom = self.geom
 
-        # These are the row-pointers...
-        rptr = np.insert(_a.cumsumi(self._value('n_col')), 0, 0)
-
-        # Get column indices
-        col = self._value('list_col') - 1
+        # These are the row-pointers and column indices
+        rptr, col = self._sparsity_pattern()
 
         # Default matrix size
         mat_size = [geom.no, geom.no_s]
@@ -1085,92 +1195,81 @@ class tbtncSileTBtrans(_devncSileTBtrans):
             col = col[all_col]
 
             # recreate row-pointer
-            cnz = np.count_nonzero
-            def func(ptr1, ptr2):
-                return cnz(all_col[ptr1:ptr2])
-            tmp = _a.arrayi(list(map(func, rptr[:geom.no], rptr[1:])))
-            rptr = np.insert(_a.cumsumi(tmp), 0, 0)
-            del tmp
+            rptr = np.insert(_a.cumsumi(all_col), 0, 0)[rptr]
 
         if all_col is None:
             D = self._value_E(data, elec, kavg, E)
         else:
             D = self._value_E(data, elec, kavg, E)[..., all_col]
 
-        return csr_matrix((D, col, rptr), shape=mat_size)
+        # The pattern may be stored in the object, hence we copy them
+        if np.ndim(E) > 0:
+            return [csr_matrix((d, col.copy(), rptr.copy()), shape=mat_size) for d in D]
+        return csr_matrix((D, col.copy(), rptr.copy()), shape=mat_size)
 
-    def _sparse_data_orb_to_atom(self, Dij, uc=False):
+    def _sparse_data_orb_to_atom(self, Dij, uc=False, only='all'):
         """ Reduce orbital sparse data to atomic sparse data
 
+        All orbital elements between two atoms are summed, the returned
+        sparse matrices have sorted and unique column indices.
+
         Parameters
         ----------
-        Dij : scipy.sparse.csr_matrix
-           the input data
+        Dij : scipy.sparse.csr_matrix or list of scipy.sparse.csr_matrix
+           the input data, in case of a list the atomic reduction is only calculated
+           once for matrices with the same sparsity pattern
         uc : bool, optional
            whether the returned data are only in the unit-cell.
            If ``True`` this will return a sparse matrix of ``shape = (self.na, self.na)``,
            else, it will return a sparse matrix of ``shape = (self.na, self.na * self.n_s)``.
            One may figure out the connections via `~sisl.geometry.Geometry.sc_index`.
+        only : {'all', '+', '-'}
+           which orbital elements are summed, all, positive or negative values only.
         """
         geom = self.geom
         na = geom.na
-        o2a = geom.o2a
-
-        if not uc:
-            uc = Dij.shape[0] == Dij.shape[1]
-
-        # We convert to atomic bond-currents
-        if uc:
-            Dab = csr_matrix((na, na), dtype=Dij.dtype)
-
-            def map_col(c):
-                return o2a(c) % na
-
-        else:
-            Dab = csr_matrix((na, na * geom.n_s), dtype=Dij.dtype)
-
-            map_col = o2a
+        only = {'all': 0, '+': 1, '-': -1}[only]
 
+        is_list = isinstance(Dij, (list, tuple))
+        if not is_list:
+            Dij = [Dij]
         # Lets do array notation for speeding up the computations
-        if not isspmatrix_csr(Dij):
-            Dij = Dij.tocsr()
-
-        # Check for the simple case of 1-orbital systems
-        if geom.na == geom.no:
-            # In this case it is extremely easy!
-            # Just copy to the new data
-
-            # Transfer all columns to the new columns
-            Dab.indptr[:] = Dij.indptr.copy()
-            if uc:
-                Dab.indices = (Dij.indices % na).astype(np.int32, copy=False)
-            else:
-                Dab.indices = Dij.indices.copy()
+        Dij = [D if isspmatrix_csr(D) else D.tocsr() for D in Dij]
 
+        if not uc:
+            uc = Dij[0].shape[0] == Dij[0].shape[1]
+        if uc:
+            n_s = 1
         else:
-            # The multi-orbital case
-
-            # Loop all atoms to make the new pointer array
-            # I.e. a consecutive array of pointers starting from
-            #   firsto[.] .. lasto[.]
-            iptr = Dij.indptr
-            # Get first orbital
-            fo = geom.firsto
-            # Automatically create the new index pointer
-            # from first and last orbital
-            indptr = np.insert(_a.cumsumi(iptr[fo[1:]] - iptr[fo[:-1]]), 0, 0)
-
-            # Now we have a new indptr, and the column indices have also
-            # been processed.
-            Dab.indptr[:] = indptr[:]
-            # Transfer all columns to the new columns
-            Dab.indices = map_col(Dij.indices).astype(np.int32, copy=False)
-
-        # Copy data
-        Dab.data = np.copy(Dij.data)
-        # Note that we do not sum duplicates as that depends on the next routine
-        # I.e. sometimes we want to remove negative values, etc.
-        return Dab
+            n_s = Dij[0].shape[1] // geom.no
+        firsto = geom.firsto.astype(np.int32, copy=False)
+        o2a = geom.o2a(_a.arangei(geom.no)).astype(np.int32, copy=False)
+
+        def reduce(Ds):
+            # Ds all have the same sparsity pattern
+            D0 = Ds[0]
+            data = np.array([D.data for D in Ds])
+            if data.dtype not in [np.float32, np.float64]:
+                data = data.astype(np.float64)
+            ptr, col, data = sparse_orb_to_atom(D0.indptr.astype(np.int32, copy=False),
+                                                D0.indices.astype(np.int32, copy=False),
+                                                data, firsto, o2a, n_s, only)
+            return [csr_matrix((d, col.copy(), ptr.copy()), shape=(na, na * n_s)) for d in data]
+
+        # Group the matrices with the same sparsity pattern
+        Dab = [None] * len(Dij)
+        todo = list(range(len(Dij)))
+        while len(todo) > 0:
+            D0 = Dij[todo[0]]
+            same = [i for i in todo if np.array_equal(Dij[i].indptr, D0.indptr) and
+                    np.array_equal(Dij[i].indices, D0.indices)]
+            for i, D in zip(same, reduce([Dij[i] for i in same])):
+                Dab[i] = D
+            todo = [i for i in todo if not i in same]
+
+        if is_list:
+            return Dab
+        return Dab[0]
 
     def orbital_current(self, elec, E, kavg=True, isc=None, only='all'):
         r""" Orbital current originating from `elec` as a sparse matrix
@@ -1195,10 +1294,12 @@ class tbtncSileTBtrans(_devncSileTBtrans):
         ----------
         elec: str, int
            the electrode of originating electrons
-        E: float or int
+        E: float or int or array_like
            the energy or the energy index of the orbital current. If an integer
            is passed it is the index, otherwise the index corresponding to
            ``Eindex(E)`` is used.
+           If array-like, a list of orbital currents (one per energy) is returned.
+           This is much faster than requesting the energies one at a time.
         kavg: bool, int, optional
            whether the returned orbital current is k-averaged, or an explicit (unweighed) k-point
            is returned
@@ -1215,6 +1316,7 @@ class tbtncSileTBtrans(_devncSileTBtrans):
         --------
         >>> Jij = tbt.orbital_current(0, -1.0) # orbital current @ E = -1 eV originating from electrode ``0``
         >>> Jij[10, 11] # orbital current from the 11th to the 12th orbital
+        >>> Js = tbt.orbital_current(0, tbt.E[10:20]) # orbital currents for 10 energies
 
         See Also
         --------
@@ -1224,21 +1326,25 @@ class tbtncSileTBtrans(_devncSileTBtrans):
         atom_current : the atomic current for each atom (scalar representation of bond-currents)
         vector_current : an atomic field current for each atom (Cartesian representation of bond-currents)
         """
-        J = self._sparse_data('J', elec, E, kavg, isc)
-
-        if only == '+':
-            J.data[J.data < 0] = 0
-        elif only == '-':
-            J.data[J.data > 0] = 0
-        elif only != 'all':
+        if not only in ['all', '+', '-']:
             raise ValueError(self.__class__.__name__ + '.orbital_current "only" keyword has '
                              'wrong value ["all", "+", "-"] allowed.')
 
-        # We will always remove the zeroes and sort the indices... (they should be sorted anyways)
-        J.eliminate_zeros()
-        J.sort_indices()
+        J = self._sparse_data('J', elec, E, kavg, isc)
+
+        def clean(J):
+            if only == '+':
+                J.data[J.data < 0] = 0
+            elif only == '-':
+                J.data[J.data > 0] = 0
+            # We will always remove the zeroes and sort the indices... (they should be sorted anyways)
+            J.eliminate_zeros()
+            J.sort_indices()
+            return J
 
-        return J
+        if isinstance(J, list):
+            return [clean(j) for j in J]
+        return clean(J)
 
     def bond_current_from_orbital(self, Jij, only='+', uc=False):
         r""" Bond-current between atoms (sum of orbital currents) from an external orbital current
@@ -1261,8 +1367,9 @@ class tbtncSileTBtrans(_devncSileTBtrans):
 
         Parameters
         ----------
-        Jij : scipy.sparse.csr_matrix
-           the orbital currents as retrieved from `orbital_current`
+        Jij : scipy.sparse.csr_matrix or list of scipy.sparse.csr_matrix
+           the orbital currents as retrieved from `orbital_current` (possibly a list of
+           orbital currents)
         only : {'+', '-', 'all'}
            If "+" is supplied only the positive orbital currents are used,
            for "-", only the negative orbital currents are used,
@@ -1286,21 +1393,18 @@ class tbtncSileTBtrans(_devncSileTBtrans):
         atom_current : the atomic current for each atom (scalar representation of bond-currents)
         vector_current : an atomic field current for each atom (Cartesian representation of bond-currents)
         """
-        Jab = self._sparse_data_orb_to_atom(Jij, uc)
-
-        if only == '+':
-            Jab.data[Jab.data < 0] = 0
-        elif only == '-':
-            Jab.data[Jab.data > 0] = 0
-        elif only != 'all':
+        if not only in ['all', '+', '-']:
             raise ValueError(self.__class__.__name__ + '.bond_current_from_orbital "only" keyword has '
                              'wrong value ["+", "-", "all"] allowed.')
 
-        # Do in-place operations by removing all the things not required
-        Jab.eliminate_zeros()
-        Jab.sort_indices()
-        Jab.sum_duplicates()
+        # The orbital currents are filtered while being summed
+        Jab = self._sparse_data_orb_to_atom(Jij, uc, only)
 
+        if isinstance(Jab, list):
+            for J in Jab:
+                J.eliminate_zeros()
+        else:
+            Jab.eliminate_zeros()
         return Jab
 
     def bond_current(self, elec, E, kavg=True, isc=None, only='+', uc=False):
@@ -1312,10 +1416,11 @@ class tbtncSileTBtrans(_devncSileTBtrans):
         ----------
         elec : str, int
            the electrode of originating electrons
-        E : float or int
+        E : float or int or array_like
            A `float` for energy in eV, `int` for explicit energy index
            Unlike `orbital_current` this may not be `None` as the down-scaling of the
            orbital currents may not be equivalent for all energy points.
+           If array-like, a list of bond currents (one per energy) is returned.
         kavg : bool, int, optional
            whether the returned bond current is k-averaged, or an explicit (unweighed) k-point
            is returned
@@ -1348,9 +1453,20 @@ class tbtncSileTBtrans(_devncSileTBtrans):
         atom_current : the atomic current for each atom (scalar representation of bond-currents)
         vector_current : an atomic field current for each atom (Cartesian representation of bond-currents)
         """
-        Jij = self.orbital_current(elec, E, kavg, isc, only=only)
+        if not only in ['all', '+', '-']:
+            raise ValueError(self.__class__.__name__ + '.bond_current "only" keyword has '
+                             'wrong value ["+", "-", "all"] allowed.')
 
-        return self.bond_current_from_orbital(Jij, uc=uc, only=only)
+        # The orbital currents are filtered while being summed
+        Jij = self._sparse_data('J', elec, E, kavg, isc)
+        Jab = self._sparse_data_orb_to_atom(Jij, uc, only)
+
+        if isinstance(Jab, list):
+            for J in Jab:
+                J.eliminate_zeros()
+        else:
+            Jab.eliminate_zeros()
+        return Jab
 
     def atom_current_from_orbital(self, Jij, activity=True):
         r""" Atomic current of atoms by passing the orbital current
@@ -1423,8 +1539,9 @@ class tbtncSileTBtrans(_devncSileTBtrans):
         ----------
         elec: str, int
            the electrode of originating electrons
-        E: float or int
+        E: float or int or array_like
            the energy or energy index of the atom current.
+           If array-like, the atomic currents are returned with shape ``(len(E), self.na)``.
         kavg: bool, int, optional
            whether the returned atomic current is k-averaged, or an explicit (unweighed) k-point
            is returned
@@ -1438,6 +1555,18 @@ class tbtncSileTBtrans(_devncSileTBtrans):
         bond_current : the bond current (orbital current summed over orbitals)
         vector_current : an atomic field current for each atom (Cartesian representation of bond-currents)
         """
+        if np.ndim(E) > 0:
+            # Retain the sparsity pattern of the orbital currents such that the
+            # atomic reduction is only calculated once
+            Jorb = self._sparse_data('J', elec, E, kavg)
+            Jab = self._sparse_data_orb_to_atom(Jorb)
+            Ja = np.array([np.asarray(abs(J).sum(1)).ravel() for J in Jab])
+            if activity:
+                Jab = self._sparse_data_orb_to_atom([abs(J) for J in Jorb])
+                Jo = np.array([np.asarray(J.sum(1)).ravel() for J in Jab])
+                Ja = np.sqrt(Ja * Jo)
+            return Ja * 0.5
+
         Jorb = self.orbital_current(elec, E, kavg)
 
         return self.atom_current_from_orbital(Jorb, activity=activity)
@@ -1511,10 +1640,11 @@ class tbtncSileTBtrans(_devncSileTBtrans):
         ----------
         elec: str or int
            the electrode of originating electrons
-        E: float or int
+        E: float or int or array_like
            the energy or energy index of the vector current.
            Unlike `orbital_current` this may not be `None` as the down-scaling of the
            orbital currents may not be equivalent for all energy points.
+           If array-like, the vector currents are returned with shape ``(len(E), self.na, 3)``.
         kavg: bool, int, optional
            whether the returned vector current is k-averaged, or an explicit (unweighed) k-point
            is returned
@@ -1540,14 +1670,19 @@ class tbtncSileTBtrans(_devncSileTBtrans):
         # retain vectors crossing the boundaries
         Jab = self.bond_current(elec, E, kavg, only=only)
 
+        if isinstance(Jab, list):
+            Ja = np.array([self.vector_current_from_bond(J) for J in Jab])
+        else:
+            Ja = self.vector_current_from_bond(Jab)
+
         if only == 'all':
             # When we divide by two one can *always* compare the bulk
             # vector currents using either of the sum-rules.
             # I.e. it will be much easier to distinguish differences
             # between "incoming" and "outgoing".
-            return self.vector_current_from_bond(Jab) / 2
+            return Ja / 2
 
-        return self.vector_current_from_bond(Jab)
+        return Ja
 
     def density_matrix(self, E, kavg=True, isc=None, geometry=None):
         r""" Density matrix from the Green function at energy `E` (1/eV)
@@ -1810,8 +1945,6 @@ class tbtncSileTBtrans(_devncSileTBtrans):
         """
         COOP = self._sparse_data_orb_to_atom(COOP, uc)
         COOP.eliminate_zeros()
-        COOP.sort_indices()
-        COOP.sum_duplicates()
         return COOP
 
     def atom_COOP(self, E, kavg=True, isc=None, uc=False):
@@ -2682,11 +2815,17 @@ class tbtavncSileTBtrans(tbtncSileTBtrans):
         This write *requires* the TBT.nc `Sile` object passed as the first argument,
         or as the keyword ``from=tbt`` argument.
 
+        The variables are k-averaged in blocks (aligned with the chunking of the
+        variables) such that the memory usage is bounded by `nbytes`.
+
         Parameters
         ----------
         from : tbtncSileTBtrans
           the TBT.nc file object that has the k-sampled quantities.
+        nbytes : int, optional
+          approximate maximum number of bytes read at a time when averaging the variables
         """
+        nbytes = kwargs.get('nbytes', 2 ** 26)
 
         if 'from' in kwargs:
             tbt = kwargs['from']
@@ -2766,9 +2905,25 @@ class tbtavncSileTBtrans(tbtncSileTBtrans):
                 dims = dvg.dimensions[:]
                 has_kpt = False
 
+            # Retain the compression (unless explicitly requested) and the chunking
+            filters = dvg.filters()
+            if filters is None:
+                filters = {}
+            filters = {key: filters[key] for key in ['zlib', 'complevel', 'shuffle', 'fletcher32']
+                       if key in filters}
+            if self._lvl > 0:
+                filters.update(self._cmp_args)
+            chunk = dvg.chunking()
+            if not (chunk is None or chunk == 'contiguous'):
+                chunk = list(chunk)
+                if has_kpt:
+                    chunk.pop(idx)
+                if len(chunk) > 0:
+                    filters['chunksizes'] = chunk
+
             v = grp.createVariable(dvg.name, dvg.dtype,
                                    dimensions=dims,
-                                   **dvg.filters())
+                                   **filters)
 
             # Copy attributes
             copy_attr(dvg, v)
@@ -2780,18 +2935,25 @@ class tbtavncSileTBtrans(tbtncSileTBtrans):
                 # we create a temporary array to hold the averaged
                 # quantities.
                 # This should only be faster for very large variables
-                if idx == 0:
-                    dat = np.asarray(dvg[0][:] * wkpt[0])
-                    for k in range(1, nkpt):
-                        dat += dvg[k][:] * wkpt[k]
-                    v[:] = dat[:]
+                if idx == 0 and len(dims) == 0:
+                    v[...] = _k_average(dvg, wkpt, nbytes=nbytes)
+                elif idx == 0:
+                    # Average blocks of the leading dimension (typically the energy)
+                    nrow = max(1, int(np.prod(dvg.shape[2:])) * np.dtype(dvg.dtype).itemsize)
+                    nrow = max(1, nbytes // nrow)
+                    if 'chunksizes' in filters:
+                        c = filters['chunksizes'][0]
+                        nrow = max(c, nrow // c * c)
+                    for i in range(0, dvg.shape[1], nrow):
+                        slc = slice(i, min(i + nrow, dvg.shape[1]))
+                        v[slc, ...] = _k_average(dvg, wkpt, (slc,), nbytes=nbytes)
                 else:
                     for slc in iter_shape(dvg.shape[:idx]):
                         dat = np.asarray(dvg[slc][0][:] * wkpt[0])
                         for k in range(1, nkpt):
                             dat += dvg[slc][k][:] * wkpt[k]
                         v[slc][:] = dat[:]
-                del dat
+                    del dat
             else:
                 v[:] = dvg[:]
 
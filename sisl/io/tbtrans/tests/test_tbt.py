@@ -312,6 +312,19 @@ def test_1_graphene_all_tbtav(sisl_files, sisl_tmp):
     tbt.write_tbtav(f)
 
 
+@pytest.mark.slow
+def test_1_graphene_all_tbtav_blocks(sisl_files, sisl_tmp):
+    tbt = sisl.get_sile(sisl_files(_dir, '1_graphene_all.TBT.nc'))
+    f = sisl_tmp('1_graphene_all_blocks.TBT.AV.nc', _dir)
+    # Force many small blocks and re-compress the output
+    tbt.write_tbtav(f, lvl=3, nbytes=1024)
+    tbtav = sisl.get_sile(f)
+    assert np.allclose(tbtav.transmission(), tbt.transmission())
+    for elec in tbt.elecs:
+        assert np.allclose(tbtav.ADOS(elec), tbt.ADOS(elec))
+    assert np.allclose(tbtav.DOS(), tbt.DOS())
+
+
 @pytest.mark.xfail(raises=ValueError)
 def test_1_graphene_all_fail_kavg(sisl_files, sisl_tmp):
     tbt = sisl.get_sile(sisl_files(_dir, '1_graphene_all.TBT.nc'))
@@ -458,3 +471,133 @@ def test_1_graphene_all_warn_atom(sisl_files):
     tbt = sisl.get_sile(sisl_files(_dir, '1_graphene_all.TBT.nc'))
     with pytest.warns(sisl.SislWarning):
         tbt.a2p(1)
+
+
+@pytest.mark.parametrize("nbytes", [1, 100, 2 ** 26])
+def test_k_average_blocks(nbytes):
+    from sisl.io.tbtrans.tbt import _k_average
+    v = np.random.rand(7, 3, 4).astype(np.float32)
+    wkpt = np.random.rand(7)
+    data = _k_average(v, wkpt, nbytes=nbytes)
+    assert data.dtype == v.dtype
+    assert np.allclose(data, (v * wkpt.reshape(-1, 1, 1)).sum(0))
+    data = _k_average(v, wkpt, (1,), nbytes=nbytes)
+    assert np.allclose(data, (v[:, 1] * wkpt.reshape(-1, 1)).sum(0))
+
+
+def test_1_graphene_all_k_average_cache(sisl_files):
+    tbt = sisl.get_sile(sisl_files(_dir, '1_graphene_all.TBT.nc'))
+    left = tbt.elecs[0]
+    DOS = (tbt.DOS(kavg=False) * tbt.wkpt.reshape(-1, 1)).sum(0)
+    assert np.allclose(tbt.DOS(), DOS)
+    # Now from the cache
+    assert np.allclose(tbt.DOS(), DOS)
+    assert np.allclose(tbt.DOS(E=0.195), DOS[tbt.Eindex(0.195)])
+    assert np.allclose(tbt.ADOS(left, E=0.195),
+                       (tbt.ADOS(left, E=0.195, kavg=False) * tbt.wkpt).sum())
+
+
+def test_1_graphene_all_current_multi_E(sisl_files):
+    tbt = sisl.get_sile(sisl_files(_dir, '1_graphene_all.TBT.nc'))
+    left = tbt.elecs[0]
+    E = [tbt.E[4], tbt.E[1], tbt.E[2]]
+    for J, e in zip(tbt.orbital_current(left, E), E):
+        assert abs(J - tbt.orbital_current(left, e)).max() == 0.
+    for J, e in zip(tbt.bond_current(left, E), E):
+        assert abs(J - tbt.bond_current(left, e)).max() < 1e-12
+    assert np.allclose(tbt.atom_current(left, E), [tbt.atom_current(left, e) for e in E])
+    assert np.allclose(tbt.vector_current(left, E), [tbt.vector_current(left, e) for e in E])
+
+
+def test_1_graphene_all_cached_pivot(sisl_files):
+    tbt = sisl.get_sile(sisl_files(_dir, '1_graphene_all.TBT.nc'))
+    pvt = tbt.pivot()
+    # Returned arrays are copies of the stored ones
+    pvt[:] = 0
+    assert not np.allclose(tbt.pivot(), 0)
+    assert np.allclose(tbt.o2p(tbt.pivot()[[3, 1]]), [1, 3])
+    a_dev = tbt.a_dev
+    DOS = tbt.DOS(atom=a_dev, sum=False)
+    assert np.allclose(DOS, np.array([tbt.DOS(atom=ia) for ia in a_dev]).T)
+    g = tbt.geometry
+    g.xyz[:, :] = 0.
+    assert not np.allclose(tbt.geometry.xyz, 0.)
+
+
+def test_1_graphene_all_current_grid(sisl_files):
+    tbt = sisl.get_sile(sisl_files(_dir, '1_graphene_all.TBT.nc'))
+    left, right = tbt.elecs
+    V = np.linspace(0, 0.5, 4)
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')
+        I = tbt.current_parameter(left, V / 2, 0.025, right, -V / 2, 0.025)
+        assert I.shape == V.shape
+        for i, v in enumerate(V):
+            assert I[i] == pytest.approx(tbt.current_parameter(left, v / 2, 0.025, right, -v / 2, 0.025))
+        I = sisl.io.tbtrans.tbt_bias_scan([tbt, tbt], elec_from=left, elec_to=right)
+        assert np.allclose(I, tbt.current(left, right))
+
+
+class _tbtncMock(sisl.io.tbtrans.tbtncSileTBtrans):
+    """ A tbtncSileTBtrans without a file, variables are stored in a dictionary """
+    wk = None
+
+    def __init__(self, geometry=None, wk=None, **variables):
+        self._access = 0
+        self._k_avg = False
+        self._data = {'_geom': geometry}
+        self._vars = variables
+        self.wk = wk
+
+    def _variable(self, name, tree=None):
+        return self._vars[name]
+
+
+def test_bond_current_from_orbital_only():
+    # 2 atoms with 2 orbitals each
+    atom = sisl.Atom(6, R=[1.5, 1.5])
+    geom = sisl.Geometry([[0] * 3, [1, 0, 0]], atom, sc=[10, 10, 10])
+    tbt = _tbtncMock(geom)
+
+    # Opposite orbital currents on the same bond
+    Jij = sisl.SparseOrbital(geom)
+    Jij[0, 2] = 1.
+    Jij[1, 3] = -0.4
+    Jij[3, 0] = 0.5
+    Jij = Jij.tocsr()
+
+    assert tbt.bond_current_from_orbital(Jij, only='+')[0, 1] == pytest.approx(1.)
+    assert tbt.bond_current_from_orbital(Jij, only='-')[0, 1] == pytest.approx(-0.4)
+    assert tbt.bond_current_from_orbital(Jij, only='all')[0, 1] == pytest.approx(0.6)
+    Jab = tbt.bond_current_from_orbital(Jij, only='-')
+    assert Jab.nnz == 1
+    assert Jab[1, 0] == 0.
+    Jab = tbt.bond_current_from_orbital([Jij, Jij * 2], only='+')
+    assert Jab[1][0, 1] == pytest.approx(2.)
+    assert Jab[1][1, 0] == pytest.approx(1.)
+
+    # bond_current filters in the same way
+    tbt._sparse_data = lambda *args: Jij
+    for only in ['+', '-', 'all']:
+        Jab = tbt.bond_current(0, 0, only=only)
+        assert abs(Jab - tbt.bond_current_from_orbital(Jij, only=only)).max() == 0.
+
+
+@pytest.mark.parametrize("kavg", [True, False, 1])
+@pytest.mark.parametrize("E", [[4, 1, 1, 2], [2, 1], [0, 1, 2], [3, 0, 3], 2])
+def test_value_E_order(kavg, E):
+    # k, E, orbital
+    np.random.seed(1)
+    wk = np.array([0.25, 0.5, 0.25])
+    v = np.random.rand(3, 5, 2)
+    tbt = _tbtncMock(wk=wk, DOS=v)
+
+    data = tbt._value_E('DOS', kavg=kavg, E=E)
+    if kavg is True:
+        ref = np.tensordot(wk, v, axes=(0, 0))[E, ...]
+    elif kavg is False:
+        ref = v[:, E, ...]
+    else:
+        ref = v[kavg, E, ...]
+    assert data.shape == ref.shape
+    assert np.allclose(data, ref)
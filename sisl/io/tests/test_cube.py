@@ -98,3 +98,19 @@ def test_imaginary_fail_geometry(sisl_tmp):
     grid2 = Grid(0.3, dtype=np.complex128)
     grid2.write(fi, imag=True)
     grid.read(fr, imag=fi)
+
+
+def test_region_stride(sisl_tmp):
+    f = sisl_tmp('GRID.cube', _dir)
+    geom = Geometry(np.random.rand(10, 3), np.random.randint(1, 70, 10), sc=[10, 10, 10, 45, 60, 90])
+    grid = Grid(0.2, geometry=geom)
+    grid.grid = np.random.rand(*grid.shape)
+    grid.write(f)
+    read = grid.read(f)
+    sub = grid.read(f, region=[(2, 10), None, 3], stride=[3, 2, 1])
+    assert np.allclose(read.grid[2:10:3, ::2, 3:4], sub.grid)
+    assert np.allclose(sub.sc.origo, read.dcell[0] * 2 + read.dcell[2] * 3)
+    assert np.allclose(sub.dcell[0], read.dcell[0] * 3)
+    assert np.allclose(sub.dcell[1], read.dcell[1] * 2)
+    assert np.allclose(sub.dcell[2], read.dcell[2])
+    assert np.allclose(sub.geometry.xyz, read.geometry.xyz)
@@ -6,7 +6,9 @@ import numpy as np
 from .sile import SileVASP
 from ..sile import *
 from .car import carSileVASP
+from .._help import grid_slices, grid_supercell, grid_read_planes
 
+import sisl._array as _a
 from sisl import Grid
 
 __all__ = ['chgSileVASP']
@@ -19,7 +21,7 @@ class chgSileVASP(carSileVASP):
     """
 
     @sile_fh_open(True)
-    def read_grid(self, index=0, dtype=np.float64):
+    def read_grid(self, index=0, dtype=np.float64, region=None, stride=None):
         """ Reads the charge density from the file and returns with a grid (plus geometry)
 
         Parameters
@@ -32,6 +34,12 @@ class chgSileVASP(carSileVASP):
            contributions for each corresponding index.
         dtype : numpy.dtype, optional
            grid stored dtype
+        region : list of (None, int, (int, int) or slice), optional
+           the retained grid points along each lattice vector, see `~sisl.io._help.grid_slices`.
+           Only the z-planes in the region are parsed and the returned grid has its
+           supercell shifted to the first retained grid point.
+        stride : int or (3, ) of int, optional
+           only read every `stride` grid point (along each lattice vector)
 
         Returns
         -------
@@ -44,26 +52,18 @@ class chgSileVASP(carSileVASP):
         # We can now read the size of CHGCAR
         self.readline()
         nx, ny, nz = list(map(int, self.readline().split()))
-        n = nx * ny * nz
+        sx, sy, sz = slices = grid_slices([nx, ny, nz], region, stride)
+        # The values are stored with x as the fastest index, hence only the needed
+        # z-planes are parsed
+        planes = _a.arangei(nz)[sz]
 
-        is_index = True
         if isinstance(index, Integral):
-            max_index = index + 1
-        else:
-            is_index = False
-            max_index = len(index)
+            index = [0] * index + [1]
 
         rl = self.readline
-        vals = []
-        vapp = vals.append
-
-        i = 0
-        while i < n * max_index:
-            dat = [l for l in rl().split()]
-            vapp(dat)
-            i += len(dat)
-
-            if i % n == 0 and i < n * max_index:
+        val = None
+        for i, scale in enumerate(index):
+            if i > 0:
                 # Each time a new spin-index is present, we need to read the coordinates
                 j = 0
                 while j < geom.na:
@@ -72,20 +72,26 @@ class chgSileVASP(carSileVASP):
                 # one line of nx, ny, nz
                 rl()
 
-        # Cut size before proceeding (otherwise it *may* fail)
-        vals = np.array(vals).astype(dtype).ravel()
-        if is_index:
-            val = vals[n * index:n * (index+1)].reshape(nz, ny, nx)
-        else:
-            vals = vals[:n * max_index].reshape(-1, nz, ny, nx)
-            val = vals[0] * index[0]
-            for i, scale in enumerate(index[1:]):
-                val += vals[i + 1] * scale
+            last = i == len(index) - 1
+            if scale == 0 and not last:
+                # Simply skip the data
+                grid_read_planes(rl, nx * ny, [], nz, dtype)
+                continue
+
+            vals = grid_read_planes(rl, nx * ny, planes, None if last else nz, dtype)
+            vals = vals.reshape(-1, ny, nx)[:, sy, sx]
+            if val is None:
+                val = vals * scale
+            else:
+                val += vals * scale
         del vals
 
         # Make it C-ordered with nx, ny, nz
         val = np.swapaxes(val, 0, 2) / V
 
+        # The grid (and geometry) spans the retained grid points
+        geom.set_supercell(grid_supercell(geom.sc, [nx, ny, nz], slices))
+
         # Create the grid with data
         # Since we populate the grid data afterwards there
         # is no need to create a bigger grid than necessary.
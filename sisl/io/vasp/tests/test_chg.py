@@ -38,3 +38,14 @@ def test_graphene_chgcar_index_float(sisl_files):
     gridh = chgSileVASP(f).read_grid(index=[0.5])
 
     assert grid.grid.sum() / 2 == pytest.approx(gridh.grid.sum())
+
+
+def test_graphene_chgcar_region(sisl_files):
+    f = sisl_files(_dir, 'graphene/CHGCAR')
+    grid = chgSileVASP(f).read_grid()
+    sub = chgSileVASP(f).read_grid(region=[None, None, (2, 7)], stride=[2, 1, 1])
+
+    assert np.allclose(grid.grid[::2, :, 2:7], sub.grid)
+    assert np.allclose(sub.sc.origo, grid.dcell[2] * 2)
+    assert np.allclose(sub.dcell[0], grid.dcell[0] * 2)
+    assert sub.geometry.na == grid.geometry.na
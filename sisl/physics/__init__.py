@@ -61,6 +61,8 @@ Electrons (:mod:`~sisl.physics.electron`)
    ~electron.velocity
    ~electron.velocity_matrix
    ~electron.berry_phase
+   ~electron.berry_curvature
+   ~electron.chern
    ~electron.wavefunction
    ~electron.spin_moment
    ~electron.spin_squared
@@ -12,12 +12,10 @@ from ._matrix_phase3 import *
 _dot = np.dot
 _roll = np.roll
 
-__all__ = ['matrix_ddk']
+__all__ = ['matrix_ddk', 'matrix_ddk_state']
 
 
-def matrix_ddk(gauge, M, const int idx, sc,
-               np.ndarray[np.float64_t, ndim=1, mode='c'] k, dtype, format):
-    dtype = phase_dtype(k, dtype)
+def _phase_ddk(gauge, M, sc, np.ndarray[np.float64_t, ndim=1, mode='c'] k, dtype):
     # This is the double differentiated matrix with respect to k
     #  - i R (- i R) == - R ** 2
     if gauge == 'R':
@@ -39,7 +37,35 @@ def matrix_ddk(gauge, M, const int idx, sc,
         del rij, phases
         p_opt = 1
 
-    return _matrix_ddk(M._csr, idx, Rd, Ro, dtype, format, p_opt)
+    return Rd, Ro, p_opt
+
+
+def matrix_ddk(gauge, M, int idx, sc,
+               np.ndarray[np.float64_t, ndim=1, mode='c'] k, dtype, format):
+    dtype = phase_dtype(k, dtype)
+    Rd, Ro, p_opt = _phase_ddk(gauge, M, sc, k, dtype)
+    csr, idx = M._csr._kernel_arrays(idx)
+    return _matrix_ddk(csr, idx, Rd, Ro, dtype, format, p_opt)
+
+
+def matrix_ddk_state(gauge, M, int idx, sc,
+                     np.ndarray[np.float64_t, ndim=1, mode='c'] k, state):
+    r""" Expectation values of the double k-derivative matrices, :math:`\langle\psi_i|\partial^2_k\mathbf M|\psi_i\rangle`
+
+    All 6 Cartesian directions (in Voigt order) are calculated while traversing the sparse
+    matrix twice and without creating the derivative matrices.
+
+    Returns
+    -------
+    numpy.ndarray
+       expectation values of shape ``(state.shape[0], 6)``
+    """
+    Rd, Ro, p_opt = _phase_ddk(gauge, M, sc, k, np.complex128)
+    # Ensure the states are the fastest index
+    state = np.ascontiguousarray(np.asarray(state).T, dtype=np.complex128)
+    csr, idx = M._csr._kernel_arrays(idx)
+    return np.concatenate((_phase3_state_c128(csr.ptr, csr.ncol, csr.col, csr._D, idx, Rd, p_opt, state),
+                           _phase3_state_c128(csr.ptr, csr.ncol, csr.col, csr._D, idx, Ro, p_opt, state)), axis=1)
 
 
 @cython.boundscheck(False)
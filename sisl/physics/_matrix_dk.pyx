@@ -11,13 +11,10 @@ from ._matrix_phase3 import *
 
 _dot = np.dot
 
-__all__ = ['matrix_dk']
+__all__ = ['matrix_dk', 'matrix_dk_state']
 
 
-def matrix_dk(gauge, M, const int idx, sc,
-              np.ndarray[np.float64_t, ndim=1, mode='c'] k, dtype, format):
-    dtype = phase_dtype(k, dtype, True)
-
+def _phase_dk(gauge, M, sc, np.ndarray[np.float64_t, ndim=1, mode='c'] k, dtype):
     # This is the differentiated matrix with respect to k
     #  - i R
     if gauge == 'R':
@@ -32,7 +29,34 @@ def matrix_dk(gauge, M, const int idx, sc,
         del rij
         p_opt = 0
 
-    return _matrix_dk(M._csr, idx, iRs, dtype, format, p_opt)
+    return iRs, p_opt
+
+
+def matrix_dk(gauge, M, int idx, sc,
+              np.ndarray[np.float64_t, ndim=1, mode='c'] k, dtype, format):
+    dtype = phase_dtype(k, dtype, True)
+    iRs, p_opt = _phase_dk(gauge, M, sc, k, dtype)
+    csr, idx = M._csr._kernel_arrays(idx)
+    return _matrix_dk(csr, idx, iRs, dtype, format, p_opt)
+
+
+def matrix_dk_state(gauge, M, int idx, sc,
+                    np.ndarray[np.float64_t, ndim=1, mode='c'] k, state):
+    r""" Expectation values of the k-derivative matrices, :math:`\langle\psi_i|\partial_k\mathbf M|\psi_i\rangle`
+
+    All 3 Cartesian directions are calculated while traversing the sparse matrix once and
+    without creating the derivative matrices.
+
+    Returns
+    -------
+    numpy.ndarray
+       expectation values of shape ``(state.shape[0], 3)``
+    """
+    iRs, p_opt = _phase_dk(gauge, M, sc, k, np.complex128)
+    # Ensure the states are the fastest index
+    state = np.ascontiguousarray(np.asarray(state).T, dtype=np.complex128)
+    csr, idx = M._csr._kernel_arrays(idx)
+    return _phase3_state_c128(csr.ptr, csr.ncol, csr.col, csr._D, idx, iRs, p_opt, state)
 
 
 @cython.boundscheck(False)
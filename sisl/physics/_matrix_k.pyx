@@ -15,7 +15,7 @@ from ._matrix_phase_so import *
 __all__ = ['matrix_k', 'matrix_k_nc', 'matrix_k_so', 'matrix_k_nc_diag']
 
 
-def matrix_k(gauge, M, const int idx, sc,
+def matrix_k(gauge, M, int idx, sc,
              np.ndarray[np.float64_t, ndim=1, mode='c'] k, dtype, format):
     dtype = phase_dtype(k, dtype)
     if gauge == 'R':
@@ -27,7 +27,8 @@ def matrix_k(gauge, M, const int idx, sc,
         phases = phase_rij(M.Rij()._csr._D, sc, k, dtype)
         p_opt = 0
 
-    return _matrix_k(M._csr, idx, phases, dtype, format, p_opt)
+    csr, idx = M._csr._kernel_arrays(idx)
+    return _matrix_k(csr, idx, phases, dtype, format, p_opt)
 
 
 @cython.boundscheck(False)
@@ -71,7 +72,8 @@ def matrix_k_nc(gauge, M, sc,
         M.finalize()
         phases = phase_rij(M.Rij()._csr._D, sc, k, dtype)
         p_opt = 0
-    return _matrix_k_nc(M._csr, phases, dtype, format, p_opt)
+    csr = M._csr._kernel_arrays()[0]
+    return _matrix_k_nc(csr, phases, dtype, format, p_opt)
 
 
 @cython.boundscheck(False)
@@ -108,7 +110,8 @@ def matrix_k_so(gauge, M, sc,
         M.finalize()
         phases = phase_rij(M.Rij()._csr._D, sc, k, dtype)
         p_opt = 0
-    return _matrix_k_so(M._csr, phases, dtype, format, p_opt)
+    csr = M._csr._kernel_arrays()[0]
+    return _matrix_k_so(csr, phases, dtype, format, p_opt)
 
 
 @cython.boundscheck(False)
@@ -135,7 +138,7 @@ def _matrix_k_so(csr, phases, dtype, format, p_opt):
     raise ValueError('matrix_sc_so: only supports dtype in [complex64, complex128].')
 
 
-def matrix_k_nc_diag(gauge, M, const int idx, sc,
+def matrix_k_nc_diag(gauge, M, int idx, sc,
                      np.ndarray[np.float64_t, ndim=1, mode='c'] k, dtype, format):
     dtype = phase_dtype(k, dtype, True)
     if gauge == 'R':
@@ -145,7 +148,8 @@ def matrix_k_nc_diag(gauge, M, const int idx, sc,
         M.finalize()
         phases = phase_rij(M.Rij()._csr._D, sc, k, dtype)
         p_opt = 0
-    return _matrix_k_nc_diag(M._csr, idx, phases, dtype, format, p_opt)
+    csr, idx = M._csr._kernel_arrays(idx)
+    return _matrix_k_nc_diag(csr, idx, phases, dtype, format, p_opt)
 
 
 @cython.boundscheck(False)
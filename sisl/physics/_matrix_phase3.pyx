@@ -12,7 +12,8 @@ from sisl._sparse import fold_csr_matrix
 __all__ = ['_phase3_csr_f32', '_phase3_csr_f64',
            '_phase3_csr_c64', '_phase3_csr_c128',
            '_phase3_array_f32', '_phase3_array_f64',
-           '_phase3_array_c64', '_phase3_array_c128']
+           '_phase3_array_c64', '_phase3_array_c128',
+           '_phase3_state_c128']
 
 # The fused data-types forces the data input to be of "correct" values.
 ctypedef fused numeric_real:
@@ -446,3 +447,54 @@ def _phase3_array_c128(np.ndarray[np.int32_t, ndim=1, mode='c'] PTR,
                 vz[r, c] = vz[r, c] + d * phases[s, 2]
 
     return Vx, Vy, Vz
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+@cython.initializedcheck(False)
+@cython.cdivision(True)
+def _phase3_state_c128(np.ndarray[np.int32_t, ndim=1, mode='c'] PTR,
+                       np.ndarray[np.int32_t, ndim=1, mode='c'] NCOL,
+                       np.ndarray[np.int32_t, ndim=1, mode='c'] COL,
+                       numeric_complex[:, ::1] D, const int idx,
+                       np.ndarray[np.complex128_t, ndim=2, mode='c'] PHASES, const int p_opt,
+                       np.ndarray[np.complex128_t, ndim=2, mode='c'] STATE):
+    """ Calculate the expectation values of the 3 matrices for each state
+
+    This does not create the matrices but accumulates the expectation value
+    for all states while traversing the sparse elements.
+    Note that `STATE` is transposed, i.e. the 2nd dimension corresponds to the states.
+    """
+
+    # Convert to memory views
+    cdef int[::1] ptr = PTR
+    cdef int[::1] ncol = NCOL
+    cdef int[::1] col = COL
+    cdef double complex[:, ::1] phases = PHASES
+    cdef double complex[:, ::1] state = STATE
+
+    cdef int nr = ncol.shape[0]
+    cdef int ns = state.shape[1]
+    cdef np.ndarray[np.complex128_t, ndim=2, mode='c'] V = np.zeros([ns, 3], dtype=np.complex128)
+    cdef double complex[:, ::1] v = V
+    cdef double complex d, dx, dy, dz, t
+    cdef int r, ind, s, c, i
+
+    for r in range(nr):
+        for ind in range(ptr[r], ptr[r] + ncol[r]):
+            c = col[ind] % nr
+            if p_opt == 0:
+                s = ind
+            else:
+                s = col[ind] / nr
+            d = <double complex> D[ind, idx]
+            dx = d * phases[s, 0]
+            dy = d * phases[s, 1]
+            dz = d * phases[s, 2]
+            for i in range(ns):
+                t = state[r, i].conjugate() * state[c, i]
+                v[i, 0] = v[i, 0] + t * dx
+                v[i, 1] = v[i, 1] + t * dy
+                v[i, 2] = v[i, 2] + t * dz
+
+    return V
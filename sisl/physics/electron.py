@@ -20,6 +20,8 @@ One may also plot real-space wavefunctions.
    velocity
    velocity_matrix
    berry_phase
+   berry_curvature
+   chern
    wavefunction
    spin_moment
    spin_squared
@@ -50,6 +52,7 @@ automatically passes the correct ``S`` because it knows the states :math:`k`-poi
 from __future__ import print_function, division
 
 from functools import reduce
+from multiprocessing.pool import ThreadPool
 import numpy as np
 from numpy import find_common_type
 from numpy import zeros, empty
@@ -67,18 +70,20 @@ from sisl.oplist import oplist
 from sisl._math_small import xyz_to_spherical_cos_phi
 import sisl._array as _a
 from sisl.linalg import svd_destroy, eigvals_destroy
-from sisl.linalg import eigh_destroy, det_destroy
+from sisl.linalg import det_destroy
 from sisl.messages import info, warn, SislError, tqdm_eta
 from sisl._help import dtype_complex_to_real, _range as range
 from .distribution import get_distribution
 from .spin import Spin
-from .sparse import SparseOrbitalBZSpin
+from .sparse import SparseOrbitalBZ, SparseOrbitalBZSpin
 from .state import Coefficient, State, StateC
+from .state import _decouple_degenerate
 
 
 __all__ = ['DOS', 'PDOS']
 __all__ += ['velocity', 'velocity_matrix']
 __all__ += ['spin_moment', 'inv_eff_mass_tensor', 'berry_phase']
+__all__ += ['berry_curvature', 'chern']
 __all__ += ['wavefunction']
 __all__ += ['CoefficientElectron', 'StateElectron', 'StateCElectron']
 __all__ += ['EigenvalueElectron', 'EigenvectorElectron', 'EigenstateElectron']
@@ -302,35 +307,35 @@ def spin_moment(state, S=None):
     if state.ndim == 1:
         return spin_moment(state.reshape(1, -1), S).ravel()
 
-    if S is None:
-        class S(object):
-            __slots__ = []
-            shape = (state.shape[1] // 2, state.shape[1] // 2)
-            @staticmethod
-            def dot(v):
-                return v
-
-    if S.shape[1] == state.shape[1]:
-        S = S[::2, ::2]
-
     # Initialize
     s = np.empty([state.shape[0], 3], dtype=dtype_complex_to_real(state.dtype))
 
-    # TODO consider doing this all in a few lines
-    # TODO Since there are no energy dependencies here we can actually do all
-    # TODO dot products in one go and then use b-casting rules. Should be much faster
-    # TODO but also way more memory demanding!
-    for i in range(len(state)):
-        Sstate = S.dot(state[i].reshape(-1, 2))
-        D = (conj(state[i]) * Sstate.ravel()).real.reshape(-1, 2)
-        s[i, 2] = (D[:, 0] - D[:, 1]).sum()
-        D = 2 * (conj(state[i, 1::2]) * Sstate[:, 0]).sum()
-        s[i, 0] = D.real
-        s[i, 1] = D.imag
+    # Spinor components of all states (orbitals along the 1st dimension)
+    up = state[:, ::2].T
+    dn = state[:, 1::2].T
+
+    if S is None:
+        S_up = up
+        S_dn = dn
+    else:
+        if S.shape[1] == state.shape[1]:
+            S = S[::2, ::2]
+        # Apply the overlap matrix to all states at once
+        S_up = S.dot(up)
+        S_dn = S.dot(dn)
+
+    s[:, 2] = (conj(up) * S_up).sum(0).real - (conj(dn) * S_dn).sum(0).real
+    D = 2 * (conj(dn) * S_up).sum(0)
+    s[:, 0] = D.real
+    s[:, 1] = D.imag
 
     return s
 
 
+# Number of states processed in each matrix-matrix product in spin_squared
+_spin_squared_block = 256
+
+
 def spin_squared(state_alpha, state_beta, S=None):
     r""" Calculate the spin squared expectation value between two spin states
 
@@ -389,29 +394,30 @@ def spin_squared(state_alpha, state_beta, S=None):
     n_alpha = state_alpha.shape[0]
     n_beta = state_beta.shape[0]
 
+    # The overlap matrix is applied to the larger set of states and the
+    # smaller set of states is processed in blocks to limit the memory usage
+    # of the intermediate overlap matrix (matrix-matrix products).
     if n_alpha > n_beta:
-        # Loop beta...
         Sa = zeros([n_alpha], dtype=dtype_complex_to_real(state_alpha.dtype))
         Sb = empty([n_beta], dtype=Sa.dtype)
 
         S_state_alpha = S.dot(state_alpha.T)
-        for i in range(n_beta):
-            D = dot(conj(state_beta[i]), S_state_alpha)
-            D *= conj(D)
-            Sa += D.real
-            Sb[i] = D.sum().real
+        for i in range(0, n_beta, _spin_squared_block):
+            D = dot(conj(state_beta[i:i+_spin_squared_block]), S_state_alpha)
+            D = D.real ** 2 + D.imag ** 2
+            Sa += D.sum(0)
+            Sb[i:i+_spin_squared_block] = D.sum(1)
 
     else:
-        # Loop alpha...
         Sa = empty([n_alpha], dtype=dtype_complex_to_real(state_alpha.dtype))
         Sb = zeros([n_beta], dtype=Sa.dtype)
 
         S_state_beta = S.dot(state_beta.T)
-        for i in range(n_alpha):
-            D = dot(conj(state_alpha[i]), S_state_beta)
-            D *= conj(D)
-            Sb += D.real
-            Sa[i] = D.sum().real
+        for i in range(0, n_alpha, _spin_squared_block):
+            D = dot(conj(state_alpha[i:i+_spin_squared_block]), S_state_beta)
+            D = D.real ** 2 + D.imag ** 2
+            Sb += D.sum(0)
+            Sa[i:i+_spin_squared_block] = D.sum(1)
 
     return oplist((Sa, Sb))
 
@@ -475,20 +481,10 @@ def _velocity_non_ortho(state, dHk, energy, dSk, degenerate):
 
     # Decouple the degenerate states
     if not degenerate is None:
-        for deg in degenerate:
-            # Set the average energy
-            e = np.average(energy[deg])
-            energy[deg] = e
-
-            # Now diagonalize to find the contributions from individual states
-            # then re-construct the seperated degenerate states
-            # Since we do this for all directions we should decouple them all
-            vv = conj(state[deg, :]).dot((dHk[0] - e * dSk[0]).dot(state[deg, :].T))
-            S = eigh_destroy(vv)[1].T.dot(state[deg, :])
-            vv = conj(S).dot((dHk[1] - e * dSk[1]).dot(S.T))
-            S = eigh_destroy(vv)[1].T.dot(S)
-            vv = conj(S).dot((dHk[2] - e * dSk[2]).dot(S.T))
-            state[deg, :] = eigh_destroy(vv)[1].T.dot(S)
+        # Now diagonalize to find the contributions from individual states
+        # then re-construct the seperated degenerate states
+        # Since we do this for all directions we should decouple them all
+        _decouple_degenerate(state, degenerate, dHk, energy, dSk)
 
     # Since they depend on the state energies and dSk we have to loop them individually.
     for s, e in enumerate(energy):
@@ -510,16 +506,10 @@ def _velocity_ortho(state, dHk, degenerate):
 
     # Decouple the degenerate states
     if not degenerate is None:
-        for deg in degenerate:
-            # Now diagonalize to find the contributions from individual states
-            # then re-construct the seperated degenerate states
-            # Since we do this for all directions we should decouple them all
-            vv = conj(state[deg, :]).dot(dHk[0].dot(state[deg, :].T))
-            S = eigh_destroy(vv)[1].T.dot(state[deg, :])
-            vv = conj(S).dot((dHk[1]).dot(S.T))
-            S = eigh_destroy(vv)[1].T.dot(S)
-            vv = conj(S).dot((dHk[2]).dot(S.T))
-            state[deg, :] = eigh_destroy(vv)[1].T.dot(S)
+        # Now diagonalize to find the contributions from individual states
+        # then re-construct the seperated degenerate states
+        # Since we do this for all directions we should decouple them all
+        _decouple_degenerate(state, degenerate, dHk)
 
     v[:, 0] = (conj(state.T) * dHk[0].dot(state.T)).sum(0).real
     v[:, 1] = (conj(state.T) * dHk[1].dot(state.T)).sum(0).real
@@ -592,29 +582,19 @@ def _velocity_matrix_non_ortho(state, dHk, energy, dSk, degenerate, dtype):
 
     # Decouple the degenerate states
     if not degenerate is None:
-        for deg in degenerate:
-            # Set the average energy
-            e = np.average(energy[deg])
-            energy[deg] = e
-
-            # Now diagonalize to find the contributions from individual states
-            # then re-construct the seperated degenerate states
-            # Since we do this for all directions we should decouple them all
-            vv = conj(state[deg, :]).dot((dHk[0] - e * dSk[0]).dot(state[deg, :].T))
-            S = eigh_destroy(vv)[1].T.dot(state[deg, :])
-            vv = conj(S).dot((dHk[1] - e * dSk[1]).dot(S.T))
-            S = eigh_destroy(vv)[1].T.dot(S)
-            vv = conj(S).dot((dHk[2] - e * dSk[2]).dot(S.T))
-            state[deg, :] = eigh_destroy(vv)[1].T.dot(S)
-
-    # Since they depend on the state energies and dSk we have to loop them individually.
-    for s, e in enumerate(energy):
-
-        # Since dHk *may* be a csr_matrix or sparse, we have to do it like
-        # this. A sparse matrix cannot be re-shaped with an extra dimension.
-        v[s, :, 0] = conj(state).dot((dHk[0] - e * dSk[0]).dot(state[s]))
-        v[s, :, 1] = conj(state).dot((dHk[1] - e * dSk[1]).dot(state[s]))
-        v[s, :, 2] = conj(state).dot((dHk[2] - e * dSk[2]).dot(state[s]))
+        # Now diagonalize to find the contributions from individual states
+        # then re-construct the seperated degenerate states
+        # Since we do this for all directions we should decouple them all
+        _decouple_degenerate(state, degenerate, dHk, energy, dSk)
+
+    # All states are multiplied at once, the energy dependence of the
+    # dSk term is handled by scaling the columns of the products.
+    # Since dHk *may* be a csr_matrix or sparse, we have to do it like
+    # this. A sparse matrix cannot be re-shaped with an extra dimension.
+    cstate = conj(state)
+    energy = np.asarray(energy).reshape(1, -1)
+    for i in range(3):
+        v[:, :, i] = cstate.dot(dHk[i].dot(state.T) - dSk[i].dot(state.T) * energy).T
 
     return v * _velocity_const
 
@@ -628,21 +608,15 @@ def _velocity_matrix_ortho(state, dHk, degenerate, dtype):
 
     # Decouple the degenerate states
     if not degenerate is None:
-        for deg in degenerate:
-            # Now diagonalize to find the contributions from individual states
-            # then re-construct the seperated degenerate states
-            # Since we do this for all directions we should decouple them all
-            vv = conj(state[deg, :]).dot(dHk[0].dot(state[deg, :].T))
-            S = eigh_destroy(vv)[1].T.dot(state[deg, :])
-            vv = conj(S).dot((dHk[1]).dot(S.T))
-            S = eigh_destroy(vv)[1].T.dot(S)
-            vv = conj(S).dot((dHk[2]).dot(S.T))
-            state[deg, :] = eigh_destroy(vv)[1].T.dot(S)
-
-    for s in range(n):
-        v[s, :, 0] = conj(state).dot(dHk[0].dot(state[s, :]))
-        v[s, :, 1] = conj(state).dot(dHk[1].dot(state[s, :]))
-        v[s, :, 2] = conj(state).dot(dHk[2].dot(state[s, :]))
+        # Now diagonalize to find the contributions from individual states
+        # then re-construct the seperated degenerate states
+        # Since we do this for all directions we should decouple them all
+        _decouple_degenerate(state, degenerate, dHk)
+
+    # All states are multiplied at once
+    cstate = conj(state)
+    for i in range(3):
+        v[:, :, i] = cstate.dot(dHk[i].dot(state.T)).T
 
     return v * _velocity_const
 
@@ -726,19 +700,10 @@ def _inv_eff_mass_tensor_non_ortho(state, ddHk, energy, ddSk, degenerate, as_mat
 
     # Now decouple the degenerate states
     if not degenerate is None:
-        for deg in degenerate:
-            e = np.average(energy[deg])
-            energy[deg] = e
-
-            # Now diagonalize to find the contributions from individual states
-            # then re-construct the seperated degenerate states
-            # We only do this along the double derivative directions
-            vv = conj(state[deg, :]).dot((ddHk[0] - e * ddSk[0]).dot(state[deg, :].T))
-            S = eigh_destroy(vv)[1].T.dot(state[deg, :])
-            vv = conj(S).dot((ddHk[1] - e * ddSk[1]).dot(S.T))
-            S = eigh_destroy(vv)[1].T.dot(S)
-            vv = conj(S).dot((ddHk[2] - e * ddSk[2]).dot(S.T))
-            state[deg, :] = eigh_destroy(vv)[1].T.dot(S)
+        # Now diagonalize to find the contributions from individual states
+        # then re-construct the seperated degenerate states
+        # We only do this along the double derivative directions
+        _decouple_degenerate(state, degenerate, ddHk[:3], energy, ddSk[:3])
 
     # Since they depend on the state energies and ddSk we have to loop them individually.
     for s, e in enumerate(energy):
@@ -773,16 +738,10 @@ def _inv_eff_mass_tensor_ortho(state, ddHk, degenerate, as_matrix):
 
     # Now decouple the degenerate states
     if not degenerate is None:
-        for deg in degenerate:
-            # Now diagonalize to find the contributions from individual states
-            # then re-construct the seperated degenerate states
-            # We only do this along the double derivative directions
-            vv = conj(state[deg, :]).dot(ddHk[0].dot(state[deg, :].T))
-            S = eigh_destroy(vv)[1].T.dot(state[deg, :])
-            vv = conj(S).dot(ddHk[1].dot(S.T))
-            S = eigh_destroy(vv)[1].T.dot(S)
-            vv = conj(S).dot(ddHk[2].dot(S.T))
-            state[deg, :] = eigh_destroy(vv)[1].T.dot(S)
+        # Now diagonalize to find the contributions from individual states
+        # then re-construct the seperated degenerate states
+        # We only do this along the double derivative directions
+        _decouple_degenerate(state, degenerate, ddHk[:3])
 
     for i in range(6):
         M[:, i] = (conj(state.T) * ddHk[i].dot(state.T)).sum(0).real
@@ -801,7 +760,7 @@ def _inv_eff_mass_tensor_ortho(state, ddHk, degenerate, as_matrix):
     return M * _inv_eff_mass_const
 
 
-def berry_phase(contour, sub=None, eigvals=False, closed=True, method='berry'):
+def berry_phase(contour, sub=None, eigvals=False, closed=True, method='berry', threads=1):
     r""" Calculate the Berry-phase on a loop using a predefined path
 
     The Berry phase for a single Bloch state is calculated using the discretized formula:
@@ -828,6 +787,15 @@ def berry_phase(contour, sub=None, eigvals=False, closed=True, method='berry'):
        'zak' will compute the Zak phase for 1D systems by performing a closed loop integration but
        taking into account the Bloch factor :math:`e^{-i2\pi/a x}` accumulated over a Brillouin zone,
        see J. Zak, "Berry's phase for energy bands in solids" PRL 62, 2747 (1989).
+    threads : int, optional
+       number of threads used for calculating the eigenstates concurrently. Only
+       `threads` eigenstates are calculated at a time and only the neighbouring eigenstates
+       are retained in memory.
+
+    See Also
+    --------
+    berry_curvature : Berry curvature on a 2D k-mesh
+    chern : Chern number from the Berry curvature
 
     Notes
     -----
@@ -944,7 +912,10 @@ def berry_phase(contour, sub=None, eigvals=False, closed=True, method='berry'):
             return prd
 
     # Do the actual calculation of the final matrix
-    d = _berry(contour.asyield().eigenstate())
+    if threads > 1:
+        d = _berry(_eigenstate_iter(contour.parent, contour.k, threads))
+    else:
+        d = _berry(contour.asyield().eigenstate())
 
     # Correct return values
     if eigvals:
@@ -956,6 +927,205 @@ def berry_phase(contour, sub=None, eigvals=False, closed=True, method='berry'):
     return ret
 
 
+def _eigenstate_iter(H, k, threads=1, sub=None, **kwargs):
+    """ Iterate the eigenstates of `H` at `k` while calculating `threads` eigenstates concurrently """
+    def func(k):
+        es = H.eigenstate(k, **kwargs)
+        if sub is None:
+            return es
+        return es.sub(sub)
+
+    if threads <= 1:
+        for kk in k:
+            yield func(kk)
+        return
+
+    pool = ThreadPool(threads)
+    try:
+        for i in range(0, len(k), threads):
+            for es in pool.map(func, k[i:i+threads]):
+                yield es
+    finally:
+        pool.terminate()
+
+
+def _berry_flux(H, N, sub, axes, origin, threads, **kwargs):
+    r""" Berry flux through all plaquettes of a 2D k-mesh using the Fukui-Hatsugai method
+
+    The mesh is traversed line by line such that only the eigenstates of two
+    neighbouring lines (and the first line for periodicity) are retained in memory.
+
+    Returns
+    -------
+    flux : numpy.ndarray
+       the Berry flux through each plaquette, shape ``(N[0], N[1])``
+    dk : numpy.ndarray
+       the Cartesian k-vectors spanning a plaquette, shape ``(2, 3)``
+    """
+    N = _a.arrayi(N).ravel()
+    if N.size == 1:
+        N = np.tile(N, 2)
+    if N.size != 2 or np.any(N < 2):
+        raise ValueError('berry_curvature: requires N to be 2 integers larger than 1')
+    axes = _a.arrayi(axes).ravel()
+    if axes.size != 2 or axes[0] == axes[1]:
+        raise ValueError('berry_curvature: requires axes to be 2 different lattice directions')
+
+    # Reduced k-vectors spanning a plaquette
+    dkr = _a.zerosd([2, 3])
+    dkr[0, axes[0]] = 1. / N[0]
+    dkr[1, axes[1]] = 1. / N[1]
+
+    # The eigenstates are calculated in the cell vector gauge (R) which makes them
+    # periodic in the Brillouin zone. The overlap of the periodic part of the
+    # Bloch functions, i.e. the orbital distance gauge (r), is then:
+    #   < u_k | u_{k+dk} > = \sum_j C^*_{k,j} e^{i dk r_j} C_{k+dk,j}
+    g = H.geometry
+    dk = dot(dkr, g.rcell)
+    phase = np.exp(1j * dot(dk, g.xyz[g.o2a(_a.arangei(g.no)), :].T))
+    if len(H) != g.no:
+        # spinor components are consecutive
+        phase = np.repeat(phase, len(H) // g.no, axis=1)
+
+    def link(s1, s2, p):
+        # Normalized determinant of the overlap matrix
+        d = det_destroy(dot(conj(s1.state), (s2.state * p).T))
+        return d / np.absolute(d)
+
+    # Create all k-points with the first axis being the fastest
+    k = _a.zerosd([N[1], N[0], 3]) + _a.asarrayd(origin).reshape(1, 1, 3)
+    k += _a.aranged(N[0]).reshape(1, -1, 1) * dkr[0].reshape(1, 1, 3)
+    k += _a.aranged(N[1]).reshape(-1, 1, 1) * dkr[1].reshape(1, 1, 3)
+    eigenstates = _eigenstate_iter(H, k.reshape(-1, 3), threads, sub, **kwargs)
+
+    def next_line():
+        return [next(eigenstates) for _ in range(N[0])]
+
+    def links_0(line):
+        return _a.arrayz([link(line[i], line[(i + 1) % N[0]], phase[0]) for i in range(N[0])])
+
+    flux = _a.emptyd(N)
+    first = next_line()
+    line = first
+    U0 = links_0(line)
+    U0_first = U0
+    for j in range(N[1]):
+        if j + 1 == N[1]:
+            line_next = first
+            U0_next = U0_first
+        else:
+            line_next = next_line()
+            U0_next = links_0(line_next)
+        U1 = _a.arrayz([link(line[i], line_next[i], phase[1]) for i in range(N[0])])
+
+        # Plaquette product (counter-clockwise)
+        flux[:, j] = - angle(U0 * np.roll(U1, -1) * conj(U0_next) * conj(U1))
+
+        line = line_next
+        U0 = U0_next
+
+    return flux, dk
+
+
+def berry_curvature(H, N, sub=None, axes=(0, 1), origin=(0, 0, 0), threads=1, **kwargs):
+    r""" Calculate the Berry curvature on a 2D k-mesh using the Fukui-Hatsugai method
+
+    The Berry curvature is calculated from the Berry phase around each plaquette of the
+    discretized 2D Brillouin zone spanned by the reciprocal lattice vectors `axes`:
+
+    .. math::
+       \Omega(\mathbf k) A = - \Im\ln U_1(\mathbf k) U_2(\mathbf k + \delta\mathbf k_1)
+             U_1^*(\mathbf k + \delta\mathbf k_2) U_2^*(\mathbf k)
+
+    with :math:`U_\mu(\mathbf k) = \mathrm{det}\langle u_{\mathbf k} | u_{\mathbf k + \delta\mathbf k_\mu}\rangle / |\dots|`
+    and :math:`A` being the plaquette area, see T. Fukui, Y. Hatsugai and H. Suzuki, J. Phys. Soc. Jpn. 74, 1674 (2005).
+
+    Parameters
+    ----------
+    H : Hamiltonian
+       the Hamiltonian (in an orthogonal basis) used for calculating the eigenstates
+    N : int or (2,) of int
+       number of k-points along each of the `axes`
+    sub : None or list of int, optional
+       selected bands to calculate the Berry curvature of, for more than one band
+       the non-Abelian (multi-band) formulation is used. Defaults to all bands.
+    axes : (2,) of int, optional
+       the reciprocal lattice vectors spanning the 2D Brillouin zone
+    origin : (3,) of float, optional
+       the origin (in reduced coordinates) of the k-mesh, this may be used to select the
+       plane perpendicular to `axes`
+    threads : int, optional
+       number of threads used for calculating the eigenstates concurrently.
+    **kwargs : dict, optional
+       passed directly to ``H.eigenstate``, e.g. `spin` for polarized Hamiltonians
+
+    See Also
+    --------
+    chern : the Chern number from the Berry curvature
+    berry_phase : Berry phase along a contour
+
+    Returns
+    -------
+    numpy.ndarray
+        Berry curvature for each plaquette with shape ``(N[0], N[1])`` in units of Ang^2.
+        The lower left corner of the plaquettes are the k-points ``origin + i / N[0] * b[axes[0]] + j / N[1] * b[axes[1]]``.
+    """
+    _berry_check(H)
+    flux, dk = _berry_flux(H, N, sub, axes, origin, threads, **kwargs)
+    area = (np.cross(dk[0], dk[1]) ** 2).sum() ** 0.5
+    return flux / area
+
+
+def chern(H, N, sub=None, axes=(0, 1), origin=(0, 0, 0), threads=1, **kwargs):
+    r""" Calculate the Chern number on a 2D k-mesh using the Fukui-Hatsugai method
+
+    The Chern number is the integrated Berry curvature, see `berry_curvature`:
+
+    .. math::
+       C = \frac1{2\pi} \int_{\mathrm{BZ}} \Omega(\mathbf k) \mathrm d\mathbf k
+
+    The lattice method ensures that the returned value is an integer (up to numerical precision)
+    even for coarse k-meshes.
+
+    Parameters
+    ----------
+    H : Hamiltonian
+       the Hamiltonian (in an orthogonal basis) used for calculating the eigenstates
+    N : int or (2,) of int
+       number of k-points along each of the `axes`
+    sub : None or list of int, optional
+       selected (occupied) bands to calculate the Chern number of. Defaults to all bands.
+    axes : (2,) of int, optional
+       the reciprocal lattice vectors spanning the 2D Brillouin zone
+    origin : (3,) of float, optional
+       the origin (in reduced coordinates) of the k-mesh
+    threads : int, optional
+       number of threads used for calculating the eigenstates concurrently.
+    **kwargs : dict, optional
+       passed directly to ``H.eigenstate``, e.g. `spin` for polarized Hamiltonians
+
+    See Also
+    --------
+    berry_curvature : the Berry curvature on the k-mesh
+
+    Returns
+    -------
+    float
+        the Chern number
+    """
+    _berry_check(H)
+    return _berry_flux(H, N, sub, axes, origin, threads, **kwargs)[0].sum() / (2 * pi)
+
+
+def _berry_check(H):
+    """ Check that the Hamiltonian is applicable for Berry curvature calculations """
+    from .hamiltonian import Hamiltonian
+    if not isinstance(H, Hamiltonian):
+        raise SislError('berry_curvature: requires a Hamiltonian!')
+    if not H.orthogonal:
+        raise SislError('berry_curvature: requires the Hamiltonian to use an orthogonal basis!')
+
+
 def wavefunction(v, grid, geometry=None, k=None, spinor=0, spin=None, eta=False):
     r""" Add the wave-function (`Orbital.psi`) component of each orbital to the grid
 
@@ -1519,6 +1689,16 @@ class StateCElectron(_electron_State, StateC):
     """ A state describing a physical quantity related to electrons, with associated coefficients of the state """
     __slots__ = []
 
+    def _parent_state_kernels(self):
+        """ Whether the expectation values of the `k` derivatives can be calculated without creating the derivative matrices
+
+        This is possible for unpolarized and polarized parents only.
+        """
+        parent = self.parent
+        if isinstance(parent, SparseOrbitalBZSpin):
+            return parent.spin.is_unpolarized or parent.spin.is_polarized
+        return isinstance(parent, SparseOrbitalBZ)
+
     def velocity(self, eps=1e-4):
         r""" Calculate velocity for the states
 
@@ -1536,12 +1716,26 @@ class StateCElectron(_electron_State, StateC):
         eps : float, optional
            precision used to find degenerate states.
         """
-        try:
-            opt = {'k': self.info.get('k', (0, 0, 0))}
-            gauge = self.info.get('gauge', None)
-            if not gauge is None:
-                opt['gauge'] = gauge
+        opt = {'k': self.info.get('k', (0, 0, 0))}
+        gauge = self.info.get('gauge', None)
+        if not gauge is None:
+            opt['gauge'] = gauge
+
+        deg = self.degenerate(eps)
+        if len(deg) == 0 and self._parent_state_kernels():
+            # Without degenerate states we need not decouple the states.
+            # Hence we calculate the expectation values directly without
+            # creating the derivative matrices
+            if self.parent.orthogonal:
+                v = 0.
+            else:
+                v = - self.c.reshape(-1, 1) * self.parent._dSk_state(self.state, **opt)
+            if 'spin' in self.info:
+                opt['spin'] = self.info['spin']
+            v = v + self.parent._dPk_state(self.state, **opt)
+            return v.real.astype(dtype_complex_to_real(self.state.dtype), copy=False) * _velocity_const
 
+        try:
             # Get dSk before spin
             if self.parent.orthogonal:
                 dSk = None
@@ -1550,7 +1744,6 @@ class StateCElectron(_electron_State, StateC):
 
             if 'spin' in self.info:
                 opt['spin'] = self.info.get('spin', None)
-            deg = self.degenerate(eps)
         except:
             raise SislError(self.__class__.__name__ + '.velocity requires the parent to have a spin associated.')
         return velocity(self.state, self.parent.dHk(**opt), self.c, dSk, degenerate=deg)
@@ -1618,15 +1811,32 @@ class StateCElectron(_electron_State, StateC):
         eps : float, optional
            precision used to find degenerate states.
         """
-        try:
-            # Ensure we are dealing with the r gauge
-            self.change_gauge('r')
-
-            opt = {'k': self.info.get('k', (0, 0, 0))}
-            gauge = self.info.get('gauge', None)
-            if not gauge is None:
-                opt['gauge'] = gauge
+        # Ensure we are dealing with the r gauge
+        self.change_gauge('r')
+
+        opt = {'k': self.info.get('k', (0, 0, 0))}
+        gauge = self.info.get('gauge', None)
+        if not gauge is None:
+            opt['gauge'] = gauge
+
+        degenerate = self.degenerate(eps)
+        if len(degenerate) == 0 and self._parent_state_kernels():
+            # Without degenerate states the expectation values are calculated
+            # directly without creating the derivative matrices
+            if self.parent.orthogonal:
+                M = 0.
+            else:
+                M = - self.c.reshape(-1, 1) * self.parent._ddSk_state(self.state, **opt)
+            if 'spin' in self.info:
+                opt['spin'] = self.info['spin']
+            M = (M + self.parent._ddPk_state(self.state, **opt)).real
+            M = M.astype(dtype_complex_to_real(self.state.dtype), copy=False) * _inv_eff_mass_const
+            if as_matrix:
+                # Voigt to matrix
+                return M[:, [0, 5, 4, 5, 1, 3, 4, 3, 2]].reshape(-1, 3, 3)
+            return M
 
+        try:
             # Get dSk before spin
             if self.parent.orthogonal:
                 ddSk = None
@@ -1635,7 +1845,6 @@ class StateCElectron(_electron_State, StateC):
 
             if 'spin' in self.info:
                 opt['spin'] = self.info.get('spin', None)
-            degenerate = self.degenerate(eps)
         except:
             raise SislError(self.__class__.__name__ + '.inv_eff_mass_tensor requires the parent to have a spin associated.')
         return inv_eff_mass_tensor(self.state, self.parent.ddHk(**opt), self.c, ddSk, degenerate, as_matrix)
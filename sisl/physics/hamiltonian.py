@@ -252,6 +252,9 @@ class Hamiltonian(SparseOrbitalBZSpin):
             # When the energy is zero, there is no shift
             return
 
+        # The eigenvalues are changed
+        self._eig_cache_clear()
+
         if self.orthogonal:
             for i in range(self.shape[0]):
                 for j in range(min(self.spin.spins, 2)):
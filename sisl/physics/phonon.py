@@ -44,9 +44,10 @@ from numpy import conj, dot
 
 import sisl._array as _a
 from sisl import units, constant
-from sisl.linalg import eigh_destroy
 from sisl._help import dtype_complex_to_real
 from .state import Coefficient, State, StateC
+from .state import _decouple_degenerate
+from .sparse import SparseOrbitalBZ
 
 from .electron import DOS as electron_DOS
 from .electron import PDOS as electron_PDOS
@@ -181,19 +182,11 @@ def _velocity(mode, hw, dDk, degenerate):
 
     # Decouple the degenerate modes
     if not degenerate is None:
-        for deg in degenerate:
-            # Set the average frequency
-            hw[deg] = np.average(hw[deg])
-
-            # Now diagonalize to find the contributions from individual modes
-            # then re-construct the seperated degenerate modes
-            # Since we do this for all directions we should decouple them all
-            vv = conj(mode[deg, :]).dot(dDk[0].dot(mode[deg, :].T))
-            S = eigh_destroy(vv)[1].T.dot(mode[deg, :])
-            vv = conj(S).dot((dDk[1]).dot(S.T))
-            S = eigh_destroy(vv)[1].T.dot(S)
-            vv = conj(S).dot((dDk[2]).dot(S.T))
-            mode[deg, :] = eigh_destroy(vv)[1].T.dot(S)
+        # Set the average frequency and
+        # diagonalize to find the contributions from individual modes
+        # then re-construct the seperated degenerate modes
+        # Since we do this for all directions we should decouple them all
+        _decouple_degenerate(mode, degenerate, dDk, hw)
 
     v[:, 0] = (conj(mode.T) * dDk[0].dot(mode.T)).sum(0).real
     v[:, 1] = (conj(mode.T) * dDk[1].dot(mode.T)).sum(0).real
@@ -349,6 +342,12 @@ class ModeCPhonon(_phonon_Mode, StateC):
             opt['gauge'] = gauge
 
         deg = self.degenerate(eps)
+        if len(deg) == 0 and isinstance(self.parent, SparseOrbitalBZ):
+            # Without degenerate modes the expectation values are
+            # calculated without creating the derivative matrices
+            v = self.parent._dPk_state(self.mode, **opt).real.astype(dtype_complex_to_real(self.mode.dtype), copy=False)
+            v[self.hw < 0, :] = 0
+            return v * _velocity_const / (2 * self.hw.reshape(-1, 1))
         return velocity(self.mode, self.hw, self.parent.dDk(**opt), degenerate=deg)
 
 
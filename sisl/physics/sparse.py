@@ -1,6 +1,7 @@
 from __future__ import print_function, division
 
 import warnings
+from collections import OrderedDict
 
 import numpy as np
 from scipy.sparse import csr_matrix, SparseEfficiencyWarning
@@ -11,8 +12,8 @@ from sisl.sparse import isspmatrix
 from sisl.sparse_geometry import SparseOrbital
 from .spin import Spin
 from ._matrix_k import matrix_k, matrix_k_nc, matrix_k_so, matrix_k_nc_diag
-from ._matrix_dk import matrix_dk
-from ._matrix_ddk import matrix_ddk
+from ._matrix_dk import matrix_dk, matrix_dk_state
+from ._matrix_ddk import matrix_ddk, matrix_ddk_state
 
 
 __all__ = ['SparseOrbitalBZ', 'SparseOrbitalBZSpin']
@@ -45,6 +46,11 @@ class SparseOrbitalBZ(SparseOrbital):
       number of components per element
     dtype : np.dtype, optional
       data type contained in the matrix. See details of `Spin` for default values.
+      The matrices at specific k-points (`Pk`, `Sk` and their derivatives) are
+      accumulated in the data-type requested at call-time, hence one may store
+      the elements in single precision (``numpy.float32``) to halve the memory
+      consumption while still constructing the k-point matrices in double precision.
+      See also `pack` for a compact storage with a separate overlap matrix.
     nnzpr : int, optional
       number of initially allocated memory per orbital in the matrix.
       For increased performance this should be larger than the actual number of entries
@@ -83,6 +89,169 @@ class SparseOrbitalBZ(SparseOrbital):
         self.dPk = self._dPk
         self.ddPk = self._ddPk
 
+        # The eigenvalue cache is disabled by default
+        self._eig_cache = None
+        self._eig_cache_nbytes = 0
+        self._eig_cache_size = 0
+
+    def set_eig_cache(self, nbytes=0):
+        """ Enable (or disable) caching of the eigenvalues/eigenstates returned from `eigh`
+
+        Repeated calls to `eigh` (and thereby also ``eigenvalue`` and ``eigenstate``)
+        with the same arguments will return the cached results instead of re-diagonalizing the matrix.
+        The cache is keyed by the k-point, the gauge, the spin-component and the data-type.
+        When the total size of the cached arrays exceeds `nbytes` the least recently used
+        entries are discarded.
+
+        The cache is automatically cleared whenever the matrix elements are changed through
+        item assignment/deletion, in-place arithmetic, `finalize` (of a non-finalized matrix)
+        or `set_nsc`. Direct
+        manipulation of the underlying sparse matrix is *not* tracked, in which case one should
+        call this method again to clear the cache.
+
+        Parameters
+        ----------
+        nbytes : int, optional
+           maximum number of bytes used for the cached arrays, if 0 the cache is disabled.
+        """
+        nbytes = int(nbytes)
+        if nbytes <= 0:
+            self._eig_cache = None
+            nbytes = 0
+        else:
+            self._eig_cache = OrderedDict()
+        self._eig_cache_nbytes = nbytes
+        self._eig_cache_size = 0
+
+    def _eig_cache_clear(self):
+        """ Remove all entries in the eigenvalue cache (if it is enabled) """
+        if self._eig_cache is not None:
+            self._eig_cache.clear()
+            self._eig_cache_size = 0
+
+    def _eig_cache_key(self, k, gauge, spin, dtype, kwargs):
+        """ Return the key for the cached `eigh` results, or None if the call cannot be cached """
+        # Additional arguments for the eigensolver (subset of eigenvalues etc.)
+        # are not cached.
+        if self._eig_cache is None or len(kwargs) > 0:
+            return None
+        if dtype is not None:
+            dtype = np.dtype(dtype).char
+        return (tuple(np.asarray(k, np.float64).ravel()), gauge, spin, dtype)
+
+    def _eig_cache_get(self, key, eigvals_only):
+        """ Return a copy of the cached `eigh` results for `key`, or None if not present """
+        if key is None:
+            return None
+        cache = self._eig_cache
+        # Eigenvalues may be taken from an entry with eigenstates
+        if eigvals_only:
+            onlys = (True, False)
+        else:
+            onlys = (False,)
+        for only in onlys:
+            ev = cache.get(key + (only,), None)
+            if ev is None:
+                continue
+            # Mark as recently used
+            del cache[key + (only,)]
+            cache[key + (only,)] = ev
+            if only:
+                return ev.copy()
+            elif eigvals_only:
+                return ev[0].copy()
+            return ev[0].copy(), ev[1].copy()
+        return None
+
+    def _eig_cache_set(self, key, eigvals_only, ev):
+        """ Store `eigh` results in the cache and return a copy of them """
+        if key is None:
+            return ev
+        key = key + (eigvals_only,)
+        if eigvals_only:
+            nbytes = ev.nbytes
+        else:
+            nbytes = ev[0].nbytes + ev[1].nbytes
+        if nbytes > self._eig_cache_nbytes:
+            # Can never be contained in the cache
+            return ev
+
+        cache = self._eig_cache
+        while self._eig_cache_size + nbytes > self._eig_cache_nbytes:
+            _, old = cache.popitem(last=False)
+            if isinstance(old, tuple):
+                self._eig_cache_size -= old[0].nbytes + old[1].nbytes
+            else:
+                self._eig_cache_size -= old.nbytes
+        cache[key] = ev
+        self._eig_cache_size += nbytes
+        if eigvals_only:
+            return ev.copy()
+        return ev[0].copy(), ev[1].copy()
+
+    def __setitem__(self, key, val):
+        self._eig_cache_clear()
+        super(SparseOrbitalBZ, self).__setitem__(key, val)
+
+    def __delitem__(self, key):
+        self._eig_cache_clear()
+        super(SparseOrbitalBZ, self).__delitem__(key)
+
+    def finalize(self):
+        """ Finalizes the model
+
+        Finalizes the model so that all non-used elements are removed. I.e. this simply reduces the memory requirement for the sparse matrix.
+
+        Note that adding more elements to the sparse matrix is more time-consuming than for a non-finalized sparse matrix due to the
+        internal data-representation.
+        """
+        if not self.finalized:
+            self._eig_cache_clear()
+        super(SparseOrbitalBZ, self).finalize()
+
+    def set_nsc(self, *args, **kwargs):
+        """ Reset the number of allowed supercells in the sparse orbital
+
+        If one reduces the number of supercells *any* sparse element
+        that references the supercell will be deleted.
+
+        See `SuperCell.set_nsc` for allowed parameters.
+
+        See Also
+        --------
+        SuperCell.set_nsc : the underlying called method
+        """
+        self._eig_cache_clear()
+        super(SparseOrbitalBZ, self).set_nsc(*args, **kwargs)
+
+    def __iadd__(self, b):
+        self._eig_cache_clear()
+        return super(SparseOrbitalBZ, self).__iadd__(b)
+
+    def __isub__(self, b):
+        self._eig_cache_clear()
+        return super(SparseOrbitalBZ, self).__isub__(b)
+
+    def __imul__(self, b):
+        self._eig_cache_clear()
+        return super(SparseOrbitalBZ, self).__imul__(b)
+
+    def __idiv__(self, b):
+        self._eig_cache_clear()
+        return super(SparseOrbitalBZ, self).__idiv__(b)
+
+    def __ifloordiv__(self, b):
+        self._eig_cache_clear()
+        return super(SparseOrbitalBZ, self).__ifloordiv__(b)
+
+    def __itruediv__(self, b):
+        self._eig_cache_clear()
+        return super(SparseOrbitalBZ, self).__itruediv__(b)
+
+    def __ipow__(self, b):
+        self._eig_cache_clear()
+        return super(SparseOrbitalBZ, self).__ipow__(b)
+
     # Override to enable spin configuration and orthogonality
     def _cls_kwargs(self):
         return {'orthogonal': self.orthogonal}
@@ -97,6 +266,39 @@ class SparseOrbitalBZ(SparseOrbital):
         """ True if the object is using a non-orthogonal basis """
         return not self._orthogonal
 
+    def pack(self, dtype=np.float32, S_dtype=None):
+        """ Store the matrix elements in a compact format for (repeated) k-point calculations
+
+        The elements are stored in `dtype` and for non-orthogonal matrices the overlap matrix
+        is stored in a separate array (with data-type `S_dtype`).
+        The matrices at specific k-points (`Pk`, `Sk` and their derivatives) are
+        still accumulated in the data-type requested at call-time (defaults to double precision).
+
+        Any modification of the matrix (or access of its elements) unpacks the matrix again, see
+        `SparseCSR.pack` for details. The ``gauge='r'`` k-point matrices also unpack the matrix.
+
+        Parameters
+        ----------
+        dtype : numpy.dtype, optional
+           data-type of the stored elements, must be one of `numpy.float32`, `numpy.float64`,
+           `numpy.complex64` or `numpy.complex128`
+        S_dtype : numpy.dtype, optional
+           data-type of the stored overlap matrix elements, defaults to `dtype`
+
+        See Also
+        --------
+        unpack : revert to the default storage
+        """
+        self._eig_cache_clear()
+        if self.orthogonal:
+            self._csr.pack(dtype)
+        else:
+            self._csr.pack(dtype, dtype if S_dtype is None else S_dtype)
+
+    def unpack(self):
+        """ Revert a packed matrix (see `pack`) to the default storage """
+        self._csr.unpack()
+
     def __len__(self):
         """ Returns number of rows in the basis (if non-collinear or spin-orbit, twice the number of orbitals) """
         return self.no
@@ -387,6 +589,69 @@ class SparseOrbitalBZ(SparseOrbital):
         """
         return self._dPk(k, dtype=dtype, gauge=gauge, format=format, _dim=self.S_idx)
 
+    def _dk_state(self, state, k=(0, 0, 0), gauge='R', _dim=0):
+        r""" Expectation values of the quantity differentiated with respect to `k` for each state
+
+        All 3 Cartesian directions are calculated in a single loop over the sparse elements
+        without creating the differentiated matrices.
+
+        Parameters
+        ----------
+        state : array_like
+           states (1st dimension) to calculate the expectation values of
+        k: array_like, optional
+           k-point (default is Gamma point)
+        gauge : {'R', 'r'}
+           chosen gauge
+
+        Returns
+        -------
+        numpy.ndarray
+           :math:`\langle\psi_i|\partial_{\mathbf k_\alpha}\mathbf M|\psi_i\rangle` with shape ``(len(state), 3)``
+        """
+        k = np.asarray(k, np.float64).ravel()
+        return matrix_dk_state(gauge, self, _dim, self.sc, k, state)
+
+    def _dPk_state(self, state, k=(0, 0, 0), gauge='R'):
+        """ Expectation values of the quantity differentiated with respect to `k`, see `_dk_state` """
+        return self._dk_state(state, k, gauge=gauge)
+
+    def _dSk_state(self, state, k=(0, 0, 0), gauge='R'):
+        """ Expectation values of the overlap differentiated with respect to `k`, see `_dk_state` """
+        return self._dk_state(state, k, gauge=gauge, _dim=self.S_idx)
+
+    def _ddk_state(self, state, k=(0, 0, 0), gauge='R', _dim=0):
+        r""" Expectation values of the quantity double differentiated with respect to `k` for each state
+
+        All 6 Cartesian directions are calculated in two loops over the sparse elements
+        without creating the differentiated matrices.
+
+        Parameters
+        ----------
+        state : array_like
+           states (1st dimension) to calculate the expectation values of
+        k: array_like, optional
+           k-point (default is Gamma point)
+        gauge : {'R', 'r'}
+           chosen gauge
+
+        Returns
+        -------
+        numpy.ndarray
+           :math:`\langle\psi_i|\partial_{\mathbf k_\alpha}\partial_{\mathbf k_\beta}\mathbf M|\psi_i\rangle`
+           with shape ``(len(state), 6)`` in Voigt order
+        """
+        k = np.asarray(k, np.float64).ravel()
+        return matrix_ddk_state(gauge, self, _dim, self.sc, k, state)
+
+    def _ddPk_state(self, state, k=(0, 0, 0), gauge='R'):
+        """ Expectation values of the quantity double differentiated with respect to `k`, see `_ddk_state` """
+        return self._ddk_state(state, k, gauge=gauge)
+
+    def _ddSk_state(self, state, k=(0, 0, 0), gauge='R'):
+        """ Expectation values of the overlap double differentiated with respect to `k`, see `_ddk_state` """
+        return self._ddk_state(state, k, gauge=gauge, _dim=self.S_idx)
+
     def ddSk(self, k=(0, 0, 0), dtype=None, gauge='R', format='csr', *args, **kwargs):
         r""" Setup the double :math:`k`-derivatie of the overlap matrix for a given k-point
 
@@ -478,14 +743,24 @@ class SparseOrbitalBZ(SparseOrbital):
         the given k-point and calculate the eigenvalues.
 
         All subsequent arguments gets passed directly to :code:`scipy.linalg.eigh`
+
+        See Also
+        --------
+        set_eig_cache : enable caching of the returned values
         """
         dtype = kwargs.pop('dtype', None)
+        key = self._eig_cache_key(k, gauge, None, dtype, kwargs)
+        ev = self._eig_cache_get(key, eigvals_only)
+        if ev is not None:
+            return ev
+
         P = self.Pk(k=k, dtype=dtype, gauge=gauge, format='array')
         if self.orthogonal:
-            return lin.eigh_destroy(P, eigvals_only=eigvals_only, **kwargs)
-
-        S = self.Sk(k=k, dtype=dtype, gauge=gauge, format='array')
-        return lin.eigh_destroy(P, S, eigvals_only=eigvals_only, **kwargs)
+            ev = lin.eigh_destroy(P, eigvals_only=eigvals_only, **kwargs)
+        else:
+            S = self.Sk(k=k, dtype=dtype, gauge=gauge, format='array')
+            ev = lin.eigh_destroy(P, S, eigvals_only=eigvals_only, **kwargs)
+        return self._eig_cache_set(key, eigvals_only, ev)
 
     def eigsh(self, k=(0, 0, 0), n=10, gauge='R', eigvals_only=True, **kwargs):
         """ Calculates a subset of eigenvalues of the physical quantity  (default 10)
@@ -743,6 +1018,34 @@ class SparseOrbitalBZSpin(SparseOrbitalBZ):
         """
         return self._dPk(k, dtype=dtype, gauge=gauge, format=format, _dim=spin)
 
+    def _dPk_state(self, state, k=(0, 0, 0), gauge='R', spin=0):
+        """ Expectation values of the quantity differentiated with respect to `k`, see `SparseOrbitalBZ._dk_state`
+
+        Parameters
+        ----------
+        spin: int, optional
+           the spin-index of the quantity, only used for `Spin.POLARIZED` matrices
+        """
+        if self.spin.is_unpolarized:
+            spin = 0
+        elif not self.spin.is_polarized:
+            raise ValueError(self.__class__.__name__ + '._dPk_state is not implemented for non-collinear spin')
+        return self._dk_state(state, k, gauge=gauge, _dim=spin)
+
+    def _ddPk_state(self, state, k=(0, 0, 0), gauge='R', spin=0):
+        """ Expectation values of the quantity double differentiated with respect to `k`, see `SparseOrbitalBZ._ddk_state`
+
+        Parameters
+        ----------
+        spin: int, optional
+           the spin-index of the quantity, only used for `Spin.POLARIZED` matrices
+        """
+        if self.spin.is_unpolarized:
+            spin = 0
+        elif not self.spin.is_polarized:
+            raise ValueError(self.__class__.__name__ + '._ddPk_state is not implemented for non-collinear spin')
+        return self._ddk_state(state, k, gauge=gauge, _dim=spin)
+
     def _Sk(self, k=(0, 0, 0), dtype=None, gauge='R', format='csr'):
         """ Overlap matrix in a ``scipy.sparse.csr_matrix`` at `k`.
 
@@ -821,16 +1124,25 @@ class SparseOrbitalBZSpin(SparseOrbitalBZ):
         spin = kwargs.pop('spin', 0)
         dtype = kwargs.pop('dtype', None)
 
+        if self.spin.kind == Spin.POLARIZED:
+            key = self._eig_cache_key(k, gauge, spin, dtype, kwargs)
+        else:
+            key = self._eig_cache_key(k, gauge, None, dtype, kwargs)
+        ev = self._eig_cache_get(key, eigvals_only)
+        if ev is not None:
+            return ev
+
         if self.spin.kind == Spin.POLARIZED:
             P = self.Pk(k=k, dtype=dtype, gauge=gauge, spin=spin, format='array')
         else:
             P = self.Pk(k=k, dtype=dtype, gauge=gauge, format='array')
 
         if self.orthogonal:
-            return lin.eigh_destroy(P, eigvals_only=eigvals_only, **kwargs)
-
-        S = self.Sk(k=k, dtype=dtype, gauge=gauge, format='array')
-        return lin.eigh_destroy(P, S, eigvals_only=eigvals_only, **kwargs)
+            ev = lin.eigh_destroy(P, eigvals_only=eigvals_only, **kwargs)
+        else:
+            S = self.Sk(k=k, dtype=dtype, gauge=gauge, format='array')
+            ev = lin.eigh_destroy(P, S, eigvals_only=eigvals_only, **kwargs)
+        return self._eig_cache_set(key, eigvals_only, ev)
 
     def eigsh(self, k=(0, 0, 0), n=10, gauge='R', eigvals_only=True, **kwargs):
         """ Calculates a subset of eigenvalues of the physical quantity  (default 10)
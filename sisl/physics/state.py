@@ -11,7 +11,6 @@ __all__ = ['Coefficient', 'State', 'StateC']
 _abs = np.absolute
 _phase = np.angle
 _argmax = np.argmax
-_append = np.append
 _diff = np.diff
 _dot = np.dot
 _conj = np.conjugate
@@ -40,6 +39,95 @@ def _couter1(c, v):
     return _outer_(v * c, _conj(v))
 
 
+def _degenerate(c, eps):
+    """ Find degenerate coefficients in segment form
+
+    Parameters
+    ----------
+    c : numpy.ndarray
+       coefficients
+    eps : float
+       the precision above which coefficients are not considered degenerate
+
+    Returns
+    -------
+    idx : numpy.ndarray
+       indices of all degenerate coefficients, grouped consecutively
+    ptr : numpy.ndarray
+       offsets into `idx` such that ``idx[ptr[i]:ptr[i+1]]`` are the indices of the i'th degenerate group
+    """
+    sidx = np.argsort(c)
+    deg = _diff(c[sidx]) < eps
+
+    # A coefficient is degenerate if it is close to its lower or upper neighbour
+    member = np.zeros(len(sidx), dtype=np.bool_)
+    member[:-1] = deg
+    member[1:] |= deg
+    idx = sidx[member]
+
+    # The groups start where the lower neighbour is not degenerate
+    start = member.copy()
+    start[1:] &= ~deg
+    ptr = _a.emptyi(start.sum() + 1)
+    ptr[:-1] = start[member].nonzero()[0]
+    ptr[-1] = len(idx)
+    return idx, ptr
+
+
+def _degenerate_segments(degenerate):
+    """ Convert a list of degenerate index groups to the segment form, see `_degenerate` """
+    ptr = _a.zerosi(len(degenerate) + 1)
+    if len(degenerate) == 0:
+        return _a.arrayi([]), ptr
+    ptr[1:] = _a.cumsumi([len(deg) for deg in degenerate])
+    return np.concatenate(degenerate).astype(np.int32, copy=False), ptr
+
+
+def _decouple_degenerate(state, degenerate, dM, energy=None, dS=None):
+    r""" In-place decoupling of degenerate states by diagonalizing `dM` in the degenerate sub-spaces
+
+    All degenerate sub-spaces of equal size are diagonalized simultaneously, one direction at a time.
+
+    Parameters
+    ----------
+    state : numpy.ndarray
+       states (1st dimension) to be decoupled, the degenerate states are rotated upon return
+    degenerate : list of array_like
+       a list containing the indices of degenerate states
+    dM : list of array_like
+       the matrices used for decoupling, all matrices are successively used in the decoupling
+    energy : numpy.ndarray, optional
+       the energies of the states, the degenerate states are averaged upon return
+    dS : list of array_like, optional
+       for non-orthogonal basis sets the decoupling is done using :math:`\mathbf M - \epsilon \mathbf S`,
+       requires `energy`.
+    """
+    idx, ptr = _degenerate_segments(degenerate)
+    if len(idx) == 0:
+        return
+    n = _diff(ptr)
+
+    if not energy is None:
+        # Set the average energy
+        energy[idx] = np.repeat(np.add.reduceat(energy[idx], ptr[:-1]) / n, n)
+        e = energy[idx].reshape(1, -1)
+
+    S = state[idx, :]
+    for i, M in enumerate(dM):
+        MS = M.dot(S.T)
+        if not dS is None:
+            MS = MS - e * dS[i].dot(S.T)
+
+        # Diagonalize all degenerate sub-spaces with the same size simultaneously
+        for m in np.unique(n):
+            rows = ptr[:-1][n == m].reshape(-1, 1) + _a.arangei(m)
+            vv = np.matmul(_conj(S[rows, :]), MS[:, rows].transpose(1, 0, 2))
+            U = np.linalg.eigh(vv)[1]
+            S[rows, :] = np.matmul(U.transpose(0, 2, 1), S[rows, :])
+
+    state[idx, :] = S
+
+
 class ParentContainer(object):
     """ A container for parent and information """
     __slots__ = ['parent', 'info']
@@ -123,22 +211,11 @@ class Coefficient(ParentContainer):
         -------
         list of numpy.ndarray: a list of indices
         """
-        deg = list()
-        sidx = np.argsort(self.c)
-        dc = _diff(self.c[sidx])
-
-        # Degenerate indices
-        idx = (dc < eps).nonzero()[0]
+        idx, ptr = _degenerate(self.c, eps)
         if len(idx) == 0:
             # There are no degenerate coefficients
-            return deg
-
-        # These are the points were we split the degeneracies
-        seps = (_diff(idx) > 1).nonzero()[0]
-        IDX = np.array_split(idx, seps + 1)
-        for idx in IDX:
-            deg.append(_append(sidx[idx], sidx[idx[-1] + 1]))
-        return deg
+            return []
+        return np.split(idx, ptr[1:-1])
 
     def sub(self, idx):
         """ Return a new coefficient with only the specified coefficients
@@ -696,22 +773,11 @@ class StateC(State):
         -------
         list of numpy.ndarray: a list of indices
         """
-        deg = list()
-        sidx = np.argsort(self.c)
-        dc = _diff(self.c[sidx])
-
-        # Degenerate indices
-        idx = (dc < eps).nonzero()[0]
+        idx, ptr = _degenerate(self.c, eps)
         if len(idx) == 0:
             # There are no degenerate coefficients
-            return deg
-
-        # These are the points were we split the degeneracies
-        seps = (_diff(idx) > 1).nonzero()[0]
-        IDX = np.array_split(idx, seps + 1)
-        for idx in IDX:
-            deg.append(_append(sidx[idx], sidx[idx[-1] + 1]))
-        return deg
+            return []
+        return np.split(idx, ptr[1:-1])
 
     def sub(self, idx):
         """ Return a new state with only the specified states
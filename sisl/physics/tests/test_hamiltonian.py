@@ -8,8 +8,9 @@ import numpy as np
 from sisl import Geometry, Atom, SuperCell, Hamiltonian, Spin, BandStructure, MonkhorstPack, BrillouinZone
 from sisl import get_distribution
 from sisl import oplist
-from sisl import Grid, SphericalOrbital, SislError
-from sisl.physics.electron import berry_phase, spin_squared
+from sisl import Grid, SphericalOrbital, SislError, SislWarning
+from sisl.physics.electron import berry_phase, berry_curvature, chern, spin_squared
+from sisl.physics.electron import velocity, inv_eff_mass_tensor, _velocity_const
 
 
 pytestmark = pytest.mark.hamiltonian
@@ -210,6 +211,52 @@ class TestHamiltonian(object):
         # orthogonal basis sets always returns a diagonal in float64
         assert Sk.dtype == dtype
 
+    @pytest.mark.parametrize("k", [[0, 0, 0], [0.15, 0.15, 0.15]])
+    def test_Hk_float32(self, setup, k):
+        H = setup.HS.copy()
+        H.construct([(0.1, 1.5), ((1., 2.), (0.1, 0.2))])
+        H32 = H.copy(np.float32)
+        assert H32.dtype == np.float32
+        # single precision storage is accumulated in double precision
+        assert H32.Hk(k).dtype == H.Hk(k).dtype
+        assert H32.Sk(k).dtype == H.Sk(k).dtype
+        assert np.allclose(H32.Hk(k).toarray(), H.Hk(k).toarray(), atol=1e-6)
+        assert np.allclose(H32.Sk(k, format='array'), H.Sk(k, format='array'), atol=1e-6)
+
+    @pytest.mark.parametrize("k", [[0, 0, 0], [0.15, 0.15, 0.15]])
+    def test_Hk_pack(self, setup, k):
+        H = setup.HS.copy()
+        H.construct([(0.1, 1.5), ((1., 2.), (0.1, 0.2))])
+        H.finalize()
+        Hp = H.copy()
+        Hp.pack(np.float32, np.float64)
+        D, S = Hp._csr._packed
+        assert D.dtype == np.float32 and D.shape[1] == 1
+        assert S.dtype == np.float64 and S.ndim == 1
+        assert np.allclose(Hp.Hk(k, format='array'), H.Hk(k, format='array'), atol=1e-6)
+        assert np.allclose(Hp.Sk(k, format='array'), H.Sk(k, format='array'))
+        assert np.allclose(Hp.dHk(k, format='array'), H.dHk(k, format='array'), atol=1e-5)
+        assert np.allclose(Hp.dSk(k, format='array'), H.dSk(k, format='array'))
+        assert np.allclose(Hp.ddSk(k, format='array'), H.ddSk(k, format='array'))
+        assert Hp._csr._packed is not None
+        # modifications unpacks the matrix
+        Hp[0, 0] = 2., 1.
+        assert Hp._csr._packed is None
+        assert Hp._csr.col.dtype == np.int32
+        assert Hp[0, 0, 0] == 2.
+        assert Hp[0, 1, 1] == H[0, 1, 1]
+
+    def test_Hk_pack_so(self, setup):
+        H = Hamiltonian(setup.g, spin=Spin('SO'), orthogonal=False)
+        H.construct([(0.1, 1.5), ((1., 0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 1.),
+                                  (2., 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.1))])
+        Hp = H.copy()
+        Hp.pack()
+        k = [0.1, 0.2, 0.3]
+        assert np.allclose(Hp.Hk(k, format='array'), H.Hk(k, format='array'), atol=1e-6)
+        assert np.allclose(Hp.Sk(k, format='array'), H.Sk(k, format='array'), atol=1e-6)
+        assert Hp._csr._packed is not None
+
     @pytest.mark.parametrize("k", [[0, 0, 0], [0.15, 0.15, 0.15]])
     def test_Hk_format(self, setup, k):
         H = setup.HS.copy()
@@ -485,6 +532,23 @@ class TestHamiltonian(object):
         assert np.allclose(Hg.eigh(), Hc.eigh())
         del Hc, H
 
+    def test_cut3(self, setup):
+        # Cut with automatic detection of the periodicity
+        R, param = [0.1, 1.5], [1., 0.1]
+        Hg = Hamiltonian(setup.g)
+        Hg.construct([R, param])
+        Hg.finalize()
+        H = Hg.tile(3, 0).tile(2, 1)
+        Hc = H.cut(None, 1).cut(None, 0)
+        assert Hc.no == Hg.no
+        assert Hc.spsame(Hg)
+        assert np.allclose(Hc._csr._D, Hg._csr._D)
+
+        # Inconsistent parts are warned about
+        H[H.no - 1, H.no - 1] = 2.
+        with pytest.warns(SislWarning, match='maximum deviation'):
+            H.cut(3, 0)
+
     def test_eigh_vs_eig(self, setup):
         # Test of eigenvalues
         R, param = [0.1, 1.5], [1., 0.1]
@@ -638,6 +702,61 @@ class TestHamiltonian(object):
         bz = BrillouinZone(H, K)
         berry_phase(bz, method='unknown')
 
+    def test_berry_phase_threads(self, setup):
+        R, param = [0.1, 1.5], [1., 0.1]
+        g = setup.g.copy()
+        H = Hamiltonian(g)
+        H.construct((R, param))
+        bz = BrillouinZone.param_circle(H, 20, 0.01, [0, 0, 1], [1/3, 2/3, 0])
+        assert berry_phase(bz, sub=0) == pytest.approx(berry_phase(bz, sub=0, threads=3))
+        assert np.allclose(berry_phase(bz, eigvals=True), berry_phase(bz, eigvals=True, threads=2))
+
+    @staticmethod
+    def _qwz(u):
+        # Qi-Wu-Zhang model, Chern insulator for 0 < |u| < 2
+        g = Geometry([0] * 3, Atom(1, R=[1.01] * 2), sc=SuperCell([1, 1, 10], nsc=[3, 3, 1]))
+        H = Hamiltonian(g, dtype=np.complex128)
+        sx = np.array([[0, 1], [1, 0]])
+        sy = np.array([[0, -1j], [1j, 0]])
+        sz = np.array([[1, 0], [0, -1]])
+        Tx = (sz - 1j * sx) / 2
+        Ty = (sz - 1j * sy) / 2
+        for i in range(2):
+            for j in range(2):
+                H[i, j] = u * sz[i, j]
+                H[i, j, (1, 0, 0)] = Tx[i, j]
+                H[i, j, (-1, 0, 0)] = np.conj(Tx[j, i])
+                H[i, j, (0, 1, 0)] = Ty[i, j]
+                H[i, j, (0, -1, 0)] = np.conj(Ty[j, i])
+        return H
+
+    @pytest.mark.parametrize("u", [-1., 1., 3.])
+    def test_chern(self, u):
+        H = self._qwz(u)
+        c = chern(H, 10, sub=0, dtype=np.complex128)
+        if abs(u) < 2:
+            assert abs(c) == pytest.approx(1)
+        else:
+            assert c == pytest.approx(0, abs=1e-10)
+        assert c == pytest.approx(-chern(self._qwz(-u), [8, 12], sub=0, threads=2, dtype=np.complex128))
+        # All bands always sum to 0
+        assert chern(H, 10, dtype=np.complex128) == pytest.approx(0, abs=1e-10)
+
+    def test_berry_curvature(self):
+        H = self._qwz(1.)
+        N = 12
+        c = berry_curvature(H, N, sub=0, dtype=np.complex128)
+        assert c.shape == (N, N)
+        # Integrate over the Brillouin zone
+        area = (2 * np.pi / N) ** 2
+        assert c.sum() * area / (2 * np.pi) == pytest.approx(chern(H, N, sub=0, dtype=np.complex128))
+
+    def test_berry_curvature_fail(self, setup):
+        with pytest.raises(SislError):
+            berry_curvature(setup.HS, 4)
+        with pytest.raises(ValueError):
+            berry_curvature(setup.H, 4, axes=(0, 0))
+
     def test_gauge_inv_eff(self, setup):
         R, param = [0.1, 1.5], [1., 0.1]
         g = setup.g.tile(2, 0).tile(2, 1).tile(2, 2)
@@ -749,6 +868,46 @@ class TestHamiltonian(object):
             vsub = es.sub([0]).inv_eff_mass_tensor(True)
             assert np.allclose(v[0, :], _to_voight(vsub))
 
+    @pytest.mark.parametrize("spin", [0, 1])
+    def test_velocity_polarized(self, setup, spin):
+        H = Hamiltonian(setup.g, spin=Spin('P'))
+        H.construct([(0.1, 1.5), ((0., 0.5), (-2.7, -2.))])
+        k = [0.1, 0.2, 0.3]
+        es = H.eigenstate(k, spin=spin)
+        assert es.info['spin'] == spin
+        v = velocity(es.state, H.dHk(k, spin=spin))
+        assert np.allclose(es.velocity(), v)
+
+    def test_velocity_matrix_loop(self, setup):
+        HS = setup.HS.copy()
+        HS.construct([(0.1, 1.5), ((0., 1.), (-2.7, 0.1))])
+        k = [0.1, 0.2, 0.3]
+        es = HS.eigenstate(k)
+        dHk = HS.dHk(k)
+        dSk = HS.dSk(k)
+        v = es.velocity_matrix() / _velocity_const
+        for s, e in enumerate(es.c):
+            for i in range(3):
+                vi = np.conj(es.state).dot((dHk[i] - e * dSk[i]).dot(es.state[s]))
+                assert np.allclose(v[s, :, i], vi)
+
+    @pytest.mark.parametrize("orthogonal", [True, False])
+    def test_inv_eff_mass_tensor_state(self, setup, orthogonal):
+        if orthogonal:
+            H = setup.H.copy()
+            H.construct([(0.1, 1.5), ((1., 1.))])
+        else:
+            H = setup.HS.copy()
+            H.construct([(0.1, 1.5), ((0., 1.), (-2.7, 0.1))])
+        k = [0.1, 0.2, 0.3]
+        es = H.eigenstate(k, gauge='r')
+        assert len(es.degenerate(1e-3)) == 0
+        ddSk = None if orthogonal else H.ddSk(k, gauge='r')
+        M = inv_eff_mass_tensor(es.state, H.ddHk(k, gauge='r'), es.c, ddSk)
+        assert np.allclose(es.inv_eff_mass_tensor(), M)
+        M = inv_eff_mass_tensor(es.state, H.ddHk(k, gauge='r'), es.c, ddSk, as_matrix=True)
+        assert np.allclose(es.inv_eff_mass_tensor(True), M)
+
     def test_dos1(self, setup):
         HS = setup.HS.copy()
         HS.construct([(0.1, 1.5), ((1., 1.), (0.1, 0.1))])
@@ -906,6 +1065,23 @@ class TestHamiltonian(object):
         assert len(sup) == 2
         assert len(sdn) == 1
 
+    def test_spin_squared_blocks(self):
+        # More states than processed in each block
+        from sisl.physics import electron
+        n = electron._spin_squared_block + 10
+        np.random.seed(1)
+        alpha = np.random.rand(n, 20) + 1j * np.random.rand(n, 20)
+        beta = np.random.rand(n - 5, 20) + 1j * np.random.rand(n - 5, 20)
+        S = np.random.rand(20, 20)
+        D = np.absolute(np.conj(beta).dot(S.dot(alpha.T))) ** 2
+        sa, sb = spin_squared(alpha, beta, S)
+        assert np.allclose(sa, D.sum(0))
+        assert np.allclose(sb, D.sum(1))
+        D = np.absolute(np.conj(beta[:5]).dot(S.dot(alpha.T))) ** 2
+        sa, sb = spin_squared(alpha, beta[:5], S)
+        assert np.allclose(sa, D.sum(0))
+        assert np.allclose(sb, D.sum(1))
+
     def test_non_colinear1(self, setup):
         g = Geometry([[i, 0, 0] for i in range(10)], Atom(6, R=1.01), sc=SuperCell(100, nsc=[3, 3, 1]))
         H = Hamiltonian(g, dtype=np.float64, spin=Spin.NONCOLINEAR)
@@ -1231,6 +1407,51 @@ class TestHamiltonian(object):
         assert np.allclose(H._csr._D, Hbig._csr._D)
         setup.H2.empty()
 
+    def test_tile_lazy(self, setup):
+        R, param = [0.1, 1.5], [(1., 1.), (0.1, 0.2)]
+        H = Hamiltonian(setup.g, orthogonal=False)
+        H.construct([R, param])
+        Hf = H.tile(2, 0).repeat(2, 1)
+        Hl = H.tile(2, 0, lazy=True).repeat(2, 1)
+        for k in [[0] * 3, [0.1, 0.2, 0]]:
+            assert np.allclose(Hf.Hk(k).toarray(), Hl.Hk(k).toarray())
+            assert np.allclose(Hf.Sk(k, format='array'), Hl.Sk(k, format='array'))
+        assert not Hl.materialized
+        # Meta-data and eigenvalue problems do not materialize
+        assert Hl.spin == Hf.spin
+        assert Hl.orthogonal == Hf.orthogonal
+        assert Hl.S_idx == Hf.S_idx
+        for k in [[0] * 3, [0.1, 0.2, 0]]:
+            assert np.allclose(Hf.eigh(k), Hl.eigh(k))
+            es = Hl.eigenstate(k)
+            assert es.parent is Hl
+            assert np.allclose(Hf.eigenstate(k).eig, es.eig)
+        assert not Hl.materialized
+        # In-place methods materializes
+        Hl.shift(1.)
+        assert Hl.materialized
+        assert np.allclose(Hf.eigh() + 1., Hl.eigh())
+
+    def test_tile_lazy_complex(self, setup):
+        H = Hamiltonian(setup.g, dtype=np.complex128)
+        H.construct([[0.1, 1.5], [1. + 0.5j, 0.1j]])
+        Hl = H.tile(2, 0, lazy=True)
+        Hf = H.tile(2, 0)
+        Hk = Hl.Hk(format='array')
+        assert Hk.dtype == np.complex128
+        assert np.allclose(Hf.Hk(dtype=np.complex128, format='array'), Hk)
+        assert not Hl.materialized
+
+    def test_tile_lazy_orthogonal(self, setup):
+        H = Hamiltonian(setup.g)
+        H.construct([[0.1, 1.5], [1., 0.1]])
+        Hl = H.tile(3, 1, lazy=True)
+        Hf = H.tile(3, 1)
+        k = [0.1, 0.2, 0]
+        assert np.allclose(Hf.Hk(k, format='array'), Hl.Hk(k, format='array'))
+        assert np.allclose(Hf.Sk(k, format='array'), Hl.Sk(k, format='array'))
+        assert not Hl.materialized
+
     def test_sub1(self, setup):
         R, param = [0.1, 1.5], [1., 0.1]
 
@@ -1299,6 +1520,52 @@ class TestHamiltonian(object):
         assert H.eigh(spin=0)[0] == pytest.approx(eig0_0 + 0.2)
         assert H.eigh(spin=1)[0] == pytest.approx(eig1_0)
 
+    def test_eig_cache1(self, setup):
+        R, param = [0.1, 1.5], [(1., 1.), (0.1, 0.1)]
+        H = Hamiltonian(setup.g.copy(), orthogonal=False)
+        H.construct([R, param])
+        H.finalize()
+        H.set_eig_cache(2 ** 20)
+        k = [0.1, 0.2, 0]
+        es1 = H.eigenstate(k)
+        # changing the returned state should not alter the cache
+        es1.state[:, :] = 0.
+        es2 = H.eigenstate(k)
+        assert not np.allclose(es2.state, 0.)
+        assert np.allclose(H.eigenvalue(k).eig, es2.eig)
+        assert len(H._eig_cache) == 1
+        H.eigenvalue(k, gauge='r')
+        assert len(H._eig_cache) == 2
+        H.shift(0.2)
+        assert len(H._eig_cache) == 0
+        assert np.allclose(H.eigh(k), es2.eig + 0.2)
+        H[0, 0] = 2.
+        assert len(H._eig_cache) == 0
+        H.eigh(k)
+        del H[0, 1]
+        assert len(H._eig_cache) == 0
+        H.eigh(k)
+        assert not H.finalized
+        H.finalize()
+        assert len(H._eig_cache) == 0
+        H.set_eig_cache(0)
+        assert H._eig_cache is None
+
+    def test_eig_cache2(self, setup):
+        R, param = [0.1, 1.5], [(1., -1.), (0.1, 0.1)]
+        H = Hamiltonian(setup.g.copy(), spin=Spin('P'))
+        H.construct([R, param])
+        e = H.eigh(spin=0)
+        # Only room for a single eigenvalue vector
+        H.set_eig_cache(e.nbytes)
+        assert np.allclose(H.eigh(spin=0), e)
+        assert np.allclose(H.eigh(spin=1), e - 2.)
+        assert len(H._eig_cache) == 1
+        assert H._eig_cache_size == e.nbytes
+        # not cachable
+        H.eigh(spin=0, eigvals_only=False)
+        assert len(H._eig_cache) == 1
+
     def test_fermi_level(self, setup):
         R, param = [0.1, 1.5], [(1., 1.), (2.1, 0.1)]
         H = Hamiltonian(setup.g.copy(), orthogonal=False)
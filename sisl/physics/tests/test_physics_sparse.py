@@ -103,6 +103,40 @@ def test_pickle_non_orthogonal_spin():
     assert np.allclose(sp.eigh(), SP.eigh())
 
 
+@pytest.mark.parametrize("gauge", ['R', 'r'])
+def test_dk_state(gauge):
+    gr = _get()
+    sp = SparseOrbitalBZ(gr, orthogonal=False)
+    sp.construct([(0.1, 1.44), ((0.1, 1.), (-2.7, 0.1))])
+    k = [0.1, 0.2, 0.3]
+    state = sp.eigh(k, gauge=gauge, eigvals_only=False)[1].T
+    dPk = sp.dPk(k, gauge=gauge)
+    dSk = sp.dSk(k, gauge=gauge)
+    v = sp._dPk_state(state, k, gauge=gauge)
+    vS = sp._dSk_state(state, k, gauge=gauge)
+    assert v.shape == (2, 3)
+    for i in range(3):
+        assert np.allclose(v[:, i], (np.conj(state.T) * dPk[i].dot(state.T)).sum(0))
+        assert np.allclose(vS[:, i], (np.conj(state.T) * dSk[i].dot(state.T)).sum(0))
+
+
+@pytest.mark.parametrize("gauge", ['R', 'r'])
+def test_ddk_state(gauge):
+    gr = _get()
+    sp = SparseOrbitalBZ(gr, orthogonal=False)
+    sp.construct([(0.1, 1.44), ((0.1, 1.), (-2.7, 0.1))])
+    k = [0.1, 0.2, 0.3]
+    state = sp.eigh(k, gauge=gauge, eigvals_only=False)[1].T
+    ddPk = sp.ddPk(k, gauge=gauge)
+    ddSk = sp.ddSk(k, gauge=gauge)
+    v = sp._ddPk_state(state, k, gauge=gauge)
+    vS = sp._ddSk_state(state, k, gauge=gauge)
+    assert v.shape == (2, 6)
+    for i in range(6):
+        assert np.allclose(v[:, i], (np.conj(state.T) * ddPk[i].dot(state.T)).sum(0))
+        assert np.allclose(vS[:, i], (np.conj(state.T) * ddSk[i].dot(state.T)).sum(0))
+
+
 @pytest.mark.parametrize("n0", [1, 2, 4])
 @pytest.mark.parametrize("n1", [1, 2, 4])
 @pytest.mark.parametrize("n2", [1, 2, 4])
@@ -59,6 +59,17 @@ def test_coefficient_iter():
         assert C == c.c[i]
 
 
+def test_coefficient_degenerate():
+    c = Coefficient([3, 1e-6, 2, 0., 2, 1, 2, 3 + 1e-5])
+    deg = c.degenerate(1e-4)
+    assert len(deg) == 3
+    assert np.allclose(np.sort(deg[0]), [1, 3])
+    assert np.allclose(np.sort(deg[1]), [2, 4, 6])
+    assert np.allclose(np.sort(deg[2]), [0, 7])
+    assert len(c.degenerate(1e-8)) == 1
+    assert len(Coefficient(ar(6)).degenerate(1e-4)) == 0
+
+
 def test_state_creation1():
     state = State(ar(6))
     assert len(state) == 1
@@ -283,3 +294,11 @@ def test_cstate_outer1():
     assert np.allclose(out, o1)
     o = state.outer(np.arange(len(state)))
     assert np.allclose(out, o)
+
+
+def test_cstate_degenerate():
+    state = StateC(ar(4, 10), [0., 1., 1., 0.])
+    deg = state.degenerate(1e-4)
+    assert len(deg) == 2
+    assert np.allclose(np.sort(deg[0]), [0, 3])
+    assert np.allclose(np.sort(deg[1]), [1, 2])
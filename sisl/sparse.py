@@ -1,6 +1,12 @@
 from __future__ import print_function, division
 
 from numbers import Integral
+import hashlib
+import operator
+import os
+import shutil
+import tempfile
+import weakref
 
 # To speed up the extension algorithm we limit
 # the lookup table
@@ -8,12 +14,11 @@ import numpy as np
 from numpy import int32
 from numpy import empty, zeros, asarray, arange
 from numpy import insert, take, delete, copyto, split
-from numpy import intersect1d, setdiff1d, unique, in1d
+from numpy import setdiff1d, unique, in1d
 from numpy import diff, count_nonzero
 from numpy import any as np_any
 from numpy import all as np_all
 from numpy import isnan
-from numpy import argsort
 
 from scipy.sparse import isspmatrix
 from scipy.sparse import isspmatrix_coo
@@ -23,11 +28,12 @@ from scipy.sparse import isspmatrix_lil
 
 from . import _array as _a
 from ._array import asarrayi, arrayi
-from ._indices import indices, indices_only, sorted_unique
+from ._indices import indices, indices_only
 from .messages import warn, SislError
 from ._help import array_fill_repeat, get_dtype, isiterable
 from ._help import _range as range, _zip as zip, _map as map
 from .utils.ranges import array_arange
+from ._sparse import sparse_merge, sparse_sub, sparse_finalize
 
 # Although this re-implements the CSR in scipy.sparse.csr_matrix
 # we use it slightly differently and thus require this new sparse pattern.
@@ -35,6 +41,81 @@ from .utils.ranges import array_arange
 __all__ = ['SparseCSR', 'ispmatrix', 'ispmatrixd']
 
 
+
+def _truncate(array, n):
+    """ Truncate `array` to the first `n` elements along the first axis
+
+    A view is returned, unless more than half of `array` is discarded in which case a
+    copy is returned to release the memory.
+    """
+    if array.shape[0] == n:
+        return array
+    if isinstance(array, np.memmap) or 2 * n > array.shape[0]:
+        return array[:n]
+    return array[:n].copy()
+
+
+class _Scratch(object):
+    """ Scratch directory holding the memory-mapped arrays of a `SparseCSR`
+
+    The directory (and all files) are removed when the object is garbage collected.
+
+    Parameters
+    ----------
+    directory : str, optional
+       the parent directory of the scratch directory, defaults to the system temporary directory
+    """
+    # Maximum number of elements copied in each block
+    block = 2 ** 20
+
+    def __init__(self, directory=None):
+        self.directory = directory
+        self.path = tempfile.mkdtemp(prefix='sisl_', dir=directory)
+        self._n = 0
+
+    def empty(self, shape, dtype, order='C'):
+        """ A new (uninitialized) memory-mapped array in the scratch directory """
+        shape = tuple(np.atleast_1d(shape))
+        if np.prod(shape) == 0:
+            # memory-maps may not have zero size
+            return empty(shape, dtype, order=order)
+        self._n += 1
+        fname = os.path.join(self.path, 'array{}.bin'.format(self._n))
+        return np.memmap(fname, dtype=dtype, mode='w+', shape=shape, order=order)
+
+    def slices(self, n):
+        """ Iterate slices of at most `block` elements spanning ``range(n)`` """
+        for i in range(0, n, self.block):
+            yield slice(i, min(n, i + self.block))
+
+    def copy(self, array, dtype=None, idx=None):
+        """ Copy `array` (or ``array[idx]``) into a new memory-mapped array, in blocks """
+        if dtype is None:
+            dtype = array.dtype
+        n = len(array) if idx is None else len(idx)
+        out = self.empty((n, ) + array.shape[1:], dtype)
+        for sl in self.slices(n):
+            if idx is None:
+                out[sl] = array[sl]
+            else:
+                out[sl] = array[idx[sl]]
+        return out
+
+    def __del__(self):
+        shutil.rmtree(self.path, ignore_errors=True)
+
+
+class _CSRArrays(object):
+    """ Light-weight container of the sparse arrays passed to the Cython kernels """
+    __slots__ = ('ptr', 'ncol', 'col', '_D')
+
+    def __init__(self, ptr, ncol, col, D):
+        self.ptr = ptr
+        self.ncol = ncol
+        self.col = col
+        self._D = D
+
+
 class SparseCSR(object):
     """
     A compressed sparse row matrix, slightly different than :class:`~scipy.sparse.csr_matrix`.
@@ -121,6 +202,14 @@ class SparseCSR(object):
     __numpy_ufunc__ = None
     __array_ufunc__ = None
 
+    # Scratch directory for memory-mapped arrays, see `tomemmap`
+    _scratch = None
+    # Cached hash of the sparsity pattern, see `_fingerprint`
+    _fp = None
+    # Compact storage of the elements, see `pack`
+    _packed = None
+    __finalized = False
+
     def __init__(self, arg1, dim=1, dtype=None, nnzpr=20, nnz=None,
                  **kwargs):
         """ Initialize a new sparse CSR matrix """
@@ -321,12 +410,17 @@ class SparseCSR(object):
     @property
     def dtype(self):
         """ The data-type in the sparse matrix """
+        if self._packed is not None:
+            D, last = self._packed
+            if last is None:
+                return D.dtype
+            return np.result_type(D.dtype, last.dtype)
         return self._D.dtype
 
     @property
     def dkind(self):
         """ The data-type in the sparse matrix (in str) """
-        return np.dtype(self._D.dtype).kind
+        return np.dtype(self.dtype).kind
 
     @property
     def nnz(self):
@@ -342,6 +436,17 @@ class SparseCSR(object):
         """ Whether the contained data is finalized and non-used elements have been removed """
         return self._finalized
 
+    @property
+    def _finalized(self):
+        return self.__finalized
+
+    @_finalized.setter
+    def _finalized(self, finalized):
+        # A change of state may be accompanied by an (in-place) change of the
+        # sparsity pattern, hence the cached pattern hash is discarded
+        self._fp = None
+        self.__finalized = finalized
+
     def finalize(self, sort=True):
         """ Finalizes the sparse matrix by removing all non-set elements
 
@@ -358,43 +463,23 @@ class SparseCSR(object):
         if self.finalized:
             return
 
-        # Create and index array to retain the indices we want
-        ptr = self.ptr
-        ncol = self.ncol
-        idx = array_arange(ptr[:-1], n=ncol)
-
-        self.col = take(self.col, idx)
-        self._D = take(self._D, idx, 0)
-        del idx
-        self.ptr[0] = 0
-        _a.cumsumi(ncol, out=self.ptr[1:])
-
-        ptr = self.ptr
+        # The pattern arrays are re-written in-place (the cached hash can not detect this)
+        self._fp = None
+
+        # Compact (and sort) the elements in-place, the data is
+        # handled as raw bytes per element
+        if not self._D.flags.c_contiguous:
+            self._D = np.ascontiguousarray(self._D)
+        nnz, err = sparse_finalize(self.ptr, self.ncol, self.col,
+                                   self._D.reshape(self._D.shape[0], -1).view(np.uint8), sort)
+        if err >= 0:
+            raise SislError('You cannot have two elements between the same ' +
+                            'i,j index (i={}), something has went terribly wrong.'.format(err))
+
+        # Truncate the arrays to the non-zero elements
+        self.col = _truncate(self.col, nnz)
+        self._D = _truncate(self._D, nnz)
         col = self.col
-        D = self._D
-
-        # We truncate all the connections
-        if sort:
-            for r in range(self.shape[0]):
-                # Sort and check whether there are double entries
-                sl = slice(ptr[r], ptr[r+1])
-                ccol = col[sl]
-                DD = D[sl, :]
-                idx = argsort(ccol)
-                # Do in-place sorting
-                ccol[:] = ccol[idx]
-                if not sorted_unique(ccol):
-                    raise SislError('You cannot have two elements between the same ' +
-                                    'i,j index (i={}), something has went terribly wrong.'.format(r))
-                DD[:, :] = DD[idx, :]
-
-        else:
-            for r in range(self.shape[0]):
-                ptr1 = ptr[r]
-                ptr2 = ptr[r+1]
-                if unique(col[ptr1:ptr2]).shape[0] != ptr2 - ptr1:
-                    raise SislError('You cannot have two elements between the same ' +
-                                    'i,j index (i={}), something has went terribly wrong.'.format(r))
 
         if len(col) != self.nnz:
             raise SislError('Final size in the sparse matrix finalization went wrong.') # pragma: no cover
@@ -515,6 +600,7 @@ class SparseCSR(object):
 
         # Update number of non-zeroes
         self._nnz = int(ncol.sum())
+        self._fp = None
 
         if not keep_shape:
             shape = list(self.shape)
@@ -552,6 +638,7 @@ class SparseCSR(object):
 
         # Update number of non-zeroes
         self._nnz = int(ncol.sum())
+        self._fp = None
 
         # We are *only* deleting columns, so if it is finalized,
         # it will still be
@@ -598,6 +685,69 @@ class SparseCSR(object):
             if np_any(new >= self.shape[1]):
                 self._clean_columns()
 
+    def _fingerprint(self):
+        """ Hash of the sparsity pattern, ``None`` if the matrix is not finalized
+
+        The hash is cached until the matrix changes its finalized state, the pattern arrays are
+        replaced (or the shape/number of non-zero elements changes), this makes repeated
+        comparisons of finalized matrices (see `spsame`) O(1).
+        """
+        if not self._finalized:
+            return None
+        key = (self._shape[:2], self._nnz)
+        fp = self._fp
+        if fp is not None and fp[0]() is self.ncol and fp[1]() is self.col and fp[2] == key:
+            return fp[3]
+        h = hashlib.sha1()
+        h.update(np.ascontiguousarray(self.ncol))
+        h.update(np.ascontiguousarray(self.col[:self._nnz]))
+        self._fp = (weakref.ref(self.ncol), weakref.ref(self.col), key, h.hexdigest())
+        return self._fp[3]
+
+    def _sorted_pattern(self):
+        """ Compact sparsity pattern with sorted column indices in each row
+
+        Returns
+        -------
+        ptr, ncol, col : numpy.ndarray
+           the compact sparsity pattern
+        idx : numpy.ndarray or None
+           indices of the elements of `col` in the data array, ``None`` if the matrix is finalized
+           (in which case the pattern of the matrix is returned as is)
+        """
+        if self._finalized:
+            return self.ptr, self.ncol, self.col, None
+        ncol = self.ncol
+        idx = array_arange(self.ptr[:-1], n=ncol)
+        col = self.col[idx]
+        srt = np.lexsort((col, np.repeat(_a.arangei(self.shape[0]), ncol)))
+        ptr = insert(_a.cumsumi(ncol), 0, 0)
+        return ptr, ncol, col[srt], idx[srt]
+
+    def _merge(self, other):
+        """ Union of the sparsity patterns of this and `other` (column indices sorted in each row)
+
+        Parameters
+        ----------
+        other : SparseCSR
+
+        Returns
+        -------
+        ptr, ncol, col : numpy.ndarray
+           the union sparsity pattern
+        idx1, idx2 : numpy.ndarray
+           indices of the union elements in the data array of this and `other`, respectively
+           (``-1`` if not present)
+        """
+        ptr1, ncol1, col1, i1 = self._sorted_pattern()
+        ptr2, ncol2, col2, i2 = other._sorted_pattern()
+        ptr, ncol, col, idx1, idx2 = sparse_merge(ptr1, ncol1, col1, ptr2, ncol2, col2)
+        for idx, i in [(idx1, i1), (idx2, i2)]:
+            if i is not None:
+                ok = idx >= 0
+                idx[ok] = i[idx[ok]]
+        return ptr, ncol, col, idx1, idx2
+
     def spsame(self, other):
         """ Check whether two sparse matrices have the same non-zero elements
 
@@ -612,23 +762,21 @@ class SparseCSR(object):
         """
         if self.shape[:2] != other.shape[:2]:
             return False
+        if self.nnz != other.nnz:
+            return False
 
-        sptr = self.ptr
-        sncol = self.ncol
-        scol = self.col
-        optr = other.ptr
-        oncol = other.ncol
-        ocol = other.col
+        # Finalized matrices are compared via their (cached) sparsity pattern hashes
+        fp = self._fingerprint()
+        if fp is not None:
+            ofp = other._fingerprint()
+            if ofp is not None:
+                return fp == ofp
 
         # Easy check for non-equal number of elements
-        if (sncol == oncol).sum() != self.shape[0]:
+        if not np_all(self.ncol == other.ncol):
             return False
 
-        for r in range(self.shape[0]):
-            if len(intersect1d(scol[sptr[r]:sptr[r]+sncol[r]],
-                               ocol[optr[r]:optr[r]+oncol[r]])) != sncol[r]:
-                return False
-        return True
+        return np_all(self._sorted_pattern()[2] == other._sorted_pattern()[2])
 
     def align(self, other):
         """ Aligns this sparse matrix with the sparse elements of the other sparse matrix
@@ -649,24 +797,63 @@ class SparseCSR(object):
         if self.shape[:2] != other.shape[:2]:
             raise ValueError('Aligning two sparse matrices requires same shapes')
 
-        lsetdiff1d = setdiff1d
-        sptr = self.ptr
-        sncol = self.ncol
-        scol = self.col
-        optr = other.ptr
-        oncol = other.ncol
-        ocol = other.col
-        for r in range(self.shape[0]):
-            # pointers
-            sp = sptr[r]
-            sn = sncol[r]
-            op = optr[r]
-            on = oncol[r]
-
-            adds = lsetdiff1d(ocol[op:op+on], scol[sp:sp+sn])
-            if len(adds) > 0:
-                # simply extend the elements
-                self._extend(r, adds)
+        ptr, ncol, col, idx = self._merge(other)[:4]
+        if len(col) != self._nnz:
+            self._set_merged(ptr, ncol, col, idx)
+
+    def _set_merged(self, ptr, ncol, col, idx):
+        """ Replace the sparsity pattern by a merged (sorted) pattern containing all elements of this matrix
+
+        Parameters
+        ----------
+        ptr, ncol, col : numpy.ndarray
+           the merged sparsity pattern
+        idx : numpy.ndarray
+           indices of the merged elements in the current data array (``-1`` for new elements)
+        """
+        D = zeros([len(col), self.dim], dtype=self.dtype)
+        ok = idx >= 0
+        D[ok, :] = self._D[idx[ok], :]
+
+        scratch = self._scratch
+        if scratch is None:
+            self.ptr, self.ncol, self.col, self._D = ptr, ncol, col, D
+        else:
+            self.ptr = scratch.copy(ptr)
+            self.ncol = scratch.copy(ncol)
+            self.col = scratch.copy(col)
+            self._D = scratch.copy(D)
+        self._nnz = len(col)
+        # The merged pattern is sorted and without holes
+        self._finalized = True
+
+    def _iop(self, other, op, fill=None):
+        """ In-place element-wise operation `op` with the non-zero elements of `other`
+
+        The non-zero elements of `other` are added to the sparsity pattern of this
+        matrix (initialized to 0) and `op` is applied only on these elements.
+
+        Parameters
+        ----------
+        other : SparseCSR
+           the other sparse matrix
+        op : callable
+           in-place operator, ``op(a, b)`` (e.g. `operator.iadd`)
+        fill : optional
+           value of the elements *only* in this matrix, defaults to leaving them unchanged
+        """
+        ptr, ncol, col, idx1, idx2 = self._merge(other)
+        if len(col) != self._nnz:
+            # Elements are added, the data is stored in the merged order
+            self._set_merged(ptr, ncol, col, idx1)
+            idx1 = _a.arangei(len(col))
+
+        D = self._D
+        in2 = idx2 >= 0
+        if fill is not None:
+            D[idx1[~in2], :] = fill
+        idx1 = idx1[in2]
+        D[idx1, :] = op(D[idx1, :], other._D[idx2[in2], :])
 
     def iter_nnz(self, row=None):
         """ Iterations of the non-zero elements, returns a tuple of row and column with non-zero elements
@@ -1123,6 +1310,23 @@ class SparseCSR(object):
 
         new = self.__class__(shape, dtype=dtype, nnz=1)
 
+        if self._scratch is not None:
+            # Retain the memory-mapped arrays (in a new scratch directory)
+            new._scratch = scratch = _Scratch(self._scratch.directory)
+            new.ptr = scratch.copy(self.ptr)
+            new.ncol = scratch.copy(self.ncol)
+            new.col = scratch.copy(self.col)
+            new._nnz = self.nnz
+            if dims is None:
+                new._D = scratch.copy(self._D, dtype)
+            else:
+                new._D = scratch.empty([len(self.col), dim], dtype)
+                for i, dim in enumerate(dims):
+                    new._D[:, i] = self._D[:, dim]
+            new._finalized = self._finalized
+            new._copy_fingerprint(self)
+            return new
+
         # The default sizes are not passed
         # Hence we *must* copy the arrays
         # directly
@@ -1140,9 +1344,143 @@ class SparseCSR(object):
 
         # Mark it as the same state as the other one
         new._finalized = self._finalized
+        new._copy_fingerprint(self)
 
         return new
 
+    def _copy_fingerprint(self, other):
+        """ Retain the cached pattern hash of `other` (which has an identical sparsity pattern) """
+        fp = other._fp
+        if self._finalized and fp is not None and fp[0]() is other.ncol and fp[1]() is other.col:
+            self._fp = (weakref.ref(self.ncol), weakref.ref(self.col), fp[2], fp[3])
+
+    @property
+    def scratch(self):
+        """ Scratch directory of the memory-mapped arrays (``None`` if the arrays are held in memory) """
+        if self._scratch is None:
+            return None
+        return self._scratch.path
+
+    def tomemmap(self, directory=None):
+        """ A copy of the sparse matrix with all arrays (`ptr`, `ncol`, `col` and `data`) memory-mapped
+
+        The arrays are stored in a scratch directory (created in `directory`) which is removed
+        when the sparse matrix is garbage collected. The copy is done in blocks of rows,
+        hence the full matrix is never held in memory.
+
+        Arithmetic, conversion (`tocsr`) and copies retain the memory-mapped arrays.
+        Note that adding elements outside the sparsity pattern converts the arrays back into
+        memory.
+
+        Parameters
+        ----------
+        directory : str, optional
+           parent directory of the scratch directory, defaults to the system temporary directory
+
+        Returns
+        -------
+        SparseCSR
+            a new sparse matrix with all elements stored in memory-mapped files, the
+            sparse elements are consecutive (but not necessarily finalized)
+        """
+        new = self.__class__(self.shape, dtype=self.dtype, nnz=1)
+        new._scratch = scratch = _Scratch(directory)
+
+        # Consecutive elements
+        ptr = self.ptr
+        ncol = self.ncol
+        new.ncol = scratch.copy(ncol)
+        new.ptr = scratch.empty(len(ptr), ptr.dtype)
+        new.ptr[0] = 0
+        _a.cumsumi(ncol, out=new.ptr[1:])
+        new._nnz = self.nnz
+        if ptr[0] == 0 and np_all(diff(ptr) == ncol):
+            idx = None
+        else:
+            idx = array_arange(ptr[:-1], n=ncol)
+        new.col = scratch.copy(self.col[:ptr[-1]], idx=idx)
+        new._D = scratch.copy(self._D[:ptr[-1]], idx=idx)
+        new._finalized = self._finalized
+        return new
+
+    def pack(self, dtype=None, last_dtype=None):
+        """ Store the elements in a compact format
+
+        The matrix is finalized and the elements are stored in `dtype`. Optionally the last
+        component is stored in a separate array with its own data-type.
+        The column indices are kept as ``int32`` since this is what the Cython kernels
+        use, i.e. the k-point routines in `sisl.physics` use the packed arrays without any copies.
+
+        Any use of `data` (including all operations that change the matrix)
+        transparently unpacks the matrix again (with the reduced precision of the elements).
+
+        Parameters
+        ----------
+        dtype : numpy.dtype, optional
+           data-type of the stored elements, defaults to the current data-type
+        last_dtype : numpy.dtype, optional
+           if given, the last component is stored separately with this data-type
+
+        See Also
+        --------
+        unpack : revert to the default storage
+        """
+        self.finalize()
+        if dtype is None:
+            dtype = self.dtype
+        D = self._D[:self.nnz]
+        if last_dtype is None:
+            last = None
+        else:
+            last = D[:, -1].astype(last_dtype)
+            D = D[:, :-1]
+        D = np.ascontiguousarray(D, dtype=dtype)
+        # Remove the instance array, further look-ups are handled in __getattr__
+        del self._D
+        self._packed = (D, last)
+
+    def unpack(self):
+        """ Revert a packed matrix (see `pack`) to the default storage, a no-op if the matrix is not packed """
+        packed = self._packed
+        if packed is None:
+            return
+        D, last = packed
+        self._packed = None
+        if last is None:
+            self._D = D
+        else:
+            self._D = empty([D.shape[0], D.shape[1] + 1], np.result_type(D.dtype, last.dtype))
+            self._D[:, :-1] = D
+            self._D[:, -1] = last
+
+    def __getattr__(self, name):
+        # Only called for attributes not found, i.e. the element array of a packed matrix
+        if name == '_D' and self._packed is not None:
+            self.unpack()
+            return getattr(self, name)
+        raise AttributeError("'{}' object has no attribute '{}'".format(self.__class__.__name__, name))
+
+    def _kernel_arrays(self, idx=0):
+        """ The sparse arrays and component index used by the Cython kernels
+
+        For a packed matrix (see `pack`) the separately stored last component is
+        returned as a single component.
+
+        Returns
+        -------
+        csr : object
+           with attributes ``ptr``, ``ncol``, ``col`` and ``_D``
+        idx : int
+           index of the component in ``csr._D``
+        """
+        packed = self._packed
+        if packed is None:
+            return self, idx
+        D, last = packed
+        if last is not None and idx == self.shape[2] - 1:
+            return _CSRArrays(self.ptr, self.ncol, self.col, last.reshape(-1, 1)), 0
+        return _CSRArrays(self.ptr, self.ncol, self.col, D), idx
+
     def tocsr(self, dim=0, **kwargs):
         """ Convert dimension `dim` into a :class:`~scipy.sparse.csr_matrix` format
 
@@ -1187,15 +1525,22 @@ class SparseCSR(object):
 
         return self.sub(rindices)
 
-    def sub(self, indices):
+    def sub(self, indices, copy=True):
         """ Create a new sparse CSR matrix with the data only for the given rows and columns
 
         All rows and columns in `indices` are retained, everything else is removed.
 
+        The columns are translated through a dense table (old column -> new column) in a single
+        pass over the non-zero elements.
+
         Parameters
         ----------
         indices : array_like
            the indices of the rows *and* columns that are retained in the sparse pattern
+        copy : bool, optional
+           if false, and the retained rows are contiguous and have all their elements retained,
+           the data of the returned matrix is a view of the data in this matrix (the returned
+           `data` shares memory with this matrix, changing the elements of one changes the other).
         """
         indices = asarrayi(indices).ravel()
 
@@ -1220,59 +1565,17 @@ class SparseCSR(object):
         # Create the new SparseCSR
         # We use nnzpr = 1 because we will overwrite all quantities afterwards.
         csr = self.__class__((nr, nc, self.shape[2]), dtype=self.dtype, nnz=1)
-        # Limit memory
-        csr._D = empty([1])
-
-        # Get views
-        ptr1 = csr.ptr
-        ncol1 = csr.ncol
-
-        # Create the sub data
-        take(self.ptr, ridx, out=ptr1[1:])
-        # Place directly where it should be (i.e. re-use space)
-        take(self.ncol, ridx, out=ncol1)
-
-        # Create a 2D array to contain
-        #   [0, :] the column indices to keep
-        #   [1, :] the new column data
-        # We do this because we can then use take on this array
-        # and not two arrays.
-        col_data = _a.emptyi([2, ncol1.sum()])
-
-        # Create a list of ndarrays with indices of elements per row
-        # and transfer to a linear index
-        col_data[0, :] = array_arange(ptr1[1:], n=ncol1)
-
-        # Reduce the column indices (note this also ensures that
-        # it will work on non-finalized sparse matrices)
-        col_data[1, :] = pvt[take(self.col, col_data[0, :])]
-
-        # Count the number of items that are left in the sparse pattern
-        # First recreate the new (temporary) pointer
-        ptr1[0] = 0
-        # Place it directly where it should be
-        _a.cumsumi(ncol1, out=ptr1[1:])
-
-        # Count number of entries
-        idx_take = col_data[1, :] >= 0
-        ncol1[:] = _a.fromiteri(map(count_nonzero,
-                                    split(idx_take, ptr1[1:-1]))).ravel()
-
-        # Convert to indices
-        idx_take = idx_take.nonzero()[0]
-
-        # Decrease column data and also extract the data
-        col_data = take(col_data, idx_take, axis=1)
-        del idx_take
-        csr._D = take(self._D, col_data[0, :], axis=0)
-        csr.col = col_data[1, :].copy()
-        del col_data
-
-        # Set the data for the new sparse csr
-        csr.ptr[0] = 0
-        _a.cumsumi(ncol1, out=csr.ptr[1:])
+
+        csr.ptr, csr.ncol, csr.col, idx = sparse_sub(self.ptr, self.ncol, self.col, ridx, pvt)
+        del pvt
         csr._nnz = len(csr.col)
 
+        if not copy and csr._nnz > 0 and np_all(diff(idx) == 1):
+            # The retained elements are consecutive in the data
+            csr._D = self._D[idx[0]:idx[-1] + 1]
+        else:
+            csr._D = take(self._D, idx, axis=0)
+
         return csr
 
     def sum(self, axis=None):
@@ -1324,19 +1627,8 @@ class SparseCSR(object):
         if isinstance(other, SparseCSR):
             if self.shape != other.shape:
                 raise ValueError('Adding two sparse matrices requires the same shape')
-            # Ensure that a is aligned with b
-            self.align(other)
-
-            # loop and add elements
-            for r in range(self.shape[0]):
-                # pointers
-                bptr = other.ptr[r]
-                bn = other.ncol[r]
-                sl = slice(bptr, bptr+bn, None)
-
-                # Get positions of b-elements in a:
-                in_a = self._get(r, other.col[sl])
-                self._D[in_a, :] += other._D[sl, :]
+            # Operate on the union of the sparsity patterns
+            self._iop(other, operator.iadd)
 
         elif isspmatrix(other):
             tmp = SparseCSR(other, shape=self.shape[:2])
@@ -1363,19 +1655,8 @@ class SparseCSR(object):
         if isinstance(other, SparseCSR):
             if self.shape != other.shape:
                 raise ValueError('Subtracting two sparse matrices requires the same shape')
-            # Ensure that a is aligned with b
-            self.align(other)
-
-            # loop and add elements
-            for r in range(self.shape[0]):
-                # pointers
-                bptr = other.ptr[r]
-                bn = other.ncol[r]
-                sl = slice(bptr, bptr+bn, None)
-
-                # Get positions of b-elements in a:
-                in_a = self._get(r, other.col[sl])
-                self._D[in_a, :] -= other._D[sl, :]
+            # Operate on the union of the sparsity patterns
+            self._iop(other, operator.isub)
 
         elif isspmatrix(other):
             tmp = SparseCSR(other, shape=self.shape[:2])
@@ -1400,26 +1681,16 @@ class SparseCSR(object):
             # it is not required that they are aligned...
             # 0 * float == 0
             # Hence aligning is superfluous
+            idx1, idx2 = self._merge(other)[3:]
+            in1 = idx1 >= 0
+            idx1 = idx1[in1]
+            idx2 = idx2[in1]
+            in2 = idx2 >= 0
 
-            # loop and add elements
-            for r in range(self.shape[0]):
-                # pointers
-                aptr = self.ptr[r]
-                an = self.ncol[r]
-                bptr = other.ptr[r]
-                bn = other.ncol[r]
-
-                acol = self.col[aptr:aptr+an]
-                bcol = other.col[bptr:bptr+bn]
-
-                # Get positions of b-elements in a:
-                in_a = self._get_only(r, bcol)
-                # Everything else *must* be zeroes! :)
-                self._D[in_a, :] *= other._D[bptr:bptr+bn, :]
-
-                # Now set everything *not* in b but in a, to zero
-                not_in_b = in1d(acol, bcol, invert=True).nonzero()[0]
-                self._D[aptr+not_in_b, :] = 0
+            # Get positions of b-elements in a:
+            self._D[idx1[in2], :] *= other._D[idx2[in2], :]
+            # Now set everything *not* in b but in a, to zero
+            self._D[idx1[~in2], :] = 0
 
         elif isspmatrix(other):
             tmp = SparseCSR(other, shape=self.shape[:2])
@@ -1443,19 +1714,8 @@ class SparseCSR(object):
         if isinstance(other, SparseCSR):
             if self.shape != other.shape:
                 raise ValueError('Division of two sparse matrices requires the same shape')
-
-            # Ensure that a is aligned with b
-            self.align(other)
-
-            # loop and add elements
-            for r in range(self.shape[0]):
-                # pointers
-                bptr = other.ptr[r]
-                bn = other.ncol[r]
-
-                # Get positions of b-elements in a:
-                in_a = self._get(r, other.col[bptr:bptr+bn])
-                self._D[in_a, :] /= other._D[bptr:bptr+bn, :]
+            # Operate on the union of the sparsity patterns
+            self._iop(other, operator.itruediv)
 
         elif isspmatrix(other):
             tmp = SparseCSR(other, shape=self.shape[:2])
@@ -1474,18 +1734,8 @@ class SparseCSR(object):
         if isinstance(other, SparseCSR):
             if self.shape != other.shape:
                 raise ValueError('Floor-division of two sparse matrices requires the same shape')
-            # Ensure that a is aligned with b
-            self.align(other)
-
-            # loop and add elements
-            for r in range(self.shape[0]):
-                # pointers
-                bptr = other.ptr[r]
-                bn = other.ncol[r]
-
-                # Get positions of b-elements in a:
-                in_a = self._get(r, other.col[bptr:bptr+bn])
-                self._D[in_a, :] //= other._D[bptr:bptr+bn, :]
+            # Operate on the union of the sparsity patterns
+            self._iop(other, operator.ifloordiv)
 
         elif isspmatrix(other):
             tmp = SparseCSR(other, shape=self.shape[:2])
@@ -1504,18 +1754,8 @@ class SparseCSR(object):
         if isinstance(other, SparseCSR):
             if self.shape != other.shape:
                 raise ValueError('True-division of two sparse matrices requires the same shape')
-            # Ensure that a is aligned with b
-            self.align(other)
-
-            # loop and add elements
-            for r in range(self.shape[0]):
-                # pointers
-                bptr = other.ptr[r]
-                bn = other.ncol[r]
-
-                # Get positions of b-elements in a:
-                in_a = self._get(r, other.col[bptr:bptr+bn])
-                self._D[in_a, :].__itruediv__(other._D[bptr:bptr+bn, :])
+            # Operate on the union of the sparsity patterns
+            self._iop(other, operator.itruediv)
 
         elif isspmatrix(other):
             tmp = SparseCSR(other, shape=self.shape[:2])
@@ -1541,29 +1781,9 @@ class SparseCSR(object):
         if isinstance(other, SparseCSR):
             if self.shape != other.shape:
                 raise ValueError('True-division of two sparse matrices requires the same shape')
-            # Ensure that a is aligned with b
-            # 0 ** float == 1.
-            self.align(other)
-
-            # loop and add elements
-            for r in range(self.shape[0]):
-                # pointers
-                aptr = self.ptr[r]
-                an = self.ncol[r]
-                bptr = other.ptr[r]
-                bn = other.ncol[r]
-
-                acol = self.col[aptr:aptr+an]
-                bcol = other.col[bptr:bptr+bn]
-
-                # Get positions of b-elements in a:
-                in_a = self._get(r, bcol)
-                self._D[in_a, :] **= other._D[bptr:bptr+bn, :]
-
-                # Now set everything *not* in b but in a, to 1
-                #  float ** 0 == 1
-                not_in_b = in1d(acol, bcol, invert=True).nonzero()[0]
-                self._D[aptr+not_in_b, :] = 1
+            # Operate on the union of the sparsity patterns
+            # 0 ** float == 0. and float ** 0 == 1.
+            self._iop(other, operator.ipow, fill=1)
 
         elif isspmatrix(other):
             tmp = SparseCSR(other, shape=self.shape[:2])
@@ -1591,6 +1811,9 @@ class SparseCSR(object):
         self.ptr = insert(_a.cumsumi(self.ncol), 0, 0)
         self.col = state['col']
         self._D = state['D']
+        self._nnz = int(self.ncol.sum())
+        # The state is stored after finalization
+        self._finalized = True
 
 
 def ispmatrix(matrix, map_row=None, map_col=None):
@@ -5,21 +5,23 @@ import functools as ftool
 from numbers import Integral
 import numpy as np
 from numpy import int32
-from numpy import insert, unique, take, delete, argsort
+from numpy import insert, unique, take, delete, count_nonzero, zeros
 from numpy import tile, repeat, concatenate
+from scipy.sparse import csr_matrix, identity
 
 from . import _array as _a
+from . import linalg as lin
 from .atom import Atom
 from .orbital import Orbital
 from .geometry import Geometry
 from .messages import warn, SislError, SislWarning, tqdm_eta
-from ._indices import indices_only
 from ._help import get_dtype
 from ._help import _zip as zip, _range as range, _map as map
 from .utils.ranges import array_arange
 from .sparse import SparseCSR
+from ._sparse import sparse_merge, sparse_transpose
 
-__all__ = ['SparseAtom', 'SparseOrbital']
+__all__ = ['SparseAtom', 'SparseOrbital', 'SparseGeometryView']
 
 
 class _SparseGeometry(object):
@@ -135,6 +137,20 @@ class _SparseGeometry(object):
         new._csr = self._csr.copy(dtype=dtype)
         return new
 
+    def tomemmap(self, directory=None):
+        """ A copy of this object with the sparse matrix stored in memory-mapped files
+
+        See :meth:`~sparse.SparseCSR.tomemmap` for details.
+
+        Parameters
+        ----------
+        directory : str, optional
+           parent directory of the scratch directory, defaults to the system temporary directory
+        """
+        new = self.__class__(self.geometry.copy(), self.dim, self.dtype, 1, **self._cls_kwargs())
+        new._csr = self._csr.tomemmap(directory)
+        return new
+
     @property
     def dim(self):
         """ Number of components per element """
@@ -241,6 +257,11 @@ class _SparseGeometry(object):
         If one reduces the number of supercells, *any* sparse element
         that references the supercell will be deleted.
 
+        The column indices are remapped in-place through a supercell translation
+        table. If the supercell indices of the retained supercells are unchanged and there are
+        no couplings to any removed supercells (e.g. when extending from a single supercell), only
+        the shape is updated.
+
         See `SuperCell.set_nsc` for allowed parameters.
 
         See Also
@@ -253,75 +274,54 @@ class _SparseGeometry(object):
         if np.all(sc.nsc == self.sc.nsc):
             return
 
-        # Create an array of all things that should be translated
-        old = []
-        new = []
-        deleted = np.empty(self.n_s, np.bool_)
-        deleted[:] = True
-        for i, sc_off in sc:
-            try:
-                # Luckily there are *only* one time wrap-arounds
-                j = self.sc.sc_index(sc_off)
-                # Now do translation
-                old.append(j)
-                new.append(i)
-                deleted[j] = False
-            except:
-                # Not found, i.e. new, so no need to translate
-                pass
-
-        if len(old) not in [self.n_s, sc.n_s]:
+        # Create the translation table from the old supercell indices to the new
+        # supercell indices (-1 for supercells that are deleted)
+        sc_off = self.sc.sc_off
+        kept = np.all(np.abs(sc_off) <= sc.nsc // 2, axis=1)
+        n_kept = count_nonzero(kept)
+        if n_kept not in [self.n_s, sc.n_s]:
             raise SislError("Not all supercells are accounted for")
+        isc = _a.fulli(self.n_s, -1)
+        isc[kept] = sc.sc_index(sc_off[kept, :])
+        same = np.all(isc[kept] == kept.nonzero()[0])
 
-        # 1. Ensure that any one of the *old* supercells that
-        #    are now deleted are put in the end
-        for i, j in enumerate(deleted.nonzero()[0]):
-            # Old index (j)
-            old.append(j)
-            # Move to the end (*HAS* to be higher than the number of
-            # cells in the new supercell structure)
-            new.append(sc.n_s + i)
-
-        old = _a.arrayi(old)
-        new = _a.arrayi(new)
-
-        # Assert that there are only unique values
-        if len(unique(old)) != len(old):
-            raise SislError("non-unique values in old set_nsc")
-        if len(unique(new)) != len(new):
-            raise SislError("non-unique values in new set_nsc")
-        if self.n_s != len(old):
-            raise SislError("non-valid size of in old set_nsc")
-
-        # Figure out if we need to do any work
-        keep = (old != new).nonzero()[0]
-        if len(keep) > 0:
-            # Reduce pivoting work
-            old = old[keep]
-            new = new[keep]
-
-            # Create the translation tables
-            n = tile([size], len(old))
-
-            old = array_arange(old * size, n=n)
-            new = array_arange(new * size, n=n)
-
-            # Move data to new positions
-            self._csr.translate_columns(old, new)
-
-            max_n = new.max() + 1
+        csr = self._csr
+        if same and n_kept < self.n_s and csr.finalized and csr.nnz > 0:
+            # The columns are sorted, so only the last element in each row needs to be checked
+            # for couplings to the deleted supercells (which are all after the retained ones)
+            ncol = csr.ncol
+            last = csr.col[(csr.ptr[:-1] + ncol - 1)[ncol > 0]]
+            no_couplings = last.max() < n_kept * size
         else:
-            max_n = 0
+            no_couplings = csr.nnz == 0 or (same and n_kept == self.n_s)
 
-        # Make sure we delete all column values where we have put fake values
-        delete = _a.arangei(sc.n_s * size, max(max_n, self.shape[1]))
-        if len(delete) > 0:
-            self._csr.delete_columns(delete, keep_shape=True)
+        if not no_couplings:
+            # Remap all column indices (deleted columns are placed beyond the new shape)
+            idx = array_arange(csr.ptr[:-1], n=csr.ncol)
+            col = csr.col[idx]
+            new = isc[col // size]
+            deleted = new < 0
+            if not same:
+                new[deleted] = sc.n_s
+                csr.col[idx] = new * size + col % size
+                # The columns are no longer sorted
+                csr._finalized = False
+                csr._fp = None
+            elif np.any(deleted):
+                csr.col[idx[deleted]] = sc.n_s * size
+                csr._fp = None
+            del idx, col, new
+        else:
+            deleted = None
 
         # Ensure the shape is correct
-        shape = list(self._csr.shape)
+        shape = list(csr.shape)
         shape[1] = size * sc.n_s
-        self._csr._shape = tuple(shape)
+        csr._shape = tuple(shape)
+
+        # Remove the elements in the deleted supercells (now beyond the shape)
+        if deleted is not None and np.any(deleted):
+            csr._clean_columns()
 
         self.geometry.set_nsc(*args, **kwargs)
 
@@ -356,70 +356,65 @@ class _SparseGeometry(object):
         """
         # Create a temporary copy to put data into
         T = self.copy()
-        T._csr.ptr = None
-        T._csr.col = None
-        T._csr.ncol = None
-        T._csr._D = None
-
-        # Short-linkes
-        sc = self.geometry.sc
-
-        # Create "DOK" format indices
-        csr = self._csr
-        # Number of rows (used for converting to supercell indices)
-        size = csr.shape[0]
-
-        # First extract the actual data
-        ncol = csr.ncol.view()
-        if csr.finalized:
-            ptr = csr.ptr.view()
-            col = csr.col.copy()
+        ptr, ncol, col, idx = self._transpose_pattern()
+        csr = T._csr
+        scratch = csr._scratch
+        if scratch is None:
+            csr.ptr = ptr
+            csr.ncol = ncol
+            csr.col = col
+            csr._D = take(self._csr._D, idx, axis=0)
         else:
-            idx = array_arange(csr.ptr[:-1], n=ncol, dtype=int32)
-            ptr = insert(_a.cumsumi(ncol), 0, 0)
-            col = csr.col[idx]
-            del idx
+            csr.ptr = scratch.copy(ptr)
+            csr.ncol = scratch.copy(ncol)
+            csr.col = scratch.copy(col)
+            csr._D = scratch.copy(self._csr._D, idx=idx)
 
-        # Create an array ready for holding all transposed columns
-        row = _a.zerosi(len(col))
-        row[ptr[1:-1]] = 1
-        _a.cumsumi(row, out=row)
-        D = csr._D.copy()
-
-        # Now we have the DOK format
-        #  row, col, _D
-
-        # Retrieve all sc-indices in the new transposed array
-        new_sc_off = sc.sc_index(- sc.sc_off)
+        # The transposed columns are sorted
+        # We haven't changed the number of non-zeros
+        csr._finalized = True
 
-        # Calculate the row-offsets in the new sparse geometry
-        row += new_sc_off[sc.sc_index(sc.sc_off[col // size, :])] * size
+        return T
 
-        # Now convert columns into unit-cell
-        col %= size
+    def _transpose_pattern(self):
+        """ Transposed sparsity pattern (see `transpose`) and the indices of the transposed elements in the data """
+        sc = self.geometry.sc
+        csr = self._csr
+        # Supercell index of the transposed elements
+        isc = sc.sc_index(- sc.sc_off).astype(int32, copy=False)
+        return sparse_transpose(csr.ptr, csr.ncol, csr.col, isc, csr.shape[0])
 
-        # Now we can re-create the sparse matrix
-        # All we need is to count the number of non-zeros per column.
-        _, nrow = unique(col, return_counts=True)
+    def symmetrize(self):
+        """ Symmetrize the sparse geometry *in-place* by averaging with its transpose
 
-        # Now we have everything ready...
-        # Simply figure out how to sort the columns
-        # such that we have them unified.
-        idx = argsort(col)
+        This is equivalent to (but without creating the transposed object):
 
-        # Our new data will then be
-        T._csr.col = take(row, idx, out=row).astype(int32, copy=False)
-        del row
-        T._csr._D = take(D, idx, axis=0)
-        del D
-        T._csr.ncol = nrow.astype(int32, copy=False)
-        T._csr.ptr = insert(_a.cumsumi(nrow), 0, 0)
+        >>> sp = (sp + sp.transpose()) * 0.5
 
-        # For-sure we haven't sorted the columns.
-        # We haven't changed the number of non-zeros
-        T._csr._finalized = False
+        Notes
+        -----
+        As for `transpose` the sub-spin matrix box is not transposed, nor are
+        the values complex conjugated.
 
-        return T
+        See Also
+        --------
+        transpose : the transposed sparse geometry
+        """
+        csr = self._csr
+        D = csr._D
+        tptr, tncol, tcol, tidx = self._transpose_pattern()
+        sptr, sncol, scol, sidx = csr._sorted_pattern()
+        ptr, ncol, col, idx1, idx2 = sparse_merge(sptr, sncol, scol, tptr, tncol, tcol)
+        if sidx is not None:
+            ok = idx1 >= 0
+            idx1[ok] = sidx[idx1[ok]]
+        if not csr.finalized or len(col) != csr.nnz:
+            # Add the elements only present in the transposed matrix (and sort)
+            csr._set_merged(ptr, ncol, col, idx1)
+
+        in2 = idx2 >= 0
+        csr._D[in2, :] += D[tidx[idx2[in2]], :]
+        csr._D *= 0.5
 
     def spalign(self, other):
         """ See :meth:`~sisl.sparse.SparseCSR.align` for details """
@@ -580,7 +575,7 @@ class _SparseGeometry(object):
         """ Whether the contained data is finalized and non-used elements have been removed """
         return self._csr.finalized
 
-    def remove(self, atom):
+    def remove(self, atom, copy=True):
         """ Create a subset of this sparse matrix by removing the atoms corresponding to `atom`
 
         Negative indices are wrapped and thus works.
@@ -589,6 +584,10 @@ class _SparseGeometry(object):
         ----------
         atom : array_like of int
             indices of removed atoms
+        copy : bool, optional
+            if false, the data of the returned sparse matrix shares memory with this sparse
+            matrix whenever possible (the retained rows are contiguous and keep all their
+            elements), i.e. changing the elements of one changes the other, see `SparseCSR.sub`
 
         See Also
         --------
@@ -598,9 +597,9 @@ class _SparseGeometry(object):
         """
         atom = self.sc2uc(atom)
         atom = delete(_a.arangei(self.na), atom)
-        return self.sub(atom)
+        return self.sub(atom, copy=copy)
 
-    def sub(self, atom):
+    def sub(self, atom, copy=True):
         """ Create a subset of this sparse matrix by retaining the atoms corresponding to `atom`
 
         Indices passed must be unique.
@@ -611,6 +610,10 @@ class _SparseGeometry(object):
         ----------
         atom : array_like of int
             indices of removed atoms
+        copy : bool, optional
+            if false, the data of the returned sparse matrix shares memory with this sparse
+            matrix whenever possible (the retained rows are contiguous and keep all their
+            elements), i.e. changing the elements of one changes the other, see `SparseCSR.sub`
 
         See Also
         --------
@@ -642,6 +645,164 @@ class _SparseGeometry(object):
         full[b] = a
         return self.sub(full)
 
+    def _cut(self, seps, axis, *args, **kwargs):
+        """ Cut the sparse geometry into `seps` parts along `axis`, see `SparseAtom.cut` and `SparseOrbital.cut`
+
+        Returns
+        -------
+        S : object
+           the cut sparse geometry
+        dev : float
+           the maximum absolute deviation between the matrix elements in all parts
+           and the matrix elements of `S`
+        tiled : bool
+           whether all parts are equivalent to `S` within `rtol` and `atol` (see `numpy.allclose`)
+        """
+        rtol = kwargs.get('rtol', 1e-4)
+        atol = kwargs.get('atol', 1e-4)
+
+        # Create new geometry
+        with warnings.catch_warnings(record=True) as w:
+            # Cause all warnings to always be triggered.
+            warnings.simplefilter("always")
+            # Create new cut geometry
+            geom = self.geometry.cut(seps, axis, *args, **kwargs)
+        # Check whether the warning exists
+        if len(w) > 0:
+            if issubclass(w[-1].category, SislWarning):
+                new_w = str(w[-1].message)
+                new_w += ("\n---\n"
+                          "The {} cannot be cut as the structure "
+                          "cannot be tiled accordingly. ANY use of the model has been "
+                          "relieved from sisl.".format(self.__class__.__name__))
+                warn(new_w)
+
+        size = self._size
+        # Size of the cut sparse geometry
+        n = size // seps
+        csr = self._csr
+
+        # Retrieve all elements (in all parts)
+        ncol = csr.ncol
+        idx = array_arange(csr.ptr[:-1], n=ncol)
+        row = np.repeat(_a.arangei(size), ncol)
+        col = csr.col[idx]
+        D = csr._D[idx, :]
+        del idx
+
+        # Supercell offsets in the cut structure (relative to the part of the row)
+        isc = self.geometry.sc.sc_off[col // size, :]
+        col %= size
+        isc[:, axis] = isc[:, axis] * seps + col // n - row // n
+        col %= n
+        row %= n
+
+        # The interaction range along `axis` is determined by the first part
+        first = ncol[:n].sum()
+        nsc = self.nsc.copy()
+        nsc[axis] = 1
+        if first > 0:
+            nsc[axis] += np.abs(isc[:first, axis]).max() * 2
+        geom.sc.set_nsc(nsc)
+        sc_index = geom.sc.sc_index
+        n_s = geom.sc.n_s
+
+        # Create the cut sparse geometry from the elements of the first part, the
+        # transposed elements are added where they are not already present
+        r = concatenate((row[:first], col[:first]))
+        if first > 0:
+            c = concatenate((sc_index(isc[:first, :]) * n + col[:first],
+                             sc_index(-isc[:first, :]) * n + row[:first]))
+        else:
+            c = r
+        # Retain the first occurence of each element (this also sorts the elements)
+        key, uniq = unique(r.astype(np.int64) * (n * n_s) + c, return_index=True)
+        r = r[uniq]
+        c = c[uniq]
+        S_D = D[uniq % max(first, 1), :]
+        del uniq
+
+        S = self.__class__(geom, self.dim, self.dtype, 1, **self._cls_kwargs())
+        S._csr = SparseCSR((S_D, c, insert(_a.cumsumi(np.bincount(r, minlength=n)), 0, 0)),
+                           shape=(n, n * n_s))
+        # The columns are sorted per row
+        S._csr._finalized = True
+        del r, c
+
+        # Compare all elements in all parts with the cut sparse geometry
+        E = zeros(D.shape, dtype=D.dtype)
+        valid = np.all(np.abs(isc) <= nsc // 2, axis=1).nonzero()[0]
+        if len(key) > 0 and len(valid) > 0:
+            k = row[valid].astype(np.int64) * (n * n_s) + sc_index(isc[valid, :]) * n + col[valid]
+            pos = np.searchsorted(key, k)
+            pos[pos == len(key)] = 0
+            found = key[pos] == k
+            E[valid[found], :] = S_D[pos[found], :]
+        if len(D) > 0:
+            dev = np.abs(D - E).max()
+        else:
+            dev = 0.
+        tiled = np.allclose(D, E, rtol=rtol, atol=atol)
+
+        return S, dev, tiled
+
+    def _cut_auto(self, axis, *args, **kwargs):
+        """ Cut the sparse geometry into the largest number of parts along `axis` which re-creates the sparse geometry by tiling
+
+        See `_cut` for details and return values.
+        """
+        na = self.na
+        for seps in range(na, 1, -1):
+            if na % seps != 0:
+                continue
+            with warnings.catch_warnings():
+                warnings.simplefilter("error", SislWarning)
+                try:
+                    S, dev, tiled = self._cut(seps, axis, *args, **kwargs)
+                except (SislWarning, ValueError):
+                    continue
+            if tiled:
+                return S, dev, tiled
+        return self.copy(), 0., True
+
+    def cut(self, seps, axis, *args, **kwargs):
+        """ Cuts the sparse geometry model into different parts.
+
+        Recreates a new sparse geometry object with only the cutted
+        atoms in the structure.
+
+        Cutting is the opposite of tiling.
+
+        The matrix elements of the first part along `axis` are used in the cut
+        structure. All parts are checked against the cut structure (within ``rtol``
+        and ``atol``, see `Geometry.cut`) and a warning is issued, reporting the
+        maximum deviation, if they are not equivalent.
+
+        Parameters
+        ----------
+        seps : int or None
+           number of times the structure will be cut. If ``None`` the largest number
+           of parts which re-creates this object by tiling is used (i.e. the periodicity along `axis`
+           is detected).
+        axis : int
+           the axis that will be cut
+        *args, **kwargs :
+           passed to `Geometry.cut`
+
+        See Also
+        --------
+        tile : the opposite of `cut`
+        Geometry.cut : the cutting of the geometry
+        """
+        if seps is None:
+            S, dev, tiled = self._cut_auto(axis, *args, **kwargs)
+        else:
+            S, dev, tiled = self._cut(seps, axis, *args, **kwargs)
+        if not tiled:
+            warn(self.__class__.__name__ + '.cut the cut structure cannot be re-created by tiling, '
+                 'the maximum deviation of the matrix elements is {:.4e}.'.format(dev))
+        return S
+
     def finalize(self):
         """ Finalizes the model
 
@@ -941,120 +1102,7 @@ class SparseAtom(_SparseGeometry):
         """
         super(SparseAtom, self).set_nsc(self.na, *args, **kwargs)
 
-    def cut(self, seps, axis, *args, **kwargs):
-        """ Cuts the sparse atom model into different parts.
-
-        Recreates a new sparse atom object with only the cutted
-        atoms in the structure.
-
-        Cutting is the opposite of tiling.
-
-        Parameters
-        ----------
-        seps : int
-           number of times the structure will be cut
-        axis : int
-           the axis that will be cut
-        """
-        new_w = None
-        # Create new geometry
-        with warnings.catch_warnings(record=True) as w:
-            # Cause all warnings to always be triggered.
-            warnings.simplefilter("always")
-            # Create new cut geometry
-            geom = self.geometry.cut(seps, axis, *args, **kwargs)
-            # Check whether the warning exists
-            if len(w) > 0:
-                if issubclass(w[-1].category, SislWarning):
-                    new_w = str(w[-1].message)
-                    new_w += ("\n---\n"
-                              "The sparse atom cannot be cut as the structure "
-                              "cannot be tiled accordingly. ANY use of the model has been "
-                              "relieved from sisl.")
-                    warn(new_w)
-
-        # Now we need to re-create number of supercells
-        na = self.na
-        S = self.tocsr(0)
-
-        # First we need to figure out how long the interaction range is
-        # in the cut-direction
-        # We initialize to be the same as the parent direction
-        nsc = _a.arrayi(self.nsc // 2)
-        nsc[axis] = 0  # we count the new direction
-        isc = _a.zerosi([3])
-        isc[axis] -= 1
-        out = False
-        while not out:
-            # Get supercell index
-            isc[axis] += 1
-            try:
-                idx = self.sc_index(isc)
-            except:
-                break
-
-            sub = S[0:geom.na, idx * na:(idx + 1) * na].indices[:]
-
-            if len(sub) == 0:
-                break
-
-            c_max = np.amax(sub)
-            # Count the number of cells it interacts with
-            i = (c_max % na) // geom.na
-            ic = idx * na
-            for j in range(i):
-                idx = ic + geom.na * j
-                # We need to ensure that every "in between" index exists
-                # if it does not we discard those indices
-                if len(np.logical_and(idx <= sub,
-                                      sub < idx + geom.na).nonzero()[0]) == 0:
-                    i = j - 1
-                    out = True
-                    break
-            nsc[axis] = isc[axis] * seps + i
-
-            if out:
-                warn('Cut the connection at nsc={0} in direction {1}.'.format(nsc[axis], axis))
-
-        # Update number of super-cells
-        nsc[:] = nsc[:] * 2 + 1
-        geom.sc.set_nsc(nsc)
-
-        # Now we have a correct geometry, and
-        # we are now ready to create the sparsity pattern
-        # Reduce the sparsity pattern, first create the new one
-        S = self.__class__(geom, self.dim, self.dtype, np.amax(self._csr.ncol), **self._cls_kwargs())
-
-        def _sca2sca(M, a, m, seps, axis):
-            # Converts an o from M to m
-            isc = _a.arrayi(M.a2isc(a))
-            isc[axis] = isc[axis] * seps
-            # Correct for cell-offset
-            isc[axis] = isc[axis] + (a % M.na) // m.na
-            # find the equivalent cell in m
-            try:
-                # If a fail happens it is due to a discarded
-                # interaction across a non-interacting region
-                return (a % m.na,
-                        m.sc_index(isc) * m.na,
-                        m.sc_index(-isc) * m.na)
-            except:
-                return None, None, None
-
-        # only loop on the atoms remaining in the cutted structure
-        for ja, ia in self.iter_nnz(range(geom.na)):
-
-            # Get the equivalent orbital in the smaller cell
-            a, afp, afm = _sca2sca(self.geometry, ia, S.geom, seps, axis)
-            if a is None:
-                continue
-            S[ja, a + afp] = self[ja, ia]
-            # TODO check that we indeed have Hermiticity for non-collinear and spin-orbit
-            S[a, ja + afm] = self[ja, ia]
-
-        return S
-
-    def sub(self, atom):
+    def sub(self, atom, copy=True):
         """ Create a subset of this sparse matrix by only retaining the elements corresponding to the ``atom``
 
         Indices passed *MUST* be unique.
@@ -1065,6 +1113,10 @@ class SparseAtom(_SparseGeometry):
         ----------
         atom : array_like of int
             indices of retained atoms
+        copy : bool, optional
+            if false, the data of the returned sparse matrix shares memory with this sparse
+            matrix whenever possible (the retained rows are contiguous and keep all their
+            elements), i.e. changing the elements of one changes the other, see `SparseCSR.sub`
 
         See Also
         --------
@@ -1083,11 +1135,11 @@ class SparseAtom(_SparseGeometry):
 
         # Now create the new sparse orbital class
         S = self.__class__(geom, self.dim, self.dtype, 1, **self._cls_kwargs())
-        S._csr = self._csr.sub(idx)
+        S._csr = self._csr.sub(idx, copy=copy)
 
         return S
 
-    def tile(self, reps, axis):
+    def tile(self, reps, axis, lazy=False):
         """ Create a tiled sparse atom object, equivalent to `Geometry.tile`
 
         The already existing sparse elements are extrapolated
@@ -1104,6 +1156,8 @@ class SparseAtom(_SparseGeometry):
             number of repetitions along cell-vector `axis`
         axis : int
             0, 1, 2 according to the cell-direction
+        lazy : bool, optional
+            if true, return a `SparseGeometryView` which does not create the tiled sparse matrix
 
         See Also
         --------
@@ -1111,6 +1165,9 @@ class SparseAtom(_SparseGeometry):
         Geometry.repeat: a different ordering of the final geometry
         repeat: a different ordering of the final geometry
         """
+        if lazy:
+            return SparseGeometryView(self).tile(reps, axis)
+
         # Create the new sparse object
         g = self.geometry.tile(reps, axis)
         S = self.__class__(g, self.dim, self.dtype, 1, **self._cls_kwargs())
@@ -1172,7 +1229,7 @@ class SparseAtom(_SparseGeometry):
 
         return S
 
-    def repeat(self, reps, axis):
+    def repeat(self, reps, axis, lazy=False):
         """ Create a repeated sparse atom object, equivalent to `Geometry.repeat`
 
         The already existing sparse elements are extrapolated
@@ -1184,6 +1241,8 @@ class SparseAtom(_SparseGeometry):
             number of repetitions along cell-vector `axis`
         axis : int
             0, 1, 2 according to the cell-direction
+        lazy : bool, optional
+            if true, return a `SparseGeometryView` which does not create the repeated sparse matrix
 
         See Also
         --------
@@ -1191,6 +1250,9 @@ class SparseAtom(_SparseGeometry):
         Geometry.tile: a different ordering of the final geometry
         tile: a different ordering of the final geometry
         """
+        if lazy:
+            return SparseGeometryView(self).repeat(reps, axis)
+
         # Create the new sparse object
         g = self.geometry.repeat(reps, axis)
         S = self.__class__(g, self.dim, self.dtype, 1, **self._cls_kwargs())
@@ -1455,126 +1517,17 @@ class SparseOrbital(_SparseGeometry):
         """
         super(SparseOrbital, self).set_nsc(self.no, *args, **kwargs)
 
-    def cut(self, seps, axis, *args, **kwargs):
-        """ Cuts the sparse orbital model into different parts.
-
-        Recreates a new sparse orbital object with only the cutted
-        atoms in the structure.
-
-        Cutting is the opposite of tiling.
-
-        Parameters
-        ----------
-        seps : int
-           number of times the structure will be cut
-        axis : int
-           the axis that will be cut
-        """
-        new_w = None
-        # Create new geometry
-        with warnings.catch_warnings(record=True) as w:
-            # Cause all warnings to always be triggered.
-            warnings.simplefilter("always")
-            # Create new cut geometry
-            geom = self.geometry.cut(seps, axis, *args, **kwargs)
-            # Check whether the warning exists
-            if len(w) > 0:
-                if issubclass(w[-1].category, SislWarning):
-                    new_w = str(w[-1].message)
-                    new_w += ("\n---\n"
-                              "The sparse orbital cannot be cut as the structure "
-                              "cannot be tiled accordingly. ANY use of the model has been "
-                              "relieved from sisl.")
-                    warn(new_w)
-
-        # Now we need to re-create number of supercells
-        no = self.no
-        S = self.tocsr(0)
-
-        # First we need to figure out how long the interaction range is
-        # in the cut-direction
-        # We initialize to be the same as the parent direction
-        nsc = self.nsc // 2
-        nsc[axis] = 0  # we count the new direction
-        isc = _a.zerosi([3])
-        isc[axis] -= 1
-        out = False
-        while not out:
-            # Get supercell index
-            isc[axis] += 1
-            try:
-                idx = self.sc_index(isc)
-            except:
-                break
-
-            sub = S[0:geom.no, idx * no:(idx + 1) * no].indices[:]
-
-            if len(sub) == 0:
-                break
-
-            c_max = np.amax(sub)
-            # Count the number of cells it interacts with
-            i = (c_max % no) // geom.no
-            ic = idx * no
-            for j in range(i):
-                idx = ic + geom.no * j
-                # We need to ensure that every "in between" index exists
-                # if it does not we discard those indices
-                if len(np.logical_and(idx <= sub,
-                                      sub < idx + geom.no).nonzero()[0]) == 0:
-                    i = j - 1
-                    out = True
-                    break
-            nsc[axis] = isc[axis] * seps + i
-
-            if out:
-                warn('Cut the connection at nsc={0} in direction {1}.'.format(nsc[axis], axis))
-
-        # Update number of super-cells
-        nsc[:] = nsc[:] * 2 + 1
-        geom.sc.set_nsc(nsc)
-
-        # Now we have a correct geometry, and
-        # we are now ready to create the sparsity pattern
-        # Reduce the sparsity pattern, first create the new one
-        S = self.__class__(geom, self.dim, self.dtype, np.amax(self._csr.ncol), **self._cls_kwargs())
-
-        def _sco2sco(M, o, m, seps, axis):
-            # Converts an o from M to m
-            isc = _a.arrayi(M.o2isc(o), copy=True)
-            isc[axis] = isc[axis] * seps
-            # Correct for cell-offset
-            isc[axis] = isc[axis] + (o % M.no) // m.no
-            # find the equivalent cell in m
-            try:
-                # If a fail happens it is due to a discarded
-                # interaction across a non-interacting region
-                return (o % m.no,
-                        m.sc_index(isc) * m.no,
-                        m.sc_index(-isc) * m.no)
-            except:
-                return None, None, None
-
-        # only loop on the orbitals remaining in the cutted structure
-        for jo, io in self.iter_nnz(orbital=range(geom.no)):
-
-            # Get the equivalent orbital in the smaller cell
-            o, ofp, ofm = _sco2sco(self.geometry, io, S.geom, seps, axis)
-            if o is None:
-                continue
-            d = self[jo, io]
-            S[jo, o + ofp] = d
-            S[o, jo + ofm] = d
-
-        return S
-
-    def remove(self, atom, orb_index=None):
+    def remove(self, atom, orb_index=None, copy=True):
         """ Remove a subset of this sparse matrix by only retaining the atoms corresponding to `atom`
 
         Parameters
         ----------
         atom : array_like of int or Atom
             indices of removed atoms or Atom for direct removal of all atoms
+        copy : bool, optional
+            if false, the data of the returned sparse matrix shares memory with this sparse
+            matrix whenever possible (the retained rows are contiguous and keep all their
+            elements), i.e. changing the elements of one changes the other, see `SparseCSR.sub`
 
         See Also
         --------
@@ -1586,9 +1539,9 @@ class SparseOrbital(_SparseGeometry):
             atom = self.geometry.atoms.index(atom)
             atom = (self.geometry.atoms.specie == atom).nonzero()[0]
         # This will digress to call .sub
-        return super(SparseOrbital, self).remove(atom)
+        return super(SparseOrbital, self).remove(atom, copy=copy)
 
-    def remove_orbital(self, atom, orbital):
+    def remove_orbital(self, atom, orbital, copy=True):
         """ Remove a subset of orbitals on `atom` according to `orbital`
 
         Parameters
@@ -1597,6 +1550,10 @@ class SparseOrbital(_SparseGeometry):
             indices of atoms or `Atom` that will be reduced in size according to `orbital`
         orbital : array_like of int or Orbital
             indices of the orbitals on `atom` that are removed from the sparse matrix.
+        copy : bool, optional
+            if false, the data of the returned sparse matrix shares memory with this sparse
+            matrix whenever possible (the retained rows are contiguous and keep all their
+            elements), i.e. changing the elements of one changes the other, see `SparseCSR.sub`
 
         Examples
         --------
@@ -1622,7 +1579,7 @@ class SparseOrbital(_SparseGeometry):
             new = self
             for i in range(uniq_specie.size):
                 idx = (indices == i).nonzero()[0]
-                new = new.remove_orbital(atom[idx], orbital)
+                new = new.remove_orbital(atom[idx], orbital, copy=copy)
             return new
 
         # Get the atom object we wish to reduce
@@ -1634,9 +1591,9 @@ class SparseOrbital(_SparseGeometry):
             orbital = old_atom.index(orbital)
         # Create the reverse index-table to delete those not required
         orbital = delete(_a.arangei(len(old_atom)), np.asarray(orbital).ravel())
-        return self.sub_orbital(atom, orbital)
+        return self.sub_orbital(atom, orbital, copy=copy)
 
-    def sub(self, atom):
+    def sub(self, atom, copy=True):
         """ Create a subset of this sparse matrix by only retaining the atoms corresponding to `atom`
 
         Negative indices are wrapped and thus works, supercell atoms are also wrapped to the unit-cell.
@@ -1645,6 +1602,10 @@ class SparseOrbital(_SparseGeometry):
         ----------
         atom : array_like of int or Atom
             indices of retained atoms or `Atom` for retaining only *that* atom
+        copy : bool, optional
+            if false, the data of the returned sparse matrix shares memory with this sparse
+            matrix whenever possible (the retained rows are contiguous and keep all their
+            elements), i.e. changing the elements of one changes the other, see `SparseCSR.sub`
 
         Examples
         --------
@@ -1676,11 +1637,11 @@ class SparseOrbital(_SparseGeometry):
 
         # Now create the new sparse orbital class
         S = self.__class__(geom, self.dim, self.dtype, 1, **self._cls_kwargs())
-        S._csr = self._csr.sub(idx)
+        S._csr = self._csr.sub(idx, copy=copy)
 
         return S
 
-    def sub_orbital(self, atom, orbital):
+    def sub_orbital(self, atom, orbital, copy=True):
         """ Retain only a subset of the orbitals on `atom` according to `orbital`
 
         This allows one to retain only a given subset of the sparse matrix elements. 
@@ -1692,6 +1653,10 @@ class SparseOrbital(_SparseGeometry):
         orbital : array_like of int or Orbital
             indices of the orbitals on `atom` that are retained in the sparse matrix, the list of
             orbitals will be sorted. One cannot re-arrange matrix elements currently.
+        copy : bool, optional
+            if false, the data of the returned sparse matrix shares memory with this sparse
+            matrix whenever possible (the retained rows are contiguous and keep all their
+            elements), i.e. changing the elements of one changes the other, see `SparseCSR.sub`
 
         Notes
         -----
@@ -1721,7 +1686,7 @@ class SparseOrbital(_SparseGeometry):
             new = self
             for i in range(uniq_specie.size):
                 idx = (indices == i).nonzero()[0]
-                new = new.sub_orbital(atom[idx], orbital)
+                new = new.sub_orbital(atom[idx], orbital, copy=copy)
             return new
 
         # At this point we are sure that uniq_specie is *only* one specie!
@@ -1760,11 +1725,11 @@ class SparseOrbital(_SparseGeometry):
         n_s = self.geometry.n_s
         sc_off = _a.arangei(n_s) * self.no
         sub_idx = tile(sub_idx, n_s).reshape(n_s, -1) + sc_off.reshape(-1, 1)
-        SG._csr = self._csr.sub(sub_idx)
+        SG._csr = self._csr.sub(sub_idx, copy=copy)
 
         return SG
 
-    def tile(self, reps, axis):
+    def tile(self, reps, axis, lazy=False):
         """ Create a tiled sparse orbital object, equivalent to `Geometry.tile`
 
         The already existing sparse elements are extrapolated
@@ -1776,6 +1741,8 @@ class SparseOrbital(_SparseGeometry):
             number of repetitions along cell-vector `axis`
         axis : int
             0, 1, 2 according to the cell-direction
+        lazy : bool, optional
+            if true, return a `SparseGeometryView` which does not create the tiled sparse matrix
 
         See Also
         --------
@@ -1783,6 +1750,9 @@ class SparseOrbital(_SparseGeometry):
         Geometry.repeat: a different ordering of the final geometry
         repeat: a different ordering of the final geometry
         """
+        if lazy:
+            return SparseGeometryView(self).tile(reps, axis)
+
         # Create the new sparse object
         g = self.geometry.tile(reps, axis)
         S = self.__class__(g, self.dim, self.dtype, 1, **self._cls_kwargs())
@@ -1844,7 +1814,7 @@ class SparseOrbital(_SparseGeometry):
 
         return S
 
-    def repeat(self, reps, axis):
+    def repeat(self, reps, axis, lazy=False):
         """ Create a repeated sparse orbital object, equivalent to `Geometry.repeat`
 
         The already existing sparse elements are extrapolated
@@ -1856,6 +1826,8 @@ class SparseOrbital(_SparseGeometry):
             number of repetitions along cell-vector `axis`
         axis : int
             0, 1, 2 according to the cell-direction
+        lazy : bool, optional
+            if true, return a `SparseGeometryView` which does not create the repeated sparse matrix
 
         See Also
         --------
@@ -1863,6 +1835,9 @@ class SparseOrbital(_SparseGeometry):
         Geometry.tile: a different ordering of the final geometry
         tile: a different ordering of the final geometry
         """
+        if lazy:
+            return SparseGeometryView(self).repeat(reps, axis)
+
         # Create the new sparse object
         g = self.geometry.repeat(reps, axis)
         S = self.__class__(g, self.dim, self.dtype, 1, **self._cls_kwargs())
@@ -1893,7 +1868,11 @@ class SparseOrbital(_SparseGeometry):
         sc_index = geom_n.sc_index
 
         # Create new indptr, indices and D
-        ncol = repeat(ncol, reps)
+        # The orbitals of each atom are repeated as a block, hence we need
+        # the primitive orbital of each of the new orbitals
+        ja_n = geom_n.o2a(_a.arangei(geom_n.no))
+        ncol = ncol[geom.firsto[ja_n // reps] + _a.arangei(geom_n.no) - geom_n.firsto[ja_n]]
+        del ja_n
         # Now indptr is complete
         indptr = insert(_a.cumsumi(ncol), 0, 0)
         del ncol
@@ -2071,6 +2050,10 @@ class SparseOrbital(_SparseGeometry):
         the orbitals on the overlapping atoms have the same orbitals, as well as the
         same orbital ordering.
 
+        This is equivalent to:
+
+        >>> self.concatenate([self, other], axis, eps)
+
         Examples
         --------
         >>> sporb = SparseOrbital(....)
@@ -2099,6 +2082,7 @@ class SparseOrbital(_SparseGeometry):
         See Also
         --------
         prepend : equivalent scheme as this method
+        concatenate : append many sparse geometries in one go
         transpose : ensure hermiticity by using this routine
         Geometry.append
         Geometry.prepend
@@ -2114,321 +2098,137 @@ class SparseOrbital(_SparseGeometry):
         """
         if not (type(self) is type(other)):
             raise ValueError(self.__class__.__name__ + '.append requires other to be of same type: {}'.format(other.__class__.__name__))
+        return self.concatenate([self, other], axis, eps)
 
-        if self.geometry.nsc[axis] > 3 or other.geometry.nsc[axis] > 3:
-            raise ValueError(self.__class__.__name__ + '.append requires sparse-geometries to maximally '
-                             'have 3 supercells along appending axis.')
-
-        if np.any(self.geometry.nsc != other.geometry.nsc):
-            raise ValueError(self.__class__.__name__ + '.append requires sparse-geometries to have the same '
-                             'number of supercells along all directions.')
-
-        if self.dim != other.dim:
-            raise ValueError(self.__class__.__name__ + '.append requires the same number of dimensions in the matrix')
-
-        # Create sparsity pattern in the atomic picture.
-        # This makes it easier to find the coupling elements along axis.
-        # It could also be done in the orbital space...
-
-        def _sep_connections(spO, direction):
-            """ Finds atoms that has connections crossing the `axis` along `direction`
-
-            Returns
-            -------
-            self_connect
-                atoms in `spO` which connects across `direction`
-            other_connect
-                atoms in `spO` which self_connect connects to along `direction`
-            """
-            geom = spO.geometry
-            # We need to copy since we are deleting elements below
-            csr = spO._csr.copy([0])
-
-            # We will retain all connections crossing along the given direction
-            n = spO.shape[0]
-
-            # Figure out the matrix columns we should retain
-            nsc = [None] * 3
-            nsc[axis] = direction
-
-            # Get all supercell indices that we should delete from the column specifications
-            idx = delete(_a.arangei(geom.sc.n_s), geom.sc.sc_index(nsc)) * n
-
-            # Calculate columns to delete
-            cols = array_arange(idx, n=_a.fulli(idx.shape, n))
-
-            # Delete all values in columns, but keep them to retain the supercell information
-            csr.delete_columns(cols, keep_shape=True)
-            # Now we are in a position to find the indices along the append direction
-            self_connect = geom.sc2uc(geom.o2a((csr.ncol > 0).nonzero()[0], True), True)
-
-            # Retrieve the connected atoms in the other structure
-            other_connect = geom.sc2uc(geom.o2a(csr.col[array_arange(csr.ptr[:-1], n=csr.ncol)], True), True)
-
-            return self_connect, other_connect
-
-        # Naming convention:
-        #  P_01 -> [0] -> [1]
-        #  P_10 -> [1] -> [0]
-        #  M_01 -> [0] -> [-1]
-        #  M_10 -> [-1] -> [0]
-        self_P_01, self_P_10 = _sep_connections(self, +1)
-        self_M_01, self_M_10 = _sep_connections(self, -1)
-        other_P_01, other_P_10 = _sep_connections(other, +1)
-        other_M_01, other_M_10 = _sep_connections(other, -1)
-
-        # I.e. the connections in the supercell picture will be:
-        # Note that all indices are not in any supercell (which is why we need to
-        # translate them anyhow).
-
-        def _find_overlap(g1, g1_idx, isc1, g2, g2_idx, isc2, R):
-            """ Finds `g1_idx` atoms in `g2_idx` """
-            xyz1 = g1.axyz(g1_idx, isc=isc1)
-            g1_g2 = []
-            warn_atoms = []
-            for ia, xyz in zip(g1_idx, xyz1):
-                # Only search in the index
-                idx = g2.close_sc(xyz, isc2, R=R, idx=g2_idx)
-                g1_g2.append(_check(idx, ia, warn_atoms))
-            return _a.arrayi(g1_g2).ravel(), warn_atoms
-
-        def _check(idx, atom, warn_atoms):
-            if len(idx[0]) == 0:
-                warn_atoms.append(atom)
-                if len(idx[1]) == 0:
-                    raise ValueError(self.__class__.__name__ + '.append found incompatible self/other within the given eps value.')
-                idx = idx[1]
-            else:
-                idx = idx[0]
-            if len(idx) != 1:
-                raise ValueError(self.__class__.__name__ + '.append found two atoms close to a mirror atom, a too high eps value was given.')
-            return idx
-
-        # Radius to use as precision array
-        R = _a.arrayd([0.001, eps])
-
-        # Initialize arrays for checking
-        self_isc = [0] * 3
-        other_isc = [0] * 3
-
-        def _2(spg1, spg1_idx, spg1_isc, spg2, spg2_idx, spg2_isc, name):
-            _error = self.__class__.__name__ + '.append({}) '.format(name)
-            idx, warn_atoms = _find_overlap(spg1.geometry, spg1_idx, spg1_isc,
-                                            spg2.geometry, spg2_idx, spg2_isc, R)
-            if len(spg1_idx) != len(spg2_idx):
-                raise ValueError(_error + 'did not find an equivalent overlap atoms between the two geometries.')
-            if len(idx) != len(spg2_idx):
-                raise ValueError(_error + 'did not find all overlapping atoms.')
-
-            if len(warn_atoms) > 0:
-                # Sort them and ensure they are a list
-                warn_atoms = str(np.sort(warn_atoms).tolist())
-                warn(_error + 'atoms farther than 0.001 Ang: {}.'.format(warn_atoms))
-
-            # Now we have the atomic indices that we know are "dublicated"
-            # Ensure the number of orbitals are the same in both geometries
-            # (we don't check explicitly names etc. since this should be the users
-            #  responsibility)
-            s1 = spg1.geometry.atoms.sub(spg1_idx).reorder().firsto
-            s2 = spg2.geometry.atoms.sub(idx).reorder().firsto
-            if not np.all(s1 == s2):
-                raise ValueError(_error + 'requires geometries to have the same '
-                                 'number of orbitals in the overlapping region.')
-
-            return idx
-
-        # in the full sparse geometry:
-        # [0] <-> [0]
-        self_isc[axis] = 0
-        other_isc[axis] = 0
-        self_P_10_to_other_M_01 = _2(self, self_P_10, self_isc,
-                                     other, other_M_01, other_isc, 'self[0] -> other[0]')
-
-        self_isc[axis] = -1
-        other_isc[axis] = -1
-        other_M_10_to_self_P_01 = _2(other, other_M_10, other_isc,
-                                     self, self_P_01, self_isc, 'other[0] -> self[0]')
-
-        # [0] -> [-1]
-        self_isc[axis] = -1
-        other_isc[axis] = -1
-        self_M_10_to_other_P_01 = _2(self, self_M_10, self_isc,
-                                     other, other_P_01, other_isc, 'self[0] -> other[-1]')
-
-        # [0] -> [1]
-        self_isc[axis] = 0
-        other_isc[axis] = 0
-        other_P_10_to_self_M_01 = _2(other, other_P_10, other_isc,
-                                     self, self_M_01, self_isc, 'other[0] -> self[1]')
+    @classmethod
+    def concatenate(cls, sps, axis, eps=0.01):
+        """ Append all sparse geometries in `sps` along `axis` to construct a new connected sparse matrix
 
-        # Clean-up
-        del self_isc, other_isc
-
-        # Now we have the following operations to perform
-        self_no = self.geometry.no
-        other_no = other.geometry.no
-        total_no = self_no + other_no
-
-        # Now create the combined geometry + sparse matrix
-        total_geom = self.geometry.append(other, axis)
-        sc = total_geom.sc
-
-        # 1. create a copy of the sparse-geometries
-        # 2. translate old columns to new columns
-        # 3. merge the two
-        # 4. insert the overlapping stuff (both +/-)
-        self_o2n = _a.arangei(self_no)
-        self_o2n.shape = (1, -1)
-        self_o2n = self_o2n + sc.sc_index(self.geometry.sc.sc_off).reshape(-1, 1) * total_no
-        self_o2n.shape = (-1,)
-
-        other_o2n = _a.arangei(other_no) + self_no
-        other_o2n.shape = (1, -1)
-        other_o2n = other_o2n + sc.sc_index(other.geometry.sc.sc_off).reshape(-1, 1) * total_no
-        other_o2n.shape = (-1,)
-
-        # Create a template new sparse matrix
-        self_csr = self._csr
-        other_csr = other._csr
-
-        total = self.copy()
-        # Overwrite geometry
-        total._geometry = total_geom
-        n_s = sc.n_s
-
-        # Correct the new csr shape
-        csr = total._csr
-        csr._shape = (total_no, total_no * n_s, csr.dim)
-
-        # Fix columns in the self part
-        idx = array_arange(csr.ptr[:-1], n=csr.ncol)
-        csr.col[idx] = self_o2n[csr.col[idx]]
-
-        # Now add the `other` sparse data while fixing the supercell indices
-        csr.ptr = concatenate((csr.ptr[:-1], csr.ptr[-1] + other_csr.ptr)).astype(int32, copy=False)
-        csr.ncol = concatenate((csr.ncol, other_csr.ncol)).astype(int32, copy=False)
-        # We use take since other_csr.col may contain non-finalized elements (i.e. too large values)
-        # In this case we use take to *clip* the indices to the largest available one.
-        # This may be done since col elements not touched by the .ptr + .ncol will never
-        # be used.
-        csr.col = concatenate((csr.col, take(other_o2n, other_csr.col, mode='clip'))).astype(int32, copy=False)
-        csr._D = concatenate((csr._D, other_csr._D), axis=0)
-
-        # Small clean-up
-        del self_o2n, other_o2n, idx
-
-        # At this point `csr` contains all data.
-        # but the columns are incorrect. I.e. self -> self along the append axis
-        # where it should connect to `other`.
-
-        # Below we are correcting the column indices such that they
-        # connect to the proper things.
-        # Since some systems has crossings over diagonal supercells we need
-        # all supercells with a non-zero component along the axis
-        isc = [None] * 3
-
-        def _transfer_indices(csr, rows, old_col, new_col):
-            " Transfer indices in col to the equivalent column indices "
-            if old_col.size != new_col.size:
-                raise ValueError(self.__class__.__name__ + '.append requires the overlapping basis to '
-                                 'be equivalent. We found different number of hopping elements between '
-                                 'the two regions.')
-
-            col_idx = array_arange(csr.ptr[rows], n=csr.ncol[rows], dtype=int32)
-            col_idx = col_idx[indices_only(csr.col[col_idx], old_col)]
-
-            # Indices are now the indices in csr.col such that
-            #   col[col_idx] in old_col
-            # Now we need to find the indices (in order)
-            # such that
-            #   col[col_idx] == old_col[old_idx]
-            # This will let us do:
-            #   col[col_idx] = new_col[old_idx]
-            # since old_col and new_col have the same order
-            # Since indices does not return a sorted index list
-            # but only indices of elements in other list
-            # we need to sort them correctly
-            # Create the linear index that transfers from old -> new
-            # Since old_col/new_col does not contain the full supercell picture
-            # we need to create a fake indexing converter
-            min_col = (old_col[0] // csr.shape[0]) * csr.shape[0]
-            max_col = (old_col[-1] // csr.shape[0] + 1) * csr.shape[0]
-            new_col_idx = _a.arangei(max_col - min_col)
-            new_col_idx[old_col - min_col] = new_col
-            csr.col[col_idx] = new_col_idx[csr.col[col_idx] - min_col]
-
-        ## nomenclature in new supercell
-        # self[0] -> other[0]
-
-        # Now we have the two matrices merged.
-        # We now need to fix connections crossing the border
-        isc[axis] = 1
-        rows = self.geometry.a2o(self_P_01, True)
-        # We have to store isc_off since we require a one2one correspondance
-        # of the new supercells. Also we require the supercell indices to be
-        # sorted, and hence we sort the sc-indices (just in case)
-        isc_off = np.sort(sc.sc_index(isc))
-        sc_off = isc_off.reshape(-1, 1) * total_no
-        # These columns should have a one-to-one correspondance
-        old_col = (self.geometry.a2o(self_P_10, True).reshape(1, -1) + sc_off).ravel().astype(int32)
-        # Since we are appending we actually move it into the primary cell (this is where the
-        # requirement of nsc == 3 comes from...)
-        # Shift all supercell indices to the primary one (along the append axis)
-        sc_off = sc.sc_off[isc_off, :]
-        sc_off[:, axis] = 0
-        sc_off = sc.sc_index(sc_off).reshape(-1, 1) * total_no + self_no
-        new_col = (other.geometry.a2o(self_P_10_to_other_M_01, True).reshape(1, -1) + sc_off).ravel().astype(int32)
-
-        # Find columns in `rows` and transfer
-        # the elements with values `old_col` -> `new_col`
-        # Since this should catch *all* elements that cross the
-        # boundary we will only have elements that are actually used
-        # So we need simply to reduce idx to the indices that contain the elements
-        # in `old_col`
-        _transfer_indices(csr, rows, old_col, new_col)
-
-        ##
-        # other[0] -> self[0]
-        isc[axis] = -1
-        rows = other.geometry.a2o(other_M_01, True) + self_no
-        isc_off = np.sort(sc.sc_index(isc))
-        sc_off = isc_off.reshape(-1, 1) * total_no + self_no
-        old_col = (other.geometry.a2o(other_M_10, True).reshape(1, -1) + sc_off).ravel().astype(int32)
-        sc_off = sc.sc_off[isc_off, :]
-        sc_off[:, axis] = 0
-        sc_off = sc.sc_index(sc_off).reshape(-1, 1) * total_no
-        new_col = (self.geometry.a2o(other_M_10_to_self_P_01, True).reshape(1, -1) + sc_off).ravel().astype(int32)
-        _transfer_indices(csr, rows, old_col, new_col)
-
-        ##
-        # self[0] -> other[-1]
-        isc[axis] = -1
-        rows = self.geometry.a2o(self_M_01, True)
-        isc_off = np.sort(sc.sc_index(isc))
-        sc_off = isc_off.reshape(-1, 1) * total_no
-        old_col = (self.geometry.a2o(self_M_10, True).reshape(1, -1) + sc_off).ravel().astype(int32)
-        #sc_off = sc.sc_off[isc_off, :]
-        #sc_off[:, axis] = -1
-        #sc_off = sc.sc_index(sc_off).reshape(-1, 1) * total_no
-        new_col = (other.geometry.a2o(self_M_10_to_other_P_01, True).reshape(1, -1) + self_no + sc_off).ravel().astype(int32)
-        _transfer_indices(csr, rows, old_col, new_col)
-
-        ##
-        # other[0] -> self[1]
-        isc[axis] = 1
-        rows = other.geometry.a2o(other_P_01, True) + self_no
-        isc_off = np.sort(sc.sc_index(isc))
-        sc_off = isc_off.reshape(-1, 1) * total_no
-        old_col = (other.geometry.a2o(other_P_10, True).reshape(1, -1) + self_no + sc_off).ravel().astype(int32)
-        #sc_off = sc.sc_off[isc_off, :]
-        #sc_off[:, axis] = 1
-        #sc_off = sc.sc_index(sc_off).reshape(-1, 1) * total_no
-        new_col = (self.geometry.a2o(other_P_10_to_self_M_01, True).reshape(1, -1) + sc_off).ravel().astype(int32)
-        _transfer_indices(csr, rows, old_col, new_col)
-
-        # Finally figure out the number of non-zero elements
-        csr._nnz = csr.ncol.sum()
-        csr._finalized = False
+        This is equivalent to (but much faster than) appending the sparse geometries one at a time:
+
+        >>> sps[0].append(sps[1], axis).append(sps[2], axis) # ...
+
+        The couplings of each sparse geometry across the boundary along `axis` are
+        transferred to the equivalent atoms in the neighbouring sparse geometries
+        (see `append` for details). The first and last sparse geometries are connected
+        through the periodic boundary along `axis`.
+
+        The atoms connecting any two neighbouring sparse geometries are only searched once
+        for each (unique) pair of objects. Hence when the same object is repeated,
+        e.g. ``[H_lead, H_dev, H_dev, ..., H_dev, H_lead]``, the interfaces are found only
+        once.
+
+        Parameters
+        ----------
+        sps : list of object
+            the sparse geometries to be appended, must all be of the same type
+        axis : int
+            axis to append the sparse geometries along
+        eps : float, optional
+            tolerance that all coordinates *must* be within to allow an append, see `append`
+
+        See Also
+        --------
+        append : append two sparse geometries
+        Geometry.append
+
+        Raises
+        ------
+        ValueError if atomic coordinates does not overlap within `eps`
+
+        Returns
+        -------
+        object
+            a new instance with all sparse matrices joined and appended together
+        """
+        sps = list(sps)
+        if len(sps) == 0:
+            raise ValueError(cls.__name__ + '.concatenate requires at least one sparse geometry')
+
+        sp0 = sps[0]
+        for sp in sps:
+            if not (type(sp) is type(sp0)):
+                raise ValueError(cls.__name__ + '.concatenate requires all objects to be of same type: {}'.format(sp.__class__.__name__))
+            if sp.geometry.nsc[axis] > 3:
+                raise ValueError(cls.__name__ + '.concatenate requires sparse-geometries to maximally '
+                                 'have 3 supercells along appending axis.')
+            if np.any(sp.geometry.nsc != sp0.geometry.nsc):
+                raise ValueError(cls.__name__ + '.concatenate requires sparse-geometries to have the same '
+                                 'number of supercells along all directions.')
+            if sp.dim != sp0.dim:
+                raise ValueError(cls.__name__ + '.concatenate requires the same number of dimensions in the matrix')
+
+        # Compact sparse data and the atoms connecting across the boundaries,
+        # these are calculated once per object
+        compact = {}
+        for sp in sps:
+            if id(sp) not in compact:
+                compact[id(sp)] = _sparse_orbital_compact(sp, axis)
+
+        # Orbital maps of the connections across the interface between two neighbouring
+        # objects, these are calculated once per pair of objects
+        interfaces = {}
+        N = len(sps)
+        for i in range(N):
+            A = sps[i]
+            B = sps[(i + 1) % N]
+            key = (id(A), id(B))
+            if key not in interfaces:
+                interfaces[key] = _sparse_orbital_interface(A, compact[id(A)], B, compact[id(B)], axis, eps)
+
+        # Create the combined geometry
+        geom = sp0.geometry
+        for sp in sps[1:]:
+            geom = geom.append(sp.geometry, axis)
+        sc = geom.sc
+        total_no = geom.no
+
+        # Orbital offsets of each object in the combined geometry
+        offset = insert(_a.cumsumi([sp.geometry.no for sp in sps]), 0, 0)
+
+        ptr = [_a.zerosi(1)]
+        ncol = []
+        col = []
+        D = []
+        for i, sp in enumerate(sps):
+            ip = (i + 1) % N
+            im = (i - 1) % N
+            no = sp.geometry.no
+            s_ncol, s_col, s_D, s_sc_off = compact[id(sp)][:4]
+            # Orbital maps for couplings in the +1/-1 direction along axis
+            o_P = interfaces[(id(sp), id(sps[ip]))][0]
+            o_M = interfaces[(id(sps[im]), id(sp))][1]
+
+            jo = s_col % no
+            sc_off = s_sc_off.copy()
+            d = sc_off[:, axis]
+
+            o = jo + offset[i]
+            for direction, o_map, j, shift in [(1, o_P, ip, i < N - 1), (-1, o_M, im, i > 0)]:
+                idx = (d == direction).nonzero()[0]
+                if len(idx) == 0:
+                    continue
+                jo_n = o_map[jo[idx]]
+                if np.any(jo_n < 0):
+                    raise ValueError(cls.__name__ + '.concatenate requires the overlapping basis to '
+                                     'be equivalent. We found different number of hopping elements between '
+                                     'the two regions.')
+                o[idx] = jo_n + offset[j]
+                if shift:
+                    # The coupling is now within the combined cell
+                    sc_off[idx, axis] = 0
+
+            ptr.append(_a.cumsumi(s_ncol) + ptr[-1][-1])
+            ncol.append(s_ncol)
+            col.append(sc.sc_index(sc_off) * total_no + o)
+            D.append(s_D)
+            del jo, sc_off, d, o
+
+        total = sp0.__class__(geom, sp0.dim, sp0.dtype, 1, **sp0._cls_kwargs())
+        total._csr = SparseCSR((concatenate(D, axis=0),
+                                concatenate(col).astype(int32, copy=False),
+                                concatenate(ptr).astype(int32, copy=False)),
+                               shape=(total_no, total_no * sc.n_s))
 
         return total
 
@@ -2488,3 +2288,707 @@ class SparseOrbital(_SparseGeometry):
         spAtom._csr._nnz = len(col)
         spAtom._csr._finalized = True # unique returns sorted elements
         return spAtom
+
+
+def _sparse_orbital_compact(sp, axis):
+    """ Compact sparse data of `sp` and the atoms connecting across the boundaries along `axis`
+
+    Returns
+    -------
+    ncol, col, D : numpy.ndarray
+       the compact sparse data (without holes)
+    sc_off : numpy.ndarray
+       the supercell offsets of `col`
+    P_01, P_10 : numpy.ndarray
+       atoms in `sp` which connects across the ``+1`` boundary and the atoms they connect to
+    M_01, M_10 : numpy.ndarray
+       atoms in `sp` which connects across the ``-1`` boundary and the atoms they connect to
+    """
+    geom = sp.geometry
+    csr = sp._csr
+    ncol = csr.ncol
+    if csr.finalized or csr.nnz == csr.ptr[-1]:
+        col = csr.col[:csr.nnz]
+        D = csr._D[:csr.nnz]
+    else:
+        idx = array_arange(csr.ptr[:-1], n=ncol)
+        col = csr.col[idx]
+        D = csr._D[idx, :]
+        del idx
+
+    no = geom.no
+    sc_off = geom.sc.sc_off[col // no, :]
+    d = sc_off[:, axis]
+    rows = np.repeat(_a.arangei(no), ncol)
+
+    def sep(direction):
+        idx = (d == direction).nonzero()[0]
+        return geom.o2a(unique(rows[idx]), True), geom.o2a(unique(col[idx] % no), True)
+
+    P_01, P_10 = sep(1)
+    M_01, M_10 = sep(-1)
+
+    return ncol, col, D, sc_off, P_01, P_10, M_01, M_10
+
+
+def _sparse_orbital_interface(A, cA, B, cB, axis, eps):
+    """ Orbital maps for the connections between `A` and `B` (appended after `A`)
+
+    Parameters
+    ----------
+    A, B : SparseOrbital
+       the neighbouring sparse orbital objects
+    cA, cB : tuple
+       the compact data of `A` and `B`, see `_sparse_orbital_compact`
+    axis : int
+       axis that `B` is appended along
+    eps : float
+       tolerance that all coordinates *must* be within
+
+    Returns
+    -------
+    A2B : numpy.ndarray
+       orbitals in `B` that the orbitals in the ``+1`` image of `A` are equivalent to (-1 if not connected)
+    B2A : numpy.ndarray
+       orbitals in `A` that the orbitals in the ``-1`` image of `B` are equivalent to (-1 if not connected)
+    """
+    name = A.__class__.__name__
+    # Radius to use as precision array
+    R = _a.arrayd([0.001, eps])
+
+    def _map(spg1, spg1_idx, spg2, spg2_idx, isc, what):
+        _error = name + '.append({}) '.format(what)
+        g1 = spg1.geometry
+        g2 = spg2.geometry
+        if len(spg1_idx) != len(spg2_idx):
+            raise ValueError(_error + 'did not find an equivalent overlap atoms between the two geometries.')
+
+        idx = []
+        warn_atoms = []
+        for ia, xyz in zip(spg1_idx, g1.axyz(spg1_idx, isc=isc)):
+            # Only search in the connecting atoms
+            close = g2.close_sc(xyz, isc, R=R, idx=spg2_idx)
+            if len(close[0]) == 0:
+                warn_atoms.append(ia)
+                if len(close[1]) == 0:
+                    raise ValueError(name + '.append found incompatible self/other within the given eps value.')
+                close = close[1]
+            else:
+                close = close[0]
+            if len(close) != 1:
+                raise ValueError(name + '.append found two atoms close to a mirror atom, a too high eps value was given.')
+            idx.append(close[0])
+        idx = _a.arrayi(idx)
+
+        if len(warn_atoms) > 0:
+            # Sort them and ensure they are a list
+            warn_atoms = str(np.sort(warn_atoms).tolist())
+            warn(_error + 'atoms farther than 0.001 Ang: {}.'.format(warn_atoms))
+
+        # Now we have the atomic indices that we know are "dublicated"
+        # Ensure the number of orbitals are the same in both geometries
+        # (we don't check explicitly names etc. since this should be the users
+        #  responsibility)
+        if not np.all(g1.lasto[spg1_idx] - g1.firsto[spg1_idx] == g2.lasto[idx] - g2.firsto[idx]):
+            raise ValueError(_error + 'requires geometries to have the same '
+                             'number of orbitals in the overlapping region.')
+
+        # Convert to an orbital map
+        o_map = _a.fulli(g1.no, -1)
+        o_map[g1.a2o(spg1_idx, True)] = g2.a2o(idx, True)
+        return o_map
+
+    isc = [0] * 3
+    # A[0] -> B[0]
+    A2B = _map(A, cA[5], B, cB[6], isc, 'self[0] -> other[0]')
+    # B[0] -> A[0]
+    isc[axis] = -1
+    B2A = _map(B, cB[7], A, cA[4], isc, 'other[0] -> self[0]')
+    return A2B, B2A
+
+
+def _lazy(func):
+    """ Decorator for `SparseGeometryView` methods which defers to the materialized object once it exists """
+    name = func.__name__
+
+    @ftool.wraps(func)
+    def wrapped(self, *args, **kwargs):
+        if self._full is None:
+            return func(self, *args, **kwargs)
+        return getattr(self._full, name)(*args, **kwargs)
+    return wrapped
+
+
+class SparseGeometryView(object):
+    """ Lazy tiled/repeated view of a sparse geometry object (`SparseAtom`, `SparseOrbital` and sub-classes)
+
+    The view only stores the primitive sparse object together with the sequence
+    of `tile` and `repeat` operations. The rows of the resulting sparse matrix are
+    generated on demand (in blocks of ``_block`` rows) which means that `nonzero`, `iter_nnz`,
+    `tocsr` and the :math:`k`-space matrices (`Pk`, `Hk`, `Sk`, ...) may be calculated without ever
+    creating the repeated sparse matrix.
+
+    Any modification of the view (``view[i, j] = v``, ``del view[i, j]`` or in-place methods
+    such as `construct`, `shift`, `eliminate_zeros`, ...) *materializes* the full sparse object
+    (which is then used for all subsequent operations).
+    Meta-data which is not changed by tiling/repeating (`spin`, `orthogonal`, `S_idx`, ...) is
+    taken from the primitive sparse object and writers read the view directly through
+    its (generated) sparse matrix. Other methods are not available on the view, use `materialize`
+    to create the full sparse object.
+
+    Parameters
+    ----------
+    parent : SparseAtom or SparseOrbital
+       the primitive sparse object, a copy is stored in the view
+
+    Examples
+    --------
+    >>> H = Hamiltonian(sisl.geom.graphene())
+    >>> Hbig = H.tile(100, 0, lazy=True).tile(100, 1)
+    >>> Hbig.Hk([0.1, 0, 0])
+    """
+    __numpy_ufunc__ = None
+    __array_ufunc__ = None
+
+    # Number of rows generated in each block
+    _block = 16384
+
+    def __init__(self, parent):
+        if isinstance(parent, SparseGeometryView):
+            raise ValueError(self.__class__.__name__ + ' cannot create a view of a view, use tile/repeat on the view.')
+        self._parent = parent.copy()
+        self._ops = []
+        if isinstance(parent, SparseAtom):
+            self._units = [_a.arangei(parent.na + 1)]
+        else:
+            self._units = [parent.geometry.firsto.astype(int32)]
+        self._sc = parent.geometry.sc
+        self._geometry = None
+        self._full = None
+
+    def _extend(self, method, reps, axis):
+        """ Create a new view with an additional `method` operation """
+        if self._full is not None:
+            return SparseGeometryView(self._full)._extend(method, reps, axis)
+        if reps < 1:
+            raise ValueError(self.__class__.__name__ + '.' + method + ' requires a positive number of repetitions.')
+
+        view = object.__new__(self.__class__)
+        view._parent = self._parent
+        view._ops = self._ops + [(method, reps, axis)]
+        firsto = self._units[-1]
+        if method == 'tile':
+            units = (firsto[:-1].reshape(1, -1) + firsto[-1] * _a.arangei(reps).reshape(-1, 1)).ravel()
+            units = np.append(units, firsto[-1] * reps)
+        else:
+            units = insert(_a.cumsumi(repeat(np.diff(firsto), reps)), 0, 0)
+        view._units = self._units + [units.astype(int32, copy=False)]
+        view._sc = getattr(self._sc, method)(reps, axis)
+        view._geometry = None
+        view._full = None
+        return view
+
+    def tile(self, reps, axis):
+        """ Lazily tile the view, equivalent to `SparseOrbital.tile`
+
+        Parameters
+        ----------
+        reps : int
+            number of repetitions along cell-vector `axis`
+        axis : int
+            0, 1, 2 according to the cell-direction
+        """
+        return self._extend('tile', reps, axis)
+
+    def repeat(self, reps, axis):
+        """ Lazily repeat the view, equivalent to `SparseOrbital.repeat`
+
+        Parameters
+        ----------
+        reps : int
+            number of repetitions along cell-vector `axis`
+        axis : int
+            0, 1, 2 according to the cell-direction
+        """
+        return self._extend('repeat', reps, axis)
+
+    @property
+    def parent(self):
+        """ The primitive sparse object """
+        return self._parent
+
+    @property
+    def materialized(self):
+        """ Whether the full sparse object has been created """
+        return self._full is not None
+
+    def materialize(self):
+        """ Create (and store) the full sparse object by applying all operations on the primitive sparse object """
+        if self._full is None:
+            full = self._parent
+            for method, reps, axis in self._ops:
+                full = getattr(full, method)(reps, axis)
+            if len(self._ops) == 0:
+                full = full.copy()
+            self._full = full
+            # Free the lazy data
+            self._units = None
+        return self._full
+
+    @property
+    def geometry(self):
+        """ The repeated geometry (created on first access) """
+        if self._full is not None:
+            return self._full.geometry
+        if self._geometry is None:
+            geom = self._parent.geometry
+            for method, reps, axis in self._ops:
+                geom = getattr(geom, method)(reps, axis)
+            self._geometry = geom
+        return self._geometry
+    geom = geometry
+
+    @property
+    def sc(self):
+        """ The supercell of the repeated geometry """
+        if self._full is not None:
+            return self._full.sc
+        return self._sc
+
+    @property
+    def na(self):
+        """ Number of atoms in the repeated geometry """
+        if self._full is not None:
+            return self._full.na
+        return len(self._units[-1]) - 1
+
+    @property
+    def no(self):
+        """ Number of orbitals in the repeated geometry """
+        if self._full is not None:
+            return self._full.no
+        no = self._parent.no
+        for _, reps, _ in self._ops:
+            no *= reps
+        return no
+
+    @property
+    def _size(self):
+        if self._full is not None:
+            return self._full._size
+        return self._units[-1][-1]
+
+    def __len__(self):
+        return self._size
+
+    @property
+    def dim(self):
+        """ Number of components per element """
+        return self._parent.dim
+
+    @property
+    def dtype(self):
+        """ Data type of sparse elements """
+        return self._parent.dtype
+
+    @property
+    def dkind(self):
+        """ Data type of sparse elements (in str) """
+        return self._parent.dkind
+
+    @property
+    def shape(self):
+        """ Shape of sparse matrix """
+        if self._full is not None:
+            return self._full.shape
+        n = self._size
+        return (n, n * self._sc.n_s, self.dim)
+
+    @property
+    def nnz(self):
+        """ Number of non-zero elements """
+        if self._full is not None:
+            return self._full.nnz
+        nnz = self._parent.nnz
+        for _, reps, _ in self._ops:
+            nnz *= reps
+        return nnz
+
+    @property
+    def finalized(self):
+        """ Whether the contained data is finalized and non-used elements have been removed """
+        if self._full is not None:
+            return self._full.finalized
+        return self._parent.finalized
+
+    def __str__(self):
+        """ Representation of the lazy sparse model """
+        s = self.__class__.__name__ + '{{{0}, dim: {1}, non-zero: {2}, kind={3}'.format(self._parent.__class__.__name__,
+                                                                                        self.dim, self.nnz, self.dkind)
+        if self._full is None:
+            for method, reps, axis in self._ops:
+                s += ',\n {0}: {1} along {2}'.format(method, reps, axis)
+        else:
+            s += ',\n materialized'
+        return s + '\n}'
+
+    # Attributes which are the same for the primitive and the full sparse object
+    _meta = ('spin', 'orthogonal', 'non_orthogonal', 'S_idx', '_cls_kwargs')
+    # Methods which change the sparse object in-place
+    _inplace = ('construct', 'empty', 'reset', 'eliminate_zeros', 'set_nsc', 'spalign',
+                'symmetrize', 'shift', 'apply_newton', 'pack', 'unpack')
+
+    def __getattr__(self, attr):
+        """ Meta-data from the primitive sparse object, in-place methods from the materialized sparse object """
+        if attr.startswith('__') or attr in ('_parent', '_ops', '_units', '_sc', '_geometry', '_full'):
+            raise AttributeError(attr)
+        if self._full is not None:
+            return getattr(self._full, attr)
+        if attr in self._meta:
+            return getattr(self._parent, attr)
+        if attr in self._inplace:
+            return getattr(self.materialize(), attr)
+        raise AttributeError("'{0}' has no attribute '{1}', use {0}.materialize() to create "
+                             "the full sparse object.".format(self.__class__.__name__, attr))
+
+    def __setitem__(self, key, value):
+        """ Set elements in the materialized sparse object """
+        self.materialize()[key] = value
+
+    def __delitem__(self, key):
+        """ Delete elements in the materialized sparse object """
+        del self.materialize()[key]
+
+    @property
+    def _csr(self):
+        """ Sparse matrix of the repeated sparse object (generated on each access, if not materialized) """
+        if self._full is not None:
+            return self._full._csr
+        D = self._parent._csr._D
+        ncols, cols, data = [], [], []
+        for _, ncol, col, idx in self._iter_block():
+            ncols.append(ncol)
+            cols.append(col)
+            data.append(D[idx])
+        ptr = insert(_a.cumsumi(concatenate(ncols)), 0, 0)
+        csr = SparseCSR((concatenate(data), concatenate(cols), ptr), shape=self.shape, dtype=self.dtype)
+        csr.finalize()
+        return csr
+
+    def finalize(self):
+        """ Finalizes the primitive (or materialized) sparse object, see `SparseCSR.finalize` """
+        if self._full is None:
+            self._parent.finalize()
+        else:
+            self._full.finalize()
+
+    def spsame(self, other):
+        """ Compare two sparse objects and check whether they have the same entries.
+
+        This does not necessarily mean that the elements are the same
+        """
+        return self._csr.spsame(other._csr)
+
+    def _parent_method(self, name):
+        """ The method `name` of the primitive sparse class, to be called with the view as argument """
+        func = getattr(self._parent.__class__, name)
+        # unbound methods (Python 2) only accepts instances of the class
+        return getattr(func, '__func__', func)
+
+    def write(self, sile, *args, **kwargs):
+        """ Writes the repeated sparse object to the `Sile`, equivalent to the primitive sparse objects `write` """
+        if self._full is not None:
+            return self._full.write(sile, *args, **kwargs)
+        return self._parent_method('write')(self, sile, *args, **kwargs)
+
+    def _rows(self, rows):
+        """ Sparse pattern for the rows `rows` of the repeated matrix
+
+        Parameters
+        ----------
+        rows : array_like of int
+           rows in the repeated sparse matrix
+
+        Returns
+        -------
+        ncol : number of non-zero elements per row
+        col : the column indices (in the repeated supercell)
+        idx : indices of the data elements in the primitive sparse matrix
+        """
+        rows = _a.asarrayi(rows).ravel()
+
+        # Back-track the rows to the primitive rows, storing the repetition index
+        # for each level
+        r = rows
+        R = []
+        for (method, reps, axis), firsto in zip(reversed(self._ops), reversed(self._units[:-1])):
+            n = firsto[-1]
+            if method == 'tile':
+                R.append(r // n)
+                r = r % n
+            else:
+                ia = np.searchsorted(firsto * reps, r, side='right') - 1
+                f = firsto[ia]
+                off = r - f * reps
+                nA = firsto[ia + 1] - f
+                R.append(off // nA)
+                r = f + off % nA
+
+        csr = self._parent._csr
+        ncol = csr.ncol[r]
+        idx = array_arange(csr.ptr[r], n=ncol)
+        col = csr.col[idx]
+
+        # Now move the columns forward through all operations
+        sc_off = self._parent.geometry.sc.sc_off
+        sc_index = self._parent.geometry.sc.sc_index
+        for (method, reps, axis), firsto, rep in zip(self._ops, self._units[:-1], reversed(R)):
+            n = firsto[-1]
+            n_n = n * reps
+            rep = repeat(rep, ncol)
+            isc = sc_off[col // n, :]
+            JO = col % n
+            if method == 'tile':
+                JO += n * (isc[:, axis] + rep)
+                isc[:, axis] = JO // n_n
+                col = JO % n_n + sc_index(isc) * n_n
+            else:
+                ja = np.searchsorted(firsto, JO, side='right') - 1
+                f = firsto[ja]
+                A = rep + isc[:, axis]
+                isc[:, axis] = A // reps
+                col = JO + f * (reps - 1) + (firsto[ja + 1] - f) * (A % reps) + sc_index(isc) * n_n
+            col = col.astype(int32, copy=False)
+
+        return ncol, col, idx
+
+    def _iter_block(self):
+        """ Iterate the repeated sparse pattern in blocks of rows
+
+        Yields
+        ------
+        rows, ncol, col, idx
+        """
+        n = self._size
+        block = max(1, self._block)
+        for i in range(0, n, block):
+            rows = _a.arangei(i, min(i + block, n))
+            ncol, col, idx = self._rows(rows)
+            yield rows, ncol, col, idx
+
+    @_lazy
+    def iter_nnz(self):
+        """ Iterations of the non-zero elements
+
+        An iterator on the sparse matrix with, row and column
+        """
+        for rows, ncol, col, _ in self._iter_block():
+            for i, j in zip(repeat(rows, ncol), col):
+                yield i, j
+
+    def __iter__(self):
+        return self.iter_nnz()
+
+    @_lazy
+    def nonzero(self, atom=None, only_col=False):
+        """ Indices row and column indices where non-zero elements exists
+
+        Parameters
+        ----------
+        atom : int or array_like of int, optional
+           only return the tuples for the requested atoms, default is all atoms
+        only_col : bool, optional
+           only return then non-zero columns
+        """
+        if atom is None:
+            rows = _a.arangei(self._size)
+        else:
+            firsto = self._units[-1]
+            atom = _a.asarrayi(atom).ravel()
+            rows = array_arange(firsto[atom], firsto[atom + 1])
+        ncol, col, _ = self._rows(rows)
+        if only_col:
+            return col
+        return repeat(rows, ncol), col
+
+    def __getitem__(self, key):
+        """ Elements for the index(s), only integer row indices are generated lazily """
+        lazy = self._full is None and isinstance(key[0], Integral)
+        if len(key) > 2:
+            lazy = lazy and len(key) == 3 and isinstance(key[2], Integral)
+        if not lazy:
+            return self.materialize()[key]
+
+        _, col, idx = self._rows([key[0]])
+        j = _a.asarrayi(key[1])
+        D = self._parent._csr._D
+        if len(key) == 3:
+            D = D[:, key[2]]
+        v = np.zeros(j.shape + D.shape[1:], dtype=self.dtype)
+        for i, jj in np.ndenumerate(j):
+            found = (col == jj).nonzero()[0]
+            if len(found) > 0:
+                v[i] = D[idx[found[0]]]
+        return v
+
+    @_lazy
+    def tocsr(self, dim=0, isc=None, **kwargs):
+        """ Return a :class:`~scipy.sparse.csr_matrix` for the specified dimension
+
+        Parameters
+        ----------
+        dim : int, optional
+           the dimension in the sparse matrix
+        isc : int, optional
+           the supercell index, or all (if ``isc=None``)
+        """
+        if isc is not None:
+            raise NotImplementedError("Requesting sub-sparse has not been implemented yet")
+        D = self._parent._csr._D
+        ncols, cols, data = [], [], []
+        for _, ncol, col, idx in self._iter_block():
+            ncols.append(ncol)
+            cols.append(col)
+            data.append(D[idx, dim])
+        ptr = insert(_a.cumsumi(concatenate(ncols)), 0, 0)
+        return csr_matrix((concatenate(data), concatenate(cols), ptr),
+                          shape=self.shape[:2], **kwargs)
+
+    def _matrix_k(self, k, dtype, format, dim):
+        """ Calculate the matrix at `k` in the cell vector gauge """
+        k = _a.asarrayd(k).ravel()
+        gamma = np.allclose(k, 0.)
+        if dtype is None:
+            dtype = np.result_type(self._parent.dtype, np.float64 if gamma else np.complex128)
+        if gamma:
+            phases = np.ones(self._sc.n_s, dtype=dtype)
+        else:
+            phases = np.exp(-1j * np.dot(self._sc.sc_off, k * 2 * np.pi)).astype(dtype, copy=False)
+
+        n = self._size
+        D = self._parent._csr._D
+        ncols, cols, data = [], [], []
+        for _, ncol, col, idx in self._iter_block():
+            ncols.append(ncol)
+            data.append(D[idx, dim] * phases[col // n])
+            cols.append(col % n)
+        ptr = insert(_a.cumsumi(concatenate(ncols)), 0, 0)
+        M = csr_matrix((concatenate(data).astype(dtype, copy=False), concatenate(cols), ptr),
+                       shape=(n, n), dtype=dtype)
+        M.sum_duplicates()
+        if format in ['array', 'matrix', 'dense']:
+            return M.toarray()
+        return M.asformat(format)
+
+    def Pk(self, k=(0, 0, 0), dtype=None, gauge='R', format='csr', spin=0, _dim=None):
+        """ Sparse matrix at `k` calculated directly from the primitive sparse matrix
+
+        For the orbital distance gauge (``gauge='r'``) and non-colinear spin configurations
+        the sparse object is materialized.
+
+        Parameters
+        ----------
+        k : array_like, optional
+           k-point (default is Gamma point)
+        dtype : numpy.dtype, optional
+           default to `numpy.complex128` (`numpy.float64` at the Gamma point)
+        gauge : {'R', 'r'}
+           chosen gauge
+        format : {'csr', 'array', 'dense', 'coo', ...}
+           the returned format of the matrix
+        spin : int, optional
+           the spin-index (only used for polarized matrices)
+        """
+        s = getattr(self._parent, 'spin', None)
+        if _dim is None:
+            if s is None or s.is_unpolarized:
+                _dim = 0
+            elif s.is_polarized:
+                _dim = spin
+        if self._full is not None or gauge != 'R' or _dim is None:
+            M = self.materialize()
+            if s is not None and s.is_polarized:
+                return M.Pk(k, spin=spin, dtype=dtype, gauge=gauge, format=format)
+            return M.Pk(k, dtype=dtype, gauge=gauge, format=format)
+        return self._matrix_k(k, dtype, format, _dim)
+
+    def Hk(self, k=(0, 0, 0), dtype=None, gauge='R', format='csr', spin=0):
+        """ Hamiltonian at `k`, see `Pk` """
+        return self.Pk(k, dtype=dtype, gauge=gauge, format=format, spin=spin)
+
+    def Dk(self, k=(0, 0, 0), dtype=None, gauge='R', format='csr', spin=0):
+        """ Density/dynamical matrix at `k`, see `Pk` """
+        return self.Pk(k, dtype=dtype, gauge=gauge, format=format, spin=spin)
+
+    def Ek(self, k=(0, 0, 0), dtype=None, gauge='R', format='csr', spin=0):
+        """ Energy density matrix at `k`, see `Pk` """
+        return self.Pk(k, dtype=dtype, gauge=gauge, format=format, spin=spin)
+
+    def Sk(self, k=(0, 0, 0), dtype=None, gauge='R', format='csr'):
+        """ Overlap matrix at `k` calculated directly from the primitive sparse matrix
+
+        Parameters
+        ----------
+        k : array_like, optional
+           k-point (default is Gamma point)
+        dtype : numpy.dtype, optional
+           default to `numpy.complex128` (`numpy.float64` at the Gamma point)
+        gauge : {'R', 'r'}
+           chosen gauge
+        format : {'csr', 'array', 'dense', 'coo', ...}
+           the returned format of the matrix
+        """
+        P = self._parent
+        s = getattr(P, 'spin', None)
+        if self._full is not None or not (s is None or s.is_unpolarized or s.is_polarized):
+            return self.materialize().Sk(k, dtype=dtype, gauge=gauge, format=format)
+        if P.orthogonal:
+            # The overlap matrix is the identity matrix, regardless of gauge
+            if dtype is None:
+                dtype = np.float64
+            n = self._size
+            if format in ['array', 'matrix', 'dense']:
+                return np.identity(n, dtype=dtype)
+            return identity(n, dtype=dtype, format=format)
+        if gauge != 'R':
+            return self.materialize().Sk(k, dtype=dtype, gauge=gauge, format=format)
+        return self._matrix_k(k, dtype, format, P.S_idx)
+
+    @_lazy
+    def eigh(self, k=(0, 0, 0), gauge='R', eigvals_only=True, **kwargs):
+        """ Eigenvalues (and eigenvectors) of the repeated sparse object, calculated from `Pk` and `Sk`
+
+        Parameters
+        ----------
+        k : array_like, optional
+           k-point (default is Gamma point)
+        gauge : {'R', 'r'}
+           chosen gauge
+        eigvals_only : bool, optional
+           whether only the eigenvalues are returned
+        spin : int, optional
+           the spin-component to calculate the eigenvalue spectrum of, note that
+           this parameter is only valid for `Spin.POLARIZED` matrices.
+        **kwargs : dict, optional
+           passed arguments to `scipy.linalg.eigh`
+        """
+        spin = kwargs.pop('spin', 0)
+        dtype = kwargs.pop('dtype', None)
+        P = self.Pk(k=k, dtype=dtype, gauge=gauge, format='array', spin=spin)
+        if self._parent.orthogonal:
+            return lin.eigh_destroy(P, eigvals_only=eigvals_only, **kwargs)
+        S = self.Sk(k=k, dtype=dtype, gauge=gauge, format='array')
+        return lin.eigh_destroy(P, S, eigvals_only=eigvals_only, **kwargs)
+
+    def eigenstate(self, k=(0, 0, 0), gauge='R', **kwargs):
+        """ Eigenstates of the repeated sparse object, equivalent to the primitive sparse objects `eigenstate`
+
+        The eigenstates are calculated using `eigh` of the view, the returned state
+        has the view as its parent.
+        """
+        if self._full is not None:
+            return self._full.eigenstate(k, gauge, **kwargs)
+        if kwargs.get('sparse', False):
+            raise NotImplementedError(self.__class__.__name__ + '.eigenstate(sparse=True) is not implemented, '
+                                      'use materialize() to create the full sparse object.')
+        return self._parent_method('eigenstate')(self, k, gauge, **kwargs)
@@ -9,6 +9,7 @@ import scipy as sc
 from sisl.utils.ranges import array_arange
 from sisl.sparse import *
 from sisl.sparse import indices
+from sisl.messages import SislError
 
 
 @pytest.fixture
@@ -247,6 +248,28 @@ class TestSparseCSR(object):
         assert not setup.s1.finalized
         assert len(setup.s1.col) == 9
 
+    def test_finalize3(self):
+        # Short and long rows (sorted differently) with multi-dimensional data
+        s = SparseCSR((3, 100, 2), dtype=np.complex128, nnzpr=2)
+        cols = [np.arange(100)[::-1], np.array([5, 1, 3]), np.random.permutation(60)]
+        for r, c in enumerate(cols):
+            s[r, c] = np.stack([c, c * 1j], axis=1)
+        s.finalize()
+        assert s.finalized
+        assert s.nnz == 163
+        for r, c in enumerate(cols):
+            c = np.sort(c)
+            assert np.allclose(s.col[s.ptr[r]:s.ptr[r+1]], c)
+            assert np.allclose(s._D[s.ptr[r]:s.ptr[r+1], 0], c)
+            assert np.allclose(s._D[s.ptr[r]:s.ptr[r+1], 1], c * 1j)
+
+    @pytest.mark.xfail(raises=SislError)
+    def test_finalize_duplicate(self):
+        s = SparseCSR((3, 10), nnzpr=2)
+        s[1, [1, 2]] = 1.
+        s.col[s.ptr[1] + 1] = 1
+        s.finalize()
+
     def test_iterator1(self, setup):
         setup.s1[0, [1, 2, 3]] = 1
         setup.s1[2, [1, 2, 4]] = 1.
@@ -355,6 +378,25 @@ class TestSparseCSR(object):
         assert s1.shape[1] == 2
         setup.s1.empty()
 
+    def test_sub2(self, setup):
+        s = SparseCSR((10, 10), dtype=np.int32)
+        for i in range(10):
+            s[i, np.unique([0, i, 9 - i])] = i + 1
+        ref = s.tocsr()
+        for idx in [[2, 3, 4], [5, 1, 8, 0]]:
+            s1 = s.sub(idx)
+            assert np.allclose(s1.tocsr().toarray(), ref[idx, :][:, idx].toarray())
+        s.finalize()
+        # All columns are retained, the data is a view
+        idx = np.arange(10)
+        s1 = s.sub(idx, copy=False)
+        assert np.shares_memory(s1._D, s._D)
+        assert np.allclose(s1.tocsr().toarray(), ref.toarray())
+        s1 = s.sub(idx)
+        assert not np.shares_memory(s1._D, s._D)
+        s1 = s.sub(idx[1:], copy=False)
+        assert not np.shares_memory(s1._D, s._D)
+
     def test_remove1(self, setup):
         setup.s1[0, [1, 2, 3]] = 1
         assert setup.s1.nnz == 3
@@ -412,6 +454,92 @@ class TestSparseCSR(object):
         setup.s1.align(setup.s2)
         assert setup.s1.spsame(setup.s2)
 
+    def test_same_finalized(self, setup):
+        s1 = setup.s1
+        s1[0, [3, 1, 2]] = 1
+        s1[4, [9, 2]] = 1
+        s2 = s1.copy()
+        s1.finalize()
+        assert s1.spsame(s2)
+        s2.finalize()
+        assert s1._fingerprint() == s2._fingerprint()
+        assert s1.spsame(s2)
+        s2[4, 1] = 1
+        assert s2._fingerprint() is None
+        assert not s1.spsame(s2)
+        s2.finalize()
+        assert s1._fingerprint() != s2._fingerprint()
+        assert not s1.spsame(s2)
+        del s2[4, 1]
+        s2.finalize()
+        assert s1.spsame(s2)
+
+    def test_same_finalized_inplace(self, setup):
+        s = setup.s1
+        s[0, [0, 1]] = 1
+        s[1, 2] = 1
+        s.finalize()
+        ref = s.copy()
+        assert s.spsame(ref)
+        # Re-use the freed element of the same row (no re-allocation)
+        del s[0, 1]
+        s[0, 3] = 2
+        s.finalize()
+        assert s.nnz == ref.nnz
+        assert not s.spsame(ref)
+        assert not ref.spsame(s)
+        s.delete_columns(3, keep_shape=True)
+        ref.delete_columns(1, keep_shape=True)
+        assert s.spsame(ref)
+
+    def test_pack(self, setup):
+        s = SparseCSR((10, 100, 3), dtype=np.float64)
+        for i in range(10):
+            s[i, [i, i + 50]] = [[i, 1, 2], [3, 4, 5]]
+        s.finalize()
+        ref = s.copy()
+        s.pack(np.float32, np.float64)
+        D, last = s._packed
+        assert s.col.dtype == np.int32
+        assert D.dtype == np.float32 and D.shape == (s.nnz, 2)
+        assert last.dtype == np.float64
+        # properties do not unpack
+        assert s.dtype == np.float64
+        assert s.dim == 3
+        assert s.spsame(ref)
+        assert s._packed is not None
+        csr, idx = s._kernel_arrays(2)
+        assert idx == 0
+        # the column indices are not copied
+        assert csr.col is s.col
+        assert np.allclose(csr._D[:, 0], ref._D[:, 2])
+        csr, idx = s._kernel_arrays(1)
+        assert idx == 1
+        assert np.allclose(csr._D, ref._D[:, :2])
+        # any access to the elements unpacks
+        assert np.allclose(s[1, 51], [3, 4, 5])
+        assert s._packed is None
+        assert s.col.dtype == np.int32
+        assert np.allclose(s._D, ref._D)
+        s.pack()
+        s.unpack()
+        assert s._packed is None
+        assert np.allclose(s._D, ref._D)
+
+    def test_align_extend(self, setup):
+        s1 = setup.s1
+        s2 = setup.s1.copy()
+        for i in range(10):
+            s1[i, [i, i + 10]] = i + 1
+            s2[i, [i + 1, i + 10, i + 20]] = 1
+        s1.align(s2)
+        assert s1.nnz == 40
+        for i in range(10):
+            assert s1[i, i] == i + 1
+            assert s1[i, i + 10] == i + 1
+            assert s1[i, i + 1] == 0
+            assert s1[i, i + 20] == 0
+
     def test_delete_col1(self, setup):
         s1 = setup.s1.copy()
         nc = s1.shape[1]
@@ -843,6 +971,31 @@ class TestSparseCSR(object):
         S = S1 - S2
         assert np.allclose(S._D, S1._D - S2._D)
 
+    @pytest.mark.parametrize("finalize", [True, False])
+    def test_op_pattern(self, finalize):
+        def rand(seed):
+            sp = sc.sparse.random(20, 30, density=0.2, random_state=seed, format='csr')
+            S = SparseCSR((20, 30))
+            rows, cols = sp.nonzero()
+            for i in np.random.RandomState(seed).permutation(len(rows)):
+                S[rows[i], cols[i]] = sp[rows[i], cols[i]]
+            if finalize:
+                S.finalize()
+            return S, sp.toarray()
+        S1, A1 = rand(1)
+        S2, A2 = rand(2)
+        assert np.allclose((S1 + S2).tocsr().toarray(), A1 + A2)
+        assert np.allclose((S1 - S2).tocsr().toarray(), A1 - A2)
+        assert np.allclose((S2 - S1).tocsr().toarray(), A2 - A1)
+        assert np.allclose((S1 * S2).tocsr().toarray(), A1 * A2)
+        S = S1 * S2
+        assert S.spsame(S1)
+        A = np.where(A2 != 0, A1 ** A2, np.where(A1 != 0, 1, 0))
+        assert np.allclose((S1 ** S2).tocsr().toarray(), A)
+        S = S1 + S2
+        assert S.finalized
+        assert S.nnz == np.count_nonzero((A1 != 0) | (A2 != 0))
+
     def test_op_numpy_scalar(self, setup):
         S = SparseCSR((10, 100), dtype=np.float32)
         I = np.ones(1, dtype=np.complex64)[0]
@@ -937,6 +1090,43 @@ class TestSparseCSR(object):
         s = p.loads(n)
         assert s.spsame(S)
 
+    def test_memmap(self, setup, tmpdir):
+        import os
+        S = SparseCSR((10, 100, 2))
+        for i in range(10):
+            S[i, [i, i + 10, i + 31]] = [[1, 2], [3, 4], [5, 6]]
+        del S[4, 14]
+        M = S.tomemmap(str(tmpdir))
+        assert S.scratch is None
+        assert os.path.isdir(M.scratch)
+        assert isinstance(M._D, np.memmap)
+        assert M.spsame(S)
+        assert M.nnz == S.nnz
+        for d in [0, 1]:
+            assert abs(M.tocsr(d) - S.tocsr(d)).max() == 0.
+
+        # Arithmetic and copies retains memory-mapping
+        M2 = M * 2 + M
+        assert isinstance(M2._D, np.memmap)
+        assert M2.scratch != M.scratch
+        assert abs(M2.tocsr(1) - 3 * S.tocsr(1)).max() == 0.
+        M2 = M.copy(dims=[1], dtype=np.complex128)
+        assert isinstance(M2._D, np.memmap)
+        assert abs(M2.tocsr(0) - S.tocsr(1)).max() == 0.
+
+        # Finalization is done in-place
+        M.finalize()
+        assert M.finalized
+        assert isinstance(M._D, np.memmap)
+        assert abs(M.tocsr(1) - S.tocsr(1)).max() == 0.
+
+        # Clean-up of scratch directory
+        scratch = M.scratch
+        del M, M2
+        import gc
+        gc.collect()
+        assert not os.path.exists(scratch)
+
 
 @pytest.mark.xfail(raises=IndexError)
 @pytest.mark.parametrize("i", [-1, 10])
@@ -950,3 +1140,34 @@ def test_sparse_row_out_of_bounds(i):
 def test_sparse_column_out_of_bounds(j):
     S = SparseCSR((10, 10, 1), dtype=np.int32)
     S[0, j] = 1
+
+
+@pytest.mark.parametrize("n_s", [1, 3])
+@pytest.mark.parametrize("only", [0, 1, -1])
+def test_sparse_orb_to_atom(n_s, only):
+    from sisl._sparse import sparse_orb_to_atom
+    lasto = np.array([2, 3, 6, 7])
+    firsto = np.insert(lasto, 0, 0).astype(np.int32)
+    o2a = np.repeat(np.arange(4), np.diff(firsto)).astype(np.int32)
+    no, na = 7, 4
+    np.random.seed(42)
+    D = sc.sparse.random(no, no * 3, density=0.3, format='csr')
+    D.data -= 0.5
+    data = np.array([D.data, D.data * 2])
+    ptr, col, A = sparse_orb_to_atom(D.indptr.astype(np.int32), D.indices.astype(np.int32),
+                                     data, firsto, o2a, n_s, only)
+    assert A.shape == (2, len(col))
+
+    # Reference
+    Dc = D.tocoo()
+    v = Dc.data.copy()
+    if only == 1:
+        v[v < 0] = 0
+    elif only == -1:
+        v[v > 0] = 0
+    c = (o2a[Dc.col % no] + (Dc.col // no) * na) % (na * n_s)
+    ref = sc.sparse.coo_matrix((v, (o2a[Dc.row], c)), shape=(na, na * n_s)).toarray()
+    for i in range(2):
+        out = sc.sparse.csr_matrix((A[i], col, ptr), shape=(na, na * n_s))
+        assert out.has_sorted_indices
+        assert np.allclose(out.toarray(), ref * (i + 1))
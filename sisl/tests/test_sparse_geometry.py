@@ -267,6 +267,22 @@ class TestSparseAtom(object):
         s2.finalize()
         assert np.allclose(s1._csr._D, s2._csr._D)
 
+    def test_repeat_lazy(self, setup):
+        setup.s2.construct([[0.1, 1.5], [(1, 2), (3, 4)]])
+        s1 = setup.s2.repeat(2, 0).tile(2, 1)
+        s2 = setup.s2.repeat(2, 0, lazy=True).tile(2, 1)
+        setup.s2.empty()
+        assert isinstance(s2, SparseGeometryView)
+        assert s1.nnz == s2.nnz
+        assert s1.shape == s2.shape
+        for dim in [0, 1]:
+            assert abs(s1.tocsr(dim) - s2.tocsr(dim)).max() == 0.
+        assert np.allclose(s1.nonzero(atom=2)[1], s2.nonzero(atom=2)[1])
+        assert not s2.materialized
+        del s2[0, 0]
+        assert s2.materialized
+        assert s1.nnz - 1 == s2.nnz
+
     def test_supercell_poisition1(self, setup):
         g1 = setup.g.copy()
         g2 = setup.g.translate([100, 100, 100])
@@ -303,6 +319,36 @@ class TestSparseAtom(object):
         assert s.nnz == 4
         assert s[0, 0] == 1
 
+    def test_set_nsc3(self, setup):
+        g = graphene(atom=Atom(6, R=1.43))
+        s = SparseAtom(g)
+        s.construct([[0.1, 1.43], [1, 2]])
+        s.finalize()
+        # Extending re-orders the supercells
+        g = g.copy()
+        g.set_nsc([5, 5, 1])
+        s5 = SparseAtom(g)
+        s5.construct([[0.1, 1.43], [1, 2]])
+        s5.finalize()
+        s.set_nsc([5, 5, 1])
+        assert s.shape == s5.shape
+        s.finalize()
+        assert s.spsame(s5)
+        # Shrinking without couplings to the removed supercells
+        s.set_nsc([3, 3, 1])
+        assert s.nnz == 8
+        s.set_nsc([3, 1, 1])
+        assert s.nnz == 6
+        s.finalize()
+        s.set_nsc([1, 1, 1])
+        assert s.nnz == 4
+        assert s.shape == (2, 2, 1)
+        # Extending from a single supercell
+        s.set_nsc([3, 3, 1])
+        assert s.nnz == 4
+        assert s.shape == (2, 18, 1)
+        assert s.finalized
+
     def test_edges1(self, setup):
         g = graphene(atom=Atom(6, R=1.43))
         s = SparseAtom(g)
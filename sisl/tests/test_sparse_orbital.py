@@ -71,6 +71,33 @@ def test_sparse_orbital_append(n0, n1, n2, axis):
         assert sout.spsame(s)
 
 
+@pytest.mark.parametrize("n", [1, 2, 5])
+@pytest.mark.parametrize("axis", [0, 1, 2])
+def test_sparse_orbital_concatenate(n, axis):
+    g = fcc(1., Atom(1, R=1.98)) * 2
+    dists = np.insert(g.distance(0, R=g.maxR()) + 0.001, 0, 0.001)
+    connect = np.arange(dists.size, dtype=np.float64) / 5
+    s = SparseOrbital(g)
+    s.construct([dists, connect])
+    s = s.tile(2, 0).tile(2, 1).tile(2, 2)
+    sf = s.tile(n, axis)
+
+    sout = SparseOrbital.concatenate([s] * n, axis)
+    assert sout.spsame(sf)
+    sout.finalize()
+    sf.finalize()
+    assert np.allclose(sout._csr._D, sf._csr._D)
+
+    # Differently ordered segments
+    idx = np.arange(s.na)
+    np.random.shuffle(idx)
+    s2 = s.sub(idx)
+    sout = SparseOrbital.concatenate([s, s2, s], axis)
+    sf = s.tile(3, axis)
+    assert sout.spsame(sf.sub(np.concatenate([np.arange(s.na), s.na + idx, 2 * s.na + np.arange(s.na)])))
+    assert sout.spsame(s.append(s2, axis).append(s, axis))
+
+
 def test_sparse_orbital_hermitian():
     g = Geometry([0] * 3, Atom(1, R=1), sc=SuperCell(1, nsc=[3, 1, 1]))
 
@@ -87,7 +114,7 @@ def test_sparse_orbital_hermitian():
         assert spo.nnz == 2
 
         spoT = spo.transpose()
-        assert not spoT.finalized
+        assert spoT.finalized
         assert spoT.nnz == 2
         assert spoT[0, 0] == 1.
         assert spoT[0, 1] == 0.
@@ -100,6 +127,40 @@ def test_sparse_orbital_hermitian():
         assert spoH[0, 1] == 1.
         assert spoH[0, 2] == 1.
 
+        spo.symmetrize()
+        assert spo.spsame(spoH)
+        assert spo[0, 0] == 1.
+        assert spo[0, 1] == 1.
+        assert spo[0, 2] == 1.
+
+
+def test_sparse_orbital_transpose_symmetrize():
+    g = fcc(1., Atom(1, R=1.5)) * 2
+    s = SparseOrbital(g)
+    s.construct([[0.1, 1.51], [1, 2]])
+    s = s.tile(2, 0)
+    # Random values and remove some elements to break the symmetry
+    s._csr._D[:, 0] = np.random.rand(s.nnz)
+    for io in range(0, s.no, 3):
+        del s[io, s.edges(io)[-1]]
+    assert s.nnz > 0
+
+    sT = s.transpose()
+    assert sT.nnz == s.nnz
+    no = s.geometry.no
+    for io in range(no):
+        edges = s.edges(io)
+        isc = s.geometry.sc.sc_index(- s.geometry.o2isc(edges))
+        for edge, jo in zip(edges, isc * no + io):
+            assert sT[edge % no, jo] == s[io, edge]
+    assert sT.transpose().spsame(s)
+
+    sH = (s + sT) * 0.5
+    s.symmetrize()
+    assert s.finalized
+    assert s.spsame(sH)
+    assert np.allclose(s._csr._D, sH._csr._D)
+
 
 def test_sparse_orbital_sub_orbital():
     a0 = Atom(1, R=(1.1, 1.4, 1.6))
@@ -145,3 +206,119 @@ def test_sparse_orbital_sub_orbital():
     spo_rem = spo.remove_orbital([0, 1], 1)
     spo_sub = spo.sub_orbital(0, [0, 2]).sub_orbital(1, 0)
     assert spo_rem.spsame(spo_sub)
+
+
+def test_sparse_orbital_sub_nocopy():
+    a0 = Atom(1, R=1.1)
+    a1 = Atom(2, R=(1.1, 1.1))
+    g = Geometry([[0, 0, 0], [1, 0, 0], [10, 0, 0]], [a0, a1, a0], sc=SuperCell(20))
+    spo = SparseOrbital(g)
+    # atoms 0 and 1 are coupled, atom 2 is isolated
+    for io in range(3):
+        spo[io, io] = 1.
+    spo[0, 2] = 2.
+    spo[3, 3] = 3.
+    spo.finalize()
+
+    sub = spo.sub([0, 1], copy=False)
+    assert np.shares_memory(sub._csr._D, spo._csr._D)
+    sub[0, 2] = 4.
+    assert spo[0, 2] == 4.
+    assert not np.shares_memory(spo.sub([0, 1])._csr._D, spo._csr._D)
+    rem = spo.remove(2, copy=False)
+    assert np.shares_memory(rem._csr._D, spo._csr._D)
+    assert rem.spsame(sub)
+    # orbital subsets are passed through
+    sub = spo.sub_orbital(1, 0, copy=False)
+    assert sub.spsame(spo.remove_orbital(1, 1, copy=False))
+
+
+def _sparse_orbital_random():
+    a0 = Atom(1, R=(1.1, 1.4))
+    a1 = Atom(2, R=(1.3, 1.1, 1.2))
+    g = Geometry([[0, 0, 0], [1, 0, 0]], [a0, a1], sc=SuperCell([2, 2, 10], nsc=[3, 3, 1]))
+    spo = SparseOrbital(g, 2)
+    np.random.seed(1234)
+    for io in range(g.no):
+        for jo in range(g.no_s):
+            if np.random.rand() < 0.5:
+                spo[io, jo] = np.random.rand(2)
+    return spo
+
+
+def test_sparse_orbital_repeat_orbitals():
+    # Atoms with different number of orbitals *and* number of non-zero elements
+    spo = _sparse_orbital_random()
+    spt = spo.tile(3, 1)
+    spr = spo.repeat(3, 1)
+    gt = spt.geometry
+    gr = spr.geometry
+    no = gt.no
+
+    # Create the orbital permutation from the repeated to the tiled geometry
+    ia = [np.argmin(((gt.xyz - xyz) ** 2).sum(1)) for xyz in gr.xyz]
+    io = np.concatenate([gt.a2o(a, all=True) for a in ia])
+    IO = (io.reshape(1, -1) + no * np.arange(gt.n_s).reshape(-1, 1)).ravel()
+    for dim in [0, 1]:
+        t = spt.tocsr(dim).toarray()[io, :][:, IO]
+        assert np.allclose(spr.tocsr(dim).toarray(), t)
+
+
+@pytest.mark.parametrize("ops", [[('tile', 3, 0)], [('repeat', 3, 1)],
+                                 [('tile', 2, 0), ('repeat', 3, 1)],
+                                 [('repeat', 2, 0), ('repeat', 2, 0), ('tile', 2, 1)]])
+def test_sparse_orbital_lazy(ops):
+    spo = _sparse_orbital_random()
+    full = spo
+    lazy = SparseGeometryView(spo)
+    for method, reps, axis in ops:
+        full = getattr(full, method)(reps, axis)
+        lazy = getattr(lazy, method)(reps, axis)
+    # Ensure several blocks are generated
+    lazy._block = 4
+    assert isinstance(lazy, SparseGeometryView)
+    assert lazy.shape == full.shape
+    assert lazy.nnz == full.nnz
+    assert len(lazy) == len(full)
+    assert lazy.geometry == full.geometry
+    for dim in [0, 1]:
+        assert abs(lazy.tocsr(dim) - full.tocsr(dim)).max() == 0.
+    r, c = lazy.nonzero()
+    assert np.allclose(r, full.nonzero()[0])
+    assert np.allclose(c, full.nonzero()[1])
+    assert np.allclose(lazy.nonzero(atom=[1, 2], only_col=True),
+                       full.nonzero(atom=[1, 2], only_col=True))
+    assert list(lazy.iter_nnz()) == list(full.iter_nnz())
+    assert np.allclose(lazy[r[10], c[10]], full[r[10], c[10]])
+    assert np.allclose(lazy[r[10], [c[10], c[11]], 1], full[r[10], [c[10], c[11]], 1])
+    assert not lazy.materialized
+
+    # Mutating the view materializes it
+    lazy[0, 0] = [10., 11.]
+    assert lazy.materialized
+    assert np.allclose(lazy[0, 0], [10., 11.])
+    assert lazy.nnz in [full.nnz, full.nnz + 1]
+    assert not np.allclose(full[0, 0], [10., 11.])
+
+
+def test_sparse_orbital_lazy_kwarg():
+    spo = _sparse_orbital_random()
+    lazy = spo.tile(2, 0, lazy=True).repeat(2, 1)
+    assert isinstance(lazy, SparseGeometryView)
+    assert spo.repeat(2, 1, lazy=True).tile(2, 0).nnz == lazy.nnz
+    full = spo.tile(2, 0).repeat(2, 1)
+    assert abs(lazy.tocsr() - full.tocsr()).max() == 0.
+    # read-only methods does not materialize
+    assert lazy.spsame(full)
+    assert full.spsame(lazy)
+    full.finalize()
+    assert lazy._csr.spsame(full._csr)
+    assert np.allclose(lazy._csr._D, full._csr._D)
+    assert not lazy.materialized
+    # other methods are not available
+    with pytest.raises(AttributeError):
+        lazy.sub_orbital
+    assert not lazy.materialized
+    # in-place methods materializes
+    lazy.eliminate_zeros()
+    assert lazy.materialized